@@ -13,12 +13,17 @@ Flame app to send sequences to review.
 """
 
 from __future__ import absolute_import
+import hashlib
+import json
 import os
+import tempfile
+import threading
+import time
 import uuid
+from multiprocessing.pool import ThreadPool
 
 from sgtk import TankError
 from sgtk.platform import Application
-from sgtk.platform.qt import QtGui
 
 
 class FlameReview(Application):
@@ -28,6 +33,23 @@ class FlameReview(Application):
     Generates quicktimes for the selected Flame sequences and uploads these to ShotGrid.
     """
 
+    # Number of seconds a quicktime must have been left untouched before a queue
+    # drain considers Flame is done writing it.
+    UPLOAD_SETTLE_TIME = 5 * 60
+
+    # Maximum number of Versions created by a single batch request.
+    VERSION_BATCH_SIZE = 50
+
+    # Maximum number of Shots created or updated by a single batch request.
+    SHOT_BATCH_SIZE = 100
+
+    # Suffix of the marker written next to a quicktime once its thumbnail is done.
+    THUMBNAIL_DONE_SUFFIX = ".thumbnail_done"
+
+    # Number of seconds after init_app the ShotGrid warm up starts, leaving Flame
+    # time to finish starting.
+    WARM_UP_DELAY = 10
+
     def init_app(self):
         """
         Called as the application is being initialized.
@@ -37,13 +59,45 @@ class FlameReview(Application):
         # register our desired interaction with Flame hooks
         menu_caption = self.get_setting("menu_name")
 
-        # track the comments entered by the user
-        self._review_comments = ""
+        # state of the export sessions in flight, keyed by session id.
+        self._sessions = {}
+
+        # guards the creation of the members created on first use, which happens
+        # from the warm up timer, the UI and the pool threads alike.
+        self._lazy_lock = threading.Lock()
+
+        # durable record of the uploads still to perform, created on first use.
+        self._upload_queue = None
+
+        # local index of entity codes for the submit dialog, created on first use.
+        self._entity_index = None
+
+        # TaskTemplates shared by all the submit dialogs, created on first use.
+        self._task_template_cache = None
 
-        # flag to indicate that something was actually submitted
-        self._submission_done = False
-        self._submit_options = None
-        self._submit_entity = None
+        # optional upload daemon backburner jobs hand their uploads to.
+        self._upload_daemon = None
+        self._upload_daemon_pool = None
+        # tokens of the jobs whose uploads were handed to the daemon.
+        self._upload_daemon_owners = set()
+
+        # threads running ShotGrid requests away from the UI, created on first use.
+        self._shotgun_pool = None
+        # thread submitting the finished export sessions one at a time, created on
+        # first use.
+        self._submission_pool = None
+
+        # background tasks of the submit dialogs, shared by all of them. Created
+        # with the first dialog, so that starting the app doesn't import Qt or
+        # the frameworks.
+        self._task_pool = None
+
+        # get ShotGrid ready for the first submission while the artist works.
+        self._warm_up_timer = None
+        if self.engine.has_ui and self.context.project:
+            self._warm_up_timer = threading.Timer(self.WARM_UP_DELAY, self._warm_up)
+            self._warm_up_timer.daemon = True
+            self._warm_up_timer.start()
 
         # set up callbacks for the engine to trigger
         # when this profile is being triggered
@@ -56,6 +110,25 @@ class FlameReview(Application):
         # register with the engine
         self.engine.register_export_hook(menu_caption, callbacks)
 
+    def destroy_app(self):
+        """
+        Called when the app is being torn down.
+        """
+        if self._warm_up_timer:
+            self._warm_up_timer.cancel()
+            self._warm_up_timer = None
+        self._stop_upload_daemon()
+        if self._submission_pool:
+            self._submission_pool.close()
+            self._submission_pool = None
+        if self._shotgun_pool:
+            self._shotgun_pool.close()
+            self._shotgun_pool = None
+        if self._task_pool:
+            self.log_debug("Task pool stats: %s" % self._task_pool.stats())
+            self._task_pool.shut_down()
+            self._task_pool = None
+
     def pre_custom_export(self, session_id, info):
         """
         Flame hook called before a custom export begins. The export will be blocked
@@ -77,12 +150,14 @@ class FlameReview(Application):
         """
         from sgtk.platform.qt import QtGui
 
-        # clear our flags
-        self._submission_done = False
+        tk_flame_review = self.import_module("tk_flame_review")
+        session = tk_flame_review.ExportSession(session_id)
 
+        # a new entity is created while Flame exports, see _create_session_versions.
         options = self.request_submit_options(
             message='Upload selected to ShotGrid for review.<br>',
             defaults={'mode': 0},
+            defer_creation=True,
         )
 
         if not options:
@@ -90,11 +165,15 @@ class FlameReview(Application):
             info["abort"] = True
             info["abortMessage"] = "User cancelled the operation."
         else:
+            session.options = options
+            session.entity = options['entity']
+            session.pending_entity = options.get('pending_entity')
             # get comments from user
-            self._review_comments = options['comment']
+            session.comments = options['comment']
 
             # populate the host to use for the export. Currently hard coded to local
             info["destinationHost"] = self.engine.get_server_hostname()
+            session.host = info["destinationHost"]
             # set the (temp) location where media is being output prior to upload.
             info["destinationPath"] = self.engine.get_backburner_tmp()
             # pick up the xml export profile from the configuration
@@ -103,9 +182,17 @@ class FlameReview(Application):
             info["isBackground"] = self.get_setting("background_export")
 
             self.log_debug(
-                "%s: Starting custom export session with preset '%s'"
-                % (self, info["presetPath"])
+                "%s: Starting custom export session %s with preset '%s'"
+                % (self, session_id, info["presetPath"])
             )
+            self._sessions[session_id] = session
+
+            # pick up uploads left behind by earlier sessions, for example when
+            # backburner was restarted before their job ran.
+            self._submit_upload_queue_drain(info["destinationHost"])
+
+            if self.get_setting("upload_daemon"):
+                self._start_upload_daemon()
 
         # Log usage metrics
         try:
@@ -114,6 +201,32 @@ class FlameReview(Application):
             # ingore any errors. ex: metrics logging not supported
             pass
 
+    def _submit_upload_queue_drain(self, host):
+        """
+        Submits a backburner job draining the upload queue if it has due entries.
+
+        :param host: Host the backburner job should run on.
+        """
+        try:
+            due = self.upload_queue.due()
+        except Exception as e:
+            self.log_warning("Could not read the upload queue: %s" % e)
+            return
+
+        if not due:
+            return
+
+        self.log_debug("%d upload(s) are due in the upload queue." % len(due))
+        self.engine.create_local_backburner_job(
+            "ShotGrid Upload Queue",
+            "Uploads quicktimes left behind by earlier review submissions.",
+            None,
+            self,
+            "backburner_drain_upload_queue",
+            {},
+            host,
+        )
+
     def adjust_path(self, session_id, info):
         """
         Flame hook called when an item is about to be exported and a path needs to be computed.
@@ -214,6 +327,21 @@ class FlameReview(Application):
 
         """
 
+        if self.get_setting("create_shots") and info.get("shotName"):
+            # keep the segments of every asset type, the Shots are created once
+            # the export is done, see _create_session_shots.
+            session = self._sessions.get(session_id)
+            if session:
+                session.segments.append(
+                    {
+                        "shot_name": info["shotName"],
+                        "sequence_name": info["sequenceName"],
+                        "segment_index": info["segmentIndex"],
+                        "record_in": info["recordIn"],
+                        "record_out": info["recordOut"],
+                    }
+                )
+
         if info.get("assetType") not in ["video", "movie"]:
             # the review system ignores any other assets. The export profiles are defined
             # in the app's settings hook, so technically there shouldn't be any other items
@@ -226,116 +354,1048 @@ class FlameReview(Application):
         # to backburner gets executed *after* the quicktime generation has completed!
         dependencies = info.get("backgroundJobId")
 
+        session = self._sessions.get(session_id)
+        if not session:
+            self.log_warning("Ignoring asset of unknown export session %s." % session_id)
+            return
+
         # Attempt to find an entity matching info['sequenceName']
-        entity = self._submit_entity
+        entity = session.entity
 
-        thumbnail_entities = [entity]
+        # now start the version creation process
+        self.log_debug(
+            "Will associate upload with ShotGrid entity %s..."
+            % (entity or "resolved once the export is done")
+        )
 
+        title = info["sequenceName"]
+
+        data = {}
+        data["code"] = title
+        data["description"] = session.comments
+        data["project"] = self.context.project
+        data["entity"] = entity
+        data["created_by"] = self.context.user
+        data["user"] = self.context.user
+
+        # general metadata for the version
+        # for the frame range, there isn't very meaningful metadata we can add
+        # and we don't have corresponding frames on disk
+        # so set the first frame to 1 in order to normalize the frames from Flame
+        # which typically start at 10:00:00.00
+        #
+        # also note that Flame is out-exclusive, meaning that if you have the
+        # frame range 100-111, it corresponds to the frames
+        # 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110
+        #
+        # We transform the above frame range (100-111) to be 1-10 in ShotGrid with length 10.
+        #
+        data["sg_first_frame"] = 1
+        data["sg_last_frame"] = info["sourceOut"] - info["sourceIn"]
+        data["frame_count"] = info["sourceOut"] - info["sourceIn"]
+        data["frame_range"] = "%s-%s" % (
+            data["sg_first_frame"],
+            data["sg_last_frame"],
+        )
+        data["sg_frames_have_slate"] = False
+        data["sg_movie_has_slate"] = False
+        data["sg_frames_aspect_ratio"] = info["aspectRatio"]
+        data["sg_movie_aspect_ratio"] = info["aspectRatio"]
+
+        # This is used to find the latest Version from the same department.
+        # todo: make this configurable?
+        data["sg_department"] = "Editorial"
+
+        # the versions of the whole session are created together once the export
+        # is done, see _create_session_versions.
+        self.log_debug("Version %s will be created once the export is done." % title)
+
+        # the uploads of the whole session are sent to backburner as a single
+        # job once the export is done.
+        session.uploads.append(
+            {
+                "title": title,
+                "entity": entity,
+                "full_path": os.path.join(info["destinationPath"], info["resolvedPath"]),
+                "info": dict(info),
+                "sg_version": None,
+                "version_data": data,
+                "dependencies": dependencies,
+            }
+        )
+        if dependencies:
+            session.dependencies.append(dependencies)
+
+    @property
+    def shotgun_pool(self):
+        """
+        Thread pool running ShotGrid requests away from the Flame UI thread.
+        """
+        with self._lazy_lock:
+            if self._shotgun_pool is None:
+                self._shotgun_pool = ThreadPool(4)
+            return self._shotgun_pool
+
+    @property
+    def submission_pool(self):
+        """
+        Thread submitting the finished export sessions, see :meth:`display_summary`.
+
+        A single thread submits the sessions one after the other, since the engine's
+        thumbnail generator collects the thumbnails of one session at a time. It
+        waits for the requests it sends to the :attr:`shotgun_pool`, so it can't
+        be one of its threads.
+        """
+        with self._lazy_lock:
+            if self._submission_pool is None:
+                self._submission_pool = ThreadPool(1)
+            return self._submission_pool
+
+    def _match_session_entities(self, session):
+        """
+        Links each upload of an auto-matched export session to the entity named
+        after its sequence.
+
+        All the sequence names are looked up with a single query, and the missing
+        entities created with a single batch request. Like :meth:`_create_entity_async`,
+        they are created without their TaskTemplate, which is applied from the
+        :attr:`shotgun_pool` afterwards.
+
+        :param session: The :class:`ExportSession`.
+        """
+        options = session.options
+        entity_type = options["entity_type"]
+        names = sorted(set(upload["info"]["sequenceName"] for upload in session.uploads))
+
+        # ShotGrid matches codes case insensitively, and so does Flame's media panel.
+        entities = {}
+        for entity in self.shotgun.find(
+            entity_type,
+            [["project", "is", self.context.project], ["code", "in", names]],
+            ["code"],
+        ):
+            entities[entity["code"].lower()] = entity
+
+        missing = [name for name in names if name.lower() not in entities]
+        if missing:
+            self.log_debug("Creating %s entities %s..." % (entity_type, missing))
+            requests = []
+            task_template = None
+            for name in missing:
+                data = self._get_new_entity_data(options, name)
+                task_template = data.pop("task_template", None)
+                requests.append(
+                    {
+                        "request_type": "create",
+                        "entity_type": entity_type,
+                        "data": data,
+                        "return_fields": ["code"],
+                    }
+                )
+            created = self.shotgun.batch(requests)
+            for entity in created:
+                entities[entity["code"].lower()] = entity
+            if task_template:
+                self.shotgun_pool.apply_async(
+                    self._apply_task_template_batch, (created, task_template)
+                )
+
+        for upload in session.uploads:
+            entity = entities[upload["info"]["sequenceName"].lower()]
+            upload["entity"] = entity
+
+    def _create_session_shots(self, segments, parents):
+        """
+        Creates or updates the Shots of the segments of an export session. Runs in
+        the :attr:`shotgun_pool`.
+
+        Existing Shots are looked up with a single query, then all the Shots are
+        created or updated with batch requests of at most :attr:`SHOT_BATCH_SIZE`
+        Shots. Like the Versions, cut ranges are normalized to start at frame 1.
+
+        :param segments: Segments recorded by :meth:`populate_shotgun`.
+        :param parents: Entity of each sequence, keyed by lower case sequence name.
+        """
         try:
-            # now start the version creation process
-            self.log_debug("Will associate upload with ShotGrid entity %s..." % entity)
+            # a shot appearing in several segments is described by the first one.
+            shots = {}
+            for segment in segments:
+                shots.setdefault(segment["shot_name"].lower(), segment)
+
+            existing = {}
+            for shot in self.shotgun.find(
+                "Shot",
+                [
+                    ["project", "is", self.context.project],
+                    [
+                        "code",
+                        "in",
+                        [segment["shot_name"] for segment in shots.values()],
+                    ],
+                ],
+                ["code"],
+            ):
+                existing[shot["code"].lower()] = shot
+
+            task_template = self._get_shot_task_template()
+            parent_field_info = self.get_setting("entity_parent_fields").get("Shot")
+
+            requests = []
+            for key, segment in shots.items():
+                # Flame is out-exclusive, see populate_shotgun.
+                duration = segment["record_out"] - segment["record_in"]
+                data = {
+                    "sg_cut_in": 1,
+                    "sg_cut_out": duration,
+                    "sg_cut_duration": duration,
+                    "sg_cut_order": segment["segment_index"],
+                }
+                parent = parents.get(segment["sequence_name"].lower())
+                if (
+                    parent_field_info
+                    and parent
+                    and parent["type"] == parent_field_info["entity_type"]
+                ):
+                    data[parent_field_info["field"]] = parent
+
+                if key in existing:
+                    requests.append(
+                        {
+                            "request_type": "update",
+                            "entity_type": "Shot",
+                            "entity_id": existing[key]["id"],
+                            "data": data,
+                        }
+                    )
+                    continue
+
+                data["code"] = segment["shot_name"]
+                data["description"] = "Created by the ShotGrid Flame integration."
+                data["project"] = self.context.project
+                if task_template:
+                    data["task_template"] = task_template
+                requests.append(
+                    {"request_type": "create", "entity_type": "Shot", "data": data}
+                )
+
+            for start in range(0, len(requests), self.SHOT_BATCH_SIZE):
+                self.shotgun.batch(requests[start : start + self.SHOT_BATCH_SIZE])
+
+            self.log_debug(
+                "Created %d and updated %d Shots from the exported segments."
+                % (len(shots) - len(existing), len(existing))
+            )
+        except Exception as e:
+            self.log_error(
+                "Could not create the Shots of the exported segments: %s" % e
+            )
+
+    def _get_shot_task_template(self):
+        """
+        Returns the TaskTemplate set by the ``shot_task_template`` setting, or None.
+        """
+        code = self.get_setting("shot_task_template")
+        if not code:
+            return None
+        return self.task_template_cache.get(code, "Shot") or self.shotgun.find_one(
+            "TaskTemplate",
+            [["code", "is", code], ["entity_type", "is", "Shot"]],
+            ["code"],
+        )
 
-            # create a version in ShotGrid
-            title = info["sequenceName"]
+    def _create_entity_async(self, entity_type, data):
+        """
+        Creates an entity in the :attr:`shotgun_pool`, so that the export doesn't
+        wait for ShotGrid.
+
+        Applying a TaskTemplate creates all of its Tasks, which can take a while,
+        so the entity is created without it and the template applied afterwards.
+        Versions only wait for the entity itself.
 
-            self.engine.show_busy(
-                "Updating ShotGrid...", "Creating Version %s" % (title)
+        :param entity_type: Type of the entity to create.
+        :param data: Fields of the entity, including its ``task_template``.
+        :returns: ``AsyncResult`` of the created entity.
+        """
+        data = dict(data)
+        task_template = data.pop("task_template", None)
+
+        self.log_debug("Creating %s in the background with data %s" % (entity_type, data))
+        pending_entity = self.shotgun_pool.apply_async(
+            self._call_shotgun, ("create", entity_type, data, ["code"])
+        )
+        if task_template:
+            self.shotgun_pool.apply_async(
+                self._apply_task_template, (pending_entity, task_template)
             )
+        return pending_entity
+
+    def _call_shotgun(self, method, *args):
+        """
+        Calls a ShotGrid API method with the connection of the calling thread.
+
+        Connections aren't thread safe, so requests sent from the :attr:`shotgun_pool`
+        must look the connection up from the pool's thread.
+        """
+        return getattr(self.shotgun, method)(*args)
 
-            data = {}
-            data["code"] = title
-            data["description"] = self._review_comments
-            data["project"] = self.context.project
-            data["entity"] = entity
-            data["created_by"] = self.context.user
-            data["user"] = self.context.user
-
-            # general metadata for the version
-            # for the frame range, there isn't very meaningful metadata we can add
-            # and we don't have corresponding frames on disk
-            # so set the first frame to 1 in order to normalize the frames from Flame
-            # which typically start at 10:00:00.00
-            #
-            # also note that Flame is out-exclusive, meaning that if you have the
-            # frame range 100-111, it corresponds to the frames
-            # 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110
-            #
-            # We transform the above frame range (100-111) to be 1-10 in ShotGrid with length 10.
-            #
-            data["sg_first_frame"] = 1
-            data["sg_last_frame"] = info["sourceOut"] - info["sourceIn"]
-            data["frame_count"] = info["sourceOut"] - info["sourceIn"]
-            data["frame_range"] = "%s-%s" % (
-                data["sg_first_frame"],
-                data["sg_last_frame"],
+    def _apply_task_template(self, pending_entity, task_template):
+        """
+        Applies a TaskTemplate to an entity being created. Runs in the :attr:`shotgun_pool`.
+        """
+        try:
+            entity = pending_entity.get()
+        except Exception:
+            # reported by whoever waits for the entity.
+            return
+        try:
+            self.shotgun.update(entity["type"], entity["id"], {"task_template": task_template})
+            self.log_debug("Applied TaskTemplate %s to %s" % (task_template, entity))
+        except Exception as e:
+            self.log_error("Could not apply TaskTemplate %s to %s: %s" % (task_template, entity, e))
+
+    def _apply_task_template_batch(self, entities, task_template):
+        """
+        Applies a TaskTemplate to entities created without it, with a single batch
+        request. Runs in the :attr:`shotgun_pool`.
+        """
+        try:
+            self.shotgun.batch(
+                [
+                    {
+                        "request_type": "update",
+                        "entity_type": entity["type"],
+                        "entity_id": entity["id"],
+                        "data": {"task_template": task_template},
+                    }
+                    for entity in entities
+                ]
+            )
+            self.log_debug("Applied TaskTemplate %s to %s" % (task_template, entities))
+        except Exception as e:
+            self.log_error(
+                "Could not apply TaskTemplate %s to %s: %s"
+                % (task_template, entities, e)
             )
-            data["sg_frames_have_slate"] = False
-            data["sg_movie_has_slate"] = False
-            data["sg_frames_aspect_ratio"] = info["aspectRatio"]
-            data["sg_movie_aspect_ratio"] = info["aspectRatio"]
 
-            # This is used to find the latest Version from the same department.
-            # todo: make this configurable?
-            data["sg_department"] = "Editorial"
+    def _create_session_versions(self, session):
+        """
+        Creates the Versions of all the uploads of an export session.
+
+        The Versions are created with batch requests of at most
+        :attr:`VERSION_BATCH_SIZE` Versions, sent side by side from the
+        :attr:`shotgun_pool`. Each upload's ``sg_version`` is set to its created
+        Version, or left to None if its batch failed.
 
-            sg_version_data = self.shotgun.create("Version", data)
+        :param session: The :class:`ExportSession`.
+        """
+        if session.pending_entity is not None:
+            # created while Flame was exporting, so this rarely has to wait.
+            session.entity = session.pending_entity.get()
+            session.pending_entity = None
+
+        batches = []
+        for start in range(0, len(session.uploads), self.VERSION_BATCH_SIZE):
+            uploads = session.uploads[start : start + self.VERSION_BATCH_SIZE]
+            requests = []
+            for upload in uploads:
+                upload["entity"] = upload["entity"] or session.entity
+                requests.append(
+                    {
+                        "request_type": "create",
+                        "entity_type": "Version",
+                        "data": dict(upload["version_data"], entity=upload["entity"]),
+                    }
+                )
+            batches.append(
+                (
+                    uploads,
+                    self.shotgun_pool.apply_async(
+                        self._call_shotgun, ("batch", requests)
+                    ),
+                )
+            )
 
-            self.log_debug("Created a version in ShotGrid: %s" % sg_version_data)
-            if self.get_setting("bypass_shotgun_transcoding"):
-                thumbnail_entities.append(
-                    {"type": sg_version_data["type"], "id": sg_version_data["id"]}
+        for uploads, result in batches:
+            try:
+                sg_versions = result.get()
+            except Exception as e:
+                # a batch is a single transaction, none of its Versions were created.
+                self.log_error(
+                    "Could not create Versions %s: %s"
+                    % (", ".join(upload["title"] for upload in uploads), e)
                 )
+                continue
+            for upload, sg_version_data in zip(uploads, sg_versions):
+                self.log_debug("Created a version in ShotGrid: %s" % sg_version_data)
+                upload["sg_version"] = sg_version_data
 
-            full_path = os.path.join(info["destinationPath"], info["resolvedPath"])
+    def _submit_session_uploads(self, session):
+        """
+        Submits a single backburner job uploading every quicktime of an export session.
+
+        Runs in the :attr:`submission_pool`, once the export is done: the entities
+        and Versions are created first, which means waiting for ShotGrid.
+
+        :param session: The :class:`ExportSession`.
+        :returns: True if a job was submitted.
+        """
+        if not session.uploads:
+            return False
+
+        try:
+            if session.options.get("auto_match"):
+                try:
+                    self._match_session_entities(session)
+                except Exception as e:
+                    self.log_error("Could not match the sequences to ShotGrid entities: %s" % e)
+                    return False
+
+            try:
+                self._create_session_versions(session)
+            except Exception as e:
+                self.log_error("Could not create %s: %s" % (session.options["entity_type"], e))
+                return False
+
+            if session.segments:
+                # nothing waits for the Shots, create them in the background.
+                parents = dict(
+                    (upload["info"]["sequenceName"].lower(), upload["entity"])
+                    for upload in session.uploads
+                )
+                self.shotgun_pool.apply_async(
+                    self._create_session_shots, (session.segments, parents)
+                )
+
+            # the upload job owns its queue entries, so that drains leave them
+            # alone while the job waits for the export.
+            owner = uuid.uuid4().hex
+            uploads = []
+            for upload in session.uploads:
+                sg_version_data = upload["sg_version"]
+                if not sg_version_data:
+                    continue
+
+                thumbnail_entities = [upload["entity"]]
+                if self.get_setting("bypass_shotgun_transcoding"):
+                    thumbnail_entities.append(
+                        {"type": sg_version_data["type"], "id": sg_version_data["id"]}
+                    )
 
-            if len(thumbnail_entities) > 0:
-                self.engine.show_busy("Updating ShotGrid...", "Generating thumbnail")
                 self.engine.thumbnail_generator.generate(
-                    display_name=title,
-                    path=full_path,
-                    dependencies=dependencies,
+                    display_name=upload["title"],
+                    path=upload["full_path"],
+                    dependencies=upload["dependencies"],
                     target_entities=thumbnail_entities,
-                    asset_info=info,
+                    asset_info=upload["info"],
                     favor_preview=False,  # No need to generate a movie file.
                 )
-                dependencies = self.engine.thumbnail_generator.finalize()
-                self.log_debug("New job dependency: %s" % dependencies)
 
-            self.engine.show_busy("Updating ShotGrid...", "Preparing background job")
+                uploads.append(
+                    {
+                        "full_path": upload["full_path"],
+                        "sg_version_id": sg_version_data["id"],
+                        "owner": owner,
+                    }
+                )
 
-            # set up the arguments which we will pass (via backburner) to
-            # the target method which gets executed
-            args = {"full_path": full_path, "sg_version_id": sg_version_data["id"]}
+            if not uploads:
+                return False
+
+            # generate the thumbnails of the whole session in a single job. It only
+            # depends on the export, like the upload job, so both run side by side.
+            thumbnail_job = self.engine.thumbnail_generator.finalize()
+            if thumbnail_job:
+                self.log_debug("Thumbnail job: %s" % thumbnail_job)
+                # the thumbnail job reads the quicktimes, so they can only be removed
+                # once both jobs are done. Whichever finishes last removes them.
+                for upload in uploads:
+                    upload["wait_for_thumbnail"] = True
+
+            # record the uploads before handing them to backburner, so that they can
+            # still be drained if the backburner job never runs.
+            for upload in uploads:
+                self.upload_queue.enqueue(
+                    upload["full_path"],
+                    upload["sg_version_id"],
+                    self._get_upload_field_name(),
+                    owner=owner,
+                    wait_for_thumbnail=upload.get("wait_for_thumbnail", False),
+                )
 
-            # and populate UI params
+            if thumbnail_job:
+                self.engine.create_local_backburner_job(
+                    "ShotGrid Upload Cleanup",
+                    "Removes the temporary Quicktimes once they have been uploaded.",
+                    thumbnail_job,
+                    self,
+                    "backburner_thumbnails_done",
+                    {"paths": [upload["full_path"] for upload in uploads]},
+                    session.host,
+                )
 
-            backburner_job_title = "%s %s - ShotGrid Upload" % (
+            # when following the exports, the upload job starts straight away and
+            # uploads the quicktimes as Flame writes them.
+            dependencies = session.dependencies
+            if self.get_setting("upload_while_exporting"):
+                dependencies = None
+                for upload in uploads:
+                    upload["follow"] = True
+
+            # and populate UI params
+            backburner_job_title = "%s - ShotGrid Upload (%d quicktimes)" % (
                 self.get_setting("shotgun_entity_type"),
-                info.get("sequenceName"),
+                len(uploads),
             )
-            backburner_job_desc = "Creates a new version record in ShotGrid and uploads the associated Quicktime."
-
-            # kick off async job
-            self.engine.create_local_backburner_job(
-                backburner_job_title,
-                backburner_job_desc,
-                dependencies,
-                self,
-                "backburner_upload_quicktime",
-                args,
-                info.get("destinationHost"),
+            backburner_job_desc = (
+                "Uploads the Quicktimes of a review submission to their "
+                "ShotGrid versions."
             )
 
-            # done!
-            self._submission_done = True
-        finally:
-            self.engine.clear_busy()
+            # hand the uploads over to the upload daemon if it is running, so
+            # that the job doesn't bootstrap the toolkit for them.
+            if not (
+                self._upload_daemon
+                and self._upload_daemon.running
+                and self._create_upload_client_job(
+                    backburner_job_title,
+                    backburner_job_desc,
+                    dependencies or None,
+                    uploads,
+                    session.host,
+                )
+            ):
+                # kick off async job
+                self.engine.create_local_backburner_job(
+                    backburner_job_title,
+                    backburner_job_desc,
+                    dependencies or None,
+                    self,
+                    "backburner_upload_quicktimes",
+                    {"uploads": uploads},
+                    session.host,
+                )
+        except Exception:
+            self.log_exception("Could not submit the uploads of %s." % session)
+            return False
+
+        session.submission_done = True
+        return True
 
     def backburner_upload_quicktime(self, full_path, sg_version_id):
         """
         This method is called via backburner and therefore runs in the background.
-        It uploads the quicktime to the version
+        It uploads the quicktime to the version, then drains any other upload
+        left behind in the upload queue.
+
+        Kept for the jobs submitted before uploads were batched per export session.
+        """
+        self.backburner_upload_quicktimes(
+            [{"full_path": full_path, "sg_version_id": sg_version_id}]
+        )
+
+    def backburner_upload_quicktimes(self, uploads):
+        """
+        This method is called via backburner and therefore runs in the background.
+        It uploads the quicktimes of an export session to their versions in parallel,
+        then drains any other upload left behind in the upload queue.
+
+        :param uploads: List of dictionaries with the ``full_path`` of a quicktime and
+                        the ``sg_version_id`` of the version to upload it to.
+        """
+        self._record_job_bootstrap_time()
+
+        # the ShotGrid connection returned by self.shotgun is specific to each
+        # thread, so the uploads can safely run side by side.
+        pool = ThreadPool(max(1, min(self.get_setting("upload_workers"), len(uploads))))
+        try:
+            errors = pool.map(self._upload_session_quicktime, uploads)
+        finally:
+            pool.close()
+            pool.join()
+
+        self.backburner_drain_upload_queue()
+
+        errors = [error for error in errors if error]
+        if errors:
+            raise TankError(
+                "%d of %d upload(s) failed:\n%s"
+                % (len(errors), len(uploads), "\n".join(errors))
+            )
+
+    def _upload_session_quicktime(self, upload, lease=None):
+        """
+        Uploads a quicktime from a batched upload job.
+
+        :param upload: Dictionary with the ``full_path`` and ``sg_version_id`` of the upload.
+                       If ``wait_for_thumbnail`` is True, the quicktime is only removed
+                       if its thumbnail has been generated already. If ``follow`` is
+                       True, the upload starts while Flame is still writing it.
+                       ``owner`` is the token of the job owning the queue entry.
+        :param lease: Optional number of seconds the queue entry is claimed for,
+                      the queue's owner lease by default.
+        :returns: An error message if the upload failed, None otherwise.
+        """
+        full_path = upload["full_path"]
+        sg_version_id = upload["sg_version_id"]
+        field_name = self._get_upload_field_name()
+        # jobs submitted before the queue entries were owned don't have a token.
+        owner = upload.get("owner") or uuid.uuid4().hex
+        wait_for_thumbnail = upload.get("wait_for_thumbnail", False)
+        entry_id = self.upload_queue.enqueue(
+            full_path,
+            sg_version_id,
+            field_name,
+            owner=owner,
+            wait_for_thumbnail=wait_for_thumbnail,
+        )
+
+        # this is our own upload, so don't wait for its retry delay if the job
+        # is being retried.
+        entry = self.upload_queue.claim(entry_id, owner=owner, lease=lease)
+        if not entry:
+            entry = self.upload_queue.get(entry_id)
+            if entry and entry["state"] == self.upload_queue.DONE:
+                self.log_debug("Upload of %s was already done by a drain." % full_path)
+                return
+            if entry and entry["state"] == self.upload_queue.FAILED:
+                return "%s: gave up after %d attempts: %s" % (
+                    full_path,
+                    entry["attempts"],
+                    entry["last_error"],
+                )
+            return "%s: is being uploaded by another worker." % full_path
+
+        try:
+            self._upload_quicktime(
+                full_path,
+                sg_version_id,
+                field_name,
+                remove=not wait_for_thumbnail,
+                follow=upload.get("follow", False),
+            )
+        except Exception as e:
+            self.log_exception("Upload of %s failed." % full_path)
+            self.upload_queue.fail(entry_id, e)
+            return "%s: %s" % (full_path, e)
+        self.upload_queue.complete(entry_id)
+
+        # the entry is marked as done before looking for the thumbnail marker, so
+        # that the cleanup job sees it if it looks at the same time.
+        if wait_for_thumbnail and os.path.exists(full_path + self.THUMBNAIL_DONE_SUFFIX):
+            self._remove_quicktime(full_path)
+
+    def backburner_thumbnails_done(self, paths):
+        """
+        This method is called via backburner once the thumbnails of an export
+        session have been generated. It removes the quicktimes which have been
+        uploaded already, and flags the others for their upload to remove.
+
+        :param paths: Paths of the quicktimes of the export session.
+        """
+        for full_path in paths:
+            # flag first, then look at the upload, see _upload_session_quicktime.
+            open(full_path + self.THUMBNAIL_DONE_SUFFIX, "w").close()
+            entries = self.upload_queue.find(full_path)
+            if entries and all(
+                entry["state"] == self.upload_queue.DONE for entry in entries
+            ):
+                self._remove_quicktime(full_path)
+
+    def _create_upload_client_job(self, title, desc, dependencies, uploads, host):
+        """
+        Submits a backburner job handing uploads over to the upload daemon.
+
+        The job runs ``upload_daemon.py`` as a script with Flame's Python, which
+        only needs the standard library, instead of bootstrapping the toolkit, the
+        engine and this app like the engine's jobs do. If the daemon is gone by
+        the time the job runs, the job releases the uploads in the upload queue for
+        the next drain and fails.
+
+        :param title: Title of the job.
+        :param desc: Description of the job.
+        :param dependencies: Ids of the jobs to wait for, or None.
+        :param uploads: List of the uploads to hand over, see
+                        :meth:`_upload_session_quicktime`.
+        :param host: Host the job should run on.
+        :returns: The id of the job, or None if it could not be submitted.
+        """
+        install_root = getattr(self.engine, "install_root", None)
+        python = getattr(self.engine, "python_executable", None)
+        if not install_root or not python:
+            return None
+
+        # the request holds the tokens owning the uploads, keep it to the user.
+        request_path = os.path.join(
+            self.engine.get_backburner_tmp(),
+            "tk_flame_review_upload_%s.json" % uuid.uuid4().hex,
+        )
+        with os.fdopen(
+            os.open(request_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "w"
+        ) as fh:
+            json.dump(
+                {
+                    "socket": self._get_upload_daemon_socket(),
+                    "queue": self.upload_queue.path,
+                    "uploads": uploads,
+                },
+                fh,
+            )
+
+        tk_flame_review = self.import_module("tk_flame_review")
+        try:
+            return tk_flame_review.backburner.submit_command_job(
+                os.path.join(install_root, "backburner", "cmdjob"),
+                title,
+                desc,
+                [
+                    python,
+                    os.path.join(
+                        self.disk_location, "python", "tk_flame_review", "upload_daemon.py"
+                    ),
+                    request_path,
+                ],
+                dependencies=dependencies,
+                servers=host,
+                manager=self.engine.get_setting("backburner_manager"),
+                group=self.engine.get_setting("backburner_server_group"),
+            )
+        except tk_flame_review.backburner.BackburnerError as e:
+            self.log_warning("Could not hand the uploads to the upload daemon: %s" % e)
+            os.remove(request_path)
+            return None
+
+    def _record_job_bootstrap_time(self):
+        """
+        Records how long this backburner job took to bootstrap the toolkit, the
+        engine and this app, which the jobs handing their uploads over to the
+        upload daemon save, see :meth:`_get_job_bootstrap_time`.
+        """
+        tk_flame_review = self.import_module("tk_flame_review")
+        bootstrap_time = tk_flame_review.upload_daemon.process_age()
+        if bootstrap_time is None:
+            return
+        path = os.path.join(self.cache_location, "job_bootstrap_time.json")
+        # jobs may run side by side, only ever replace the file as a whole.
+        tmp_path = "%s.%s" % (path, uuid.uuid4().hex)
+        try:
+            with open(tmp_path, "w") as fh:
+                json.dump({"bootstrap_time": bootstrap_time}, fh)
+            os.rename(tmp_path, path)
+        except EnvironmentError as e:
+            self.log_debug("Could not record the job bootstrap time: %s" % e)
+
+    def _get_job_bootstrap_time(self):
+        """
+        Returns the number of seconds the last upload job bootstrapping the toolkit
+        took to start, or None if no such job recorded it.
+        """
+        path = os.path.join(self.cache_location, "job_bootstrap_time.json")
+        try:
+            with open(path) as fh:
+                return json.load(fh)["bootstrap_time"]
+        except (EnvironmentError, ValueError, KeyError):
+            return None
+
+    def _get_upload_daemon_socket(self):
+        """
+        Returns the path of the upload daemon's Unix socket.
+
+        The socket is in a folder of the current user, which other users can't
+        access. The cache location makes the path specific to the site and project,
+        but is too long to hold the socket itself.
+        """
+        key = hashlib.md5(self.cache_location.encode("utf-8")).hexdigest()[:12]
+        return os.path.join(
+            tempfile.gettempdir(), "tk_flame_review_%d" % os.getuid(), "%s.sock" % key
+        )
+
+    def _start_upload_daemon(self):
+        """
+        Starts the upload daemon in this process if it is not running yet.
+        """
+        if self._upload_daemon and self._upload_daemon.running:
+            return
+
+        tk_flame_review = self.import_module("tk_flame_review")
+        # every worker sets up its own ShotGrid connection as soon as it starts,
+        # so that uploads handed over find it ready.
+        self._upload_daemon_pool = ThreadPool(
+            max(1, self.get_setting("upload_workers")),
+            initializer=self._warm_up_thread,
+        )
+        self._upload_daemon = tk_flame_review.upload_daemon.UploadDaemon(
+            self._get_upload_daemon_socket(),
+            self._on_upload_daemon_request,
+            warm_up=self._warm_up_connection,
+            logger=self.log_debug,
+            bootstrap_time=self._get_job_bootstrap_time,
+        )
+        try:
+            self._upload_daemon.start()
+        except Exception as e:
+            self.log_warning("Could not start the upload daemon: %s" % e)
+            self._stop_upload_daemon()
+
+    def _stop_upload_daemon(self):
+        """
+        Stops the upload daemon and its workers, if they are running.
+        """
+        if self._upload_daemon:
+            self._upload_daemon.stop()
+            self._upload_daemon = None
+        if self._upload_daemon_pool:
+            # let uploads in flight finish, and hand the ones Flame may not get to
+            # back to the upload queue, so that the next drain picks them up.
+            self._upload_daemon_pool.close()
+            self._upload_daemon_pool = None
+            for owner in self._upload_daemon_owners:
+                released = self.upload_queue.release(owner)
+                if released:
+                    self.log_debug(
+                        "Released %d upload(s) the upload daemon didn't finish."
+                        % released
+                    )
+            self._upload_daemon_owners = set()
+
+    def _warm_up_connection(self):
+        """
+        Authenticates the ShotGrid connection of the calling thread.
+        """
+        self.shotgun.find_one("Project", [["id", "is", self.context.project["id"]]])
+
+    def _warm_up_thread(self):
+        """
+        Initializer of the pool threads which authenticate their ShotGrid connection
+        as they start. A pool keeps restarting threads whose initializer fails, so
+        errors are only logged.
+        """
+        try:
+            self._warm_up_connection()
+        except Exception as e:
+            self.log_debug("Could not warm up ShotGrid: %s" % e)
+
+    def _warm_up(self):
+        """
+        Prepares ShotGrid for the first submission. Called by the warm up timer.
+
+        The toolkit gives each thread a ShotGrid connection of its own, so each
+        connection is authenticated by the thread which uses it: the
+        :attr:`shotgun_pool` and :attr:`submission_pool` are started, and their
+        threads authenticate as they start. Authenticating resolves the site's
+        address, loads its server info and refreshes the user's session.
+
+        One of the threads then fills the caches the submit dialog reads from,
+        see :meth:`_warm_up_caches`.
+        """
+        with self._lazy_lock:
+            if self._shotgun_pool is None:
+                self._shotgun_pool = ThreadPool(4, initializer=self._warm_up_thread)
+            if self._submission_pool is None:
+                self._submission_pool = ThreadPool(1, initializer=self._warm_up_thread)
+        self._shotgun_pool.apply_async(self._warm_up_caches)
+
+    def _warm_up_caches(self):
+        """
+        Fills the caches the submit dialog reads from: the TaskTemplates and the
+        local entity index. Runs in the :attr:`shotgun_pool`.
+        """
+        started = time.time()
+        try:
+            self.task_template_cache.fetch(self.shotgun, self.supported_entity_types)
+            if self.entity_index:
+                self.entity_index.sync(
+                    self.shotgun, self.context.project, self.supported_entity_types
+                )
+        except Exception as e:
+            self.log_debug("Could not warm up the submit dialog caches: %s" % e)
+            return
+        self.log_debug(
+            "Warmed up the submit dialog caches in %.3f seconds."
+            % (time.time() - started)
+        )
+
+    @property
+    def supported_entity_types(self):
+        """
+        Entity types the submit dialog can link Versions to.
+        """
+        return sorted(set([self.get_setting("shotgun_entity_type"), "Sequence", "Shot"]))
+
+    def _on_upload_daemon_request(self, uploads):
+        """
+        Called by the upload daemon with the uploads a backburner job handed over.
+
+        Only uploads this app queued for the job are accepted: the quicktime must
+        be in the backburner temporary folder, which the uploads remove files from,
+        and the job must own its entry in the upload queue.
+
+        :raises TankError: If any of the uploads is not accepted.
+        """
+        self.log_debug("Upload daemon received %d upload(s)." % len(uploads))
+        tmp_dir = os.path.realpath(self.engine.get_backburner_tmp())
+        for upload in uploads:
+            full_path = upload["full_path"]
+            if not os.path.realpath(full_path).startswith(tmp_dir + os.sep):
+                raise TankError(
+                    "Refusing to upload %s, which is not in %s." % (full_path, tmp_dir)
+                )
+            if not any(
+                entry["sg_version_id"] == upload["sg_version_id"]
+                and entry["owner"] == upload.get("owner")
+                for entry in self.upload_queue.find(full_path)
+            ):
+                raise TankError(
+                    "Refusing to upload %s, which is not queued for this job."
+                    % full_path
+                )
+        self._upload_daemon_pool.map_async(self._upload_daemon_quicktime, uploads)
+
+    def _upload_daemon_quicktime(self, upload):
+        """
+        Uploads a quicktime handed over to the upload daemon.
+
+        Flame may exit before the upload is done, and nothing retries the upload
+        then. Unless it waits for the export, the entry is only claimed for the
+        queue's lease instead of the job's owner lease, and it is released when the
+        daemon stops, see :meth:`_stop_upload_daemon`.
+        """
+        if upload.get("owner"):
+            self._upload_daemon_owners.add(upload["owner"])
+        lease = None if upload.get("follow") else self.upload_queue.lease
+        return self._upload_session_quicktime(upload, lease=lease)
+
+    def backburner_drain_upload_queue(self):
+        """
+        This method is called via backburner and therefore runs in the background.
+        It uploads every entry of the upload queue whose retry delay has elapsed.
         """
+        uploaded, failed = self.upload_queue.drain(self._upload_queue_entry)
+        if uploaded or failed:
+            self.log_debug(
+                "Drained upload queue: %d uploaded, %d failed." % (uploaded, failed)
+            )
+
+    @property
+    def upload_queue(self):
+        """
+        The :class:`UploadQueue` recording the uploads this app has to perform.
+        """
+        with self._lazy_lock:
+            if self._upload_queue is None:
+                tk_flame_review = self.import_module("tk_flame_review")
+                self._upload_queue = tk_flame_review.UploadQueue(
+                    os.path.join(self.cache_location, "upload_queue.db")
+                )
+            return self._upload_queue
+
+    def _upload_queue_entry(self, entry):
+        """
+        Uploads an entry picked from the upload queue by a drain.
+
+        Entries are picked from the queue regardless of the backburner job which
+        created them, so make sure Flame is done writing the quicktime first. A
+        quicktime the thumbnail job still needs is only removed once its thumbnail
+        has been generated, see :meth:`backburner_thumbnails_done`.
+
+        :returns: False if the entry was deferred.
+        """
+        full_path = entry["full_path"]
+        if not os.path.exists(full_path):
+            raise TankError("Cannot find quicktime '%s'!" % full_path)
+
+        age = time.time() - os.path.getmtime(full_path)
+        if age < self.UPLOAD_SETTLE_TIME:
+            self.log_debug("%s is still being written, deferring upload." % full_path)
+            self.upload_queue.defer(entry["id"], self.UPLOAD_SETTLE_TIME - age)
+            return False
+
+        wait_for_thumbnail = entry["wait_for_thumbnail"]
+        self._upload_quicktime(
+            full_path,
+            entry["sg_version_id"],
+            entry["field_name"],
+            remove=not wait_for_thumbnail,
+        )
+        if wait_for_thumbnail:
+            # mark the entry as done before looking for the thumbnail marker, see
+            # _upload_session_quicktime.
+            self.upload_queue.complete(entry["id"])
+            if os.path.exists(full_path + self.THUMBNAIL_DONE_SUFFIX):
+                self._remove_quicktime(full_path)
+
+    @property
+    def entity_index(self):
+        """
+        The :class:`EntityIndex` used by the submit dialog to complete entity codes,
+        or None if the ``local_entity_index`` setting is off.
+        """
+        if not self.get_setting("local_entity_index"):
+            return None
+        with self._lazy_lock:
+            if self._entity_index is None:
+                tk_flame_review = self.import_module("tk_flame_review")
+                self._entity_index = tk_flame_review.EntityIndex(
+                    os.path.join(self.cache_location, "entity_index.db")
+                )
+            return self._entity_index
+
+    @property
+    def task_template_cache(self):
+        """
+        The :class:`TaskTemplateCache` shared by all the submit dialogs.
+        """
+        with self._lazy_lock:
+            if self._task_template_cache is None:
+                tk_flame_review = self.import_module("tk_flame_review")
+                self._task_template_cache = tk_flame_review.TaskTemplateCache()
+            return self._task_template_cache
+
+    @property
+    def task_pool(self):
+        """
+        The :class:`BackgroundTaskPool` running the submit dialogs' background tasks.
+
+        Its ``stats()`` report the queue depth and the task latencies.
+        """
+        if self._task_pool is None:
+            tk_flame_review = self.import_module("tk_flame_review")
+            self._task_pool = tk_flame_review.BackgroundTaskPool(
+                max_threads=self.get_setting("task_pool_threads"),
+            )
+        return self._task_pool
+
+    def _get_upload_field_name(self):
+        """
+        Returns the Version field the quicktime is uploaded to.
+        """
+        if self.get_setting("bypass_shotgun_transcoding"):
+            return "sg_uploaded_movie_mp4"
+        return "sg_uploaded_movie"
+
+    def _upload_quicktime(self, full_path, sg_version_id, field_name, remove=True, follow=False):
+        """
+        Uploads the quicktime to the version and removes the temporary file.
+
+        :param remove: False to keep the temporary file once uploaded.
+        :param follow: True to start uploading while Flame is still writing the file.
+        """
+        tk_flame_review = self.import_module("tk_flame_review")
+        # upload in parts, so that a retried job resumes from the last part the
+        # server acknowledged instead of sending the whole file again.
+        uploader = tk_flame_review.ChunkedUploader(
+            self.shotgun,
+            chunk_size=max(5, self.get_setting("upload_chunk_size")) * 1024 * 1024,
+            concurrency=self.get_setting("upload_concurrency"),
+            logger=self.log_debug,
+        )
+
+        if follow:
+            self.log_debug("Following %s while Flame writes it..." % full_path)
+            uploader.follow("Version", sg_version_id, full_path, field_name)
+            self.log_debug("Upload complete!")
+            if remove:
+                self._remove_quicktime(full_path)
+            return
 
         if not os.path.exists(full_path):
             raise TankError("Cannot find quicktime '%s'! Aborting upload." % full_path)
@@ -344,21 +1404,28 @@ class FlameReview(Application):
         self.log_debug("File size is %s bytes." % os.path.getsize(full_path))
 
         # upload quicktime to ShotGrid
-        if self.get_setting("bypass_shotgun_transcoding"):
+        if field_name == "sg_uploaded_movie_mp4":
             self.log_debug("Begin upload of explicit mp4 quicktime to ShotGrid...")
-            field_name = "sg_uploaded_movie_mp4"
-
         else:
             self.log_debug("Begin upload of quicktime to ShotGrid...")
-            field_name = "sg_uploaded_movie"
 
-        self.shotgun.upload("Version", sg_version_id, full_path, field_name)
+        uploader.upload("Version", sg_version_id, full_path, field_name)
         self.log_debug("Upload complete!")
 
+        if remove:
+            self._remove_quicktime(full_path)
+
+    def _remove_quicktime(self, full_path):
+        """
+        Removes a temporary quicktime, along with its thumbnail marker.
+        """
         # clean up
         try:
             self.log_debug("Trying to remove temporary quicktime file...")
-            os.remove(full_path)
+            if os.path.exists(full_path):
+                os.remove(full_path)
+            if os.path.exists(full_path + self.THUMBNAIL_DONE_SUFFIX):
+                os.remove(full_path + self.THUMBNAIL_DONE_SUFFIX)
             self.log_debug("Temporary quicktime file successfully deleted.")
         except Exception as e:
             self.log_warning(
@@ -380,16 +1447,45 @@ class FlameReview(Application):
                      - presetPath: Path to the preset used for the export.
 
         """
+        # the session is over, whatever happens next.
+        session = self._sessions.pop(session_id, None)
+        if not session:
+            self.log_warning("Summary requested for unknown export session %s." % session_id)
+        else:
+            # creating the entities and Versions waits for ShotGrid, give Flame back
+            # to the artist straight away instead. Failures are logged.
+            self.submission_pool.apply_async(self._submit_session_uploads, (session,))
+
         # pop up a UI showing summary
         tk_flame_review = self.import_module("tk_flame_review")
         self.engine.show_modal(
             "Submission Summary",
             self,
             tk_flame_review.SummaryDialog,
-            self._submission_done,
+            bool(session and session.uploads),
         )
 
-    def request_submit_options(self, message, defaults=None):
+    def _get_new_entity_data(self, options, code):
+        """
+        Returns the fields of an entity created with the submit dialog's options.
+
+        :param options: Options returned by :meth:`request_submit_options`.
+        :param code: Code of the entity.
+        """
+        data = {
+            "code": code,
+            "description": "Created by the ShotGrid Flame integration.",
+            "task_template": options['task_template'],
+            "project": self.context.project,
+        }
+
+        # Set parent using entity_parent_fields setting.
+        parent_field_info = self.get_setting('entity_parent_fields').get(options['entity_type'])
+        if parent_field_info and options['parent']:
+            data[parent_field_info['field']] = options['parent']
+        return data
+
+    def request_submit_options(self, message, defaults=None, defer_creation=False):
         """
         Shows the ExtendedSubmitDialog with options for Selecting the Sequence to
         upload to, as well as options for choosing a Shot Task Template, Comment, and
@@ -398,59 +1494,90 @@ class FlameReview(Application):
         Arguments:
             message (str): A message to display at the top of the Dialog.
             defaults (dict): Default options for dialog.
+            defer_creation (bool): Create a new entity in the background instead
+                of waiting for ShotGrid. The entity is then None and the options
+                hold the pending creation as pending_entity.
 
         Defaults Schema:
             entity (dict): Entity dict with type, id, and code fields.
             mode (int): 0 - Select, 1 - New
             entity_name (str): Name of Entity.
             entity_type (str): Type of Entity.
+            auto_match (bool): Match each exported sequence to the entity of the
+                same name in creation mode, instead of using entity_name.
             task_template (str): Name of TaskTemplate to use in creation mode.
             shot_task_template (str): Name of TaskTemplate to use when creating Shots.
             presets (list): List of export presets to choose from.
             preset (str): Default export preset in presets list.
 
         Returns:
-            ShotGrid Entity dict.
+            Options dict, with the selected, found or created ShotGrid Entity
+            dict as entity. None if the user cancelled.
         """
 
+        from sgtk.platform.qt import QtCore
+
+        # time each step of opening the dialog, to keep an eye on its latency.
+        timings = [time.time()]
         tk_flame_review = self.import_module("tk_flame_review")
-        dialog = tk_flame_review.ExtendedSubmitDialog(
+        # the first access imports the dialog module, Qt and the frameworks.
+        ExtendedSubmitDialog = tk_flame_review.ExtendedSubmitDialog
+        timings.append(time.time())
+        dialog = ExtendedSubmitDialog(
             app=self,
             message=message,
             defaults=defaults,
             parent=self.engine._get_dialog_parent(),
         )
+        timings.append(time.time())
+
+        def log_open_latency():
+            timings.append(time.time())
+            self.log_debug(
+                "Submit dialog opened in %.3f seconds (import %.3f, build %.3f, show %.3f)."
+                % (
+                    timings[3] - timings[0],
+                    timings[1] - timings[0],
+                    timings[2] - timings[1],
+                    timings[3] - timings[2],
+                )
+            )
+
+        # fires once exec_ has shown the dialog and is processing events.
+        QtCore.QTimer.singleShot(0, log_open_latency)
         return_code = dialog.exec_()
         if return_code == dialog.Rejected:
             return
 
         options = dialog.get_options()
-        self._submit_options = options
+
+        if options['mode'] == dialog.New and options['auto_match']:
+            # the entities are only known once the sequences have been exported.
+            self.log_debug('Matching the exported sequences to %s entities...' % options['entity_type'])
+            options['entity'] = None
+            return options
 
         if options['mode'] == dialog.New:
-            # Check if entity already exists
-            entity = self.shotgun.find_one(
-                options['entity_type'],
-                [['code', 'is', options['entity_name']], ['project', 'is', self.context.project]],
-                ['code'],
-            )
+            # Check if entity already exists, the dialog usually found out while
+            # the artist was typing its name.
+            checked, entity = dialog.get_existing_entity()
+            if checked is None:
+                entity = self.shotgun.find_one(
+                    options['entity_type'],
+                    [['code', 'is', options['entity_name']], ['project', 'is', self.context.project]],
+                    ['code'],
+                )
             if entity:
                 self.log_debug('Found existing entity %s...' % entity)
-                self._submit_entity = entity
+                options['entity'] = entity
                 return options
 
             # Create it if it doesn't
-            data = {
-                "code": options['entity_name'],
-                "description": "Created by the ShotGrid Flame integration.",
-                "task_template": options['task_template'],
-                "project": self.context.project,
-            }
-
-            # Set parent using entity_parent_fields setting.
-            parent_field_info = self.get_setting('entity_parent_fields').get(options['entity_type'])
-            if parent_field_info and options['parent']:
-                data[parent_field_info['field']] = options['parent']
+            data = self._get_new_entity_data(options, options['entity_name'])
+            if defer_creation:
+                options['entity'] = None
+                options['pending_entity'] = self._create_entity_async(options['entity_type'], data)
+                return options
 
             self.log_debug('Creating entity with data %s' % data)
             entity = self.shotgun.create(
@@ -459,10 +1586,9 @@ class FlameReview(Application):
                 ['code'],
             )
             self.log_debug('Created entity %s...' % entity)
-            self._submit_entity = entity
+            options['entity'] = entity
             return options
 
         if options['entity']:
             self.log_debug('Existing entity selected %s...' % options['entity'])
-            self._submit_entity = options['entity']
             return options
@@ -8,6 +8,37 @@
 # agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
-from .submit_dialog import SubmitDialog
-from .summary_dialog import SummaryDialog
-from .extended_submit_dialog import ExtendedSubmitDialog
\ No newline at end of file
+import importlib
+import sys
+
+from .upload import ChunkedUploader, UploadError
+from .upload_queue import UploadQueue
+from . import backburner, upload_daemon
+from .export_session import ExportSession
+from .entity_index import EntityIndex
+from .task_template_cache import TaskTemplateCache
+
+# Classes needing Qt or the frameworks, only imported once they are used so that
+# loading the app doesn't pay for them.
+_LAZY_IMPORTS = {
+    "SubmitDialog": ".submit_dialog",
+    "SummaryDialog": ".summary_dialog",
+    "ExtendedSubmitDialog": ".extended_submit_dialog",
+    "BackgroundTaskPool": ".task_pool",
+}
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        if name not in _LAZY_IMPORTS:
+            raise AttributeError("module %r has no attribute %r" % (__name__, name))
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+
+else:
+    # no module __getattr__ before Python 3.7
+    from .submit_dialog import SubmitDialog
+    from .summary_dialog import SummaryDialog
+    from .extended_submit_dialog import ExtendedSubmitDialog
+    from .task_pool import BackgroundTaskPool
@@ -0,0 +1,105 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Backburner jobs running a plain command line.
+"""
+
+from __future__ import absolute_import
+
+import datetime
+import re
+import subprocess
+
+
+class BackburnerError(Exception):
+    """
+    Raised when a job cannot be submitted to backburner.
+    """
+
+
+def submit_command_job(
+    cmdjob,
+    name,
+    description,
+    command,
+    dependencies=None,
+    servers=None,
+    manager=None,
+    group=None,
+):
+    """
+    Submits a backburner job running the given command line as the current user.
+
+    The engine's ``create_local_backburner_job`` runs an app method, which means
+    bootstrapping the toolkit, the engine and the app in the job first. Jobs
+    submitted here skip all of that, and are meant for commands which only need
+    the Python standard library. The job is submitted the way the engine submits
+    its own.
+
+    :param cmdjob: Path of backburner's ``cmdjob`` executable.
+    :param name: Name of the job.
+    :param description: Description of the job.
+    :param command: List of the arguments of the command line the job runs.
+    :param dependencies: Optional id, or list of ids, of the jobs to wait for.
+    :param servers: Optional backburner servers the job can run on.
+    :param manager: Optional backburner manager to submit the job to.
+    :param group: Optional backburner server group the job runs on.
+    :returns: The id of the job.
+    :raises BackburnerError: If the job could not be submitted.
+    """
+    # backburner doesn't sanitize the job info, and rejects it when too long.
+    name = _sanitize(name)
+    description = _sanitize(description)
+    # the convention in Flame is to append a time stamp to job names.
+    name += datetime.datetime.now().strftime(" (%H.%M.%S)")
+
+    args = [
+        cmdjob,
+        "-userRights",
+        "-timeout:600",
+        "-jobName:%s" % name,
+        "-description:%s" % description,
+    ]
+    if manager:
+        args.append("-manager:%s" % manager)
+    if group:
+        args.append("-group:%s" % group)
+    if servers:
+        args.append("-servers:%s" % servers)
+    if dependencies:
+        if isinstance(dependencies, (list, tuple)):
+            dependencies = ",".join(dependencies)
+        args.append("-dependencies:%s" % dependencies)
+    args.extend(command)
+
+    try:
+        process = subprocess.Popen(
+            args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+        )
+        output = process.communicate()[0].decode("utf-8", "replace")
+    except OSError as e:
+        raise BackburnerError("Could not run %s: %s" % (cmdjob, e))
+
+    match = re.search(r"Successfully submitted job (\d+)", output)
+    if not match:
+        raise BackburnerError("Backburner job could not be created: %s" % output)
+    return match.group(1)
+
+
+def _sanitize(text, max_length=70):
+    """
+    Returns text with only the characters backburner accepts, shortened to
+    max_length characters.
+    """
+    text = re.sub(r"[^0-9a-zA-Z_\-,\. ]+", "_", text)
+    if len(text) > max_length:
+        text = "%s..." % text[: max_length - 3]
+    return text
@@ -0,0 +1,268 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Local, incrementally synced index of entity codes used for instant completion.
+"""
+
+from __future__ import absolute_import
+
+import datetime
+import os
+import sqlite3
+import threading
+import time
+
+
+class EntityIndex(object):
+    """
+    SQLite index of the codes of a project's entities.
+
+    The index is brought up to date with :meth:`sync`, which only fetches the
+    entities updated since the previous sync, and answers :meth:`search` locally.
+    A trigram full text index is used when the SQLite library supports it.
+    """
+
+    # bumped when the tables change, the index is then rebuilt from scratch.
+    SCHEMA_VERSION = 1
+
+    def __init__(self, path):
+        """
+        :param path: Path to the SQLite database, created if needed.
+        """
+        self.path = path
+        self._sync_lock = threading.Lock()
+
+        folder = os.path.dirname(path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        conn = self._connect()
+        try:
+            if conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                # an index written by an earlier version, which is only a cache.
+                conn.executescript(
+                    """
+                    DROP TRIGGER IF EXISTS entities_ai;
+                    DROP TRIGGER IF EXISTS entities_ad;
+                    DROP TRIGGER IF EXISTS entities_au;
+                    DROP TABLE IF EXISTS entities_fts;
+                    DROP TABLE IF EXISTS entities;
+                    DROP TABLE IF EXISTS syncs;
+                    """
+                )
+                conn.execute("PRAGMA user_version = %d" % self.SCHEMA_VERSION)
+            # the full text index refers to the rows by pk, which unlike an
+            # implicit rowid is kept by VACUUM.
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS entities (
+                    pk INTEGER PRIMARY KEY,
+                    entity_type TEXT NOT NULL,
+                    id INTEGER NOT NULL,
+                    project_id INTEGER NOT NULL,
+                    code TEXT NOT NULL,
+                    UNIQUE (entity_type, id)
+                );
+                CREATE TABLE IF NOT EXISTS syncs (
+                    entity_type TEXT NOT NULL,
+                    project_id INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (entity_type, project_id)
+                );
+                """
+            )
+            try:
+                conn.executescript(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(
+                        code, content='entities', content_rowid='pk', tokenize='trigram'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS entities_ai AFTER INSERT ON entities BEGIN
+                        INSERT INTO entities_fts(rowid, code) VALUES (new.pk, new.code);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entities_ad AFTER DELETE ON entities BEGIN
+                        INSERT INTO entities_fts(entities_fts, rowid, code)
+                        VALUES ('delete', old.pk, old.code);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entities_au AFTER UPDATE ON entities BEGIN
+                        INSERT INTO entities_fts(entities_fts, rowid, code)
+                        VALUES ('delete', old.pk, old.code);
+                        INSERT INTO entities_fts(rowid, code) VALUES (new.pk, new.code);
+                    END;
+                    """
+                )
+                self._fts = True
+            except sqlite3.OperationalError:
+                # no fts5 or trigram tokenizer in this SQLite build, fall back to
+                # plain substring matching, which is still fast enough for the
+                # size of a project.
+                self._fts = False
+        finally:
+            conn.close()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def last_sync(self, entity_type, project_id):
+        """
+        Returns the time stamp of the most recent update indexed for the entity type,
+        or None if it was never synced.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT updated_at FROM syncs WHERE entity_type = ? AND project_id = ?",
+                (entity_type, project_id),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row["updated_at"] if row else None
+
+    def is_synced(self, entity_types, project_id):
+        """
+        Returns True if all the entity types were synced at least once, so that
+        searching the index finds all their entities.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT count(*) FROM syncs WHERE project_id = ? AND entity_type IN (%s)"
+                % ", ".join("?" * len(entity_types)),
+                [project_id] + list(entity_types),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0] == len(set(entity_types))
+
+    def sync(self, shotgun, project, entity_types):
+        """
+        Brings the index up to date with ShotGrid.
+
+        Only the entities updated since the previous sync are fetched, along with
+        the entities retired since then.
+
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        :param project: Project entity dictionary.
+        :param entity_types: List of entity types to sync.
+        :returns: Number of entities added, updated or removed.
+        """
+        changes = 0
+        # a sync triggered while another one is running has nothing left to do.
+        with self._sync_lock:
+            for entity_type in entity_types:
+                changes += self._sync_entity_type(shotgun, project, entity_type)
+        return changes
+
+    def _sync_entity_type(self, shotgun, project, entity_type):
+        filters = [["project", "is", project]]
+        last_sync = self.last_sync(entity_type, project["id"])
+        if last_sync is not None:
+            # shotgun_api3 treats naive datetimes as local time.
+            since = datetime.datetime.fromtimestamp(last_sync)
+            filters.append(["updated_at", "greater_than", since])
+
+        entities = shotgun.find(entity_type, filters, ["code", "updated_at"])
+        retired = []
+        if last_sync is not None:
+            retired = shotgun.find(entity_type, filters, [], retired_only=True)
+
+        # the first sync is recorded even without entities, see is_synced.
+        if not entities and not retired and last_sync is not None:
+            return 0
+
+        newest = last_sync or 0
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            for entity in entities:
+                code = entity.get("code") or ""
+                # update in place rather than replacing the row, so that the full
+                # text index triggers see the change.
+                updated = conn.execute(
+                    "UPDATE entities SET code = ? WHERE entity_type = ? AND id = ?",
+                    (code, entity_type, entity["id"]),
+                )
+                if not updated.rowcount:
+                    conn.execute(
+                        "INSERT INTO entities (entity_type, id, project_id, code) "
+                        "VALUES (?, ?, ?, ?)",
+                        (entity_type, entity["id"], project["id"], code),
+                    )
+                if entity.get("updated_at"):
+                    newest = max(newest, time.mktime(entity["updated_at"].timetuple()))
+            for entity in retired:
+                conn.execute(
+                    "DELETE FROM entities WHERE entity_type = ? AND id = ?",
+                    (entity_type, entity["id"]),
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO syncs (entity_type, project_id, updated_at) "
+                "VALUES (?, ?, ?)",
+                (entity_type, project["id"], newest),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return len(entities) + len(retired)
+
+    def search(self, text, project_id, entity_types, limit=20):
+        """
+        Returns the entities whose code contains the given text.
+
+        Codes starting with the text are listed first.
+
+        :param text: Text to look for, case insensitive.
+        :param project_id: Id of the project to search in.
+        :param entity_types: List of entity types to search.
+        :param limit: Maximum number of entities returned.
+        :returns: List of entity dictionaries with ``type``, ``id`` and ``code`` keys.
+        """
+        text = text.strip()
+        if not text or not entity_types:
+            return []
+
+        type_filter = ", ".join("?" * len(entity_types))
+        params = [project_id] + list(entity_types)
+        if self._fts and len(text) >= 3:
+            # trigrams need at least three characters to match anything.
+            query = (
+                "SELECT e.entity_type, e.id, e.code FROM entities_fts f "
+                "JOIN entities e ON e.pk = f.rowid "
+                "WHERE entities_fts MATCH ? AND e.project_id = ? AND e.entity_type IN (%s) "
+                % type_filter
+            )
+            params.insert(0, '"%s"' % text.replace('"', '""'))
+        else:
+            query = (
+                "SELECT e.entity_type, e.id, e.code FROM entities e "
+                "WHERE e.code LIKE ? ESCAPE '\\' AND e.project_id = ? "
+                "AND e.entity_type IN (%s) " % type_filter
+            )
+            escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            params.insert(0, "%%%s%%" % escaped)
+
+        query += "ORDER BY e.code NOT LIKE ?, length(e.code), e.code LIMIT ?"
+        params.extend(["%s%%" % text, limit])
+
+        conn = self._connect()
+        try:
+            rows = conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+        return [
+            {"type": row["entity_type"], "id": row["id"], "code": row["code"]}
+            for row in rows
+        ]
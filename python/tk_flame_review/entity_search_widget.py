@@ -0,0 +1,85 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+from sgtk.platform.qt import QtCore, QtGui
+
+
+class IndexedSearchWidget(QtGui.QLineEdit):
+    """
+    Line edit completing entity codes from the local :class:`EntityIndex`.
+
+    Offers the same ``entity_activated`` signal and ``set_searchable_entity_types``
+    method as the qtwidgets ``GlobalSearchWidget``, but answers every keystroke
+    locally instead of sending a text search to ShotGrid.
+    """
+
+    # emitted with the type, id and code of the entity picked by the user.
+    entity_activated = QtCore.Signal(str, int, str)
+
+    _ENTITY_ROLE = QtCore.Qt.UserRole + 1
+    _CODE_ROLE = QtCore.Qt.UserRole + 2
+
+    def __init__(self, index, project_id, parent=None):
+        """
+        :param index: :class:`EntityIndex` to search.
+        :param project_id: Id of the project to search in.
+        :param parent: Parent widget.
+        """
+        super(IndexedSearchWidget, self).__init__(parent)
+        self._index = index
+        self._project_id = project_id
+        self._entity_types = []
+
+        self._model = QtGui.QStandardItemModel(self)
+        # the index does the matching, so the completer must show every result
+        # as is instead of filtering them on the text again.
+        self._completer = QtGui.QCompleter(self._model, self)
+        self._completer.setCompletionMode(QtGui.QCompleter.UnfilteredPopupCompletion)
+        self._completer.setCompletionRole(self._CODE_ROLE)
+        self._completer.setWidget(self)
+        self._completer.activated[QtCore.QModelIndex].connect(self._on_activated)
+
+        self.setPlaceholderText("Search...")
+        self.textEdited.connect(self.refresh)
+
+    def set_searchable_entity_types(self, types):
+        """
+        Sets the entity types to search.
+
+        :param types: Dictionary keyed by entity type, as for ``GlobalSearchWidget``.
+                      Filters are not supported and ignored.
+        """
+        self._entity_types = sorted(types)
+
+    def refresh(self, text=None):
+        """
+        Updates the completions for the given text, or the current one.
+        """
+        text = self.text() if text is None else text
+        results = self._index.search(text, self._project_id, self._entity_types)
+
+        self._model.clear()
+        for entity in results:
+            item = QtGui.QStandardItem("%s  (%s)" % (entity["code"], entity["type"]))
+            item.setData(entity["code"], self._CODE_ROLE)
+            item.setData(entity, self._ENTITY_ROLE)
+            self._model.appendRow(item)
+
+        if results and self.hasFocus():
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def _on_activated(self, index):
+        entity = index.data(self._ENTITY_ROLE)
+        self.setText(entity["code"])
+        self.entity_activated.emit(entity["type"], entity["id"], entity["code"])
@@ -0,0 +1,60 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+
+class ExportSession(object):
+    """
+    State of a single Flame export session, from preCustomExport to postCustomExport.
+
+    Flame passes a session id to every export hook, and background exports mean
+    several sessions can be in flight at the same time. Keeping the state per
+    session makes sure assets are always linked to the entity chosen for their
+    own session.
+    """
+
+    def __init__(self, session_id):
+        """
+        :param session_id: Id Flame gave to the export session.
+        """
+        self.session_id = session_id
+
+        # options chosen by the user in the submit dialog.
+        self.options = None
+
+        # the entity the Versions are linked to.
+        self.entity = None
+
+        # AsyncResult of the entity while it is being created in the background,
+        # entity is None until then.
+        self.pending_entity = None
+
+        # the comments entered by the user.
+        self.comments = ""
+
+        # host the export, and therefore the upload job, runs on.
+        self.host = None
+
+        # one entry per exported quicktime, see FlameReview.populate_shotgun.
+        self.uploads = []
+
+        # shot name, sequence name, index and record range of the exported
+        # segments, see FlameReview.populate_shotgun.
+        self.segments = []
+
+        # backburner jobs the upload job depends on.
+        self.dependencies = []
+
+        # flag to indicate that something was actually submitted
+        self.submission_done = False
+
+    def __repr__(self):
+        return "<ExportSession %s: %d upload(s)>" % (self.session_id, len(self.uploads))
@@ -1,15 +1,26 @@
 import sgtk
 from sgtk.platform.qt import QtCore, QtGui
 
+from .entity_search_widget import IndexedSearchWidget
 
-task_manager = sgtk.platform.import_framework(
-    'tk-framework-shotgunutils',
-    'task_manager',
-)
-shotgun_search_widget = sgtk.platform.import_framework(
-    'tk-framework-qtwidgets',
-    'shotgun_search_widget',
-)
+
+_shotgun_search_widget = None
+
+
+def shotgun_search_widget():
+    """
+    Returns the qtwidgets framework's shotgun_search_widget module.
+
+    The framework is only imported when a dialog first needs a search widget.
+    """
+
+    global _shotgun_search_widget
+    if _shotgun_search_widget is None:
+        _shotgun_search_widget = sgtk.platform.import_framework(
+            'tk-framework-qtwidgets',
+            'shotgun_search_widget',
+        )
+    return _shotgun_search_widget
 
 
 def FieldLabel(text):
@@ -47,11 +58,26 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self._template = None
         self._shot_template = None
         self._parent = None
-        self._task_manager = task_manager.BackgroundTaskManager(
-            parent=self,
-            start_processing=True,
-            max_threads=2,
-        )
+        self._index_sync_task = None
+        self._template_fetch_task = None
+        self._pending_template = None
+        self._search_widgets = []
+        self._template_entity_type = self.default_entity_type
+        self._parent_entity_type = None
+        # (entity type, name) -> existing entity or None, see _check_entity_exists
+        self._existing_entities = {}
+        self._existence_tasks = {}
+        # The app's task pool outlives the dialog, tasks are grouped so that
+        # the ones still running can be stopped when the dialog goes away.
+        self._task_group = 'extended_submit_dialog_%d' % id(self)
+        self._task_manager = app.task_pool
+        self._task_manager.task_completed.connect(self._on_task_completed)
+        self._task_manager.task_failed.connect(self._on_task_failed)
+
+        # TaskTemplates are shared by all dialogs, start fetching them straight away
+        # if they aren't cached yet.
+        if not self.app.task_template_cache.fresh:
+            self._fetch_task_templates()
 
         # Header
         self.message = QtGui.QLabel(message)
@@ -59,13 +85,7 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self.message.setMinimumHeight(24)
 
         # Select tab
-        self.entity_selector = shotgun_search_widget.GlobalSearchWidget(self)
-        self.entity_selector.set_searchable_entity_types({
-            entity_type: []
-            for entity_type in self.supported_entity_types
-        })
-        self.entity_selector.set_bg_task_manager(self._task_manager)
-        self.entity_selector.completer().entity_activated.disconnect(self.entity_selector.clear)
+        self.entity_selector = self._create_entity_selector()
 
         self.select_tab_layout = QtGui.QFormLayout()
         self.select_tab_layout.addRow(FieldLabel('Entity:'), self.entity_selector)
@@ -75,26 +95,32 @@ class ExtendedSubmitDialog(QtGui.QDialog):
 
         # New Tab
         self.entity_name = QtGui.QLineEdit()
+        self.entity_status = QtGui.QLabel()
+        self.auto_match = QtGui.QCheckBox('Match each sequence by name instead')
+        self.auto_match.setToolTip(
+            'Link every exported sequence to the entity with the same name, '
+            'creating the ones which don\'t exist yet.'
+        )
+
+        # Check if the entity exists once the artist stops typing
+        self._existence_timer = QtCore.QTimer(self)
+        self._existence_timer.setSingleShot(True)
+        self._existence_timer.setInterval(300)
+        self._existence_timer.timeout.connect(self._check_entity_exists)
 
         self.entity_type = QtGui.QComboBox()
         self.entity_type.addItems(self.supported_entity_types)
 
-        self.template_selector = shotgun_search_widget.GlobalSearchWidget(self)
-        self.template_selector.set_searchable_entity_types({
-            'TaskTemplate': [['entity_type', 'is', self.default_entity_type]],
-        })
-        self.template_selector.set_bg_task_manager(self._task_manager)
-        self.template_selector.completer().entity_activated.disconnect(self.template_selector.clear)
-
-        self.parent_selector = shotgun_search_widget.GlobalSearchWidget(self)
-        self.parent_selector.set_bg_task_manager(self._task_manager)
-        self.parent_selector.completer().entity_activated.disconnect(self.parent_selector.clear)
+        # Most submissions only use the Select tab, the search widgets are built
+        # the first time the New tab is shown, see _create_new_tab_selectors.
+        self.template_selector = None
+        self.parent_selector = None
 
         self.new_tab_layout = QtGui.QFormLayout()
         self.new_tab_layout.addRow(FieldLabel('Name:'), self.entity_name)
+        self.new_tab_layout.addRow('', self.entity_status)
+        self.new_tab_layout.addRow('', self.auto_match)
         self.new_tab_layout.addRow(FieldLabel('Type:'), self.entity_type)
-        self.new_tab_layout.addRow(FieldLabel('Template:'), self.template_selector)
-        self.new_tab_layout.addRow(FieldLabel('Parent:'), self.parent_selector)
 
         self.new_tab = QtGui.QWidget()
         self.new_tab.setLayout(self.new_tab_layout)
@@ -104,6 +130,7 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self.tabs.setDocumentMode(True)
         self.tabs.addTab(self.select_tab, 'Select')
         self.tabs.addTab(self.new_tab, 'New')
+        self.tabs.currentChanged.connect(self._on_tab_changed)
 
         # Options
         self.comment = QtGui.QTextEdit()
@@ -135,11 +162,9 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self.exit_code = QtGui.QDialog.Rejected
         self.submit_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
-        self.cancel_button.clicked.connect(self._task_manager.shut_down)
         self.entity_name.textEdited.connect(self._on_entity_name_changed)
+        self.auto_match.toggled.connect(self._on_auto_match_toggled)
         self.entity_selector.entity_activated.connect(self._on_entity_changed)
-        self.template_selector.entity_activated.connect(self._on_template_changed)
-        self.parent_selector.entity_activated.connect(self._on_parent_changed)
         self.entity_type.currentTextChanged.connect(self._on_entity_type_changed)
 
         # Window Attributes
@@ -150,16 +175,201 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         if defaults:
             self.set_options(defaults)
 
+    def _create_entity_selector(self):
+        """
+        Creates the Select tab's entity search widget.
+
+        Completes from the app's local entity index when it is enabled, syncing
+        it in the background, and falls back to live ShotGrid searches otherwise.
+        """
+
+        searchable_types = {
+            entity_type: []
+            for entity_type in self.supported_entity_types
+        }
+
+        index = self.app.entity_index
+        if index:
+            self._index_sync_task = self._task_manager.add_task(
+                self._sync_entity_index,
+                group=self._task_group,
+            )
+            project_id = self.app.context.project['id']
+            # A cold index would find nothing until its first sync is done, search
+            # ShotGrid instead until the next dialog.
+            if index.is_synced(self.supported_entity_types, project_id):
+                widget = IndexedSearchWidget(index, project_id, self)
+                widget.set_searchable_entity_types(searchable_types)
+                return widget
+
+        widget = self._create_search_widget()
+        widget.set_searchable_entity_types(searchable_types)
+        return widget
+
+    def _create_search_widget(self):
+        """Creates a GlobalSearchWidget searching ShotGrid from the app's task pool."""
+
+        widget = shotgun_search_widget().GlobalSearchWidget(self)
+        widget.set_bg_task_manager(self._task_manager)
+        widget.completer().entity_activated.disconnect(widget.clear)
+        self._search_widgets.append(widget)
+        return widget
+
+    def _create_new_tab_selectors(self):
+        """
+        Creates the New tab's template and parent search widgets, applying the
+        options set while they didn't exist yet.
+        """
+
+        if self.template_selector is not None:
+            return
+
+        self.template_selector = self._create_search_widget()
+        self.parent_selector = self._create_search_widget()
+
+        self.new_tab_layout.addRow(FieldLabel('Template:'), self.template_selector)
+        self.new_tab_layout.addRow(FieldLabel('Parent:'), self.parent_selector)
+
+        self.template_selector.entity_activated.connect(self._on_template_changed)
+        self.parent_selector.entity_activated.connect(self._on_parent_changed)
+
+        self._apply_task_template_filters()
+        if self._template:
+            self.template_selector.setText(
+                self._template.get('name', self._template.get('code', ''))
+            )
+        self._apply_parent_field()
+
+    def _on_tab_changed(self, index):
+        if index == self.New:
+            self._create_new_tab_selectors()
+
+    def _sync_entity_index(self):
+        # Runs in a background thread, where app.shotgun is a connection of its own.
+        return self.app.entity_index.sync(
+            self.app.shotgun,
+            self.app.context.project,
+            self.supported_entity_types,
+        )
+
+    def _on_task_completed(self, uid, group, result):
+        if uid == self._index_sync_task and result and isinstance(
+            self.entity_selector, IndexedSearchWidget
+        ):
+            # Entities were added or renamed, refresh what the user is looking at
+            self.entity_selector.refresh()
+
+        if uid == self._template_fetch_task:
+            self._on_task_templates_fetched()
+
+        if uid in self._existence_tasks:
+            key = self._existence_tasks.pop(uid)
+            self._existing_entities[key] = result
+            self._update_entity_status()
+
+    def _on_task_failed(self, uid, group, message, traceback_str):
+        if uid == self._template_fetch_task:
+            self._template_fetch_task = None
+            self.app.log_warning('Could not fetch TaskTemplates: %s' % message)
+
+        if uid in self._existence_tasks:
+            self._existence_tasks.pop(uid)
+            self.app.log_warning('Could not check if the entity exists: %s' % message)
+            self._update_entity_status()
+
+    def _entity_key(self):
+        return (self.entity_type.currentText(), self.entity_name.text())
+
+    def _schedule_entity_check(self):
+        """Looks the New tab's entity up shortly after its name or type last changed."""
+
+        self._update_entity_status()
+        self._existence_timer.start()
+
+    def _check_entity_exists(self):
+        """Looks the New tab's entity up in the background, unless it was already."""
+
+        key = self._entity_key()
+        if not key[1].strip() or self._task_manager is None:
+            return
+        if key in self._existing_entities or key in self._existence_tasks.values():
+            return
+
+        uid = self._task_manager.add_task(
+            self._find_entity,
+            group=self._task_group,
+            task_args=list(key),
+        )
+        self._existence_tasks[uid] = key
+
+    def _find_entity(self, entity_type, name):
+        # Runs in a background thread, where app.shotgun is a connection of its own.
+        return self.app.shotgun.find_one(
+            entity_type,
+            [['code', 'is', name], ['project', 'is', self.app.context.project]],
+            ['code'],
+        )
+
+    def _update_entity_status(self):
+        entity_type, name = key = self._entity_key()
+        if not name.strip():
+            text = ''
+        elif key not in self._existing_entities:
+            text = 'Checking...'
+        elif self._existing_entities[key]:
+            text = 'The existing %s will be used.' % entity_type
+        else:
+            text = 'A new %s will be created.' % entity_type
+        self.entity_status.setText('<i>%s</i>' % text if text else '')
+
+    def get_existing_entity(self):
+        """
+        Returns whether the New tab's entity exists and the existing entity.
+
+        :returns: Tuple of True and the entity dict if it exists, of False and None
+                  if it doesn't, or of None and None if the check didn't finish.
+        """
+
+        key = self._entity_key()
+        if key not in self._existing_entities:
+            return None, None
+        entity = self._existing_entities[key]
+        return bool(entity), entity
+
+    def _release_task_manager(self):
+        """
+        Stops this dialog's background tasks and disconnects it from the app's
+        task pool, which is left running for the next dialog.
+        """
+
+        if self._task_manager is None:
+            return
+
+        self._existence_timer.stop()
+        for widget in self._search_widgets:
+            # stops the searches the widget still has in flight
+            widget.destroy()
+
+        self._task_manager.stop_task_group(self._task_group)
+        self._task_manager.task_completed.disconnect(self._on_task_completed)
+        self._task_manager.task_failed.disconnect(self._on_task_failed)
+        self.app.log_debug('Task pool stats: %s' % self._task_manager.stats())
+        self._task_manager = None
+
     def accept(self):
         if not self.validate():
             # Cancel accept - allow user to fix options...
             return
 
-        self._task_manager.shut_down()
+        self._release_task_manager()
         super(ExtendedSubmitDialog, self).accept()
 
+    def reject(self):
+        self._release_task_manager()
+        super(ExtendedSubmitDialog, self).reject()
+
     def closeEvent(self, event):
-        self._task_manager.shut_down()
+        self._release_task_manager()
         event.accept()
 
     @property
@@ -172,7 +382,7 @@ class ExtendedSubmitDialog(QtGui.QDialog):
 
     @property
     def supported_entity_types(self):
-        return sorted(set([self.default_entity_type, 'Sequence', 'Shot']))
+        return self.app.supported_entity_types
 
     @property
     def entity_parent_fields(self):
@@ -182,6 +392,7 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self._parent = {'type': type, 'id': id, 'code': name}
 
     def _on_template_changed(self, type, id, name):
+        self._pending_template = None
         self._template = {'type': type, 'id': id, 'code': name}
 
     def _on_entity_changed(self, type, id, name):
@@ -192,10 +403,23 @@ class ExtendedSubmitDialog(QtGui.QDialog):
     def _on_entity_type_changed(self, entity_type):
         self.update_task_template_filters(entity_type, self.default_template)
         self.update_parent_field(entity_type)
+        self._schedule_entity_check()
 
     def _on_entity_name_changed(self, text):
         label = self.new_tab_layout.labelForField(self.entity_name)
         label.setValid(True)
+        self._schedule_entity_check()
+
+    def _on_auto_match_toggled(self, checked):
+        self.entity_name.setEnabled(not checked)
+        self.entity_status.setVisible(not checked)
+        label = self.new_tab_layout.labelForField(self.entity_name)
+        label.setValid(True)
+
+    def set_auto_match(self, auto_match):
+        """Set the auto_match option."""
+
+        self.auto_match.setChecked(auto_match)
 
     def set_comment(self, text):
         """Sets the comment field's text."""
@@ -222,11 +446,13 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         self.entity_name.setText(entity_name)
         self.entity_type.setCurrentText(entity_type)
         self.update_task_template_filters(entity_type, self.default_template)
+        self._schedule_entity_check()
 
     def set_entity_name(self, entity_name):
         """Set the entity_name option."""
         
         self.entity_name.setText(entity_name)
+        self._schedule_entity_check()
 
     def set_entity_type(self, entity_type):
         """
@@ -250,29 +476,97 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         """
 
         if isinstance(template, dict):
-            self.template_selector.setText(template.get('name', template.get('code', '')))
+            self._pending_template = None
             self._template = template
+            if self.template_selector is not None:
+                self.template_selector.setText(template.get('name', template.get('code', '')))
             return
         else:
             entity_type = entity_type or self.entity_type.currentText()
-            template = self.app.shotgun.find_one(
-                'TaskTemplate',
-                [['code', 'is', template], ['entity_type', 'is', entity_type]],
-                ['code', 'entity_type']
-            )
+            cache = self.app.task_template_cache
+            self._pending_template = None
+            if not cache.fresh:
+                # Apply it again once the templates have been fetched in the background
+                self._pending_template = (template, entity_type)
+                self._fetch_task_templates()
+                if not cache.fetched:
+                    return
+
+            template = cache.get(template, entity_type)
             if template:
-                self.template_selector.setText(template['code'])
                 self._template = template
+                if self.template_selector is not None:
+                    self.template_selector.setText(template['code'])
                 return
 
-        self.template_selector.clear()
         self._template = None
+        if self.template_selector is not None:
+            self.template_selector.clear()
+
+    def _fetch_task_templates(self):
+        """Fetches the TaskTemplates of all supported entity types in the background."""
+
+        if self._template_fetch_task is not None:
+            return
+
+        self._template_fetch_task = self._task_manager.add_task(
+            self._fetch_task_templates_task,
+            group=self._task_group,
+        )
+
+    def _fetch_task_templates_task(self):
+        # Runs in a background thread, where app.shotgun is a connection of its own.
+        return self.app.task_template_cache.fetch(
+            self.app.shotgun,
+            self.supported_entity_types,
+        )
+
+    def _resolve_pending_template(self):
+        """
+        Looks up the template still waiting for the background fetch, so that the
+        options never lose it when the dialog is accepted before the fetch is done.
+        """
+
+        if not self._pending_template:
+            return
+
+        code, entity_type = self._pending_template
+        self._pending_template = None
+        template = None
+        if self.app.task_template_cache.fetched:
+            template = self.app.task_template_cache.get(code, entity_type)
+        else:
+            try:
+                template = self.app.shotgun.find_one(
+                    'TaskTemplate',
+                    [['code', 'is', code], ['entity_type', 'is', entity_type]],
+                    ['code', 'entity_type'],
+                )
+            except Exception as e:
+                self.app.log_warning('Could not find TaskTemplate %s: %s' % (code, e))
+
+        self._template = template
+        if template and self.template_selector is not None:
+            self.template_selector.setText(template['code'])
+
+    def _on_task_templates_fetched(self):
+        self._template_fetch_task = None
+        if self._pending_template:
+            code, entity_type = self._pending_template
+            self.set_task_template(code, entity_type)
 
     def update_parent_field(self, entity_type):
         self._parent = None
         field_info = self.entity_parent_fields.get(entity_type)
-        if field_info:
-            self.parent_selector.set_searchable_entity_types({field_info['entity_type']: []})
+        self._parent_entity_type = field_info['entity_type'] if field_info else None
+        self._apply_parent_field()
+
+    def _apply_parent_field(self):
+        if self.parent_selector is None:
+            return
+
+        if self._parent_entity_type:
+            self.parent_selector.set_searchable_entity_types({self._parent_entity_type: []})
             self.parent_selector.show()
             self.new_tab_layout.labelForField(self.parent_selector).show()
         else:
@@ -287,12 +581,19 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         A default value to apply to the TaskTemplate dialog may be provided.
         """
 
-        self.template_selector.set_searchable_entity_types({
-            'TaskTemplate': [["entity_type", "is", entity_type]],
-        })
+        self._template_entity_type = entity_type
+        self._apply_task_template_filters()
         if default:
             self.set_task_template(default, entity_type)
 
+    def _apply_task_template_filters(self):
+        if self.template_selector is None:
+            return
+
+        self.template_selector.set_searchable_entity_types({
+            'TaskTemplate': [["entity_type", "is", self._template_entity_type]],
+        })
+
     def set_options(self, options):
         """Convenience method to set multiple options at once."""
 
@@ -305,6 +606,9 @@ class ExtendedSubmitDialog(QtGui.QDialog):
         if options.get('entity_name'):
             self.set_entity_name(options['entity_name'])
 
+        if options.get('auto_match'):
+            self.set_auto_match(options['auto_match'])
+
         if options.get('entity_type'):
             self.set_entity_type(options['entity_type'])
         else:
@@ -323,21 +627,28 @@ class ExtendedSubmitDialog(QtGui.QDialog):
             return self._entity
 
     def get_template(self):
+        if self.template_selector is None:
+            # The New tab was never shown, the template can't have been edited
+            return self._template
         if self._template and self._template['code'] == self.template_selector.text():
             return self._template
 
     def get_parent(self):
+        if self.parent_selector is None:
+            return self._parent
         if self._parent and self._parent['code'] == self.parent_selector.text():
             return self._parent
 
     def get_options(self):
         """Returns the values of this dialogs options as a dict."""
 
+        self._resolve_pending_template()
         return {
             'entity': self.get_entity(),
             'mode': self.tabs.currentIndex(),
             'mode_str': ('Select', 'New')[self.tabs.currentIndex()],
             'entity_name': self.entity_name.text(),
+            'auto_match': self.auto_match.isChecked(),
             'entity_type': self.entity_type.currentText(),
             'task_template': self.get_template(),
             'parent': self.get_parent(),
@@ -351,7 +662,7 @@ class ExtendedSubmitDialog(QtGui.QDialog):
             label.setValid(False)
             return False
 
-        if options['mode'] == self.New and not options['entity_name']:
+        if options['mode'] == self.New and not (options['entity_name'] or options['auto_match']):
             label = self.new_tab_layout.labelForField(self.entity_name)
             label.setValid(False)
             return False
@@ -0,0 +1,39 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+import os
+import sys
+import threading
+
+_lock = threading.Lock()
+_registered = False
+
+
+def register_resources():
+    """
+    Registers the images of the dialogs with Qt, the first time it is called.
+
+    The images are kept in a binary resource file built by build_resources.sh,
+    which Qt maps in memory instead of loading them into Python.
+
+    :returns: True if the images are available under ``:/tk-flame-review``.
+    """
+    global _registered
+
+    with _lock:
+        if not _registered:
+            from sgtk.platform.qt import QtCore
+
+            ui_folder = "ui_python2" if sys.version_info.major == 2 else "ui"
+            path = os.path.join(os.path.dirname(__file__), ui_folder, "resources.rcc")
+            _registered = QtCore.QResource.registerResource(path)
+        return _registered
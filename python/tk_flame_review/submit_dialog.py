@@ -20,6 +20,8 @@ if sys.version_info.major == 2:
 else:
     from .ui.submit_dialog import Ui_SubmitDialog
 
+from .resources import register_resources
+
 
 class SubmitDialog(QtGui.QWidget):
     """
@@ -34,6 +36,7 @@ class SubmitDialog(QtGui.QWidget):
         QtGui.QWidget.__init__(self)
 
         # now load in the UI that was created in the UI designer
+        register_resources()
         self.ui = Ui_SubmitDialog()
         self.ui.setupUi(self)
 
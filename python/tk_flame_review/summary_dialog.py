@@ -20,6 +20,8 @@ if sys.version_info.major == 2:
 else:
     from .ui.summary_dialog import Ui_SummaryDialog
 
+from .resources import register_resources
+
 
 class SummaryDialog(QtGui.QWidget):
     """
@@ -36,6 +38,7 @@ class SummaryDialog(QtGui.QWidget):
         QtGui.QWidget.__init__(self)
 
         # now load in the UI that was created in the UI designer
+        register_resources()
         self.ui = Ui_SummaryDialog()
         self.ui.setupUi(self)
 
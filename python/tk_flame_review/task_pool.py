@@ -0,0 +1,126 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+import time
+
+import sgtk
+
+task_manager = sgtk.platform.import_framework(
+    "tk-framework-shotgunutils", "task_manager"
+)
+
+
+class BackgroundTaskPool(task_manager.BackgroundTaskManager):
+    """
+    Long lived background task manager shared by every submit dialog.
+
+    Its threads, and the ShotGrid connection each of them holds, outlive the
+    dialogs. Users of the pool must stop their own tasks and disconnect from its
+    signals when they go away, rather than shutting it down.
+
+    Keeps track of how many tasks are queued and how long they take, see
+    :meth:`stats`.
+    """
+
+    def __init__(self, parent=None, max_threads=2):
+        """
+        :param parent: Parent QObject.
+        :param max_threads: Maximum number of threads running tasks.
+        """
+        super(BackgroundTaskPool, self).__init__(
+            parent, start_processing=True, max_threads=max_threads
+        )
+        self._max_threads = max_threads
+        # task id -> (group, time it was added)
+        self._pending = {}
+        self._completed = 0
+        self._failed = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+        self.task_completed.connect(self._on_task_completed)
+        self.task_failed.connect(self._on_task_failed)
+
+    def add_task(
+        self,
+        cbl,
+        priority=None,
+        group=None,
+        upstream_task_ids=None,
+        task_args=None,
+        task_kwargs=None,
+    ):
+        """
+        Adds a task, see ``BackgroundTaskManager.add_task``.
+        """
+        task_id = super(BackgroundTaskPool, self).add_task(
+            cbl,
+            priority=priority,
+            group=group,
+            upstream_task_ids=upstream_task_ids,
+            task_args=task_args,
+            task_kwargs=task_kwargs,
+        )
+        self._pending[task_id] = (group, time.time())
+        return task_id
+
+    def stop_task(self, task_id, stop_upstream=True, stop_downstream=True):
+        self._pending.pop(task_id, None)
+        super(BackgroundTaskPool, self).stop_task(
+            task_id, stop_upstream=stop_upstream, stop_downstream=stop_downstream
+        )
+
+    def stop_task_group(self, group, stop_upstream=True, stop_downstream=True):
+        for task_id, (task_group, _) in list(self._pending.items()):
+            if task_group == group:
+                del self._pending[task_id]
+        super(BackgroundTaskPool, self).stop_task_group(
+            group, stop_upstream=stop_upstream, stop_downstream=stop_downstream
+        )
+
+    def stop_all_tasks(self):
+        self._pending.clear()
+        super(BackgroundTaskPool, self).stop_all_tasks()
+
+    def stats(self):
+        """
+        Returns the pool statistics, for debugging.
+
+        :returns: Dictionary with the number of ``threads``, the number of ``queued``
+                  tasks, the number of ``completed`` and ``failed`` tasks and the
+                  ``average_latency`` and ``max_latency`` in seconds between adding
+                  a task and it finishing.
+        """
+        finished = self._completed + self._failed
+        return {
+            "threads": self._max_threads,
+            "queued": len(self._pending),
+            "completed": self._completed,
+            "failed": self._failed,
+            "average_latency": self._total_latency / finished if finished else 0.0,
+            "max_latency": self._max_latency,
+        }
+
+    def _record(self, task_id):
+        pending = self._pending.pop(task_id, None)
+        if pending:
+            latency = time.time() - pending[1]
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+    def _on_task_completed(self, task_id, group, result):
+        self._completed += 1
+        self._record(task_id)
+
+    def _on_task_failed(self, task_id, group, message, traceback_str):
+        self._failed += 1
+        self._record(task_id)
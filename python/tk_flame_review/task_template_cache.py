@@ -0,0 +1,80 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+
+class TaskTemplateCache(object):
+    """
+    Time limited cache of the TaskTemplates available for a set of entity types.
+
+    All the templates are fetched with a single query and shared by every submit
+    dialog, so looking a template up by code never needs a ShotGrid round trip
+    while the cache is fresh.
+    """
+
+    def __init__(self, ttl=300):
+        """
+        :param ttl: Number of seconds fetched templates are considered up to date.
+        """
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._templates = {}
+        self._fetched_at = None
+
+    @property
+    def fresh(self):
+        """
+        True if the templates were fetched less than ``ttl`` seconds ago.
+        """
+        return (
+            self._fetched_at is not None and time.time() - self._fetched_at < self._ttl
+        )
+
+    @property
+    def fetched(self):
+        """
+        True if the templates were fetched at least once, even if they are stale.
+        """
+        return self._fetched_at is not None
+
+    def fetch(self, shotgun, entity_types):
+        """
+        Fetches the TaskTemplates of all the given entity types in one query.
+
+        Safe to call from a background thread.
+
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        :param entity_types: List of entity types to fetch the templates of.
+        :returns: Number of templates fetched.
+        """
+        templates = shotgun.find(
+            "TaskTemplate",
+            [["entity_type", "in", list(entity_types)]],
+            ["code", "entity_type"],
+        )
+        by_type = {}
+        for template in templates:
+            by_type.setdefault(template["entity_type"], {})[template["code"]] = template
+
+        with self._lock:
+            self._templates = by_type
+            self._fetched_at = time.time()
+        return len(templates)
+
+    def get(self, code, entity_type):
+        """
+        Returns the TaskTemplate with the given code for the entity type, or None.
+        """
+        with self._lock:
+            return self._templates.get(entity_type, {}).get(code)
@@ -1,5170 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 5.15.2
-# WARNING! All changes made in this file will be lost!
-
-try:
-    from tank.platform.qt import QtCore
-except ImportError:
-    from PySide2 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x19\xfb\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x81\x00\x00\x00T\x08\x06\x00\x00\x00d\xdd\x8b\x0c\
-\x00\x00\x19\xc2IDATx\x9c\xed\x9d\x7fpcW\
-u\xc7\xbf\xb2$\xef\x8f,Y\xcb\xbbYBih\xa2\
-e\xde\x9b\xd0\x04X\xbc\x94\xd2\xf0c:#wJ\x9b\
-\x94\xa1T\xce\x84\xa4\xe4\x07\xa9\x96\x92\xa4\x03)S\xb9\
-\xd3\x1f\x13\x18~\xd8P\x98\x81\xf0#6\x81\xe9\x84\x09\
-\xa1rH\x86\x90IJWt \x9b\xb6\x14\xacn\x12\
-\x0a\xdb\xf7:V\x93\xa53\x85$k\xedf\xd7\xde\xf5\
-\xaem\xf5\x8f{\xce{W\xcf\xef\xe9=IO\xb6\xe4\
-=\x9f\x19\x8dl\xbdw\x7f\xbe\xfb\xee\xb9\xf7\xdc{\xcf\
-\x01\x04A\x10\x04A\x10\x04A\x10\x04A\x10\x04A\x10\
-\x04A\x10\x04A\x10\x04A\x10\x04A\x10\x04A\x10\x04\
-A\x10\x04A\x10\x04A\x10\x04A\x10\x04A\x10\x04A\
-\x10\x04A\x10\x04A\x10\x04A\x10\x84\xbe \x11\xe5\xa6\
-z\xbd\xde\xed|\xc4J\x22\x91hZ\xaez\xbf\x15H\
-\x10\x04!f\xb8\x9b\x1c\xd8\xe0|\xc4J\x82\xe0\x7f\xe9\
-3\x90/]\x98\x01\x90\x84*oBg\xa3\xf2*\x08\
-\x82\xd0\x0bl\x9a\x99\x80\xd6\xa1\x0fh\xdf\x89[\x9e\x1e\
-\xfe\xe3\xe4\x8e\xe4\xdf\xad\x9cZ\xf9\xf0\xd7^7\xffu\
-\x00u\xed\xb3\x0a\xac\xef\xcc\xc0\xb6\xed\x0c\x80\x09\x00\x05\
-\xed\xe7\x19\x00\x93\x86aT\xfc\xc2\x04\xc9*\xcb\xb2\x8a\
-\x14\xd7\x8ci\x9ac1g\x15\x96eMQ>\x0f\x98\
-\xa69\x1dS\x9c\x05\x00S\x00\xa6M\xd3<\x10G\x9c\
--\xa4[\x000B?U\x00L\x9a\xa69\xb3^y\
-h\x86eY\x19\x00\xf3\xf4\xef\xb0i\x9a\xb5\xb8\xe2n\
-\xd6\xbcm\xdb\x9e\x85\xaa\x93\x03\x86a\xc4\xf2\x8c\x85\xfe\
-`S\xcd\x04H\x00$\xa0\xca\x93\x04\x90\x02\x90|\xf7\
-ww\xed\xdb\xb2#}o\x0a\x03C[v\xa4\xef\xbd\
-\xb12|\x13]K\xd1}I\x00\x03\xeb5# \x01\
-0\x8bF\x01\x00\x00y\x00\xb3\xb6m{\x7f\xdfh2\
-\x9e\xef^\x8d\xb3)$,\xa7\xe0\x0a\x00\xd0\xdf%\x12\
-\x0e}\x8deY\x13\x96e\xd5-\xcb\xcaw\x10Ml\
-BG\xe8/R\x1b\x9d\x81N\xd1\x04@\x02\xae\xca'\
-\x99\xff\xce\xf0k\x87^=\xf0\x98~\xef\xf6\xa1\xf4\xd4\
-\xad?\xd9\xf5\xb6{\xaf<\xf6~\xa8Y\xc0*\x80e\
-(A\xb0\xba\x0e3\x82<\x80,\xd4\x0b7\xca#\x7f\
-\xdb\xb6\x8bP\x82\xa1\xdc\xe5\xf4[\xa2\x1b\xb3\x0b\xd34\
-'\x01L\xc6\x1do\x10\x96ee\xa1fK\x80\x1a\xf9\
-\x8f\xd3\xefy\x00\xb9\xb8f8\x1bLv\xa33 \xf4\
-/}-\x04<\xfa\x7f\x1e\xd9\xa7\xf6\xdd\x86\xe1\xa1\xcb\
-S\xdfL!1\xe4\x0d\x93\xde\x9e\xba\xfe\xe6gv\x0f\
-\xfc\xe7=/\x16\x7f\xfc%g\xf4\xb3\x9e\x82\x00\x00*\
-\xba\xea\xc70\x8c\x86\x8e\xd1\xb6\xed<\x80\x12\xdd\xb7\x1f\
-p:\xad\x12\x80\x8ai\x9a\xfb\xbd\x11Z\x96u\x10@\
-\x8e\xfeu:;\xba\xc6j\x86\x03P#\xe2\x0cH\x1d\
-\xa3\xa9\x94\x1a\xc2Q\x98\x8c\xcf\xef#t?\xa7U\xa6\
-\xb8f\xc2\xae[\x96U\x82\x12\x84\xf0\x96\x83\xf2Q\xd4\
-\xd2,C\xa9\xa1\xaaZ\xbc\xb3P\xaa\xb3\x8a\x96\xe7\x86\
-\xfb|\xe0|T\xf4:\xa1\xfc:\xaa \x12\x16S\xda\
-\xfd5*\xf7\xa4v\x0f\xe7\x7f\x8c\xf2:B\xe9\x8fQ\
-8\xae\xdb2\x801V\xe9h\xe1\x0e\xc0UI\xd5\x00\
-\x8c\x87\x09!\x9f|9j,\x8f\x0a\x09P3\x1b\x00\
-\xd8o\x9af\x85\xc2Oi3\xcc\x1a\x94\xdaQ\x17\xc2\
-2\x038\xcf\xe9[u\x90g\x0d\x80\xd5@\xe9}\xb7\
-a\xf8\x8d\xb7\xefy4\x95H\xbc*(\xec\xd6\x0b\x92\
-\xd7\xed\xbbc\xcfc\xfbn\xc3.\x00i(a8\x00\
- \xd9\xe5\x05\xe3\x19\xa8\x97.G\xa3\xff\xb8\xc8\xc3\xed\
-$\x00\xa0H\x9d\xaa\x97\x12\xdcN\xb6`Y\xd6,\xdc\
-\xce\x94\xc3\x05\xaaG\xa8\xd3\xd1\x85\x0d\xe8\xef\x92eY\
-\xb9\xb0\xebM\xe2\x9d\xa2|\xe8*\xa2\x1c\x80Y\xea\x04\
-u\xf2\x9e<\xe7\xa8\x5cAp\x9cAB\x82;\xdaY\
-O\xbe3\x00&(o^t\xd5R\x0e\xaa\xccz\xdd\
-\xe6<yd&\xb4p\x19\x00S$\xdc\x82\xf2\xe5W\
-\x9f\xac\xc6\x0a\x0c\xa7\x85?\x88F\xd5c\x06\xc0\x84\xa7\
-\xed\xb1\x10\x08\xac\x1fas\xd3\xb7B\x80`\x01\x90\x82\
-\xea\xcc\xd3o(\x5ctOr0qEX\xc0\xe4`\
-\xe2\x8a7\xde\xbe\xe7\xd1?\xb8\x7fh\x1f\x80A4\xae\
-\x13\x84n3m\x07\xc30j\x00F\xa1F\x8a\x13\xb6\
-m\xd7m\xdb.\xc5 \x10*\x00\xf6\x9a\xa6\x99\x00\xc0\
-\xa3]og\x9e\x81Z@\xd6\xef\x19\x81\x1a\x8d&\xe0\
-\x8e\x8aG\x00\xc04\xcda\xacU\xdbd)\x9e\x1a\xd4\
-\xe2e\x02\xc0~\x8a\xa3\x1cv\x9d\xd4K\x0d*&\xea\
-\xe8xv\xc0y\x19\xa62e\xa0F\xdc^\xf8>\x8e\
-k\x84\xe2\xf1#\xca\xdaC\x81\xee\xabh\xf9v\xea\xd1\
-G\x10U)\x8f<\x93\x19\xc1\xda\xba\xf5\x13z\x15\xd3\
-4\x13t\x1f\xab\xfe\x9a\xadI\x14\xa1\xeatR\x0b\xc7\
-e.\x98\xa6Y\xa3\xdfxV9F\xf7UX\xdd\x05\
-\xa0l\x18F\xc20\x8c\x04\x80\xbd\x94\xf7\xbe_\x07\x11\
-\xe2\xa3/\x85\x00u\xd0\x0d3\x00\x00\xa9\x9b\x9e\xda\xfd\
-\xc5\xc1\x1d\x03\xbf\x1b5\x9e\xe4`\xe2\x8a\x8b\xdf\x94~\
-\xe4\x9a\xfb\x86\xf6Q\x1cIt_\x10T\x0c\xc3\x18\x85\
-\xeaD&\xa1^\xf2\x09\xdb\xb6gi\xe1\xb8\x1d\xaa\x9a\
-:\x84\xd5\x0bY\x9f\x8e\x91;u\xee\x80j\x9a\xba\x83\
-;\x92\xc0<\x90\x8a\x81;\xe7\x02\xff\xc6q\x84]\x0f\
- G\xf7W\xb5xjZ9\xbc#^=\xcfq\xad\
-\xa1p\x87=\xcd*\x1cJ\x83\xeb\xd4\x9b\x87\x19\xea\x80\
-+pG\xd2\xde<\xf9\xd5\xa3\x9e\xdf\xa0\xf2\xe9\xf0\xb5\
-\x22-\xfc\xd6\xe1\xcez\xc2f\x02,\xb8r4\xd8\xa8\
-\x03\x98\xa3\xdf\xb3\x1d\xb45a\x93\xd1wB@\x13\x00\
-\xfc\x9d\x02\x90z\xcf\x93\xbbo\xdb\xf6\xb2\xe4\xb5\xad\xc6\
-\x97L\x0c\xec|\xc5o\xa5\xbf}\xed\x13\x99\xf7\xa2q\
-6\xd05A\x00\xa8Y\x81a\x18\xe3\xa4\xf3\x9f\x86z\
-\xa9\xe3T\x11u\x05\xd2\xe3\x8f\x03\xc8Q\xc7\xd4\xa0\x9a\
-\x08\xbb\xde\x04\xafn:.]u+\xf1t+\x0f\xed\
-\xd2IG\x1d5\xac\xa8\x81\xces\xfajaX\xdb\x09\
-\x04\xb83\x80\xc1\xb1\xf2\xd0\x0d;_\x91\xfch\xbb\xf1\
-&\x13\x03;\x87_9x\xf7\xb5Od\xf0\x0fo\xab\
-\xdd\xe7\xb9\xbc\xd2n\xbc-\xc0/b_\xec\xf2\xe0\x1d\
->\x9a\xcez\xd6\xb2,g12\xecz\x00\xdeN+\
-\xee\x91j\x94\xf8\xba\x9d\x87v\x19\xeb\xe0<\xc3\xa4a\
-\x18\xe3A\x17\xe9Z\xe0ua\xf3\xd373\x01\xcfV\
-P\xde\xeb\x9f~\xc7\x97w\xbe~\xd7e[>\x17G\
-\x1a\xc3\xaf\x1c\xbc\xfb\xe6gv\xdf\x03w\xa1\xd8Y,\
-\x8e#~\xdb\xb6s\xa4\xf6)h\xbfe\xe1\xea\xc4\xbd\
-#\xcf\x8cm\xdb\x19\xeaL\x9b\xe9qu\xd5\x0f\xcf&\
-\xaaq\x1e8bhOz\x16p\xd46L.\xcau\
-\x1f\xcaP\xe5\xce\xf2b\xb6\xa7\xbc\xcd\x04G\x14X\x05\
-\x93\xd3\x17\xcb-\xcb\xcak\x8b\xbe\x8e~\x9e\xeb\x91\xee\
-e\xa1\xdci\x1e\x18]\xc8G)\x9f_\xbe2\x01\x8b\
-\xfe\xde\xf89\xde\xbcm\xdb\xceL\xcc\xb6\xed\xa2\xa8\x82\
-\x04\x9d\xbe\x10\x02A\x02\xe0\xea\xaf\x0c\xbd\xee\x92\xd1\xc1\
-\x87\xe2Lk\xeb\x05\xc9\xeb\xae;\x94\xb9\x01\xae \x88\
-\x93\x1c\x94\xdag\xca\xa3\xa7\xe5-\x83\xba^\xb9\x06\xf5\
-R\xcf\xd3'Lw<O:c\xee b\xdf\x8b\xaf\
-m\xe3\x9c\xd3t\xd4\x9c\xafj\xd8u\xbf8IP\xf0\
-(w\x82\xc2py\xf5:i\x0b\x9a}\xb0\xfe}\xc2\
-j\xd4\xad\x17h\x01u\x9a\xd2\xd2\xeb\x91w\xf7L7\
-\xd9~\xda*\x05-\xfd\x1c\x82\xcb7G\xdf\xbc.\x91\
-\xd3\xf25O\xe5\xd0\x0f\x86q\x87\xef\x1c\x1a\xa3\x99\x03\
-/\xd6\xcfj\xedm\x02\x9a\xda\x91\x06%\xf5\x1e<\xa8\
-(\xac\x13=/\x04\x82\xce\x02\x5cq#v]\xfc\xf6\
-\xf4}\xc9\xc4\xc0\xce8\xd3[Z\xac\xff\xdb\x03o\xad\
-}\x0b\xee\xc13\xfet\x0cM\xbd\xc7\xb0vAs\x06\
-\xc0~\xc30\xaat_\x0djO9w>\x15\x0a\x17\
-4\xb2\x1f\xd7\xe2\xac!F3\x0f:\xa4\xe69\x80\xc6\
-\xd1k\x85\xd2\x9b\x09\xbb\xde$\xde\x03Pe\xd0\xcbW\
-\x86\xda\xef\xdeq\x07\xac\xc5\xaf\xc7\xc5{\xf9g(\x0d\
-\xde\xb5\xc5\xf0>\xfe8M[\xcc\xa0\xf1\x99\x8er\xf9\
-H\x18\xb2Z&cYV\x96~\x1b\x85v\x9e\x81\xc2\
-\x8f{\xeas\xd2\x93w\x9e\x89\x8db\xad\x90i\xaa\x1e\
-\x12\xce?z\xdav\x90\xcfY\x80\x14\x80\xf4ko\xc5\
-\xae7\xdd\xb9\xe7;\xa9-\x89_\x8f3\xbd\xa5\x85e\
-\xeb{\xb7\x1f\xbb\xee\xb9'\xf0K\x00g\x00\x9c\x03\xb0\
-\x04u\xb2xe\xa3\xac\x8f\x8a\x9d\xbb\xfeF;,6\
-\x1e\xb2S\xaa+\xf4\x83\xed/a\xfd\xe1~\xa5\x1f\x16\
-\x86\xbdg\x01\x06\xdfx\xc7E_\x8a[\x00\x9c[\xae\
-\x9f|\xe4\xc6\x13\x07^<\x8c3pw\x09\x9d\xa3\xb4\
-W\xe3LK\x10\x04\xa1W\xe8Y!\x10p\x16 }\
-\xd3S\xbb\xbf\xd0\xcaY\x80(\xac\x9c[=\xf5\xa3O\
-\x9f\xbc\xf3\xc5\xc3\xcb\xa7\xe1\xae=\xe8j(A\x10\x84\
-MIO\x0a\x81&g\x01>\xd0\xceY\x800*_\
-9\xf5\xf1g\xbezf\x0e\xca\xbc4\xb4\xef\x9e\x10\x00\
-2\x9d\xef{\x9cS\xd2\xf2,\x85^\xa3\xe7\x16\x86\xbb\
-u\x16 \x88#\x0f/|\xb1\xf2\x99\xd3\xcf\xc0\xe3c\
-\x80\xbe\xf9\xff\xbax#\x13\x04a3\x12\xfbL \xca\
-\x9e\xfa\xa0\x0eu=\xce\x02\xe8<\xf7/g\xbe\xf5\xfd\
-\x0f\x9f\xfa\x1e\x94\x15\xd1\xb3Pk\x00\xcb\xf4Y\x81;\
-#\x10\x04A\xd8\x94\xc46\x13\xd0\xaco68xy\
-\xf7\xa1\x9d\x97As\xe0\xa2\xdd\x9a\xf0\x86\xc7:\x9d\x05\
-\x00\x80\x17~\xb6t\xe8\xb1\xf7\x9e(Au\xfe\xde\xcf\
-2hG\x10dQX\x10\x84ML,B\xc0\xb3\x95\
-\xd3\xe9\xc4o=r\xd1g\xf7\xfc\xca\xd6\xb9[\x8e\x0c\
-\xff\x19\x1a\x05\x81\xe3\xd1\xcbGxt\xfd,\xc0K\xbf\
-8w\xe4\xc1k\x8e\x7f\x11j\x1b\xe8i\xfa\xd6\x05\x00\
-\x0b\x01]%$\x08\x82\xb0\xe9\xe8X\x08\x04\xb9v\xbc\
-\xe1G\xc3\xefL\x0f\x0e\xdc\x01\x00[\x06\xd3\x9f)\x1c\
-y\xf9\xccU\x7f\x81\xddp\xed\xf7\xeb\x9e\xc0\xd6\x08\x80\
-+o\xc1\xae7\x17\xf7|;\x9d\x1c\xb8\xa4\xd3<\xea\
-,\xcc\xe3\xe8#\xd7\xcf\x7f\x1a\xaa\xf3g\x01\xc0\x1f\x16\
-\x04\xac\x16Z\x81\xac\x07\x08\x82\xb0\x89\xe9\xe8\xb0\x98g\
-\x06\xc0\x1dz\xeaw\xbe<x\xe9\xa5\xa3;\x9f\xf4\x8e\
-\xe0\x97\xeb\xf5\xa3\xc7*\xe7\xde\xf3\xd0\xb5\xb5\xa7\xe1\xea\
-\xdcy\x94\xcdB \x05`\xf0}O_\xf4\xf5\xb8\xb7\
-\x82./\xd5\x17\xbfy\xf5\xf3w\x9c\xacb\x1e\xc0\x22\
-}\x16\xe8\x9b\x85\xc29\xb83\x82\x95z\xbd\xbe\x1e\x06\
-\xe4\x04A\x10\xd6\x958\x1d\xcd\xeb{\xf9S\x00\xd2\x97\
-\xfe\xf6\xd07\xfcT8\xa9D\xe2U/\xdf?\xf8\xe4\
-\x8d?\xbc\xe8\x0e\xb8\x8e\x5c\xd2\x9e\xcf\x96\x9b\x0f\xb7\xe6\
-\x17 \x0a\xcbK\xf5\xc5\x1f\xfc\xf5\xfc\xc7NVq\x1c\
-n\x87\xbf\x08w\x16\xb0\x84F\x01\xc0\xea A\x10\x84\
-MK\xdb3\x01\xcfa.g!\xf7\xe6\xca\xeeOn\
-\x1dJ\x86\x1a\xa3:sz\xe5\xf1\xc3_x\xf1\x03O\
-\xdd\x83\xe3\xf4\xd3\x00\x80\xd4u\xdf\xdf\xfd\xfe\xa1K\x92\
-\x1f\x89Z\x80\xa8\xfc\xf0S\xb5\x8f\x1d\x9e:{\x18\xaa\
-\xf3_\xd0\xbeY\x10,A\x09\x80\x15\x90\x10\xa8\xd7\xeb\
-=!\x04\xceG\xb3\x11\xe4\x8er\xca4\xcd\xbd]N\
-\xa7\x0e\xe5\x95m\xd3\xd9\xd5\x8f\xb3\x0e\xc92\xec\x1c\xd6\
-\xb1\xae\xc8=\xe6L7\xec`\xc5\x01[\x9a\xf5\xb3/\
-\xd5\xec\xdaz\xd3D\x93\x03\xa0\xcd-\xa2~\xbb\x80\x00\
-\xa4\xc7\x1e\x1d\xba&\x8a\x00\x00\x80\xad\xdb\x92\xef\xd8\x7f\
-\xe7EO\x5c|\xc5\xd9\x9b\xff\xf1\xf6\x13?\x030\xf0\
-\xee\xef^8\xd6\x0d\x01\xf0\xd3\x07\x17\xa6\x0fO\x9d}\
-\x1a\xee\xa8\x9f\x05\x00w\xfeKp\xd7\x00\xba&\x00\xc8\
-\x8dd\xc10\x8c\xbd\xdao\x19\xa8\x97\xeb\x80a\x18\xed\
-\xda\x8c\xef;\xc8\xd1Ln#l\xe9\x08\xf1C\xbe\xa9\
-\xab\xe4ft\xdd\xc3G\x88\xdf\xdb\x13\xb2\x01\xc1\x8dv\
-\x1c\xb4\xe1\xb4\xac\x0e\xf2\xb1\xea\x99\x020x\xd5]\xe9\
-\xecNs\xf0\xf3\xad\xc4\x95N\x0e\x5cr\xd9;\xb6\x96\
-\xc7\xfei\xf8O\xdf\xfa\xf1\xed\xaf\xdf\xf3\xeam\x9fm\
-5?a<{\xe8\xcc\xc3O\x14O\x95\xb1\xb6\xf3\xd7\
-\xd5@\xcbp\x17\x83\xeb\xdd\x9a\x01\x18\x861\x09\xa0\xe6\
-\xf1)\x5c\x040s>\x09\x00b\x04\xc1>\x06\x84\xfe\
-c\x04\xe1./\xbb\x19>\x0a\xa3\x9a\x0f\xeb\x0c\x5cs\
-\xe1\xe75\xed\x1e\x16\xf3\xae\x03\xa4^3\x96\xf9\xfb\xd4\
-@\xe2\xc2v\x22\xdb\xb57\xfd7\xbb\xf6\xa6\xdb\xccJ\
-0/\xfcl\xe9\xd0\xe37\x9d\xf8&Tg\xaf\xeb\xff\
-\x17\xe1\xaa\x7f\xf4\x03b\xf5uX\x08\x1e\x07P\xb2m\
-{\x1a\xae#\xf5\xbd\x803+(\xc1\xed\x1c+ \xd3\
-\xcc<\x1d\xa7F\x0c\x00\xb0,k\x0e\xca\x09\xf94\xfd\
-_\xa7\xf8'\xa0\xa6\xd1~N\xdd\xf5\xf8\x9d{,\xcb\
-\x9a\x05P6Ms\x9c\xfe/\x01\x80i\x9ac4\xb5\
-\x1d\x812Q\xccv\xfe\xc7x\xd4F\xa3\xfa)\xb8/\
-q\xc3(\xcb\x9b/*\xd7\x84v-\xd0\xf459~\
-\xe1\xd9\xe54O\xaf)Oy-M\xfd\x9a7?\xd3\
-!\xd3\xf2\x22\x8dDAu0\xaa\xa5\xaf\xdb\xdf\xafP\
-\xb9\xaat\xad@\xe5\xc8@\x99x>\xa0\xd5\x89^f\
-\x0e;\xea7\xf2\x8cP\xbfs\x9e\xb8\xa7\x00e\x22\xdb\
-\xe7\x99\x96\xe9\xde\xaa\x16\x7fP\x1d\x06\xb6\x07\x9fp\x81\
-#tR\xdb8N\x85@*#O\xfd\x00\xaa\xad\xae\
-1c\x1d\x14\x9e.g\xa9\xfcY\xa8:\x1ec\x0fu\
-\xcd\xea\xbf\x19\xa6i\xd6,\xcb\x9a\xd1\xd2\xccB=c\
-.\xab7\x9d\x1cT{b\xa7=k\xda+\xb5\xb9\x83\
-TF\x9e\xddf\xe9\xbdj\xe9\x99juR\xa6\xf2\xd5\
-L\xd3\x1c\xd6~+\x04\xd4\x87\xb7\xdd;Vki\xe0\
-\x99\xa52g\x01\xec\x07\x99|oi&\x10\xb0\x0e0\
-x\xc3\xbf\xef\xfex\xdcV=;\xe5\xf8\xff-\xff\x97\
-v\x16@\x9f\x05\xf0\xb6P\xaf\x1ah=\x04\x00\x0c\xc3\
-(\xc3}\x90E\x00\xe3\xecG\x00\xea\x85\xcc\x00\x186\
-\x0c#\x01\xf5\x90J\xbe\x11\x05\x93\x070\xec\x15\x00\xc4\
-\x04\x00h\xa3!\xc7\x9b\x17\x94}\x9b\x82eY#\xe4\
-\xb0d\x04J\x0019\xa8F\x95\x80\xb2Q_\x22/\
-W\xecB\xb2\x122\xcar\xf2E\x0ds\x1c\xaa\xc3M\
-4\xd1\xf9\xb2]\xfc\x04\x94]\xfd\x82\xe6\xaf\xb8\xa2\xe5\
-g?\x80\xbc\xe6h\xa5\x08\xa5ZH\xd0\xf5Z\x88\x9f\
-\xe3,\xdd\xb7\x17\x8d\x1e\xce\x0a\x94\xef\xbdt\xbd\x02\xf5\
-\x92q\xc71\x05\xf5\x126\xd4\x89\xb7\xcc\x14o\x98w\
-8\xdf\xfamr?\xc3\x1d\xc20\x85-\xa3q\x86\xd5\
-\xac\x0e\x03\xdb\x83V\xf6\xfdZ\xbc\xbe\x90\xd0,s\xfe\
-I\x00p\xc7\xa9?\xa3\x82&l\x9b\x86\xd7.\xe7\xe1\
-\xd6q\x15$\x90#\xd6\x7f3\xf2\x5c&J\xaf\xa6\xb5\
-\x972\xdc\xe7\xcc\x82\xb2\xac\xb7\x11=\x22\xcaK\x09k\
-M\x85\x8f\xa0\xbdg\xca\x14\xa1\xea\x7fX\xfb\xad\x00\x9f\
-\xfa JP\x82\x5c\xaf\xef\x9c'\xec\xa4a\x18\x09\xc3\
-0\x1c\x9f\x1f\x91\x85\x80\xc7\xa6\x8f\xb3\x0e\x90\x7fd\xe8\
-\xf7_\xb6;yk\x0b\x05\xeb:\x0b\xf38\xfa\xe8\x0d\
-\xc7>\x05w\x17\x90\xae\x02\xe2\x19\xc0\x12T\xe7\xbf\x82\
-\xf5\xdf\x0a\xca#\xc4\x1c\x5c\xafW\xa0\xff\x0f\x90S\x19\
-\xbe/\x1b\xd1Q\xbb\x13w\x13=g\x81\xe2d'&\
-\x93 \xd7\x96\xf4\x22LB5\xfe\x09\x9fxfx\xd4\
-\xa25tg\x0a\xcf#\x18o\xbc\x11\xf3\x15DU\x8b\
-\xb7\x0c\xd5\xe83\xfc\xbf\x96\x9f\x0a\xd4H\x8b_\xb0\x0a\
-4\x97\x9b\xa6i\x8e\x9b\xcd\xfd\x1bs\x1aU\xa8\xe7\xc1\
-/N\x1e\x8d\x9e\xc5\xc6\xa1\xdcTf\xe8\x9a^'\xd3\
-p\xbd\x801c\xa6i\xd6(|\xd8\x085\xa8~\xc3\
-\xe0rqg\xef\xcc\x0c\x89\xc0:D\x93\xf6\xa0\x95\x9d\
-\xe3oU]9\x02mQ\xd7t=\xbc\xb5\xaa\x02\x9c\
-\xf4\xe4\x81\xf3\x1e\xa5\xfe\xbd\x1c\xd4<\xbbe\xa0\x95\xc9\
-3C\xa9h\xe9x\xdbw\xd5s/\x0f\x82\xa6}\x06\
-3\xed>Sf\xd2\xa7\xdd\xfa\xd6\x07u\xf6\x19N\x87\
-\xeeqf;D\xd90\x8c5\x03\xaeV\xd5A\xfa\x81\
-\xae\xf4Uw\xa5/\x1b\xba|0v\x9b>\x9d\xb0\xbc\
-T_|\xf8\xda\xe7?r\xf2Y\xd4\xe0\xce\x00\xf4\xed\
-\xa0|\x16\x80\x17\x81\xd7\xfd,\x80a\x18U\xdb\xb6\xcb\
-P\x0f\xa5\x068\xbe\x86\x01\xcd\xbb\x96a\x185\xdb\xb6\
-\x01\xf5\xa0\xa3v\xa0\xbe;7\xd8\xef/\x94\xd3w\xdf\
-\xfbM\xd3\x9c\xa4\xe9x\xd5\x0cwl\xce\xf9\xc9\xfa\xe4\
-M\xef\x90\x9b\xe6\xab]h\xc4\xea\xab\xd3\xa5rT\xa0\
-\xdc-f\xd1\xda\x0e\x13\xbd,Y\x8a\xc3\x9bN\x86\xae\
-\xe5}\x16\x1c\xe3\xf2\xdf\x1b\xe9y\x9b\xa6Y\xb6,k\
-\x14J\xa5\x95\x85\x1a\xb1\x86.\xb6Gi\x0f\xe8\xec\x99\
-Em\x17\x9d\xc4\xdfj\xfd\x8fz\xd4/\x07\x01\xec\xd5\
-F\xf2z\x07\xed\xa8\xa3\xd0\xfcY\xe4\xe9\xde(\x9d{\
-\xab\x83\xa0V\xee\xcfBy\xa4\xf3\xd6G\xc3\x80\xc0/\
-`$!\x10d\xda\xb9\x93u\x80n\xd0\xcfg\x01H\
-0\x00Z#\xd6\x1c\x82w\xbc\x83\x81\xa6\xe8\x80\x9a^\
-\xfa\x8e\x8a\xa9c\xad@5\xa6|\x88 \xe0\xbc\xe9#\
-K\xfdZ\xd7v]\xd0K;\x81\xc6\x97zN\xbf\x87\
-~\xe7k\xf3\x96eE\xddy\xa2\xe7\xbd\x0a5\xc2[\
-\xd3\xa9Z\x96U\x85\xcf\xbaK\x8cD\xee,i\xa6\xc1\
-\xba\xe4\x92eY\xc50A\x10\xa5=\xb4\x92\x07\x1f\xfc\
-:\xc68\xdbE\xa7\xf5?\x03W=W\x04\xa9\x83\x00\
-G\x15\xc6j\x16\xbf\xf6\xadS\x86R\xa5\xceF\xa8\xf7\
-n\xbe\x17\xac\xd2\x1a\xf6^\x083x\xd0\xea\xee \xc7\
-\xe7\xeeXy\xe8\xba^[\x07\x98\xfd\xdc\xf1\xcf\xda\x0f\
--[Xk\x12\xe24\x1a\x17\x82\xb9\xf3_\xed1\x93\
-\x10e('\xf4\xdc\xe8xT\xce\xea\x0e\xb0\xde\x9b\xf7\
-!\xb7\x18\xff4\x80)V\x93X\x96\xe5\xe8h\xb5\x8e\
-u\x0cJE\xe0\xdcG\x8c\xf0\xe8\x91FQ5\xeaT\
-+\xdao\xacC-\x22\x9a\xfa\xa0\xd5\xfc{\xe1:\xc9\
-A{Q-\xcb\x9a`\x15\x9a6\xe2m\x96\x16\xd7\xe9\
-\x08T\xdeYX\xcc@\xd3\xa1\xd3zIQ\xbb\x96\xd7\
-\xea/cY\x96\xb7\xceZ!\xa8~\xb9\x9c\xbc\x88\x99\
-\x83\xa6j\xb3,K_\xd4\xe6rF\xad\xd7\xc0\xf6\x00\
-Z\xb7\xd2\xea\xaf\xe8\x17\x81F\xcd\x93n\x05\x8d\xf53\
-\x02\xd5\xe9\x06\x09bo\xf80:\xad\xff\x22\x1aG\xc6\
-z\xe7\xac\xab2\xb9};k\x11Z\x1b\x00\xd4\xfbY\
-\x83zo\x9cvG\xf8=S\x16\xb8\x81\xcf\xb4\x1d\xa8\
-\xad\xd4\xf8=\xe4<GQ%\xb7sbx\x00@\xb2\
-\x94;\xfe\xd0\xfcsg\xefn#|W\xe8\x95\xb3\x00\
-\x1d\xc2\xce\xe4\xe7m\xdb\xaeC\x8d\xa4\xc6\x80\x06G\xe4\
-%\x9a\xf2\xe5\xd0\xba\x9e\x96\x9d\xad\xcfS\x1c\x05\x00e\
-m\xf1k\x9ct\x9e3\x14\xb7wQ\xfa \x85\xf3\xe6\
-k\x14\xaa\xc1\xd7\x01\xccS\x19\xc2\x9c\x99\xcf\x00j\x17\
-\x8d\xdep\xa3@#\xdfq\xa8\xd1W\x1dJx\xe9\xa3\
-\xd9*\xdcz\x9a\x83R\x914S\x07e\xe9\xdeYh\
-\xba]\xfa\x9e\xd6\xd2)q:\xda\xe8\xbb\xa8\x95\x9b;\
-\x84vYS\xbf\xc48T\x87\xcce\xd5\xcb\xc2\x9d5\
-\xeb\xba\x81\xb5\xce\xe5\x83\xf0m\x0f\x80\xa3\xc3\xae\x00\x98\
-\xa3ka\xe5\x9a\xd6\xf2Q\xa0N\xe9\x00T\xc7\xb8\xa6\
-n\xc3\xc2\x87e\xbc\xcd\xfa?\xe8\xa9'\xae\xe3IP\
-\x1b\xa0kN[\xd2\xdawA+\x87_~*p\x07\
-O,\xcc\xaah\xef\x99\xb6\xcb\x18\xe8=\xe44C\xd6\
-\xc2\x00D\xf7\x9c\xd5p&\x00\xc0\x16\x00\xdb\x00\x5c\xf0\
-\x96On\x7f\xebk\xdeu\xc1g\x92\xe9\x81\x1dmf\
-\xbcc\x9e=t\xe6\xe1\xc7o:\xf1\x00\xdc\x8e_?\
-\x11\xccB\xe1\x1c\x1a\xcf\x02\xf4\x8dM\xa0\x8d>1l\
-\xf5\xd0\xe9\xc7\xcd\x88\xd4\xaf\xd0M\xc2N\x0cG\x9d\x09\
-x\xfd\xed:k\x04O\xfe\xe5\xe2S\xa5w\xbep\xfd\
-\xc2\xf3\xab?\xe9 \x9fm\xd3\xa3g\x01\x04A\x10\xfa\
-\x82N\x0d\xc8\xd5\x01\xe0\xb8\x85S\xf7\xbd\xf9\x85\xbf\xfa\
-\xdf\x1f\x9eY\xd7S\xaf\xbdz\x16@\x10\x04\xa1_\x88\
-\xaag\xe0\x9dA\x8e\xa5O(u\xd0v\xfa\xec\xa0\xcf\
-\xb6\xd7\x16\xb6\xbf\xe1M\x1f\xdc\xf1\xa1\xd4\x96\xc4\xf6.\
-\xe4\xd7aa\x1eG\x1f\xce\xff\xf2\xae\x93\xcf\xe2\x18\xd6\
-\x1a\x85\xd3\x9d\xc5l\xd8VPA\x10\x84^\x85\xd5A\
-\xad\x0a\x016\xfd\xcc\xeb\x02\x17\x80\xd6\x06\xa0\x84\xc1\x05\
-\x00\xb6n\x7f\x152\xef\xfa\xc6\xae;/|E\xca\x8c\
-9\xdf\x00\xc4/\x80 \x08B\xa7\xb4\xba&\xc0+\x0b\
-\xbc\xb5\x92\xd5+\xec\x89k\x09\xda\xb6\xcc\xc5\xa3\xa8\xdd\
-\xff\x96c\x9fx\xee\x07\xa7\xbf\x1dg\xa6\x81\xfe>\x0b\
- \x08\x82\xd0kD\xf6'\x90H$t\x95\x90>#\
-\xd8\x0a5\x1b\xd8F\x7fo\xd7\xfe\xde\xf2\xba\xf7\x0d^\
-\xf9\x1b\x7f>tG\x5c\xea\xa1~\xf6\x0b \x08\x82\xd0\
-+\xb4\xa4\x0e\xf2\x08\x01\xc7n\x10\xdc\xf5\x81-P\x9d\
->\x0b\x84\xad\xfag\xe7%\xd8y\xf5\x03\xbb>\xd8\xa9\
-z\xe8\xa7\x0f.L?Q<u\x10\xae\xda\xe7\x14\xd6\
-\xae\x01\xe8f\xa17\x85\x00\xd8\x88-\xa2\x9e\xa3\xf4\x15\
-\xd34\xf7\xaf{&6\x09\xbdu\x1eQ\x10\x14-;\
-\x95\xa9\xd7\xeb\xab$\x08V\xa1\x04\xc19\xed\xf2\xaa\xe7\
-\xa3\xabaVO\xfc\x1c+\xf7\xbf\xe5\xd8'~\xefk\
-\x17\xfe\xe1\xaf\xbd}\xdb;\xdb\xc9p/\xf9\x05\xe8\x04\
-2\xe9ZD\xa3\xb1\xb3q\xb2.\xdaK\xb0a\xb9\xf3\
-\xcf\xad\x99\x0f\xb4\x97\xbf\xe8w,_\x10\xfa\x99\x96\xb6\
-\x88R\xa7Z\x87\xbb&\xc0\xba\xf7%4v\xce\x8bp\
-G\xe9<j_|\xec\x96\x97f\xfe\xf5\x13\xb5\xc9\xe5\
-\xa5\xfab+\xe9n\x96\xb3\x00\xb6m\xe7A\x16:\xc9\
-\x9c\xabc.Z3 \xd7K\x84\x9e6<_ \xeb\
-\x9c\x22\x00\x84MG[>\x865\xd5\x90~\x92Xw\
-\x16\xbf\x15\x8d*\x22]U\xb4\xa5\x15\xf5\xd0K\xbf8\
-w\xe4\xfe\xab\xe6?\x02w\x11\x98\x85\x0b/\x08{\xcf\
-\x02\xf4\xecN \xdb\xb6K\x00\xaa\x86a\x8c{~\x9f\
-\x030m\x18\xc6\xa4m\xdb\x05\x00y\xc30F\xe9Z\
-\x83oW\xab\xb9c\x98\x02\x80<\xd9g_\xe3\x17\xb6\
-YX\x1d\x1f\x0b\x9d\xe3d\x993\xd0I\x08\xd9?a\
-\x9b*l\x1b\xbf\xc1|\x81\xa5\x9cbT\xa0\xcc\x13d\
-\xb0\xd6I\xcb\x1a\xa78\xcd\xd2\xa40%\xb8vW\x1c\
-\xc7-Vs\x87/^G1\xe3d\x8d\xd3\xd7A\x0b\
-\xfd?\x05e\x96`\xafV\x960\x07\x1f%\xedZ\x15\
-\xcaj\xac\xb8\xd3\x14z\x82Vw\x075@3\x02\x9e\
-\x15\xf0\x02,w\xc6<B_\xd0>\xa7\xb4\xdf\x16O\
-\xfc\x1c\xf3Qv\x0f-\xcc\xe3\xe8#\xd7\xcf\x7f\x1a\xbd\
-\xeb\x17\xa0UF\xe0o\xce\xb5\x15\x93\xbd\xcd\x1c\xc3\xc4\
-\x12\xd6t\x9d\xbeL\x93\xa3\x8dI+\x9a\x93\x90\x1c\x5c\
-g.A\x9d]\x0e\xae\xa3\x92\x1a\xc5\xa9\xe38\x9f\x09\
-K\xd3r=rq|3p\x8dv\xf9:\x1c\xd1\x8c\
-\xc4q\x98q\xb8\xd6.}\x1d\xb4\x90\xbd\x1b?\x93\x0e\
-a\x0e>\xa6\xe9\xda\x18:7\x96'\x08]\xa1\xed\x13\
-\xc3u\xc5\x0a\xdc5\x80e4n\x19m\xa6\x1eZ\x84\
-R\x0f\x95\x82\xd4C\xe7\x96\xea\x0bt\x18\xacg\xfd\x02\
-l\x10\xcd\x1c\x81t3l\x14'!Q\x0c\xc7\xadq\
-\xd2\xe2\xb9\xae;\x9f\x09K3\x07\xcd\xf1\x09\xa9l\xca\
-h\xeep\xa4J\xf9dg!\xba\xfd\xfd0\x07-^\
-\x9a9\xf8\xc8r\xbc\xe4\xc5\xa9\xd7\xd6|\x04\x01@\xfb\
->\x86\x1d<\x0b\xc6u\x9f\xcf\x0a}\xf3\xec\xc1\xe9\xb4\
-\x01\xac<\xfd\xd5\xb3\xff\xf1\xdf\x07\x9f\xff\xd0\xbb\x1e\x18\
-\xfe\xe0\x85\x17\xa7/\x07\x94\x008\xf4\xb7'?z\xf2\
-Y\xccC\xce\x028X\xd1\x1c\x81\xc4\x1e\x96\x88\xe2$\
-\xa4\xd6\xa2\x15M\xbf{\xf5\xfc\x84\xa5\x19\xe4\xf0#\xd0\
-\xe1\x08\xe5o\x98\xccM\x1f\xa4\xf4\xc6M\xe5\x01\xac-\
-\x07-\x01\xc4\xeaDG\x10\xbaE\xc7B\x00p\x04\x01\
-o\x1f\xe5\xd1\xb8\xde\xe9\xeb\x07\xcc\x9c\xfd\xfb\xf4\xf7\xd6\
-\xc5\xa3x\xf1\xfe\xab\xe6\xef\xba\xe6\xfe\x9d\x7f\xf4\xab\xbf\
-\xb95_\xb9\xe7\xa5I\xeb\xc13G\xa0:{\x9e9\
-\xf4\x93_\x80 *\xd0\xd4\x02\xb4S\xa8\x8c\x88\xce&\
-\x22:\x02\x89=,\xd1\x0d'!a\xb6\xdf\xc3\xd2\x0c\
-r\xf8\x11\xeapD[\xcb(B\xa9nF\xe9\xf7\x96\
-\x1d\xb4\x04 \xea\x1f\xa1/\xe8\xd4\x80\x9cC\x07\xea\xa1\
-S\xfc\xf7w\xae?q\xdf\xe3\x7f\xf2\xe2-\x87?\x7f\
-\xe6\xc7p\xd7\x13\xbc3\x80~\xf0\x0b\x10\xc4\x0c\x80\x22\
--\xfe\x02J(\xcc\x02\x80\xe6\xfb\xb3\x06`D\xdb-\
-\xe4\xd5\x997s\x04R\x83\xe6\xc8\xa2\xc5\xb0a\xb4\xea\
-$$\x08v\xe0\x92\xa1\xfc5S\xb7\x84\xa5\xd9\xe0\xf8\
-\x84\x9chd\xd1\xc4\xe1\x88eY9\xcf:\x08\xbb\x8a\
-\xec\xd4A\x8b7\xdf5N\xc7\xb6\xed\x8e\x9d\x86\x08B\
-\xb7\x88M\x080\xda6R\x16\x06\xac\xb69\x8bF\xdd\
-\xbe.\x00\x1cA\xf0\xec?\xaf\xfc\x0f\xfd\xcd*\xa0\xd3\
-\xda\xa7/\xce\x02\x04a\x18\xc6\x0ch\xf7\x0b9\x8da\
-u\x84\xf7\x9e\x0a\x809\xba\xa7\x8c\xc6\xd1v3G \
-NX\xba\x169l\x18m8\x09\x09$\xaa\xf3\x99\xb0\
-4i\x84^\x86[^v\xb6\xdd\xcc\xe1H\x05\x8d\x8e\
-7\xf2p\x17};q\xd0\xa2\xe7\x9b=Mq\xfa\x0d\
-Nol\xdb.\xd8\xb6]\xef\xd1m\xc1\xc2yF[\
-[D#E\xdc\xe8\x978I\x7f\xb3\xc9\x89A\xb8F\
-\xe8t3\x14\x9c'\x1e\xe9\xeb;\x80x\x1d\x80\x85@\
-O\x9e\x05h\x07\xdb\xb6g\x01\xcc\x04m\x1f\xdch\xa7\
-2qA:\xf8V\x9c\xbeo\x0a\xea\xf5:o\x0f\xae\
-\xc8\x16Q\xa1Wh\xf9\xc4p\xab\x90\x8e~\x85\x16\x8d\
-\xebPB@_ \xe6\x99\xc2 \xe5#\x09W(\xf1\
-\xda\x01w\xfa\xba\x00\xd8t~\x01\x0c\xc3\x10\x93\x0c\x9b\
-\x0cR+\x95M\xd3\xac\x92:\xa8\x1dw\xa0\x82\xd0u\
-\xba&\x04\x98\x90\xddC\xbcv\x90\x82k\x97\x08p\x17\
-\x8dY\x104\xec(\xdaL\x02@\xd8\xb4d\xa0vb\
-9\x87\xdcH\xd5'\x08=E\xd7\xd4Ak\x12\xf2W\
-\x0f%\xe1\xce\x00\x92\x9e<\xad\xf8|VE\x00\x08\x82\
- tN\xd7\xd5A^|\xd4C\x09\xb8j!^\x07\
-`\x01\xa0\x9f1\x00\x1a\xcf\x1a\x08\x82 \x081\xb1n\
-3\x81\x86D]\xdbC\x9c\x07\xef\xff@\xa3\xfah\x15\
-\xb4\x0b5\xd6\x8c\x08\x82 \x9c\xa7\xac\xfbL@\x87\xb7\
-u\x92\x8a(\x01\xd7s\xd9\x9a[!\x9d\xbf \x08B\
-\xd7\xd8\x10!\xc0P\xe7^\x07\x1c\x81\xe0\xbd&\x08\x82\
- \x08\x82 \x08\x82 \x08\x82 \x08\x82 \x08\x82 \
-\x08\x82 \x08\x82 \x08\x82 \x08\x82 \x08\x82 \x08\
-\x82 \x08\x82 \x08\x82 \x08\x82 \x08\x82 \x08\x82\
- \x08B#\xff\x0f-S\xc4v\xab/1A\x00\x00\
-\x00\x00IEND\xaeB`\x82\
-\x00\x00\xfe\xa7\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\x9e\x00\x00\x01\x19\x08\x06\x00\x00\x00\xa7\xc9Co\
-\x00\x00 \x00IDATx\x9c\xec\xbdI\x90%\xc7\
-\x99\xa0\xf7\xb9{,o\xc9=+k\xdfP\x05 \x89\
-\x85 @\x90F\xb2\x9bb\x8b\xdd\xa0z1\x1b\xcd\x98\
-LhI\xa61-\x97\xa6L\x17\xc9\xa4\x03q\xd2\x98\
-.2Rf\xa3C\xdfH]d\xba\xc8\x8c%k\x1e\
-\xd8\xb2\xe9\x1e\xa2\xd9m\xadiRl\xa2\x9a \x09\x82\
-H\x00\xb5\xa2\xf6\xac\xdc\xdf\x16\x8b\xbb\xeb\xe0\x11/\xe3\
-\xbd|\xb9\xd4\x96U\x00\xfc\x83\x1523\x16\x0f\x0f\x8f\
-\x08\xff\xfd_\xfcw\xf0x<\x1e\x8f\xc7\xe3\xf1x<\
-\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\
-\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\
-\xf1x<\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\xf1x\
-<\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\xf1x<\x1e\
-\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\xe3\xf1x<\x1e\x8f\xc7\
-\xe3\xf1x<\x1e\xcf=!\x1eF!\x0b\x0b\x0b\xdf\x02\
-\xbe\x0d\xfc\xe9\xfc\xfc\xfc\xb9\x07,k\x1ax\x0b\xb88\
-??\xff\x8d\x07(\xe7\xd5\xa2\x9c\xef\xcc\xcf\xcf\xbf\xf1\
- uz\x80:\xbc\x05\x9c\x99\x9f\x9f\x9fy\x1c\xd7\xaf\
-\xd4\xe3\xfb\xc0\xeb\xc0\xcc\xfc\xfc\xfc\xca\xe3\xac\x8b\xc7\xf1\
-$=\x93\xca\xf7\xfb\x8d\xf9\xf9\xf97G\xec\xdf\xb1\xae\
-\x0b\x0b\x0b\x7f\x06|\xb7\xf8\xf3\x8d\xf9\xf9\xf9\xef<\xca\
-\xfa\xde+\x0b\x0b\x0b\xaf\x01?\xe2\x11\xd5\xcdZ\xfb\xb0\
-\x8b\xfcD#\x84 (\xff(^\xbeo\x01\xd3\xc5\xa6\
-\xf3\xc0\xb9'\xe1%*\x84\xc8\xeb8!2\xf2#-\
-\xea\xbf2??\xff\xbd}\xad\xdc>P|\xd8\xd3\x8f\
-\xeaY,,,|\x17\xf8\xb3\xca\xa67q\xcf\xfe\x13\
-\xd7\x96{e/\xef\xdc.\xe7\x9f\xc1u\xc6\xafU6\
-\x7f\x0f\xd7\xae[:\xf7\xfb(\x7f\xe4;Q\x11\x22%\
-\xe7p\x1d\xee\xc5\x07\xbd\xe6\x0e|\x1bw_\x7f\xfa\x08\
-\xaf\xe1\xf9\x04!\xa1\xff\x12\x7f\x1b\xf7\x91\x89\xf9\xf9y\
-\x81\xeb|\xa6w:\xf9Q0??\xbf2??\x7f\
-vH\xdby\x0d'\x14\xcf\xecp\xea\xb7\x18\xfc\xc8?\
-I\xbc\x8e\xbb\xbf\x87N!t^\x07\xbeP<\xf7R\
-;\xfb\xb4kF{y\xe7v\xe2G\xb8\xefg\xa6h\
-\xd7/\x14e=,\x01\xb0\xe5\x9d(\x9e\xe5\xb7p\x96\
-\x87\xf2YN\x17\xc7n\xcb\xfc\xfc|\xf9\xdd\xdf\xb3@\
-,\x04\xf44\x0f\xef\xbe\x1e:\xf3\xf3\xf3o\x16\xf7\xf7\
-\xd8\x07\xd1\x1e\x87\x00XXX\xf86\x9b/\xec\x16S\
-\xd9\xc2\xc2\xc2\xeb\xc0\xf7)T\xd5a3Ve\x94u\
-\x1ex\xb58\xado\xe2\xaa\xec?\xc7\xe6G\xf0\x9d\xe2\
-\xd8\xd7p\x9d\xdc7\xe7\xe7\xe7\xcf-,,,\xe3^\
-\xe4\xf3\xf3\xf3\xf3_\xa8\xa8\xf9%\x03#\xabJ]\xaa\
-|\xa1\xf8\xf9\x16N\x80\x96\x1f\xc7\x9b\xc5=\xae\x14\xe7\
-\x96\x02w\xba\xa8\xc3\x1b\xa3F\xf9C\xc7\x81\x1b\xb9\xbe\
-1??\xbf\xb2S\x19\xc3\xa6\xb6\xa2\xae\xdf\x1d\xd5F\
-\xc5\xfe\xf29\x80\xfb\x90\xbf3t]\x18|\x06#\xcb\
-*\xcc\x95\xdfgS\x10_\xc4uz[L%e\x1d\
-\x81\xb3;h\x93\xd5z\x9d\xc7=\xab\xf3\x95\xb6)\xcd\
-,e[\x7f\xafx/\xca\xf3\xbe0??\x7f~\xd8\
-$;\xa2\x9e\xfd\xe7Sy\xae\xd5wf\xf8\xf9mi\
-\xaf\xf9\xf9\xf9\xef\xed\xf2L\xb6}\x96\x95\xfb\x1d\xf9\xce\
-mS\xdf7\xca\xb6\xa8\x9c?\x0d,S\xbc\xc3\xdb\xb4\
-iy\x8d7+\xe5}\xb3R\xcfm\xafU\xf9FJ\
-\xde(\xda\xe9\x02\xae\xed\xbf\xb9\xcd5\x87\xdb\xf4bq\
-\xff\xa5\x86\xb4\xdds\x19\xf9\xfeT\xee\xb3\xca\x9f\x16u\
-\xdd\xb6\x9d\x8a\xfa\x97}\xc54\xc5\xfb\xb1S=\xe7\xe7\
-\xe7\xcfn\xf7\xbe\x14\xbf_\xc0\xb5\xf77\x8a2\xcaw\
-\xed\x8d\xca\xfdU\xbf\x91\x91\xef\xc8\xb0\xd9qaa\xe1\
-Bq\xef\xe5\xdfo\xe14\xcd\xb3e}\xbd\xa9\xed\xde\
-\x10B8\x8d\x07\xf7\x12\x00|\x7faa\xe1\xbbE\xe3\
-\xdf\x0fo\x16#\xado\x02\xdf*\x1en\x95\x95b\xff\
-y\x5c\x87Q\x1e\xbfB\xf1r\x14\x9dt\xff\xe5.\x84\
-L9R\xf9\xc2\xb0:_\xbc\xb0\xe5(\xfd\x5c1\xb2\
-\xa9v\x04\xd3\xc0Y\x9c0z\xad\xbcN!L\xbfK\
-\xa1\xe5\x15\xd7\xf8n\xf1\xd2\x0f\xf3m\xdcK]\x8e\x22\
-/\x16\x9d\xe3\x9e\xcb(>\x9a\x1f\x15\xe7\x0a\xe0\x1bE\
-\x1b}\xab\xd8_\x15\xfeeY\xe7\x8a\xf68_\xb6]\
-!tv,\xab\xd8w\xa6\xb8\xef\x81\xf6\x1cA\xa9\xd9\
-^XXX\xf8vqO\xd5z\x7f\x1bg\x86\xfbB\
-\xe5Y}\x7f\x9b6\xbcW-\xb9\xaf\x15\x14\xffJ\xf3\
-T\x953\xc5\xbe\xe1\xe77\xb2\xbd\xf6\xf0LF>\xcb\
-\xea\x05wx\xe7\xfa\xedZ\x9c\x0f\xf0\xa3\xe2yT\xcf\
-_\xa1\xe8X\x17\x16\x16\xde*\xdau;\xcd\xa9\xfc\x06\
-\xce\x15\xf5,\x8f\xdb\xf6Z\xa3\xde\x096\xdb}/\x9a\
-\xeak\xc5}\x9d-\xce\x1d\xf6\x81\xee\xe9\xfd)\xee\xb3\
-\x14\xac\xa5\xd6tn\xa7\xba\x0f\xd5\xa1<g@p\x8f\
-\xaag\xa5^[\xde\x97j{\x0f\x9d{\xb1\xb8\xbf\x01\
-\xe1\xbf\xcb;R\xd6\xe5LQ\xdf3\xc5\xfd\x97e\x9f\
-\xc1\xbd\xe7\x9e\x07@\x02\x14/\xcb7q\x8d\xfeg\xc0\
-\xb7\x17\x16\x16\x96\x87;\xa1=P>\xb4Rk\x1a6\
-}\xbd\xb9\xcd\xcf\xf3l>\xe8\x87\xcd\x9b\xc5\x8bY\x9a\
-\x02\xcak\x94u+5\x9c\xed\xea\x5c\xf2\xea\xc2\xc2\xc2\
-\xb7\x0bS\xe0w\x86\x8e\xddK\x19\xaf\x17\xd7>\x07N\
-\xfd/\xea\xf4je\xff\xc5R\xe3\x9c\x9f\x9f\xff\xde\x0e\
-\xbe\x85m\xcb*:\xaeW\x8b\xfb\xbe8t\xef[(\
-F\x80e\xc7\xf3-\xdc\xe0\xe3\xadJ\x07X\xd6\xab\xfa\
-l\xcf\x14\x1f\xe9\xf0\xfd\xef\xf9\x83\x1c\xaa\xe7JQ\xcf\
-\xea\xe8\xbfd\xbb\xe7\xb7]{\xed\xe5\x99\x8cz\x96{\
-\xad\xef\xb9\xf9M\x7f\xc99\xb67e}\xa3\xa8\xc3\xab\
-\xb8v\xbd\xb0\xb0\xb0\xf0\xa3\x11\xc7\x95\xf5\xec\xdf\xdf}\
-\x5ckT}\xdfZXX\xb0\xc5\xbfa\xad\xe4\xdcv\
-\x9d\xfd\xbd\xbe?;\x9c\xbf[\xdd/\xee\xa1\xed\xfb\xf5\
-\xdc\xc3\xfb\xf2&\xae\xed^+\xfa\x91W\xd9|\xf6\xc3\
-l\xfb\x8e\x14\xdfR)h^-~?\x07\xbcV\xd4\
-\xe1\x896+~\x5c(5\x9e\xf2\xc3\xfd\x02n$Q\
-\x8e\xa0\x86G\x9f\x9f$\xca\x0elyaa\xc1\xe2T\
-\xf5\xedx\x03\xf7\x02~\xab\xf8\x90\xcbv\xb9\x972\xca\
-c\xbf_v\x08\xb8\xd1\xd3te\xff^\xfd*;\x95\
-u/#_\xa0o\xe3/\xb5\x8as\xb8\x0f\xaez\x8f\
-\xafV\xaeS\xdd~\xcf\xd7\x1aq\x0f\xdf\xaa\x94=\xac\
-!\xefv\xfe\xa8\xeb\xee\xf6L\xb6{\x96{\xado\x95\
-\x95\xed\xf6\x15\x9d\xe37+\x16\x807q\x9d\xd7^\xac\
-\x09\xf7t\xadQ\xcc\xcf\xcf\x97\x1a\xea(\x01\xb3\xd3\xf3\
-z\x90gZ=\x7f\xd4\xf5\xa6Gl\xdb\x89\xea1\xbb\
-\xbd/\xa5\xf0(\x83BJ\xd3\xfaNu\xdc\xee\x1dY\
-\xc1}O\xaf\xe2\x84L\xa9M\x95\x83\xc4\xed44\xcf\
-\x1e\x09\x867\x14#\x897\x0a\xe9\xfe\xfa\x03j!O\
-\xb2\x83\xba\xac\xdb\xae\xe1\xac\x85\xdd\xfd{\xc5(\xff\xdb\
-\xc0\x9f-,,\x9c\xbb\x972*\xc7n\x17r\xbe\xc2\
-\xde\xcdT\xdb\x96U\xd1T\xee\xf9\xb9\x15\xa3\xcb?\x1d\
-\xf2!\xac\xe0F\xa7[|\x15\x15\x8d\xf8^\x84fI\
-y\xfc\xfd\x86\xbbo\xd7^;>\x93\xed\x9e\xe5\xfc\xee\
-\x8e\xf5Q\x9d\xe7\x9e:\xe9\xc2wp\x1e\xe7\xb7\xd8\xcb\
-s\xb9\x9fk\xdd\x93`\xba\xc7k?\xe8\xf9\x0f*\xcc\
-\xaa\xe7\x8e|_\xe6\xe7\xe7/.,,\xbc\x89\x13:\
-\xe7q\xef\xecv\xcft\xb7\xef\xb6,\x87\xb2,65\
-\xb6\x95=\xbc+\x9e](\xa3\xda\xbeU\x1d\xf9\x15\x1f\
-\xe5\xab8[\xf8\x0a[_\xa6\xed\xd4\xfd\xb2\xd3+G\
-\x22\x0f\xfb\x01\xed\xf61\xdc\xcb\xc7R\xd6\xad?\x02\xdd\
-n4Z\xd8\xe8\xa7\x8b\x8e\xb9:\xda\xd9s\x19\xb8\x11\
-\xd9\x0a\x95QZ\xd1\xee\xd3\x95\xfdg\xca\xce|aa\
-\xe1\xcfv\x10\xfa\xdb\x96U\x987\xce\xe3F\xd7\xa5\xd9\
-f\xdb\xc8\xaca\x9f^\xe1\x97\xab\x8e\x16\xcf\xe14\x9e\
-\xb2^g*\xbe\xbb\xf2\x98\xf2}\x186\x93\x95\xef\xcd\
-\x99\xe1\xfd\x95z\xbe^\x0a\xcb\x85\x85\x85\xd7\xb7\xf1\xb1\
-\x8db\xbb\xf6\xda\xf1\x99\xec\xf0,\xb7cz\xa8\xbe\xa5\
-\xc9\x05\x8a\x8e\x88!\x93N\xd1\xee\xdf\x1f2U\x97m\
-\xb6\xeb5\xef\xe5Z;\x9dS<\xa7\xbd\xb6\xe7\xa8r\
-v}\x7f\x1eF\xdd\xef\xb1\xdc\x9d\xde\x972\xb8\xa5\x0c\
-\xda\xd8\x8e\xdd\xbe\xdb\xf3\x14\x9a>\xae\x0f,\xcdo\xaf\
-Qy~\x859\xf3\xc2\xfb\xef\xbf\xbf\xef\xd1\xbf\x1fw\
-d\xe5\xf73\x15\x15\xb6\x8c\x06\xfb\x06\xf4}\x08oP\
-\xa8\xb9l:\xdc\xaa\xac\xe0^6K\x11M\xb2\xcd\xc8\
-\xfe~\xf8\x1e\xee\x81\xffh\x94\x9d\xbc\xd4\xd2\xca\xeb/\
-\xb8\x09c;R\xf1k\xbd^\xb9\xefW\x17\x86\x9c\xc0\
-\xc5\x8b}\x86M\xb5\xfc[\xb8{{s\x0fe\x9c\xc3\
-\xd9\x9d\x7fT\xd4\xb1\x8c\xb8)\x8f}\xad\xf8W\xfaZ\
-\xbeCa>\xc3uT\xe5}|\xa7r\xde\xb7v+\
-\x0b\x17\xe9s\x11\x17q\xf4\x16\xdb\x8c4\x8b\x8ez\x05\
-7\xea\xb7C\xcf\xee\x8dJ\xbd\xde\xa8\xd4\xab\x8c\xf2)\
-\xdb\xf0\x0d\x9cO\xd024 )l\xf8oV\xce\x1d\
-\xb6\x8d\x7f\x03\xf7\x5c/T\xae\xbd\xa7\x90\xf8\xed\xdak\
-\xa7g\xb2\xd3\xb3\x1cq\x89Q\xef\xdc7\x8a{(\xeb\
-;\x8d\x8bv\x1an\xdf2l\xbaj\x0a}\x95\x22r\
-s/\xf7\xb7\x87k\x0d\xbc\x13\xdb\x9c\xb3[\x07\xbc\x1d\
-{z\x7f\x1e\xa0\xee\xf7\xcbn\xefK\xd9\xb6\xd3\xec \
-\xe4\xf6\xf0\xdd\x96mV\x1d\xc8\x94\xc2\xc8\x9b\xd9\x1e\x02\
-\x0f%s\x81\xc7\x03OF\xb6\x08\x8fg\xbf\xf1\xe1\xd4\
-\xf7F5\x9c\xda\xe3\xf1x<\x9e}\xc1\x0b\x1e\x8f\xc7\
-\xe3\xf1\xec+\x02\xbc\xaa\xe8\xf1x<\x9e\xfd\xc1\x9b\xda\
-<\x1e\x8f\xc7\xb3\xefx\xc1\xe3\xf1x<\x9e}\xc5\x0b\
-\x1e\x8f\xc7\xe3\xf1\xec+^\xf0x<\x1e\x8fg_\xf1\
-\x82\xc7\xe3\xf1x<\xfb\x8a\x17<\x1e\x8f\xc7\xe3\xd9W\
-\xbc\xe0\xf1x<\x1e\xcf\xbe\xe2\x05\x8f\xc7\xe3\xf1x\xf6\
-\x15/x<\x1e\x8f\xc7\xb3\xafx\xc1\xe3\xf1x<\x9e\
-}\xc5\x0b\x1e\x8f\xc7\xe3\xf1\xec+^\xf0x<\x1e\x8f\
-g_\xf1\x82\xc7\xe3\xf1x<\xfb\x8a\x17<\x1e\x8f\xc7\
-\xe3\xd9W\xbc\xe0\xf1x<\x1e\xcf\xbe\xe2\x05\x8f\xc7\xe3\
-\xf1x\xf6\x15/x<\x1e\x8f\xc7\xb3\xafx\xc1\xe3\xf1\
-x<\x9e}\xc5\x0b\x1e\x8f\xc7\xe3\xf1\xec+^\xf0x\
-<\x1e\x8fg_\xf1\x82\xc7\xe3\xf1x<\xfb\x8a\x17<\
-\x1e\x8f\xc7\xe3\xd9W\xbc\xe0\xf1x<\x1e\xcf\xbe\xe2\x05\
-\x8f\xc7\xe3\xf1x\xf6\x15/x<\x1e\x8f\xc7\xb3\xafx\
-\xc1\xe3\xf1x<\x9e}E<\xee\x0ax<\x1f#\x82\
-\xf9\xf9\xf9z\xbb\xdd\x0e\x8d1~\xd0\xf6)\xe1\xd5W\
-_ell\xec\xa1\x95\xd7z\xb2O\xda3A\x10\xd8\
-4\xad\x9bF#\xeb\x01\xe9\xb9s\xe7\xf4^\xcf\xf5\x82\
-\xc7\xe3\xd9\x1d\xf1\xc2\x0b/Lk\xad?\x93\xa6\xe9\xd7\
-\x8c1\xcfeY\xd6\xc0\x7f?\x9fx\x1a\x8dI\x9e\x7f\
-\xe9E\x1a\x8d\x18\xec\xe6v\x0d`\xaaG\xda\x81\x1f;\
-a\x01\xf4\xc0\xc9\x18\xec6\xa7\xea\xed\xcb5n\xfb\xf6\
-\xbd}\xf5\xa4\xca\xc1\x0a\x8c\xde\xe9\xbc\xc1k\xdb\xf2\xd7\
-\xc1*#\x84\xd5J\xb2\x8a\x14\xbf\x14\xd6\xfe\xbb\xf5\xf5\
-\xf8\xe2\xdf\xfd\xdd\xb9=I;\xff\xe1x<;#\x9f\
-{\xee\xb9\x13\xddn\xf7\xbf\xedt:\xffE\xaf\xd7;\
-\x9c$\x09\x00\xd6\xee\xa1\x97\xf1|lQJq\xe2\xd4\
-S\xcc\x7f\xe6y`\xf0y\xdb\xfe\xff\xdc/[\xdf\x04\
-[9\xc6\x80\xdd<|K9n\xe3\xd0\xe9\xb6\xf2\xc3\
-\x0e\xee\xb6\x83\xd7\xdbruk\x06\xeahF^\xaf\xf2\
-W\x7f\xbf-O\x1d\xb8v\xf5\xff\xee\xa7)6\x08\xa4\
-\x14\x04*\xc8\xc2 \x5c\xa8\x8f\xd7\xbf\xdb6\xe6\xff\xfa\
-\x9b\x1f\xfc`\x89]\xf0\x82\xc7\xe3\xd9\x1eq\xf6\xec\xd9\
-\xe3\xc6\x98\xffeyy\xf9_nll`\x8c\xd9\xfd\
-,\xcf\xc7\x1e!\x04\xe3\xe3\x13|\xf6\xd5Wi\xd6\xc6\
-0\xc6\xe9$\xae\xc3\xacv\xf5\x16\xac\xa8l\xb3X+\
-\xfa\xfb\xfa\xddvE\xf0\x94\x9b\xaa\x1b\xdd\x9f\xee\xf8~\
-i\xd6\xfd\xb4\x83\xd2\xc2\xfd-`@8\x09\x8b\xb0\x85\
-P\xab\x5c\xa8\x22R6\x8f\xaf\xd4GT\xef\xc5TN\
-\xad\x0a7[\xb9\x8fj\x1d*\x84QH\xb3\xd1Xl\
-\xc4\xf1\xff\xdeh\xd4\xfe\xd7s\xe7\xce\xad\x8dh\xd6>\
-j\xa7\x9d\x1e\xcf\xa7\x99\xa7\x9f~z\x02\xf8o\x96\x97\
-\x97\xff\xbb\xb5\xb55\xaf\xe1|\x8a\x08\xc3\x88\xd3g\x9f\
-fn\xee\x10F;\x93\xd3\x16\xa1c\xcb\xadv\xb3K\
-.\x84P\xb5\xf7\xaf(\x14l\xdd8\xa8\x01\x95\xa5\xd9\
-\xca1b\xe8d!\x06\xcf\x17U\xa1Sas\x88T\
-\x15:\x9b\x17\xea\x17S\xfc\x1b\xd4m6\xcf\xb5\xc2\x8e\
-\xd8^\x9e\xe3\xea\xaasM\x96\xe7M!\x82\x93a\xa0\
-\xee\xbc\xf4\xd2g\x7f\xfd\xee\xbb\xefn\xfb\xc1x\x07\xa9\
-\xc73\x1a\xa9\xb5>\xddn\xb7\xff\xeb\x8d\x8d\x8d\xc7]\
-\x17\xcf>\x22\x84djj\x9a\xc3G\x8eb\xf2\xaa'\
-dX\xe8X\x06\x85\x0e\x94\xbe\x14\x0b\x18\xcb\x90\x89\x0c\
-\xb7\xa1\xa2\xa9\x0c\x9b\xdd\xac\xb5Xc\xdd\xc9\x94\x1d{\
-U\x85\xb1\x83\x02\xa68\xbe\xbf\xad\xf8a\xca\x0b`\xfa\
-\x1aK_\x98\x15U\xb0fH\xe3*\xb4\xab\xbey\x0f\
-\x8b\xb5\xc6\xd5\x89\xca\xbd\xb8\xc2\x9d_\xaa\xbf\xc3\x92g\
-\x19\xedn\xebh\xab\x93\xfe'I2~h\xa76\x0e\
-v\xda\xe9\xf1|Z9~\xfcx\x1cE\xd1\x17WV\
-V\x9e\xd2z\xcf\xc1:\x9eO\x00q\x1cq\xe2\xa9\xa7\
-\x88T\x84\xb6\xf9H\xbf\xc8@G<h\xd0\xdab\x86\
-*\x85\xc8`1[5\x9eA!4t\xce\xb0\xb0\x19\
-p\x1a\x0d\xe9Xv\xf3\xafa\x81\xb4\xd5\x14g\x07\xca\
-\xd8\xfc\xc5\x22\xb0\xa5\x8c\xe9\x1f\xdd\xb74Wv\xd8\xbe\
-\xc0\x85<\xcfC\x9dg\xa7\xc3p\xede\xe0\x06\xdb\xe0\
-\x05\x8f\xc73\x82Z\xad\x16&Ir6\xcf\xf3\xc7]\
-\x15\xcf>\x22\x95b\xee\xd0Qf\xa7\x0f\xa0\xad\x1e\x10\
-:UOGU\x08\x95\x9aBu\xcb\xe6\xaea\x93\xdb\
-\x909\xac\xf4\xe6\xf7\xcf\x1f\x92ZvX\xcb2[L\
-w\x9b&5\xb3U\xa8\xd8\xcd\x9f\x0c\xd7\xb1\xe2\xeb)\
-\xaf,\x0a\xa1e*\x87\x80\xdd\x94\x9dU\xe1;\xa4\xf5\
-a\xc0\x1a\x836Y\xd4\xeb\xe9\x19v\xc0\x0b\x1e\x8fg\
-\x04\xc6\x18a\xad\x8d}0\xc1\xa7\x8bf\xa3\xc1\x89\x93\
-\xa7\xdch\xdf\x9a!]fPx\x8cPx\x06\x7f\x1f\
-\xd1AW\xff\xde.6\xad4\xb9U\xf7a\x19\x888\
-\x1b\xaeKi?\x1b4\xcb\x8d\xae\xef\x80\xb6\xd4\x17\x9a\
-n\x83)\xcb\xb5#\x8e\xed\xb7\x87\x05+@T\xca5\
-eY\x16m\xad0\xc2\xee\xe8\xc6\xf1\x82\xc7\xe3\xd9\x06\
-c\xcc\xb6\x01\x05J)\xea\x8d1\x10\xeeC\x15\xb05\
-Ft\xf4\xa9ns\xe1\xdc\xed\x7f\xe0\xc5\xb9\x02\x81\xa8\
-\x9as\xa8n\x1fU\xe4fg&\x10\x08\xe1\x8c$\xdb\
-\x22\xecf\x05v@\x08\xcb\xc0\x05G_\xbc_\xabQ\
-\xb7:\xea\x94=\xc5g\x14'n\xc6\x86\x0d\xd5V\x0c\
-\xee\xdb\xad\xa8j\x19\xc3\xb7S\xdd\xa6\x94bfv\x96\
-$\xed\xd1\xebu\x06\xcb\xb6\xe5yCB\xa7\xfa\xfb\xd0\
-\xcd\xf5\x9b\xba\xc0\xb0\x19E\xd6\xbfn\xff\xf9[\xc4P\
-\x984\x83\xca\x10e;\x8f\xba^\xf5\xbcjT\x1cv\
-\xb8\x8d\x06\x05\xd3f\xe0\xc2\xa0\xe0+\xef\xd5h'\x80\
-\x11\xeeI\x0b\xa1\x10\xd68\xb9\x83\x22\x8a\xc2\xcd\xeaZ\
-\x10\xa6\x1fn\xc0Nx\xc1\xe3\xf1\xdc\x07a\xad\xc1\xf8\
-\xd4\x04R(\x1a\xf5:\x12I\x96\xe7 -Zk\x02\
-\x15P\x0b#\xb46\x08)\x88\xa2\x90n\xb7G\x10(\
-d\x10\xd0MzXmQB\x90k\xe7G0@\x9e\
-\xa7X\x03RJ\x9aq\xc8\xd7O\x9ed\xa5\xd3\xe2\xe7\
-\xd7o\xd3\xc93\x84\x90\xb8\xaeA\x22\x8a1\xa5\xb5\x96\
-\xc9\xc9\x09\xf2D\xd3\xedu\xc8\x8dF\x08\x10\x94\xc7V\
-\x11\x08Yt7\xd6\xb8Q\xb4\xb0\x85\x00)\xb0 \xa4\
-t\x1d\x88\xd8\xdc\xe3\xb4\xbf\xc1c\xa5\x94\xce\xf9\x5c=\
-Nk\x10\x9bW\xb7\xc5u\xa5\xdc<\xaf\xd4$\xc5f\
-A\x9b\xd7\xee\x0b\xe1\xfe\xa6\x01\xc1cy4\x82\x07\xa0\
-\xdb\xeb\xd1\xbdq}O\xe5\xed\xc6\xa8q\xc8\xa8\xebV\
-\xb7\x19k\xa9\xd7\x1b$I\x0fk-BH\x02%\x11\
-\x82\x11\xe6.'\x06\xa5\xdc\xaa\xa5\x88\xa2\x11\x85\x00)\
-\xd5\xc0\xe4Ok-\xb9\xcd\x11\xd6yqL\xc5\x07U\
-\x0e\xb4\x84p#\xaa\xd3\xa7Ns\xf0\xe0\x1c\xad\x8d\x16\
-\xdd^\x8f\x1b7o\x93\xf4: \x05a\x18\x12F\x93\
-lJ7\x0b(\xb0\x16\xb3\x8b[\xd4\x0b\x1e\x8f\xe7>\
-\x08jc`\xe1\x85\x17\x9f\xe7\xab_\xf9\x1dZ\xad\x16\
-k\xebk\xa80\x22I\x12\xc6\x1bu\xc6\xc7'\xe8t\
-:\xd4j\x0d\xe28\xa2\xddnc\xb1\xb4\xdam\xda\xed\
-\x16R)\x1aq\x8dz\xbdA\x18\x85\xfc\xfa7\xef\xf2\
-\xf6/\x7fI\xaa{\x1c\x98\x9d\xe5\x0f\xbe\xfaU\xfe\xa8\
-\xb7\xca\xcf~\xf3[>\x9a\x9e\xa4E\x80\xd6\x1am4\
-I\xd2#ISr\x9d\xf1\xf9\x97_\xe1?\xf8\xc67\
-\xb8t\xf92?\xfd\xe9\xcf0\xd6\x92\xa6=t\xae\xa9\
-\xd7j\xa4i\x0a\xb6\x10lYJ\xbb\xdb\xc1\x18\xcd\xe4\
-\xc4\x0c\x13c\x0d\xba\xbd\x1e\x06\x81\xd1\x1a\xa5$\x08A\
-\xbb\xdd\xc2j\x0b\xc2\x92f\x19R\x06\x1c;2G\x96\
-e\xf4z\x09H\x89\x10\x82N{\x03\xa1\x02\x84\xd1$\
-Y\x8e\x10\x82\x13'\x9f\x22M\xda$i\x0eV\x10\x85\
-\x01i\x96\xd1\xeal`\xb4\xf3Q\x1c<x\x98\xac\x97\
-\x80\x14\xae\x9cN\x8b\xb2\xab\xce\xf2\xac\x1fIU\xb2E\
-s\xda\xe3s\xda\xae\x8c\xe1\xd1\xfd^\xb9\x97\xe3G\x1d\
-;\xea\xba\xe5\xef\xc6\x18fg\x0f\xf0\xe2\xf3/p\xed\
-\xfau\x16>\x5c`\xac>N\xbd^\xa3\xdd\xde\xe0\xf8\
-\x89\x93\xa4IJ\x96\xa7Da\x88\xd6\x10*H\xd2\x8c\
-\xe9\xa9iZ\xed\x16\xd6:A\xd4\xebu\x11R\x91\xf6\
-z\xdc]^F\x05\xc5\xcc\x19\x03*\x0cx\xf9s\x9f\
-c\xa3\xdd\xe6\xca\xc5K\x18\xdc\xc0\xa7\x16E<\xf3\xcc\
-3\x5c\xbet\x99V\xa7\x8d6\x86W?\xff2'O\
-\x9c\xe0\xfd\x0f> KR\xb24\xe3\xf6\x9d\x9cLg\
-EyNmrr\xc7\xeeM\xa3\xc5\x0b\x1e\x8f\xe7\xfe\
-(:\xc6Z\xad\xce\xe1#\x87\x89\xc2\x98,M\x08\xc2\
-\x904MY__gc\xa3E\x1cG\xc4qH\xa7\
-\xd3\xa6\xde\xa8!U@\xae5\x87\x0e\xcc\x11\xd7c\xa4\
-\x0a\x18\x1f\x1fgjr\x92\xa5\x95e~\xf9\xab_b\
-\x8devf\x8e\x97?\xff*M\x9dp\xe7\xc6\x0a\x07\
-'\x03N\x8f5\xc8\xa5D\x06\x82\x8f.]\xe2\xea\x8d\
-\xeb\xe8\x5cr\xf0\xe0!:\xdd.\xcf\x9c}\x9a\xc5\xdb\
-\x8bH\xa9\xb0h\xae\x7f\xf4\x11q\xbd\xc6\xf4\xcc\x1c\x11\
-\x0aM\xce\xf2\xca2\x1f\x5c\xb8@\xab\xdde|l\x8c\
-\x833\xb3\x04\xb5\x98Fs\x1c\xd0$IB\x14*.\
-^\xbcHn@I\xc3\x9d\xdb\x8b\x08\x15055\xc5\
-\xf8\xc4\x0c\xb5ZL\xa4 \xc9\x0d\xbf\xf9\xcd/\x89k\
-\x13\x98\xac\xcb\xed;\x8bH\xa1\x98\x9b\x99%j\x1c#\
-T\x12%k\x04\xd6\x92\xe8\x0eo\xff\xf2mZ\xdd\x1e\
-Q\x18q\xfa\xf4\x19\xa2 \xa2\x1e(l Yx\xef\
-7\xe4V\x10\x07\x82\xeb7o\xa1?\x85s\xa6l\xa1\
-\x15\xd6\x1au~\xff\xf7\xbf\xce\xb5\x1b70\xd601\
-1A\xd2m3>>I\xfd`\x04F#\x84\xa2\x9b\
-d\xe8$\xa5\xd5m355Mc|\x8cH\x85\x8c\
-\x8f\x8d\x91$\x1d6:=\xd6W\x97\xe9\xf4:l\xac\
-\xb5@\x08\xac\xb5\x8c\x87!\xcf}\xe69\x16\x17\xefr\
-\xf9\xc2E\xa4\x14\x18c\x99\x9d\x9d\xe5\xf3\xaf|\x9e^\
-\xd2\xe3\xfd\xf7?\x00\xe0\xe0\xc1\x83\x9c>}\x9a\x95\x95\
-\x15>\xba\xfa\x11\x93\x133\xc4\xa1\xe0\xc3\xcbW\x8b:\
-\xf7\x1dIE\xa4\xb6\xc1\xee!\x1e\xc7\x0b\x1e\x8f\xe7>\
-\x11\x02Z\xad\x16\xd7\xaf\xdf$P\x01k\xab+$I\
-B/\xe9Q\xaf7\x99\x9e\x9e\xe4\xfa\xf5\x1b\xb4[m\
-\x0c\x06\xa4b~\xfeY\x04\xb0\xb2\xb6\xc6\x81`\x96\xd6\
-\xda:\x17/\x5c$\x0aCn\xdd\xb8Y\x98W\x04i\
-\xda\xe5\xe2\xe5K\xdc\xad\xd7\xf9m\xa7\xc7\x9d;wQ\
-\x91BH\x098M\xc3\x18\x8b\x94p\xe9\xd2Ef\xa6\
-\xa6X_]\xe5\xf2\xa5\xcbt\xbam\xea\xcdq\xd6\xd7\
-V0X\xee\xde]F\x0a0\x06\xb2<!\xcbr\x94\
-\x92,-\xdfe}m\x8d8\x8e\x19\x9b\x98\x22M;\
-\xe4Y\x86\x94\xb0\xd1j\x93\xe7\x1a\xb0d\xda l\xca\
-\xa5\xcbW\x88kw8p\xe0\x00:K\xe8\xf4z\xb4\
-[\x1d6Z=0y\xe1_\xd6|x\xe1\x03\x82Z\
-L\xa4\x22j\xb5\x18\xd3K\xc8lF/\xcb\x9d9\xc9\
-h>\xf8\xf0=\xc6\xeb\x13D\xa13Q\xae\xae\xaf\x93\
-g9\x08\x816\x9f>\xa1\x03 \xa5`eu\x8d\x7f\
-\xfc\xf9?\x92g9\x8dzL\xbb\xdd\xe1\xee\xd2]r\
-c\xb9v\xe52B)g\x8a4\x02+\x0cY\x96c\
-\xade}c\x0dc,JJf\xa6f\xe8t\x9di\
-Lk\x83R\x01\xf5f\x99Z\xd0\x22\x94\xe4\xad\xb7\xde\
-\xa2\x9b&H%\xd0\xb9\x13zKKK\xfc\xfc\xad\xb7\
-\xb8q\xfd&\x08Y\x088\xc1\xcc\xcc\x0c\x13\x13\x13|\
-t\xed\x1a\xd7n\xde\xc6\x1a]\x98|\xe9;8\x8d\x85\
-r\x8e\x91{z;\xdb\xda|\xca\x1c\x8fg\x04g\xce\
-\x9c\x99\xcc\xb2\xec\x7f\xba{\xf7\xee\xff\xd0\xedv\xb7\xec\
-\x1f\x9b=\xccX=$\x8ek4\x9bM\x04\x90g\x19\
-\xc6Z\xac1\xa8  \x0a#\x92^\x97\x5c\xbb\x0f\xd8\
-b\xa97\x9aXk0\xda\x10\x86\x11y\x9e\x93\xe5\x09\
-\x12A\xa65\xbd\x9e\xb3\xed\xc7q\xc4X\xa3\x89P\x92\
-\x8dV\x8b\xa4\x97Q\xbaH\x06\xc2d\x810\x08\x19\x1f\
-\x1f\xc3\x1a\xcbFk\x1d\x9d[T 1\xda\xcd:\x1f\
-\x0e\x00\x18\x0e\x98\x90\xd6iQ\xce\xd6_\xf8\x0el9\
-\x81p\xd3\xe7\x02\xce\xf6\x1fH\x85\xc5\xa2M\x91\x83\xcc\
-\xda\xc2\xd9L\xf5@\x84\x15()\xb1\xc6`\x85\xad\xe4\
-\x0cs\xf5\x09\xa4D \xd1\xc6b\x85q\x13!\x8b\xdd\
-\x9f\xe6\x8eI \x88\xeb1y\x9a\xa1\x8dA\x0ag\xd6\
-\x1c\xf0GY\x81\x10\xa3\x83:\x94R\xc5\xb3\xb1\xfd\xf2\
-\x06\x8e\x14 \x85\xc4Z\x83\xd6\xa6\x12\xd2-P\x81@\
-\x17\x09L\xad\x85\xe7\xe7\x9fen\xee \xb7\x17os\
-\xf5\xcaU\xba\xdd\x1e\x85\x03\x910\x8c\x18k6\xe9\x87\
-3XPJ\xd2l6/OLL\xfc\xab7\xff\xfa\
-\xdf\xfc\x9f\xdb\xdd\xa3\xd7x<\x9e\xfb@\x08\xe7\x5c\xd5\
-:cee\xc5u\x02\xb6\x0cq\x13E\xe7n\x8b\x0e\
-C\xf4?\xfb^/)s\x9e\x14\x0evg^\x11\x08\
-\x10\x02%\x9d->\xcfs\x96W\xd7\x9c\xb0\x11\xa5c\
-\xde\x16\xa7J\xa4\x12HQ\x06\x09X\xd676\x8ak\
-+\x82\xc8\xfd\x1a\x84[\xaa\xed\x8eg\xd0\xa1]\x0a\xb1\
- \x90#\xf7o\x09l\xb3\x16\x81$\x0cvI|R\
-\xf8\x95\xa4T}\xe1U-\xab\x9c8\xaf\xa4\xd8\x1cA\
-\xdf'\xd5rw;\xee\xe3 \xd4\xf24G\x08\xd7\xc6\
-\xb6\x88V\xdc\x8cB+\x11#\xef\xc5X\xe3\xde\xbb\xca\
-\x88a8x\xa4\x0c\x1c\x09\x02E5s\x9a\xb5\x16\x15\
-\xaa\xfeq\x97\xae^\xe5\xf2\xd5\x8f0\xd6\xbd\xafa\x14\
-\xf5\x9f\xa5R\x922\x84{`P3\x1c\xf7=\x02/\
-x<\x9e\xfb@\x08A\x14E(\x15\x10\xc71JJ\
-T\xa0\x88\xa3\xb8?;\x5c\x05\x8a<\xcb\xd0\xd6\x12\x04\
-\x01Y\x9a\xa2\xf3\x9c4M\x89\xeb1\x8dz\x93<w\
-\x81\x02Y\x96 \x84DJ\x09\x16\xe2Z\x0cB\xd0i\
-\xb7\x09\xc3\x90Z\xbd\x8e\xb0\x82L\xa7\x84*d\xbd\xb5\
-N\xb7\x93`\xad\x8b43\xe04\x8b\xb2s\x92\xa2\x1f\
-\xea$\x84B\x0a\x81\x90\xa0\x8dF\xe7eXn\x11\xfd\
-$ TA_\xb5\xb1\xd6\xa5J)\x83\x95\xfa\xa1\xe2\
-\xd6\x15+\xe5fGe\x8c\x0b \xb0\x95.]\x08U\
-\x04\xa9U&\x16\x16s@\xc4\xc0\xfe\x22\xba\xad4\xcf\
-\x08[DZQ\xb4EQ\x1fc\xdd\x1d\xdaA\xc1!\
-\x84\xdc\x8c\xd0\xa3H5SI\xb4)\x94rf!6\
-\x8f3\xc6u\x8cUMA\x8e8\xeeIb\xbb\x05\x13\
-\xee\xbb<c\x11\x85_GX[\xc4}\x17\xf7-]\
-4\xa4)\xdb\xdb\x9a2~\x00%U_{\x92\xd2\xbd\
-\xabN\xe8\x14\xe7\x9a2\xaf\xdb\xeex\xc1\xe3\xf1\xdc'\
-a\x14\xf1\xc5/~\x89W^z\x89H\xb99\x0dc\
-\x93\x13\xc4\xb5:\x9d\x8d\x16(A\xad\x11\xd3]oc\
-,dZc\xa5!M\x12\x96\x16\x17\x99\x18\x9fD\x01\
-\x97\xae\x5c\xe3\xd0\xa1C\x9c<u\x94n7\xa1\xd7\xed\
-\xd2\xeb\xf5\xa8\xd5\x9bLM\xd4\xc9\xb5p\x1dc\x18\xb0\
-\xb1\xdebzr\x82\xbf\xfd\xf1\xdf\xf0\x0f?\xfd\x19\x9d\
-^\xca\xec\xeca\xe6\x0e\xcc\x90\xe7\x19\x16\x89\xb4\x1a)\
-\x94\xf3\x97\xe8\x9c\xf5\x8dUVW\xd7\xe9\xa5)\xcf\xbd\
-\xf0Y\x9e{\xf6,\xad\x96\xf3\x11\x8d\x8d\x8dq\xe7\xd6\
-\x0d\xde\xf9\xcdo\xe9t:4\xc7&9~\xf4\x08\xb9\
-1\x04B\x91\x9b\x8c0\x88\xc8z\x09\x81\x0a\xe9$-\
-n\xdc\xba\x896\x96\xe6\xd88'\x8e\x1f\xa5\xd7M\x01\
-K\x18\xc5(\x09\xb7n\xdd`m\xbd\x851\x9aS'\
-\xcf05>A\xb7\xd7A(\x85\xb4\x86\xeb7o\xd2\
-\xeat\xb1\xc6\xf0\xfc\xfc\x8b\x04!\xb4\xda=B\xe5:\
-\xb2\xdc\x18V\x96\x16Yk\xb51y\xee\xca\x98l\xd2\
-\xea\xf6\xb0\xda\x10\x06\x01R\x0an\xdf\xb9\xc9\xeaF\x1b\
-\xa3s\x8e\x1e9\xce\x81\xd9\x19\x84\x10\xb4;\x1d\xac5\
-\xdc\xbeu\x93Z\xbdI\x96\xf6Xk\xb5\x18oN\xf2\
-\x99\xa7\xcf\xb2\xba\xb1F\xaasT\x10\x81\x85\x9b\xd7\xaf\
-26v\x80$i\xb3\xd1\xea\xf2\x80\xca\xd7Cg\xb4\
-^s\x9f\x187L\x99\x1c\x9fa\xfe\x993,--\
-\x81\x0c\x11\xc2i4:\xeb\x11D\x0d\x8c\xce\x88ku\
-\x8c\xd6d\xb9FH\xc1\xf2\xd2]\xb2<\xa3Qk\xb2\
-\xb8\xb4D\xa9\xe0\x97\xea\xab-\xa2\xda\xac\xa1o\xae\xdb\
-\x0e/x<\x9e\xfbB ,\xe4I\xca\xca\xd2]\xf2\
-,ss-44\xc6'90;KTSt\xba\
-mB\x15\x92'\x19\xd7n\xdc\xa01\xde\xe0\xd0\xa1\x03\
-\x98\xc9\x097\xa24\x90e\x9an\x9a!\xa5\x22\x90\x92\
-\xb1\xf1&q\x5c\xa3\xdd\xee\xb0\xb4\x9c399\x01B\
-\x92\xa69q\x18 \x04\xd4j\x01R\xb9\x0eI\xa9\x80\
-0\x8c\x18\x1f\x9f$\x0aBz\x9d\x0eJ\x05\x04qH\
-\xa8$\xe6\xa3\x9c\xb5\xf5\xf5\xc2\x86\x1f1>1\xc6\x81\
-\xb9Y\xa4\x05\x19\x054\xeb\x8a\x0b\x17.\xd0\xeet\xb1\
-\x16\xc2\xb8\xce\x98\x8a\xb0F\xd3hF\x18\x19B\x96 \
-E\xc8\xeaz\xc0\xcd\xdb\xb7\xb16\xa3\x1e\xd7i\xd4'\
-\x98\x99\x0a\x90J\xba\x11\xb4\x84N{\x8d\xf5\x8dV1\
-\x12\x0e\x89\x82\x1a\xd1DHP\x8f\x08\x10,\xaf.\xd3\
-\xeev\xb1\x85\xfdhlb\x82Z\xbd\xe9\xb4\xc40$\
-\x92\x8a\xac\xdbfc}\x03-$Fg\xe4\xc6r`\
-n\x8eX:S\x8f\xb5\x96\x8d\x8d5V\xd7]\x02W\
-\x19\x84Da\x88\xb0\xd0\x98\x9d\xc1\x18\xcb\xad\x1b7\xa9\
-\xd5\x9a\xce\xcf\xd5j!\x84d\xa3\xd3af\xf6\x10\x93\
-S\x93\x98\xbcG'I\xb8{\xe7\x06\xf5Z\x9dL'\
-\x03\xfe\xacO6\x82\xf6F\x9b\xf1\xc6\x18\xd3\x07\x8f\xa2\
-\xb3.\xed$\xa1\xbb\xbe\x8a\x8c\x1a\xd4\xa2\x18H\x11\xc4\
-\xce\x1c*2t\x96\xb1\xbc\xd6\xa2Y\xab\xb1hs \
-\xec\xfb\xf8Ju\xd4:]i\x0fW\xf7x<[\xd8\
--\xb8`b\xee\x18s3\x13\x84A\xe8L\x10\x85C\
-\xdc\x18\x83P\xca\x99\xca\x8c3\xe9\x04AH\x96\xa5\xa4\
-\xbd\x14+\x9d\xd9-\x0e#\xa4\x90hcH\xb3\x14c\
-,Q\x18:G\xafq\xeb\x9b\x18mH\xf2\x94H\x06\
-\xa8\xa8\xe8\xdcs\x17\xb8\xd0no\xd0\xe9\xf6\xb0\xd6\xf4\
-'\x19\xda\xd2\xe1\x5c\x9a\xdb\x8a^T\x1b\xed\xccU&\
-'\x08\x5c9JH\x84PE\xc7\xa1\xe9\xa5\x19\xd6\x80\
-\x08\x04J)gn\xb1\x06)\xdc\x88[ \x5c\xe0\x84\
-\x85\xdc\xe6`-RH\xe7\xf8Vn\xe8\xeb\xb2&(\
-\xb4\xce\xd0\xc6%\x99\x0cD\x80(&8\x0a)@H\
-t\x9e\x16\x93!]\x19J(\x10\x85\x99P\xbai\xa7\
-:7\xc5\xaa\x9c\x16E1c^\x0a\x820@\x18\xd0\
-&'7\xa6\x1f\x10\xa1\x8a\xfd\xa5\xb7G\x08A\x9e\xeb\
-\x8a\x09\xd0\xfdT\x08\x84R\x8c\x8f\x8f\x91\xa4=\xb2T\
-\x93\xeb\xcc\xf9\xe7\xb0\xfd\xf3?\xb1\x18'(\x84\x92(\
-\x04HI\xa3\xd1 M\xd3\x22\xcb\xb5A[\xedLi\
-8\xff\x92\xc5\xb8\xff\x1b\xa7\x8d\xca\xb2U\xa5DQ\xfa\
-y\x1c2\x90\x8c5\xc7.OLL\xfe\xab\xbf}\xf3\
-\xaf}p\x81\xc7\xf3\xb01\xc6\x90\xf4zE\xda\xaa2\
-\xb7\x973\x8c\xac\xb7,\x12\xe9:\xd22\xea\xab\x12\x99\
-\xd4\x02\x17\x84\x80-R^\x09\xda]\xbb\xd9E\xb6q\
-\xbe\x13a\xe9\xd0\x8fZ\xc5J\x810e\xa8Y9\x7f\
-\xc2\x90\xe5\x9b>\x94*\x96\x22\x8dI\xd4\xc0\x9c\xf92\
-\xf9\xf4A\x9c!_\x16k\xb8\x14EIP\x97\x7f\x09\
-\x8b\xefctN?\xdb\xf0P\x99\x16\x90E \x04\x80\
-\xb6\x06\x91S9\xcaM,TB\x00\xc2\x8d\x7f\x8b\xdc\
-\x95\xa2\xbf^\xb4\xacD\xe8\xb92\xfa\xfe\x1b]\xdc\x87\
-\x10\xee:\x95\xeb\x1ac1I\x0e}qR\x09\xb0\xc0\
-\xf9.\xfa\xf7\x8c\xed\x07,TKq\xe5h\xd6\xd6\xd7\
-\x0a'\xb8,\x02;J\x93\xd6'|,\xae\xa0x\x19\
-\x8b@\x11hw6\x0a\x1f\x8f\xfbg\x91\x18\xcd\x08\xdd\
-E\xa0\x84\xc2b\x90\x80\xb2\x85/\xa8xk\x0d\x16\xa9\
-K\x7f\x9fO\x99\xe3\xf1<\x12\x02\x15\x107\x02Ln\
-\x90A\xc8\xe4\xe4\x04BZ\xb4\xb6\x04*\xa0\xd3n\xd3\
-\xea\xb4\x09\xc2\x10k4I/\x19\x14\x0e\xd6\x0et\x8a\
-}\xa7y\xb9IT\xb6\x89rS\xa9\xcel\x1d\x99\x8f\
-\xea2\xfb\x81\x06\xba\x87\xba\xfe\x0e\xcd\xf6\xac3IQ\
-H\x9b\xcaYBt\x10\xd3S\x95`\x01\xcf'\x96\xe1\
-\xd1\xc4\xbd\xca[!\x90\x06\x96\x96\x16\xe9\x8f\x1a(\xe4\
-\x97\xb6\xbb\xc9\x1d/x<\x9e\xfb\xc1Z\xcb\xf8\xc4\x14\
-/\xbe\xf0<A`\xa9\xd5\xeaLN\x8cq\xe5\xeaU\
-\xac1\x84Q\x0c\x08\x92\xa4G\xa3\xd1$O\x13~\xfd\
-\xcb_\xb3\xdan\xbb\xc8\xb5\xfdF[\xc2l\x838\x95\
-\x04V\x8dNmb]$\xd8`\x10\xf5^\x19\xee\xc9\
-v;\xe6q\xe0\x85\xe9\xe8g\xb0\xd7`\xf4\xcd\xe3\x85\
-\x00\xa9\xa4\xd32\xdd\x8cV\xa7\xd9\xfa\xa86\x8f\xe7\xd1\
-\xa2\xad!\xae\xd79y\xea\x10:\xcb\xc9\x93\x840\x0c\
-\xe9v;l,\xaf0>9\xc1SgN#E\x80\
-\xc92n\xdf\xbe\xcd\xea\x87\x17\x1fSm]\xd4\x91\x00\
-0;u1[\xf4\xae\xfb\xe0q\x0b\x98\xedxR\xeb\
-\xf5\xb8\xb9gu\x07\xe8\x1bz\x07|<\xb6\xba^\xd0\
-\x0ex\xc1\xe3\xf1\xdc\x17\x82,I\xb8z\xe5\x0a\x9d\x8d\
-\x15\x84\x80 \x88Hz\x1aK\xc8\xdc\x81\x09\xda\xad\x16\
-W/_%IS\xd2nB\x9a\xe5\x04A\xb89S\
-\xfcqRd\x10\xee;\xfe\x8b\x0c\x07\x03\x93F\xe5\x88\
-@\xde\xa1L\xd4\x9eO3v3\x9c\xba4\xb7\xf5\x83\
-4\xbc\x8f\xc7\xe3y\xe8\x08!\xe8u{\x5c\xf8\xe0\x03\
-.J[\x84\x9cV|&\xa2\x9c\xacX\xc6J\x19\x10\
-{\xcf\xde\xfb(\x90}\xf7\x90\x9bss\xe8\xe0,\xab\
-\xab-\x1a\x8d\x1aI\xd2E\x06!I'A*\xe7\xfc\
-o\xb7;\xa4\x99F\x0agN\x11JQ\x8fk\xfd\xb5\
-j\x8c\xb6\x88\x00l\x0e\x22\xe8O\x1f}|7\xe8y\
-\x04\xd8\xad\x16\xca\x81\x98s\xe3\xf2\xc6Q\xb8\x8a\xec\xde\
-\x02\xaa\xbd\xe0\xf1x\xee\x0b\x0bV\xa3\xfb_\xdc`\x14\
-P\x191TN\x0a/\x967\xd9\x8c\x0bx\x8c\x02H\
-\xe7\x96#\xc7\xe6x\xf9\xc5y.]\xb9\xce\xcc\xf44\
-\x8b\x8b\x8bt\xd2\x9c\xb9iI\xa3\xd9\x00,\xf5Z\x93\
-n\xa7K\x10\x06\xd4\xe2\x88\xf6z\x97\xccf\xa8 $\
-\x0a\x14\xdd$er|\x82\xf5\xce:S\xcd\x09\xde[\
-\xf8\x80\xbb\xabK\xfd\x99\xee\x9e\x8f9\xd6\x92t{X\
- \x8e\x222\x93a\xb2\x9c0j\x10D\xb2\xb4\xb2\xb1\
-\x19]i\xc1\xaa=\x05\xa6x\xc1\xe3\xf1\xdc/\xa3L\
-Q\x05\xfd43b\x84\xd7\xe4qD\xed\x962\xd1\x82\
-\x0a\x15O\x9d<I\x10\x8eq\xe2\xc4q\x04\x92\xd5\x95\
-U\x16\xaf\xdf\xe4s/}\x8ez\xac\x08\x83\xc8\xe5b\
-\x9b\x9eay\xf9.Yn\x98\x9d\x9d$\x88#:\x9d\
-\x16\xcbk]\xce\x9e<\xc5\x95\x1b\xd7\x99\x9a\x9c\xa6\xd9\
-l07\xdd\xe0\xee\xf2\x92\x93\xb6^\xf4|\xec1\x80\
-\xc93\x1accn\x0e\x15\x11\xed4C[M@\x91\
-\xd7\xcf:\x13m9\xe8\xb2X\xf62\x83\xd4\x0b\x1e\x8f\
-\xe7\xbe\xf98EI\x95\xae`K\x14\xc5\xdc\xb8y\x9d\
-\x0f?\xfc\x80\xb9\x03\xd3\x84R\xb1\xbc\xb2L\xb7\xd3\xe1\
-\xd6\x9d[H\x93a\x8c\xe0\xd8\x91Cll\xb4YY\
-]\xa31>\x8e\x94\x96\xf5;w\x89\xa2\x1a\xe3\xb5\x1a\
-\x17.^dim\x8d^\xb7\x878p\x8047\xb8\
-uGw\x89\xa5\xf5|l(\xb5u\xa3-q\xa0\xb6\
-&s\xb5`D!i\xca\xa86\x1f\x5c\xe0\xf1x\xaa\
-\x08!\xc8\xd2\x1e\x1f]\xb9\x86\x16\x86\xa5\xa5e\x8a\x9c\
-\x0b\x80\xe5\xca\xe5+\x94\x11\xb17n\xder\xf9\xbb\x8c\
-A\xde\xba\xbd\x99X\x12\x89\x92\x90\x19\x8d\xc0r{\xf1\
-\x0e\x17/]&\xd7Y\xd1\xaeU3\x1c\x00\x00 \x00\
-IDAT\x09ym\xe7\x13\x81p\x19#\xba\x9d\x0e\
-\xb5Z\x9dv\xda\xc3\xe8\x9c0\xaa\xf5\x0f)\x97\xd8\xd8\
-\x1c\xd6\x14\x09fw\xc1\x0b\x1e\x8f\xe7\x01\x91B\x14#\
-}(\xf3\x1e\xcb\xa23\x7f\x12W\xd2t1G\x1ak\
-\x05y_;)\x1dQ\xbao)\xd1\xf9\xa6\xe6b\xac\
-\x19Pd6w\x09\xb0\x06m6\xcb\xf1b\xe7\x93\x81\
-\x04\xe2f\x1dQD2*\x11\x22\xc77\x97E\xb0E\
-f6\x81\xd8\xf4[\x16y\xdbv\xd3y\xbd\xe0\xf1x\
-\xee\x13\x81$\x08\x22\xe2(t\x13F\x85\xcbo\xe6\x5c\
-8\x824OI\xbam\xf2<\x7fr\x94\x80\xbe\xe3\xbf\
-LH#6w\x14\x7f\x8b\xca\xb1{\xab\xf7\x0e\x07=\
-\x0cw\xcf\xbd\xcco|\xf2\xe4\xfc\xc7\x83\x91m+\x5c\
-\xea\xa3B\xae\x08\x01}C[9\xa0\xb2U\xad\xc7\x22\
-\xac\xa2\x88\xe1\xdc\x11/x<\x9e\xfb\xc4Z\x8d\xc0\x80\
-1\xe4YVh\x0c\xce\xd4d\xad&\xcbR\xb4\xce\x5c\
-\xca\xea'!\xedqQ\xb7<3\x18\x9d\x15\xeb\x15\x03\
-\xca\xad*:`\xbf\x17.\x09\xa4\xd5\xa5\xcd\xfe\xfez\
-t\x11T\xca\xe8'\x9cct\xa2\x83\xed\x9aH9q\
-h\xb3\xe2\xe0\x1d\x9aR\x04Or\xbe5Q\x99$\xb5\
-S{\xba\x836\xdd%\x0f7X\xa3\x92\xe5\xcf\xb5\xab\
-\x00\xab7W\x93u\x811\xa3\xafg\x8b\x12D\xb1|\
-\x93-\xcb(\xeaj\xac\xcb\x98\xe3S\xe6x<\x8f\x02\
-\x19@s\x86\x14\xc8\x10\xc5G\x08\xe5b.B(L\
-\x18A\xd4\xbc\x0f\x0d\xe2\xe1c-\xa0\x02\xac\x10t\xda\
-\xebh\xa1\x08\xeaM\xa4R$\xeb+\x84X\xc20t\
-K`k7/#\x0c#\xb2,\xc7\x9a\x14\x84B\x82\
-[\xca\xc0\x96\xbd\x8a\xa4\xcc\x00\xba\xa5\x1b\x15.\xb8-\
-\xaa\xd5\xc9\xb2\x14\xabsP\x0a\xb4@H\xdb\xcf\x84l\
-q\x0b\xb1\xb9\x84\xa5.\x1f\xb5[6\xbb\xf0\x18X\x08\
-\xe3\x180\xe8\xd4\xad\x0b\x83\xa5XN\xbb\xb8\xb7\xb2\x93\
-\x16\x82Z\xbd\xd1_.\xe2\x89\xc3\x1a\xd7+\xcb\xcd$\
-\xab\x03B\xa8\xdf\xd9[\xba\xad.\xd8\x1c\xa9\xdc\xf2\x17\
-nER\x8aUEe\x11\x9eo\x9c\xa0\x10\x0a[<\
-\x93Bd\xedV\x11\xa4t\x8b\x03\xe6\xdaP\x1b\xab\x91\
-$=\xb0\x82\xe6XL\x96\x1a\xd2$E\x06\xa05\xee\
-\xd9\x15Iim\xb1\xc6y\xad\xdeD\x05\xa2\x98\xc6S\
-\xd1o\x0a\xff\x8e\xf6\x13H=\x9e\x87\x8f=x\x1a\xfd\
-_}\xbb\xba\x85\xcd\xec\xben\x04(\x85\x1b\x0fj\x97\
-\xc6\xaa\x9fP\xda\xe2\xfa\x1e\x85u\x0b\x85\xee\x87}H\
-*\xf4\x8d\xf7\xb1o\xff\x00\xd6\xeeb\x8f\xbf@v\xfa\
-\x15\x82x\x1c\xf3\xf6\xbf\xc1,_C\x05\x8a\x89\xb1q\
-r\x9d\xd3j\xb5\x00\x83\xb59\x08I\xa3\x16\xb9\xa5\x0e\
-,(\x19c\xac\xc6X\x8d\x10q\xff\xbe\x0cnES\
-\x0b\x08cI\xd2N\xa1\xe8X\x10\x92\xc3\x07\x0e\xb2\xb1\
-\xb6\xc1\xf8x\x03\x15\x06d\xb9!\xcb3L\x96\x12E\
-q!\xd4\x5c\x16\x05+$Z\xe7\xac.\xaf`\x11\x18\
-m\x89\xc2\x80\x83s\x07\xc8\xb5&\xcf\x0dB\x0aV\xd6\
-VQB\xa1\x02\xc1\xc6F\xeb\x91h\x08\x0f\x03!\x04\
-y\x9a\xd2\xebu\x89\xe3:\x93\x93\x13\x18\x04\xcdz\xad\
-X\xb6\xc2M\xbe\x5cim\x80u\xe3\x9a\xf1\xc68I\
-\x92s\xe4\xc8!\xf2\xbcH\xf1m\x0dI\x9a\x10\xc7\x11\
-Q\x14\xd2Ir\x1aQ@\xae\x0dFk\x16\x17\xef\xd0\
-\xcd\xd2\x1d\x15*\x01\x1c\x98=@=\xaes\xf5\xc6\x0d\
-\xf7\xec\xacE\xda\x9czm\x06m\xda\x8cGu\x1aq\
-\x0d\x19\x04\xa4Z\x93v\x13zi\x97(\x0aY]\xdf\
-p\xefl\x99L\xb6\x9f/\xc7b\x94u\xe3\x92]l\
-m^\xf0x<\xf7C\x10c\xe7N\x03\xf4;W\x0b\
-\x84\x12^\x9c\x84#\xb1e%\xb1\x84\x01DR`\xad\
-\xc5\x18\xe1\x16\x05\x10\xd0\xc9\x05\x17\xda\xb0\x94\xec\x8f\x15\
-\xce\xaa\x90\xa0\xbb\x81U\x01\xc2Z\xd2\x0cL\x0aV\x0a\
-\x94\xb1\x04X\x8c\xd1\xa4y\x8a\xce\xf5@\x86\x85(T\
-\xa4\xa9Fk\x83\x14\x96<\xd0Xm\xb1V\xa3\xa4\xc1\
-\xad\x98\x03`\x06<F\xa6:\x10\xd6\x9a\xe5\xe5e\xf2\
-<\xc3\xd8\x9c(\x08\xc9\x0b\xd3N\x96%\xa4i\xee\x96\
-R\xb6\x02\xa9\x9c\xf0\xd2\xb9\xd3\x8a\x5c\x86mHS\xcd\
-\xca\xda:\xd6\x80\x12\x16\x8dDg\x1aM\x86\xc8\x9e\xb0\
-eC\x87\x10\xc5dbYh\xc4F[T \xd1y\
-\x8e\xd5N;\xc8K\xb1)\xc0\xe4\x96n\xaf\x07\xd6\xd2\
-\xdah;\xe1`\xdc\x22\x15\xbd^\x97N\x1a\x12\xab\x80\
-LkL\x18\xa3M\x86E\x10\x04!J\x1b\xf2<c\
-[\xe1+ MS\x94tK~\x97\xc7ich\xb7\
-7\xe8\xf5z\xa4\x04d\xbd\x0c\x19\xba\xd5I\xd3$!\
-\xd3\xd9\xc0\xca\xa2NY\xb3}+\xaa\x05\x94\xe9\xef\xd9\
-\x11/x<\x9e\xfb\xc1\xa5\xe7-\xfe(R\xe3XA\
-\xa8\x0c5\x9b\x10\xe6\x1aL\x80\xd5\xd0T\x1ai)\xd6\
-B\x01\xac \x12\x92\x86\x0cX*\x16\x91{\xd4X\xa9\
-\xdc\x1a7\x16\x82\xb8N\xfd\xee\x87\x98\x95\xcb $*\
-O\x08\xa3\x08!\x04\xddN\x82\x90\x16\x19\x04n\xa1\xaf\
-Pata\xd2)\x16\xd11\xb9q\xb9\xdd\x84t\xf6\
-\xfc\xbeY\xc5\xf6#\x9c\x9ce/@JP\x81\xc2 \
-\xc8\xb5\xeb\xe4\x924\xa3\x97\x96\xab}J\xb7\xb8\x9cI\
-]\xb3B\x11\x8e+\x8a4=\x01\x81\x94`$y\xa0\
-)\x17\xe5s\x8b\x93\xc9\xfeL]\x8b%\x08B\x1eG\
-\xe2\xef\xbd`\xb0\xc88\xa4\x1e\x05\x80\xa0\x97\xa5\x90\xdb\
-\x01A\xdd\xb7\xb8\x01AXf\x10\x17\xac\xae\xad!\xa4\
-\xe8\xaf\x9dd\xacEt\x0d\x89\xe8\x81\x85n\xa7\xbb\xe9\
-\xf5\xb7\xa0\x94B*\xc5N\xb4\xba=:\xbd\x84 \x8c\
-@\x08\x82 \xc0\x08A/\xc9\x10H,\x86D[\xd0\
-\x19e\xad\x9cI\xcf\x12Da\x7f\x1d$\xb3\x99\xac\x0d\
-\xca\xb5y\xac\x01\xbf\xf4\xb5\xc7\xf3\x08\xd0\x19\xac\xdf\xed\
-\xff)p\xa6\xb3\x04\xcb?\xad\x9a\xbe\x03\xd7\x22(\x17\
-\x1a\xa0H\x9bSN\x941V\xb2?\xfd\xa4@\xc8\x00\
-\xd1Y\x05k\xa85\x1a\xd4\x06\xf6\x97!\xb2e\x9c\x9b\
-\xc5\x165\x93R\x22B\xb8\xdf\xe0\x02\x8b$\x0c%\x22\
-\xdcti\xdfkY\x16 \x88\x88\xf7\x10\xe4`\x11\xf4\
-\x9d?O\x1c\x9b\x81\x0f\xa6T\x11F\x1c\x01\x10\xc5\xd1\
-\xbeD\xe8)\xdc;\x19F\x11b\x8f\x17\xb4\x08\x97\x5c\
-\xd6\xd8\xc2\x8cJ\xa1\xf9X0\xa6?\xa5`'\xbc\xe0\
-\xf1x\xee\x03q\xe72\xc1\xff\xf1\xdfo\xddn\x8bT\
-#\xc6\x8d\xfe\xa4\x14\x18m\xdcJ\x9dB\x16vq\x8d\
-\x15\xa0\xa4$\x94\xfb\xd3I\x1a\x0a\x9fRh\x10r\xd4\
-g?*\xd4L<\xe0\xac\x9cr=\xd6R\xe8\xdc\x9f\
-\x98\x15[~\xd9\xc3\xb1O8\xbb\xd7S\xec\xdb\xcd\x0c\
-\x86\xd5\xef\x8e\x14\x96\xac\x9b\x12\x04Aac\xb3}\x8d\
-\xcd\xaaR^\xfa\xe0\x02\x8f\xe7\xe1\x93'p\xf7\xea\xc0\
-&k4\xcd\x89I^~\xf9s\x1c;4\xc3\x8d\xeb\
-w\xb0B2>9\x811\x06k,\xdaZ\xac\xd1\x98\
-,\xe3\xf2\xe5\x8b\x5c\xb9v\x83\xfd\xe8a\x84\xb5\x10E\
-\xd8\xe9i\xec\xb6f\x18[\xf9\xff\xe0o\xf7\x8f\xdd\xe6\
-w\xcf\xc7\x16\x0b\x1b\xed\x0d&\xc7\xc6\x0b\x8d\xa7j0\
-\xb4\xec%\x05\xbb\x17<\x1e\xcf\xfd2\xbc\xda\xa2\x10d\
-y\xc6\xf2\xca2\x07f&\xb1\xca\xb2\xb6\xb6NX\x8f\
-Q\xc5\xa0_\xaa\x80<\x03\x85!\x0a\x03\xa4`O\xa6\
-\x89\x07\xc6\x0ek4\x8e4\xcd0\xb9\xdeZ\x83\xa1\x04\
-\xa8Bl\x9a\xca\xaa\xfd\x8a\x9b_\xe8\x8e\xb4\x85\xc9e\
-Sy*\xf4\x1d1$~\x8a\xe1qYN\xc5\xcaG\
-\xa8BD G\xd4T\xf4\xfd\x0a\x0fBu\xfe\xca\x83\
-\x95c\xfb\x13'\x87\x11\xe2A5\xc5\x87\xcbNu\xbd\
-o\x8c\xa1\xaf\xd5\xf4\xcd\x86.\x8f\x81O\x12\xea\xf1\xec\
-#B\x0a\x92^\x8f\xdf\xbc\xf3\x1b\xde{o\x01\x09.\
-k\x01.\x92m\xf8\xdb\x97B`\x1ec\xff$\x85\xe0\
-Kg\x9f\xe1\xe0\xe4\x01,\x824\xd1\x08+Q(2\
-c\xc8\x8d&3=\x92t\x03\x8b\x22\x90\x12)B\xe2\
-\xa0\x81\x12\x81\x8b\xd4\xd3\x90\xe5\x99\x8b\x8eR\x8a5\xd6\
-\xd1\x16\x12\xabQ\x04\xa4yN`#\x22\x19c\x84\xa6\
-'\xdah4\xa1R\xc4A\x8d\xc8F\xc4\xa2Q\xac\x15\
-\x14r}\xed\x0aw\xd6o`\xc4\xa6\xe3] \xc8\xd2\
-\x84\x8d\xf5\xb5\x07\x5cDO\x12\x05\x8a@)ziV\
-8\xc6\xef\x07C\x1c\xc64''\x0b\x81<Hku\
-\x95^\x9a\xf0\xa4hx\x13\x13\xd3\x84\xb5xO\x9a\xc8\
-=!\xe8O8-t\x1d\x17D\xe3}<\x1e\xcf\xfe\
-R\x8ev\xf34q\x11@*\xc4\x0a\xc8M\xee\x16\x86\
-\x03\x84\x90\x04Ja*Z\xc4\xbec-A\x14\x11\xdd\
-Xg\xf1\xed\x9b\x84*\xa6\xdbJ\xb0Y@$\x22\xba\
-\xbaM\xdbn\x90\xa7\xabl\x98\x0d\xd2\xdc\xd2\x0c\xeah\
-Q\xe7p\xfd\x10\xe3\xc1\x04\xca\x06H\x22\xa4\xd5h\x93\
-\x91#X\xce\x17i\xeb.\x17\xb3;4\x82&V\x08\
-\x9ar\x86X\xd6Y3\xab\xac\x8ae22$1\xf5\
-\xa8\xcexZcZ\x1d\xe2@x\x84\xa6hp\xf4s\
-Oq[\xdc\x02\x5c\xe8p\xd9\xa6I\xa7\xcd\xe5\x0b\x1f\
-\x90e\xd9\x8e\xb7\xb5\x1bRJ\xc2(\x22\xe9\xf5\x1e\xa8\
-\x9cfs\x9c\xe7>\xf7\xf2\x16\xc1#\x84\xe0\xa3\x8f>\
-b}u\x99'E\xf0<\xf7\xdc\x8b\xc4\xb5\xda#\xd0\
-\xac\x8b\xa4\xa0\xfd\xdf)\x22\x1a}\xae6\x8fg\xdf\xb0\
-\xc6\xd0\x1c\x9b\xe0\xd0\xc1\xc3\x1c;v\x94\xb9\xb9YZ\
-\xab\xebd\xc62>\xd9\xc4\x22\xc8\x8d%\x96\x82\x8f\xae\
-\x5c\xe4\x9dw\xdf#\xc9\xf2\xc7\x97MG\x08\x16\xb3.\
-\xdd\xa4E\x8d\xae\x9b\xfb\x91d\xc4(\x12\xdde\xb9\xbb\
-\xc4\xd4d@\xb3\x1ec\xd6\x04\x1b\xc6`\xb3Un\x88\
-\x9c\x09\xb5J$\x03jLPSuB[G\x9b.\
-\x13V\xd2\x90c\xb4cCKA\xa31E\xdeM\xe9\
-\xe9e\xbaABM(\xc6\xa3\x90\x8d<@[KO\
-\xb5\xb9\xa1\xaf3\x11\xce0.'\x91R1\xcaVc\
-\xad\x0b\xd80\xd5\xc9Ae\xf0Ci\xee\x13\x9bf\xbc\
-\xcd[\x14.\xfa\xaa\xf8\xdb\x18C\x9ew\xfa\xe9\x81D\
-\x11\xc3\xb7[Fe)\xe5\xd0\xb5m1K\x7fD\xc0\
-\x845\x18\xb3\xd9\xf5\xca\x1db\xbc\xdd\xdc\xa5\x87o\x0a\
-\xab\xd6\xf5\xd1\x89\xbf\xa2\xc1\xcb$\x0c\xfd9<^\xe3\
-\xf1x\xf6\x11\x81\xd6\xce\xb4\x86\x81\xf6\xc6:+\xebK\
-\xb4\xda\x09\xdd\xde\x04\x93\x93S \x04w\xd7\xd7X^\
-Y}\xbcU\xc5\x99I:\x93\x11\x8b\xddY\xc6\xba\x1b\
-D\xa6\xcb\xa2l#3\xcd\xd4\x81#\x04\xeb\x19\xddd\
-\x9dZ\x1d\x08b\x94\x88x\xb6!\xe86;\xac\xf7r\
-n\xae\xa4Hq\x9b\x83\xd1!\x0e\xd6\x8e\x90\xca\x04i\
-\xa0N\xcc\x91\xfa!\xeeN\x8f\x11\xab\x88\x0d\xbb\x84\xcd\
-z(\x1b\xd1\xa8\x05\xe4$\x08\x17\xfaGb2R\x91\
-q\x8b\x9b\xd4tD\xac'GWvH:K\x19 \
-L\x84\x15\x91\xcbxP\xf8m\xa4\xa5X\x13\xa6H-\
-c\xdd\x9c\x9f\xe2\x8e\x017_( (2\xd7h\x10\
-n\xe9\x07M5\xb9\xa5q\xc2H8\x7fS\x10H\xb2\
-,\xbb/\x01\x11\x04\x01Z\xeb\xbe\x80)\xb5\xa4 \x08\
-\x06\x84\x921\x06\xad5a\x18\x92\xa6\xe9@\x19a\x18\
-n\xd1\xf6\x82\xc0\x99;u1\x01\xb5,kk\x1d\xcb\
-\x90\xe7{\xae\xfa\xae\x14\xae\x9d\x8a\xb6c\x5c\x0a@\x9f\
-\xab\xcd\xe3\xd9\x1fJ\x1f\xcf\xa5\x8b\x1fp\xf1\xc2\x07P\
-\xfa),\x08)\x11H\xb7R\xa35\xd8~N\xb7\xc7\
-Xaci\x8c7\xd0\xcbm\x0e\x8e\xcd\xa0\xcc\x04k\
-\xad\xbb|pk\x85\xb33S\x9c:\x22\xe9\x5cN\x11\
-q\x8d\x96\x0898~\x84\xd9\xf8:\xad\xee:\xed\xb6\
-A\x079V\x1a\xaev?\xa2czL\x86\x93\x10E\
-tgg \x08\x89\xa3\x808\x01Q\x9bF\x8e\x09\xd6\
-\xb35\x94\xca\xe9\xe5)&\xc9\x90A\x13\xab\x0da\xb3\
-\xc9\x0am\xc2\xf6Ef\xe5\xcb{\xec#%\x88\x18+\
-\x14\xd6\x06N\xec\x88\x0c!A\x1aU\xe45s\xb3\xf1\
-\x87\x03\x86%\x06\x85 0\x12\x81\xc2H\x8d w\xc1\
-\x1fP\x04\x8d(\xe8\x07EhL\x9e?\x90V\x12\x86\
-a_c\xabjn\xbd\xc2\xe4'\xa5tf\xc00$\
-\x8a\xa2\xbe\xa02\xc6\xf4\xaf;\xa8q\xd1\x17:\xe5v\
-!\x04\xc6\x98\x1d5\xac\x87\x8ausy\xca\x97\xd8Z\
-\x83A\xeeI\xbey\xc1\xe3\xf1<L\x84\xec\x9bOr\
-\x9d\xf5\x05\x8b\xc9R\xacpQmA\x19\xce\xfc8\xd7\
-\xea\x11\xc2\xd5\x8f\x80\xc9\x9a\xa5\x16\x8f!eB\xa0\x03\
-\xa8\xc5\xdc\xea\xb6\xa8\x85\x02yp\x8e\xeb+]\xba\x08\
-r\x9b\xb0\xdei2\xb9\x01\x1b\x02\x883\xa6C\xcd\xdd\
-\xa4\xc7zv\x87\xf1\xa0I\x10M\xd1\x9b\x9b@\x1bA\
-\xbar\x17\xd1S\x1c\x1e\xab\xd3\x10!\xcb*\xa4\x13\x0a\
-l\xa60\xabmDm\x9c(>@\x8e\xa1\xddZ\xe5\
-\x8e\x88\xb8\x99\xdc\xdc\xdb\xc0\xdc\x0a\xac\x90X\xab\x90\x22\
-p)e\xc8\xb1\xb8D\xa2N\x80h\xa4\xc0\xad\x89$\
-AX\x975@X\x85\x10\xaa0\xd4i\x84\x91X\xe9\
-\x86\x05\xd6\x1a\xb0\x02Qh:\xe5\xcc\xfc\xfc\x01\xe6[\
-\x19cH\xd3\x14!\x04J\xa9\xbe\xa6RjB\xc3\x02\
-\xc9\x16k\xda\x94\xc2HJ\x89R\x8a\xb9\xb99\xd6\xd7\
-\xd7\xfb\xd9\x1b\xa2(\xeakAU\x014\xe2a\xdfw\
-\xddw\xa6\x8cr,C\xa8\x0b\x93\xa6\xb1\x18?\x8f\xc7\
-\xe3\xd9\x1f\xac14\xc6\x9a\x9c:}\x96\xd3G\x8f\x13\
-\xd7$*\x0c\x88\xe2\x18k\xb4K1#\x15W/|\
-\xc8o\xde\xf9\x15\x1b\xad^?\x0d\xcd\xe3\xa90$\x1b\
-\x96\xf1\x08.\xad/\x93\x9b67:\x19\xa2Vg}\
-}\x8dw\xd74\xa14h$\x9f\x9b\x98b|r\x82\
-n/@k\xcb\x98\xecp\x22\xd0\xc8\xc4b{1\x98\
-\x08Q\x0f\xe9N\x8d\xa1B\xc1z\xb7C\x96\xb5\x10I\
-\xc0\xe1c\x8a\xa0gi\xf7&\x08\xf36-[\xc3\xb2\
-\x0a6E4\x0f\x11\x06`W\xef\x22\x1a\x0d.\xdd\xfd\
-\x88F\xdd\x22v\xc9>`\xa4-\x04\x89r!\x83\xc6\
-\x82\x09\x91B\xa2\x84FX\xed&\xf3\x0a\x8b(\xdc\xea\
-F\x18\xa4\x15(\x11\x13\xa0\x08$X+16\x05\x1b\
-\xa0m\x0f\xb0.EO\x81[\xe4O\x15y\xd4\x1el\
-Iok\xedf\x94c\xa1\xdd\x94\x82H\x08\x81\xd6\xda\
-\xf9\xa4\xacE\x8a\x90$u\x02&\x08\x02\xd24\xe5\xb9\
-\xe7\x9e\xe3\xab_\xfd*\x7f\xf1\x17\x7fA\x9e\xe7\x85\xbf\
-*\x1f(\x7fT\x94\xdd\xa3\xc2RIoD1IY\
-\xefm<\xe5\x05\x8f\xc7\xf3\xb0\x10\x92<\xcdH:-\
-n\xdd\xba\x8e\xb69q\xad\x86\x8a\x22B)\x91B\xa0\
-\x11,\xdd]\x22M\xf3\xc7lg\x03\x84\xa0\x16t\xe8\
-d\x09W\xdb]R\xa9\xd0a\x13\x9d\xb4\x98\xa8)\xa6\
-E\x17ic\x9e9\xf4,\xf3\x13\x93\xb4j1\xbas\
-\x1d\xbb|\x9b\xb935\xee\xac\xe4t\xc2\x03\x9c\xca\x04\
-\x04!\xcd#\xe3|(\x1b\xa4\xdd\x0e\x22m1\x19v\
-\xe9j\xcb%s\x8c\xeb\x13_F\xaf\xbf\xc51\x93r\
-,\x96\xdc\xaa\xc7\xb4\xd2\x1e\xb6\xb3L\xb39\xcd\xc1\xc6\
-\x04\xb2^#\xc0\x90\xdbQ\xa6\xa2QmU\x982\x8d\
-\xc6\x18\x8b\x149\x01\x96\xc0\x18\xb7\xf4\x82\x9bX\x84\x11\
-9\xc2(\x5cZ\xd1\xd0\xad\x5c!\xdc\xac\x13\x8cFc\
-0$\xbc\xf2\xe2s$\x89\xe6\xc3K\x17\xb7\x98\xd5\x94\
-\x15\xe4#j\xb0\x17\xa4\x94}-\xa7\xd4h\x84\x10\xa4\
-i: \x88Ja\x14\xd6\xc7\x09\xc2\x09\xec\xf2U\xac\
-5\x04A@\x9e\xe7\xfc\xeaW\xbf\xe2\xeb_\xff:\x87\
-\x0f\x1f\xe6\xea\xd5\xab#\xb5\x9c\xfd\x14<}\x0dg\xcb\
-\xd2\x18\xdag\xa7\xf6x\x1e\x09\xa3\xf2l\x09H\xb3\x8c\
-\x8b\x17/\x16I,\xa1\xef\xd5-'p\x96\x1d\x83\x10\
-\x8f_\xee\x007\xd7W\xb8u\xb7M/\x18CLM\
-\xa1W\xd7\xa9Eu>\xfb\xec\xd3\x9cV\x97\xb8\xdb\x9b\
-fn\xf64&2D\x8d\x08RK\x1cY\xa6\x8f\x07\
-\xdc\xfa\xe9GLLO1>\xddd\xc9L`\x02\xc5\
-\xa9\x9a\xa5\xbd~\x87\xc4(6f\x8er3x\x86+\
-3\x7fH\xdb$L\xf3\x0b\x82\xa8\xc9ds\x8c\xf1<\
-\xa0\xb7\xbeH\x9e\xb4\xd1A\x0dU\xab\xf3\xbb\xd3\xb3\xbc\
-7^c\xa9u\x8d\xcdq\xf4p\x8d\x1d\xd2nN\x8c\
-\xb4\xc5\x04\x12aAY\x8d\x12\x16)2,e\xc6g\
-\x8b\x95\x1a\x81`ll\x82\xbc\x9b#4\xee\x99H8\
-{\xfa\x14\xa7O\x1fcjn\x9a\xdf\xbe\xfb\x9e3\xe3\
-Y\x97\xb3\x8e\xbe\xff\xe8\xfe\xe7\x0f\x95\xfe\x9a\xd2d\x06\
-\x9b>\x9f2\xe0\xa04\xb3I!\x98\x99\x9b\xa211\
-\xc3\xea\xe2\x15\xac\xd5}\xcd(\xcfs.\x5c\xb8\xc0\xa9\
-S\xa7\xb8s\xe7\x0eJ\xa9\xcd\xd5?+A\x06\xfbF\
-\xe1\xe3\xe9+\xa7\xc6b\x95\xf6\x1a\x8f\xc7\xb3\xdf\x08Q\
-\x86\x97VG\xed;u\xa1\x8f\x97\x1bk\x09\x1b&@\
-\x86!\xe49:Oxun\x9c\xf9\x99\x98\xd9\xdag\
-\x09\xb2\x80\x833\x01\xb7.\xbcK\xbdv\x92C\x07\x1a\
-\x10\x1c\xa0\x89\xe5\xc0\xc1\x03\x04(&f\xa6x\xcf\xcc\
-\xd3\xbbv\x9d/M$\xac\x8d\x1b\x96\xe3\x19~}\xe0\
-_rm\xbc\xc9\xd7\xda?\xe5\xf6x\xc8\xb5\xf1S\x5c\
-\xab\x1d\xa6-\xaeP\x0f\x12\x1a\xe1*\xed<#\xd3\x09\
-\x13c\xe3|\xe3\xec1V\xd6;,\xb5\xf6Z\xfbM\
-a \x00%4\xd2Z\xa4\xd0(a0E\x8f\xa8\x10\
-\x18\xa18y\xea4\xb5\xc6\x14wn,\x91\xb5V\xe9\
-\xa5-\x0e\xcd\xcc\xf1\xe5/\xbd\xc4F\xab\xcd;o\xbf\
-\xc3\x85KW\xc8t\x8e@\xe2\xa6\xd2\xba\x8c\x09\xe9\x03\
-v\x95\xc3\xa1\xe0A\x10\xf4\x03\x01\x84\x10}M%\x8e\
-#\xee\xdc\xba\xc2\x01\x0csG\x8e\xd1k\xb5\xe9v\xd6\
-H\xd2\x04\x80\xbf\xf9\x9b\xbf\xe1\x8f\xff\xf8Ox\xfb\xed\
-\xb7\xe9\xb4\xdbE\xf0\x04}\x13\x9d\xfb\xfd\x81\xaazO\
-\xf45\xc3-\xa1\xd4>;\xb5\xc7\xb3\xef<)\x82e\
-'$\x02\x1b\x87\x08\xa1\xc8\xd3\x1e\xf9\xc6:\xa1\xb4<\
-3\x91\xd2l_b=?N\xdc8\xc8\xd7\x8e\x05\xbc\
-}\xa7\xc1/.\xdd\xe0\xc83\xd3\xd46`V\x1b\xac\
-\xf9\x0c\xef\x8c\x1d\xe5\xbdVH}6\xa0-4\xff\xb0\
-R\xc72I7]\xe1H\xef\xc7d+\xcb\xc4\xb5\x09\
-\xb2\xf8?d\xf5\xc8\x14\xb3\xe9\x0d\xd4\xfaGD\xc18\
-\xf5\xb8\xcej\xeb.\xc6Hz\xd3\x01\x09=\x1a\xadn\
-a\xc0\xd9K\x0bZ\x90\xceo#\xadA\x09\x83\x92\x19\
-\x12\xb7\xf2^\xa4,\xca\x08:\x06\x0eM5\xf9\xcag\
-\x0e\xf2\x8f\xef-\xd2\xac\xc3\xc4\xc1\xd3<u\xe2(\xad\
-\xee2\xd7o/1;s\x90S\xa7\x9f\xe3\xb3\x9f\xf9\
-\x22\xdahZ\xab-\xae\x5c\xf9\x88;\xb7o\xd0N\xba\
-\x08\xee\x7f\xe2\xaa\x10b\xcb|\x1dc\xcc\x96\xf0\xe8R\
-\x08\xe5iBkm\x99SO\x9d!<8M/8\
-J}b\x8cF\xa3\x81\xee\xa5,,\xbc\xc7K_z\
-\x05\xa4`\xa3\xddfeq\x89\xd5\xc5ez\xed\x0eY\
-\x9a\x15&\xc6G\xc7f\x8em\x8at9\x9b\xb9\x0b\x5c\
-\x9c\x81\x9f\xc7\xe3\xf1x\xb6Ac\xa97\x9a\xb4\xd3\x0e\
-&\xc9\x08M\xce\x7f\xfa\xf9#\xbcv0\xe6\x83\xbbK\
-Hu\x89\x5c\x1b\xb2\xdb\x93\x9c\x18\x9fBe\xeb\x5cN\
-fi\x8b\x98tc\x95\x13k5\xcc\xa9c\x5cL$\
-\x87n\xdf\xc1\xda\x19\xa6\x0fMr\xeb\xe6\x1as\xf5\x1e\
-\x1f\x05\x07\xb9=\xf5\x15\xd2z\xccY\xf3>\xa2VC\
-\xd3\x82\xfaQ\x0e\x09\xc1\x11}\x97\x15\xb5J\x22Rn\
-\xa7\x1b\xfc?W.su5\xc3\x8e\xefM\xec\x08\x0c\
-\xc2\x16k\x1d\x09\x8d\xc0\x22\x84EZC,-M\x11\
-p\xd7\x80\xb5\x8a\xa9\xc99j\xf5c\xfc\xc7\xff\xfck\
-LNL\xa0\xb5ayu\x99\xdb7?\xe2\xb9\xe7_\
-\xa2\xa6\x1atZ]\x9e~\xfai\xd0\x06!%yj\
-\xb8u\xfb:?\xff\xd9\xcfy\xfb\xd7o\xf1\xfe\xe2o\
-\xef+eO\xe9\xbf\xa9\xfe\x1dE\x11\xc0\x80\xa9\xcd\xed\
-S\x1c={\x92cgNql\xee\x08\xd3\xcd&:\
-\x8a\x88B\xb7\xd6\x90\x12\x0a\x93dD\xf5\x18!%F\
-iRk\xc8z)\xadn\x9b[w\xee\xf0\xf37\x7f\
-Bgm\xfd\x9e\xeby/\x04\x81r\xf3u\xfas\x9f\
-\xca\x04\xa1\xf8$\xa1\x1e\x8fg{\x04\x90g\x19h\xb7\
-\x86\xca\xbf\xf8\xcc\x1c\xff\xf9+\x87\x89Z\x19\xff\xd4\x9a\
-fiy\x85\x97\xa2%\xce\xb7\x169\xa6\xc68%#\
-\xa6\xb5&\xa0E#6\xac\xc4m\xc4\xdaU&\x1bG\
-\x98\x13\x92V]\xd0\x8c\xda|f\xbcC41\xc9\xbb\
-\xad&\xc7\xb8\xc1W\xc4\x9b\xe4Y\x8d+\xcd\xd7\xe9\xaa\
-\x97x\xaa\x91\xf1\xc5\xe5\x9f\x90\xb5'yG\x06d6\
-%I,?\xb3-\x22\x93\x22h\xee\xa9\xfe\xd2\x94+\
-\x1d\xe5\xc5?\x17Re\x80\xcc\xc0b\x0e\xf5\xf19\xbe\
-\xfc\xc2+<u\xfair\x91399E\x18I\x22\
-%y\xee\xf0\xd3<uf\x8e8j\xd0J:ll\
-\xdc\xe0\xff\xfe\xb7\x7f\xc7\xd1\x03\xa7\x09\xd4\x04O\x1d?\
-\xcd\xcc\xdc\x01\xbe\xfa\xbb_'\xacI.\xfc\xf5\xfb\x98\
-\xfc\xde\x05\xcfp\xf4Y)\x84\xaa\xdb\xe2Z\x8d3/\
-<\xcb\x89\x93\xc7\x99\x9d\x9e\xa1V\xaf\x13\xc9\x98(\x8e\
-\x09\x02E\x80p\x8b\xf3\x09\x81l\x0a\x84\x12Nc5\
-\x16\x1b)D]cg-gO\x9f\xe1\xe2/\xde\x1d\
-\x12<\x0f7l\xdfb\x19\x9f\x9av\xc1\x0d\x15\x81S\
-\xfa\xda\xf6\x82\x17<\x9e\xfd@\xfe\xd5_\xfd\xd5\x941\
-F\x8d\x8d\x8d=\xee\xba\xec\x89\x1f\xff\xf8\xc7\xe3?\xfc\
-\xe1\x0f\xebY\x96\x11\xc7\xf1\x96\xfdc\x13\xe3\x8c\x8fU\
-;\xc8JX\x8f\xa8NX\x14\xe5^\x1ev\x07\xb0-\
-e\xaaz\xbb\x19\xe5d\xac!\x0ak4\x9b\x8d\x22-\
-\x8d\x0b\x15N\x13Cs\x22fR\xa7|\xf9\xc0\x18\xe6\
-N\x97\xb7\x83\xe3\xfc}7f}\xd1rv\xce\x906\
-\x96XV\x19\xd3A\x93g\xa3\x84\xd4\xf6\x88\x9a\x02u\
-8\xe2\x95\xe6\x1a_\x0a\xda\xd4gf\xf8q{\x86\x8b\
-\xb7Z\xfc\xf3\x17fh\xc9.\xbfw\xe5\xaf\xe9\xd8\xc3\
-d\x13\xbf\xc3\xfb<\x8f\xe8h\xce$\x7f\xc7\x1f\xa96\
-\xb3\x9dU.X\xc5dc\x0cm\x13\xe2\xc642\xae\
-\x93\xa9;\xc4{6\xb5\xe9\xe2\x9fq\xf3q\x8a\xad\xc6\
-\x82\x0a\xeb<\xf3\xccK\x1c=|\x96\xa4\xd3e\xe1\xc3\
-_ \x9b\x09K\xc9\x07\x9c8\xfe4ss\x07X\xdb\
-\xb8\xcd\xda\xea\x12I\xaf\xc7\xb5[\x97\xb8t\xe5\x22\x16\
-\x8b\xa1\xc7Z\xbb\xc7\xdf\xfe\xec\xfb\x1c9|\x84#\x07\
-O\xd1V\xdd\x07x\x1c\x83\xcf]\x08A\x96e\x18\xe3\
-\x02P\x0e\x9f:\xc1K/\xbd\xc4\xdc\xa1C4\x9b\x0d\
-j\xb5\x18%\x03\xa2  \x90\x0a\x89@\x05\x01\x22P\
-nR\xb2\x90(\x15\x00vs\x02g]\xa1r\x8d\x15\
-\x02%\x1em\xb7n\x11 \xacKpk\x06\xbd9.\
-=\x91\xd7x<\x8f\x91?\xff\xf3?\x8fO\x9c8\xf1\
-\xfa\xca\xca\xca?;\x7f\xfe\xfc\x89n\xb7\x1b\x0b1\xbc\
-\x96\xc0\x93\x891F}\xedk_;\xd2j\xb5F\xda\
-\xace\x10\x12(U\xd8\xe5+)\xab\xfa\x19{7s\
-+\x83\xc5X\xb3'\xdb\xf7\x83\x22\x84@\x0a\xe9LB\
-\xfd\x8c\x09\x02c\xdc\x1c\x11\xa9\xd4@\xc8mn,\x06\
-\x89\xb0\x86Kq\xc0%\x11\xd0\xca\x14gf\xba\x98\xf1\
-1\x16k\x82z4\xc1\x8aP\x9c\xb7\x16\x84!\x0db\
-BiPs!\xda\xc4\x04@6\x0e\xb5\xe9u^\x10\
-\x86+\xc1A\x1a\xf5\x94\xf0\xe4\x04\xa1i0Uos\
-J\xfc-\xeb\xeb)hXW\x92\xce\xacB\x9a\xc3|\
-\xd9L\xd3\xb5\x1a!\x03\xe2Z\x83\xa8\xf6\x02\x8b\x8bK\
-\xbc\xff\xc1\x85\x1d&D\x96\x14\xa9b\x84\xe9;\xd43\
-c8<{\x88\x17_\xfc\x02\xcf<\xf3\x19\xf2\xbc\xc7\
-\xc4\xd1\x98\x95\xb5\x1a\x1b+\x8bD\xb5YV\x16\xaf\xf3\
-\xde\xc2/HRA\xb3^gnf\x8a\x99\x999\x8e\
-\x1f\x7f\x86\xe5\xd5\x0d\xae\xdfx\x8f\x8d\xf5\x0d\xba:\xe0\
-\xec\xb3/\x90tn\xf3\xce{\xff\x0em\xee/\xa0\xba\
-\x9c\xab\x03\xee\xdd\x88\xe3\x984M\x89\xe3\x98\xcf~\xfe\
-\x15\xce<}\x86\x89\xc9IjAD\x14\x06\x84AH\
-\x10G\x08\xa9\x90\xb2\x98t\xaa\x02T\x91d\x16)\x10\
-J\xa1\x00S.\xc1\xa0$Dn\xdd\xa5@\xed_\xe6\
-\x02C\x99\xaf\xce\xa9<{\xb4\xb4y\xc1\xe3y4\xfc\
-\xe0\x07?\x98\xca\xf3\xfc_\xff\xe4'?\xf9\x17?\xfe\
-\xf1\x8f\x9b\xcb\xcb\xcb\xc1\xbe\x87{>8\x8f\xccK[\
-v\xfe\xfb!\x8c\xf6\xcef6hc4\x13\x93S\x1c\
-=v\xb2\x10\xa4\xa5\x16R\xb8\xfe\xab-c\xcbQp\
-q\xc4Pj0\xd1\xcf\x5c<8\x16\xae\xccuw\xed\
-\x90\x1b\x820\xe0\xa5\xcf>\xcf\xd7~\xe7+\xfc\xf4\xe7\
-o\x91$\xc96u-f\xf7\x0b\x81\x14\x9b1\x84O\
-\x9fz\x96\xd7\xfe\xf0Ox\xee\xf9\xcfr\xe5\xe6\x02i\
-f\x89B0i\x97\xe3'\xce\x90\xa4\x8a\xeb\x1bk\xd4\
-\xe2\x98\xe7\x9e\xff\x22RZ\x8e\x1f\x9a&\x0e\x15\xdaH\
-\xfe\xf1W\x17\x99\x7f\xfe\xdfc\xe5\xf6\xfbhaY]\
-^\xa5\xb5\xb1A\xae\x83\xfbN4\xb15\xb9)4'\
-&\xf8\xd2W\xbf\xc4\x89c'\xa8\x071Q\xa3F\x18\
-\xd5\x88\x02\x85T\x0a%$\x01\x02\x02\x89\x0cC\x14 \
-\x83\x22\xfaMJ\x84\x92(\xed\xb4\x0b!\xa4\xf3\xef+\
-E`a?\x16T\xb7\x14Y\x1d\x0cl\xea<\xa5\x8f\
-g\xf7\xa9\xb6\x03\x82\xc7Z[\xdb\x80\x93\x0f\xbf\x9a\x9e\
-\x87\x89\x80\x95q!\x16\x1fw=v@\xe6y\xfe?\
-\xff\xe8G?\xfa\xcf~\xf8\xc3\x1f\xd6w\x1f\xb9~\xfa\
-\xd8\x0c}}2\xe3\xdf\x94R\x1c<|\x94\xda\xd8\x18\
-\xe8\xca\xac\x9a\xdd\xfa\xb4\xb2w\x1e\xd5I\x97sN\xb6\
-;G@\xaes\xde\xfa\xc5\xdb<\xf7\xec3|\xf1\x95\
-\x97\xf9\x7f\x7f\xfa\xffm+\xfe\x95\xd4\xa8~\x86d\xcb\
-W\xbf\xf4{\xfc\xc1\x1f\xfc1'N\x1f\xe7\xd2\xf5_\
-\xb3\xd1\xbd\xca\xb5+\xd7\x08B\xcb\xf4\xe4A\x8e\x1d<\
-\xceZk\x85\xba:\xc5\x81\x83O\xa1m\x9dVg\x95\
-^\xa7\xcdr\xba\xc6\xb5k\x97\x09\x04\x1c\x99\x9cg\xfe\
-\xe4\xd7\x99\x99\x9c\xe2\xc2\xb5w\xb8\xb3\x14\xf1\xec3\x8a\
-\xabW\xee\x0c\xf8e\xf6J5x\x00\xe0\xe0\xa1\x83|\
-\xf9k_\xe5\xc0\xec\x01\xea\x8d\x06\xf50\x22\x94\x0a\x19\
-H\xc2z\xbdX\xf7\xc8\xc5\x8e)\x01\x22\x08P\xd65\
-\x90\x10\x02\x11Hd\x18\xb8\xc5\xd8$\x80,\x02,\x5c\
-\xe8\xf7~O\x22uC\x0b\xd3\xbf\xd7\xbdH\x9e\x01\xc1\
-\xb3N\xf6\xb2\xcd\xedO\x1fQ\x0d=\x0f\x09\x81\xf8\xdf\
-\x80\xff\xf1q\xd7c;~\xf8\xc3\x1f\xbe\xfc\xf6\xdbo\
-\xff\x97\x7f\xf9\x97\x7fY/\xd3\x80<\xa9\x1d\xec\xe3\xa2\
-\xd1h`\xad\xa5\xdb\xed>qmc\x8cf\xf6\xe0Q\
-\xc6\xa7\xa6A[\xac\x90\xbb\xae\xfe\xb9\xa9\xb99\xdd\xa8\
-\x9f\x1d\xd5\xed-\x96H\x1e8c\xf3\xb7r\xbb\xb5(\
-\xa5\x18\x1b\x9b\xe4\xd7\xef.\xf0\xef\x7f\xedw9t\xf0\
- w\xef.18G\x04\xa4\xd1\x84\xc2e\x9fVR\
-\xf0\x07\xbf\xffG\xfc\xc9?\xfb\x8f\x08k\x8a\x8b\x1f\xbd\
-C\x96\xac\xd0\xd9Xbr\xac\xc5g\x9e\xfb<g\xcf\
-~\x8e\xcf\xbf\xf2\x22\xddn\xce\xe2\xe2\x15~\xf5\x8bw\
-\xf9\xfb\xf3\x1f\xb0x\xed#\xd2\xacE\xa0\x04c\xcd\x90\
-ZS\x12I\xc3\xed\xdb1\xd33g\x99:8\xcf\xdc\
-\x01\xc3\xcd\xab\x7fu\xff\x0d\x0a\xfdo\xe0\xe8\xb1\xa3\xfc\
-\xde\x1f\xfe>s3s4\xe3:a\xbdN(\x15\x81\
-\x10\x84Q\xe4\xdaY8\x9f\x8e\x0c\x142\x0c\x91@`\
-\x07\xcb\xb1R \x8c\xed'2\x15\x08D\xa8\xe8%\x19\
-+k+\x83\xd7~\xa0\x9a\xefD\xf9\x5c7MlN\
-\x04y\x1f\x8f\xe71\xd0\xeb\xf5^;\x7f\xfe\xfc\xe4\xc6\
-\xc6\x06\xf5z\xfd\x91\xac7\xf2q\xc6\x18\xc3\x89\x13'\
-0\xc6\xf0\xee\xbb\xef\xf6\xed\xffO\x02\xce\x07Q\xe3\xe8\
-\x89S\x08\x97/\xb3b`\xdbz\xec\xf6\x05m\xd7\xfd\
-\x94\xa6\xb5\xa1mUEIB\x1c\xc7|\xf0\xfe\x87\x1c\
-;z\x98\xbbw\x97\x5c\x98\xb4\x944\x1a\x0d\xc20$\
-\x16\x8a\xd0\x08\xda\xed6\x9f{\xe1\xb3|\xf1\xcb_\xa1\
->V\xe3\xfc\xaf\xff\x9e\xdb\x8b\x1frhv\x9cNw\
-\x91\x13\x87\x9e&a\x96K\x17\xff\x81KW~\x8a\xe2\
-0\x1b\x9dUV\x96\x97h4jL\xcf5\xb8q}\
-\x85\xc5\xc5E\x1ak\x11Z\x84,\xde\xed\xa1DN\x8f\
-\xf71\xb5\x17\x99\xa8[n]\xbb\xbe\x07\x9f\xd3h\x94\
-R\x04Q\x88\x0a\x14'N\x9ffmy\x83\xf6Z\x9b\
-8\x8c\x08\xa4B\x04\x0a)\x15\x81\x14\x88\x22 D*\
-Y\x98\xd4\x14\x16P\xc2-\xf9\x80u\x99\x02D\x10\xf4\
-\xffF\xb89YBJ\xee\xae\xae\xb0\xb2\xb4\xb2\xb5\x12\
-\x8f\xe8\xf3+\x13r\x982\xb8\xcd%_g7\x95g\
-\xf77\xfe\xc9\x1a\x8c}:\xf9\x98\xf5\xd9\xddn\xf7\xe4\
-\x8d\x1b7\xfa\x93\xe6<\x83\x08!\xb8x\xf1\x22\xc0@\
-\xda\x93'\x01c\x0c\xc7N\x9e\xa6Vk`w\xf0\xc9\
-m[g\xbbST\x93\x1d\xe1'\x19\x12:X0\x96\
-(\xaa\xb1\xde\xda\xe0x|\xb2\xd0\xa0\x5cG499\
-I\x14El\xac\xaf\xb3\xdek\x93\xda\x8c\x9f-\xfc\x8a\
-\xf3\xff\xfa\xb7Xa\xdd2\xdc\xd6\x10(I\xae\x0dA\
-\xf0+d\xa1}i\xeb\xae%\x85\x0b\xb0\xc8\x8d\x06\xeb\
-\xf2\xbci\x93\x83u\x13=\x03u\x97\xdc\xb8(9m\
-~\xeb\x82GL> x\xdcj\xb2{\xeb\x1c\xabk\
-\xeb\xfc\xe3O~Z$\x86\x15[\xcf.\xa2T\x1eD\
-\x03\xb6\xd6n\x99\x98j\x1fA'.(|\x81\x180\
-\xb2\x98H\x8a\x8bv\xdb-Q\x1b;\x09\x9e\x22:G\
-\x1bsO\x1d\xdfN\xb7\xb8\xb5\x98\x07k\x90m\xcf~\
-B\x84\xe5\xc3\xa9\x86(>\x9c'\xe4\xa6\xf6@\x9e\xe7\
-A\x99\x06~k\x07%0y\x8a\xddC\x84\xd0\xb6\xaf\
-\xdd\xbd\xf4\xd3\xdbt\x90{.b\xd3\xa7>\xf8\x08*\
-\x05\xdcK?Q\x0eR{\x9d2/\xcc`\xe1\x8f\xf3\
-)[\x0b3\xb33\x1c\x98\x99%\xefu+\x02dX\
-8\x8c8qT\xc0\xb8\x1d\xda2\xe4\xff\xb1X\x84\x0c\
-\x91\x81\xea_\xa3\x1fp Ag\x06\xa35`\x11\xc2\
-%\xa1^\x5c\xbc\xd3\xcf\xe4\x5c\xb6V\x9ae\xa4C\x99\
-\x05\xb46\x08\x14\x89N\xfb\xe7\x07A\xc8\xc4\xc4\x04B\
-H\xd6\xd7\xd7\xc9\x06\x16[+\x16Q3\x16\x11HL\
-\xb9\xa0\x1fy?XBI\x09\x02\xe2(\xa2\xd6\xa8\x8d\
-~\xee\xd6R\xaf\xd5i\x15)q\xb6\xee\xb6X\xfd\xe8\
-\x06\x1a\xe5\xe2rRJ\xc6\xc6\x9a\xb4\xdbn\xb5\xd5G\
-rE\xcb@\xaa\x1c\x8bqY\x13\xcc=\x06\x17T\x11\
-@b4KIJb\xcc\xc0\x07\xb1\xdb\xc71r\xbf\
-\xd8a\xff\xb0\xf9\xb7<\xae\x92\x9bA\xdcg\xa4\xc6\xde\
-f@\xef~\xa0\x18q\xc8\xe8S\x06\x8f\xdcr\xce\x96\
-\x82v\xbe\xb0\xb0\xd0\x08\x14\xf5\xe0\xfe\xa3j\x1e\x17\xa3\
-LlVg\xd4\xc7\xb6Ye\xd2\xf3\xd8\xc9-\xbc\xfd\
-\xf6?\xed\xeb5?\xfb\xd2+\x88\x22\x04\xb8L\x97c\
-mE\xd8YK\xa3>\xce\xfc\x8b/9\xe1e\xc0\xca\
-MQ]\xfd\x82\xca\x15\x12\xdc\xef\xe5\x1c\xa6b\xa7\x10\
-(\xe9\x8e/\x85\x82.\x83<*eX\xb3\xf5C\x13\
-\xa5\xc1Q\xba\xec\x02Q\x10\xc2\xa8\x05\xd7,\x1c?y\
-\x9aCG\x8fl\xdb\xd9\xf7\xaf5J1\x90\xe5]\xd9\
-~[T\xefp\xd3\x936t\xd1\xe2\xff\xa2\xd0\x9a,\
-\x82(\x0c\xd0yN\x10\xd6w]\xda\xfb~\xd8\xbc?\
-]\xf5\xd8\xb9g\xf4 +\x90f\xc6\xb0\x91%\xac\xe7\
-z\xa0;\xed7\xb7\x18\xf8\xc1\xa8\xbf\xaa[\xfa#\x04\
-Q\xed\x9eGu\xe9\xa3\x8b\x1b\xa1\x9c\x22\x86\x84\xd6(\
-!\xb2\xb3\xc0(CHw>\xa7r\x17\x9b[\x866\
-\x89\x91G\x8d`\xe0-\xdfzW\x82~d<\x16A\
- %\x0d>^\x16\xb7j\xe6\xdd*:\xeb\x01\xa3\x05\
-\xcfN&\xa7~\x1b=\x90#~\xd4\x1b\xf4\xe9\xc6n\
-\xf9Kl\xd9\xba\xb7\x82F\x1b\xd8\xf6b6\xcauJ\
-\xa0\xe2\xcaem\xe5?\x87T\x8aZ\xd0\xc0MY\x11\
-.\xd0\xce\x1a\xc0\x92[\xdd\xef\xe8\xac\xb5\xa8\xca\x87i\
-\xacA\x05\x01\xd6j0\x02c\x8a,\xd6Ja\x8cE\
-)\xf7\x8d\x09\xbd\x99l\x13U\x98\x04\xd5f\xdd\x83\xb2\
-\xccb\xf2\xad+]l\xbdg!\x08\x94\xd3:\x02!\
-\xb0E\x1d\xdc\xb7`\xc8s\x83PN\xac\x94\x91kR\
-:\xd3\x9dt7\x87\xb6N\xcbs#r\x81\xb2\x12c\
-\x9c\xd0\x03\xb0\xdaV\x82=\xca\xe7e\xb0\xd2\x85VK\
-+\xd1Xtn\x09\x83\x1aJJ\x0c\x0f\xb7\xffp\x9a\
-{\xb9<8C\xcf\xce\xf0\x10|<\x12\x85.\xbe\xf7\
-\xa1\x91\xfcH\xc1\xb3\x8d\x80\x18\xae\xb5\xf8\xff\xd9{\xf3\
-\xa0\xcf\xb2\xf3\xbe\xebs\xce\xb9\xdbo}\xf7\xdeg\xe9\
-\x19\x8d4\xa3e$\xcb\xf2\x06\xb6l\x19T\xe5T\x1c\
-9V\x81\x9dT\x04\x06R\x90\xe0%T\x02$\x04'\
-\x81\x10*&\x84\x10\x08$61\xb1M\x19\xcb\xb1\xe3\
-rlb\x87P\xc4+\xd2H\x13I\x96F\x1e\x8dF\
-\xcbl=\xd3\xdd\xef\xbe\xfc\xd6\xbb\x9cs\x1e\xfe8\xf7\
-\xfe\xde\xdf\xbbt\xf7\xdb=\x8bG\xa9<S\xd3\xef\xfd\
-\xdd\xfd\x9e{\xee\xf3}\xf6g\x1e\xbd\x1b\xa9\xe3\x14H\
-8f\xe28i\x17=\xb9~\x06h\xb7\xb8\xbf\x93\xeb\
-N\x01\x93[\x1ew\xf4\x86n}\x8f\xb7\xd1z\xe6\xf7\
-\x9f\xdd\xe3I\x19Fq\x12X\xbfVh\xbe\xd4\xfb<\
-\xdd\xceA\xdb\x1c\xa3T\x18\x8d#LK5\xefS\x1d\
-~t\x8az|\xa5\xc2\x9c\x00\x00 \x00IDAT\
-_5S%\xb5R\x88\x12\xb4\xd2\xa4IJ\x9c\xc6\x88\
-\x13\x8a\x22\xc7\xf9\x90\xd8\xf9F\x07\x91\x1d~\x93\x87\xf6\
-\xfbYq\x81zA\xc1\x1b\xde\xc8kvo\xc7\xc3\x9c\
-\xc5\xd7&{\x99i\x1ea\x9b\x9fu\x9b\x14T\xbd_\
-\x0d\x0e\x0d\xf3i~\xd7\xc77m\x00nK^\x8e2\
-\xae\xc6\x843?Wj-$\x8dC\x9b\x02\x8dPY\
-\x8bG\xb8|\xe9\x12Y\x1a\xa3MJ\xbb\x9d\xd1n\xb5\
-\xd0\xca\x80\xf2\xb4\xd2\x94\x1b\x9b\x1b\x0c\x06#\xd2,\xa5\
-\x15\xb7\xf08\xc6\xe3\x11\xddv;\xf4\xc4\x11aee\
-\x15q\x96\xe1hB\x1c'\xc4i\xcc\xe8\xe0\x00e\x0c\
-\x88b8\x1ca\x94agg\x9d\xbc*\x89Tt:\
-F+\x10\xef\x89\xb4\x0a=xPT\xd6RU\x05\x0b\
-\x0b\x8b\x9c;\xb7\x8cxO\xa7\xdb'\x8e\x0d\xedV\x07\
-o+\xb2,\xc3\xb9\x8ag\x9f\x7f\x81N\xabE\x9c$\
-\xc4&f0\x1c\x90f-p%\x88\xc2\x03\x97\xef\xbf\
-\x9f\x9b/]#m\xb51QDQ\xe5\xd8\xa2 J\
-S\x86\x83\x03.\x5c\xb8B\x9a&hU\xf1{\x9fy\
-\x8a\xb2\x92\xd7\xc5\xcf\x03\x8d\xb0\xa8\x9a\x1fg\x06\xb73\
-\x85\xd3\x1c\x9e\xfa\xd8\xd2\x1c\x80\x1c\x11\xe2\x91[2\xd2\
-[\xaf\xb8\xb5\x19\xfd\x90Q\x9fv\xe6\x93\xc7\xd6\xca:\
-MH\xcein\xc0\xa3\xeb\xe6\x9eK\x0e\xc1\xe7\xd6\xc7\
-\x9d2\x22\xa7> \xc7\xf6\x9e\xdb2w\x9d[=\xd9\
-i\xd7\xff\x9a\xa7\xb3\xccL\x09!\xbcB\xad]\xcf\x06\
-J7\x95`j\x0cj\x00\xa8\xd1ZkI\x12\xcd\x85\
-\x0b\x17x\xcf\xbb\x1f\xe7\xd2\xe5\xcb\x8cGc\x9e\xf9\xe2\
-3|\xf5\xab\xcf\x1fq\xf4\xbe^$\x801\x11Y\x12\
-QYO\x1cG\x01\x10\xeb\xb7,\xe21:B\xc4\xe3\
-\xbd\xc3\x98h\xa6\xed\xe5E\x8e\xb5\xee\x0d{\xefG\x85\
-\xd5\x06\x80T\xf8\xe8\x1aDQR\xff\xd4@#\xe1\xd6\
-\xcc\xec\x98\xb4\xdb\xfc\xbe\x1b\xe9:\xe0\xd5\xbc\xff\xe7\xa8\
-\xb6\x03\xc1\xb4\xa6\xeb*\xc8Z\x87{\x0c\xbe\x12\xcd\xe3\
-\x8f\xbf\x9b\x8b\xe7\xcf3\x9cL0\x06\xca\xa2\xc2\xb9\x02\
-WY\x16\xfbK`=o\x7f\xe7\xbb(G\x05b@\
-\xf0\x8c\xf6wYZX\xa6\xbf\xd4cg{\x97\xc5\xd5\
-%\xc6\x83\x09\x8b\x8b=&\x93\x8a(K\xb0\xce\xa3\xbd\
-\xe1\xe0`\x8b\xd1`\xc8\xb4T\xb4Z1\xeb\x1b7\x99\
-\xe6\xd5\xad\xdfQ]=\x22\x0c\x9d\xa0\x8d\xc6{\xcf\xca\
-\xeay\xbe\xf3\xdf\xf8V&\x13G1\x19\x92f-\xa6\
-\xc3!eU\x90v\xda\x88\xabx\x9b\x8e\xb8z\xffC\
-\xaco\xbfB\x92,P\x16\x07\x8c'\x05\x8f<t\x1f\
-{{\x03t\x14\x93\xb4Z\x5cZY\x22jw\xb1\xd6\
-b\xbdc!m\xb3\xbd\xb7\xcfh\xb2KdZdY\
-J>\xd8\xc5\xe8\xd7\xc7R\x12\xc4\xbc\xa3/[\x98)\
-\xa1w\xa43\x03\xcf\xd1_o\x1c\xf8\x1c\xbf\xce\x9b\x1a\
-|\xe6\xb6sl\xeb\xa9\xe79\x03\xf8|\xad\xd2\xadB\
-\xa8\xef$\x13\x9d\xfa\xf4\x8dc\xac\xd6x\xe6Ag\xe6\
-\xfb\x9b\xd3$V\xcf/\xf3G\xbf\xe7\x8f\xf0\xbe\xf7}\
-=\x0b\x0b\x0bTU\xc5\xbb\xdf\xfd.~\xe9\x97\xfe1\
-O?\xf3\x85\xd7\x9d\xb1\x8b\xf3,\xae\xf48\x7f\xee<\
-\x93\xe9\x84s\xe7\xd6PJ\x13\x19\xc3`0\xc0ya\
-mm\x85\xf1h\x8c\xf5\x8e^\xb7G\x9e\xe7\xf4\xba\x1d\
->\xf7\xd9\xcf\xb3\xbb\xb7\xc7\x1b\xa9\x965A 3\x0c\
-ij\x00\xa1P\xaa\xee\xe4\xd9\x00\x91\x82&\xf1\xa6\xd9\
-6\xabL0\xdbv\x97\xacN\x9a\x0e\x96sL\xac\xd6\
-\xac\xe6\xee\x12\xe7\x1d\xc6\x87k\xf8\xba\xc9\xa5X\xc7o\
-\xfc\xc6o\x92F)y9e\xa61\x89`\xb4F|\
-\xa84\xedQx\x1b\xea\xba9 6\x06\xf1\x0e\xb4\xc6\
-;O\x1c\xc5T\xd6bL\x88\xc4\xd4Zc\x94\xa6\xb2\
-\x0e\x11G\x14G\xf5\xad\x99:\xf0\xe0\xd6\xcf(\x80\xf5\
-\x9e\xd8\x87\xfb\xb6\xd6\xa2#\xc3K/>\xc7/\xfc\xfc\
-\x06U\x9e#x\x9c\xd7\x08\xbe\xf6\xcb\xf8z\xbc\x15O\
-|\xfc\x93T\xce\xa29\xcc\x9f\xfa\xc4\x13\x9f\xac\xbb\xac\
-\xd6>\xaa\x9ayhU\x17\x1d\x15\xb0\xb6\xaa\xcb\xec\xd4\
--\x18\xbc\x0f\xa6\xc64~]\xc0\xe7\xf8S\xcb\x9c\xd0\
-p':s\x02\xc1-\x994\xaf\x1e|\xe6u\x83f\
-\x02\xeb\xd3X\xc3\x9b\x1c|Nj1'\xc1\x87c\xe7\
-\xba\x13\xf8\x08\xb7\x9b\xe2on:\x9e\xb1\xdd\xac\xbb#\
-\xd5\xd2\xe2Qmg~\xdc\xd4<\x0e\x11\xc0\xa8\x1ei\
-\xefy\xdf{\xbf\x81\xc5\xa5%\x9e|\xf2S\xac\xad\xad\
-1\x1c\x0eXYY\xe3\xeb\xbf\xfe=\x5c\xbbv\xed\xf5\
-g\xec\x0aP\x06\xeb,\xadV\x1b\xa3\x0cEU\x90\xa6\
-}\x86\x83!I\x96\x82\x17\x8a\xa2\xa0\x95\xb5\xf0\xd6R\
-\x96\x15Y\x9a\xe1\xbc\xfd\x03I(\x0d\xdab\x90\xd0\x01\
-Di\x14~\x8e\xf7\xab\xd9|\x0f\x9fS\xd3Z\x9a\x1a\
-\x94f\xee\xf7\xfa|\xc7p\xe364\xd3of\x8c\xeb\
-\xf0{:\xbc:h\xa5\xb1Nj\xc0\x13\x8c2\xa8\x18\
-\xc49\xa6v<\x1b\xb7F0i\x98s\x93M\xaf\x8d\
-f\xbe\xa0\x8c\xd2\xa1\xd0\xa61\x11^\x0e\xcd\x82\x0d\x10\
-;\xefj\xed*\x9a\xb3\xfa\xd9\xba\x1e\x9eBN\x03Y\
-\xa9\xfd/\x22X\xe7gJ`d\x22\x140\x1e\x8f\xe6\
-\xdc\x16\xae>d\x86\xe8\xb3\xef#6\xc7Ys\x00\xd2\
-\x86\xf4\xdc\x14\x99\xb5T0M=\xb8\xda_\xa55\x1a\
-={\xb7\xaf\x0b\x09\xf8\xa6\xfcb-l\x0a\xaf\x22\xaa\
-\xed\x16\xd7x]\xc0G\x10\xae\x8fG8B\xc8b\xa2\
-5\xa9\xd6\xa4*\x22\xd2\xcc$\xde\xa8I\xa2RA\x02\
-\x0b\xf3\xaa\xf6\x07\xdc\xf6\x9e\xef\x0d|n\xb1x\xf2\xdc\
-\xf3[N\xdb\xf1\xf6\x1b\xfe\xa5\xd4|\x1a\x8d\xe7DT\
-\xdb\x1d\x02\x08NlUG\xff\xaa#\xcb\xea\xc46e\
-\x14kk+\xec\xee\xec\xf0\xf4\x17\xbe@\xa7\xd3\xa1\xd5\
-j\x11\xc71\xcb\xcb\xcb\xa4Yv\x9b7\xf1\xda\x90\xd6\
-\x9a\xfd\x9d]\xa6\x93\x09\x911\xbc,/\xe3\xbd\xe0}\
-h\x0b\xec\x9c\xe7\xfa\xcdu\xe2(\xc1V\x16c\x14\xce\
-y\x9e\xfd\xe2\x17O\xe4`\xbc\xe1\xd4\xe4\x920'\x10\
-\x1e*@5\xc0\xf8\x13\xdb\x0e\xb5\xa5\x1a\xa2\xe4.F\
-\xb9\xd6P\x0e\xa7\x86\x10\xcaO\x1e\xce\x06Q@\xacg\
-[9v\xf6\xd7\xe3}\xde\x8eY\x9f4\x06\x1e\x1e\xa3\
-\x22\x05\xe8#\xf7\xf9\x07\xf55+8S%\x81{%\
-\xdf\xf0\xd6YH\xbd\xe0E\xee\x98\xc9\xf3*S\xa6_\
-\x1b\xf0\xa9\x9c\xe3\x9f=\xf7%6\x8cG\xeb\x98nl\
-X\x893\x16\xe2\x84,\x8aiiC\xcb\x18\xbaqB\
-\xc7DuL\xbf\xc2\xd4\x8d\x91R\x15\xcdl\xffZ\x85\
->\x15F\xa9P\xc7\x89\x1a\xa7\xea{\xd0\xf3\xd2\xf2\x91\
-\xfbT\x87\xfe\xeb\xfa\xb7\x1c\xbb\xd1\xd3\x5ct\xa7i>\
-\xea\xc81\xc7\xafs\x0b\x08:\x81_\xffr\x80\xcf\xc9\
-\xe0\x82\xdb|\x04J\xcd\xb4\x9d#\xefe\xb6\x5c\xc7\xfa\
-\xcd\xb6+\x1amg\x06H^\xb1\xb1\xb1\xc5\xfb\xde\xf7\
-^\xde\xf1\x8ew\xb0\xb0\xd0e2\xc9A)677\
-)\xf2\xfc\x0d\x19U/\x9e\xc9xL\x9c\xa63I\x5c\
-+\x8dR\x82\x89\x0cJ\x87v\xd3\xb16\x08\x82\xd1\x8e\
-\xf1\xb0|}5\xb1;\xd0I\x93\xdb\xa1\xd6\xa3\x1aA\
-\x0ff_A\xa3y\x84\x17r\xba\xd6s\x16:\x14P\
-\xe62\x87\x1c\xcc\xb3~\xe1\xe8\xef73}-\xdd\xeb\
-\xab!9\xf2\xcf\x1c\x0c\x0bp\x87\x82\xc0w\x0d<\xa7\
-1\xd2\xf9m\xf7\x06>\x8a\xc1\xf66\xfb\xad\x84\xb2\x95\
-\x22\x05|\x99a\x00\x18\x14-\xad\xc9tL'2\xf4\
-\xa2\x94\xc4(Z\xc6\x90\xea\x88\xd4(Z:\x9e\x95\xf6\
-P@\xac4\xa9\xd1\xb4t\x0c\x04/\x806\x90\x10\xd1\
-\x8a\x0c\xa9\xd15\xb3\xd2h\x1d\xc0*R\x8aD\xe9Z\
-\x11\x97\x1a\x84t\x0dd\x1c1\x7f4v\xd70\xe6\xb3\
-\xcc\x83\xd9\xd3\x1c\x07\x9f\xd3F\xef\xe4\xf8p\x8a\xa9\xee\
-k\x17|^m\x99\x1c\x05s9\x0d\xcd\xba\xf9\x01\x9a\
-{\xe1s\x07i\xa5\xf8\xec\xe7>\xc7\xa3\x8f=\xca\xb7\
-|\xf37\xd1\xe9tp\xde\xb1~\xf3&\xbf\xfb\xbb\x1f\
-c8\x1a\xf1FQhc\x5c\xce\xd4\x02m\x22\xb4Q\
-(\xa5)\xa7\x13\xf2\xd1\x08\xef-\x10\xca\x9d\xfcA\x82\
-\xce\x11R\xea\xd0\xe4vT\xf7\x99\x01\x0c\xf5\xd6F`\
-\x93\x13Z\xd2i\xc9\xc3\xb7\x22?\x0f9!\xa2\xee\x88\
-\x06\xf4\xaf\xe8\xcdIR\x87S7\x1aO\xfd\xc7\xbb\xa3\
-\x11\x89\xa7\xd0=\xfaxN\xe8:G\xd7\xdf\x05\xf8@\
-\x90Y\xab\xa2\xc4O\xc7\xa4\x97\xce\xe3\xf4\xd1L\xdb\xdc\
-;\xa6\xde\xb1kA1&R\x9aTi2\x1d\xd1\x89\
-\x0d\x99\x8e\xc9\xa2PF\x5cP8\x09v\xceJ\x04\x87\
-\x0f\xb6^\x82#.\xd6\x9aX\x07x1J\x11+M\
-\xacb\xda\x91\xa1\x1b\xc5\xc4Z\x85\x12\xe4J\x13iM\
-\xa6\x0d-\x13\xd32\x1a\xa5\x82\x09\xb0\x15E\x01\xdc\xb4\
-\x0e\x0c\x83\xe6\xc3{\xf5\x9a\xcfq\xb3\xdb\xd7\x225\x15\
-|\xef\xd6\xd4\x06\xdcB\xdb\xd1'\xb67[\x8eh;\
-(\x94Vlln\xf0\x8b\xff\xe8\x97x\xe9\xdaK\xdc\
-\x7f\xe5>\xc6\x93\x09\x9f\xfe\xccgx\xf6\xd9/SU\
-\xd5,\xfa\xed\xd4\x8b\xdf\x93!\xee\x0e\xcf\xd4|\x94\xde\
-\xe3\x95\xc2\x98\xe0'A\x05\x07\xb9\x12\xb9my\x9a\x93\
-W\x9b\xbf\xdeQp\xbe\xbbcO\xa1\x06D\x1a\x87\xb7\
-\x0a\x01\x06\x87\x05L\x82\xf1&X\x18\x14G\xfc@\xb5\
-).\xfc=;j\x84H\xa8\xc30\xec\xc6\xd4\xf6\xaf\
-j\xfc}\x8d\xd0\x91wt\xb6\xf7ug\xe0\x91\xa3\x8b\
-\xaf\x0f\xf8\x84fG\xc3\xcd\x0dV{=d\xa1w$\
-\x17V\x1d;\xc2\x8b0\x11\xcb\xd8[\xb6\xab \x09'\
-J\x93)M\xdf\xc4t\xe2\x98\x961$Z\xe1\xc5`\
-\x15\x14\xe2\xb0^(\x5c\x85\x93:*\x84\xc6\x0c\xd7\xe4\
-\x8d\x84e\xa3\x82\xaf)V\x0a\xa3\xc2y\x22\xad1J\
-\xd161KqB?N8\xdfj\xb1\x1agt\xa3\
-x\x16I\xf2j5\x1f8\x0a>s\xae\xd67\x0b\xa9\
-\xaf\xfb\xf9k\x7fD\x84oD\xf9O|\xee\x8f?\xf8\
-O\xb9\x8b\x1b\xbc[>\xa2\x8e,\xc9\xd1\x0d'\x10:\
-\xbc\xc7TG\xec^\xdf\xe0\x9f\xfd\xea\xaf\x13\xc7\x09\xce\
-9\x9c\xb5(\xadI\xd1\xb5\xc9Hs\xca\xc8\x13\xde\x89\
-\x10|\x88\x1e\xbc \xaa\x8e8\x22\x94vi\xe6\xc9\xe1\
-\xf1\xfa\xd8\xefC\xa3\xec\xb1\xbbFY\x08m\x9a\x83V\
-\x10\x09\xd8\xda\x0a\xafQ\xb3y\x19\xaeS7q\x9bY\
-\xcc\x15Fi4\x87\xb91\x0d\x908\xb1s\xc7\x1e\x8e\
-Q\xc8[j$RE\xa4\xa2\xb9\xaf\xe9\xe8\xe8\x1eF\
-\x06z\xacq\xc4\xa4\xb5\x93=\xf8\xa1\x8c\xd28\x1f\x12\
-6=\x01\x984\x1a\x11\x8b\xb5\x05\x87\xf9xw;c\
-\xe7#\xa2\xe0D@\xdbl\xb7\xe6iomw9\xb1\
-F\xddr\xcb-\xce}\xfcpu\xc7CO\x9eJ\x02\
-f\xd7\x09\x9dp\xb6\xf1\x98\x8d\xdbqam\xce<\xad\
-\x1a+\xc0]\x04\x0c\xbc\x91rl\xf3\xfe\xeeDg\xd0\
-x\xe4\xf0\xcf\xa9@\xf2\xea\xc1G)\x88\x22MeK\
-\xa6\x1b[\xb4\xbam\xbc\xb9}}!E\xa8\xe4J-\
-q\x95\xce\x91K\xc9\x9e\x9f\x22^H\x80\xb6\x8e\xe8&\
-1\xbd(\xa6e\x12tlpZS\xf8F\x1b\x0a\x13\
-\xbe\x89\xca\xd0\xf5\x87\xdeT\x82\x15\x15\xb2\x8eK\xaf\xb0\
-\x122\xa2K\xe79(\x0b\x8cR<7\x8c8\xd7j\
-\xf1\xd6\xde\x02WZ\x1d\x22e\xeag\xbb\xbd\xe6sl\
-\x94\xbe\x964\x1f\xf3\x9e\x9f}\xee/\x09\xea\xbf\x0e7\
-l\xf8\xba\x9f{\xe1o|\xf6O\x5c\xfdQ\xe6\x02Y\
-\x1a\xdf\x8esn\xd6_\xbe!w\x86\xca\x1d\xf3L\xb0\
-Y\xa1\x90\xd0y\x91\x064\xeak\xcd\xf6?\x1c\xc3\x0b\
-\xa2YN\xfb\xb4\x92V\x90\xa6\x8d\xa2\xa0\xa2r\x1e\xef\
-B(nJ\x82\xd1\x11a&\x05\xc9\xbaT\x0d \x08\
-\x96\x82i9&\xcf\xf7\xb1\xde\x12\xeb\x04IZdJ\
-\x88\xb5\xc6\x98\x10\xad\x06\x9a\x98\x16\x868\x98\xfaj\x89\
-\xdf\x8bF$\xf8H\x90\x106\x8b\xf2\x18\x15\x5c\xf3\xa1\
-\xa2\xbdc\xcb\x1ep\xdd\xed\x91\xa8\x88\x84\x84\x03\x7f@\
-%!i>Q-\x12\x93Q\xb8\x02+%\x89Nh\
-\x99\x05ZQ\x1f\xef-J\x19\x0a7A+\xcdn\xb5\
-\xc1XrB\x1e\xd3!\x04\xc4I+\x04\xe9T\x0eQ\
-\x9a\xc5\xe4\x12\xb1\x8a@\x14F\x14J\x19\x22\x0cZ\x99\
-\x10\xbe\x8bf\xacF\xdch\xdd\xe4bz\x1e7\x1cQ\
-\xe8!\xa9JH\xa5\x0b:f\xc3X**&2\xa6\
-\xa3V@9\xf6\x87\xcfrd\x92s7\x89\xba\xb5\xab\
-~.\x915\xcc\xa1C\x0e\xa0\x95&\xce2\x94\x8a@\
-5\xc9\x22\x82\xf8\xb0\xdf\xa1\x92\x15&X\x03\xc2G\xc1\
-\xbc\xa1\xa6w\xcc\xe1\x0c2\xc6\xa0#\x13\xb4Ojf\
-_g\xe6\xfb\x06\x14\x8f\xdd\xdf\xad\x18T\xa7\xdd!\xcb\
-b\xbc\x83\xc1pp$\x1am\x9e\x8e\x18,\x95\xc6z\
-\x8b\x22$\x9e\x06\xab\xb2\xa2\xa8\x0az\xfd^=W\x85\
-\xf1x\x12x\xaa\xf7gF\x14\xeb^\xa7\xee\xb7\x0d\xca\
-\x1c\xf1\x0f\x9cMP\xbe#\xf0\x1cJ\xdc\xa7 \xc8\xa9\
-wr\x9c\xad\x9e\xb6\xe5\x18\xf8\xa8\x10\x1a\x89\xd6\x0c\xf7\
-\xf7\xe9\x1c,c\x96\x17\x030\xdc\xeeR5\xe84\x93\
-D{B\x1d'\x84\xcay\x0e\xaa\x8a\xdd\xc9\x18\x11G\
-\x8c\xa6o\x22\x16\xd3\x8c^\x96\x92\xc5)\x12\xe9\xa0\x0d\
-\xa1\xf0\xf5\xe3y\x11\x5cc\xb6\x11\xa9[\xcb\x1eZ\x0f\
-\x94\xae\x9b3\xa1\xb0x\xae\xe7c\xf6\xab\x82jq\x95\
-\xb7\xf4\x16@\xd4\x99\xc0\x87\x13\xe3q\xca\xd0\xfa\xd3V\
-\xfe\x81\x91\x06RL\xfc\xc3\xf3+EG\x7f\xe1\x9d?\
-\xf9\xfbO?\xfd\x1f\xbe\xeb\xe79%\x8a\xf2\xd5N\xf8\
-Chn\xa8\x96\x0b\x9bP\xd6\xb9\x98wQ\xa0EX\
-R)Wt\x8f\x85t\x81H' \xc2D\x15L\xf3\
-\x8a\xd2\x07a#\xd3mR\x92\x99/\xc2\xaa\x8a\xa1\x1b\
-!\xda\x13\xa9\x08\xef\x0d\xbb\xe5\x98q\xee)\x95%\xf5\
-\x82\xb7\x9a\xb6\xd2$iBL\x84Q!p`)Z\
-\x22\xd5\x1d\xf0\x01\xc4\x8c\xd1x\x97\xe0E\x82\xe5I\x83\
-\x93*\xccQ\xf1\x882\xa0\x0c\x88\x90\x92\xb2\xe7\x0a\x96\
-M\x97\x08\xc5\xb8\x1cS\x11@%S\x9a\x986\xb8P\
-|1\x96\x94\xaeZ\xa6\xc7\x0a\x8e\x90\xc0\xb8\xe7JZ\
-\xa6\xcf\xb6\xdb\xc26\xe3\xa4@|\xb8\xb06m\x22\x1f\
-\x91\xd8\x02\x17%\xacp\x01\xed\xc3\x88f\x92\x92\xaa\x16\
-\x0aC\xa6S\x94\xd2\x18\x22\xf6\xd9\xe6F\xb4C\x14k\
-\xa6j\xca\xb21,\xaa\x92\xe9\xde\x8b\xb4\xd2\x871\x9d\
-\x15J7\xe4\xc6\xf4\x00\xeb\xa7$\xed\xec\xc8\x1bk\x18\
-\xb3\xe0kp\xbe=5\xe6\xc60_\xea3\xcc10\
-\xb1\x8e\xe5\xcbWx\xd7w\xfd\xbb\xf4\xcf]\x01\xf1\x94\
-\xf9\x88b|@>\x180\x9d\x8c(\x8b\x09>\x1fa\
-\xcb\x09\x95+qU\x85X\x87X\x87\xf7eH6\xf5\
-\x1e+\x16/U\x98/\xde\x07M\xc7Z.>\xfc\x00\
-\x0f\xbc\xfdmHU\x92O\x0b\x8a\xd1\x88b\xbc\xcfp\
-8b2\x1aSN\xa6\x94yIQ\x14T\xb6\x226\
-\x86\xaa\xb0\x87!\xe5\xcd\xb3\x0b\xfc\xe5\xff\xf2/\xf2\xae\
-w>\xc6O\xfe\xef?\xc5\x13\x1f\xfb]VWWo\
-\x19\x22\x1f\x12\x8a\x85\xf1h\x18*o\xa7)\xfd\xfe\x02\
-\xc6h\x86\x83!\x8f\xbf\xfbq>\xf4\xa1\x0f\x91&)\
-\x82\xf0\x9b\xbf\xf1\x9b\xfc\xd6o\xff\x16/<\xff<k\
-kkw\x0c\xbd\xd7Jqsc\x87\xad\xbd\xbd:\x9c\
-\xfc\xf5\xa5\xb3\xdag\xce\x00<\xcd\xbfG?p8\x0a\
-*\x87\xbf\x8f\x81\x8f\x1cJ\xa4\xa7\x81Oc\xe8\x8a\xea\
-\xde\xf0\x95\xb3\x8con\xd2\xeb\xf7\x18G\x8aS9\xef\
-\x11\xd0\xa9\xa5\x1f/\xf5D\xf2\x01\x88\xbc\x07'h\x09\
-\xa5R\xadT\xec\x14\x05\x9b\xc3\x01Z\xa0\xa54\xcb\xad\
-\x16\x8b\x9d6\x9dV\x1b\x15'T\x91\xc2j\x85'\xd8\
-\xe0\x1dB$A\x86\xf4(t\x1d\xc5\xe3Q\xb32N\
-\x91hr\xe7\xf9\xfc\xfe.\xabY\xc6r\x94\xcd\x85\x12\
-\xde\x1a|\x8e\x8f\xf0i\x9a\xcf\xeb \xa3\xbc\x1a2@\
-\x1b\xa5V\x8fo\x88\xba\x8b?\xf1\xf6\xbf\xf5;_x\
-\xe6?\xfd\xf6\xa7\x98+}x\xaa\x8f\xe7\xacW;b\
-oT\x88RG\xfc\xda'\x8dE\xb5\x91L`\x90W\
-\xec\xba1\x13\xe7I\xd3\x14\x8d\x09%N\x22\x85+\x0b\
-\x1c\xe0\xbcPph\x1e*\xc9\x19\xda\x01\x95\xcf\xd1Q\
-\x84\xae\xa6\xd8jL\xd4\x8a\x90$e\x9c\x17\x14\xc5\x18\
-\x1fE\xe8\xc2\x92\x17S<\x9aHE\x8c\xb3\x92~\xd2\
-%&!\xc2`DcT\x82\xc7cHQ\xa2pT\
-\x08\x122\xea\x01\xad3\xc4\x0b\xa9N\xb8\x14-p^\
--0\x921+&\xe3\x157\xa9%{p2\xa1T\
-U]\xcf\xcba]\xc1\xa8\xdc\xc6JHB\xdcv\x1b\
-tM\x8e\xc5\x92\x1aC\x12\xc7\x14\xaeI\xecT\x988\
-\x09I\x90\xc6\x83\xae\xd8,\x9e\x0f\xa0\xa7\x13\xee7W\
-\x03\xa3P\x96JED\x04F\xd5$\x1e\xde\xd0\x15\xef\
-zh\x8d\xabKk,8\xc7\xfe\xee\x0e\xd7e\x8d\x9e\
-\xbd\xc9P\x9dge_3\xa9\xf6H\xda\x9e\xed\xbd\xe6\
-\x9bPa\xa2\x8b\x84\x99p\x06^'~N@\xa9\xa5\
-\xe8\xd9\xdc\xa9\xefEg]\xb2\x95s\xa4+\x17\xc0\x95\
-\xf8aL\xe1\x05]:\x12\xe7\xb0\xce!Q\x05\x95G\
-\x94\xe0u\xd0\x08\xbc\xaapJ\xf0\xa6\xe6\x11\x02\x16\xc1\
-xS\xff\x16\xac\x80\x8a\x0di7\xc3\x17\x11\xa2\x02\x1f\
-\xa2JB\xf1R\x1d\x82\xbb\x9dXJ)\xf1\xce\x07\xa3\
-k\x13J;\x9b\xb2\xc1\x1fvnu\x85\xaf|\xf9\xcb\
-|\xfa_|\x92\xe5\xe5\xe59\xad\xff\xf8\xec\x9f\xe5\xfe\
-\x93e\xa1\xda\xf5B\xbf\xcfw\x7f\xf7\x1f\xe6\xb1\xc7\x1e\
-\xe3\xd3\x9f\xfe4\xdf\xfc\xcd\xdfL\xaf\xd7c}}\x9d\
-~\xbf\xcfw|\xc7\xb7\xf3\x99\xcf|\x8a8\x8e\x11\xf1\
-h\x1d\x9d\xf8\x0ef\xb2\x19\x84\x5c\x9e3T-z\xcd\
-\xe8\x8c\xb6\xb6\xbb(\x99s\xd2^t\x1a\xa3\xbc[\xb3\
-\x1b\x08h\x88MH\x19UZ3\xd8\xdfgao@\
-\xbc\xb6DE\x03Ps'\x9b\xd7t\x90\xd0%\xb1\x06\
-\x1d\xef\x05\xe5=\xb80a\x95s\xf5:9\x9c0\xce\
-1q\x15\xc3\xe9\x98\x97\xb6\x1c\x99\x89Y\xccZ\x9c[\
-X\xa0\xdb\xeb\xa1\xd3\x14\x1bE8s\xf84\xf3\xb1k\
-G\xff\x17\x0c\x8a\xb1\xb3\x5c\x1b\x0fYZ\xc8n9\x16\
-\xf7\xac\xf9\xbc9\xc8\x00\xad\xf9\x15~:Z\xd7\xad\xee\
-\x05\xa0\x93\x5cx\xf0\x17\x1e\xfd\xa1\xff\xf5[\x9e\xfd\xbb\
-?\xbc\xfb\x9a\x5cm>\x19\x90\xc3\xf9w\xc4d\xaf\xd4\
-\xb1\xe5\xf0\xe1;g\x99\x94\x05\x85x\x22\x1bJ\xe4\xb4\
-\xa2\x0c\xe3\x15h\x8f\xf2BiKr\x84\x08\x03xJ\
-\xa9(\xab\x09\xa5\x9f\xe2JK\xe4-\xadT\x13g\x11\
-q\x1cS\x89P\x89A\xb4\xa6\xb0\x9e\xb1+\x00\x8d\xd1\
-\x117\xa77\xc9\xdd2\x9d\xa8C\xaa4\x91\x89\x10\xef\
-\x88TB\xcb\xf4\xd0D8W\x021J\xa5\x88\x94\x94\
-\xd5\x88\x0a\x0b:b\x99\x18%\x9e\xb6J\xe8G]\x12\
-o\xc1DT\x22\x18<i\xd6\xc1\x98\x18\x9bW\x94>\
-\xa7\xb0\x03\xacv8\x01\xab<c=\x01\xedIMJ\
-/K\x18\x96%\xa5\x8fA\x82?\xcabq\xda\xd11\
-1S7$\xf7\x8e\x88\x1eq\xd6\xc2H\x8c\xf3E\x18\
-;\x1d\x87\xa4J\x81\xd2\x0b\xe7c\xc3\x85\xd6\x12W2\
-\xb8\x10\xc5\xec\xc6k\xe0{t\xd3\x97X\x9f\x8e\x98\x16\
-K<\x95\xef0\x15\xa9\xf1%p\xbc\x99\xaf\xe2\xac\x13\
-\xb9\xae\x5c0\xefg\x09\x1a\xd3\xe1woLD\x9au\
-I\xb2\x166W!\x1c]\x85\xc0\xc7\xd9\xd7%G\xbf\
-\xa8pJ\xdd\x14\xfa\x09f4\x01-:\x08\xa8\xb8\xfa\
-\x83\x14\x14\x11J\x1b\xc4\xb8P\xeeFk\xb4\xd2\xb3j\
-\xd6\x81\x0eQ\xd4\xc9\xe9\xa8\xaa\x95\xe6\xe0\xe0\x80_\xf9\
-\x95\x7fL\x14EsM\xfeN\xd3\x05\xea9\xad\x14I\
-\x92\xf0\xfc\xf3/\xd0nwx\xcf{\xdeC\xbb\xdd\xe6\
-\x83\x1f\xfc \xc3\xe1\x90_\xfc\xc5_\xe4\x13\x9f\xf8\x04\
-\x0f<\xf0\x00?\xf0\x03?\xc0\xe2\xe2\x12\xab\xab\xab\xe4\
-y\x0e\x84\xca\x0a\xaen\xb5\xd0$\xa7\x86 \xc97\x12\
-q\x1aY\xf1l\xa2\xe5]F\xb5\x9d\x04\x9f\xd3\xf7;\
-\xb9\xc3\xed\xc0G\xa1\x88U4c-V`\xb0\xbe\xce\
-\xc2r\x9fj\xbe\xc8\xe0\x1c\xe8\x04\xc3\xab?\x02:\xe2\
-%\x98%|\xa8\x81\xd5\x80\x8d\x88\xe0\x9dC\xb9\xb0\x8f\
-8\x8b\x88\xa0]\x88\xd6\xc9m\xce+\xe3\x11/on\
-\xd2\x8e\x22\xd6z]\xce-\xad\xd0[\x5c@\xb5Z\xb8\
-(\x0ao\xb4\xb6\xcf\xeb\xd9\x03\x1d}\xd2\xcd<\xc7-\
-x\xcc\x1c@ql\xdc\xeeE\xf3y\x93\x90\x06\xe2\xf9\
-\x15\xaf\xfc\xd4\x8f\xfeo\xf7\xff\xe0\xdf\xfe/P:E\
-\xebG\x92o\xfa\xae\x7f\xc0\xdf\xe5\xfb\xe0P\xdb\xb9g\
-\x8d\xe7\x98\x8fg\xfe\xef\x89\x88\xb6c\xc7\x8dp\x94\x94\
-,i\xcd\x82Np\xd6\xb2;\x1d\x80\x0a\x1a*\xb6\xc4\
-U\x8e\x04\x8dW\x81MZ\xa9\xf0vJes\xac\xab\
-\x90D\xb3\xd6\xebP\x19\xc5\xd4[b\x0dq\xd2G)\
-\x18\xcb\x98H\x0cQmn\xb5\xe2\x19\xdb!\x95\xcb\x89\
-\x94\x22\x8b3\x94rh\x89\xf0>\xd4\xed\xf2R\x11\xab\
-\x16\x89\xee\x11\xa3\x11\xa30\x22\xe4v\x8c&h\x5c\x89\
-i\xb3\xa8z\x5c\x885\xa5\xf1\x0c\xa4\x04\x0f\xfd\xfe9\
-\x8c\x8e\x18\xab)R\x14\x88\x87J\x0b%\x0e\xe3\x13\x8c\
-I\xd0\xd1\x94$JY\xccb\x9c\xafpN#u\x12\
-\xa3\xaf*\x22B\x19\x18\x1f\x0b\x93b\x04\xde\xb1\xe5\xb7\
-\xb9\xac/\xe3}\x85\x89\x13L\xfd\x0dZ\x1f4\xc1\xbc\
-\xf4|\xe9\xda\x84\xe9^\x85_4d\x91\xe5\x5c$\xb4\
-M\x9fr:\xe1\xe5\xa1\xd0JV9P\x93#2\xc0\
-\xddj\xea^\x04}d\xae\x043\x9d\xf8:\x11Q\x04\
-mb\xe2\xa4\x85\x89\xe3Yi\x98\xf9\x96\xeaZk\xdc\
-\xbc\x02\xa2\x8eU\xcc\xa8-#J\x04-\x1a\x117\xc7\
-\x88B\xa0\x89\xc1\xe0\x22\x0d&\xa4Q4!\xeeZ\x07\
-S\xbcW2;\xad\xa9\xc7\xf6\xc8\xb3*\x88\xa3\x84'\
->\xf9\x04/\xbc\xf0\x02\xbd^o\xf6<\xb7\x1e\x95\xc3\
-\xf5\xe7\xce\xad\xb1\xbc\xbc\x8c\xf7\x9e\xcf\x7f\xfe\xf3\x5c\xbb\
-v\x8d\xef\xfc\xce\xefdss\x93\x0f\x7f\xf8\xc3\xf4z\
-=n\xdc\xb8\x11\xc6\xcc{vww\xe9\xf7\xfb\xa76\
-\x5c\xac*\x0f\x84\x08Ng_\xbf\xa4d9\xb2pv\
-\xceu\x0f\x95\x0bN\x9a\xdd\x8e_\xean\xc0\xa7\xe1\xdf\
-\xf1\x9ccO+\xd8?8`y\x7fD\xbc\xba@%\
-\x879\x012\x93\x8c|\xf0\xe74N\xc0\xc6\xbc\xe6=\
-^\x1a\xd0q(\xf1x\xe7k@\xaaA\xc7\xb9\x90\xd8\
-\xe8\x05\xbc\xc3;\x1f@\xc89r[\xf1\xc2p\xc8\x8b\
-\xd7o\xb0\x90e\x5c\x5c=\xc7\xda\xf95Z\x0b\x0b\xa8\
-,\xc5G\x86P\x86\xa3f\xae\xb5\x84a\x14\x14\xceS\
-\x8a'S\x11''\xdaY5\x9f\x13\xa3\xfcf!\xc5\
-1\x11o\xf7c\xbf\xfcB\xef\xed\xdf\xf2SK\x1f\xf8\
-c\xff1\x80\x8e\xd3\xefy\xfc\x1f|\xe1?\xb3\xf9o\
-\xdf\xb31Y\x9dXn\x1a\xaf\xcc\xa1\xcf\xbc\xb63[\
-{\xc8\xf9\xf2N\xc2\xc0kt\xd6\xa6\xd3\xeaa'S\
-\xc6\x93}\xc4z\xbc\xb3\xb8\xaa$\xf1\x9e6A\xfa\x15\
-\x13\xca\xee\xa3\x04\xa9*J\xef(\x95\x10\xa7\x10g\x8a\
-\xc9\xd8a+\xcb\xa2\xc0^\xaa\xc9\xbd\xe6\xbc\xee\x90\xba\
-\x82\x0aP\x19\xa8(Dz\xd9\xa9cX\x16\xc1T+\
-\x9e\x81*\x89\x95f1^\xc4(\x87\xc3bTL\xa4\
-S\xf0\x06a\x8cVq\xcd\x08=\x191\x97u\x97\x83\
-v\x84\x8f\xa1\x9cNH\xd2\x05\xb46\xa46\x22\xf7\x0a\
-\xe3\x04#E\x1d\xd2\xacQ\x22\xb4\xe2\xba\xad\x80V$\
-F\x81sh\x1d\xd7\xdf\x89\x0b\x91j\xce\x81\x86R\x09\
-\x95\x1dr\xc3\xbd\xc4\x8at\xb0~JO_F\xf0x\
-;\xa5\xa8\x86h\xf1\xec\x8e+\xa4\xf4\xbc2-\xf9\xca\
-\x9ec\xa5\x15\xa3\xf4\x16\xa5\x08\x83i\xc5\xee$'Y\
-X\xc2W9\xaa6O\x03 w\x07@~\x06:\x8d\
-\xb0\xd2|\xe7s;E\x1a\x9d\xc4\xa8H\x87\x5c(\xa3\
-\x10}\xf2\x0b\x09k\xea\x9e\xdd\x1c\xf6\xdcQ\xcd\xf9\xea\
-\x08\xbf\x90q\xafk\xcbI\x00!\xa5\x0e\xe7Vh\xad\
-\xa0\xebgQ5\xcf\x92\x19\x83=\xed\xdbT\x84zi\
-\x1f\xfb\xff>F\xa7\xdd\x18\x07n\x07:\xc7\x8f\x0e@\
-\xfa\xab\xbf\xfa\xab|\xfe\xf3\x9f\xe7[\xbf\xf5[i\xb7\
-\xdb\xfc\xe0\x0f\xfe \xce9\xd6\xd7\xd7YYY\xe1\xea\
-\xd5\xab\x5c\xbf~\x9d\x0f}\xe8C\xfc\xfa\xaf\xff:e\
-Yb\x8c9\xd5\xdf\xa3\xb4f4\x99\x9e\xe1\xfa\xf7H\
-s\x807o-u\xaf&\x81T\x8e\xfd\x9d\x01\xc5i\
-\x80r\xdb\xb3\xdc\x1e|\x14\x8ad\xbe6\x91\x82\xcaz\
-\x867\xd6\xe9.\xf5\xd9\x9f\xb1\xb1\xda\x19X\xdb\x8f\xc5\
-y\x10\x17\x00\xa5\xf6\xe9\x888T\x0d\x22!\xe2\xc5\xa3\
-l\xc8\xe5\x11W\x81\x15\xbcxhLp\xd6\x85.\x87\
-\xce\x85\x0f\xd4\x0aZ,\xe2\x84\xdd\xe2\x80\xed\xbd]Z\
-\xcf?\xcf\xc5\xd5\x15.]\xb9\xc2\xe2\xf9\xf3\xa8v+\
-tM<\x12\xd2\xa8\xa8\xc41\xb1\x96\xd6\xac\xa0\xe0\xf1\
-\xf1\xbb\xbd\xe6s\x1c\xb0\xcfh\x22\x7f\xa3\xe8\xb4W|\
-\xf0\xd2\xdf\xff\xcf\xffyv\xf5\x9dW[\x0f\xbe\xf3\xbb\
-\x00Lg\xe1\xaf>[\x9c\xfb\x7f\xeeU\xe3\xb9\x1d\xd8\
-6s\xe5\x94\x95\x87\xc7*E\xda\xcd\x98N\x1d\xd3\x85\
-\xf3\xecg-lu\x13\xaf\x14\xbd(\x82\x08\xd6\xbd\xe3\
-@A\xcf[P\x1e'\x11K+\x17\xc9\xc4\x92\xee\xee\
-\x90O\x0f\x90\xca\xb2\xbbS\xd1]\x89P\x89P\x95\x16\
-Z\x9e\x89\xb28\x1dq\xd1$dJ!\xad\x02\xd7v\
-T\xdaP\x19\xc3P`oT\x90\xdb\x12\xab<\xe2\xc7\
-d&&\xd61\xd6{\xfaq\x86V\x86\xd2\xe5TT\
-x\x05\xa9I\xd0\xbe\x22DT\x1a\x12\xef\x88Z=:\
-\xdd\x8cVV\x11%-\x22\xa5\xf1\xa90\x99\x8cH\xb4\
-\x22\xc1P\x89\xe0\x95C\x5c\xcc\xd2B\xc6\xfe\xc1>\xe3\
-\xdc\x82Q\x88\xab\x10\x93\x12\xd5U\xbe\xc5\x0b\x95\xabB\
-\x82\xb4\x08:J(\x8d\xe5\xa6}\x89\x8e\xea\xb0$%\
-\xce[\x5c5\xc4JE\xec\x0a\xba\xe9\x14\x1d+\x5cQ\
-\xb0^:v\x9c\xc1Kh\x19m\x11\xc4x\xa2\xc9(\
-|Wj\x1el\xd4\x8c\xc1\x9f\x85fse\xae\xb8\x8b\
-\xc8\xd1H,\xa55Q\x12\x04<i\xb4\x1c!\x04\x05\
-)@\x8e\xce\x0bEc\x8a\x9f\x9d\x10Dj\x93g\x10\
-8\x9d\x1c6\x9f;\x92\x13;{\x06@\x1f6\xa5\x0b\
-a\xd2R\xdf\xdb\xe9\xcf\xe2\xc4a+G\x92$h\x1d\
-*\x91\x9f\x95\x8c1\xdc\xb8q\x83^\xaf\xc7\x0f\xfd\xd0\
-\x0fq\xf9\xf2\xe5Y\x84\xe83\xcf<\xc3\xfd\xf7\xdf\xcf\
-\x8d\x1b7\x88\xa2\x88w\xbc\xe3\x1d\x5c\xbdz\x95\xef\xff\
-\xfe\xef\xe7\xa7\x7f\xfa\xa7\xe7LzG\xe9\xf5\x16^O\
-j<\x9c\xe9\xbd\x9f1\xb8\xe0p\xf9\x04\xf8\xdc\xc2|\
-v;h:\x01>*\xf8x\xe6O\xa0\xb5bgo\
-\x87\xa5\xe1\x84x\xb1C)n\xa6\xed\xd4bJ8\x93\
-\xd4\x92\x88\x87\xa6\xe7\xaa\x17\x1f\xb4'\xefPuC2\
-\x9c\x05'x\x09 \xe3\xadG9\x8fsU\x00\x1f\xef\
-\xc0\xd6f:\x1b\xa4OU\xfb\x84\xf2*\xe7+\xd7^\
-\xe6\xa5\xeb7\xb8\xb4\xb6\xc6\x03\x0f]e\xe5\xe2\x05t\
-\xa7\x1d$\xe5\x9a*\xef)\xbd\xa5\x91\xb5N\x7f\xe9g\
-1\xbb\x1d\xeew\xb7f\x8b7\x98v\x01\xf5\xd5\xbf\xfe\
-\xc7\x7f\xfc\xed\xff\xc3o?d\xfa+o\x15\x91\xe8\x93\
-\x0b\xef\xfdN\xba\xcb\x00\xf7\x16\xd5\xa6\x1a\x8f\xc1)\xe6\
-6N\xae\x9a\xd7v\x94R\xc4I\x84\xae \xee.P\
-\x02\xedn\x0f\x5cA\x86\xa2\x97*\x0e\xf2\x09;\xc3)\
-\x83*\xf8\x15\xad\xd7D\x8b\x8bt\x17\x96YZ\xddD\
-v_\xa6\xd8\x1e0\x1a\xe4\x94x\xf4\x82&\x8e\x0c\xb6\
-\x1f3\x19\x17\xa4Y\x975\xa5\xe9\xa6\x15\xb2\xa08\xa8\
-<C\xeb\x88(\x18(\x8d\xd3\x01\x14\x04\x8f\x12O\xe5\
-a;\xdf&U)\xb1nSR0e\x8c\xd3\x82\xa8\
-\x8a\xd2\x97H\x1c\x13\x11\xe1\xad\xc3\x1b\x8di\xf5\x88b\
-M\x1c\xb5\x88\xbd\x09M\xc5\x8cC\xeb\x88\x16)\x9dV\
-\x84\x1d\x8f\x11\x14\x89\xe9\x92\xc5\x9a\x0b\x8bc\x06\x95\xe0\
-\xeazj\xceYT\xda&J[\xa8|\x8a\x88#\xaf\
-J\xd0\x11\x9d\xde\x22dm\xb6\x86\xfb\x94.')\xaf\
-\x91\x92\x12\x89\xa6\xf2\x15\x898.vJt\x04\xe3A\
-E\x1ci\xbcX\xbcWT\xd6\xa3\x9d\xc1\x1b\x0d\xa2\xd8\
-\xaf\x1c\xfb\x9c\xe0\xdc'\xb4\xd2[\x91\x10\x9c\xf73\xe6\
-\xd5|\xe2ssGS\xb7\x80\xd7\xd4\xc2\xe7\xe1$\x10\
-\x9a\xc6\x830\xab\x12Vk]\x8d\xdfH\x94\xc2\xe6#\
-\x8a\xed\x97\xa1\xb3D\xdaZ@k\x1745\x82\xdfO\
-\xc4\xcd\xeeh\xa6\xdd\xd4\xc7+\x91:\xf2\xae\xd1\xa9\xe4\
-XD\xdb!u:\xedZ\xfb8\xfb\xdc\x17\x11\x92$\
-ass\x93\x0f|\xe0\x03\x00<\xf5\xd4S,//\
-\xd3\xeb\xf5p\xce1\x99L\xb8\xef\xbe\xfb\xf8\xe2\x17\xbf\
-\x881\x86\x9f\xf9\x99\x9f\xe1{\xbe\xe7{(\x8a\x82\xa2\
-(N4_4\xc6\x90\xa6i\xdd>\xfc\xf5\xa0\xd3\x81\
-\xe6,O}\xd7\x02\xf5Q-H8\xe5\xcf-n\xe0\
-\x94_\xf5*\x85\x225\xd1\xf1\x95\x14\xa5e\xb4\xb9I\
-\xbb./>\xa7\xe9\xd65\xd1\x1bP\x09@\xe4k_\
-\x8fr\xa1 #\x08\xe2\x0e}:\xde\xbb\x00>^P\
-\xce\x87r%\xce!\xde!\x95C\xac\xc5W\x15T\x15\
-\xbe,\x91\xaa\xc2\x17\x05\x94%\xb1w\x88\xadx\xe9\xe6\
-M>\xf1/>\xc5\xef\x7f\xea3\x0cn\xac#E\xd3\
-\xdf%\xe4\xfa\x84V\xed\x87\xc0r\xfa\x08\x1c[\x92\xa3\
-\xfb\xdc~\x1c\xdfT4\x00\xb6\xdcp\x7f\xf3\xe5\xbf\xf7\
-g\xff\x86\xd8\xf2\x00\xa0\xd2I+\xfd\xbe\xbf\x82:Q\
-a\xf7\x8c\xa4\xe6\x16\x8e\x98\xd9\xe6wQG\xf6m\xbc\
->\x02\xc4QD\x1a\xc5\xe4\xe3-2;\xe2B\xaf\xcd\
-\xc5\xd5\x15z\xcb\xcb\xe8\xa5E.^Zfi\xa5K\
-\x91e\x0c\xa2\x98\x911\x0cm\x85\xeed,\x9d3\xa4\
-\x8b\x06\xe9@\x12):Q\x8av)\xc9\xf2\x22\x07\x06\
-$\xeb\xb3z\xf1*fq\x85\xec\x9c\x22\xed\x09Q\x16\
-\x1c\xdd\xb6\xa8p.h\xd7I\x04\xfd\xb6\xa1\xdf\xcf0\
-Q\xc4\x81\x9d\xb0S\x1d\xb0\x91\xdf`\xa3z\x85\xa9\x9d\
-\xa0\xbc&\x22\xa1\xf49\xa3n\xc2\xf8\xdc\x12\xc3\xc5\x8c\
-ra\x11\xd3j\x13\x9b\x18\xa9<nZbP$:\
-\xa2\x17\xb7\xe9\xb6\x97Y\xee\xf7X\xee\xa4\xb4\x92\x88V\
-\x06\xb6r\xf4Z\x19\x8b=\x03\x84Fi\xce\x95\x888\
-t\xbb\x8d\x89S\x84\xa0\xad$i\x9bta\x09\x9d\xa5\
-\x14F\xd8\xb5{\xbc\x92?G\xa1\x0a\xb2\xb8\x8f\x89\xb3\
-\xe0?q\x86D'\x98(\xc3'-\x5c\xda\xc2\xc5)\
-\xca\xa4t\xe2\x94\xa5\xa8M\xa2\x22\x94\xd2\xcc\x07\x02\xa8\
-c\x7f\xefD\xc1r1of\x9b\x13(\xe7N\xea!\
-\x98\xcd}\x9d\xbfS\x9b\xd1\x1b^\xd40]/\xe1\x1b\
-o\x96\x03\x1f\xf0\xb4\xda)\xdf\xf6M\x8fq\xa9\x1b\xc0\
-\xb5,+\x9cw\x84\xb05\x1f\xca\x92\xba`\xc2\xf73\
-\x13\x5c8\xc7L\xe6\xbd\xc3\xd7\x18\xf2p\xe2\xd9\xfd\x9c\
-\x95\xe6}UO>\xf9$y\x9e\xf3\xc8#\x8fpp\
-p\x80R\x8a\xc9d\xc2\x93O>\xc9\xfe\xfe>\x0f>\
-\xf8 [[[\x14EAY\x96lnn\xb2\xbe\xbe\
-\xce\xd6\xd6\x16{{{\x0c\x06\x03\x86\xc3!\x83\xc1\x80\
-\xf5\xf5u&\xe3\xf1\x1b\x12J=\xa33<\xf6=q\
-\x86\xd7T\xf3!\x0c\xbaQ!dy\xde\xf1\xa1\xb4b\
-oc\x93\xab\xf7]a\x90F\xa1\xc5m\xad\xf1\x08M\
-\x12^\xed\xeb\x91\xe0\xf8\xf3\xe2i\xc2j\x95;\x9c\x8c\
-ROXpu\xa4\x9b\x05\xeb\x10\xe7\x91*L8\xb1\
-6\xf8\x85l\xa3\x15\x1df\x12)\xa5Q\x91!2\x06\
-\xef\x1d\xcf]\x7f\x99\x8d\xbd]\xde\xf6\x96G\xb8\xff-\
-\x0f\xd1\xeawA\xf4\x89J\xb0\xb7\x1e\x8f\xb3h>o\
-b\xc8\x09\x94\x03C\xa0\xd8\x7f\xea\xb7\x9ek\xff\xdaO\
-\xfc\x8f\xe7\xfe\xe8\x9f\xf9\xaf\x00m\x1ex\x17\x97?\xf2\
-\x97\xb9\xf1\xb3\x7f\xf5\x9eN\xacN,\xd4?N\xf1\xef\
-\x1c\xddI\xb3\xba\xb2\x80\x89&l\x0dvH\xb3K\xb4\
-\xb5\x22j\xb7q\x22\x8c\x1ct:\x8a\xe5\xb2`\x98[\
-\xec\xd8#\x06\xa6\xc5\x84\xdcN0\xbaDKA\xda\x8e\
-\xb9\xf4\x96\x1e\xed\x85\x0e_\x19T\xecT0.*V\
-\x97\xd7\xe8.\xf4\xb9\x19\x09\xe3x\x115\x16T\xae\xd0\
-\x93\x12\xc6\x9eL\x12\xbc.Hc\xe8tc*4y\
-YR\xfa\x90\x9c\xbaSm\x92\xf8\x88\xe5\xf8<)1\
-Zi\x0a\x95\xe3\xbb=\xa6kK\xb8IJ\xe4\x14*\
-Vh\x07\xe3\xe9\x01L5\xed4!\x16E?i\x93\
-\x18M\x96F\x5cX\x99\xa2\x87\x05^,\xb9u\x0c\x0b\
-G\xaf\x9f\xb2=\xacB,LUP\xe5\x13L\xa7\x8f\
-I3\xb4R$\x12\xa3\xb36Q\xd2\xc2N\xc6\x94\xb6\
-@\x890\x96\x11N\x81\x8b@\x93\xe2D\xb1U\x1a\x16\
-D\xa1\xac\xc1\x19\x85u\x0aq\x1eg5\xb9S(\xf1\
-\x0c+K\xe9\x5c]\x1da\xeeu\xdc\xcd\xd4m4\x98\
-\x99&S\x9b\xb4\xfc\x0cR\x00B\xf2\xaf\x17\xc4\x06S\
-\xb9kJ\xed\xd8\x00\x5c\x0af\xc7\xcfS>\xc9I\xe2\
-\x98|\xea\x99\x8c\x1d\x8b\x0b\x1d\xbe\xf8\x95-:I\x8f\
-R\x0e\xf0N(\xf3\x0b\x81\xbfX\x8f\xb8\x0a\xef\x1d\x1e\
-7\xa7E\xd4\xbcN\xc09\xc14*\xd5iZ\x8f\xe6\
-\x8e\x1aO\x08\xbd\xe6H\xa1\xd5\xa2(\xf8\x86o\xf8\x06\
-\xae\x5c\xb9BQ\x14<\xf1\xc4\x13,..\xb2\xb3\xb3\
-\xc3c\x8f=\xc6\xb9s\xe7(\x8a\x82\x87\x1ez\x08\xa5\
-?\x9cJ\x1d\x00\x00 \x00IDAT\x14\x1f\xfe\xf0\
-\x87\xd9\xd8\xd8 \xcb2\x96\x97\x97gQtM\xf8\xb6\
-R\x8a<\xcfy\xe5\xfa\x0dNr\xa2\xd7\x93^\x03S\
-[s\x9a\xe3\xb7\xfc\x9a\x81O}\x8f\xba\xc1\x9c9\x91\
-_+\xc5`:\xa5\xdc\xd9%\xbbt\x8e\x11\xb5\xdd\xb8\
-\x0e(\x08\xe64\x08\x91n\x01p\x02\xf8\xd4RN\xbd\
-\xdf\xcc4'\x82w2\xab\x0d\x15\xd69\x82\x9f(\x04\
-&\xa8:*N\x9c\x0b\x0d\x9f|]\x04\xcfD(\xaf\
-\xa8\x1bt\x10\x99\x88\xdcV<\xf5\xe5g\xd9\x1f\x8fx\
-\xec\xd1\xc7\xe8\xaf\xae\xcc$\xf1\x10Zx\xfa\xf8\x9d\x05\
-|\xee^y\xfd\x03!\x07L\x80)\x90\xde\xf8\x85\xbf\
-\xf9D\xfb\xea\xbb?\xda}\xf7\xb7\x7f\x04`\xf5\xbb\xfe\
-\x03&_\xf9=\xf6?\xf9O\xce~\xc6\xd3\x1c\xa4\xf5\
-8\xcd\x97zQG\xb6\xcf/+\x16\x17\xcf\xd1M\xf7\
-(\xca!i\x9c\xe2u\x84\x13\x87\xc3\xa3\x94\xa0u\xb0\
-\xd3\x1b\x1d\x1a\x82\x01\x14U\xc1\xcd\xc1>Q[\xa3[\
-}\x96;\x11\xd2JyyR\xf1b\x91\xb3?\xae\xe8\
-\xb62\xa6\xae\xe4\xda\xe65\x9c\x08\xb1J\xe8L\xba\xac\
-\x0eKR\xaf\xf1N\x11wb\xa6\x22\xa4\xaa 6B\
-UY\x8c/\x89q\xa0\x0c`\xb1\xde\x87\xc2\xb5*t\
-\xa6Lt\x8aN\x12|dPY\x0a\x1e\xac\x03KE\
-U\x8c\xb1\xa5\xc1\xdb~\xd0z\x8c!S\x0a](\xb2\
-D\xb3\xda6X\x03\xe3\x5c\xc8+\x8f\xd1\x8a8\x0a\xdf\
-\x80Q\x02\xb6@\xbcC\xa7-\x94I1\xe2\xf1F\xe1\
-\x9d\xa5\x1c\x0d)\x8b)\xa9\xce0:f\x97m\x0e\xfc\
-\x90\xa9\xdfG\x8c&\xef\xb6I\xf2\x82\xc4\xe5DS\x88\
-\xbc\xa9\xa3@\xa1\xf0P\xfa\x9c\xea\xd0\xb8\x15\xe4\x02\x99\
-\xab\x83wF>\xd7\xf8N\x1a\xf5\xbf\xf9o\xfe\x9dz\
-\x81\xb2( \xad\xb06GlU\xfbe\xa5\x0e\x93\x96\
-:\xff\xa8>\xd2\xfb:\xcfEa\xab\x9c\xdd\xf5\x9b\x14\
-\xe3\x09\x1b/L\x893\xcd$\xef \xc9\x16\xae,\xf0\
-8\xf2r\x8c\xafJ\xc4\x82\xb3\xc1z\xe2\xad\x9aiN\
-\xca\x05s\x9eo\xfc<\xb7\x8dT\xae3\xd9O\x1d\x80\
-\xc3\xc0\xa4C\x07\xa5\xa2,K\xf6\xf6\xf6x\xfe\xf9\xe7\
-\xb9t\xe9\x12/\xbd\xf4\x12o\x7f\xfb\xdb\xd9\xd8\xd8`\
-:\x9d\xb2\xb2\xb2\xc2\xca\xca\x0a\x00UU\xf1\x91\x8f|\
-\x84\xad\xad->\xfa\xd1\x8fr\xf9\xf2\xe5#\x81\x05\x0d\
-\xef\xf1\xde\x93$\x09I\x920\x9d\xe4o\xaaJ(\xaf\
-J\xffz\xcd\xccn\xc2\x5cg#9\xb2\x9f\x88\xb0{\
-s\x83^=\xc1\x8e\xaa\xe0\xe1\xb7\xaf\xa3V\x1a\xc0\x09\
-\xd1j\x0d3\x97FG\xa6\x09N8\x8c\x82\x0b $\
-\x9e\x10\x05\xd7\xec{X\x11\x11!T\x13V\xba\x06\x1d\
-\xad\xc1(\x94&\xd4\xcd2\x11\xd766\xf8\xf4\xef\x7f\
-\x8e\x9d\xedM\xfc\xac\x9c\xc7!\xa8\xdej<\xe4\xd8\x96\
-S\x84\xb57/\xe4\x04\x12B\xe1\xb11\xb0\x03l}\
-\xf5\xbf\xfb\xc8G[[_\xd9lv\xb8\xf2\x1f\xfd\xf7\
-\xa4\x97\x1f\xb9\xb7\xb3\xcf\x99\xd1N\xfdf\xe6\xcdps\
-\xf1\xbcU\x15\xd3N:t\xdb1\x95\x9d\x92\xa3\xc81\
-\xe1\xbd\xc5\x05\xfb\xe3\x09\x07\x93<\x04o$\x11\xca\x18\
-\x0a\xe7\xb8\xb1\xbd\xc5\x176\x06\xbc2\x89\xb86\x85O\
-\xdd\x98\xf0\xe4\x8b{l\xee\x8f)\xcb\x90\x1b\xb41\xd8\
-b{p\xc0\xf6p\xc4\xce\xc4q\xb34\xbc\xa0b^\
-4-\xaee-\xae\xc5\x09E\xa4q\xd6S\x95\x8e\x05\
-\xe3x`I\xd3O#ZQ(P\x1b+\xb0\xe48\
-q\x88V\xd8V\x82D\xe0\xab\x1c\xc1\xe1\x15\x84\xfa\x05\
-%\xce\x17\xd8j\x8cw\x16\xad\x15\xe7\xba\x8e\xcb\xfd\x92\
-sLh\x0f\x85t\x0a\xc9TX\xd4\x09k\xdd\x1e\xdd\
-N\x82\x89\xf5,\xaf\xc3\xe0\xc0W\x882D\x9d.\xba\
-\xd3C')v<b:\xdc\xc5\xfa\x8a\x5cJr*\
-\x86\xc9\x98u\xb3\xc9\x1e[\xc1,\x97F\x8c\xdb\x11S\
-S\xb1[L\x19\xd8\x82\x81-)l\x15\xca\xf8\xe8\x02\
-\xef\x0b\x5c\xed\x1bQ\xf3\xef\x81Z\x90:\x035\xddF\
-\x85\xda\xdc%\xb5\x03\x1f\x99}D\xe2\x1c\xae(\xf1y\
-\x81+*\xac+\x11kq\xd6a\xa5\x0a\xa67'\x08\
-!jU|\xf8\xc6\xab\xaa\x04\x07\xb1\x8eXY]e\
-b\x1d\xa3\x5cX9\xbf\xc4`\xec\x91\xf82\x22Q(\
-\xf1T\x04\x9fo\xe9\x1cRY\xac+q>\x98\xf3|\
-\x9dk\xe4\xeb`\x81\xc3\x08\xb7\xbb#\xef\x85\xe9t:\
-g\x86\x0bf\xb4\xcd\xcdM\xa6\xd3)\xeb\xeb\xeb<\xf3\
-\xcc3\x88\x08\xcb\xcb\xcb\xbc\xf5\xado\xa5\xd5j\xd5\xc7\
-\x862Tq\x1cs\xf1\xe2E>\xfe\xf1\x8f3\xaa\xab\
-\xad\xcf\x87\xa2+u\xc8]\xb4\xd6\xa4Yz4\xd0\xe2\
-u\xa4\xe6\xcawr+\xdd\x19x\xe6\xd4\xdf[]\xe8\
-\xf0\xef\xbd\x82\x8f\xd4\xe5:N\x92\xd2\x9a\xfd\x83=\x92\
-I\xc8\x918\xcd\x87y\xea\xbd\xcd\xdds\xb3\xd5\xdfB\
-\x029\xfc\xa3\x02\x00\x1a\x1d\xea\x82E\x11:\x89\xeb0\
-\xce\x08e4\xa2\x15Z\x19\xd0\x11b\x0c\xcahL\x12\
-\xb13\x1a\xf3{\xcf>\xcb\xdeh\xc8<\x9b\xbc\x1d\xf8\
-\x9c\xb6\xe56C\xfdf%\x01J\x82\xc9m\x07\xd8\xbe\
-\xf2\x99\x9f{\xcan]\x03@\xa7m\x1e\xfc\xb3\x7f\x1f\
-\x9du\xcex\xba\xc6[3\xef)\xb8E\x90\xc1\x11\xff\
-\x8f\xcc\x16\xc7\xc3\x09\xd3\x89\x90i\xcd\xa0\x98\xb0>\x1a\
-\xb1_N\x99\xc8\x84\x8d\xc9\x1e\xcfo\x0d\x18L\x1d\x85\
-(\x9c\x89PI\x8c\x17O>\x99\xb0\xb3=\xe0\xf9\xf5\
-\x03\x9e}y\x8f\x977\xf6\x99\xe6\x16\xa2\x041\x8a\xae\
-V\xbccy\x85\xb7^Zf\xad\xdfe\xa9\xdf\xe1\xd2\
-Z\x0fYi\xb3\xdfK\xd8j\x19&\xca\xb1\x9cU\xac\
-,\x1a\xd6:\x96\x95\x96c\xa1\xa3i\xc7\x86\xd8h2\
-\xad\xe9\x98\x181\x82\xc3\xa2t\xc4t\xa9\x8bJ#b\
-<J\x1c\x85+\x19\xbb\x02\xb1\x13\x5cU\xe1mI\xe9\
-+t\xa4X\xeb\x15\x5cY\x1cs\x7f:\xe2\x1cB:\
-\x891\xfb\x8adlh\xe7mT\x99\x22\xe8\x90\x5c\xea\
-B\xe9&\xed\x0a\xbcx$2\xa84!]X\x86\xca\
-\xe1\x5cN\xaa\x14\xceY\x0aU!\x0b]\x9c\x81v\x1c\
-!\xdeS\x15\x05\x13\x11&Z3F\xd8\x97\x8a!%\
-#\xc9)$\x00g!\x15N,\xc7\xa3\x0d\x9b~\xa5\
-g\xa1P\x0fmN\x9bh\xfc*\xcd\xc7\xa3@\xac\xa5\
-\xca'\xd8|\x8aw\x15\xb6\xb4T\xae\xc2{\x1b4\x11\
-_[*\xf0(og\xc6\x84\xf5\xeb\x9b\x0c\xf6K\x96\
-\x96\xd7\xe8\xf4\xfad\xadUF\xa3\x92W\x9e\xff2\x11\
-\x13\x94*\xd0I\x17W\x9b\xd6\xcb\xa2\xc2W\x15\xae\xac\
-\xf0\xce\xe1]U\xdf_\x08Hj\xee\xef^H\x04\xc6\
-\xe31Q\x14\xcd\xba\x9d\x0e\x87C\xb6\xb6\xb6\xb0\xd6b\
-\xea\xd6\xe8\xbf\xf3;\xbf\xc33\xcf<\xc3\xe2\xe2\x22\xe3\
-\xf1\x98\xeb\xd7\xaf\xf3\xe4\x93O\xf2\xcb\xbf\xfc\xcbG\xce\
-\xf7\xb6\xb7\xbd\xedH-\xc4\xe6\xbe\x02\xf6\xd7\xc5l\x95\
-\x9a\xb5qyCh&\xe4\xbfF\xfdx\x8e\x98\xd4N\
-\xddv\xcc\xa4t\x0b\x93\xe2if\xb7z\xb8N=L\
-\xa3\x98\x149\xd3\xed=\xda\x0f\x5cd\xe0\xdc!s>\
-\x0e>\x22\xcc\x80\xfdt\xd3+~n\xbdC!J\xea\
-H\x19\x85\x89\xcc\xac\xc6\x952\xd1LgU\x80\x18\x0d\
-J\x87&^\x91\x09\xbd\xcd#\x03\xc6`\xa2\x88$6\
-\x88\xa8`\x0e\x98\xdd\xdc\xc9g\xba+\xb3\xdb\xd7\x0e\x09\
-P\x00\x07@\xdc\x8f\x98\x1c\xfc\xf4\x9fg\xe9?\xf9i\
-t\xda\x22\xbd\xf8\x10\xf7\xfd\xa9\xbf\xc5K\xff\xf3\x9f>\
-\xd3\xa9N\xf6\x94\x15\xe6e\xa4S\xcdl\xeap{>\
-\x99\x92e)\x8biJY\xe5\xdc\x1c\xed\x90*C\x14\
-Ul\x8f\xc6L-\xa0\x13\x9c\xa9\x13H\x9dE\x89G\
-\x9c\xc5W\x16|\xe8\xdf\xa4\x8d\x09\xf9\x11\xc6\xd03\x11\
-\xdf\xb6\xba\xc2\x03\xfd%\xb6c\xc5\xb5\xf6\x84X\x1ck\
-\xc3\x01\x1b=\xcdh\xec\xe9\xb4\x14\x9d\xea\x00\x95O\xb8\
-|\xa1\x85L\xa6\xec\x0e4\x07UL[\x0b:6h\
-m\xe8\xa8\x18\xd5\xed\x83\x8d\x10\x1d\x93\xb7S\xb28&\
-\x8d\x22\xc6\x93\x9c\x83r\x82SB\x22%\x94\x16-\xa1\
-X\xa4\xd2=ZIEW\xe5\x5c\x93\x0e\x1bi\x8b\x5c\
- \xaa\xc6H9\xa5\xaa<\xc6*\x22\x891\x91\xa6(\
-\x1chA\x8bC\xa4\xc2Y\x8b\xe9tI/_\xa0\x1a\
-\xec\xd3\xde\x8bY\x89\xdbxQL\xbb\x0b\xd0\xee\xc0\xee\
-n\xf8\x94\xbc\x83\xdd=D)\xa6\xce\x82\x0f\xc1\xce\x0a\
-@{\x9c\x08\xda\x87\xf2Q\x1c)\x1d3gf\xbbE\
-\xd4\xd7\x897^\xfblg\x02\xaeP\x9b\xd3\xeb\xbc>\
-\x14\xdeW\xe4\xa3!\xa2#|eq\xe5\x04_\x15\xb8\
-\xca\xe2\xab\x10\xc1\xe7\x5cm\x22\xabM\xecUY1\x1e\
-x\xe2\xd8QT%\xe2\x0a\xd0]\xb2\x8e\xa3\x9dA\x9a\
-F\xa0,\xe2B>\x97-sl\xe5\xb1e\x89\xb5\x0d\
-\xf8\x04-\xa3ID\xbf\x17\xd0i\xccj\x93\xc9\x948\
-\x8eC%\x8c\xaa\xe2\xe0\xe0\x80\xf1x\x1c\x86K)\xb4\
-\xd6\x8c\xc7c\xfa\xfd>{{{XkY\x5c\x5c\xe4\
-\xe3\x1f\xff8\xbd^\x8f\xef\xfd\xde\xef\x05\x82\xe6\xa3\xb5\
-\xe6\xe1\x87\x1f\xa6,\xcbY1^\xa5\x82\xc9.\xcb\x12\
-\xd24\x05`0\x180\x1a\x8d\xe7?\x8f7\x80\xee<\
-Fg\x0b\xa7\xaey\xe2\xd9\xc0g\xae \xbcp\xa2\xb6\
-\xd6\xfc\xbe\xf379\xebk\xc3!\xfb\x9dYI\xb5b\
-os\x93\xf3\xf7]dp\xbb\x9bU!\xe4rVD\
-\xbe)\xa3B\x9dl\xe6\x030i\xad\x89\x92\x848\x11\
-\x22\x1d\xd12\x9a\x18\x831\x9aH\xd7]Ja\x06<\
-\x8dr\xad\x8dA\xe9\xd0\x97\xc7\x98\x90\xe1,Z\x13\xc5\
-1\xcbY\x9b\x87\xce]\xe0\xd1\xb5\x0bs-\x1d\x0e\x07\
-N\xb8\x07\x9f\xcf\xed\x9e\xf5\xcdG\x8e\xe0\xeb\xd9[\x5c\
-\x5c\x9c\xfa\xcd\x17y\xf9'\xff<\x0f\xfc\xf0\xff\x02\xc0\
-\xc27\xfe!\xd6\xfe\xf0\x9fb\xe3\x9f\xfc\xf8\xed\xcfr\
-\x8b\x87>\xcbX(j\xd3\xaa\x12\xba-\xc5B+f\
-T\x8d\xc8\xf7&\xec\x95\x1e\xe7}\xa8\x93\x96\xa6\xa84\
-\x0d\xe0^\x14\xf8*H\xb9\xda[\xd2\xd8\x10\x19\xa9\xeb\
-\x96A\xaf\xdbe)ks5\xeb\xf2\xben\x1f\xa9\x14\
-E\x94\xb2\xd4OYr#\x16\xd7_\x06+,L=\
-\xf7\xf73\xd2\x8ec{'\xa7\x1b\xa5l\xba\x84\x89J\
-\x88|\xccJ\x04\xe38FTD&\x1a\xfa\x8b\x88\xef\
-R$-*\x03\xa6\xacp\xde3-r\x8a\xe9\x18\x9d\
-\x19\xba\x19\x0c\xb5\xc2i\xa1,\xa7TZ\x18(\xc5P\
-/\xf2\xd9\xf6\x15\x0e\xaa\x1c\x1dOX\x88\x22\x16\xbdG\
-lN*\x86\xae\xc4\xb4\xd3\x98\xb2\xb2T\xd6\xd3J`\
-R\x0cAGD\xad.\x08\x98\xb4\xc5b\xd2\xe1\xc1N\
-\x9f\x81Rl\xb5\xfb\xc8xL\xab*1\xca\xa3\xb4G\
-M'h\x13cL\x84\x8e\x09\x01:\x80G\xcf\x80\x22\
-\x8a\x04)\xa1\xf4n\xee-\xdd%sn|<\xf5\xa1\
-\x82\xe0D03&\xaf\xf1\xd6S\xe5#\xb4\x8e\xf1\xbe\
-\xa4*\xa6\xb8\xa2\xc2\xb9\x1c\xeb-RY\xa4\xce\xbf\xf3\
-\xce\x81\x87\xe9d\x84-\xd79w\xfe*\x83\xc1\x90b\
-\xbc\xc3(\xaf\xe8\xb7W\xe8.tQ:\xf8\x80\xbc\xad\
-\xd0\xc6`\x0bK\xe5-U^R\xda1\xe2+l\xe5\
-\x0fMwN\xc25\xa4\x041\xa0NV\x0c\x08\x8fs\
-\x08P\xe1\xaf\xa6(\x0a\x9cs\xb4Z-\xca\xb2dg\
-g\x87\xa2(\x8e\xf9fB\xceN\x96elnn\xb2\
-\xbf\xbf\xcf\xd2\xd2\x12?\xf2#?\xc2p8\xe4\xf9\xe7\
-\x9f\xe7\x99g\x9e\xe1\x03\x1f\xf8\x00Q\x14\xb1\xb0\xb0\x10\
-*\x13\xd4v\xad$I\xb8p\xe1\x02\xeb\xeb\xebT\x95\
-Ck\xc5h4\xa2\xdf\xef1\xdc\xd8\xe1\xb5\xac\xa0#\
-\xb3g\xbb7:{T\xdb]\x81\xcf\xdd\x07\x1c\x84\x18\
-\xfd\xd3\xd9\x8bQ\x86\xbd\xfd}\xee\x9f\x16\x98\xcc\x1c6\
-\xb7;\x02j\xf5\x95ka\xb9\x11\xc2D\x85\x8cj\xef\
-\x85(\x8a\xe9f\x09k\xad\x16\x17\xfb\x8b\xdc\xd7_\xa4\
-\xdf\xe9p\xae\xdb\xa3\xd7N\xd1:\x0a\xe5\xe1\xe7\xed\xd4\
-4\x13)\xe4\x165+U}\x11\x01\x8c\xd1t\xe3\x98\
-\xcc\xc4u\xc9{9\xf2l\xafJ\xf39uD\xde\xb4\
-d\x81I\xbf\xdf/\xb4\xd6\xec}\xfcW\xe8\xbc\xe5\xbd\
-\xac~\xd7\xbf\x0f\xc0\xc5?\xf6\x17\x18?\xf79\x18\x5c\
-\xbf\xcd)\x8e\x9bl\xa0)i\xd2\x98\xd6n7&J\
-A\xafU\xd1ji\x06e\xc1\xde\xb4\xc0\x8a\x0f\xcd\x05\
-\x93\x14\x1diT\x92\xa2\x94A\xaa\x12\xb1\x01t\x12\xa3\
-9\xbf\xd0\xa6\xabs<\x1e]y\xda\xae\xcd\xe5\xc5\x8b\
-\x5c\xec.\xb2\x14\xa7\x14(\xac\x11\xc8\x82\x86\xab\xb4\xa1\
-\xd7\xd3L\xae\x0f\xc8\xa6\x829H\xb9\xfc\x0dW\xc8\xcb\
-)\x1b\xdbc\xc6\xd2B\xf7\xcf\xd3\x8b=\x99.\xc8\xac\
-\x806\xf8\xa4Mw9Bg\x9aWl\x87\xc4{J\
-gqy\x85/C^Y\xa6<\xdd\x8e&\x89B\x89\
-\xda\xa9\x9b`\xed\x84/\xed\x1a6W\x1e\xe7\x85\xee\xe3\
-D\xc3/\xd1\x99<\xc1$m!iB\xcb\xe5,\xa7\
-%\x8ff\x16\xab2\xc6\xb9\xc5\xda2\xf4\xd0\xa9\xa6L\
-\xacG\xc71\xdc\x0cQa\xbd8\xa5\x9d\xb6x\xc5V\
-\xa4\xd6\xb2l+Z\xdd\x0e\x05p\xad\xda$Ic0\
--D4DB\xbb\xe5\xf0\xb6\xa2,\x05+!\x0aT\
-\x01\xb7\xac\x90|\xc6\xc9\xdb\x94\xcci@'\x18/\x0e\
-\x03\x0c\xbc8\xb2n\x87\xfe\xc2\x02\x0eE>)\xc0\x96\
-x)Bp\x81w(J\x04\x17|0\x95Py\xcb\
-h\x7f\x97n/!\x8aA\x9c\xc2\xd3cay\x99X\
-OA;\x94\x04\x0b\x87\x22BTD\xee*TQa\
-m\x85/,UU\xe2\xbd\xa5\xaa\x1c\xe2-^\x1c\xe2\
-\x15b=J\x97\x10E\xcc\x7f\xd1\x0d\x1f\x9e\x99\xfe\x1a\
-,\x15\xcft:\xa5\xdb\xedR\x96%[[[\x94e\
-YWF\x9f\xd7\xee\xfdLk\xd9\xdb\xdb\xe3\xc5\x17_\
-\xa4\xddns\xf3\xe6M~\xec\xc7~\x8c\xc9dBY\
-\x96DQ\xc4\xfb\xdf\xff~D\x84N\xa7CUU$\
-IBQ\x14\xac\xaf\xafs\xe5\xca\x15>\xf1\x89O\xd0\
-n\xb7y\xff\xfb\xdf\xcfs\xcf\xbf\x80\x97\xed7S2\
-\xfa\xdd%\x90\xbe\x9e\xe0\xa3\x94\x9ac\xb7\xc7H\xc1\xb8\
-(\xc9\xf7\x07t.\xac\xb2\xa7\xe6\xc27k;\xa6\xa8\
-\x00\x0c\xe25\xa8\xe03\x12]\xab\x5c\xa2\xe9g)o\
-]Z\xe3\xbd\xf7\xdd\xcf[V\xce\xb3\xd8i\xd3\x8a\x93\
-\xd9\xbd\x1e^\xf7\xf4\xaf\xa5\xce[;\xba\xc7\xdc\xaeB\
-S8\xf0\xe4\xb3\xdd\x8d\xe6\x03G\xc7\xb6\x89w\xf8\x1a\
-\xa2\xaa\xd3\xe9T\x8d\x0d\xfb\xfa\xcf\xfd5\xda\x0f?N\
-\xfb\x91\xaf\x07mx\xf0\xcf\xfc=\xf6\xff\xce\x9fD\x06\
-\xdbw>Sm\xab>\xd5\xb8v\xc4\xbfsLjd\
-\xcc\xe60\xe7\xfaN\xc9\xc6AN\xa1\x22\xa2\xc5\x05T\
-\x9c\xa0\xa2\x18WU\xb8\xa2\xc4\x95%\xce:\xba\xed\x0e\
-\x97.\x5c\xe4-\xbd\x8a\xce\xf4%6\x87\x05\x13eX\
-\xec_\xa0\xb7x\x0e\x1f\xb5\xd8m\x19L\x1a\x91F\x11\
-\x95*\xc9DS\x91\x90_\xb8D7w\x94V\x13?\
-t\x99\xa5\x8b\x0e\xff\xd5\x88\xfd\x89Cb\xcfB\xb7\xcf\
-\xe2r\x8a\xd9\xdbGo\x1dP\xa6m\x16\xce-pe\
-q@e\x0a\x0e\xca%*\x9bRT\x16\x97\x1f\xa0\x1d\
-\x18\x07Y\xa4\xc82h'\x0e\xa3<S)\x18T\x1d\
-6\x93\xf7p\xb3\xf3\x01\x06\xc9\x83$\xd3\x0b\x98\xedO\
-\xe2\x18\xb2\x13g\xac\x18\xc3\x81-y\xb4mx\x98>\
-7rap\xe0\xb0\xd6\x93\xc5-&\xa3\x03&\xfb\x06\
-\xed,F4\x95\xd2\x5c\xb3%\xca;\xde\x11e\x9co\
-\xf5\xd80+lN'Pm\x12g\x19\x8e\x98*/\
-\x11kpJc}H$\x0d\xe68\x09R\xf4\xab\xc3\
-\x1d\x1a\xa6\xdd4R\x14\x08\x01>\x0d\xa7T\x86r:\
-`o\xf3Kh4\x95-\xc0yTU\xa1\x95#5\
-%\xa6c\xd0IL\xe65{\xd3\x01_\xfd\xc2g\x91\
-*'\xd2\x9a\x1b\x93/\xe3\xbcbi\xe5\x0aQK\xd3\
-j-\xa2\xa8\xc0\x86\x9a\x8e\xde\x85\x0a\x03./p.\
-t\xd0U\x10\xc2\x93\xd3\x94.`\xe3\x94$+h\x95\
-%6o\xe1\xbc\xe0\x5c#\xf5\xcf\x85\x81K(\x17c\
-\xeb|>\x11(\x8arVOmww\x97<\xcf\xe7\
-@\xa7\x89\x80\x0b\x8fl\x8ca4\x1a\xe1\x9c\xe3\xe9\xa7\
-\x9f\xe6\xea\xd5\xabXk)\xcb\x92^\xaf\xc7\x85\x0b\x17\
-888\x08\xed\x19\xaa\x8a\xc7\x1f\x7f\x9c/~\xf1\x8b\
-TUE\xab\xd5BD\x18\x0e\x87<\xf4\xd0C\xbc\xf2\
-\xca+\xb3*\xd6o6\xba+\x1f\x0fp\xac\xdc\xcd]\
-\x82\x0f\x9c\xa8\xed\xd6\x98su\x03<r\x08\x05G\xaf\
-,\xec\xdc\xbc\xc9\xea\xc55\x0eP\xa1y[]\x86\x5c\
-\x94\x06\x15\xea-\x89\x9ek\xfe\xa4\x14h\xc5\xbb\xcf\xdf\
-\xc7\xbf\xf9\xf0#<\xb4z\x8ev\x1c\xfa\xb3x\x08\xb5\
-\xab\x9a\xe7\x9a\xfd\x13\x16\x8e?\xd5i\xc1\x91\x87~\x18\
-u\x94\x1f\x1e\x1b\x87\xe6\xd7\xf6\xd8\xf1\x7f|\xc1\xf1\x95\
-\x039SC\xb4C:Qk\xe9\xcf\xbd\xe7\xe7_\xfe\
-sws\x86\xd7\x9e\xa4\xa9<x\x1c\x16%\x8ec?\
-\x93\x82\x9d\xe5\x85\xff\xe9O\xf3\xb6\xbf\xfe\x7f\x13-\xac\
-\x12-\xac\xb2\xf0\xef\xfc\xb7\xec\xfd\xf8\x0f\xa1\xfc\xbdd\
-T\x1f\x1d\xd5y\xdd\xb01\xf5\xbe\xbc=\xa6r\x9a\xe1\
-\xd4\x91\x97\x1ei\x05\x06b\xd2\x16Jk\xaa<\x0f\xe6\
-5\xeb\xd1:\xe6\xdc\x85\xcb\x5c\xb9x\x99^\xcbq\x05\
-G\xb6~\x93-Y\x22Y\xbc\x9f\xb1n\xe3\xe3\x88\xde\
-R\xe82k\x8d&\x89\xdb\x18\x1b\xe3\xf2\x9c\xc9\xa5+\
-\xa4\xde\x13\xb7zt\xdeq\x95\xe1\xf8\x0b\x0cJM!\
-\x8a\x8eVd\xb1\xa7\xb3\xd8E\xf0\xe4\xa5\x22\xee\x9e'\
-_\xeas3\xdf\xc6\x95\x0a\x93\x0a}%,\xf4\x1d\xfb\
-v\x9bqeX\x90EZ\x99A\xab\x02\x97]B\xab\
-1\xfb\xd9\xbb\xb8~\xee\x83\xec-\xbf\x9dIz\x91\xd4\
-n\x91\xb9-\xe2\xb8\x0d\xde1\xd5\x09\xd3\xb4\xc5K\xed\
-\x15\xc6\x0e\x22e\xe9u\x83\x89G\x9c#i\xb5(\xab\
-\x02W\xe6\xe0<Q\xab\xcd\xa8*8(\x0b\xfe\xb5~\
-\x8f\x7f}\xa1\xcf\xa0\xb3\xcc\xefG\xf73\xbd\xf1|\x18\
-U'\xe0\x0bbU\xe1\xbc&/dV\xe3\xd0\x18\x10\
-S\x9b\xdc\xbcG1\x17F}\xb7oT\x82V\x80H\
-(\xc6\xd9D\xb9\xd5\xa7\xd3J\xe1\xed\x047X\xc7\xa7\
-\x06-!L(2\x82\xd7\xe0\x0d\xa4\x02\xd6F8\xa7\
-({1\x8b\xfd\x8c\xfd\xed\x9c\x0b\xf7\xdd\x872a~\
-\x5c}\xeb[\xc9z=Dk\x8c\x0aU\xec\xc3\xf3(\
-t\xaaIZ\x1d\x22\xa3\xd0f%\x84\xdd\xab\xd0J\x9d\
-\xba\xba}e\x1de1\xa5\x18\x17\x0c\xf6vy\xf6\xa9\
-\xdf\x0f\xa5\xb9\x82\xddi\x06B\xd6\xda\xbaED\x00\xa7\
-\xc9dB\xa7\xd3a4\x1a1\x1a\x8dj\x8bMH\x5c\
-\x15\x11\x9a\xf8\x80\xa6\xf9\xddd2\xe2\xdc\xb9s|\xea\
-S\x9f\xe2\xfd\xef\x7f?Q\x14\xf1\xc1\x0f~\x90\xfd\xfd\
-}VVVx\xe7;\xdfI\x9e\xe7lll\xd0\xef\
-\xf7y\xec\xb1\xc7\xf8\xd4\xa7>E\x96e\xc4q\xccx\
-<\xe6\xd1G\x1f\xa5,K&\x93\x09w#\x02\xbcQ\
-t\xd7\x09\xa4\xc2\xbd\x80\xcf\xd1\x0d\xa7\xf9}B\x9b\xdf\
-[\x90\x0f\xdb\xf7\x07\x07\x5c\xb6\x16\xadM]m\x96\x00\
-:\xda\xd76\xd7\xda\xc4\xa6\xa8\x9bo\x09W\x97V\xf9\
-\xee\xc7\xde\xc1C\xcb+\x80\xc2\xf9\xd3c\xdb\xe6\x9f\x8b\
-\xdaSu|\xbf\xdb\x9a\xc7jD\xbd\xd5>\xb6\xaa\xf8\
-\x99\xa7-_\xda\x7f3)\xbc\xf7N\xee`\xe7in\
-a\xcc7\xc6H\x13m#\x22T\xbb\xeb\xbc\xf8w~\
-\x90\xb7\xfc\xa5\x7f\x08J\x13?\xf8.\xba\xdf\xfd#\x8c\
-~\xf5o\xdf\xb1\x91\xd5)p\xcf\x89Q>\xa2y*\
-\xb6\x87\x96\xc2i\x9cW`\x22\x8cV\xa1\x10,\x0e\x9b\
-\x17\xb8|\x82X\x87\x894k\xfd%.v\x17\x881\
-\xd0?\x8f\xe9\xf69\x17wYL/\xb3S\xb6\x98\x14\
-\x96\xd5\xb5\x98\xabK\xf0\xd4\xef|\x8eW&C\xde\xfb\
-\x1d\xdf\x86\xcaR\x06\xe5\x98\xa4\xd3\x82\xfb.R\x91P\
-V\x96\x5c\x9d\xe3\x81\xab\x97X]\xda&\x1fO\x19\xee\
-\xdd$Y\xee\xa1\x16\x13|v\x1f//<\xc2\x8b\xdb\
-S\xc6[BK\x12\xde\xd6/\xf9\xba\xce\x80\x07\x1e\xc9\
-\xf8\xad'&\x18Y!\xd6\x8a\xe5\xbe\xe6+\xee~\x9e\
-z\xcb\x9f\xc4\xa3\x18,^\xc1\xebe\xee\xdf\x7f\x96\xbe\
-\xfe\x0a\xfbj\x0b\xf2/@\x92\xa0}\x0f\x87\xe6\xa0\xb7\
-Jy\xf1<\xbb\x9b\x07\xc4\x93\x9c\x96\x19\xd0o\xb7\x98\
-\x8c\xc7\xf8*\xa7\xd3\xed1\x19\xe7\x10G\xb8V\x86\xb7\
-%=g\xf9\x96\x95e\x1e_X\xe2s\xbd\x0b\x1c\xc8\
-2\xed\x9b/\x86\xb9\xec,\xce\x06\xe6\xab\xf18\xf1T\
-\x8e\xba\x92\xb4\xc3\xdaP\x11\xc4\xbeJ\x8d<\xa4\xe65\
-\xad\x11\xc2\x8aP\xf6jn''x\xc9\xd1\x95\x09\xfa\
-\x81jZ\x97k\x94\x0a\xdd]\xe3D\x11a\xb8t\xff\
-\x03\x9c\xbfx\x81\xb2\xcci\xf5:\xa0\x22\x22\x15\xcc\xee\
-\x18\x88\xe3\x14\x13Eh\x1d\xcc\xea\xca\x84\xb4\x08\x1d)\
-\xb4Q\x18\x1d\xa1u\x84\x8aAE\x11\xc6hf]o\
-\xbd`\x9dg\xef\xe5\xeb|\xf9\xa9\xa7\xa9\xea:\x91B\
-\x98k(E)\x06\xefB\x09\xb0\xb2*\xa9TD\xac\
-\x22\xf6'#r\xd1\xb5?\xbb\x89\xde;L\x80\xd7\xda\
-0\xc9'<\xf8\xe0\xc3\x94&\xe1\x99\x97^\xe1\x89\xcf\
-~\x81+W\xae\xf0\xf0\xbb\xdeK>\x1e\xb3\xb8\xd0g\
-\x5c:\xf6_\xbc\xc6/\xfd\xe2?\xe4}\xef{\x1f;\
-;;\xb3D\xd7\xaa\xaa\xc8\xb2\x0c\xe7\x1cY\x96\xb1\xb5\
-\xb5u\xe8\x22x\x13\xd1\xbdW.\xb8+\xf0\x99\xef@\
-\x7f\xb8\xe1\xc8Q\xb3\x894w\xf0\x1ci\x05\xa3i\x0e\
-\xa3\x9ct\xb1\xcd\xd4\x98C\x95|\x068\x9aYQY\
-\x09&\xd8o\x7f\xf0a\x1e\x5c^9\x12\x12~\xecn\
-N}\xae\xd7\x12|\x9cs\x14y\xceW\x0f\x8et\x15\
-\xf8\x1a%\xb1vw\xe3\x8b\xd7\xff\xcf\xff\xe6o\x12\xc4\
-\xb63\xb1\x9d\xd13\x9f\xe0\xc6G\x7f\x8cK\x7f\xe2G\
-\x01h\x7f\xdb\xbfM\xf5\xd2\xd3\x94O\xfd\xf3\xdb\x1ew\
-T\x13=\xb2\xf6\x94\xbf\x81\xacWx\xa5\xd1Y\x08\x83\
-\xa7\x9e\x17\xe2\xc1\x95\x05Z<\x1eG\x1a%\xbckY\
-\xf1PgH\xd1I\xd1R`F\x11Yv\x958K\
-\xd9\xab*\xba\x99a\xb5o\xd8\xd8~\x85\x17w\xd7\xc9\
-\xda\x1d\x92bJ\x96\x1a$\x8d0F\xa0\xdb\xc1\xee\x8f\
-\xe8\xefz\xfaF1\x89c\x0e\x80\x85\xa5>\xc5n\xcc\
-\x05\xb3\xcb\xb2\xcay!z;\xcf.\xad\x92\xdf\xbc\x86\
-\xb7\x0a\xab\x85r\x5c\xd1M\x85\xb5\xd83\xb1`\xbb)\
-K\xc6\xd0Y\xed\xf2\xd9\xfd\x0f\xb3\xdby\x07^E\xc4\
-\xfb\xcf\xf3\xc0\xee\xff\xc5\xbfW<\xcb\x9e\x8d\xf8\x7f/\
-?\xca(K\xf1y\x0bW\x1a\x5c\xb4\xc6v\xf7q\x16\
-\x8a\xebt\xec\x0eJ\x09F%$q\x87\x22\xb6L\x8b\
-)Q\x06Fy\xaa\xe9\x14\xe2\x04\x04zq\xca\xa3\x0f\
-\x9dc\xad\xd5\xe7\x9d\x16\xbe~c\x9f\x91\x16\xaeK]\
-\xff\x0c\xc0\x0b\xce\xfb\x9a\xc9\x0a^\x1b\x5c\xe5\xea\xe4\xca\
-W\xdf&W\xe6\xfb\xf1\xd4\x91l\x1e\x8f\x99\x8f\x8a\x13\
-\x8f\xaf\x5c\xb0r\x88\xc7\xd5\xed\x0a\x1a3{\xf8\xee\xc2\
-{\xf6\xda\xa1MB\xab\x15\x22\xbbt-\x8c\xea\xba\xd9\
-d(\x06\x0c^[\xbc\xd6\xe0#\xb0\xa1\xce\xa36\xd4\
-\x11f\xa1\xde\x1f\xca\xd0DY\x06~\xe0\x11\xe5\x99\x96\
-\x05\xae)F\x1c\xa5\xa4\x8b\xab$\x17\xaf\x22\xad\x1e\xb6\
-\xdd\xa1\x22\xb4y\xb768\xf9\x07\x02\xe5J>\x170\
-\x11\xc0\xa6\xd3j\x91\xa6)\x22B\x9e\xe7\xe8<GV\
-V\x18Em\xd2sW\xf8\xe8VD?\xb7\xc4&\x22\
-\xd6)k7v(\x0f\xb6x\xe13O\xb0\x18\x15\xf4\
-\x17\x16\xf9\xecg?\x8b1\x06\xef=\x93\xc9\x84K\x97\
-.1\x18\x0c\x10\x11666\x88\xe2P!\xe3\xb5$\
-\xc5m|{g\xa0WW\xb9\xe0^\xcdns\x1b\x9a\
-\xd7pX#T\x8e\x1e\x5c/(\xa0\xb0\x15\xf9p@\
-\xb6\xd2c\xea\xea\x8a\x02Z\xa3<\x88\x09\x9a\x8c(\x85\
-\xf2\xa1\xa7\xcf\xc5V\x8fG\xd7\xce\xc1\x5c6\xf5\xbci\
-\xe6N\xcfu;\xf09<\xd7\x9d\xc1\xc7Z\xc7t:\
-\xc5I2;\xc7\xbf5\xfa\xa7\xb3\x10\xc8y:\xedU\
-v\xa3\x88n\x1c\xcfL\x0f\xcf?\xf7\xdc\xaf\xfd\xb5\xbf\
-\xfcW~\xf6\x94]_O\xaa!\x1d\x80\x11\xb0N(\
-\x99sf{\xd9\xe6\xaf\xfd\x04\x9dG\xde\xcb\xc27\xfe\
-!\x00\xfa\xdf\xf7\x17\xd9[\x7f\x0e\xb7\xf1\xc2kz\xa3\
-\x12)\xa2\xa4\x05\xc6\x84\x0e\x8dJ#\x95\xc3\x91\xe3\xc6\
-cD,\x18C\xbfmx\xb0_q\x7fO3\xb47\
-\xd8\xdd\x9b0MVh%1#WR9\xb8\xd2\xd1\
-<\xdc.yqs\xc4\xd5K\xcb\x94q\xca\xcd\x9d-\
-.\xc6\x9as\xfd\x88\x05\xd9`x\xa00S\xcb\x92(\
-\x5cl\xe8\xa85\xd6\xd5\x00\xc3%.t\x17\xd8\x9e\x96\
-\xec\xe49\xd3\xa5E\xa2$eaa\x858\x8dI\xf3\
-\x1b\x0c\xf3\x98\x17WW8X\xbfF|\xf9\x12\x1b\xdb\
-\x13z\x8b=~\xef\xe0A\xb6\xdd\x15\xfa\xd56\xdeB\
-\xf4\xca?\xa2[|\x8c\x0b\xad\x0e\x0f\xfe\xff\xec\xbdy\
-\xb0m\xd9]\xdf\xf7Yk\xed\xe1\xec3\xde\xf1\xdd\xfb\
-\xee\x1b\xbb[\xddjuK\x02\x09!\x10\x22\x8c\x86\x10\
-S@a\xac\x98`\x88]\x90J\xa5\x92\x8a)\xbbL\
-H\xd9U)\xe2$v\xca\xff\xd8$\x95\xc4\x89c\x8a\
-8\xe0\xe0\xa4bC\x80T\x88\x82\x11\x12\x85@H\xad\
-\xa1\xd5\xf3\xf8\xfa\xcdw:\xf3\xd9\xc3\x9a\xf2\xc7\xda\xe7\
-\xdcs\xdf\xbb\xef\xf5}\xdd\x12t\xa4\xfc\xaa\xde;\xe7\
-\xec\xbb\xce>{\xaf\xbd\xd6\xfa\xad\xdf\xf7\xf7\xfb}\x7f\
-\xce\xf0\x0c\xe7x\xb9\xb3\xc6\xac:\xcbl\xfd2E\xe7\
-al{\x05n?EG\xbcB\xa2$\xa9k\xe1U\
-E\xabQ\x84\x8a\xa9U\x8epP\xe5\xe3\x90:\x90x\
-L,i\xf6b\xa2Lrf\xe8\xf8\xbej\xc4\x17\xb5\
-\xe1\x0f\x09\xb0\xc1\x82\x03WHb,*\x8d\xd0\xa5\x86\
-8f\x1e\x08\xa0\x8d\xc3\xb8\xa3\x9a/\x0f@L\x0d\xd4\
-\xc1\x05n\x89\xb1\xa0\xce\x95\xf1B\x04(\xac\x86\xce\xb5\
-\xaf\x10\xc6\x86\x99+\x05\xc6\xca\x90vW\xd7U\x12\x18\
-\x84\x94!?j\x01\x7f\x07\xb8=\xa4\x00\x06\x05\xb2\xa8\
-~ U}\x04\x88\xe4\xd1\x5c\x97\x84\x5c\xbd\xd0(\xc4\
-\xf0\xd5\x11g\xd6Y\xa4\x87\xf1A\x1fg\x0dN%\xac\
-|\xe3wSt6\xb9\xf9\xdc\xe7\x99\xee~\x09\x9d\x17\
-!4?\x8c\xc6\x07\x1e\xbf/!B~\x92\xf5\x8b\xdc\
-F/\x04RI\x92fF\xb6\xb2E\xf7\xd1\xf7\xf3\x1d\
-\x1f\xf9(\xff\xe2\xe3\xff\x17\x93\xc9\x94n\xb7\xc3l6\
-\xa3\xd3\xe9\x90e\x19\xbb\xbb\xbb\x14EA\xab\xd5\xa2?\
-\x18\xfe)\x87S\xbf\xb9\x9cZ\xf1\xdc\xeb\xf8\xdb\x85\xdd\
-\x16\xbe\x91\xba\xd0Z8~\xaf_\x14\x8c\xfa\x03\xba\x97\
-\xce3\x90\xe0|\x8d\xeb/+\x1f+\xf12\x98\xeeg\
-\xdb\x1d:I\xe3\xe8|\xe2\x0e%\xf16\x94\xcf\xbd\xee\
-\xf1$\xe5\xe3\x9c\xa5*\xcac\xed\x95\x92$i \x90\
-\x0c\xf7\xbf|\x97\xc7\xa5\x19\xc5\xb4\xe3x\x91\xa3\xd4\xe9\
-v5a\xf1\xff\xd3\x94\xf9C)\x09\xc9\xa2\xfb\x04\xba\
-\x1c\xf3 'y\xe3\x1f\xfd\x0d\x1e\xbf\xf4\x04\xf1\xd6%\
-D\xd2\xa0\xfbW\xfe\x1e\xfd_\xfci(g_\xb1\x0b\
-U\xb1\x82$\x0ed\x91\xd6\xe2\x9d\xc6\xda\x90\x9fcu\
-\x15\x9em\xec\xc9\xf0T\xd6\xd2\x9fY*\x13\x9c\xbc\xb9\
-\xf5\x1c\x8a5\xfa\xc4\xc4B\xf0\xe8\x96\xe2\xbd\xefV\x9c\
-\x95\xeb\x98[\x86?\x18\xef1\xb95\xe4\xc6\xcd!\xdf\
-\xf7\xc15.5\xaere\xd8\xa55\xed\x10%\x15:\
-\x8d\xc9\xc6[tf\x13R\xb9\xca\xb5\xed\xcb<\x9b\xc7\
-\x98q\xc1F\x9a\xa1\x9c\xe7\xb1\x8b){o\xecs\xf5\
-\xf6\x15\x0e\xcas\x94\xd3\x0c=x\x88\xa4\xd1`\xcaS\
-|\xfa\xb5\xeb$\x9d\x92\x0f\xaf\x1f\xd2(\x87\xd8<\xe7\
-\xb9\xc9m\xcax\x80mn0\x15\xe7\x18\x8d\x1ff\xbf\
-\xf5\x18\xb3f\x07\x9b\xb4Q\x1a6\x86/\xd3\xac\xae\x22\
-e\x1c|\x0c\x22\xa1\x9d*b\x11\xd3\x171eQP\
-Y\x8b\x92\x15\xb6J\x89\x1a)\x07\x22\xe7\x8d\x83]6\
-\xce^`\xf70gz(\xb0\xa5 \x8e\x14\x9b\x9b\xeb\
- \x8e\x1c\xff\xb1\xf0d\xcd\x06\x07\xbb{!,\xbb\xf6\
-\xeb\xf4\x0fG\xf4\xfb\x83\xb7L\xc9\xb2(\x89P\xa3\x12\
-\xc1\xca\x0a\xfeZ\x08sc:\x9bqp\xf5V\x9d_\
-g\x1028t\xc3\xa0\x9cG=\xfazF\xcb%\xc5\
-\x13Np\x8c\x0bq\x9e\x9f'\xe6\x90W\xf0#\xcd\x17\
-yG\xf0\xef\xb8\xfaL\x0b\xbeGg\x17\xb9B\xb3\xf1\
-\x84\xca:V?\xfc\x03\x8c\x0c<\xff\xcb\x7f\x9f\xd9\xed\
-\xd7\x1f\xf8\xdeE]\xdb\xebA\x15\x94\xfc\xdd\x7f\xce\xc1\
-\xf3\x1f\xe3\xd1\xef\xfe\x11b\xf5<\x83\xc1\x80\xaa\xaa8\
-{v\x9b\xabW\xaf2\x9b\xcd\x98\xcdf\xc1\x12:e\
->\xd5\x9f\xa6\x9c\x12j;Y\xa1\xdc\xf9\xe7\xb7\x0a\xbb\
-\xcd\x87\xca\xbd\xbe7\x17!%\xe3\xe1\x90\x0d\x07B\x0a\
-D\xd00\x08\xecq\xe5\xe3\x148G3JP\xcb\xf8\
-\xe6]\x10\xdf\xdb\xb7|N\x03\xbby\xef\xef*\x8c\xb4\
-\xbe\xb5E\xa7\xd7#m\x04:\x8c;'\xed\xf2\xc7\x95\
-8a%I\x16\xf9I\xbd\xdeJ\x1fx\xf1\xae\xce\xfa\
-\xea\x8b'X8\x05G\x1cmwY<s\xbc\xf9$\
-\xb1\xf9\x84\xfd\x7f\xfc7\xd8\xfa\xb9_A\xa6\x19\xd1\xe6\
-\x05:\x7f\xe9o3\xfa\x9f\xfe\xd6W\xec\x22U\x14A\
-\x1c\xe1+\x8b\xf7\x06[\x168\x13\x22\xb1\x8458!\
-\x89#\xcf#\xed\x94\xcd$\xc6X\x8bv\x16\xfc\x0cm\
-,\xa5\x8a\xd0\xc9:\xe7\xb2\x06\x17]BtK\xd2\xa3\
-\xcbv\xc7\xf0\xeei\xc2\xbe\xcf\xe9\xdf*\xb9\xf2\xdc\x8c\
-+\xdbO\xb0;\x8e\xf9\xf6\xd9\x80V2\xa3[U\xb8\
-\xf1\x16\xef\xd2\x0fQ\xa6\x92/nnqx%\xa7D\
- \xf3\x923\xd7\xafqPM\x98\x1cZ\x1al\x83o\
-\xf3\xc5\xd7\x0c\xce\x144\xa3}\xa6\x13Gd\xc6\xbc{\
-\xcds\xb11c\xff\xf6\x00\x9b\x1f\xa2l\xc4\xb4\xf5~\
-\xfe\xb7\xec{\xb8\xdd\xfd\x16\xae\xa4\xe7\x99\xd2!\xae\xa6\
-\xac\x0e^`m\xf24\xeb\xd5kL0\x01*\x8a\x14\
-\xbal\x91\xc5{\x18\x0d*j\xe3\xaa\x02\xeb,\x02E\
-U\x14\xc8\x15A!*^\xec\xf7Y/\x9b|\xfe\xb5\
-\x1c[\x9ec\xec\x9bH!\x88\xd3zyp\x04?F\
-1\x85\x12V\x9b):\x8e0\x84%_\xa9\xe3\x83\xf7\
-A\xa30}]\xb2~\xee\xe4Y\xb0\x03\xcc\xf3&\x94\
- \xef\x8f\xb8\xb6?X\x9a\x87\xf3\xbc!\x11\x8a<\xca\
-9\x97\xdf\xfc\xc7\xe7\xf6\xc6|\xb5\x99\xaf<Gx\x85\
-\xa8-*\xe7<J\x845eq\xe9K&\xc2rm\
-)g\xcd\xe2;\xf1\x99s\x88\xdeY^\xfa\xe5\xbfK\
-\xbe{\x05N\xe4^\xb9\xbf4\xbb=\xaa\xd9\x0c\xad\x1f\
-\xacJ\xa8s\x9e\x9b\xbf\xff/\xd88w\x89\xce\xd6\xe3\
-\x8c\xfe\xe8\xb7QQ\xcc`0B P*$+\x0f\
-\x87c\x84J\x10\xea\x9d\xa5|\x1e\x90\xb9\xe0>\xc7\xdf\
-\x8e\xe5C\xadH\xeeq\xfe\xb9H`<\x9b\x11\xe9\x0a\
-\x95Dxi\xf0\x08\xbcS\x01{\x95\x12\xe9\x05N\x04\
-\xe5c\x05w\x17S\xbb\x87\xf2\xb9\xe7=\x7f\x05\x95\xcf\
-\xb2tWVX\xddX\xa7\xd1l\x1e\x9dA\x1c?\xd7\
-\xfc\xfdZ\x9c\xb2\x96&\x0b\x8bg\xa5\xb7:%@]\
-\x7f\xda2_\x1d,\xc1\xd2yK\x85>\xec\xee\xeb\x1c\
-\xfe\xea\x7f\xca\xc6O\xff\x97\x004\xde\xf7]\x98\xef\xfa\
-If\x9f\xf8\x95\x13\x7f\xf0\xde5\x8bN\xbaB\x8fP\
-\x81\x97\xcd{\x875\x06\xef\x0cB)\x84\x03c5i\
-$\xf8s\x8f\xad\xf3c\x8f\xae\x92\x19\xc3\x1b\xe317\
-\xa7\xa1Pt+.\x98\xf8\x01\x8a\x88\x15\x9f\xe2\xa6\x96\
-\xfe5M\x8e\xe7\xcc\xb9.\xdf\xbe\xde\xa4\x98ZR\xd7\
-\xe7\x0dV\xf9\xbd\xe8\x11\xaal\xcaS\xce\x93V\x0d\x1e\
-=\xf0l\xcf$-\x11\x1c\xbc\x97\xb7\x12^)<#\
-\x0c\xdd\xe86I\xdfp\xa8\x9bTn\x85f\xdc\xe1\xa2\
-\x944\xb6\x9a$~\x9f\xdb\x87C\x9e;\xd4<\xb2\x95\
-pi]2\xf6\x9a\xcf'?\x81r97\xce_ \
-_\xff\x06\xf6\xb23\x94\xbe\xcb\xc6\xec%\xb6\x0f\xfe\x15\
-\x9d\xb6Fr\x88\xe8L(rO<\xabX\x97\x02\x1f\
-\xb5\xd9\xf2\x13\xb4_A\xc5\x87D2A*\x892\x92\
-$\x89\xf0XLa\x90-\xc9\x1f\x1c\x1c\xd2\x18t\xb8\
-9\xd5L\xec\x80V\xd6\xc2\xe7~\x91\x89]\x13\xd1\x10\
-)E\x9a\xa4\xe4\xae\xaeD\xe2\xc1\xc99\x88\xfd \x0f\
-\xe9\x8eGf=D\xcbI\x97\xd4\x14:\xc7\xf1!\x8f\
-C\xc9@7c\xad\xc0Z\x8d\xf5\x9e\xed\xadmf\xb3\
-1\xba0H\x15Q\x19\x8d\x90\x12)%I\x1c#\x1c\
-\x14UE\x14\x85\xd8o/\x82\x85S\x14%Y\xb3Y\
-'bzn\xdf>\xc0\xcf!\xc39'\xdbR\x22\xe8\
-\x9c$\xd4\xf9\x90\x8c\xdc\xbd\xfc\x04\xfd\x97\xbf\xc0l\xf7\
-f\xc8uz@\x11\x02z\xdd5\x06\xc6\x06N\xb9\x07\
-\xea?\x81w\x86[\x7f\xf2q\xce\xfc\xf8\xcf\xb2o~\
-\x93\x08K\xa4\x14RI\xbc\x0b\xf9_\x00\xd1W0q\
-\xf4+%\xa7\xaa@z\x7fu\xf2V\x95\xcf\xd1^$\
-8\x0f\xee\x8cj\x9b\xafqG\x22e\xa0\xf9\xa6\xd4D\
-\x8d\x04c%B\xd6\xceM_\xffs\x0e!\x14Q\x0c\
-\x07\xba\xa24\x16\x19\xc7\xa1\x90\xd3\xbd\xae\xfbn;\xec\
-x\x9b\xb7\xab|N\xd8\x02\xc6iJ\xa3\xd9\xa4\xd9\x9a\
-s\x98\x1d\x9d\xe1N\xd8\xad\x99\xa4\xb4\xd2t\xa1x\xda\
-m\xf1g\x01\xb5}\xc5DJE\xf1\xf9\x8f3\xfa\xbd\
-\xf7\xd1\xfd\xee\xbf\x0c@\xfb\x07\xff=\xf4\xf8+\xfdk\
-\x00\x00 \x00IDAT\xd5g\xd0\xaf~\xe1\x8e\xd6\
-\xf7[\xd0N\xd8\xca\xd4e\x8bm]\x9b\xc9\xe3\x90q\
-\x8a\x00tY\xd0\x8c\x15\x7f\xe1\xdb.\xf3\xa3\x8f\xafs\
-1\x15T\xa3\x19BX\x8c\xf7\x184\x0f\xafO\x18\xe5\
-9\x83b\xc8t0\xe6\x8a\xeb\xd0J-\xe8\x00\xdfx\
-\x0cyY2mz^\x89V)}\x82L5\x87\xd1\
-&\xcd\xb2\xe4\xcax\x82q\x8e--\x98JG2\x9a\
-\x92]\xdc\xc27\xdb\xdc\x18E\x0c\xcb~\x9d\xebQ\xcf\
-\x91$\xe1C\xdf\xfc\x04\xeb\xed\x1e\xff\xe3\xff\xf2\x87\xac\
-G\x03~\xe0\xbd\x97\xe8\xbb\x19OM\xbf\x93+g~\
-\x0c/\x15\x95\xca\x90\xc6\xd2\xcd\xbf\xc4\xf7\xfa\xa7\xf8\x81\
-\xe6o\xf3i\x19\xb1\xbf\xf2CTY\x84\x9fxF\xba\
-\x8dk\x9d\xe3vt\x89\x89_\xe5\x03\xf9\xff\xc1\x9a\x5c\
-\xe3\xb5d\x80j*\x9e\xd1\x87\xcc\x9c'Nc\x5c\x1c\
-\x81\xd0\xc8H\xf2\xa2\x9e\xd1)\x0fX51O\x0d?\
-\xcf\xb6=\x03\x91\xc0KYW\xf1\xf5\x8c\xc6\x13\x945\
-4[Mn\x1c\x8cB\x99\x05\xa5h$\x11\xa7\xa5\xc6\
-\xb9\xb7,\x95/\xe1h\xa1_\x9e\xff\xc1\xdd\x12\x11E\
-\xc1R\x11\x22B;\x8d\xf7\xf0\xc4\xfb\x1e\xa7\xdd\xea\xd0\
-\xedt\xb1U\xc1g>\xf3G\x9c9\xf7\x10\xe7\xcfm\
-\xe0\xb5#JR^x\xe1Y\x04\x09O<\xf9\x18q\
-\x92r\xed\xd5\x97x\xf6\xe57\xf8\xd6o\xfdV\x9c\xae\
-\xb0\xb6\xe4\x13\x9f\xfa\x14\xa3i\xc5\x9d\xea.\x88\x0b\xb0\
-#5o\x9b\xf7\xc8\xf6*\xe3W^\xc2\xbb\x07B\x9b\
-\xeb\xeb\x0f\xe7\xbdu\xfd\x0a\x10\xe6\x84\xf7\x96{\x15\x97\
-;\xb1\xd7<\xcc\x86\x87a<)\x85\xc2\x86\x8d8\xa2\
-\xae\x91\x14\x12R\xef\x95\x98\xffg)\xa7N \xbd\x9f\
-\xb5\xb2\xfc\xf7\x07\xb7|\xc2`\x93R\xde\xb5\xe3?\xe9\
-:\x8c\xf7\x98\xe9\x94t\xb5MIH\x18\xad\xa1\xda\xc0\
-P-@xO$\x14\xb7\xca\x19W&\x03\x9eX\xd9\
-<\xae\xc2\x8e\xac\xed\xaf(\xec\xc6\xd2w\x8f+\x9f\xfb\
-\xdf\xd3\x09\xdf8v\x9e\xaf5\x91u8\xe9\xf0\xd7\xff\
-!\xe9\xc5'H\x1f\xf9\x00\x08I\xf7\xa7\xfes\xfa\xff\
-\xe0\xaf\x1e%\x97zB\xb0\xc8\xb1o\x1f\xef\x9d\xe5g\
-q\xf4\x88\x1c\xae\xb6t\xa4'0\x8a;O\x22\x05?\
-\xfc\x0d\xdb|\xecC\xe7\xb8\xd0\x8a\x88t(\x04\xd8\xce\
-sV\xb2\x167&\x92k\xfd\x8c\x157b[L\xb9\
-\xed\xfb\xdc\x18N)\xa9h\xc8\x94\x8b\xb2G\xe6%v\
-Z\xb1W\xb6h\xb7=?\xe8\xaf\x11W%\x16\xcf\x9a\
-3\x8c\xda\x06/\x0c\xfdY\xce\x84\x9c\xab/\xe5\x98'\
-\xbb\xb4\xd6VpEIN\x8et\x81\x1b\xceJ\xc8\xd2\
-\x8a\xcb\x9b3~\xef\xa9)\xab\x83\x92\x1f|l\x95\xce\
-J\xcc\x17\xaf\x5c\xe6\xf9\xe8/R$g@\x08\xda{\
-\xbf\xc3\xa3\xe67x\xb8q\x9d\x8ffC\xd2\xfe\xeb\x8c\
-L\x07\xd1)Q\xf1\x19\x0ev[\x5cW\xeff\xd6=\
-\x87\x89\xdbx\x1d\xd1\xb0O\xf3\xbd\xc9s|f\xb8\x89\
-P#^\x12\xa0\xa5\xc0\x9b\x0a\xd9P8+`\xa2\xb0\
--\xcb\xebb\xc4\xd4%L\xf4\x8cW\xc7W\xf0+\x92\
-\xa2t!\x17$7\x14\xc5\x0c\xafK\x0a\xe3(\xb4A\
-\xb8\x02!\x1aT\x95G\x1b\xf3\xb6\x22\x9c|M\x10:\
-W@\xe1\x18w\xc0\x1d5c\x00G\xa5\xa8\xe7\x0d\x9e\
-y\xf6y\xb2(!m\xc4\xe4\xb3\x8a\xb8\xd1`4\xe9\
-\xf3\x99?\xbe\x825\x01\x1ak\xb6\xbb(U\xf2'\x9f\
-{\x0a\x09X'\xe8\xb6\x9a<\xf5\xb9?B\x888\xe4\
-B\xcd\xca\x13\xb3\xfb\x8f\x17\xa8;*\xc1 d\x84\xaf\
-\x8a\x85ut\xca\xbb%MSz\xbd\xee\xe23\xb5\xa2\
-\xa8\xaa\x8a\xc3\xc3\xfe\x03\x9cK\x04\xf6\x0dg\x11B\x86\
-dX9g\xf1\xf7w\xe3\xf7\xef \xb9\xbf\xe2Y~\
-\xf0\xde\xd7\xc8\x91\xb8k\x91]n\xfeV\x94\x8f\xf7 \
-\x16\x1e\x8c\x93\x97\xda\xf98s\x1e\x8a\xc9\x94DHB\
-\xc5%O(\xc2\x13\xdeK/\xebA\xeb\xc8\x9d\xe7\x0f\
-n\xdf`\xa3\xd1d+k\x87\x22m\xcb\x96\xcf=`\
-\xb7\xb7\xaa|\xeeu\x8f\xf7S\x1f\xc7\x7f\xeb\xe8\x82<\
-\xef\xe8q\xf3\xa6r?\x1e\xa7\xb9\xe2\xf1\xd6r\xf0K\
-?\xcf\xd6\xcf\xff3Tw\x03\xd5^\xa5\xf7S\xff\x05\
-\xfd\xff\xee\xdfG\x84*\x7f\xf7\xde\xe4,w\xd0RV\
-\xb2\xf7\x1ek,N8\xfc\xa2\x1a\xac\xc7X\xc37\x9f\
-i\xf1\xfd\x0f\xads6RT\x83)\xa5\xf1\xcc\x86\x15\
-\x13\xb3\xc6\xd5t\x8b\xcf\x1dZ\xfa\xb7&\xacT\x07|\
-{w\xc6\xb9\x86By\xc3\xcbUI\xe1\x1d\x8fv\xdb\
-\xf4D\xc4J\xdaf\x87\x88\x96;$.AY\x83\xb1\
-\x9e$\x01\xdd\xf0\x8c(\xb9\xe2s\xb4\xcaYw\x9a\xad\
-\x17>\x8d\x88\xd7\xe8\xa9U\x1eIJv-\x98\xc4A\
-4\xc5\xaa>/?3\xe4\x0f>\xf92?q\x19\x9e\
-||\x83\xe7\xb5e<9\xe0\xac\xf95\xdeS\xb49\
-\xa8v\xe0\xf0\x13|(\xfb]\x1ej\xb78\xbf\xb9\xc2\
-'ovy~\xb6\x0d\x07\x97\x18e\xdf\xcc\xa4\xd5\xa0\
-\x90mZ\xde\xf3-\xe2\x1a\xdf\xa4\x9f\xe3\x1b\xe5M\xac\
-\x960V\xec\xe6\xa3\xc0\x87&\xc0\x19\x07\x13\x83lf\
-\x08\x93\x22\x8b\x88A\xaa1i\xc9z\xb2\x83\x16\x15#\
-\xbbG^\x97\x8e\xb0\xce\xe3,\x08\xa9\xa8\xaa\x0a)\x04\
-\xc6(D\x14\xa1\x8dE\xdb{\xcc\xd9S\xae}\xde\xbb\
-Ev\xfd\xd1\x22\xbf\xa0$=v\xbe\xaarHE]\
-\xf6!0\xda\xdf\xbe\xb6\x84:\xd7?\xe8\xfd\x12\x86!\
-\x00v\x97\x14V}X\x88\x85e%\x10\xa8(\x0a\xa3\
-\xe5>\x0c\xbd\xde\x07=c\x17\xa1\xe4\x0f.\xce9\xb2\
-,\x0b<k\x01WD*A\x92\xa4\x1c\x1e\x1e\xf2\xa0\
-\x90eXC\xe7\xbe\xb1\xf9\xb1\xb9\xcf\xab\xf67\xbc\xc3\
-\xe0\xb67\xf7\xf1\xf8\xe3\xef\xefd\x1e8\xa9\xf9\xdd\xca\
-\xe7M\xda\xc2}Z\xdd\xf1\x1d\xef\xa9f9\x8d:\x0a\
-.T\xf0\x93\xb5#\xa7V,\xde\x87\xc0\x03\xe9y~\
-\xdc\xe7\xe37\xaf\xf0\x91\x8d\x1d\xce\xb5\xda\xa4*:\xda\
-!/\xed\x9a\xdeL\xf9\xcc\xdf\xcf\x95\x8f\x10A\xf9\xcc\
-\x01B\xe7\xef<\xcf\xd1=\xde\xf9\xee\xfe\xfdp\xbf\x1e\
-\xfb\xda\x90@\xd5\x1e\xa2\x0f\xed\xf8\x90\xfd_\xfa\x8f\xd9\
-\xfak\xff=HE|\xf9\xbd\xb4\x7f\xf8?d\xfa/\
-\x7f1\x14\x15\x13GV\xb1\xb8k?z\xb2\x1dn\xb4\
-\xc1\xa8\x08\x94B\xe0\xb1\xd6\xd1\x94\x82\x8f\x9c\xe9\xb0\xa9\
-\x1d\x93\xab\x07\xe1\x8c\x95eP\xa6|::\xc7\xa7\xf7\
-\x22v\xa7\x86\xc9tD2K8G\x93\xcb\xbe\xa2\x9b\
-NQ.\xec&+m\xf0iB\xb7\xa1\xf0J\xb1\xd6\
-\xf1\xb8\x0c|a\x19\x96\x8e^\x92\xe2\xade2\x8a0\
-\x85\xc45\x1at\xb3\x88\x87\xc6C\xce\xce&\x9c]\x19\
-\xf1\xe1vD\x99E\xdc(+\x9e\xcec\xbe$\xde\xcd\
-S\xafy\xf2\xc9\x17x\xcfC\x92\xd6\x85\xb3\x8c\x9f\x1e\
-\xe2\x8b]\xba\xfa*\xdf\xd3<\xe4\xea`\x87L\x0d\xf8\
-\x91\x0b\xd7\xf8\xcc\xf8\xfd\x5c\xcb>\xc2\xe7z\x97\xb9\xba\
-\xf6!\x5c\xfa0\xda\xaf\xd0\xa8\xf6\xd8\xca?\xc9_\xdf\
-\xba\xc9\x07\xe5\x80\xd9\xd5[\xd8I\xce5\xeb\xd9\x1f\x17\
-\x1c\x14\x13\x9c\x93\x81(\xd5y\xf0\x1aLJ\xd2i\xa2\
-d\x86\xa9&L\xe2\x09\xd9\x0a\xa8\x89\x0a\x85\xd7\x8a\x10\
-i\xa8\x80Xz\x84\x88j\xaa*\x8b\x12\x06a\xa7\xc1\
-Z1\xfa\x8eg\xf2`r\xcc\xa2X\x82\xdd\x8e\x8f\x19\
-\x88\xe2\x10\xc5\xe6\x1d\xa8X \x89\xbf\x0a3E-\xe0\
-\xbe\xa3k\x0b\xfe\x1d\xe1\xea\x989\xef\x90\xce\xdews\
-uo\x11T\x95\xe6\xf5\xd7\xaf\xdc\xf3\xefoE\x84\x90\
-\xc1\x87W\xb3\xe5\x87\xe0\x02Y\xd7\x12{\xe7!'\x0f\
-\x9e@Z\xc7\xd7?\x08\xecv7\x10u\xbc-\x1c\x11\
-p\x0a\xee\xec\xa4\xe3P\x95\x10PU\x15m?o\x1b\
-\xe2\xf2C\xd8\xe7\x11\xce\x8f\xf7\xb5I\xed\xf9\xdc\xe1\x1e\
-\x07e\xc5\xe3+\xab\x5chu\xd8H2\x9aJ\x91(\
-E,\xd4\x89\x0af\xf9\xbd\x87@4\xe9\xa9\x19\x8e\x8f\
-\x22\xf4s\xebh(\xc9j\xdc8\xc2\xa7\xb9\x97\xf2\xb9\
-\xb7\x9c\xa4|\xbc\xff\x1aVA5\x0d<\xde\xa3_\xfd\
-<\xfd_\xffEV\xffB`\x01j~\xf4c\x98\xd7\
-\x9f\xa3\xfa\xe2\xc7\x09}Q\x87\xcb\x9eR'[c \
-\x02\x19\xa7 \x05v:#\x11\xb0\xa2@Os\x0e\xc7\
-.\x94\xc4\xa8\x04\xaf\x9e\xb9\xcc\x1fO\x9b\xbcQ\x94\xe4\
-\x83}\xf4x\x88\xd6\x96\x83D1\xebI\x06\xb2BK\
-K\x1c)\x0e\xe4\x8cC]\xb0\xa1\x1blGm\x22c\
-PR\x22\x9c\x03\x0a\x0e\xc7\x86n\xa4\xe8\xa5\x8a-\xd3\
-\xa5\xdb\x9aQ\x8a\x19\x9bq\xc2\xf9\xcb9\xa9\x9e \xa7\
-]2?EG\xe7yN>\xcc\xf57\x9eA\x8bu\
-\xceu\x1f\xe3\xa1\xf5!\xc5F\x8f\xd5\xf6\x88G\xb7\x1b\
-l\x0eo\xf3PKsp8&M2^\xef\xfe\x10\
-\xbf\xad?\xc6\xed\x83\x0f\xb3\xd7\xebQ\xf8\x16\x8d\xf1\x8b\
-\x9c\x19\xfd\xef\xecL\xbfL\xaan\xf2pk\x0d7Q\
-L\xf7aj\x1d\x85\xf1\x0cKM\xe2\xeb\x90b'\xeb\
-h1\x8f\xb5\x1a\xefC^LD\x13\xed5\xfb\xd9\x0c\
-\x91k\xd28\xe6\xd2\xa5\xf3\xa1\x1c\x00\x01\xe9PJ\xa1\
-\xa4D\x1bM\x1c'\x8b's\xf5\xdau\xae_\xbfv\
-B\x86\xfc\xe9\x1e\xd8\xbc\x8c\x01\x8b\xc8\xb6\xa3j\x9f\x8b\
-3\xf9\xa5\x92&_\xf5\xdd\xfb\xf1\x99\xe8\x01'\x04\x8e\
-\xf0\xcf\x12XQ\x96\xdd1\xe2>V\xd2\x83\xc9\xfd\xcf\
-\xb3\xd8+\xd7\x0b\xe5\xdc\xe6\x9a3\xbe9\x11\xea\x8e\x1d\
-\xe5,\xbd92\xf3g!\xa7\xf2\xf1\xdc5|\xee\x80\
-\xdd\xdeL\xf9\x1cQ\xe4\xdc\xa7u}\xbe\x93\x5c\x22\xc7\
-u\x97\xa0,\x0b\xa4\xf7w$\xaa\xcd\x15P}\xc6z\
-\x94J\x15J!\xbc\x9c\x8f\xb8Y\xe5\xac\xa5)\x9bi\
-F7JY\x89\x13:\x91\x0ae\x0e\xa4X\xf0\xc5\xcd\
-\xcb\xe7\x86j\xbc\xc1\x84\xcd\x9d\xa5r\xa1\xe0\x81B\x90\
-H\x85\x94\x82\x995l\xa5MVV\xd3\x93\xef\x7f\xe9\
-\xf3\x9b\xc9\xd7\x8a\xe5sg\xe8\xf8I2\xf7\x09\xc8\x9a\
-\xefk\xf2{\xbfB\xf2\xd0\xfbh}\xe0\xfb\x00\xe8|\
-\xec\xe7\x19\xdcz\x19\xbb\xfb\x1aG\xa3\xb0v\xe6\x9d\xd4\
-/s\x5c\xa7\xe6\xbb\x0a\xa4}\xc1o(\xa5@kK\
-\x7fVq  m\x948\xe7\xb8Ym\xf0\xf9\xe4\x02\
-7\xf75\x93\x83\xeb\x98\xd1\x00_Nq\xc63\xb5\x02\
-\x9d)\xcaX\xd3\x93\x82\xb5fJ\x11YLn\xe9\xaa\
-\x0c\x87\xe5@8T\xbc\xcf`d8\x1c'4\xbd\xe3\
-\x893\x90\x9dOyW\x0a\xed\x8dC\xca\x99\xc3\x9a\x84\
-\xad\xde5\xcaI\xc6~\x7f\x877\x8a\x87\xf8\xc3\xe2=\
-\x8c\x87\x9f\xe7\x07\x9a/\xf1\xba\x91\xdc\xd2\x97)\xd9c\
-c3\xe2\xfd\xdb#.\xafx\xd4\xfe\x90\x7f6\xf99\
-\x9e\xe9n3inAy\x9e\x1b\xe9YR\x0c\xdf\xb1\
-\xfaYv\xc6\x9f\xe6\xb3\xb7\x9e\xa6a\xf6Y-,\x03\
-,\x1f\x7f\xbd\xa0\x1chv\xec\x1a\xabd\x0c}EE\
-\xc9\xa3\xedU\xdc\xcc\xf2Bn\x10*\xd0\xb6X\xedp\
-\xa5Gv\x13T#\xc5W\x0e\xabs\xc8\x14\x0deh\
-7\xdbx\x11\xe8\x9e\x1ai\x8a6\x06\x8f'm4H\
-\xe2\x18\xa5$^@\xba\xb7\xbb4\xc0\xc3\x8a\xf8 \xcb\
-\xb0\xf7\xae.U\x0dG\x16\x8f[\x9e\xdco?~\xe1\
-m\xcb<\xf0\xa1\xde\x5c:\x8fl\xf6\xf0u\x98\xf2\xfa\
-\xd9\xf3tW7@\x84\xf1\xef\xb5\xc5:\x8b5e\x88\
-\xda\xf3\xa1\xbe*5D7gX\xc1\xcd_\x82e\x0e\
-\x9eF\xabI\x14'acPW@\xc5Y\xac\xb1\xf5\
-\xfeK\xe2L\xc5x8:\xf2\x85\xd5k\x16\xfe\xce\xde\
-\x7fg\xae#o\x892\x078\x06\xbb\x9d\xde\xf2\xb9\xeb\
-\xc3}\xcf/|\x8d\xa9.\x1d\x16@YUD\xd6\xdd\
-\xa3\xeeym9\xc9\xe3VV\x84$\xf7\x96\xab\xf9\x94\
-k\xf9\x8cH\x08\x1aR\x12\x0b\x85\xa4\xaej]\xef\x12\
-<AY9\x1fv{\xa9\x8c\xc8\x94\x22\x8d\x22\x1aJ\
-\x11K\x85\x12\x02%$\xd6[2u\xf2\x16\xec\xc1\x95\
-\xcdI\xca\xe7kWD=\xfbj\xc3\x87\xfe\xaf\xfc\x02\
-\xc9\xd9G\x89\xb7/#\x92\x94\xee\xbf\xfdw\xe9\xff\xd7\
-?\x03\xe5\x12I\xear\x07\xf9\x80\xc7\xdf\xc9k\xee\x9d\
-EX\x1b&y\x8d\xce\x19\xe7\x19\xcc*\x06I\xc6p\
-\xf3a\xfaU\xca\x1b3\xc5KW\x0b&\x831f0\
-\xc4\x973\xb0\x1ac\x1di\xa4\xe84\xdb\x9cI{\xc4\
-\x8d\x88^\xabM\x89B\xcf*\xd6SE75\xbc^\
-x\xca\xae\xe4\xd6\xabS\x9e\xbd5\xe6\xa1U\xc5\xc5\xd5\
-[t\xbb-ZY\x9bA^0-%]\xa0,V\
-Ib\xcb\xf6\xe6\x1e\xd7\xd5{\xd8\x7f\xeae~p\xfd\
-\x15\xbe\xe3R\xc5g'{\xfc\xd2\xe7.\xf1\xa5\xfe\x8c\
-o\x99\xccx\xf2}\x11\xc5\xb4\xcf/\x7f\xf6G\xf9\xb8\
-\xfeqFg\x9b\x18\x9f\xb1co\xf3o=\xf1\x14\x7f\
-\xfe\x83\x9f\xe2\xc9\xe2\xb7\xb8\xf1T\x9f\xf2\xf9\x8c\x81M\
-QQ\xcc{\xa2\x1e\x07\xce\xd2\xec\xc4\x5c/fl\xda\
-\x0ege\x04\xde1\xb13\xce\xc9\x15^0\x07\x10G\
-\x88(AX\x83-*L\x5c!\xda)Is\x95\xe2\
-\xa0\xc2V\x13h\x06\xb6uo\x035\x8eq\x96\xaa*\
-\x01\x81\x94\xa1\x10\xd9<\xbcy\xbe\xa5<&\x0f0t\
-\xe7\xbep_\xcf77\x9f\xf4\xef\xb4\xe1__\xe7\x1c\
-\xf5\x89V\xcf\xe2\x5c\x18}\xdf\xfb\x97~\x9ao\xff\xa1\
-\x8f\x81\x93L\x07\x87T\xb3\x11{\xbb\xb7\x18\xf6\x0f\xb1\
-\xf9\x84*\xcf1\xbaB\x9b\x12\xa3KV;\x19Y\x92\
-btI\xa3\x91b+\xcd\xeb\xd7\xae\xe3\xac\xe1\xb1o\
-z\x1f\x9b\x17v(F\x13\xa6\xc3\x11\x18\x8d(*\xfa\
-\xfdC\xd6z=.\x9c?\xcf\xd3_\xf8\x12\xbf\xf5\x9b\
-\xbfI\xb1\xcc\x8f\xe0\x8fT\xce\x89\x06\xc3;H\xde\x16\
-s\xc1\x9d\xb0\x1b\xdc?\xe0\xe0^\x96\xcfIcL\xdc\
-\xa1pj\xf0\x09\x01hm\x90\xce#\xd4\xfd\x18q\xef\
-\xf0\x1e\xf9\xa0X\x82r\x09\x09`S\xeb\xf0\xdcM\xb2\
-\xec\xea\xcds;JXK\x1b\xf4\xe2\x84N\x9c\x90*\
-\x152\x99\x99\x17Ht\xc1\xac\xf5\xcb\xde\xa1\xd3\x8a?\
-\xf6\xee\xde\xca\xe7k[\xc4\x12\xe4ft\xc1\xfe?\xfe\
-\xebl\xfdG\xbf\x8aL\x9b\xa8\xcd\xf3t\xfe\xcd\xbf\xcd\
-\xf8\x9f\xfe\xadc$\xb2'\xf7\xd7\xd2Q\xe7\xc1\xea\x05\
-:7\xa7\xff\x9d\x16\x9ak\xe7\x1f\xe3\xd9x\x87\xeb\xb7\
-F\x1c\xde\xd8e\xea^D\x9b\x0a7\x1b\xe3M\x853\
-\x9a\x08\xcb\x99f\xc6\xb9\xcd!\xdd\xc4\xe2\xab\x1d\xb24\
-\xc2\x0b\xc5\xac\xca\xb0\xf2\x80\xcf\x1f\xeeSXId-\
-kj\x8do\xba\xd4B7\x87\x0c\x9a\x07\x8c]By\
-\xd0\xe6pR1\x9b\xa6\x88\xa2\x81\xb2M\xd6R\xc5\xf6\
-\x8a\xe2E\x17\x91\x16/\xf3\xc8\x9a%\xed5y\xf7\x05\
-\xcd\xb9[\x86\xab\xe3\x92?\xb7z\x96\xf5\xf3#>\xf7\
-\x99\x16\xbf>\xfe\xab\x0c\xfd\x1a\xda\xc6|w\xfc\xeb\xfc\
-\xcc{\xffo\xbe\xed\xbd{\x9c]\xbfB\xbc{\x85Y\
-\xa6\xd8\xe9f\xc4e\x8b\xd8\xc6\xbc+Y!\xc9R\xb6\
-\xa3\x16\x87{\x15\x1b\xba\x89.=q\x1c\xf1z\xe1\xb8\
-as\xe6QaJFx\xaf\xc0Z\x84\xb3\xd8|J\
-\x9a\xad!\xa2\x8c\xa2\xd8\xa3\xd7L\x88\x94\xa44\xa6F\
-\x03B\xd0N\xa3\x91\xa2\xa4\x0a;t\xe31\xa2\x5c\x10\
-\xf6\x1e\x97\xd3k\x8d\x05Y\xe6R8u\xe0\x89\xbb\xe3\
-\x1cw\xe3\xf0\xf7:\xe3}\x8f\x9e<\xb7\xde\xccs}\
-\xc2Qw\xb4\xe8w\xd6\xb7Y\xbf\xf0(\xd6hd\x9a\
-1<\x88H\xf3\x8a\xccZ\xb4\x92H\x19Q\xe9\x12Y\
-ED*B&12\x8e\x02\xd3v\x14\xe3\x9d#N\
-b\x9cW4WV\xe9mn\x92\xc4)H\x89\xcd\xa7\
-X!\x89g1R\x05\xa8\xd3\xe1\x17\xe3\xfa\xe8\x1a=\
-5\xe3('\xaf\xaa\xef\x1cy\xdb\x09\xa4\xcb\xca\xe7M\
-\xbf\xfb&+\xea\xbdw\xfa\xfeX\x1bg\xed\xe9a\xde\
-\x05(:\xdfE\x1dE~\x88c\xc7\x17F4\xbd8\
-a3k\xb1\xd9\xc8\xe8$\x09\xb1\xa8'\x9aw\x18\xcf\
-\xc2\x09j9\xc2X\xe7?v\xbfP\xeb\xbb\xaf\xcd/\
-\xfa\xe4kM\xf9<\x88\xe3U\x08\x11\x12\xfe\xbc\xc2\xdc\
-\xbe\xc2\xc1\xaf\xfc\x02\x9b?\xf3\xf7\x01H\xdf\xfb\x1d\x98\
-\xef\xfaI\x8aO\xfe\xea\xf2\xd9C?{8\xc6\xd94\
-\xefi\xe7\xb0\xde\x82\xae\x10q\x1chV\xa2\x88>\x19\
-\xa3a\xcc\xf3{7\x19\xdd\xdc%+\x0a\xb4\xb3\x94\xde\
-!l\x89\xb3\x06\xbc%F\xf2j\xd9\xe0\x137\x1d\x1b\
-\xca\xd2\x91\x03\x9e\xe8\x0c\xc8\x92\x88|\xf5\x22yz\x1b\
-\xe7F\xec\xde\x5ce\xdd\xf5hL[l\xa4\x11\x9a\x8a\
-\xab/]D\xa8\x98\xa4\x19qP\xad\xb2.\x226w\
-rP\x05R79\x9cm\xf1\xf4^\xc6f2@\xac\
-\xc4\x1c&]\xe2N\xca\xbb/W\x5c\xbfVQ\x8c\xf6\
-\xb9\xf5\xe5\x92t\x7f\x8d\xbfv\xf6w\xb82z\x86>\
-\x9b<\xd2\xf9_\xf9\xe0\x99g\x10\xfd\x98W\x9e\xefc\
-\xcc\x0a\x7f\xfc\xf2\x1a3\x9b\xd2i\xb7x2Za}\
-\xbcBW$\xe8R\xd0\x901FI\xbe4; \xaa\
-,\xe7\xb2\x1eC\x0a\xc4\x04\xac\xb78\xe7\x88\x91\xc1Q\
-\x9f\xc48\x19a*\x1d\x00\xcdX!\x84 M\x1b\x81\
-\xc1Y\xd6Nk\x19\x1c\xd7\x93\xf1\x84RW\x08\xef\xc8\
-\x9a-\xac\xab!\xa0z3\xf6\xe0\xe2\x16\xa1\xca\xd4\xf3\
-\xeb\xae\x8dh\xbds\xf5\xf3\x99q\xa2\x12\xf25=\xcc\
-\x09\xfeQ/@\xba\xa5\xe3\x9e\x10\x15\x1b\xde\x86X\xa5\
-z\xf6\x1e\xdb\xe1\x84\x12&\xf5\xd2\xb1x\xc5{|\x99\
-/\xa2\xe7|\x9c2\xb5\x82Y\xee\x18\xcf4\x93I\x8e\
-\xd6!\xdf\xc7;WG\xee\xd9\xba\x7f<\xc3\xd1\x98~\
-\x15|l\xceh\xf0\xaefRX\x0a\xac\x10\xa0\xa4`\
-\x94\x17\x8c\xf6w\x99\x1c\x1c\xf0\xda\xab\xaf1\x9bN\x83\
-\xb5yG\x0f\x1d\xff'\x8f\xde\x8b\xa5]\xff;D\x1e\
-\x08j;\x8d\xf29\x0d\xec6\x8fT\x0a\xf2\xe0\x1d\xe2\
-\xbc\xabY^\xef\xf1]\xbf\xf4f\x11{\x1f\x96\xabE\
-\x16\xe6|\xa0\xcf\x9b\x11|F;\xcd\x0e\x17\xda]\xd6\
-\xb2\x0c%\x14\x06\x87\xf1~a\xfe\x1fUE\x5c|\x11\
-w\x87mv\x1a\xe5s\x92\xbds\x92\xf2\xf9z\x91\x85\
-\xe5\xa3$\xc5\x17~\x97\xf1\xbf\xfa\x9f\xe9|\xcfO\x01\
-\xd0\xfa7\xfe]\xcc\xb5g\xb1\xaf~\xf1\x84\x9e\xbd[\
-T\x9a\xe1\x85\xc2\x19\x13(]\xe2\x14\x9f6x\xc9\xa5\
-p\xb5O\x7f\x7fJ4\x1b\xf3\xfeV\xc4\xab\xa5\xc3+\
-\xcfmc\xe9%\x02k\x15\x03\xabxz$\xb9\xf2R\
-DK\x0a\xd6\xa4\xe6\xbb'\x9a\xef\xb8\xb4\x8f\x13\x9e\xfd\
-Y\x86\x9et\xd8\xd6-\xc4\xaa\xe4\xb9\xc9>k\xe5\x94\
-U}\x03\xc5y\xb6\xb26\xc5\x8a\xe3\xd6\xfe\x98\xc7w\
-@\xaa11%\xbd\x9e\xe2\xc5[\x9e\xf1\xe8\x05\xbes\
-'\x83(f4\xb1\xacD\xf0\xe1\x0b\x8e\xff\xe6\xb3\x86\
-\xdf\xf8\x9d\x11?\xf5\xd1'\xd9I#\xba\xee\x90\x89;\
- \xef\xb4\x99*\xb8\xf1\xfcE\x06\xdar\xe3\x95\x16c\
-\xe3\xd9\xd5)\xc2\xc7\xbc\xaf\xb5\xc2\x8e\xe9\x91\xc41f\
-\x06\xcf\xed\x1e\xb2\x97O\xd8H\xbb\xbcZ\x8e(\xa6\x03\
-J\xbf\xc1\xcdjD\xe14\x12I\x8f&^\xc4\xa8l\
-\x05\xe5\x9bh\xa5Ak\xf4t\x847\x06\xefU(\x88\
-&D\x80\x9cM\x98\x03\xde\xe8@\xbfRZ&\xb3)\
-\xda\x18\xac9\xb9\xd4\xc8i\xc5\x07\x5c\xfbh\xc1\xad\x17\
-\xeb\xe5\x09P\x15\x9a\xc9\xa0\x8f\xf4\x82\xf3\xdbk\xcc*\
-\xcdpRb]\x88bM\xa4\xe2]\x97\xce\xd3jG\
-\xf4Vz\xacm\xac\xa3\x84\xa4\x9c\xce\xf0B\xf0\xc8\x85\
-\xb34\xa2\x08\xeb,Fk\x06\xc3!{\x93\xc1\x82^\
-}\xdc\x1fsu\xb7\xcf\xf5[\xfd\x1a>\x134\x13\xc1\
-#g\x15\xefyX0\xcag\xdc\xbe\xe1\xe8\x8f\x1c\xc6\
-\xcf8\x9cz\xec\xfe\x1b\xd4\x1c\xf9\xa4\x8d\x94s]\xb8\
-RI\xa4\x14\x81d4\xdc\xcc\x92\x97\xe1\x08\xc6\x91\x22\
-(\xbb\x90\xe8\xeca\x1e1\xb7\xa8\xae\x1c\x1a\x08BY\
-\x8a\x10\xb5\xa6\x88\x22E\x9a\xc4\x18}\xe4G\x8d\x94\xa2\
-\xa5Z\x08\xd9\x22mdD*\x09\x91mQ\x0cD8\
-\xbbKi\x8657\xdd;C\xdeZ=\x9e\x13\xffP\
-o\x1b\xee\xd3\xe6\xde\xb0\x1b\xf7\xb1\x0c\xef4\xb7\x05\xde\
--h\x00\xef\xdd\xdc\xcfwQ\xf5.\xcc\x13\xa2yj\
-\x85\xb3\x88\x98\xa9qe\xe1\xe0\xa1\x95U\x1e[\xdd\xa4\
-\x99&h\xef0\xce\xd5\xb9?\xe1\xc4n\xe9\xfcG\x86\
-\xed\x91S\xaf\xbe!\xee\xa5|\xeeyg\xa7\xe8\xbb\xaf\
-u\x09\xd9\xdc\xa2\xf6\x1dx\xfa\xbf\xf1_\x91\x5cz\xef\
-Qr\xe9_\xfe;\x0c~\xf1\xa7at\xc8b\x8b\x0a\
-\xf5Xr\x88:\xf0\xc0#\x90I\x82\xf4\x02[U\xa1\
-\x80\x9fR\x888a\xcf[\xdc\xfeU\xec\xd0\xb0&c\
-Z\x22\xe2_\xeb\xc4\xec\x96%\x8f\xb53\xd6cAa\
-,\x9f\x9aT\xec\xe7\x13\xa6&, ox\xc1t\xb2\
-B\xac\x9bl4\x04>\xf2L\x0bOU\xe6\xc8\x1eL\
-\x93\x82\xebo\x8c8\xa7\xbaD\xeb\x8a*\xcaI\xda\x19\
-W^\xcc\xf9TY\x92\x9a1\x89\x8f\xf8\xc6\xb3-\x9e\
-\xefW\x5cJ+\xd6Y\xc3\xefK\x92\xa6C\x19\xcf\xe3\
-[\x92o\xbf\xd0\xe3\xb3\xcf\xdc\xe2\xcf\xafV`\x1c\xa6\
-\xb4\xb4\x12Eu8\xa2\x18\xf6x\xe6\xb6\xe1f1c\
-2\x94X`{+\xe2\xa1\xee\x0a\xef\x12=b\x12r\
-\xe1ye0\xe0Z\xd9\xe7\xe9\xe1!\xad\xb4 GS\
-\xf8\x92\xcf\xe6{\x1cT\x13\x12\x91pv\xf5Q\x9a\xc9\
-\x0a\x85t\xb4Vv\x98\xdd|\x89\xbcU\x92%\x1d\xc4\
-\xa4\xa4,&\x14\x99\xe3\x99g\x9e\x0b]\x5cs\xa9\x85\
-\xd7\xe0\xdfq\xae\xa6#\x12\x9e\xb24\xf5\xe3\xa81\x83\
-\x07\xdc1\xf9\xf9\x06\x11\x7f\x94\xa4\xc9\xd2\x94\x12\x02\xab\
-+n\xde\xb8\x81\xd1\x15\xdbm\x81\xaf,\xbb\xb7s\xb4\
--\xc0\xc3N\xb7\xcdV;\xe6\x91\xc7\xcep\xe9\xd2\xc3\
-\xe4yN\x22\x15\xdbg\x1ecg\xf3\x0cJh\xb4\x9e\
- ED\x9c$\xf4\xfb\x07\xfc\xc9\x97_\xc0KI\xab\
-\xd5F9\xcf\xff\xf3G_\xe4\xb9\x17_\xc5\xbb\x08\xe7\
-,\xa4\x8a\xd6\x85\x16zt@\xb1?\xc2\xf4W\x90V\
-\x11'c|)\x11I\xe3\x88\x8fKFT\xc7L\xa5\
-Z\xa5\xcd\x97\x9c\xe5{\xad?UU\x85\x99\x0cID\
-\x81\x8e{\x84\x99o\x17k\xd7\x91\x15\x18\xd6\x9e\xf9\xe6\
-yy\xcf\x0c p\xc4Q\x04~\x9d\x88&\x91\xc8@\
-\xa6(\x11#\x84\xc2\x90\x83\x19>\xd8C\xf9*\xcb)\
-\xa2\xda\xfc\xe2U\xdccg\xbeh[/\xa0\x0f\x1ep\
-\xf0`rbR\xda\x92\xc2\x01\x1f\x22Fk\xda\x14<\
-K\xe6\xaeG\xd8\xf9\x04q\x0b%\xb4\x92\xa4<\xb9~\
-\x868N\xd0\xde\x1e\xcb\xf1\x99[6\xcb?\xe6\xe7\xf7\
-\xbb\xf4\xf3\xcb\xc8\xcf\x83(\x9f\xd0\xfc\x08B\xf8zV\
->\x08\x89\x94\x81\x09\xf8\xe0\x9f\xd4\xc9\xa5\xbd\x0dDk\
-\x85\xf6O\xfegL\xfe\xd1\xcf\x827\x0b\xc8e\x9eH\
-\xba\xdc\xf7a\x8f\xe1qF\x87Pg\x0fQ3\x0b\xc7\
-\xc5\x14\xa2\x82G\x1a\xab\xacF\x90XO\xdbK\x1aR\
-0*\x0c\x134\x95\xc9\xf1Tx\xd2@\xcdo=\x07\
-\x99\xe2\x0b&cc*\x88\xaa\x8a\xb2\xccYkD\xa4\
-\x05\x0c\xc7\x057\xa6\x1a\xd4:\x0f7Z\xbc6\xe9#\
-&9\x07c\xcb\xa4\xef\xf9\xc0\xca\x05\x12\x95q8\xea\
-\xb0\xe3%\xdb\xab-._X\x03\xef\x88J\x8dG\xe0\
-f\x9a\xefy\xfc\x0cy5\xe1\xd9\xeb#\x1e\xbf\xb8A\
-\xb7\xd3\x00\xe3\x913\x8f\xaf\x22FC\xc3\xa0(\x89\xbc\
-\xe4\xa1N\x8b\x8f\xec\xec\xc0T0\xb9\x15h\xf4Kc\
-8(\xa7\xbc:\x19a\xb2&C_Q\x98\x82\xdc\x15\
-\xb4\xd3\x15\xba\x22\xa6\x93\x9e\xa5\xdd\xda&J\xbb\xb4%\
-\xa1\x80\x5c1b\x94\xefa\xb7/\x91\xb5\xba\xb8rH\
-\x1c'\x5c\xbcp\x1ecC\x99\xf9\xe9t\xcal6%\
-I\x12\xba\xdd.Q\x14!\x95\x02\xef\xb9v\xed*o\
-\xbc1;\x81,\xf4t\x1a\xc89_\x17\x97[J\x22\
-_\x0a\xad&<i\xa4\x8a\xc0\x96\xe4e\x81\x8a3\x1a\
-\xa9\xc4W\x0a\xef\x1d*\x8ai$1\xeb\xeb\x1b\xec\xed\
-\xee\xf1\xfa\x95\xeb\xcc\x06#\x9e|\xf7\xa3\xec\xaf\x1f\xd2\
-HJ\xfa\xfd}\xa4\x80\xad\xed\xb3\x0c\xc7\x13n\xdd\x18\
-\xf1\xfak\xfb|\xe4[\xbe\x91\xeds\x1d\xb6\xcel\xd0\
-J\x1b\x94V\xe2m\x85\x97\x96\xebc\xc7\xcd\xfd\x98\xc8\
-\x9f\xa5r\x8eA\x95\x93\x8f3\x06\xe3\x84\x87\xb7/\x13\
-\xa2W\x04\xce\xc1\xde\xccS\x99ZI\xbb\xb9\xf2\xa1^\
-\x83<G\x09\xaca\xa0\xce\xc6c:\xd5\x88\xc7\xdfs\
-\x91\xcf\xbc\xb4\x87\xf0\x9eX\xa5\x81\xf4\xd4Zp\x81\x9e\
-\xc7{j6\x82e\xff\xcd\xf1\xfe\x13>\xc1\x0a\x87\x13\
-\x1e+\x5c\xa89\xe5\x1d\xd1\xa2\x9e\xd0;K\x1e\x10j\
-{s\xe5\xf3V,\x9f\xd3o\x90\x82\xaa\x17B\xe0\xe4\
-\x12\xc8\xeb!l-\xa8\xb3w\xe7\xe6\xeb\xbcT\xaf\x0d\
-\x0f\xde\x86\x87g\x9dC,\x18pC\xc4N3n\xd0\
-J\x1a\xe4!\xdd\x9d\xe3\xc1\x93\xc7\xaf\xd1\x1f\xfb\xbfn\
-U_\xceI\xca\xe7\x14wuW\xaf~\xbd*\x1f\x84\
-\x08\xf5O\xa4\xc2M\x0e9\xf8\xa5\x9f\xe7\xcc\xcf\xfe\x0f\
-!\xb9\xf4\xe2\x93d?\xf4\x1f0\xfb\x8d\x7fX\x0f\xb1\
-\x93\xc3\x0d\xbc7x\x17, \xa7+\xf0\x0e#\x05*\
-M\x91\x11\xf8\xa6\xe2\xaa\x9e\x92L`]\xc5\xe0%\xce\
-K*\xe7i\xc5\x11\xe7\xa2\x88BW\x94\xa5\xc6\x22B\
-\xae\xd7Lr\xe5V\xc1$N\xc9\x8c\xc7\x953\xa6\xad\
-\x98~\xbfdT\xcdP6f\xa0\x0a|\xe28\xafV\
-\xb96\x1d\xb1Rf\xdc\xc8\x0d/\x09\xc7\xc5fLd\
-$\xadD\xd0N\x13vo\xce\xc8\x8d\xa6\x93\xaa\x10\x8a\
-\xaf\xa1\xed\x15?\xf2\xe4C\x88\xa9\xc4Y\xc9\xde\xad\x92\
-\xc9\xd83\x1dyfF\xb3\xd6n0\xf4\x13\x1e\xd9Z\
-\xe1Cg70\xfd\x88\xcf\xdd8d<\xf5t\xe2\x84\
-\xa7\xab\x82\x89\x97\x14\xd9*E~\xc8\xa4\xe8\x13\xa9&\
-\xa9h\x11\x1bC\x92\xf6\x88\xd2\x0e\x02\x89t\x0e\x88\x90\
-V\x925\xd7)\xf7_\xa7\xb8\xfe2\xbd\x8d\x1d\x10\x11\
-RH\xe2$\xa6\x18\x17$qL\x9a\xa6DQD\x9a\
-&4\x1a\x8d\xfaQI\x94\x92D\xd1\xdd\xcb\xc8\x83\xf8\
-\xf8\xfc\xb2\xd2\x99'l\x1e\x0bg\x15D\xd2\xb3\xd20\
-\xd8Xb\xbc#M\x15\x91\x1b\x93D\x19\xd6K\xd2\xa8\
-d\xa5\x17\xd3\x8a\x1a\xcc\xac\xe2\xf2\xc5\xc7\xc8\xbb\x13\x86\
-\x07\x13n]}\x96\x0b;\x19*2x\xef\xe8\xdf\xbe\
-\xc5p4\xe5\xec\xea\x1a\xef\xba\xf88\xdd,\xa1)\xa7\
-\xbc\xfb\xd2\x06\x9fhdH+\x99\xe5\x9eiY\x82\x89\
-\xe9\xb6W)\xab\x12e-\xa6H\x18LJ*-q\
-2\x14v\x94\x84`\x08Sz\xbc\x0d%8\xe6e\xac\
-}\x1d&na\x9e\x9f\x81\xf5\x0e\xab\x0dg\xb7\xb7I\
-m\x87\x17\xaf\xee3\xea\x8fI\x1b\x113\x97SV\x05\
-\xceX\x9c\xb6h\xe3\xf1\xc6\xe2\x9d\x0dk\x9b\x03\xccq\
-x\xdf{\x8f\x13\xf3\xca\xac\xa1n\x8f\x90\xe0\x84\xc7\x08\
-x\x0b\xfc\xa5_uy\x0bP\xdb\xe9,\x1f\xf1\x00\xca\
-\xe7\xc8n\x5c~=a\xe0\xd6\x87\x94\x92!\x81k\xee\
-\xd1\xc4\xd5\x86\x8e\xab\xf1\xe2\x90\x17\xe0\x5c\x1dR[\xc7\
-\xc1\x87xxW\x13\x1f:\x04G\xca\xe7`4fo\
-p\xc8Jo\x05\xcd\xf1\x88\x9a\xbb\xae\xe4\x0e-t\xe7\
-\xdf\xefV>\xf7\xbc\x95\x13\xfa\xe3\xeb\xdd\xf2\x09\x0eQ\
-)Ax\x89~\xed\x8b\x0c\xfe\xe5?`\xe5\xc7\xfe&\
-\x00\x8d\x8f\xfc(\xfa\x95/`\x9e\xfd\xfd\xa3\xafxj\
-\x9a\x930\x1e\x5c\xa9AF\x08%\xc1Z\xbc\xd1\xb8|\
-\x06\xde!\xa5\xc2\x09\xc1\xae\xd2\x8c\xcc\x01\xed\x5c@e\
-h\xcb\x843\x8d\x16k\xa2EOE\xb4\xb5\x06o\xb1\
-\xde\xe3DI\xee3\x5c\xb5\x82\xc9+\x22\x15\xd1\x89W\
-@[\xe2\xc2p\x86\x0dzI\xcaJ\xac\xe8\xc9\x8c\x0c\
-\xb8,V\xb9ar\xa6\xcaa\x85fZVH\x93q\
-\xbb\xd4\xf4\xaa)\xd5\xae\xe4\xea\xb8B\x03\x22\x09\x04\x94\
-\xa6r()h\x8b\x984K\xc1\x0a\xaaJ@\x05\xbb\
-\xe5\x84\xd5v\xc4\xe5\xf5U\x9aq\xc4\x8b\xbb%{\xbb\
-#>u\xfb&c\x22\x9a\xceS\xf4\xb6\x01\xc70?\
-d\x90\xef\x22L\xc5V\xb6M\x1c\xa7!\xdb\xbe\x91\x11\
-\xa5\xa1<\x82\x88\xa3\xe0\x97mvXY{\x84\x95\xf1\
-\x15\xf6\xf2\x9bL\x0en\x84dH\x91\x22\xa4\xc4YK\
-Q\xa3\x05\xf3\xb4D\xe7\x1cJ)\xe28\xc2\xda\x00s\
-\x06\xe5\xb1\xbc\x11x\x00qG49\xe1\xdbsE4\
-G&<I\x1a\xb3\xb3\xb5\x0e\xde\x13\xab\x8cT%\xa4\
-q\x8a\x8cR\x8c\xf3(%h\xb5[H\x01\x1dU\xb1\
-\xb5\xbdEr~\x93/?\xfb\x05\xa2\xc4\x936 V\
-\x8a8j\xd2h6\xc9\x9a-\xe2f\x9b\xed\x9ds\xd8\
-\xa2b2\x99\xd1\xeb\xb4\xe8u\xdb\x8c\xf6\x07\x011\xa9\
-\x19\xcd\x85\xd1\xb5\xa1\x11\x92o\xbd\x15\xc0\xf1\xd2\xdc\xbe\
-\xaa\xa8\xca\x0aSV\xa05\xd6i\xac[\x0a(\xf0s\
-\xd8\xde\xe3lP<\x9b\xe7.\xf1\x81\xc7/\xf3\xc9O\
-\x7f\x9a\xd7o>\xcdpT\xa1\xa2\x04[\x96X\xad1\
-\xa6\x0a\xe1\xfduQ8[+3G\xa8\xa0{4\xfc\
-=\xce[$\x16\xbcA:\x17\x92y\xebHP\xef\x1e\
-\xf0y\xfc)\xc8[,}\xfd\x15V>\xc7\x8e\x9c,\
-\x0b\x0b\x89\xe0L\xb3rY\xe9\x1c)\x10\xac\x09\x09\x84\
-\xce\xe2M\xadp\x8c\x03kq.\x0c\x02a\x02V-\
-|\xcdo\x84g\x5c\x14|\xee\xe5\x17y\xe2\xc2E6\
-\xd7\xd6\x89\x94B\xfb{$B\x9e\x18Qs\xc2\xbd\xbd\
-U\xe5S\xbf\x9b\xab\xdfw\xde\xb0\xf9\xea\x89'P\xd6\
-\x87\x90\x9e\xd0\x0b\x93O\xfc\x1a\xc9C\xef\xa7\xf9\xc1\xef\
-\x07 \xfb\xce\x1fg\xf4\xe5O \xe4\x09\xd1m\x807\
-6\x90\xc5*\x89\xc7\x86pw\x17\xa2\x87\xbc\x0cc\xc1\
-\x02\x13g\x99\xfa\x0a/\x0c\x89\x9e\xd0\xd7S\xb6\x1a]\
-\x84\x8fX\x97\x92-\x910\xf0\x15\xb7\x991I\xda\xf4\
-}\xc5A\xd5\xe7\xb2l\xb3[\x182\xa5\xd8\x8e\xda\xac\
-\xc4m\xced!\xc7\xab\x81G\x09GQ\xc1\xccH\x9e\
-8\x07\xfb\x93=\xc6vJ\xd6\xad\xf0\x85%\x16\xd7\xb8\
-\x9e\xb7yq\x94Q\xd5\xf8}\xa2b\xbcw\x146\xe4\
-\xc6\x1b\xe9\x11\xce#QH\x0f\x09\x09\x87U\xcc\xd46\
-hO,\xbb\xa3\x01\xaf\xf4\xf7\xc8\xc9\xb0\x91`lJ\
-|\xde'\xf2\x8eiy\xc8DO\xc9\x84\xa2\x98\x1d\x10\
-7\xcf\x1277\x90Q\x82.s\x12\x99@\x94\x22\x1a\
-\x0dP\x09J\xa5\x5cj\xbe\x0b\xe3\x0d\x93\xb2_\x97\xa2\
-\x093\xbc\xdd\xed\xa0dL\x9e\xcfP\x91\xaa\xe9\x8e\x04\
-E\x91\xd7ui\xc22\xb8x~oa\xb0:\x1f\xa0\
-\xa1E4\xdb\x1c\x96Z\x1a\x15Q\x9c\xd0\xeau\xc1;\
-\xca\x5c\x93\xc41\xcdN\x17-\x12fyI\xdaP\xb4\
-bA\xa6\x0a\xb6\xcf6\xe9uAW\x13\xce\xae\x06H\
-\xb0\xdbl\xb0\xb1s\x99\xed\xcb\x8fC,\xb8\xfd\xca\xf3\
-\x0c\xf6\x0f)\xc67hd\x19\x8dFFC{\xb6\xd6\
-\xd6\xb8\xb2; I$\x8a6x\x15\x22\x01l\x01x\
-d\x0d\xd1X\xc4\x11\x93\x02P\x959z2BW%\
-ZW\xd8\xca\xe0\xcdr\x02h\x0d\xbfy\xc7\xfe\xed\x01\
-I\x1a!\x84\xe6\x99\x17^\xe1\xb5\xd7\xaf\x031\xa6<\
-D\xca5\x8c\xf5\xd8\xb2\xc2T\x15ee\xf0\xda\xe2\x9d\
-\x0b\xfct\xcebj(2\xf4z0g\xbc\x1b\xe1\xf5\
-\x18G\x13o\xd7\x11\xcd\x0b\x08%\x02\x84\xf9\xe0\x8f\xe4\
-\xab.o^\x16\xe1\x1eW}*\xe5s\xaa6Gm\
-\x8f\x1d8\xa1\xd1|\x11N\x924\x98\x90s\xc5\xe1}\
-(pnm\x0d\xad9\xbc18kA\xd7\x0a\xc7Z\
-0\xe1\xd5\xd7U\x04\xf1.\xc0o\xf5\x0f\x5c\xcbo\x93\
-Of<\xb2\xb3\xc3\xce\xf6\x16Y\xb3\x85\x91\x22\x9c\xe7\
-\x9e\x12\xf6\x81\xf7\xba\xec\xa3]\xd1\xc9\x1dyg\xbf\x1c\
-\xb3|\xfe\xbf\xcc\x12\xfa\x96e\xee\xbd\xf1\xb5\xbf\x87\xb0\
-[\xcc\xa7G-d\xb4\x80g\xc4<zhn\xf5x\
-\x81\x9b\x87\xc5\xba\xe0\xe0uB\xa0\xa4ZX\xd7B\xc9\
-\x10\xc2\xea\x02\x8d|\x80m%FH\x86\xba\xa4\x9dD\
-4|\x84\x97\x1em\x0b\xd2\xa4IL\xccm4\x91\x8c\
-\x88\xf4\x88\xbd\xd1!\x1e\xcf7\xf7\xb6I\x9b\x09C\x15\
-a\xe30\x0c\x1d\x82\xdd\xca\xb3\xaf-\xea\xc0PZ\xcf\
-\x8d\xa2\xa4\xb2\xd7\xd8\xcc\x9a\xbc6\x90\xdc\x9cA\xa4b\
-\x8cq$2\xa5!\x12\x12)\x89\x12\x81\xc52\xb59\
-3\xe3\x19c\xc1@\x83&S]\xf0\xcc`\x82m4\
-\xe8WSJ \xc9\x14hC^\x0c\xd0z@\x84\x04\
-oi\x8a\x84\x04\x81\xd3%U1\xa2\x91t@Dx\
-\x9dC+C\xf9\xda\x12\xb4\x86\xeb\xfd\x978\x9c\xbeL\
-Wd89\xa3\xa1\x12\x10\x828\x8ep\xd6\x11\xc7\x0a\
-h\x90$1\xde\xfb\xe0k\x11\x92\xb2\x0c\x09\xa5w#\
-\x16\x0f&\xce\x1d\xf9@B\xd2\xb8_$o\xcf\xfd\x22\
-\xb1\x84F\xa4\xea\xfc>\x0dB\xe0d\xb6`\x19I\xe2\
-\x84D\xc2\x8a\xccYm(\x84\x9f\xe2\xbd\xe6\xb1\x9du\
-t\x99#;=tQ\xa0\xd2\x88\xfd\xfe\x88\x18\xcb\xf9\
-\xf5\x1e\xc3\xc22\x1b\x8d\xc9Z\x1d\xce\xb4;\xecl\xae\
-\x92\xbe\x96\xd0\xc8\x9a\xc4qL\x9a\x18\xf0\xb3:\xf8E\
-\xa1\xbcD\x22\xc3\xc6\xa6\x9c0g\xa6\xae\xf2)\xe5t\
-\x8c\xad*L1\xc3i\x1d\x82/\x8c\xc1:\x13\xd8\xd2\
-\xbd\xa3,J&\xfd\x9c\xb53\x1d^{\xfdU\xae\xbc\
-\xbe\x8b5\x8eN[\x92\xc4\xeb\xe4\xf9\x18[\x14Te\
-\x89.+\xac.\xb1\xba\xc2\x98*X:\xde\x817p\
-\xac\x14\x83\xc0U\x13b=\x02\xa7\xd0n\x88l\x9e\x05\
-\xd7\xa8s\x1d\xdfyr:\xc5n\x0c\xf7\x00\x00 \x00\
-IDAT\x8b\xe7\x1eZ\xe3M\x15\x8b\xaf\xdb\x9c\xc2\
-\xf2\xb9\xefo/\x7ft\x8e\xb4\x91\xe2\xa4\xaa\xc3>=\
-\xcc-\x1b\x17\x94\x8a\xd7&\xd4<7\x0e\x8c\xc1iS\
-+\x1eS+\x9e\x00\xbb\x09g\x83\x0fs\x9e\x00'\x05\
-{E\xc9x2f\xef\xf0\x80s[gY\xdfX#\
-i402\xc0{s(L\xcc\xef\xfdM8\x9aN\
-\xf3\xd0\xff\x7f\xe5\xb3$Aw\xd4\x80\x1bx!h}\
-\xeb\x0f\xd3\xfe\xe8\x8f.\x9a\xcc>\xf9\xcf\xc3\x86cN\
-\x12{\x87\xd5#U\x84\x151\xc2U\xe0%\xd2;\x94\
-w\x08'\xb18D\xa4\xf0\x08\xa4\xf1\xc4\x80E\xa1\x85\
-\xa6\xab\x22\xb2x\x854i!\x9d\xc7\xd8\x19-\x15\xd3\
-NV\xd1\xcd-\xaa\xd8P\x8co\xf0F\xff&\xc6\x16\
-\x08\xe0\x0b\xa3\x9b8\x14\xefqg(\xe3\x14cC\xd9\
-\xe4]W\xe1\x1d\x88|\x0b|\x9b\xd1t\xc2F3\xa6\
-(3J\xb3\x86R\x96\xccf\xa8(\xc2[\xf0^\x06\
-\x9c\xdeA+\x05\x159\xf6\x95a\x16%\x88I\xcen\
-9a\xa0\x87\xcc*\x89\x22#J\x14\xc9\xc6\x16\xa2\xd3\
-\xc4\x0b\x81\xdf\x13\xb8\xdb\xb70\xd2\xd1 F\x0aEA\
-I\x03\x90\xc2\xe3\x85\xc4\xd9\x12_\x95\x0c\xfc\x0dT\x9e\
-\xd0nlr\xa3\xb8\xc1\x1b\x83\xe7\xc867iLS\
-tu\x80\xb1SZ>\x05\x0fQ\x14#\xeb\x22\x8dy\
-^\x22\xa5 \x8e\xc3\x832F#\xa5D\x1bw\xec\x01\
-\x1e\x85E\x9f\xf6\x99\xcf\xad\x01_\xc3l~\xe1\x0f\x81\
-0\x10\xec|-\xf1 k\x16\xe9\xac\xddF\x8f\x02m\
-L\x9c\xc4DIL\xa3\xd1\x22\xcd\xda@D\xb7\xd3\x22\
-kE\xec\xdd\xdc\xc5t6\xd9}\xed\x05.\xdd\xbeB\
-4pL\xa6\x136/\x9fg{e\x9b\xfd\xc3C\xf2\
-II)+z\xbdN\xf8\xc9yn\xa2\x13 \xe7\x9b\
-^\x87D\x10)\x89\xd4\x86\xe2\xc6kK\xb7\xe0(g\
-\xe3\xa00\xf2\x09U5\xc3\xe8*DV\x1a\x83\xb1a\
-\xed\x99L\xfb\xc4r\x88w\x19\xaf\xbe|\x15\xab=\xbd\
-\x95\x1ei#%I4\x93\xd1\x10cJ\xca|FQ\
-\x05\x05d*\x8d\xd7\x06g*\x9c\x09~#{G\xd2\
-\xae\xc4\x12KE\xac\x22\x8c\xd7X\x1fJo\x98\x13\x0b\
-=\xfc\xd9\xcb\xe9\x98\x0bN\xb9\xfe\xbdu\xcbG\x1c\x0b\
-9\x5c4<\xfe\xa6\xfe\xe8h4\x1a\xe80*\xc0\xfa\
-\xda\xf1f\xc1:\x9c\xd6xmC2\xa0\x0eI\x84\xae\
-\xdeyxm\xc3\xab5\xc1\xef3\xb7|\x8e.\x03)\
-%\xb9\xaexy6c\xef\xf0\x903\x1b\x9blo\x9e\
-aum\x85\xb8\x91\x85\x9d\xd6\xc2\x0f\xe3\x91~N\xb5\
-\xe3\x97\xe7\xc9]\xfdw*h\xee\xa4\xdb?\xa1\x0b\xbe\
-\x9e$>\xff\x18\xdd\xbf\xf8s\x8b\xcf\xd3\xcf\xfe\x9f\xcc\
->\xf3\x9bDQ\x02\xdc\xd1o\xf31\xa4\x14B*|\
-)H\x85\xa4-3V]\x13\xe9\x15\xb7\xc9\x99V\x96\
-\x86\x90l\xc7+\xb4}H\x0e\x1e\x88\x19R$\xc4i\
-\x8f(\xca\x90\xce\x83\xb7\xd8r\xc2\xb4\xb8N<9$\
-\x8b<\x93\xd9!N\x1f\xd5m\x19\xda\x92\xcf\x0e\xaer\
-\xbb1\x22\x92\x11\xceG\xbc\xaf\xb3\xc1\xa11\x18\xef\x99\
-RrcV\x91;Iqhpf\xcc\xa3\xbd\x1e\xd3\
-\x0a^\x1e\x8di\xc4\x09[\xcd6\x95\xb1\x14\x95\xa5\x93\
-\x08n\x8c\xa6\xec\x96\x03|\xdad\x87\x16\x83\xaa\xe4\x9a\
-\x9d\xa2$t\xbd@O\xa70\x11T\xcc\xd0\x83\x84\xf4\
-\xdc\x19\x1a\x1b[0\xcb\x11\xe3Y\xa0\xa9\x13\x82\xc2U\
-\x08\x19\xb3!\xdb\x14\x93\xdb\x08!PBq}r\x8b\
-J\xe7<\x94]\xe2 \x1a\xa2\xf5\x94ft\x96\x892\
-\xf8\xba\xe0\xd9,\x9f\xf2\xa5\xa7\x9f%$w\x0a\x9c7\
-\xb5\xa3\xfch0Z\x1b\x92\x1e\xcb\xa2X\xd0\x1e-\x1e\
-\x85\xbf\x17\xc0|\xb7\x84=C\xedW\xad\xbf\xe7\xee\x00\
-\x99m\xa8\xbf\x8d@\xe2$XW\xa2\x876,\xec\xce\
-\x83\x88\x912\x01\x15\x81\x8fH\xb3\x1e\x8d^\x93\xe6J\
-\x8b\xf6p\xc6\xed\xdbWy\xf4\xfcY\x1ai\x84kT\
-L\x86\x9a\xc3\xfd]\xb2\x95M\xd6w.2\xde\xdb\xe7\
-\xe0\xf0\x00\x8b\xc5y\xcbh4\xc4YC{\xbdA#\
-\x0a\xd7\xe3\xac\xc3z\xcf\x85\x1dI\x7fjQ\xed\x95\xb0\
-\xb2\x09EDE1\xba\x8e\x9e\xcc(\xab\x02\x9dO\xf0\
-e\x81\xb5%\xde\x19<\x86\xe1\xfe-\xfa7o\x10)\
-\x98\x0cv\xf1\x22\xa3\xb5\xbaB\x9a:\x944X/H\
-\xd3\x98\xaa\xa8\x18\x0f\x87\xe8\xa2\xc4\xe4\x05UQ\xa1\x8d\
-E\xc8\x88$M\xb0N\xe3\x8c\x0bc\xd0\xd5\xdb`\xaf\
-\xd1\xbeD8\xf0*\x0eUw#\x07^\x9d\xb8&\xff\
-Y\xcbW\xa0\xf4\xf5\xf1\xa0\xe1{Z>bn)\x9c\
-\xd0FP\xe7\x09\xdc\x01\xef\x9d8n\x05i#\xa3r\
-&\xec\x92\xea\x1a\xe8X\x87\xd7\xba\xb6v,\xbe2\xa0\
-+\xec\xfcX\xa5k\x05\xa4q\xa5\xc5\xdb\x0ak\x1d\xce\
-\x99@?\xb0\x08\xe5\x15aG\x15E\xf4+M\x7f2\
-\xe6\xe6\xe1>\x9bk\xebl\xac\xaf\xd3\xeb\xf5\xc8\xb2\x0c\
-YG\xf2\x1cW\xc8G\xbe\x99\xbb\x94\xcf\x9b|>\xa9\
-\xef\xee\x07u~\xed\xcaQ\x1f\xcaF\x9b\xde_\xf9{\
-\x888\x10\xb0\xea\x1b/1\xfc\xb5\xbf\x1b\xc8\x5c\x85\xbf\
-\x87U\xe8p\xc6c\xa4!s\x8a\x0d\xd9bM6h\
-\x8a\x04DP\x0c\x82\x09\x89\x15t\xe2.M\xd1B\xa8\
-\x84f5D\x0b\xb0Q\x82\x95\x0aoJ\x0e\xf5\x84\xbd\
-\xf2\x90\xd2\x95\xc8\xaa\xa6J\xb2\x81(v\x0e\xbe\x0a\x01\
-S*^\xcc\xf7@J\x84\x97L\xec\x94\xcd\xb4\xc7@\
-\x97\xd8\x12J\x12\x94\x17\x0cK\x81\xc0rc\x9aSX\
-K\xbf,P\xd6\xa1D\xcc\xd5\xc9\x04\x81!\x11\x05\x13\
-\x1d\xc2\x96[6\xe1\xba\xdfg\xa4\xc7X\xe5\xd9\x88V\
-I\x94gbg\x18\xa1\xa0\xdb\xc4z\x98]\xbf\x8e\x8a\
-\x12\x22ck\x87\xb2@\x09\x0f^16S\xa6jL\
-\xec\xa1\xa4$\x16)N\x19\x0ag\x18\x96\x87\x94~\x8a\
-\x90\x82\xd9\xfeuJ\x11\xe1p4E\x82w`\xaa\x1c\
-\xef\x1d\xd6\xd9\xc5\x1c\xb7\xce\xa3\xa4\x0c\xa9\x09\xb5j\x99\
-\xc3bw\xf9kO\xb9\xe2\x1d\xab>\xba\xe4\xe79\x12\
-\x01\x95\xc6D\x96z\xa7\x87\xb7\x10\xc9\x08\x15Y\xd2H\
-1\x98\x0d\x99\xe69E\xd5f\x96zR\x05I\xdad\
-:\x9d1\x19\x8f\xc9\xc7C\x8c\x9b\xa0\xcb\x19y^1\
-\x9dN\xc8\xab!qg\x95\x8d\x0b\xdd\xb0\x06Y\x8b \
-\x10x*\x19a\xaa\x09\xd6\x80s\xd1\x82Q@W9\
-\x8f\x9f-x\xac\xb1\xc6+g\xce\x87\x9a>8\x0e\xae\
-=\xc7J\xcb\xa1TD\x8c \x91\x1e\x97Zd#\xa6\
-\xa8\x1c\xe3\xfe\x947\xfa\xb7\xa8&\x87\xa8\xd55L5\
-\xe1\xec\xce\x0e\xab[\x1b\x08\xa0\xdbn\xd1LS\xac}\
-\x82\xdcj\x8c\xb1\xac\xad\xae\x22V\xd7\xe8w\x86t\xf5\
-\x06\x9dV\x934N\xd8\xdb\xddc\x7f\x7f\x97k\xaf]\
-\x87*\x04ax\x17\x02\xac\x8c5\xa8x\x81\x17\xbcc\
-\xd7\x8fSs\xb5\xcd\xb9\xd3N\xb2|N\xab|\x8e9\
-\x80\xeb\xc3Gq0\xf73\x0b\x8e\x8e\x0b\x01I\xa7\xcd\
-\xd4\x06\xa7\x9dw\xc1\xb7\x13LQ\x1b\xac\x99\xd2\xe0u\
-\x85\xd3\x1aW\x1a|U\xe2+\x8d)J\xb4\xa9P\x0e\
-\x12\xa1\xe8&\x09\xb1l \x178\xbf\x08\xcc\xbdB`\
-\xa4\xc4I\x81\x8f\x22tYqco\x97\xc3\xc9\x98^\
-\xafG\xaf\xd3\xa3\xd3i\xd1hd\x10\xa9\xbb\x98\x0b\xee\
-\xa5|\xee\xee\xb57\x97\x05\xce\xfd\xf5 KP\xa6\xc3\
-\xb3\xf2\x13\xbf@\xb4\xb6\x13\xfeTL\xd8\xff'\x7f\x13\
-at\xc8\x1fY\xa2\x22?\xca\xe9\x09\x90\x92\xb6\x02\xab\
-\x0d\xb1P4\x84Bz\x89\x94\x09*\xea\xb2.\x1c\x99\
-\xcd@:\xd2x\x05)[(\xa9\x10\xb6\xc0\xd8)\xb1\
-sTf\xca\xac:\xe4\xa0\xda\xa7\xb0U\xbd\xdb\x06\xe3\
-\xe7\xd3\xd9\x1f\xbbd)\xeac>\xe4]\xdc\xd0\x03\xfa\
-f\x86\xf6\x86\x88\x84N\xba\x81E\x11Y\xc1P\x1bf\
-\xda\x91\x0a\x81\xc5S\xe9\x8a\xabz\xc8\xccj\xbc\x98\x92\
-\x08O7\xda\xc2X\xc3a\xd5\xa7!#*g\xc1)\
-nW\x07DJ!\xe2\x08\xd5m\x05\x18H\x87\xb1\xee\
-g\x05\xb8\xc0\xd0.PT\xde`\xbd\xc1\xe0\x18\x9b!\
-M\x91p\xc3\xf6\xc9d\x8c6\x0e\x9fJ\x86\xf9\x08\x93\
-\x17x\xef0\xd3)Z\x09\x1a\xc4(\x17\xe3\x09\x1cm\
-\xa5vh!I\xa5GY\x8f\xa9}\x1aR8*\xe3\
-\x912\x94\x1a\x9f\x0fx\xef\x8f\xc6\xebi\xf3G\x96+\
-\x90\x86\xcf\xfex$\x96\x00\xed\xa1\xd4\x0e\x11\x09<\x12\
-m5Q\x14\x91\xc8\x88XF\x8c\x87\xb7\xd9;\x1c0\
-\xd9\xea\x10\xc9\x88^\xb7\x87\xf5\x9a\xdd\x9b\xb7(\xa6%\
-\x9d\xceY\xd6\xcf\xac\x22\x94\xa2\xbb\x1a\xb3y\xcesx\
-p\x9b\xdd\xbd>qw\x0f]L0\xce\x22eL\xa4\
-\x22\xac\x84n'\x0d\xfed/p\xbe\xc2\x00^fD\
-zD\xbb3\x22\xa4\x03\x86{\xac&c6\xdb-\xb2\
-f\x83\xe9\xb4@\xc9\x80\x17wZm\xc6\xd3\x09/\x8d\
-\x07\x5cz\xcf\xa3\xd8\xe2\x12\x8df@NT$QR\
-!#E\xb7\xd7#k6\xc3\xe9&\x13\xa2(\x22n\
-\xb7\x89\x95\x82f\x13m5\xab\xdd\x1e\x8d8\xa1\xb1\xbe\
-N\xb6\xb7\xceS\xbf\xff\x87\xb8\xb2\xac\xc3\xa9\xe7}g\
-\xc1E\xf5\xba\xe1\xf0\xd2\xb3XZk3]\x88P\xe2\
-\x22\x8a\x14I\x9c\x10\xc7qH\xdc\xf6!\xdaWkM\
-\xa55\xceZ\x8c\xbdG\xdd\xa1\xb7\xb9$=\xb0\xc5\xf3\
-\xb6-\x9f%\x9f\xcf\xb2\xb8c7w\x0f{\xa0\xa6\xc6\
-HZ\x19\x85\xb3G\x09\xa2u`\x817\x16\xaf\x1d\x18\
-\x8d5\x1a_h\xbc\xae0E\x81)\x0aV\x1a\x19\xdb\
-\xdbg\xd9Y[c\xb5\xdd\xa6\xd7j\xd3J\xd2\xdaq\
-X\xffL]\x15\xb0t\x16\xed<\xda{Lm\xfa\x1b\
-\x11jq\xc4\x91\xa2\x91\xa4Dq\x82W\x11\xbd(^\
-XkwF\xa5\x9dF\xf9\x9c\xe8\xdf\xf9:\x94\xa5\xe5\
-\x9c\xf6\xbf\xfe\xef\x90>\xf1m\x8b#\xfb\xff\xf4?\xc1\
-\xee_'RQ \x0c\xadw\x9a\x02\xb9\xb0z|\xad\
-|\x90!0`\xe8J\x0a\xd3\xa7I\xcc\x86-i\x98\
-\x92$j\xd2\x94\x19V\x05j\xf9\xca\xe7H$V\xc5\
-h\x0d\xe8)\x08Ge\xa7\x14\xa6\xc0\xcc\x13\xf8\x08\x0a\
-FI0V\x84\xa4\xc5\x9am\xc1\xd5\x91\x91\xd4\xeb\xaf\
-\xf3\x8e\xa9-\xb1\x1e\xdaQH\xc0\x14\x1e*\xeb\xb1\xd6\
-SYK\x8e\x08\xc1\x01^\xa2\x85\xc5\xe3\xa9\xac!S\
-\xabD\xbe\xc3\xcc\xee\xe3]J\xe5-\xd6\x09V\xd4*\
-\xb9\x9f0.Gx+\xc8\xb4%\xf2Q\x08\xa0pa\
-\xa7=\xdf\xe0\xba97\x97\x87\x18\x89B0\xb3%\xa5\
-\xab\x02\xfc\xe6A\xf8\x08\xe7$\xb1\x07[/Z\x0d\xa3\
-h\x8a\x84\xc0;\x1d\xe8\x5c|\x94\x90v!\xaa\x0a\xaa\
-AP\xbe\xd6i\x92H\x12\xc5\x96\x22\xf7H\xa9\x96\x9e\
-\xde\x1dx\xdbi\x9e\xbb\x0b\xb3\xe5\x88idnK\x11\
-R\x1f\xac\x05k\x99i\x83M\xc1{\x85\xa9\x0c\xc8\x90\
-G\xa4m\x89\xb1p\xa3?\xe2\xf6\xe1\x18\xad+\xe2V\
-\x8b\xca8\xf6o\x1e\x90\xa6\x19$\xebL\xab\x0eI\xa7\
-\x83LR\xa6\xa3\x113?F\xca\x92\xfe\xad\x9bhW\
-0\x99\x82w\x82f\xd6\xc2\x98\x82\xb5FJ,\x22\xaa\
-\xca\xe1\xbd\x04\xe3pT\xe4ULZ\x1egJ\x9bL\
-F<\xfd\xcc\x97I\x938\xc0\x8f\x95!KS\xac\xb3\
-\x94ZS\x95\x81GZ\x0aA>\x9dP\x87\x0e\xd6I\
-\xd3\x82\xe9xB#II\x92\x84\xe1t\x8amth\
-\xe7\x9eH)F\xb3)Q5a\x10\xdf\x22k5\x99\
-Nf\x14e\x89v>\xd4&\x12\x84\xbc\x1f\xef\xc0)\
-\x9c\x93\x18\xe3\x11hb\x1b\x81\xb0\xa8Hq\xfe\xdc9\
-\xce\xed\x9ce\xe7\xecY\xd6VWi6\x9b4\x1a)\
-I\x14#\xe4<$>(\x9e\x22\xaf\x98\xe6S\xf6\xf7\
-\x0f\xb8y\xeb\x16\xd7\xae\xdf\xe4\xe6\xad[\x18S\x075\
-\xc8P.\xe3\xad\xca\xa9\xea\xf1,\xbf\x9f\x8f\xe9\xb7\xac\
-|\xeeh\xb7\x18\xae\xfe\xb8\xddp\x928<\xcd\xb4\x01\
-i\x82q\xc1\xb7\x83\xf1!X\xc0\x18\x845x\xad\xb1\
-\xb5\xa5#\xaa\x12S\x96\xa0-\xef\xbf\xf40\x1fx\xd7\
-\xbbxh\xe7<\x9b+\xab4\xd2\x988Jj\xc7i\
-\xb8\x96e\xeb\xcb\xf99E\xc8\x1cN8\xc2\x01\xe7\xd0\
-@\xe5\x1c\x16O\x1a\xc5G\x13\x85\xbb\x95\xcf\xfd\xe5n\
-\x86\x83\xafg\xe5\x03\x90\xbc\xfb[\xe8|\xff\xcf,>\
-\x8f~\xe7\x97(\x9f\xfe}\xa4\x8a\x10R\x86MB=\
-\x0e\xa9\x91\xb6\xe5^l\xd8a\xc8\xc4\xb2aA/\x84\
-`\xcf\xcd\x88\x9c@\xf9\x08%\xe2\xb0_\xc1\x840^\
-\x01^D\xe0|mkyJ\xaf\x91\x89%\xadsS\
-\xe6\x1b\x13!$\x89s8\x14r\x9e'\xe1\xdd\x1dP\
-\xc0\xdc\x03\xe4\x11\x12r\x0e\x03\xd4,\xc0'aD8\
-@9\x8f\x97\x12\xe1 \x11\x1e\xe5-N\x0c\x99\x88)\
-N\x19T\x9d\xcb\x12\xe3\xd1rD\xe4\x1dm\x1f\xc2\xfc\
-%\x05\x08Y\xa7-H*\xec\x22 C\xd4u\x89\xb2\
-4\xc2\xe3\xc9\xc9\xd1\xde\x92!\x17\xd6y\xb0R\x1c\x11\
-\x82\xcc\x87\xca\x9e1\x02K\x85\x91\x813\xac\xa84^\
-\x1a\xcc\x00\x9c1\x14\xb6N\xc8F\xe0\xac#\x8a\x03\xd3\
-\xb5\xa9+\x90\x1e\xdf;\x9e>\x8c\xd7s\x94\xd6\xb0\x08\
-\xa9v\xa14\xc9xRq\xe5\xea\x10lEd4R\
-j\x02Y(x4^*\xb4\xd1x#\xf8\xc4g\xae\
-\xf0\xa5/\xdf\x22U\x82F\x96\xa1\x84\xa8\xf3\x8c\x04V\
-C\xb4\xb2\x8a\xcc\x12\x84R\xb8B3\x1b\xec\xd3\x88 \
-\x8a\x14\x95\xd3\x18\x0d\x87S\xcd\x1b\xc3\x11XK\xaa \
-r\x16\xb08\xebqXrc\x19\x0e\x05i\xaa\xd9\xf8\
-\xe0Q\xb4\xeb\xe1\xad]\xa6\xa3i\x98\xf1s\xeb\xa2\x9e\
-\xc8\xc2\x8b`\xa5\xb34\xafE\xfd\x9fgQDn\xbe\
-\xc1A\x0a\xa6k\x0fa\xd5ah\xea=\x9d\xc3W\xc1\
-\x1d-\xf4\xde\x81\xcd\xa7H\x19\x02Z\xf6\xc7 \xb4\x03\
-)\x10j\x8c\x1d<\x8f\x10)\xdb\xdb\x9b|\xf0\x1b.\
-\xf0\xde'?\xca\xe5K\x17X]\xe9\xd1lf(%\
-k\xc8Z\x1c3\x04\xe6i0\xae\x0e`\xb0\xd61\x9d\
-\xce88\x1c\xf0\xea\xebo\xf0\xf4\x97_\xe0\x8b\xcf<\
-\xc7\xc1\xee-F\xfd\x9b\xa7|\xc2w\xcb\x9b(\x9e\xf9\
-$\xf1\xa1\xf3X\xac\xbd\xe1UrB\xcc\xc4\xf1es\
-\xf9\xd31'\xf0\x1duT\xdc\x9d\xe6\xf5\xd2\xef\xcf\xc5\
-:O\xa7\xd5\xc2\xc61\xae*\xead\xd1\xe0\xf4t\xce\
-\x85\xd0\xe9\xda\xa7C\xa51\x95Fh\xc7G\xde\xf3\x04\
-\xdf\xfb\xa1o\xe6\xe2\x99-\xe28b\xd9\x99\xe4\xdd|\
-\x82,)\x1fQ\x07\x0c\x08E4\xdf\xd8,\x8d\x98\xbb\
-\xef\xc7\x1fM:\xb1|\xcf\xf7V>\xc7\x03\x0eNV\
->w\xf7\xc0\xd7\xbe\x88\xd5-V~\xea\xef,\x16\xf2\
-\xe2\x85?f\xf0[\xff-\x91\x14u)\xdf\xe0\x8b;\
-\xf2\xed8Bjv\x98\xb5\x02\x81\xf4E\x08\x0e\x10\x04\
-2\xc5H\xa0\x85\x09;D\x7f\xbc\x8c\xc7=\xc5\x07\x18\
-\xe9\xae\xf1\xed\x1d\xa8y\x11\xcc\xe5\xc8\xa2\xfa\xe9\xf9\xc5\
-\x7f5DPQ\xf9\x93w\x86\x0b\xf2\x8d\xfa\xabJx\
-<\x9aji,\xcd\xef\xab\xf2U\xfd%\x106\xd0\xa2\
-\x08\xa5jE\x10\xc6\x9fR\xf2h\x01\x07\x94\x0a\x8e\xe5\
-\x0a\x8d\xadGX\x84\xa0\xd2\x06!4*\x8a\x90Q\xa0\
-\xe67Fc\x9c\xc6\xfb\xb0\xcb\xf6>\xc2\xe8#\x0a\x1b\
-\x8bX\xd0\xb7@\xa8\xc0\xa9\xf3:\xe1s\x89\xeaf\x0e\
-\xcb\x84\xe1}J\x8bg\xc9\xc7\xe3}M\x01\x13\xd8\xc9\
-\xc8'\x07\xec_\x7fv\xd1\xb7\xcb\xf3\xe2\xce\xcd\xd9\xc1\
-\xe0\xf8\xe7\xe5\xee}\xab\xf3\xe8n\x98\xc9\xb3G\x18g\
-\x1f\xde\xbfF\xc8\x08\x93\xcc\x86\x13\xb0!D\xde\xfb\x0a\
-\xefd\xcd;\x1868\xcaG\x8b\x05\xde\xd5\xcfB\x00\
-\xce\x19\xaaR\xdf\xb5\x90\x8a\x9b\xb7Y\x1e_}T(\
-\x830?$\x83R%\xfa\x7f\xd9{\xf30K\x8e\xea\
-N\xf4\x17\x11\xb9\xdc\xa5n\xedU\xbdK\xbd\xa8\xbb\xa5\
-n\xb45B\x12\xdaP\x83d\x8c\x10\x1a\x8c%\x8dY\
-?\xf00\xd8o\xd0\x80\x1fc\x0c\x06\x8f)y\xecy\
-\x8f\x01\xdb\xd8\x03~\x1f\x02lf\xb0\x07\x90\x90\xb0\x8c\
-\x06\x0f\x12\xd0B\x12\xa2[K\xa3\xad[HH\xad^\
-\xaa\x97\xea\xa5\xd6\xbbff\xc4y\x7fDF\xde\xb8y\
-\xf3VU\xb7z\x91\xa0\xcf\xf7U\xdd\x5c\x22###\
-#\xcf/\xce\x12\xe7\x00JIL\xccL!\xaa\xcd\xc4\
-\xdf\xc4!,?\xf3L\x5cs\xcd\x1bq\xc9\xc5\x17\xe3\
-\x8c3\x96\xa1T*\xc1u]\x08!\x9a\xef\xc8\xfaM\
-\xd4\xa3\x8c%\xe0\xe3:\x0e\x5c\x07\xc8\xe7|\xf4\xf5v\
-\xe3\x8c\xa5\x0b\xb1\xe1\xbc\xb3\xf1\xd2K\xe7\xe3g\x9b7\
-\xe3\x87\xf7\xdd\x8b\xfd\x95\xe9c\xea\xd7Y\x81\x873\x06\
-\x871\xf8\x5c\xc0\xe1H:K\xaf/\x8bm\x221\x93\
-\xb6'|f\xbb\xb5/-cW\x22Z\xe8:\x84\xe0\
-\xf0\xb8vq\x9d\x95\xe5\x12\xa1\xbb\xb7\x07\x0d\x06HP\
-\x12\x02\x87\xa2X\xed&\x15HEP\xa1\x04\xc9\x10A\
-\xa3\x81\x0bW\xae\xc2\xdb\xae\xb8\x12\x0b\xfa\x07\xc0(^\
-\xcce\xb5\xc8\xaa\x1c\x89z,\x06\xc6\xb6\xd3\xf1\x86\x01\
-\x89\x16\xfe\xd0ZM\x0a|:*\x0f\xad\x82\xed\xe0\xf3\
-kG\xc2E\xff\x07>\x0b^\xe8\x01\x00D\x13\x07q\
-\xe8\xef?\x09\x0e\x02\xe3N\x9c!\xd6\xa8\xd8XS\xea\
-\x81m{a\x80\x02B\x19\xe1]\xbf\xf3N\x04a\x03\
-?\xfa\xf1&\x94+u\xb8\xfd}\x80pS7}u\
-\xc9\x9aJ\x11\x96\x0e\xf5\xc1\x8dj\xd8\xb5k\x17\x96,\
-^\x06\xce\x19\x0a\xc5<FG\xf7\xa1\xb7\xb7\x07\x9cq\
-\x14\x8ay\xbc\xf8\xe2K\x08\xc2\x00\x8a1\xbca\xb0\x1f\
-\xcfN\x971V\xab\xe3\xdak\xae\xc6\xf4t\x19\xdb\x9f\
-}\x16\x17\x5cp\x1e\xea\xf5:\x9e|\xf2i\xbc\xe7}\
-\xef\xc4\xf6\xed\xcf\xe2g\x9b\xb7 /\x9cx|j\x19\
-I\xb8\x0e\xb8\xe2 \xa5\x01O\x86\x0d\xb4\x00\x8d\xbd`\
-\xfc(gM\xc6\xc6\xd3t0PV@^\x02H\xda\
-\x9f\x1f\x94\x92\xe8\xed\xed\xc5E\x17\xbd\x0e?\xfd\xe9C\
-\xa8\xd7\xeb\x99)\x9e[&\xc9Y\xdf!\xb5\x1d\x997\
-\x11\x80\xea\x81\xddz\x82\x03\x00\x8c\xc1\x11\x02\xdcs\x00\
-\xc9\xa0\xf4j\x1f(\xc6\xe1\x84\x00\x5c\x01\xc1\x9a\xc2\x10\
-\x00p&\x10E\x0c,\xcaX'(\xda\xb9\xa7>\x8e\
-\xb8\x86\xf45\x0a \x89RW\x09\xbf\xfd\xdb\xbf\x8d\xb7\
-\xbf\xfd\xedX\xbcxq\x0b\xd0\x00h\xf5\xe2\xb5\xeb\xcf\
-0\x7f\xa4\xdf\xad\xef\xfb\x18\x1a\x1a\xc2\xf0\xf00.\xba\
-\xe8\xb5x\xdb\xf5o\xc5\x1dw\xdc\x81{\xee\xb9\x07\xb5\
-Z-\xa9\xc3\xd8\x90f\xa3\xce\xc0C:kg\x8f\xe7\
-!'\xe2\x8f>\x9e\x016\xcd\xba\x00\x18C\x92\xec\xd3\
-\x00\x10K\x95A\xfb\xe7\xad\xe7\xa8\xfa\xa8\xe78\xe8\xe2\
-n\xe7!`\x9d\xe8\xee\xefCY)0\x93.W\xc5\
-\xd2R\xa4\xb4\xf4\x13\xaf\xe9\x91A\x88\xbe|\x01\xd7]\
-t)\x16\x0d\x0cj\x1d(k\xad\x8f\xda\xda\xd9\x0a>\
-\x06@\xd2\xedO\x83D[\x99\x0e\xe0\xd3\xe9\xd1\xec\xfb\
-\xb7\x81O\xba#_%t\xb4\x0e\x11D\x84\xd2\x8d\x7f\
-\x08w\xd99z_\x868\xf4\xd5\x8f\x81\xaaS\xda\xf8\
-\xcf['7\x89=\xa7E\xea\x01\xc0b\xe6\xa5\x80\x5c\
-\xde\x03\x81\xe2\x89\x92\x9egrfF\xf0\xab\x94\x98\x84\
-\x97\xcf\xa3\xa8\xf4\xe2\xceHEP\x11\x81q\x06)%\
-\xa2(\xd2c\xaa\xc6@*\x9eY+\xc2\x8b\xe5\x0aV\
-u\x15q\xb8^\x07\x17.\x84\xeb\x801\xc0\xf7s\x90\
-R\x82\x81\x90\xcf\xe5\xe1\xban\xeb$+V\xc9\xc9\xb0\
-\xa1C\xfds\x8e(h\x80,\x91==\x83>Zf\
-\xaem;\xcdh\xf2M5\x9d\xe5r\x14W\xe9\xba\x0e\
-6n\xbc\x16\xd7\x5c\xfb\x1b\xc8\xe7\xf2`\x0c\xb8\xef\xbe\
-\xfbZ\xd6\x0aZ\x15g\xdc\xec\xe8\xdb\xd7\x89X\xeb\x80\
-\x04\xf7\x0a\xf0|\x0fA\xbd\x0eN\x01\x5c?\x0f\x19\x06\
-\xa8\xc76\xaa\xd0\xe8\xd2\xe2\xdb+(p\xc6\xc1E\xbc\
-P(\xce\xe8*\x95\xea\x08\x10\xb3\xd19\xe7\x9c\x83\x0f\
-\x7f\xf8\xc3\xd8\xb0a\x03</^np\x02\x1c\x93\x88\
-\x08\x9cs\xac\x5c\xb9\x12\x1f\xfd\xe8Gq\xc9%\x97\xe0\
-\x8b_\xfc\x22v\xee\xdc\xa9S\x9b\x00\xc49\x8ff\xab\
-\xa3#\xf0\x10t\x12\xa2\x82p\xe1@\xe9\x0f?U&\
-\xe9C\x96\x04n@\xf2Q\xb3\xf6\xb2\xad\x87\x9a\x88\xee\
-2\xa1\x17\xb95\x87YR\x9b\xbd\xe3;\x0er\xa5\x12\
-\x0e%\xb6\x17\x15/4\x93`&|\x87\xd2\xba\xfd \
-\x8cp\xfe\xaa\xd5\xb8x\xc5*8\x8e\x03%\x84^g\
-\x0am\xbf\x91\xf1\x0c\xcb85\x181\x1f\xa0\xd8p\x0d\
-\xdb\x09/\xb3\x87\xe6c\x9b\xe9\xf04\xade\xa8\xa9\xe2\
-\xfbu\x95|r\xaf{\x1b\x0a\x97\xdc\x90\xec\x8f\xdf\xfe\
-\xdf\x10\xee|\x06<6|2\xc6\xe3w\xa2\x00\xf08\
-\x15\x82-\xf5\xc41\xc3\xe2\xde\x13\x0e\xc7w\xbes\x17\
-\xa20B\x10\x85\x00\x08\xd1\xe4A\xcd\x88\xdbfw\xaf\
-\xae\xde\xde5}\x18\x22V;\x1e<p\x10f\x113\
-\x01h\x8c5\x92}\x15\x8fe\xc1\x18\x0e\xd4\x03L\x86\
-\x11\x04\x17\xf8\xc9O\x1e\x00\xa0\xe3{=\xb2e\x0b\x14\
-)\x84R\xe2\x7f~\xe3\x1f\xd1h\x04p]\xa7\xd5\xbd\
-9\x1e\xba\x11I \x0e\x80\x09\xb4\xf2u3\x07h\xae\
-\x1d\x9d?\xc3S\xa4\xe2uSFMH\xadR\x93\x05\
-\x16\x85B\x01o\x7f\xfb\xdb\xf1\xe6\xdf|\x0b&'\xc6\
-q\xef}\xf7\xa2y6s\xa3\xb9w\x1cA'M\xa4\
-\x02\x9c}\xf95\xe8\x1e\x5c\x80\xf1\x9d\xdbQ\x9e\x1c\xc7\
-\xea\xf3\xce\xc6\xe1\x03{\xb0\xe3\xe7Oc\xa0w\x00\x91\
-R(OO\xc3\xf5]\xe4r\x05Da\x03\xb5Z\x03\
-\xbd\xbd=\xa8\xd7j\xa85\x02,\x5c0\x84]\xa3{\
-Q\x99)\xe3h\xc6\xe55o\xda\x88\xdf\xff\xdd\xf7c\
-\xd9\x19g\x9cT/\xd8\x5c.\x87\xab\xaf\xbe\x1a\x8b\x17\
-/\xc6\x97\xbe\xf4%l\xd9\xb2\x05\x8e\xe3\xd4\xf2\xf9\xfc\
-\xde\xd9\xae\x9b\xa7W[\xfb0J\xebM\xb3\xcec\xd6\
-\xf36K\xa6\xccT\xb7\xf6\x9e\x22B_\xa1\x00U\xc8\
-!\x88=+8\xc5Kp\xf4\x84I\x9bn\xe2\xe8\xd4\
-R*\x5c\xb2r5\x16\x94\xba\xb4\x0d\x08\x00\x88 \x0d\
-\xf0(-\xac\xca8|xD\x04\xa9t\x96QI:\
-\xbbh\xf3\xa3\xa3X:J\x03\xc2, a\x89A\xf3\
-\x19\x06sJ>\xbf\xc2$\x16\xafA\xe9\x1d\x1fK\xf6\
-\xcb[\xeeA\xf9\xc1;\x12\x03\xa8\xe1h\xe9L\xb7\x1a\
-\x88b)\x95\x01f\x81\xa1\x10z-K\xbd\xde\xd0 \
-\xc4\x1d]\x9aq\x08\xae\xbd\xd0\x18\xe3\xe0L\xc3\x15\x88\
-\xb4\xbd\x85\xb18\x1a\xbf\xb6\xef0\x8b\x93\xce\x95e\xf7\
-T\x90\xebz\xb3\x9ewboK\xa5\xa4\x06nR\xf0\
-\x1d\xad\xaa$R\x10\x10\x88\x14\x813\x81B\xbe\x880\
-\x0c\xe1y\x1e\xa2H\xc6\x89\xd8ROl\x1b2\x93C\
-*\xb1\x0b\xc4G`l\xa8\xf3e\x80\xda\x05\xbb5D\
-\x0e\xb5#\x0f\x00\xad*\x9a\x9e\x9e\xc6\x19\xcb\x96\xa2\xb7\
-\xa7\x07\xe7\x9fw.\xee\xfe\xe7\xeffJ7\xad\x87N\
-<3\x16\x8e\x07?W\x04@\x88*e\x80\x13<\xd7\
-E\x18F\x98\xaaT4\xcfd\x1cR\x01\xe5jE\x0f\
-IG`z\xa6\x820\xd4R\xe4\xbe\xfd\x07\x10\xd4\xea\
-Gu\xdf\xab\xd7.\xc2\x9b\xde\xf21\x94J]\xa7l\
-\xe9\xc5\xda\xb5k\xf1\x99\xcf|\x06\xb7\xddv[\xb0e\
-\xcb\x96\xa7\xa2(zj\xb6\xf2\xc7\x14$\xf4\xf8\x13\x83\
-4ys\xd2\xa7\xe2\x8e\x8c\xa4D_o\x1f\x1a\xae\x03\
-\xd5\x08\x13\x17\xcc\xa6\x1f3%`F\x00<\xd7\xc1\xb2\
-\xa1\xa1X\x92`\x10\x80\x0e\xf5n\xeaMBw5%\
-\x1f\x9d\xdeZ\xbbOG\x06\x84\x14\xe9\xa4p\xf1y\xa3\
-b\xb0\x81bN\xb5\x1b\xda\x9f+kx\xfc:J>\
-,_B\xcf\xfb\xffk\xb2H4\x18}\x1e\x87\xff\xd7\
-\x9fiG\x02\xcecI\xb9\xa9\xb7l\x05\x1b\x02\xc0-\
-\x95\x9b~\x9f\x8e\xe7a\xd5\xf2\x15\xc8\xfb>\xc6'\xc6\
-\xb5JF0D\x91Dyz\x06\x83C\x83\xf0<\x17\
-\x07\x0e\x1c@ww\x0f\xfa\xfa\xfa0=3\x8d\x99\xe9\
-\x0a\x06\x07\xfb\xc1\x00\xec\xd9\xbb\x17\xb5Z\x1d\x8c\x03\x8c\
-\x0b\xa8 D\xa4\xe4\xc9\xe0_\xc7\x85\x88\x08\xf9b\x17\
-\xf2\x05\x1d\xcfLI\x09\x11/z\x0e\x1a\x0d\xad\x05P\
-*v\xc0\x88\xe0\xe5|L\x1d9\x82\x9c\xef\xa3R\xa9\
- \x08\x1a\xc9\xe4\xd2\xe0\xaf\xfe\xe5`L5};`\
-\xf4\xfa\xb6\xb4s\x94m\x95:\x0b\xac\xfe\x94\x8d\x94\x95\
-]K\xa5R\xc1W\xbe\xfaU\xbc\xf0\xe2\x8bPJa\
-\xeb\xe3?o\x93`\x9b\x97\x9e\xbc\x97\xc5\x00\xd4f\x8e\
- \xec)\xa2<3\x03\xca\xe5\x11\xd6\x03\xadz\x22\x8e\
-\xe9\xa9i\x1d-\x9dqP%\xd4^\x8dB\x00\x8at\
-P\xd1(\x82\x99\xce\xb3y\xaa\x839\xe7x\xd7M\xef\
-\xc0[\xcf=\x03.\xef\xdcg'\x83\x88\x08\x03\x03\x03\
-\xf8\xe8G?\xca\x9f}\xf6\xd9\xfd\x1f\xfa\xd0\x87&g\
-+\xff\x0a\x01\x1e#\xa9h\xef\xb9V\xb7L=|8\
-c\xe8\x1b\x1aD\x05\xcd\x8f\xc1*\x92\x10\x8b\x17\x82\xfa\
-9\x0fy7\x9frWh)\xa9\x99Z<\xa3\x16h\
-z@j\xfb\xb4\xfe\x00$1D\xa4b \x92qf\
-RB\xa4\x14\x22hp\x22\xd2\xeb\x1e\xd2n\xd9\x99\x0d\
-\x9c\xe3p\xab\x8ao\xf6e\xb5\xafv\x22\x00=\xef\xfa\
-\x0cD\xdf\x22\xbd_/c\xec\xcb\xff7X\x18\x80\x09\
-\x01\xc4\xebul\xf4\xa6x_\x83\x8fV\xb9\x01L\x87\
-\x0a\xe1z2B\xb1\xba\x95\x0b\x86\x9e\xeen\xb8\x9e\x0b\
-\xd7\xf3@\x8a\xe0{\x1e\x5cG\xaf;)u\xf7\xa0P\
-(\x22\x08\x1bh\x04\x0d\x14\x8by\x08.\xd0\x08j \
-EZ\xf7\xce8\x048\x94P\xda]\xffU2\x15`\
-\x8c\xa123\x85Jy\xbaU\xfa6\xf9\xaa\x18\x87\xb6\
-\xab\x00D\x12@\xecB\x1b\x85\x08\xc3X=oV\x8d\
-\xc7\xa3\x90b\xff\xf5D\x0b0\x8bm\xe7h\x98\xa02\
-\x19\x82\xed\xc9'e\xd7%\xa5\xc4\x8e\x17_\xc4\xde\xd1\
-\xd1\xd8\x95;:\xa5\x0c\xb7I\x02\x93{\x9fC\xce\xa9\
-\xa3\xbb\xe4\xc2+t#l4\xc0\xdc\x1c\x98\xcbu\xf8\
-\xae\x08 \x84 \x00\x82\x89$E\x0bH\xa1\x99\x96z\
-\xfe\xe3\xeb\xba\xeb\xde\x82\xdf}\xcf;O9\xe8\x18\x22\
-\x22\x14\x0a\x05\xe7\xb2\xcb.{\xe7\xd6\xad[\x1f\xde\xb0\
-a\xc3w\x88\x881\x96\xf6\xd4z\xa5\x00\x0fC\x8b[\
-(\x80\x16nK\x00\xf2\xae\x8b|\x7f\x1f\x0e\xa9H\x8b\
-\xa8\xa6\x08\x87\xf6K\xe5\x5c\x87,\xe1\x0c`\x02\x9e\xe3\
-@x\xfc\xa8\x98\xb6]\x96\xc7\xb6\x00\xc1\x01\x1fn\xfc\
-b]={$\xbd\x82;P\x0a\xa1R\x08\xa1\x10I\
-\xbd\xad\x80Xz2\xf5dTn\x1dhU\xb1!u\
-\xec\xd4\x0f\xa6\x13I\xc5k>\x00\xef\xec\xd7'\xfb\x87\
-\xbe\xfeiD\x87G\xb5w\x10\xe7\x96\xad-V\xb3%\
-j\xcf,I\x90\x00\xd2*7)#\xec\x1f;\x005\
-\xa6]B\x95\xd2^S\x82\xc5\xc6H\xa9W\xeb8\x82\
-#\x0c\xf7!\x0cC\xad\xa2\xe3H\xa2\x1d\xeb\xf8Wq\
-\xff3t\x9aR\xbc\xa2)I\x9d\x0c\xb4\x81\x04\xc5\x91\
-\xbb\x9b\xdf\x9c\x06\x9f0\xb0\xd6\x8a\xc4\xff\xc9\xcc\xc6`\
--\xec4s\x81\x0e\xf5\xa7\xb7\xe7n\xa7\x01\x1d\xcb\xbb\
-\x0d\x80\xe7\xfb\xe8\xee\xe9\xb1>\x05j\x01&\xd7u\x91\
-\xcf\xe7\xe7\xa8\xbf\xf94-\xcff\xb59q\xd5\xcfj\
-\x9b\xb5\x9dhH\xe2\x9cD\x86\xb8\x10\xd8\xfb\xc2K\xd8\
-\xfb\xc2K0}\xe5:\x0c\x80V\xad\x81)\x98d\x95\
-\x80\xd2\xd10\x10\x17\xd5\xa9\xe4f}\x864]p\xfe\
-y\xf8\xe0\x07?\x88b\xa1pL\x8e\x08'\x8a\x88\x08\
-A\x10,d\x8c}\xee\xa1\x87\x1e\x1ae\x8cm\xce*\
-\xf7\x8a\x00\x1e\x06\x1d\x040%\xe84\xb7I\xa1\xaf\xd4\
-\x0dY\xcc!Ta\x13p\x98\x00A\xcf\x16(N|\
-\x04\xc1\x01G\xc0u\x05\x1c\xee\xb4\xcc\x9c\x8e\x89(\x19\
-\xea`\x00\x1c\xa6A\xce\x83@!\xfe@\xb4jN!\
-R\x0a\x81\x224\xa4BH\x12\x92\x14\xa2,\xf5a\xea\
-)3\xc1\xa7E\xed\xf6\xea\xa2p\x1e+\x9a\xdd\xb5\x17\
-\xa3\xf8\xe6\x0f&\xfb\xd3\xf7~\x0d\xf5\xa7\x1f\xd0\xaa\x09\
-\x03,1\xe04IK\xc4M\x95\x9bq4\x88\xa1\x22\
-V\xc1iQV \xe7{\x90R\xc2\xf3r`\x5c\x7f\
-\xdc\x9e\xaf\xb3gJ\xa9\x0d\xed\xe5\xf2\x8c^p\x0c\x1d\
-!\xa0\xe9\x96K\xbf2\x81\xc1;\x83\x83\x01\x15\xd5\x94\
-f\xccq]\xd0\x92n\x92K`\x00\xabY\x7f\xf6}\
-\x8e\xa6}\xf6Z\x12\x15\x03&g\x1c\xabV\xae\xc4M\
-7\xde\x98\x94m\xb3-\xa7\xd4\xac\xcc:\xdej{j\
-\xb6\xcb^\xab\x12\xffV\x0f\x1c8p\xd7/~\xf1\x8b\
-\x1f\xa7\xdb&\xa5dD$\x88\xc8\x8d\xa2(\x17EQ\
-!\x8a\xa2R\x14E}\xb9\xfe\x05\x973\xc6\xd6 \xe1\
-\xa3,\xe9\x90Rw\x09\x97_z\x19\x90\x13x\xf8\x81\
-\x9f\xc2u}DR\x22\x08\x1a\xdas0\x1e\xa7\x9c\x09\
-(\x15`zr\xfe\xeba\x06\x07\x07\xf0\xbe\xf7\xbc\x1b\
-\xbd\xbd\xbd\x90\xb3\xa6l95$\xa5\x84\xeb\xbag\xf6\
-\xf6\xf6\xfe\xc5\xd3O?\xfd\xaes\xcf=w,]\xe6\
-\x84\x02O\xc2<\x81\x8e\x0c\xd4x\xbb\x91T\xb0G\xb7\
-=\xb8\x94\x22\x0c\x0c\x0f\xa1\x22\x84\x0e\xea\xc9Y<A\
-c:\xdfD\xc4\xf5\x0apG@H\x01eb\x10\xcd\
-\xe1K~L\xcfd\x1e\xcc\xb4\x9d1\xb8\xe0\xf0\x84\x00\
-\x13za\x9d$  \x1d\xe7\xa8\xa1\x14\xb8\xe3\xa0\xcc\
-y{=\xc9Vv\xe7\xc4<\xe1W\x8ex\xdf\x22t\
-\xbf\xeb\xd6d\xbf\xfe\xdc\x16L\xdd\xf3w\x1a\x1cbF\
-b$\x9dv\xeeO\x96\xca-\x1b|\x14)Tf&\
-Q-\xc7\xa3+\xf1\xba\x8c''0\xce-\xbc)\xcd\
-0\xe3\xa0`\xd6\xa3\xa4Y\xdc\xab\x89\x9am\xef\x0c:\
-\x06l\x9a\xa0c@E\xff(\x0bt\x8c\x8a\x8d\xac\xdf\
-\xd9UlG\x05>D\xc9:\x1e\xad\xe1\x8e\xef\xcd\x19\
-\x86\x86\x86\xb0d\xc9\x92\x04\x98l0I\xff\xa6%\x96\
-N\xc0\x93.\xeb\xbanX\xab\xd5\xb6=\xf5\xd4S\xdf\
-J7mtt\x94\x01p\x01\xe4\x01t\x01\xe8\x050\
-\x08`\x91\xdb\xd5s\x16\xc0\xceJ_\xa3\xd7\x19u\xe1\
-\xfa+_\x0bt\xd7\xf0\xf4\x13O\x01\x8e\xaf\xc3\xfe\xd4\
-\x1c\xe4=\x0f&\xea\x04w8\xa2\xc0GyF\xe7\xf6\
-Q\x8c\xc7NS\xcd\x0f?\xce\xcb\xa75=L\xe0\xdd\
-\xef\xbc\x19+V,\x9f\xd7\x04\xefT\x10c\xda\xb5_\
-\x08q\xb5\x94\xf2\x13\x00>\x96V\xb9\x9d0\xe01\xde\
-c\xe6Ni-\x9f\xf9\xb4\x01\x80)\x91\xd8J\xda>\
-v\xd2\x19G\xbb\x86\x86q\x10\xb2\xc9;\x14\x07\x09\x02\
-S\x0cp88i\x9d\xa9ru\xfc*\xd7\xcd\xc1q\
-D\xbb\xd4pBxIS&\x12\x8cA0\xc0\x83\x03\
-\x08\x07\x92\x08N\x10\x22\xf0Z\xd5\x01\x8e\xbd\xd8\xce\xf2\
-\xdb\xce\x84\xa0W+\xff\xcb \xee\xe5\xd0\xfd\xbe\xbf\x00\
-/t\x03\x00\xe4\xe4\x18\x8e\xfc\xc3\x1f\xeb\xf55,\x8e\
-\x10\xdcb\xc03j6\xb2\xc0\x060*\xb7\xe6>,\
-g\x03\x00\x89\xb1[KI\x0a\x88\x8dx\x14\x07\xf5d\
-q\xa8\x12\x0b\xe4\xa0'\x0e$%t\xbc\xf9x\x94\x9a\
-wD\x88%\xa7,:\x95\xe2Q\xfb\x00a\x8c'\x81\
-\x1f\x93R\xd6\xf7\x95\x06\x95D\xcd\x05\x1c\x15\xe8\xcc\xa6\
-b\x9b/\xf8(\x22pc{2\x00\x18K=B\x08\
-x\x9e7\xe7\x02\xc7\xe6s\xb3\xb6c\xf69\x1b\xc0\x0c\
-\xb9\xae+\x18c\xa5\xd1\xd1\xd1ZF\xf3\xccjM\x06\
-\xcd/\x1b\x00\x02\x00!\x18\xcf\x9c\x162\xce1=S\
-\xc1\xdd?\xfe\x09\x88\x01\xd5\xca\x0c\xba\x0a\x00\x94\xb6\x13\
-\x86\x0d\x82\xe7\x0a\x04a\x044\x00\xd7\xe5X\xbc`\x01\
-jA\x88\x9c\xe7B\x92BP\xab!\xdfU\x04'\xa0\
-\xd6\x08\xe1\xbb\x0e&\xcb38o\xfdz\x5c~\xd9\xa5\
-\xcd\x98i\xafP\x22\x22\x16\x04\x01s]\xf7\xdf=\xfe\
-\xf8\xe3\xf70\xc6Z\xa4\xc9\x13*\xf1D*\xf6\x04K\
-Z\x93\xfck\xf9N\x95\x8c\xd0\x08\xb3b\xb5\xe9\xc1\xd8\
-S\xea\x02\xba\x8bh(\x15\x03\xbf\xd0\xd7s\x05&\x1c\
-p\x84 \xc9A\x8e\x00W\x04\xeeH\xb8y\x07\x11\x01\
-\xd5(J\xe2\x111\xc4\x81\x1ec\x86\xd2\x8c\xa8u\xfc\
-\xc8\xae\x8bA\xdf+\xc79\x8aN\xab\xf4\xd5\xe7y(\
-9>\x5cG P\x84\xc8\xa8\x1bXF\x98\x96_!\
-Z\xfa\x81?\x87\xbbt-\x00\x80d\x88\xc3_\xf9C\
-\xa0:\x9d\xc4\xb2\x22\x93\x8d2\x01\x95\xd6\xb7\xd3t.\
-`\xd6\x18\xd2RO\x5cB\xff\xb7\x84%\x02\x12\xd7h\
-\xfd\x13'\x90#\x03>1\x10\x11A\xca\x08\xfdC\xc3\
-p=\x0fA\xbd\x06\xd7\xf3\x0100\xae\x97\x8c\x95'\
-'\x10\x04\x0dp\xc6\xa0\x946-\x12\x18dX\x7f\xd9\
-Z\xddc!\x22@8.\x5c7\x8e\x17H@\x18\xd4\
-\x00p0\xee\x9bRM 1\x17%?/\x07t\x90\
-\xda?\xb6\x0e\xd0`\xd0\xf4\x18\xd4+\xf4\xf4\x8e\x0d<\
-iU\xd9|\xeb\xb6\xc1(\x0b\xc0\x84\x10\x5c)\xd5\x7f\
-L\x8d\xcf \xc68&'\xa6p\xffC\x8f\xe8\xa0\xc2\
-\xc2AO\xb7\x00\x91@\x8e\xc5\xc9\xec\x84\x03&uD\
-}G\xf8PJ\xeal\xa3\x0e\x8f'\xcb\x5c\x07G\x8d\
-\x7f#\x0e\x14\xfd\x1cn\xb8\xfe\xadp\x1c\xe7\x15\x0f<\
-@\xa2B\xedf\x8c}|\xd3\xa6M\x0fo\xdc\xb8Q\
-\x87\xbb\xc0\x09\x04\x1e\x0e\x06!X\x12\xa2&\x19\xa4@\
-\xf2\x81\x18\x0a\x95\xea\xe8\xaa\xaa\x88044\x88\xaa\xe7\
-\xe8t\xaf\x8c\x81\x09\x80\x88\x83\x13\x87\x12\x00W\x02$\
-\xf4\x83*O\xdfL8\x1e*\x14a\x22\x0c\x8cR\x05\
-\x0c:_<\x07\xe0p\x0e/\x0e\xd5\xe3\xb1\x93\xcf\xea\
-{\xdc\x1c\x06\x1e\xa7'd\x00\x00 \x00IDAT\
-s98\xb9<\x1aQ\x88\x9a$\x04$\x11(\x85\x88\
-\x14\x18\xb1\x16\xc6\xf9\xab@\x83oz\x17\xfa\xaf\xfe\xb7\
-\xc9\xfe\xc4\x1d\x9fE\xb8g;D\xecL@\xb1\x84l\
-\xc0\xc6\x06\x1f#\xf5$\xfa|P\xec\xc9\x96\xa1r\xb3\
-\xd6\x9f$}\x18_J\x16\xf8\xc4\xab\xc0\x92r\x04\xbd\
-\xda\xbf2=\x03\xe1\xb8\x08\xc2\x06\x04\xafB8B{\
-\x1d\x11!\xa8\xd5\xa1HB1\x0e\x22\x09%9\x18\x08\
-a\x14\x07|\xb2\xd4AY\x8cn6\xa6i\x97\x9fO\
-9\xb3\xd6H\x07\xb35S<\x16?\x1bK\xc5>\xcc\
-\xb0\xd7\xcc\x1btZ\xefm\xfas\xbe\x12\xd0\x5cd\x04\
-1j\x22O\xd2v!\x04r\xb9\x5cf\x1f\xd9\xc7\xd2\
-\xa0\xc49\xefht7\xe7\xcd5B\x08\xc19\xef\xef\
-\xe4\x81u,\xc4\x18\x03w\x04\xa0$\x84\xcb \x84\x03\
-\xe1\x0a\x14Y\x1e\xa1\x94\xd8\xbds7j\xb5\xaa\x8e\x0a\
-}\xe8\x90\xbe\x86s\xd0\xf8Ds;n\xbf\x91\xb2\xaf\
-\xba\xf2\x0a\xacY\xb3zN\xd0\x89\x9f/\x9eo\xb1\x96\
-\xe3\xf13S\xfc\xac\xf3z\x16\xd3\xe7\xc6\x99\x22\x8eN\
-\x90\xd4g\x9c-\xb2\xde\x8d\x94\x92\x1c\xc7yC>\x9f\
-\x7f#\x80\xef\x9b>>a\xc0c\x0c\xf1\x8a1Df\
-0\xc6\xff[\xb4\xe71\x06E2\xbb3]\xe1\xa0{\
-h\x18\x879\x81\x94\xfe\xa0\x18#\x803\x0d> \xa8\
-\xd8=\x961\x1d\x92\x9c\x13Ax.\xa4\x22\xd4\xa5\x84\
-\x22c(n2\x1b\xce\x18D\xa8\xe3\xd0\x15\x84\x83\xa2\
-\xeb&\xea\xaf\xe3\xde\x17q\xbd\x9c\x11T\xcc\x14\xff\xfd\
-\x13\xdd\x00\xea\xf1\xdf\x5c\x14\x02h1>~\xec\x82o\
-\xee\xf9X\x87\xc2'\x96\x18\x02Fx\x90\xea\xe5\x0f>\
-\xf1\x81sv\xce\xf7\xb2\xc2\xaa\xf3\xb1\xe4\xfd\xff%\xd9\
-\xafl\xf9\x1e*?\xfdn\x0c:\xa2\xc9\xac\xcdm,\
-\xf0iy+\x06\x84\xf4\x0e:\xd9{L4\xbd\x16\xc9\
-'\x06s\xb2\xc6C\x13\x90\x00\xc6\xf4q\x87\x03\xc5\xbc\
-\x87\xc2@/8\xe7\xa87\xeah\xd4\xeb(\x16\x8b\xe0\
-\x03\xbd\x08\x82\x08\x92$\x04s\x10\x84\xdaX,8G\
-\xa5RF\xa1P@\xb5Z\x85\xef\xf9\xe8\xee\xedA\xa5\
-\x5c\x05@p\x1c\xbdp\xac\x5c\xa9\xa0X(@\x87\xce\
-o\xc0q\xdc\xa4}\xbe\xefCI\x85F\x18\x22\x0c\x02\
-\x14\x0b\x05\xd4\x1a\x0d\xf8\xae\x0b0\xa0\xd1\x08P,\x16\
-\x93\xf2\xfb\xf7\xef\xc7\xccLEk\x0c\xa2\xd8K-\x8e\
-\xdc,\x84\x01>#\xad4\xfb\x03v\xdf\xcd\x09:\xc6\
-\x0ed\xab\xd2\xe2\xeb\x93\xfdN\xe04O\xa9\x04\xcd\xc9\
-\xa8\xd96\x0bS\x85\x10\xf0}\xff\xa8\xa4\x9cy\xdd\xb3\
-\xd5.\xc4]\xd7\xed\xfb\xd9\xcf~\x96\x03\x90\xa5n;\
-f\xe2\xe0\xa8W\x1b\x18\xdd\xbd\x1b\x8a\xc5z\x16\x02$\
-Ep\x5c\x07 \xae\xe3\xaf\x99G\x8b\xb7\x15)\xbd\xee\
-'n\xab\xeb\xbax\xd3\xc6\xab\xc19G\x14kq\xb2\
-\x9e\xc9q\x1c\x08G\x80\x141\x22j0\xc6j\x00\x22\
-\x00\x8c\x88\x5c\x22*\x08!\x1c\x22\x9a\xb7\x8d\xc8\x84\xdf\
-\xe1\x9c\x8f\x11\xd1\xbe0\x0c\xcbD\x149\x8e\xe3:\x8e\
-\xd3\x03`\x91Rj\x10hw,\x8a\x01)\xef\xfb\xfe\
-\xfbGFF\xfe\x8fy\xd2\x13\xaaj\xe3`\x10\x5c\x8b\
-\x8a\xb6\xef\x05\xa56\x88\x08\xb5\x18\xc5-\xb3(\xa0\x14\
-z\xbb\xbbA\xbd%\x04D\xc6\x9a\xafK\x09\x80\x91H\
-\xcarr@Lj\xc9\x86\x08\x9e\xef!\xef\xb8\xf09\
-O\xd9\xe7\x9b1\x13H\x01\x0d\xa5m\x0a\xbe\x12pN\
-\x803BrW\xc6p\x06\x9f\xc1N\xd9}\xc2\xeeq\
-R\x88\xe0\x11\xf0&x\xf9\xbf\x07\xf0fhT\x9c\x95\
-\x9cR\x1fV\xfc\xc1\x97\xc1\xe2t\xd5\xc1\xe8s\x98\xf8\
-\xf6\xff\x03\xcey\xe2\xc6\xca\x9a\xe8\x90\x19\xa1\xc0P\x96\
-4\xd4\xba\xdf*\xf94=\x97tMz\x01d\x0c>\
-\x80v*\x88A\x87H\x97\xf5r9t\xf7\xf5\x22\x97\
-\xf3\x11E!J=\xdd E\xc8\xe5}DA\x88z\
-\xbd\x81Z\xa3\x8a\xaeb\x09SSS\xe8*u\xe9E\
-\x98\xae\x87\xaeR\x11\x9e\xe7\xc3\xf7}\x14\x8bE\xc8(\
-D\xa1P\x84\x8c$\x98\xa3\xe3p\xe5\x0b\x05x9\x1f\
-\xb5J\x05z\x15\x81~\xe6\xa5K\x96b\xef\xfe}\xf0\
-\x19\x83\xef:\x00\x13(uuA8\x0e\x18\x80R\xa9\
-\x1bBp8\x8e\x83\xf1\x89q\xd4\xeb\x81\xe92\x8b)\
-\x93\xb5\xdf\x0a4\xb6j\xcd@\x0e\xe9\xc5=\x19\xa0\x03\
-\xa4A'\xedL\xd0\x09p\x8e\x9a\xe2\xf6\x12\x80$:\
-h\x5c\x97\xe38\x89\xbbt\x96W\x9a9~\xac\xc0\x14\
-\x8f=.\xa5\xec\x9e\x9c\x9c\xec\xc2q\x06\x1e@;\x0a\
-D\xc4\x00\xc6\xe2\xc0\xa1\x040G\xbb\xef\xc7AW\x11\
-G\xb9\x06\x00\x92\x91\x86\x0a\xab\x8d\xe7\x9c\xbd\x16k\xd7\
-\xae\xe9\x08:\x80\x06\x88F\xa3\xb1\x7fjf\xea\x87\xf5\
-j\xfd\x11\x00/\xe5r\xb9\xe9\xae\xae\xae\x801\xc6\xa2\
-(r\x19cE!\xc4*\x00\xd7\x0a!\xae\x05P\x90\
-R\x9a\x19\x86M$\x84`\x8c\xb1\x901v_\x14E\
-w\x95\xcb\xe5\xa7\x5c\xd7=\x90\xcb\xe5\xcaA\x10\xa8\x89\
-\x89\x097\x97\xcbu\xb9\xae\xbb\xc0q\x9c\x0b\x19co\
-\x07\xf0F\x00v$^\x16{\xde\xbd\xf1\x86\x1bn8\
-\x971\xf6$p\x12\xdc\xa9\x1d\xc6!\xa1\xc3\xb8w\xd2\
-\x19\x11)\xd4\x95\xd4*\x15\xfb\xb8\x02\xfa\x87\x87Pv\
-\x1c\x98\xd0\xeb\x8c\x13Hq0(\x90\x00\x18\x84\xb6\x19\
-;*\xd6\xfb\xebe\xa0\xae\xe7\xa1\xcbq\xe1\x0b\x07\x1a\
-lby>!=\xd3` \x1d\x85\x9b\x9f8\xe3\xb0\
-\x99\xb9\xdd\xd0\xb5\x07\xdf\x9d\x8c\xb0\x97\xf5B\xbd\xda-\
-9B\x5c\x0e\xed\xe9\xa3\xd0\x1e*7!\xc69\xce\xfc\
-\x8f_\x84;\xb8\x04\x00 \xab\xd38\xf2\xd5\x8f\x83\xc9\
- Q\xb1e\xce\xde\x90\x92z2\xec>\xb3\xef\xc7\x91\
-\x0d\x12\x06\xaa\x8fi\x801\xaa5\x00\x09\xd3jNy\
-\xc2\xc3S846\x09\x10\x83\xcb\xf3h\xf0\x08\x0d\xa6\
-\xdd\xe6\x01\x89\x88t\xec7\xdbF\x04\x00\x82\xeb\xb1\x9e\
-,\xd1`\x86\x917\x9f\xaa\xa9\xe6kWK\xec|\xe9\
-%P\x9cz \xcd\x09l5YSBCK\xfdM\
-\xf5\xa1]\xd6\x96\x5c\x9aR\x8e\xe9\xe3,\xd0iR;\
-\xe8\x1c\xed\xef|\x88\xcc\xf3\x19\xb0\xb4\xce9\x8e\x83\x5c\
-.\x97\xa9^3\x94\xe1\x1e\x9d\x92\xd0\xa8erc\xb7\
-1V\x1bq\xa5T\xafR\xaa\x04\xe0\xd0\xbc\x1b>\xcf\
-gs\x85\x07\xaf\xd4\x03\x0a\xea0\xef]8\x02\x8dF\
-\x1d,R\xda3W\xe9\x8cn\xfa\x0d\xf2\xe6:\x9f\x98\
-.z\xed\x06\x14\x0a\x85$\x12w\x9a\x1c\xc7\xa1]\xbb\
-vm\xba\xe3\x8e;\xbe\xf4\xe4\x93OnSJM\x12\
-Q\xe5\xf2\xcb/o|\xf9\xcb_\x96\x00p\xc7\x1dw\
-\x98\x0b\x7f\xdc\xd3\xd3\xf3\xf5\xde\xde\xde\xdf\xf0}\xff/\
-\x85\x10+R\x80F\x8e\xe30\x22\xda\x1dE\xd1\x9f\xe6\
-\xf3\xf9;\x83 h\xdcw\xdf}rdd\xa4\x85\x91\
-\x12\xd1\x11\x00\xbb\x1f\x7f\xfc\xf1\xadA\x10\xdc\x9e\xcf\xe7\
-\xef\xe2\x9c\xbf\xc1\x96|\x94R\x94\xcb\xe5\xfa+\x95\xca\
-\xf5\x00N\x0e\xf00\x00\xae`\x88\xa4%\xd6\xa3\xa5\xe9\
-\x90\xc4\x10DQ3\xc4=iCn\xcesQX0\
-\x84\xc3\xe6\xe3a\x00\x88kg\x12\x15\xe7I\x8c\xc1\x87\
-1@)\x068\x0c\x02\x1e \x04\x02\x92h\x86\xa4n\
-\x92\xbe\xb5J\xb69\xb4tVr\x1c8\xfc\xe8\x16\x9d\
-\xce\x87\x84\x10\xf0s9,\xed\xc9\xe3w\x1a\xbfD\xa5\
-\x5c\x01\x806\xa6\x9bn)\x83a\xba\xad\xc7w\xbc\xf8\
-\xe2=\xff\xe5?\xff\xe97\x8es3\xe7\x22\x06\x80_\
-\xf0\xcd=\xff\x0b\x00@\xf0\x00\x14\xa0\xbd|:\x02\xcf\
-\xc2\x1b?\x86\xd2\xb9W%\xfb\xbb\xbf\xf4Q\xb8\xe3{\
-!\xacL\xa2m\x94\x012\xc9\xa9\x8e`\xa3\x1b\xd5t\
->\xd0M\xd6j7\xa0\xe9P`1\xec\xd8?AK\
-?\x04\x1d)\x01\xf0\xdd\x22\x8a\x0a\xe8\xa2\x08\xb9\x06\x10\
-\xe4\x96\xa2\xe2H\xeckL D\x03\x90a\x9b\xba\x09\
-\xd0\x19;\x81\xa6jOo\xb7\x8f\xa6\xe6\xb1\xd6sJ\
-5\xa7\xb9\xa6\x8a4\xff6\xa0\xd3<\xa7%;\xfde\
-)\xab\xcev\x89\xa7E\xb5\x16K\x15\xd9\x92\x0e\x90\x0d\
-:H\xed\xbf|\xd01-m\x02`r\x04@\xbb\x8d\
-\xa7\xed\xda\x0c\xbb\xc21\x10\x03\xd0S\xaf\xd7\x87\x01\xec\
-x\xb9\x95\xb5\x92D\xb1o!V\x9c\xf7:L\xec\x7f\
-\x09\xc1\xcc\x0c\x8a\x03](v\xe5\xf1\xfc\xd6'Qm\
-\x84@0\xbb\xcd&\xe7\xfbX\xbf~\x9d\x96\x8e2\x00\
-\xd8u]\xfc\xfc\xe9g\x1e\xfc\x93O~\xe2\xff;x\
-\xf0\xe0n!D\xe0\xban433\xa3\xb6m\xdbF\
-\xb7\xddv[\x1c\xaaR\xdbW\x88H1\xc6\xc2M\x9b\
-6}\xcf\xf3\xbc\x83\x8c\xb1;\x1d\xc7Y\x10K&\xe4\
-8\x0ec\x8c=\x16E\xd1\xef\x01xz\xdd\xbau\x11\
-\x00\x5ct\xd1Em/\xd6\xd8\xc4FFF\xe4\xbau\
-\xeb\xa6\xce:\xeb\xac\x0ao\xf7\xfcdJ)\xe4r\xb9\
-\xab7m\xda\xf4\x97\x1b7n\xac\x9f\x94\x05\xa4\x9cq\
-\xb8\x8c\xd0\x80\x89\xe4i\xce\xc4r\x08)\x04\x91L}\
-3\x0a\xfd\x03C\x08\x0a\xf9x\xa6i\x1e\x01\x00q\x80\
-\x13\x98\xd2\x8b\x02\xc9\x01 u\x84k0\x06\xc5\x08\x8a\
-;\xa8H\x89(\xb5\xe2\x1aH&V\xcd\xdb1\xa0&\
-%\x02r\xd1\xed\xb8\xc89\xc7\xb7[D\xac.\x18\x18\
-\x1c\x00c@\xb90\x83F#H\x98\x9e\xfdh6\x19\
-UP\x9aJ\xdd\xdd!\x80\xf2qm\xe4\xdc\xe4\x00H\
-s\x80\x1cLN\xb4\x0c\xea\xd9\xf0&,\xf8\xad\x8f&\
-\xfbc\xdf\xfd[Lm\xfd!\x86\x17,\xea(\xe9$\
-\x94\x02\x9f\xc4\xb9\x00\x9d\xc0\x87\x9a\x00\xcd4#\xee\x0c\
->\xb1\xa4B\x80q\xab6*'\xa5\x80F\x97\x83\xb3\
-\xcf8\x03g\xfa\x0e*S5\x8c\x86\xbd8,\x96\xc3\
-\x19\xff9\xa2\xe9\x97@Qr\xa36&\xdb\x04\x86\xec\
-g\xeb\x80\xb3\xb3R6#g\x16\xf8\xd9\x80\xa3\xcb\x13\
-\x19\xa9\xc8\x0ctj~\x05-\x00\xc1,\xf0i~\x80\
-\xd9\xa03\xb73\xc1\xb1{\xb6\x99gi%\xcey\xbc\
-\xe02\xeb\x9a\xa6$c;\x12\x18\xc7\x02\xe3@\x906\
-\xb0\x9b}S&f\x94\xae\xe38K\x8f\xa6\xcd\xf3\xd1\
-Y\x90$\xe4{z\xb1d\xf5y\x88\xa6\xc7A\x0c\xe8\
-_\xba\x0c\xbd\x0bz\xb0\xe3\x99\xed T1WD\xc6\
-\xbe\xfe>,\x5c\xb0 s\xb1\xa8\xe38\x18\xaf\x85\xd1\
-\xdf}\xf5\x1b?\xda\xbbwo\x1d\xd0v\x96z\xbd\x8e\
-O}\xeaS\xa5\xb7\xbc\xe5-\x17\x17\x8b\xc5\xde(\x8a\
-v\xdf\x7f\xff\xfd?\x05\x10\x19\xb0\xd8\xb8qct\xfb\
-\xed\xb7o^\xb3f\xcdg\x85\x10\x9f\x8b\xa2H\xc4\x92\
-\xce\xfe(\x8a~\xef\x9e{\xeey\xe23\x9f\xf9\x0ce\
-9\x5cl\xda\xb4\xa9wxx\x98o\xdb\xb6\xadv\xf3\
-\xcd7\xd7FFFhdd\x84\xaf^\xbd:\xf3a\
-\xe2\xbe>\xc7u\xdda\x00\xbbO\x0a\xf0h\xa9\x87C\
-F\xaa\xc5 @\xf1Y\x05B\x18\xb5\x9a\x0a\x18\xe3\xe8\
-Y8\x8c\xaa\x93DPk\xad\x90X\xacU\xd3\xdeF\
-$b1\x89\xc5\xc9\xe9\x5c\xa6\xc3\xde\xc4W3c\xdb\
-!\xc3\xd0M\xad\x9a)\x85\xa40\x1e\x04\xa8K\x85^\
-R(:\x0e\x9c\xe3\xe4\xed&\x84@.\x9fG_\x7f\
-?\xf2\xf9<\xea\x8d\xba\xf6\xf6\x9b\xe3#5\xc0\x93~\
-\x93==\xbd\x13\x00\x9e?.\x8d\x9b?\xe5\xa1\x17\xcf\
-\xd9\x14g|o%)%\xe3\xfd\x8bq\xc6\x7f\xf8\x9b\
-\xe4\xd8\xcc\xd3\x0f\xe0\xc0w\xfe\x12\x00\xda\xed:\x9d(\
-e\xef! \xe5\xd9\x96-\xf9\x10Lj\x8b&\x18Q\
-r\xb2U\x9d\x94\xa8\xc3b\xe9GR\x843\xba\x8aX\
-\x91\xf7q^\xc9\xc3LW\x11%^@\x81|T*\
-\x83x\x9a^@\xd3+3\x1eY)\xc6f\xdd1\xa9\
-\xd7z$\x8b\xd2\xaa\xad\xb9\x86\x84\x01\x89\xb4dc_\
-O\xf6N\x5c\xc2\xd64\xb4K9\xad\xd75%\x8f\x93\
-\xa1f\xb3\x1a\x9b}\x94(\x01\x95N\xd2M\xfa\xb8\x91\
-\x0cf\x03\x1dK\xcd\x06\xa5\x14<\xcfs\x82 Xq\
-\x0c\x0d\x9f\x9d\x18\x10T\xcb\xd8\xbb\xe3\x17\x98\x9c8\x88\
-B\xd1\x87$\x89\xa0\xde\x00\x17bN\xd0\x01\x80\xb3V\
-\xaeD\xa1\x90\xd7\xa1\x9dR\xcf\xe3\xba.^\xdc3\x11\
-<\xf3\x8b\xe7&\x85\x10\x90R\x22\x97\xcb\xa1^\xaf\xe3\
-\xfa\xeb\xaf\xff\xb3\xfe\xfe\xfe\x0f\x85a\x88\x5c.Ws\
-]\xf7\x8b\xb7\xdf~\xfb\x9f\x0c\x0d\x0dy\x8dF\xc3+\
-\x14\x0a\xbe\xeb\xba\xbd\xd5j\xf5\xa5|>?!\x84\x18\
-\x14B\xa80\x0cG.\xba\xe8\xa2\xadi/\xbf\x07\x1e\
-x`\xa8T*\xbd\x9b\x88\xae#\xa2\xa5a\x18\xb2U\
-\xabVU\xb6n\xdd\xfa\x9c\xe38?\x99\x98\x98\xf8W\
-tX\xf2\x1eE\x11\x1c\xc7Y\xec\xfb\xfez\x9c,\xe0\
-\x01\x8c\xa3\x81@$e\xab\xbd\x85AGh\xb5l<\
-\x8a\x14z\x8aE\x88\xbe^\xd4\x09\xf6g\xd3\xa4\x18|\
-4\xd0h\xfb\x0e1\xe3\xc9\x03\x80\x09\xeb\xa3\xb7\xfe\xb3\
-\xe6\x10\x17\x09\x832!Z\xb4k\xf7L\x18\x823\x86\
-.\xe3S\x7f\x1c\xc8u]p\xce\x91\xcb\xf9\x90RZ\
-:\xed\xd6Gj\xdb\xcf\x00\x9e\xde\x9e\xbe\x0a\x80\x03\xc7\
-\xa9i\xf3%\x1d\xef\xbd\x95\xb2\xba\x875\xc8q\x8b\xef\
-\xf9\x0b\x88\xa2\xce$\x1a\x1e\xd9\x87]\xff\xfd\x96\xc4=\
-tNi'EM\xf9\xc2\x1ch\x02R;\xf8\xe8\xb7\
-\x99\xe8\xfacUT\xbcL4I\xfe\xd7\xb4\x7f\xd8\xd2\
-\x8f\x96\xcew\x1d\xaaaf\xf2\x10F{\x14\x96\x15\x1d\
-0\xaf\x0b]\x95]8|$\x82K\x05\xd4\xa8j\xb5\
-\xca\xb6\xe34\x7f\xcdXkJ\xd6Y\x8cu\x16\x06M\
-\xad\x89CZ\xffRE\xd3\xeaH2\x92\x89N~G\
-\xb1Z-\xee:\xab\xcd6P\xb4\xbaN\x9f\x1c\xb0\xc9\
-&\xbb\xa6(\x8aP\xa9T\xda\xdc\xcc;\x8d\x9f\x16\xd5\
-u\xaaL\xba\x0e\x03<\xb1\xc4\xe4EQ\xb4\x1a\xb6A\
-p\x0e\x9aWP\x11\xce\x10\x06U\x843\xa3\xe8\x1d\xec\
-\x87W\xf0\xb4\xd7\x19c\xc8\x95\xba\xa0\xc6\x0e\x83\x8b\xd9\
-\xd9\xf0\xf2\xe5g\xce\xfa\xbc\xe5\x86^\xb3b$\xa2z\
-]{\xca*\xa5\xa6\xc20\xac+\xa5r\x9c\xf3<\xe7\
-\xfcc\xeb\xd7\xaf_\xad\x94\xea\x89\xa2h\x98\x88\xfa\x00\
-\xf4\x12Q!v{\x86\x94\xf2\xa9\xc3\x87\x0f\xffS\x5c\
-w\xf2*~\xfe\xf3\x9f_\xc09\xff\x9a\xeb\xba\x1b\xa2\
-(J\xdc\xa7\x85\x10\x10B\xbc\x961\xf6\xae\x9e\x9e\x9e\
-=D\xe4gy\xcb\xc5\xef\x8c9\x8es!\x80\x7f=\
-\xa9\xb1\xda<\xce \x15CH)'\x02\x22\xadj\x8b\
-\x89)\xa0o\xc10*\x9eg\xa6\xb0\xd9\x94L\x85\xe3\
-\xd0'1\x00I\x02<G\xa0\xe4x\xc89)\xa9\x85\
-\xac\x01\x08+uw\x5c\x1d\x8b%&\x87\x1d?\xd01\
-$\x84\xd0n\xb5\xc9\xdd\xb3\x1f\xa7e?\x03x\xba\xba\
-\xd8\xa9P\xb5\x01@)\xe3X\xbay\xceCC\x97_\
-\xe9t-\x03\x00P\x14\xe0\xa5\xbf\xfe\x10\xa2\x99\x89\xe6\
-\x05G\xa3\x93\xb7\xd4lY*\xb6L\xf0I\x19\x9ac\
-\x19\xa8YF7\x22\x1e\x0bM\xbb\x06c\x00#\x86z\
-c\x0a\xfb\x1a\xd3\xd83\x15\xc1\x11\x1cP\x1c\x8a\xc5R\
-\x06\x93\xf3\x90\xd6\xb2\xf0y\xf6\xf1\xd4l\x99iL:\
-\x0ev\x1a\xdc\x9a\xcc>m47\xedK\xea\xa4\xe63\
-\xear\xfaxSz\xc2Q\x81N\xba\xdc\x5c\xc7\xe6K\
-\xd4\xfa\x0f\x80f\xa2\x93\x93:\xc2~' \xc9:\xd7\
-\xe9\xb8Q\xbf\xd9v\x88X\xdd\xe6FQ\xb4vdd\
-\xa4gddd\x1aMM\x1a\x83\x96\xec\xed\xbfy\xa7\
-\xb1e\xccAmj\x02\xa3/<\xaf\x17\xae3=\xb9\
-\x81pP\x99\x98\xd4\x11\xd0\xe7\xa0E\x8b\x16v\xecW\
-\x22B)\xe7r@\xf3\x17[\x1d722\xf2\x17\x9f\
-\xfa\xd4\xa7\xbe\xdd\xdb\xdb\xbb\xceq\x9c\x15J\xa9\x15a\
-\x18\xae\x01\xb0\xcaq\x9cA!\x84h4\x1aPJ/\
-\x9a\x8a\x81\xe7\x9f\xdf\xfc\xe67Wli\xe7\xa1\x87\x1e\
-ZLD\xff\xc49_W\xadV\xcd\xe2\xb7\xe4\xf9\xa3\
-(\x22\x22\x82\xe38\xcbl\x09\xb5\xb5\x1ft\x98\x10\xc6\
-\xd8:\xe0$\x07\x09\x15`p9\x8f\x93\xad5\xa7\x15\
-\x04\xc4\x0bH\xf5\x87\x97\xcby\xc8\x0d\x0e`\x92\xcds\
- \xa7\x00\x08\x9c\xe02\x8e^7\xb6\xd7\xc4\xe7\xd3Y\
-\xcc\xed4\x06\xac\xf5\xd4i:6\x12\xe7}\xf5\xe9\xff\
-p\xb8\xd8\x9b\xc4\xaf\xda\xfb\xf5?E\xf5\xc5'_^\
-\xad6S<\x0a\xf0\xb1\xc9x\xb1\xc5\xc3?\x06\xb4\xf8\
-B\xf0D\xfaQ$QmLk\x89\x08\x1c\x8d\x88Z\
-\xc6\x83\x99\xac\xa4\x07I\xf3X\xd6d\xf9h\x07\xd4\xdc\
-c\xbe3\x084m6\x9c\x13(\xe1\x01\x1d\x5c\xab\x91\
-\x050\xb3\x9dk\x07\xa1\xe3!\xf5\xb4\xdc\x13F*\xd5\
-i\x0f\xea\xf5z\xe6\xfd\xd3\x80kS\xd6\xb94P\x19\
-\xc90^\x18\xe9\x10\xd1\xaa\xe1\xe1\xe1\xf3\x01<\x04\xc0\
-\xb3\x9a\xe2Z\x7f\x06|\x1c\x90\x9a\x155HEp\xbc\
-\x1cd@\x988x\x10\xa0\xd6\xe8,\x9c\x19\x0c\x9b\x9d\
-z{z:1sDQ\x84\x15\x03Eo\xc5\x99\xcb\
-\xba\xb6\x8f\xed\x04\xac\xc1\xf6\xc3\x1f\xfe0\xfc\xe1\x0f\x7f\
-\xf8$\x80\xc7\xed\xeb6o\xde\xbcT\x08q\x89\xe38\
-\xd73\xc6nt\x1c\xa7+\x8a\x22\x92RR\xa3\xd1\xd8\
-\x9a\xbe\x8f\xeb\xba\xef\xf1<o]\xbd^\xa7\x8c\x06\xeb\
-/\x88stp\xcbn)KDK\x81\x93\x0c<\x04\
-\xc0\xe1\x0c\x5cqHj\x22\xb3FI\x1d\x0eI*\x85\
-\x9e\xa1a\x04\xc5\x1c\xb2\x82\xe8\xccJ\xc9\xa4\x90\x81\x0b\
-\x01\xc1x\x1c\x1e'\xbbp\x8b\xee\x1d\xa7\xf1\xe6e\x12\
-_\xf7\xb7[.\xe3]\xbd\x9f5\xafm\xfc'\xb7\xe3\
-\xf0\x8f\xfe\xe9\xb8T\xde\xaeR\x9b\x1b|\x0c\xf3jq\
-\xb3\x8d%\x00#\xe3j\xe9\x87b\xe9\x07 \x05x^\
-.^u\x0e=N)V\x0f\xda.\xf7\xf13\x12\x91\
-\x0e\xf7C\x04R\x12\xccqu\x9e\x95X\x92\x96Q\x88\
-\xc8,\xee<\xdag\x9e\x85\x91\xb7\x03\x8f\xe9\x81\xf8\x8f\
-\x00\x22n\x9d\xd3\x8dn\xdd\xce\x02\x8f\xe6\xc3\xd9L\xfe\
-\xc4\xab\xd8Z\xedP\xb6\x17FV;\xcc\xbem\xcf\x99\
-\xadM\xe9\xeb\xd2\xe3\x22\xfe\xeb\x8d\xa2\xe8F\x00O\xa0\
-)\xd50h>\xe9C\x83\x91\xf9uHQ;j$\
-\x8c\x84!hHHU\x8f\x95\xbfN\x9b\xbdo\xbe\xd4\
-\xd5\xd5\x95\xe9\xd1\x06hic\xa8\xcbw\xfe\xf0\x96\xdf\
-\xff\x8d\xdf\xff\xe0\x96\xedA\x100\x00\xacT*\xb1\x99\
-\x99\x99\x84#Z@M\x97^z\xe9(\x80Q\x00w\
->\xf2\xc8#\xff\xe0y\xde\x97]\xd7=\x9b\x88jQ\
-\x14\x8d\x01M\x09\x85\x88\xb0u\xeb\xd6K\xe3\xfe\xb3\xb4\
-\xddz\xb1\xaa\xeb\xba\xcc\xee\xcb0\x0cg\x8d\x18\x11\xab\
-\xf7N\xfeb\x12\x01\x06\x8f\xc7)\x8d\x11\x7f&\x04\x9d\
-\x85\x10\x80\xeb8(\x0c\x0f\xa0*x\xb6mg\x16R\
-\xd0krrB\xc03\xb1\xbf\xac\xbf\xd3t\xc2\x88\x9d\
-5\xf2\x8f\x8b\xbd\xc1\x85\xdf\x04\xc1\x07\x80p\xf49\x8c\
-\xfe\xfd\xa7\x8f\xebM4O\x8cUG\xe9\xfd\x96cH\
-\xca\xe8\x22\x19\x0c4\xb1{\x98\xfa\xf4jy\xb082\
-05\x7f\xcd\xe7\xa6\x94\x91 \x18\x14\xe9\xf4\xd1\x80\xce\
-\xeeI\x88\x93\x02\xaa\xa6\xe7&\xc5\xcc\x9d\xe2\x00\xb8G\
-\xfb\x97~\xfa\xf4\xb9\xf8\xd1-\x95\x19\xe9Y\xb5y\xf6\
-\xe4\x1c\xa1)\xe5\xa8\xa4\xae\xb6>!j\xb9\x8f\xddw\
-\xe9~L\x9f{\xb9D\xad\x0f\x93\x90Y\x03\xa7\xd5\xd4\
-\x0e<\xcf\x83\xeb\xbaz\x85~\x1c\xc7-f\x80\xf0<\
-\x0f\x9e\xe7\xc1\xf7}\xb8\xae\x0b\xdf\xf7\x93m\xf3\xe78\
-NR\xde\xfc\x9a\xf5d\x9c\xf3Bww\xf7u\x9f\xf8\
-\xc4'\xae\x86\x96j\xf2\xd0K\x06\xcc_\x1e\xda\x93\xd3\
-\x07\xe0\x91%\xf10\x0ex\x8e\x03/\xe7\xc3\xf5\x1c\xb8\
-\x8e\x03\xcf\xf7\xc09\x03\x94\x02\x8f3\xb6\x98_\xb3\xcd\
-\xb9\x9a\xf3\xcf\xf5\xb2\xbd\xfa\xcc\xad\x83 \xc0\x86\xf3\xd6\
-_\xf5\xado}\xeb\xff\xba\xf1\xc6\x1b\x97\x02\xe01\xe8\
-X\x16\x84v\xd0\x22\x22v\xf1\xc5\x17?P.\x97?\
-\xc49\x1f'\x22\xc7q\x1c\xfb\x05\xd0\xad\xb7\xde\xca\x18\
-cm\x9e\xab\xae\xebB)\xf5@\xb5Z\xfdp\xb5Z\
-\xfdH\xa5R\xf9H\xb5Z\xfd\x08\x80\xed\xce\xec^\xc1\
-.p\x0a\xf2\xf1\x10\xb4\xad'T\x5c\x7f\xbc\xd0\xeb\x1f\
-B\xa5g\x8c\xdd\xbd\xbd\x90\xdd%\xa8dm\xc2\x5c\xf5\
-\xe9R.\x17(0\x06\x978\xaaJ\x22\xcfE\x02n\
-\xa7\xe9\x84\x12;\xeb-o\xf1\xbaV]\xf6\x0d0\xbe\
-\x04\x00XX\x0f\xc7\xbf\xf6\x87\xae\x0a\x8e.w\xfc|\
-(K\xf2\xd1\x12\x0c\xaccq\x10Q3\x82\x12\xbb\x0f\
-\x80\xd9\x1c\x0f\xe2\xfa\xc3F\x03\x015\x9a\x0f\x98l\xd8\
-\xce\x03,uR\xcf\xd2#\xd2\xb1\x01mu\xdc\xd1\xae\
-3\x99\x8b\xa1\xb7\x9e\xb6A%U.\x91\x5cL\xb9N\
-\x12M\xfb\xb1\xd6\xf3\x9d%\x9e\x13I\x8c1x\x9e\x17\
-\x87\x09j\x97\x80L\x99\xac\xf6d=Gz\xdf\x96\x94\
-\xe2z\x18c\xec\x8cK/\xbd\xf4?\x7f\xfe\xf3\x9f\xff\
-\x9b\xaf~\xf5\xab[~\xf1\x8b_\xd4\xd0T\xb3y\xf1\
-\xaf\x83D\xd5\xa6EH)\x09CK\x96\xa3T,\xa2\
-<5\x85zX\xc5\xf0@\x1f*\xd5\x0a\x0e\x1c8\x00\
-\xc7\xc9Ap \x0cBp\xcf\x81\x10\x1c\xb5\x99*B\
-\x93\xf1z\x16\x8a\xc2\xb9\x03\x82\x86a\xc8\xce:\xeb\xac\
-\xdf\xf8\xa3?\xfa\xa3\xf3o\xb9\xe5\x96-\xe5r\xf9\xc1\
-\x99\x99\x99\xc7\x84\x10\xbb\x0e\x1c8p\xe4#\x1f\xf9H\
-\xda&l\xdc\xa4\xd9\x15W\x5c\xf1\xe0\x13O<\xf1\xcf\
-\xb9\x5c\xeew\xeb\xf5\xfa\xa0]hddD\xbd\xf5\xad\
-o}\xda\xf7\xfd\x1b\x90|~Z=\xc98\xdb\xfa\xda\
-\xd7\xbe\xf6\xef\xec\xf2O<\xf1\xc4\xb5B\x88u\xb3\xc4\
-\x93\x0b\x81S\x94\x08\x8e\x81\xc1\x13\x02a\xac\x80nD\
-\x11\x1aQ\x08\xc1\x05\xba\x86\x87\xd0pt\x82\xb7Nd\
-Tp\x0e\xe3\xf0\xb9\x80\x07\x0eW)\xa8F\x88\x86\x8c\
-0\xad\x22\x9c\xb1\xe8\x0c\xb8\xa7q\xe7D\x13\x03\xe0\x14\
-n\xfa\xab\xcf\xc0q\xaf\xd6G\x18\xf5=\xfa\xcdg\xf6\
-M\xec\xbf\xf0D\xdd4S\xa5f\x1dC\x02*F\xa1\
-\x1a;&4O[\xcc\x86,\xdb\x0f`\xf4\xf0\x1d\x8d\
-\xd5I\x0b\xcc\x8e5\xb1$\x80\xc0\x90^\xf1{\xecL\
-\x9ae\x82\x8cUq\xc7\xa9YSx\xe8\x0c(\xa6\x5c\
-\x96j-\xbb\xecQ\x82\x0e\xcd\xcb\xefkVr]\x17\
-\xa5R\xbbOKV\x94\x02\xdb\xee\x93Uv\xb6k\xad\
-s\x0ec\xec\xfc\x81\x81\x81\xcf\xbf\xe65\xaf\xd9\xbag\
-\xcf\x9e\x1f\x7f\xef{\xdf{\xec_\xfe\xe5_&\xd1\xb4\
-\xf7h\x00\xb2\xfc?HI,^r&\x06\x87\x17`\
-\xdf\x9e\x9d\x98<2\x86\xe5+\x97c\xe2\xc8!LL\
-Nb\xb0\x7f\x00\x5c\x08\xccL\xcf _,\xc0u\x1d\
-\xec\x0d\xf7A\xd6k\x00u\x0eh\x0a\x00333X\
-\xb4h!d:e\x08\x9a\x8e$\xc6i\xa2\xab\xabk\
-A__\xdf\x0d\x00n\xa8V\xab\x8a1\xb6w\xdd\xba\
-u;\x1f}\xf4\xd1\x97\xa2(\xfa\xd9\xc4\xc4\xc4\x9d\xd7\
-]w\xdda4\x0d\x92\xb1\xe2\x80\x1e\x14\x8e\xf8\xdd\x5c\
-.\xb7\x01\xc0\xbfR\xd3\xb9\x805\x1a\x8d\xdb\xf2\xf9\xfc\
-\xbfu]\xf7\xac \x08\x92{\x93\x227\xbe\x961\xc6\
-\xb0i\xd3&A\xd49\xfeg\xdc\xd6\x09\xe0\x14\x01\x0f\
-\x01p\x19\x83\xc78\x02\x10jQ\x03\x8d0B\xa1\xab\
-\x0b\xd4\xdb\x9dZ\x0e\xa7)f\x07p8G\x9eq\xf8\
-`p\xa4\x02\xaf\xd4\x11\xd6\xeb\xa85B\xccD\x01\xca\
-PX\xdc7\x80\x0b\xfb\x06\xc1\xb88ju\xddi:\
-*\x12g\x7f\xf6\x077\xf0B\xe9c\x86CV\x9e\xfd\
-\xd9\x9d\xab\x0f<\x9d\x17B\x1c5\xf0\x08!\xe6Lc\
-|\xa2\xc9\xa8u~5\xa8]2Ho\xbf\xd2\xc9u\
-]\x14\x8b\xc5LP\x99\xef\xb1\xb9(}\x0d\x119\x9c\
-\xf3\xe1R\xa9\xf4\x1bCCCW\xadY\xb3f\xec\xe6\
-\x9bo\xfe\xd9\xbd\xf7\xde\xbb\xf9\xae\xbb\xee\xdaW.\x97\
-\x01\x80S\xca\xb9 \x08\x1a\x88\x82\x00\xb5Z\x15\x95j\
-\x15\xd5J\x0d  j\x84\xd8;v\x10\x02\x1cLp\
-L\x97\xcb\x09b\xf9~\x11Q\x18B\xa9\x06:\x89>\
-\x93S\xd3\xc6x\xdfv.\x0cC\xaa\x91\x90Qe\xf2\
-\x10\xa9\xe8\x88Rj\x8cs\xbe\x0f\xc0\x9e\xfe\xfe\xfe\x7f\
-\x93\xcf\xe7\xd7\x87a\xb8\xcc\xf7\xfd+\x8b\xc5\xe2{=\
-\xcf\xbbbdd\xe4\xfd###\xcd\xd8J\xfa\x99\xeb\
-a\x18\x81\x88\xae\xbb\xfd\xf6\xdb?\xc7\x18K\x10\xe6\x8a\
-+\xae\xd8\xbde\xcb\x96[\x0a\x85\xc2\x97\x0b\x85\xc2\x99\
-a\x18B\x08\x81(\x8at\x8e:\x96L\xdb\xe6\x22\xc6\
-\x18\x1b\x05Na\xeak\x0e\x06?v\xff\xab\x07\x12\x11\
-\x14\xf2C\x03\x08='Q\x9f\x19\x95\x85\xc39\x8a\x10\
-\xf0IA\x04\x11P\x9e\x81\xacTP\xaeTP\xae\xd6\
-P\x8d\x02\x04\x9c\xa3T(b\xf5\xc2\x05\xb8~\xf9Z\
-\xac(\xf5\xe8\xe9\xdc\xab\xe7\x1b{\xd5\xd1\xc2\x1b\xfe\xe3\
-\xaa\xdc\xb2\xb3\xff\x16\xb1\xc5:\x1c\xdf\xff\xc4\x8e\xff\xf7\
-=_\xbf\xf2\xdd\xef\xfe@F\xd8\x8c\x84\xf6\x8e\xee>\
-im<\x19\xc4\x18\xc3\xe0\x82a\x14r\xb9Xu\x83\
-D\xe22\x12\x14\xa5\xec>0\xc7`\xa2\x0c$+n\
-t4\xf5\xc4A\x80\x9a\xd7\x03IY2;h\xbd\x1f\
-\xc5\xd1A\x9a\xc7(\xc1\x1f\xb3o\x0e%v\x15\xab\xfe\
-\xe4\x1eI\xfd\xd6\xc1\xf4!4\xa7\xcd'\x8a\x8c\x1d\xc7\
-V\x8f\xcd\x97\xd2\x0e\x04\xb3\x9d7\x94\x02h\xae\x94*\
-tww/_\xbbv\xed\xd2\xe1\xe1\xe1\xeb\xdf\xf0\x86\
-7\xbc\xf0\xf0\xc3\x0f?u\xe7\x9dw\xee\x81\x15(\x8f\
-A\xa0V>\x8c\xa0\xcb\x07S\x0d,\x1c\x1e\x86N\xb5\
-\xee\x83\xb9\x0c\xaa!\x01\x87\x800\xd2)\x1f\x18t\xf4\
-i\x19B\xaa\xd9\xf5m\xfb\xf6\xed\xcbl?\xe7\x1c\x93\
-S\xd3\xf8\x1f\xdb\xa7'~\xfc\xc5\x91/\x8d\xbd\xf8\xcc\
-\xf3\x00\xc6\x00\x1c\x060\xf3\x9d\xef|\xe7\xd1\xb5k\xd7\
-\xfe\x9d\xe7y\xfdRJ\xc69\x97\x9c\xf3\xa9\x9d;w\
-:\x88U^q\x1f\x10\x80uJg\x0d\xbdx\xcd\x9a\
-5\xef\x19\x19\x19\xf9\xba\x89Z\x10K4?x\xf4\xd1\
-G\xdf\xe88\xce{\x19cW\x85a\xb8B)5\xd1\
-\xd6\xa8\xce\xef\x82\xc5\xce O\x03\xa7\x10x\x08:I\
-\x9a\xcf\x05\x22\x19B\xf89\xb0\xben\x84\xb1\xeb\x87\xcb\
-\x19<b\xf0\x22\x05*W@Se\xd4\xa6\xa6P\x99\
-\x9cB\xa3Z\x85\x0a\x22pG\xc0+va\xc5@?\
-\x86\x07\x07\xb1bx\x11.\x5c\xb6\x14\xaf\x19^\x84\x9c\
-pN\xcb:'\x98\x16\xbc\xe3\x96/\x80\xf1n\x00\xa0\
-F\xed\xd0\xce\xbf\xfc\xd0\xe7d\xa3q\xb8T*\x1d\xf7\
-\x08\xbf\xafd*\x96\xbaQ\xc8\x97@&'N\x9c\xec\
-\x8b\x18A\x9aX\x81\xda\xa1H;(\x90v\x82A\xbc\
-\xe0\x99b\xd5\x9c\x8c=\x97\x9207\x0c\xb1\xc7\x9d\x09\
-.\x8a\x96\xfa\x0d\xf0\x80Yj\x1a\x12I\x88 \x1d\xe5\
-\xc1\xb8\x8d\xdb\xcb\xb6)>\xa7,\x0f\xf0\x04\x9d\x92\xb6\
-\xa2\xe5\x1e)u&\x9a\xac\xb2\x05|l\xd5\x9d\xa9\xe3\
-\x18\xc9\xd8\x12\x8c\x8d'\x0b(lPI\x03L\x07U\
-Z\xcb\xb5\xe9\xfb\xa5\xb7\x95R\x08\xc3\x90EQ\xe4\xfa\
-\xbe\xef.^\xbc\xf8\x827\xbf\xf9\xcd\xab\xa6\xa6\xa6\x1e\
-\xda\xdf\x12!\x96a\xff\xe8\x1e\xccL\x8d\x03\xd0Q\xf9\
-''\x0e\x03\x00\xa2\x80\xb4\xa3J\x04\x9d%\x19\x04\xc1\
-D\xa2^\xd3Y^\xb8\xf5.\x10\xdf\x1b\x00\x14^\xda\
-\xb9+S\x15'\xa5\xc4\xa2\x85\x0b\xb0b\x7f\xe8M\xcf\
-L\x87B\x08&\xa5d\x00x>\x9f\xc7\x8d7\xde\xf8\
-\xd0\x1dw\xdc\xf1\xdee\xcb\x96\xbdY\x08\x91\xafV\xab\
-\xcf\xfc\xe8G?\xba\xeb\xeb_\xff\xba\xc9\x9c\xa8n\xbe\
-\xf9f\xb6i\xd3\xa6>\xce\xf9u\xb1]\xc6q\x1c\xe7\
-\xe3\xbf\xf9\x9b\xbf\xb9\xf9\xd6[o\xfd\x85\x05Lx\xdd\
-\xeb^\xb7\x03\xc0\xad\xf7\xddw_O>\x9f/\x12Q\
-\xf2\x9d\x13\x11\xee\xbf\xff\xfe\xcc\xf7h\xf5\xbbRJ\xfd\
-\x1c8\x85\xc0\x03h\xa9\xc7\x13:\xe1\x91\xd3\xdf\x83\x9a\
-\xebB(\x09/\x92pj\x0d\x88J\x0d\xbcV\x83[\
-k\x80\xea\x01\xf2P\x18\xce\x97\x90\xeb\x1f\xc4@O/\
-\x16\xf7\x0d\xa0\xd4\xd3\x8d%}\x03\x18\xec\xe9\xc6PW\
-\x0f\xf2\xbe\x8b\x979\xdeO\xd3<\x89\xf9\x05\xbd^\x87\
-T\xb8\xff\x8e\xcf\xfd\xb7\xca\x8e'\xf6\x008T,\x16\
-\x83W\x93:\xe7\xe5\x90p\x1ct\xf7\xf65A\x87L\
-L4\x06W8\x18\xe8\xeb\x81\x22\x89\x89\xc9)H\xa9\
-\xb0`\xc1 \xa0\x08\x07\x0f\x1f\x06\x03C!\x09\xf9/\
-\xd1\xdf7\x80}\xfb\xf7\x03\x00\x1a\xa1\x8e\x80\xad\xcf5\
-\xa5#\xa8D\x1cA\x92\xa73\x11l\x9a`\x91\xa8\x98\
-\x89\x9a\xaake\xda\x173\xb1\x16I\xc8\x82\x0b\x1bp\
-\x90\xdc\x0e\x9d\xbe\xaa\xf4\xf96i\xe9\x18\x89H/\xf4\
-4\xf9`\x8e\x96\xb2\x80\xa7S\xb90\x0c\x11\x04\x01\xa2\
-(B\x10\x04\xc9~\xbd^G\xa5R\xc1\xd4\xd4\x14f\
-ff\xa0\x94\x92G\x8e\x1c\xa9\x8c\x8e\x8eV\xc5jJ\
-\x0c\xf1\x1c\xc0ty\x06S3Sm\xf5s\xe6\xc0u\
-}(\x16%~\xc4RE:\x1d2\x04\xc0\x19\x18\xd7\
-\x09*\x8dI\x01\xe0\xe0Q\x04\xa5\x80\x1d/\xbd\x84Z\
-\xad\x8e\x5c\xceo\x01\xa08\xe2\x02{\xe3\x9a\xe1\xe2\x0f\
-\xcf9g\xe0\xf1\x87\xf6\xee\x8a\xb3\x93\xf2Z\xad\xc6\x01\
-\xf0\x9bn\xba\xe9Q\x00\x9b\xd1\xb4\xe7(\x00l\xfd\xfa\
-\xf5\xd8\xb6m\x1b\xbf\xe9\xa6\x9b\x9c\xde\xde\xde[8\xe7\
-\x17\x06A`\xc0\xfb\xec\x5c.\xf7\xe5\x1bn\xb8\xe1\xf7\
-\x00<\x87\xd6\x18M\xec\xdak\xaf\x9d\x02\xd0\xfe\xa0\xb3\
-\x90\xe38\xe0\x9c\xef\xaf\xd7\xeb\xbf\x00N1\xf0\x10\xf4\
-\xba\x9e\xbc\x97C\x7f_/<.PT@\x91+\x94\
-|\x0f\xbe\xc8\x83u3\x0c\x14\x8a(\x15\x0b(\x15J\
-\xe8\xef\xeeB!\x97G\xde\xf3\xd1\x95\xf7\xc1\xb9\x80\xc3\
-\x04\x183\xb3I]\xf7\xaf\x07\xdb;\xa9\x14O\xcb\xc3\
-)\x08\xb7\xc7>1\xb9\xe5_\xbfv\xf0\x7f\x7fe+\
-tH\xf9\x09\xce\xb9<\x19^O\xa7\x9a\x18c(u\
-\xf5\xc2e\x02\x8a\xa2D@\xd0\xbf\x0a\x8e\x9f\xc3y\xe7\
-\x9f\x8bZ\xbd\xae=\xe5\xc2\x08\x04\x85\x9e\xeen,\x9c\
-\x9c\x8a\xbd\xb6\x5c@\x11v\xee\xda\x85\xc5\x8b\x17a\xf1\
-\x92E\xa8\xd5\x1b\xf8\xe5\xf3\xcfczz&\xf1\xd2\x03\
-Q\x92\xab\xc6\x00\x8e\xc1\x06[\xa5f\xe4\x9aVu\x1a\
-\xda\x00\xa7\x09L\xfaG\xa5$\x9c\xa6\x043\x0b\xd8$\
-\x1b\xc7\x17p\x0cEQD\x0f>\xf8`\xed\xbb\xdf\xfd\
-n\xa5\xe5\xde\xed6\x99y\xdb\x7fl\xb2\xa5()%\
-L(\x18\xb3\x1d\x86!\xc20T\xf5z\x9d\xaa\xd5j\
-P\xab\xd5&fff\xf6MOO\x8fV*\x95\xc9\
-K\xaf\xfe\xc0\xf2\x96\xfa\xc0\xc12\xe2;r\x0e\x80d\
-\xe2e\xab\x94)\x0d0(H\xed\xc3\x1f\xcb L\x97\
-\x87\x8aC\xbesL\x8cO\xe1\xc0\xd8\x18V\xad\x5c\xd1\
-&\xf9H)i\xa8\xe89\x7f\xfa\x89?x\xc7\xd7\xfa\
-\x0b\x13?\xfd\xe9O\xc7\x83 \x10\xf5z\x9d\xd5\xebu\
-\x06\x80/X\xb0@\x8e\x8d\x8d\x99\xce\xe0W_}5\
-\xad\x5c\xb9\xd2\xfb\x93?\xf9\x93\x81\x95+W\xfe;\xce\
-\xf9\x1f\x85ah\xec5\x88\xa2\x88<\xcf\xbb\x821\xf6\
-\xcd\xcd\x9b7\x7f\xf2\xb1\xc7\x1e\xfb\xc9\xcc\xccL\xb0q\
-\xe3F\xa9\xbb\xd1R1\xc6\xaa\xb8\xc7\x1f\x7f\xdc)\x95\
-J.c\xcc\xcb\x92\xceb\xe7\x87g\xc30<\x08\x9c\
-b\xe0\x01\x00R\x84\xa5\xbd\xbd\xb8\x81V\xa1\x9b\xbb(\
-2\xc0\x05C\xc9\xd7\xe0\xe2y.<\xcf\xd5\xe0b\x9c\
-XMV\xc5\xf8C\x94$\x93H\xc4\xa7\xe9\x84\x11\x01\
-\xa0\xfa\x9e\xe7\xbe\x9f[\xfe\x9aw\x9a\x83\xb5\x97\x9e\xf9\
-\xd1\xce\xbf\xf9\xfd\xbb\xa1A\xe7\x08\x80\x0a\xe7\x5c\xfd:\
-\x00\x8f\xe7\xf9\xe8\xea.BR\xd4\xc6\xe8\x89\x14\x1aa\
-\x03O=\xf94\xc0\x08\xc5\xae.\xbd\x02_)\x8c\x1d\
-8\x08E\x04\x15\x8f[E\x84\xe9\xa9il}\xf2I\
-\xe4\xfd\x02\x0a\x05\x1f\xd5jC\xd7\xa5\x0c\x104\xd3x\
-t\x06\x1c4%\x9c\x0e\x80\x03\xb4J8\x94\x02\x1c\x98\
-M\xfb\x82\x14\x9d(\x09'MRJ566\xf6\xec\
-\x9dw\xde\xb9\xe9\xb8W>\x07\xd9\xaa\xb6\xf8\x97\xc7\xa1\
-eBh\xa5\x99\xdbb\xe3\xe1,\x89A\x98\xf4=k\
-\x82[h\x5c\xa2-\xbdd\xe2*\xc0Z\xf7\xcd/\x8f\
-\xd7\xfa\x04a\x0d\xdb\xb7o\xc7\xea\xb3Ve\x01*\x0b\
-\x82\x00K\x17/:\xeb\x93\x9f\xfc\xe4\xc7\xf7\xee\xdd\xfb\
-\xa3]\xbbv=\xb8\x7f\xff\xfeg\x0e\x1c8\xb07\x08\
-\x82\xda\x82\x05\x0b\x02\x00(\x16\x8bX\xbatiq\xf9\
-\xf2\xe5\xcb\x87\x86\x86^\xef\xba\xee\xbf\x01\xf0\xba(\x8a\
-\xd2\xa0\xcc\x1a\x8d\x06\x1c\xc79\xafX,\xdeND\xf7\
-\x94J\xa5\xef\xfd\xfc\xe7?\x7f\xb8R\xa9\x1c\xb9\xf7\xde\
-{\xd5\xc0\xc0\x00\xb9\xae\xcb6o\xde,\xb6l\xd9\xb2\
-\xc0\xf3\xbcK9\xe7o%\xa2\xd7e8A\x10g\x1c\
-\x95Z\xe5\xfe\x8d\x1b7\xd6\x81W\x00\xf0(\x22\x0c\x14\
-\xf2\xb8*w&\x1c\xc1\xc0\x92\x18i\x96\xf8O:\xaf\
-|\xd25\xc7\xb8\x02\xf84\xbd,R\x00\x82\x17n\xfd\
-\xad\xdb\x96\xfe\xfb\xcfO\xfa\x0bW\xac\xab\xefy\xee\xf9\
-\xd1\xaf|\xfc{h\x82N\x19@\x18\x86a\xa6\x07\xce\
-\xaf\x121\xc6\xd0\xd5\xad\x05?\xa5\x9a `\xdc\x93\x89\
-\x08\x8dz\x03\xa3\xe5Q\x0d\x1b\xca\x84\xb8BS\xaa\xb0\
-\x98\xb7\x89\xadV\x9e\x9e\x82\x02\x830\xae\xda\xb1\xeb\xb7\
-N\xdb\x90v\x5c0\x0bg\xb5MGA/rm\xb6\
-\xa3\x19\x01\xdd\x96p\x12E\x5cZ\xc29\x0au\xda\xc9\
- \xa5\x94*\x16\x8b/5\x1a\x8d\xef\x9f\xb4\x9b\xb6\x93\
-\x8b\x93\x0d\xf3\x00\x00\x1e\x1aIDAT\xd6{\xe9E\
-\xa39\xe8`\xb9%\x00}\x8c\xf3d\x90K\x19\xa1g\
-x\x18\xdd\xbd\x03\x88\xca\xe3:\x04\x18\x04\x8a=]\xd8\
-\xbbc\x17\xc8\x01\x18\x07\x94\x92\xe0\x10\xe0\x8e\x9eFG\
-2B\x14(\xa8\x0c\xd7s[px\xf4\xb1\xad\xb8\xf6\
-\x9a7\xc1q\x9cL\xc9-\x0cCx\x9e\xd7\x7f\xd6Y\
-g\xdd\xb4r\xe5\xca\xb7\x85a8\xc39?\xc4\x18\x9b\
-b`\x8dx\xce\x9eWJ\x0d2\xc6\x06\x85\x10\xddD\
-:$Q\xe6C\xc7\xe1x\x94R]\xae\xe7\xfeN.\
-\x97\xfb\xadz\xbd~\xb0T*\xed\xe8\xed\xed=\xa8\x94\
-\x0a\x19c\x85B\xa10\x1c\x86\xe1\x0a\xd7u\x07\x88\xc8\
-\x0b\xc3\xb0\xad}\x9cq\x16\x84\xc1\x11\xd7u\xef1\xc7\
-N9\xf0\x00z\xad\x05\x17\xf1\xe4\xcdd\x1a\xcd,w\
-\x9aN!I\x00\xf5\xa8^\x1f\xdf\xf9\xdfo\xb9\x0b\xc0\
-\x0f\xa0\x93\xc0\x1d\x06ppppp\xe6\x96[n\xa1\
-u\xeb\xd6\xe5\x9ex\xe2\x09\xf4\xf4\xf4\xa0R\xa9d\xea\
-\xd8m\xdd;\xe7|N\xf7e\x937\xa5\x93\x11\xd9.\
-\xd3\x89\xccB\xc1t=\xa6=v\x19\xb36\x22\xab\xdd\
-&*\xaf\x96vtJ\xecd\xcd\x90\x99\xb9*\x95\xa4\
-o\xb0\xa5\x01\x06hC\xbf\x22H\xa5\xa7\xc4\x8c\x1b\x09\
-\xa9\x09\x00&\xba\xb6\x8a\xa3 0\xce\x13\x90I\x9e\x87\
-im\x81\xf6\x863\x95\xb7\xf7\xb5\xa2fX\x19\xcex\
-\x02T\xc9%q\xfb\x92\x90,\xc9z'\xeb^\xf1\xfe\
-l}l{\xea\x992Y\xef\xde<\x97\x1d\x02&\xab\
-\x9c\x10\x02\xdd\xdd\xddT(\x14\xca\xabV\xad:T\xa9\
-T\xd4\xc4\xc4D\xd4h4N\xb6(\xcd\xd0\x0c\x99c\
-@G\x02\xf0\x98\x10\x09\xd7&)q\xf6\x85\x97c\xc5\
-\xda\xd5\x98x\xf1Q\xd4+\x12~o\x0fV\xac^\x8c\
-\xbb\xbeq\x17<\xe6@\xb8z\x1d\x8f\x97\xf3\x90\xf7\xf3\
-\xe0\x5c\xa0Z\xafb\xec\xc0\xd8,\xa9\x14u\xff<\xfb\
-\x8b\xe7\xf0\xdcs\xcf\xe3\xfc\xf3\xcfC\x10\x04\x99\xeby\
-\xa4\x94\x90R\x12\x11\xe5\x84\x109\xc6\xd8\x90=\x96\xcd\
-\xfb\x8b\x1d&b\x99l\x96\x07\x8f\xbf\xd3 \x08\x08\x04\
-\x9fs\xbe\x8c\x88\x96YR`\xf2\xbd\xc4\x99Q\xb3\xea\
-$\xe1\x08\xa6\x94\xfa\xf1\xddw\xdf\xfd\xb4Y\x1f\xf4\x8a\
-\x00\x1e\x00's\x22u\x9a\x8e\x8d$\x80\x0a\xb4t\x13\
-\x16\x0a\x85\xbc\xe7yr\xe9\xd2\xa5\xe5\x8d\x1b7zW\
-]u\xd5\xb9\x00^[\xaf\xd7/^\xbdz\xf5\x95\x1f\
-\xfe\xf0\x87\x13F\x0e4\x07\xb1\x09}R(\x14P,\
-\x16155\x85\x9d;w\xa2V\xabA\x08\xd1\xe6\xa5\
-\xe4\xba.\x96/_\x8e\xd1\xd1Q\xd4j5;qW\
-\xf2\xb1\xe5\xf3y,Y\xb2\x04{\xf7\xeeMR\x03\x0b\
-!\x92z\xc20D\xa9T\xc2\xc2\x85\x0b1::\x0a\
-\xb3\x0e\xc1\xbeO\x18\x86\x18\x18\x18@oo/\xf6\xed\
-\xdb\x87(\x8a\x922f\x0dE\xa3\xd1\xc0\xa2E\x8b\x90\
-\xcf\xe7166\x860\x8c\xe0\xbaN\xd2\x96F\x10\x80\
-\x94\xc2\xe2\xc5\x8b!\x84\xc0\xd8\xd8\x18\x94Rp]\xb7\
-\xe5\x03\x15B`\xf1\xe2\xc5PR\xe2\xe0\xa1C \xa2\
-d&\xab\x94B\xa3\xd1\x80\x9f\xf3\xb1p\xc1B\x04A\
-\x80C\x87\x0e\x82\x81A\xc4ed\x14!\x92\x12\xb9\x9c\
-\x8f\x85\x0b\x17aff\x06\xe3\xe3\xe3I<9RZ\
-\xb5\xc3\x18\xe0\xfb>\x16-Z\x84\x89\x89\x09LLL\
-\xb4\xcc\x98M?x\x9e\x87E\x8b\x16\xe1\xd0\xa1C\x98\
-\x9e\x9eN&\x02J)(\xa9\xc0\x05O\xea\xd9\xbf\x7f\
-?\xca\xe5r\xf2LF\xb2e\x8c!\x9f\xcfc\xc1\x82\
-\x05\x18\x1d\x1dM\x9e\xd3\x06\x15\xa5\x14\x8a\xc5\x22V\xac\
-X\x81R\xa9\x84r\xb9\x8cj\xb5\x0a)e\xc2\xc4\x0c\
-\xc5\xfd\xee\x16\x8b\xc5\xab\xd7\xaf__\x88\xa2\xe8\x89C\
-\x87\x0e=\xf5\xd4SO\xed\xd9\xb9sg\xe5\xc8\x91#\
-rzz:\x1a\x1f\x1f?\xd1\x9c\xc3,\x1a%h\xc9\
-\xc7\x03\x10\x00\x08t*\xe4&\xe5\x8a\xdd\x98\x9e\xaa\xe2\
-\x99\xed\xbb\xf5;\x86\xceA\xa6\x94B\xa5Q\x01c\x1c\
-\x92\x80j\xb5\x86 \x08\xc1\x10/\x1c\x15lV\xe01\
-\xd2\xc7\x8f6\xfd\x04\xe7\x9e\xfb\x9a\xb9\x5c\xca\x99=A\
-\xeaT\x1f\x8ef\x1e\x1f\xcfm\x8c\xfd\x8bY\xde|f\
-\xf1h\xa7:\xe3\x89^-\x8a\xa2\x7f\x18\x19\x19Q\x9f\
-\xf9\xccg\x18\xf0\x0a\x91xN\xd3+\x9f\x88\x08\x7f\xfd\
-\xd7\x7fM/\xbe\xf8b\x10\x04\x81\x5c\xb3f\xcd\xa2\x05\
-\x0b\x16\xac/\x16\x8b\x1b|\xdf?\xb7\xd1h\xac\xe4\x9c\
-\xe7\x8a\xc5\x22\xa4\x94(\x95J-\xab\xaa\x85\x10\xe8\xea\
-\xea\xc2\xd0\xd0\x10<\xcf\xc3\xf6\xed\xdb\xf1\xd0C\x0f\xe1\
-\xe1\x87\x1f\xc6\xc1\x83\x07\x13]\xba\x942)\xaf\x94B\
-\xa1P@.\x97\xc3\xf4\xf4t\x9c\xcf(\x87F\xa3\x81\
- \x08\xe08\x0e\x94R\xc8\xe7\xf3\xf0}\x1f333\
-\x89\x07\x14\x11!\xd6S'\x00V(\x14033\x93\
-0M\xc7q`T\x03A\x10 \x9f\xcf#\x97\xcb\xa1\
-V\xab\xc1\xf3<DQ\x04\xcf\xf3\x92\xe8\xc8D\x84|\
->\x0f!\x04j\xb5\x1a|\xdfG\x18\x86\xf0}\x1f\xf5\
-z=y\x86B\xa1\x00\xc6XR\xc6\xae'\x8a\x22p\
-\xceQ,\x16\xa1\x94B\x10\x04\xc9\xb3\xba\xae\x8bZ\xad\
-\x96\xccL\x0b\x85\x02\xa2(B\x14E\x09\xc8\xfa\xbe\x8f\
-Z\xad\x96H\x16\xa6?l&\xe3:\x0e\x1aA\x00\xa9\
-\xd7e\xa0P(\xa0\xd1\xd0!\x80\xcc\xb3\xe4r\xb9$\
-\xa0#\xe7\x5c'(\xac\xd7\xe18\x0e\xaa\xd5*\x14\x11\
-\x0ay\x9d|\xcc\x80p>\x9fO\xfa\xb4\x5c.\x83\x88\
-P(\x14\x10\x04\x01\x94R\xc9\xbdj\xb5\x1a\x5c\xd7E\
-\xbc\xd0\xb2E\x0a\x12B`\xc9\x92%\xb8\xec\xb2\xcbp\
-\xf9\xe5\x97\xe3\xf2\xcb/G\xb5Z\xc5\x91#GP\xa9\
-T`\xec\x0d\xf1\x1f#\xa2\xe5B\x88\xe5\x8c\xb1\x9b\x17\
--ZT\xdd\xb0a\xc3KB\x88'\xab\xd5\xea\xe3\xe5\
-r\xf9\x99\xc7\x1f\x7f\xfc\xc5\xbd{\xf7V\x0f\x1d:\x14\
-\xed\xda\xb5+\xda\xbd{\xf7\xf1\x06\x22\x03<2\xde\xf6\
-\x01\xd4\x01\x84\x8cq\xa5\x1d\xcc\x15\x94\x928\xb0\xfb\x97\
-\x98\x1a\x9f\xc2\xe4\x91)tw\xe5\xb0k\xc7\x8b`\xa8\
-azr\x0a\x8dZ\x00\xee\x00\x00O\x92@rGK\
-\x97R*\xc8H\x82\xcf\x01\x05\x8fl\xd9\x82\xe7\x9e\xbf\
-\x16g\xaf]\xdbQE\xd6\xd2\xf0\x13\xe0Y\x9a\x06\x98\
-\xb9\xee!\x84`Q\x14\xfd\xa4\x5c.o\xd2\xc53\xac\
-\xf1S\x14\x5cJ\x11\xfd\xcc\xec\x07Jb&\x8c\x10H\
-\xa9]\xfe\xec\x06\xa4\x1b\x94\xda\xcajO\xeb\xf5\xac\xe5\
-D\xe7\xfa\xac:\xe7,\x9fnEkE\xe9:;\xde\
-\x93\xa5\xf6\xdbj\xb7\x8e\xb6\xd4\x9f\xd5\xea\xd45\xd6M\
-f\x7ffS\x7fV9\xf6W=\xae\xf7\x9f2\xaa?\
-nt\xfb\xed\xb7\x8b\xf5\xeb\xd7\x8bZ\xad\xe6T\xab\xd5\
-\x1e\xd7uW\x16\x0a\x85\x8b\xa2(z}\x14E\x17D\
-Qt\x06\xe7<of\xe9\xf6\xcc\xd7\xfe3\xc1\x1b\xfb\
-\xfb\xfb100\x80o\x7f\xfb\xdb\xf8\xfe\xf7\xbf\x8fG\
-\x1ey$a\xa4&\xa8\xa0\xe38\xb8\xec\xb2\xcb\xf0\xc2\
-\x0b/`\xdf\xbe}\x00\x9a\xaa\x19#\xe9\x08!p\xe5\
-\x95W\xe2\xc0\x81\x03\xd8\xb6m\x1b\x0a\x85\x02J\xa5\x12\
-\x0e\x1e<\x08\x00I\xc0\xc7\x0b.\xb8\x00\x8e\xe3`\xf3\
-\xe6\xcdp]\x17\xfd\xfd\xfd\x09\xc0\x992\xb9\x5c.I\
-2v\xed\xb5\xd7\xe2\xdcs\xcf\xc5\x17\xbe\xf0\x05\x93-\
-1\x99\xc5W*\x95\xe4\xba\x81\x81\x01LOO'3\
-zS\xa6Z\xad&\xea\xa3\x81\x81\x01T\xabUT\xab\
-\xd5D\xb5W(\x14P\xa9T\x92\xb0'}}}\x90\
-R&\x80\x9a\xae\x07\x00J\xa5\x12\x1c\xc7I\xf2\xd1\x18\
-02\xed!\x22\xac^\xbd\x1a\xef{\xdf\xfbp\xdbm\
-\xb7att4\x01\x08#I\x10\x11|\xdfGww\
-7\xa6\xa6\xa6\xb0z\xf5j\xf4\xf4\xf4`\xfb\xf6\xed\x98\
-\x9e\x9enI\xe8588\x88\xc9\xc9I\xf4\xf4\xf4\xe0\
-\xdcs\xcf\xc5\x0b/\xbc\x80\x9d;w&@P(\x14\
-p\xcd5\xd7`\xeb\xd6\xad\x18\x1b\x1b\xc3e\x97]\x86\
-\xa9\xa9)l\xdb\xb6\xcd\x06\x8b\x16\xa9\xf4\xac\xb3\xceB\
-\x7f\x7f?\x1ey\xe4\x91\x04\xe4\x8d\xf4\x98\xcf\xe7\xf1\xb6\
-\xb7\xbd\x0d7\xdf|3.\xbc\xf0B\x1c>|\x18\xe3\
-\xe3\xe3\xc6\x9b\xac\xa5N3\x168\xe7\xc65\x17DT\
-q]w\x97R\xeaI\x22\xda2==\xbdu\xf7\xee\
-\xdd;\x0f\x1e<8}\xf8\xf0\xe1\xe8\xb1\xc7\x1e\x93\xf7\
-\xdf\x7f\xff\xcb\x8d\xdbc\x80'\x0f\xa0\x0b:\x0b\xef \
-\x80\xc5W\x8d|\xe3}\xa3\xf7}\xfb\x8a\x9d\x9b\x7f\xe0\
-9B\xc0/\x14 \xc3\x10\x8cs\x9d}\x89\x03Bp\
-\x04\xf5\x06\x94\x22p\xce\xb4\x0d\xceF\x98\xb8u\xb3h\
-\x89[\xe8\x8a+\xae\xc0\x9f\xfd\xd9\xad\xc9\xe4\xe9\x95L\
-\x8c18\x8es\xa8\xd1h\xdcx\xf1\xc5\x17?\xd0r\
-\xce\xde9\x0d<\xad\x1b\xbfN\xc0CDl\xfb\xf6\xed\
-E\xc7qr\xd5j\xb5\xcf\xf3\xbc\xb3\x1c\xc7\xb9\x00\xc0\
-EJ\xa9\xd7\x008\xd3u]\xdf\xa8\x9dl\xa0\xb1U\
-_I\x1b-\xf0\x01\x9a\xa1hv\xee\xdc\x89 \x08\xe0\
-\xfb~\xdb\xaar\xd7u\xb1j\xd5*\x1c>|\x18G\
-\x8e\x1ciS\xab\x99\xb2+V\xac@\x10\x04\xd8\xbbw\
-ok\xbfX\xaa\xb3e\xcb\x96!\x9f\xcfc\xc7\x8e\x1d\
-\x09sMe\x9cli\xe3\xf2\xe5\xcb\x11\x86!\x9e}\
-\xf6\xd9LW]s\xff,\x1bP\xda\xf6\x91\xbe\xc6>\
-f\x97\x01\x9a\x89\xc9f+3\x9bM*\x9f\xcf\xe3\xcc\
-3\xcf\xc4\x81\x03\x07\x12u[V=\xae\xeb\x22\x9f\xcf\
-c\xd9\xb2e\xf0}\x1f;v\xecH$)\x9b\xc1\x1b\
-P\x1c\x1e\x1e\xc6\xbe}\xfb0==\x9di\x03\xf3}\
-\x1fK\x96,\xc1\xd4\xd4\x14\x0e\x1d:\xd4v?Sn\
-xx\x18\xf9|\x1e\xbbv\xedj\x9b\xa5\x1b\x89\xafX\
-,b\xc9\x92%m!\xf5\xed\x94\xd7\xf6\xbe]\xc6\x00\
-Q\xec\x02]c\x8c\xed\x04\xf0\x0c\x80\xc7\xa2(z\xb2\
-\xd1h\xbcX(\x14&\x94R\x8du\xeb\xd6Ul5\
-\xd1<\x89\xa3\x15x\xfa\x00\x0c\x01X|\xd5\xad\xff\xf8\
-\xfe\xd1{\xbfu\xe5\xce\xcd\xff\xc7S\xd2,u\x99\x9f\
-\x94\xc1X\xcc\x01X3\x7f\xd2\x5c@\xc2\x98~\xdeO\
-\x7f\xfaSx\xc7;\xde1/\xa9\xe7T\x11c\x8c<\
-\xcf\x8b\xc20\xfc\xfc\x86\x0d\x1b>E\xa94\xda\xa7U\
-m\xa7\x09\x00\xf0\x83\x1f\xfc`\xe1\xda\xb5k\xdfKD\
-\x17\x17\x8b\xc5\x0b\x18cK]\xd7\xf5\x0d\x93\xb6\x99\x80\
-\x91\x18\xd2\x0cx\xae}\xa5\x14V\xae\x5c\xd9\x06Tv\
-\xb9z\xbd\x8e\xbe\xbe>\x0c\x0e\x0e\xb6\xd4c\xff\x1aI\
-i\xcd\x9a5\x99\xe7\x8dZ\x8a\x88\xb0f\xcd\x9a\xcc\xf3\
-6\x19\xb5\xd8\x81\x03\x07000\xd0\xd6\xee\xb4\xad\xca\
-\xfc\x1a\xe6\x9a\xe5\xec`\xfa\xcd\x5c\xdf\xc9Ya6f\
-\x93\xae\xdb\xd4i\x83\x95R\x0a\xfb\xf6\xed\x83\x10\x02C\
-CC\x99uH)\xe1y\x1e\x96,Y\x92\xd4a\xfa\
-\xce\xb4\xcf\xfe\x8d\x8d\xcfX\xb8p!\x16/^\xdc\xf2\
-\xfc\xa6\x9c\x91r{zz\xd0\xdb\xdb\xdb\xd6O\x86\xa2\
-(\x82\x94\x12\xcb\x97/o\xbb\x8f}?\xa3\x82\xb4\xfb\
-\xc9\xd8\x88L?f9\xa1\xd8\x93\x0a\xcf\xf3\xf2B\x88\
-s\x18c\xe7\x10\xd1Ma\x18\xd6|\xdf\xdf#\x84x\
-\x821\xf6\xb3\xfb\xef\xbf\xff[8>)\xe3\x09H\xa2\
-;\xc7\xc4p4f\x13\xc6\x04\x18\x07H\xc5 \xc4\x9a\
-\xcf\xd2\xf1\xa6\xa4\xa3`\x7f\xe5+_\xc3k^\xf3\x1a\
-\xac^\xbd\xfa\x15\xe9=j\xd4\xd8\x8c\xb1\x07]\xd7\xfd\
-\x1b\x00`)\xc0\x9f\x15x\x08\xc6\x95\xb3\xbdK\xd3\xdd\
-s*\xce\xcf\xf6\x9a\xb3^\xdf\xf1n\xc3\xaf\x12\xcd\xcc\
-\xcc\x5c+\xa5\xfc\xec\xf0\xf00\xca\xe5\xb2Q]\x11\xd3\
-\xd4\xc2\x8c\xb3\xb6\xd3\x8c\xd5\x06\x17\xfb\x5c\x18\x86m\xd7\
-\x1b2\xdbf&\x9e>n~M\xdd&Rn\x16\xd3\
-7dl\x1b\xf6uY\xf7%\x22\x0c\x0d\x0d\xcd9\xeb\
-4u\x18[G\x9c\x97$\x91\xfc\xb2\x98o\xd6\xb1N\
-\x94\xd5\x97\xe6\x98a\xc0\x9c\xf3\xc4\xa6\xe4\xfb~\x1b#\
-\xefTo\xadVk\x03\xbb\xb4\xf1?\x8b:y\xa7\xd9\
-\xf7\xed\x04*\xe6\x5cKT\xe3\x0c\x15Z\xd6uY\xed\
-1\xc7m)\xccf\xd8V\xdd\x04 ?44\xb4\xa6\
-X,\xae\x19\x1f\x1f\xbf\xfe\xc8\x91#c\x00\xbe\xd9\xb1\
-\x93\xe6&B\x93-\x10\xd2a\xc8\xe7I\xfa\x1dH\xe4\
-\xf3]p\x85\x0b@%\x92\xe5|\xc6\xc9\xfe\xfd\x07\xf0\
-\x85/\xfc-\xfe\xfc\xcf\xff\x0c\xbd\xbd\xbd\xb3F\xb6>\
-\x15\x14O\x18vMNN~\xfa\x8a+\xae\x18\xcb*\
-3+\xf0p\xe8T\xd5\x00\x90\xb1 \xb7\x03#f\x1d\
-Ua\xed\x8a\xa8\xce\xac|V5TF\xfd\xe9R<\
-\xfbp\x93h\x16\xd5Y\x8b\xaa\x8d\xb5l\xcdF\xf3Q\
-\xd3\xceO]y\xf2izz\xda?x\xf0 \x06\x06\
-\x06033\x83G\x1f}\x94\x82 `V\x92\xac\x16\
-)\xc7\xd8@\xcc\x9f)\x07$\x9e,-\xe0c\xec!\
-6c\xb5\xeb\xeb$\x05e\xb9[g\x01 \xd0\x9c\x11\
-\xdbL)=\x8b\xb6\xcf\xdb\xfbv9\xbb\xde\xb4\xda\xcc\
-\x1c\xdf\xb5k\x17\x1c\xc7\xc1\x82\x05\x0b\xcc\x1a\x8a\xc4\xd9\
-\xc10C\xa3\x0aI\xab\x8c:\x91\xa9\xdb<\x87-Y\
-r\xcea\xd6G\x09!\x12{\xce\x99g\x9e\xd9R\x7f\
-\x16\xe8\xd9\xdbY\xaa\xac\xd9\xcag\x01S\x1a8\xec\xeb\
-lu\x98=\x1bO\x03\x8a]G\xfa\xcfH\xabv{\
-m\xe7\x13\xfb\xb8Q\xfb\xda\xfd\x1e\xef3\xcf\xf3\xe8\xca\
-+\xafd\xf9|\x1e\x07\x0f\x1ed\x95J\xe5\xd8b\xef\
-\xc4\x8f\x90\xfe#@5\x99\xc6|1\x88\xa0\xf3\xaa)\
-\xf4\xf7\xf5czj\x02\xdd=}\x08B\x85F\xa3\x9a\
-\xd8|f#\xc6\x80\x87\x1f\xfe\x19\xbe\xf8\xc5/\xe1c\
-\xff\xe9c\x94\xcf\xe5\xd8+\xc5\xde\xc3\x18\x83\xe7y\x07\
-\x82 \xf8\xf8\x15W\x5c\xb19\xadb34+\xf08\
-\x8c\xa1\xe0\xcc/\xd8\xe6|\x98\xe6qc\xacm6\x98\
-\xf9\xdd\xe1\xe5\xde?S\x02J#\xe2q\xba\xff\xd1\x0c\
-\xe5\xe3A\x8e\xe3\x90\xf5\xd1\x22\x8a\x22f\x0c\xe16S\
-0\x8c\xd0V\x8d\x18\xd00\xe5\x0d\xc3L\xab\x98l\xc0\
-1\xb6\xa2,\xa6n\xea3*>S\xce\x06*[\xed\
-d\xc8\x96\x08\xd2m\xea$\x91\x01\xad\x0cy6\x90\xb2\
-\xeb\x11B`\xdb\xb6m\x18\x1b\x1bCoo/\xba\xbb\
-\xbb\x13\xef\xb44\x03\xb5i.\xa9\xc4n[\x1a\x98\xa5\
-\x94\x18\x1f\x1f\xc7\xf4\xf44\xc6\xc7\xc7q\xee\xb9\xe7\xc2\
-^\xb0\x97\x05p\x9d\xa4\x15\xfb\xbdf]\x93%\x95\xa4\
-\xcf\x1b2\xef)\x0b\xf8\xd2\xc7\xd3}\x92\x06!s\xde\
-V\x97\x9a2\xf6\xbe\x01\xb5\xf4q\x1b\xb0\x88\x88\x05\xb1\
-w_\xec-y\xac\x9f\x94\x0d8*\xfe\x93R\xd5\xab\
-NW7\x81\xb3Y\xdd\xa1\xd3\x94\xcb\xb9(\x14{P\
-(\x14\xc1\x84@\xa9\xbb\x0b~\xbe\x80\xf2L\x05\x07\xf6\
-\xed\xc6\x5c\x9c\x82H\x83\xcf\xddw\xdf\x8d\xe1\xa5g\xd2\
-\x07\xde\xff>\xe5@\x8aS\x0d>\x9cs\xe2\x9c\x1f\x0e\
-\x82\xe0\xd3\x1b6l\xb8\x13hW\xb1\x19\x9a\x15x\x18\
-c\xf0\x18\x03\x9dl.x\x9a\x00\x9c\x5c\x09\xa8\xd1h\
-0)e2\xab\xb6\x19\xbea\xa8J\xa9\xc4\xa3\xc8^\
-<f\xc8\x80\x8da\x04Y\xea\xb6,I\x02h\x05\x8d\
-4\x08\x99}\x1b\x1cl\xc0\xb2\xeb5\x94V\xc7\xd8\xd7\
-\x98\xba\xb2\xd4}\xf6~\xfa\x9e\xf6\xf9\xe1\xe1a\x08!\
-05\xa5c%\xd6\xeb\xcdl\xab6\x03\xb0\xdb`\xb7\
-\xd5f\xfe\xe9\xba\x8d\xa4\x94u\x9es\x8eR\xa9\x843\
-\xce8\x03\xbd\xbd\xbd\x08\xc3\xb0\xed]\xa6\xef\x93\x06\x9a\
-,pH\xb7\xd1\xae\xc7\xbe\xde\x947c#-5\xd9\
-u\xd8RH\x96\xe4d\x03\x8a}.\x0dRD\x84\x89\
-\x89\x09\xfc\xf2\x97\xbfL\xeei\x5c\xc8\x89\x08\xc5b\x11\
-k\xd6\xaci\xbb\xaf\xb9\xde\xc4`\x0b\xc3\xf0X>)\
-K\xb5\x96\x80N\x04 ,\xef\x1d\x1d+-]\x19\x8a\
-\x5c\x97\xafB\x93'nn\x8a\x22\x89BW\x09n>\
-\x8f\x9e~mS\xf4\xdc\x00S\x93G0_\x07\x05\x22\
-\x82\x22\xc2=\x8fm\xa3\x95o\x98\xdc\xfd\xc63\xbb\xfa\
-\x85\x10%)\xe5<\xfd\xe3\x8e/\x09!\xa4\x10b\x9f\
-\x94\xf2?o\xd8\xb0\xe1\x7f\xccU~N\xe7\x02J\xfe\
-\x9d\xa6_e\x92RJ\xa5\x94$\x22a\xcfJm@\
-\xb0g\xa1F\x1d\x94\xd6\xad\xa7\xc1\xc4Va\xd9\x80e\
-\x00%-\xc5\xd8\x8c\xc8\x06\x88t\x99\xb4=%\xad\x1e\
-\xb3\x81\xcf\x9c\xb7\x8d\xf2iP\xb2\x8f\xa5\xb7\xed}\xfb\
-x__\x1f\xfa\xfa\xfa\x92\xfd4H\x98\xf2\xc7c&\
-j\xf7\xad\xa9\xcf\x80\x8e}l>\x12V\x16Xt:\
->\x9b:-\xeb\xddg\x81\x88y\x87Y\x92\x91]W\
-Zb\xb1\xebp]\x17\x03\x03\x03\xc99\xe3\xb4\xa0\x94\
-J\xf2\xf5\xd8\xe7\x00$\xe7\xe3:$\x8eJ.i\xed\
-\x0a4\x81'\x82\x8e\xd7\x16\xee\xd9\xfc\xfd_\x9ew\xd3\
-\x87\xc7\x06\xd6\x5c\x98?\xf4\xe4\x03BF\xf3\xab>\x08\
-\x02LM\x1cB!\x9fC(\xf4\x18\x9d8r\x04\xe3\
-\x87\x8f`\xbe\xba\x0e\x06\xc0\xe9_L\x8b^wM\xf5\
-\x1b\xf7\xfc\xf8\xde\xe9%\xaa~\xddu\xd7\xfdVWW\
-\xd7\xc20\x0c]\xb2\xe2\xc8\x9dHb\x8c\x91\xeb\xba\x01\
-\x11=]\xab\xd5F.\xb9\xe4\x92\xff=\x9f\xebN{\
-\xb5\x9d&C\xcf\xd4\xeb\xf5\xc7\x89h\x15c,\x0f\xc0\
-#\x22\xa1\x942\x09\x9c\xdal-iu\x15\xd0j\x08\
-\xb7\xc1%\xad\xb6I3J{\xb5|ZB\xca\x92\x9c\
-\xd2\xe5\xccy\xfb\xd7\x9e\xa9\x1b\xd0\xb3\xcf\xa7\xaf\xb3\xf7\
-g\xab;=\xb36\xc7\xd3 \x99\x96<\xb2(\x0d\x84\
-i)\xa5S\xb9\xb44b\x97KK\x88Y\x12\x90}\
-\xdc&\xf3\x0ci\x00H\xb7\xd9>\x97\xf5n;\xbd\xeb\
-\xb4\x87d\x1a\x84\xd2\xaa7\xb3\xef\xfb>\x96/_\xde\
-\x22\x05\x99kl)\xdd\xba\x9e\x18c\x921\xd6 \xa2\
-j\xbd^\xdf^\xaf\xd7\x9f\xcd|\x09sS\x8b\x8a\x0d\
-\x1ax\xea\xe3Oo\x1e\x9b|\xfd[\x1eXz\xf9\xf5\
-]!h`\xea\xc5\xed\x0e\xd5k\x80\x9a\xdb\xcd\xb9\x5c\
-m`\xcf\xbe}\xf0sy\xc8(Byz\x0a\x10\x1e\
-\xe6L~\xcb\x1d0\xdf\x85[\x1a\xa6%\xaf\xbf\xa6\xc2\
-z\x16>\xf9\xfc\xd7?\xf7\xc4\x9fO\x1d\x1c\xdd\xbf\x7f\
-\xff#\xef}\xef{\x7f\xab\xaf\xaf\xef\xd2(\x8a\x16r\
-\xce\x85\x94\x92Qj\xec\x1c+\xd9\xf5\x08!\x88\x88\x22\
-!\xc4\xa8R\xea\xfba\x18\xfe\xd5%\x97\x5c\xb2\x83:\
-\xd8t\xd2\xd4\xd2\x12\x22*N!<\xe7e\xb5\xee4\
-\x9dp\xf2\xe0\x1e(\xc4)d\x8f\x131\x00\xf4\xc7\x7f\
-\xfc\xc7C\x97]v\xd9\x1b&''7\xee\xd8\xb1\xe3\
-|)\xe5b\xd7u\xbb\x18c.\x11yJ)\x97\xe9\
-\xb8\xef\x9c\xc5\xa38Kj\x01\xda\x0d\xffi\xf0\xb0A\
-\xc9\x1c\xcf*k~\xb3\xca\x99\xb2\x86\xd1\xda@\x98v\
-4H\x1e\x94\xa5\xa2\x08\xa3\xe9\xfc\x90\x96~lUW\
-Z\xede\x87\x83\xb1c\x93\xd9\xcf\x96\x06\x89t\x1d6\
-0\xa6\xdb\x99%\xb9\x98\xb2\xb6\x04\x91.\x9b\x06\x15\xfb\
-\x5c'c\xff\x5c\xd7\xa4\xef\x9b\x05.\x86\xd2\x1ef\xf6\
-\xb1\xac6g\x01\x93Mi\x89(}\x5c\x9f\x22\xc5\x18\
-S\x8c\xb1\x801\x16FQ\x14H)\xcbB\x88\xd1\xe5\
-\xcb\x97?100\xb0\xe9\xf1\xc7\x1f\x7fhdd\xe4\
-0\x8e\xde|\xca\x00\x08\xe8\xb5<&^[\x0f\xccz\
-\x1e\x91\x1bZ\xf9\xee?\xb8*\xf2\xfa.\xad\xef{n\
-\x90&\xc7=\x15\x85\x5c\x92b\x80\x91:2\x18~\xd2\
-\x8aX\xb5f\x17\xc90&30\x12\x5c\x80\xb9B\x09\
-\xaf+r\x17/\xaf\x14{\x86\xb7\xef\xbf\xe7\xcb\xf7M\
-\xed\xdc\xb6\xd3q\x9c\x83Q\x14\x8d_u\xd5U\xf2\xd3\
-\x9f\xfe\xf45\xc3\xc3\xc3ow\x1cgm\x14E\x03\x00\
-D\xdc\x7f,k\xac\xcd\x97\x8c\x8d\x8c1\x16\xb9\xae{\
-XJ\xf9\x94R\xea\x7f\xfe\xf2\x97\xbf\xfc\x97\x9bo\xbe\
-\xb9<_\xd01\x8f\x7f\x9aN\x93q\xddK\xbe\xe6\x95\
-+W\xf6\xac_\xbf~i>\x9f_)\xa5\x5cMD\
-\xeb\x94Rk\x01,`\x8c\xf5\x08!\xf2J)\xe1\xba\
-.\x03\xc0\x18cL)\xc5\xecAm\xc4\xfd,\xc6m\
-S<`\xb3\x1bfI,f\xdf>g\x00 ]\xb7\
--\x9du\x02\xc4\xa3=f\x03\xcalRS\x96\xb4d\
-3\xe7\xf4\xfe,\xfd\xd2\x028\xe6\x98![\xaa\xcc\x02\
-\x0f\x9b\xf1\xcf&\xed\xd8\xf6\x1a\xfb\x1a\xe3\xd0`\xb7\xa7\
-S}6u\x92\x92\xac\xfe$\x03$i\xf5g\xaa>\
-2\xea\xbb\xf8\xfd\x13\xe9\x02\x14E\x111\xc6\x22)e\
-\x8d\x88\xa68\xe7\xfb\x95R\xcf;\x8e\xb3\x8d\x88^h\
-4\x1a;\x9e}\xf6\xd9};v\xec\xb0\x13\x96q\xa0\
-\xc5%z>\xc4\xe2\xeb\x1c\xe88mf!i\x0f\x80\
-\xfe\xf8o\xc0Yv\xf6\xb2\xdc\x99\xe7\xad\x96\x85\xaea\
-\x17\x22\x0f\xa6\xdc\x88H0E\x06UZ^\xb0\xcb\x18\
-le\x18\x8bAH\x22\xce\x84\x11??\x00\xb8\x9c\x11\
-1\xae\xe0\xf0\x88I4TX\x9b\x88\x0e\xee\xdeU}\
-\xfa\xfe_\x02\x18\x87\x8e\x0c?\x0e`\x12\xc0\x0c\x80\xca\
-\xddw\xdf}\xc6\xb2e\xcbn\xe0\x9c\xbfQ\x08\xb12\
-\x8a\xa2A\xa5T\x9e1\xc6\xb3\xc6@\x96Td\x8d{\
-RJ)\xceyM\x08qH)\xf5\xbcR\xea\xbeF\
-\xa3q\xe7\xeb_\xff\xfa\x9dG\xd1\x97-\x9dz\x9a~\
-\xbd\xc9\x80\x8e!\x8e\xe6\x87\x96\x03P\x000\x00`\x11\
-\x80%\x00\x16\xe6\xf3\xf9\x01\xcey\xb7\xe38\x05\xdf\xf7\
-s\x9e\xe7\xf9B\x08\x9fs\xee@\x83\x10WJ\x99\xc4\
-R\xcc\xbaG\xf2\xa7\x94b\xcd\xd3z#\x1e\xfc\xc9\xf1\
-\x14CN@,\xa3\xfd\x04`N\x95B\x06\xba\x99\xf6\
-P\xe7\x22-\xf5\xb14s\xecT>\x0bh\xb2\xc07\
-K2J\xd7\x9df\x14ii\xcd\xba\x8e\xd2\xf5\xa4\x19\
-\xb9\xf5\xdc\x94Q\xbe#C\xb6\xdai\xfa\xda\xcc~\xd3\
-\xf7\xa1\xd45\xe6\x1e\xb6\x91\xde\x94'\x00\x14\xcf\xa4)\
-.F\xb1\x9a\x8c\x00\x80\xeb\xdcN\x8a\x88\x94RJF\
-QT\x0f\xc30\x08\x82\xa0&\xa5\xacJ)\xa7k\xb5\
-\xda\x11\x00\xfb\x01\xec\x85^ :\x0e\x1d\xd0\xb6\x818\
-\xe14Z\x1d\x95\x8f\x16|8\xda\xa5\x9e.\x00\xdd\xd0\
-\x00\xd4\x1b\xff\x96\xe2s9h\x90r\xd0\xbe\xcab\xbe\
-<\x97R\xdb\x12:8i\x03@\x15:\x05\xc94t\
-&\xd0\xc9\xf8w\x06\xfa\xb9\xebq\xd9\xe8\xd1G\x1f=\
-\xd3\xf3\xbc\x8dJ\xa9\xab\x1c\xc79\x87\x88\x16\xfe\xff\xed\
-\xddml[W\x19\x07\xf0\xffs\xec\xa4I\x9a\xb6Q\
-K\xbb\xb5q\x984\xd1M\xeb\x98V'j\xabN\x11\
-\xea\x04\x1f\xe8\xa0Q7\xadI&*\xd6\x02*B\x93\
-\x10[\x19T\xf4\x03e\x15\xe2E\x9b\xd8$\x10\x12\xb0\
-1\x0dh\x12w\x9b4\xca\xa8\xaamP\xd4\xc1\xa6\x91\
-6)\x14\x81\xb6\x22A\xe2\x84n\x19[_\x92\xda\xb1\
-}\xcf\xc3\x07\xfb\xc4\xb7wvb;uR\x91\xffO\
-\xba\xb9\xd7\xe7\xdc{}\xae\xeds\x9e{\xceq\x12\x11\
-i\xf4<\xaf\xceZ[c\xad\x0d\x1b1\xeaJ\x95\xbb\
-yT\x11\xf1\x8c1\xa9P(\x94\xb4\xd6^\x12\x91\xd1\
-T*\xf5\xb7P(t|bb\xe2D{{\xfb\x90\
-\xefz\xca\x9e\xc4d\xe0Y\xd8\xc4\xb7v\x8b\x0b8\x8d\
-\x81\xa5\x01\xd9\xbb\xbdE\xc8V*W\x19\x8do\x91\xc0\
-\xb6\x1b\xa6\x10_\x1e\x02\xf9\xf0\xedS\xa8l\x85\x1e\x07\
-\xb7\x0b}\x15\xa8\xd8\xfe\xfe\xeb-\xa6\x94s\x16;\xae\
-\x9af\xaa\xe0\xc1|w\x0d\xd3\x1dW\xa8\x11\x0e6z\
-3\x9ds\xa6\xfd\xfd\xfcA\xc0?i\xef\xf2\x5c\x9a\xe7\
-\xcb\x0b\xae\xfd\xf3-Ss.\xb9e\x02\xd9Fy<\
-\xb7}\x09\xf9\x00\xa4\xb8\xf2zKm0\xdd\xe78\x84\
-\xecg\x7f\x11\xb2\xf5\xc1\xfd\x9b\x84F\x5c\x19t\xea\x90\
-\x0dR\xae~\xb8sT\xc2\x7f\xcd\x99\xdc\xb5$\x91\x0f\
->\xe3\xc8^\xe3x.-\x89\xfc\xf5\xba\xd7P\xfb\xfb\
-\xfb\x1b<\xcf\xbb\xdd\x18s[]]\xddZ\x00-\x9e\
-\xe7\xad\xb4\xd6.\x13H\x1d\x04&w\xa3\xe0\xa9j\xd2\
-\x18\xf3~8\x1c~7\x93\xc9\x0c\xa5\xd3\xe97\xad\xb5\
-\x7fY\xbe|\xf9_\xd7\xae];\x09L\x8dR\x94\x1d\
-p\x1c\x06\x9e\x85\xcd\x1fx\xfc\xc3\x09\xee\xce.\xec[\
-\x5cE\xaa\xc1\x95\x01\xc6\x1fD\x5c%s\xe3\x5c\xfe\xbb\
-=\xff~R \x7f\xa6@Q,\xaf\xd4\xb4b\x8f+\
-9\xb6XZ9\xf9\xa5*7\xd8\x14J\x9bn\x9fr\
-\x82N\xa9\xcfY\xea9\x83\x01\xc8\x1f\x84\x5c~\xb1\xc0\
-d\x03\x8bkh\xd3\xb9\xc5\xcb\xa5%s\xeb\x14\xf2\xbd\
-\x9fJ\x02\x8f\x0b>\xae\x8e\xb8a\xb7zd\x83P\x03\
-\xb2\x01\xc7\xdd\x98\x85q\xf5\x02\x8f\x0b\xc4\x19|0\xf8\
-$\x90\x0f8S=\x1d\xf8\xae\xd57\x94\xad@\xf6\x0f\
-\x00G\x22\x91ZcL\x0d\x80z\xcf\xf3\xea\x96,Y\
-\x12\x9a\x9c\x9ct\xf37\xc9\x91\x91\x91d}}}j\
-\xcb\x96-)\x11\xc9\xfe\xaf\xe7\xfc\xd0y\xc5\x01\xc7a\
-\xe0Y\xd8\xfc\x8d\xaf\xab$\xee\xceN\x0a\xac\xdd\xbe\xc1\
-\x05\x81\xed\xe0\xf9\x83\xcfUJ \x09\xf68\x0a\xf5@\
-JQ\xee1\xa5\xf6r\xca9o\xb9e(\xa7b\x97\
-\x1a\x1c\xcam,*i\x5c\x8a\xbdg3\x05\xaa\xe00\
-X\xb12\x04{+\xc1\xc5\xa5{\xc8\x07$\xf7\xd8\xa5\
-y\xa8,\xf0\x00\xf9\xfa\xe1n\xc4\xdc\x0dZ-\xf2A\
-\xc7\x7f\x93V\xa8'_\x09\x17h]\xf0I#?\xec\
-\xe6\xd6\x93\xbe<w\xad\xe5\x0e)\xce\x19~\x9d\x9a\x1c\
-\xff\xdde\xf0\x17\x12\xca\xe9\x1d\x14K+%/(\xd8\
-pU4\x9e\x5c\xa6b\xe5\xab4\xf0\xcd\xa5\xe9\xca8\
-\x17\xaf[\xf0}*\xf7\xbd.'\xaf\x9c^\xdcl\x1b\
-a\xff\xe7\xd0\xf5\xae\xfcu\xc5\x05\x02\xd7\xcbqs;\
-\xae\x97\x0fT\xfe\xd9\x09\xf6\x06]\xcf\xce\xf5j\xd2\xbe\
-m\x97wM\x07\x1d\xe0\xda\xafHT]\x85\xe6J\x82\
-\xe9\x85\x1e_\xed2\x5c\xb3\x15\x84\xaa\xa2\xda\xefy\xb1\
-\xde\xdetsS\xa5\xf0\xf7\xf2]`\x09\xf9\x96\xe0\xbc\
-\xe7Ls\x89\xa5\x0a\x06\x9f`\x0f\xce\xdf\xc3\xabd(\
-q\xce1\xf0\x90\xc3\xcf\x02-\x04\xb3m\x8c\x83\xf3\xa2\
-\xd3\xad\xfd\xfb\xcfVpX\xd1\x1fdl \x0f\xb8\x86\
-\x83\x0e\xc0\xc6\x86\x88\xa8\x12\x85\xe6,\x83\xf3\x9e\xc0\xd5\
-\x0d<n]l\xdb\xbf\xbe\xa61\xf0\x10\x11\xcdN%\
-\xdfz\xacD\xa9s]DDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDDDDDDDDDDD\
-DDDDDDD4w$\x98\x10}al\x8d\
-L\xa67Y\xeb}8\x14\xc6\xeb7\xdaH\xff\xe1N\
-\xf1\xe6\xa3pDD\xf4\xffg*\xf0\xec\x88i\xe8\xac\
-7\xf2\x0d\x15\xdd\x0f\xc5\x22\x88(TE \xef\x8a`\
-\xdb\xa9\xee\xc8\xeb\xf3Y\xd0\xd9j\xeb\x8b\xdfiU?\
-s\xfd\xd2\xc8\x03G\xef\x92\xc9\xf9.\x0f\x11\xd1Be\
-\xdc\xc6Y\x1b\x7fX\xa1\x8f\x88\xca\x91Z\x91\x9b\xd7\x9a\
-\xe6:\x83\xd0\xc7T\xf0\x9e\x02Om\x8ei\xfd|\x16\
-t\xb6\x14\xb2N\x15\x9fO\x8c\x8f\xd5\xccwY\x88\x88\
-\x162\x01\x80\x8d\xcf\xc7W\xa4R:*\x90\xfeS]\
-\xcd\xed\x22\xa2n\x87\xcd\xb1\x0b\xcb\x9b\x1a\x97N\x1c\xbd\
-K&UU\xa2}\xf1/\x0b\xb0G!-P\x9c\x0e\
-\x1b\xd9\xd7\xdf\xd5\xfcG\x00\x88\xf6\xc4\x7f\x0c\xc1b(\
-\xdeR\xd1\xdd\x80\xa4D\xf1\x80\x1aD`\xf5a\x81\xd4\
-*\xcc\x81\xc1\xfb\xd6\x1cj;2\xda\xe0\x8d{o\x18\
-\x91\x9fY\xc5f\x01>\x0e\xc1@m}\xcd\xceT\x22\
-\xfdMU\xdc#\x823\x1a\xd6/\x0d\xde\xdb\xf2\x16\x00\
-\xac\xef\xfd\xcf\x06A\xe6Q\x85D\x05\xfa/A\xe8{\
-\xa7\xba\xd7\xfc\x0a\x00Zc\xa3w[\xcf;\x081\xfb\
-\x05v/T\xd6)p4\xd4h\x1e\xb4\x13\xf6\xb3P\
-\xfd\xaa\x02\xabE\xe4\xef\x109X'\x8d\xc7\x92\xf6\xd2\
-K\x00\x9e\x18\xe8\x8e<3\x0f\xaf=\x11\xd1\x82d\x00\
- \x95\x91V(jE\xf4i\x7f\xd0\x01\x80\xd7:\x97\
-\xbd\xe7\x86\xa6Z{\xe3_\x83\xe2q(\x86\x048 \
-\xc0u\x9e\xea\xf1\xb6\xd8\xb9\xdb\x00\x00\x82\x1b\x14\xd8\x09\
-\xc1G\x04\xe6\x07\xa2X\x01\xe8\xf3\xb0\xd8!F~\x08\
-Q\x11\xf1\xbe\x05\x00K\x12a\x03\xe0V\x85\x1e\x80\xc1\
-\xa0\x0a~\xa1\xaa\x9fH]N\x9f\x81\xc8E\x11}\x5c\
-\x15wJZv\x03\xc0\xc6\xde\xf8M@\xe6\x84\x02I\
-1\xf8\x9c@N(\xec\xd3\xd1\xd8H\x07\x00\xc0j\x13\
-\x80[E\xf5\x11\x85\xe9\x85\xe8!@w\xeae\xed2\
-\x82\x01@\xfe\x0c\x00*\xd2'\x22o\x02\xe9z(n\
-P\x95Us\xf3R\x13\x11\x11\x00\x84\x01@\xac\xaeV\
-\x00*\xe6\xed\xe9vV\xc1>\x81\xbc2\xd0\x1d\xd9\x0a\
-\x00\xed\xbf9\xff\xf3\x89\xf1\xf1w\xac\x97\xd9\x0b`W\
-v'\xbc1p_\xe4~\x00\x88\xf6\x0c\xaf\x87\xc8\xb6\
-\xed]\xcd\x1d\x07Dl\xb4w\xb8I\x15\xdfi;2\
-\xda\x80D\xee\xa4\x22\x07\x07\xbb\x22\x8f\xa9\xaa\xb4\xf6\xc5\
-wC\xf1\xec@W\xf3>\x00\x88\xf6\xc6w\x00\xb8\x1d\
-\x00\xd2\xc0C\x02\xb9x\xfd\xd2\xe6\x8e\x5c |6\xda\
-\x13_\x05k\xf7\x02\xf8\xb5+\xa3\x09\x99m';\xd7\
-\x0c\xa9\xaa\xb4\xf6\xc6\xefU\xb5w\x9c\xean\xf9Qk\
-\xdf\xc8:\xb5\xda\xd1$5\x8f\x1d\xef\x5c5\x0e\x00\xaa\
-\xba2\x18h\x89\x88\xa8\xbaL\xf6\x879\x03\x00\xb0X\
-_l\xc7M/\xbc}\x1d\x14M*x\xc5\xa5\xbd\xfa\
-\xe9\xa6\xf7Uq\x12\x82\x9b]\x9a\x88\xe6'\xee\x05\x13\
-P\xcd\x1c\x10\xb1\xb9\xa7\x9b\x00\x80\x15\xb5f\xeaK\x0d\
-\xa2\xd9\xdeT.\x00$D\xe0\x9b\xf8\xd7\x09\xdf\xf6-\
-\xaaXq\xeeB\xfc|\xb4g8\x11\xed\x19N@\xb0\
-\x1d*\xeb\xfc\xe5\x5c\x146\xc9\xfc\xf9d\x0c\x10\x83\x22\
-\x18t\x88\x88\xe6\x9e\x01\x80\x1b\xcd\xea3\x22\xf8\xa7\xaa\
-\xfd\xca\xa6\xe7\xe2\x11\xff\x0e\xad\xbd\xc3\xf7\xb4\xf5\x8dn\
-\xdf\xda\xb1jL\x04\x09X\xdd\xe0\xf2r_8\xf8\xa8\
-\x02\xc3\xd5/\xaa\xfc\x1b\xa2\xe7\xc307\x99\xc6P\x8b\
-i\x0c\xb5\x98\xc5f\xb5i4\xb7T\xff\xb9\x89\x88\xe8\
-j\x09\x03\xc0\xe1NI\xb5\xc5FwY\xcf\xfb]*\
-\x85\xc1hO\xfc\x09\x189+\xaa\xed\x0a\xecQ\xf5\xfe\
-t\xec0\x8e\x01x\x12\x82=\xd1\xbe\x91\xef\xc2\xeaK\
-\x09o\xe4A@\x17\x8b\x98\x9fT\xbd\xa4&\xf4$\xac\
-\xb73#\xfam\x99\xb4\x8f\x863\x92L\x03_\xac\xad\
-\xaf\xf9~)\x87\xab\xd5\x8b\x00p\xde\xa6\xb6n\x8c\x9d\
-\xebo\x80\x19\xbb`'\x7fi\x8c\xfc\xf4dg\xe4\xc5\
-\xea\x16\x9e\x88\x88\x9c\xa9a\xa8\x93\x9dk^\x0d\xd7\x84\
-\xa3\x00N\xab\xe8~\xb5\xf6\x90Ut(\xf0\xd42\xb3\
-\xe8S\xafuJ\xc2,\x0e}]\x80g`\xedC\x0a\
-}\x19\xa2\x9b\x05\xe6\x0b\x03]\xcd/W\xbb\xa0\x03\x9d\
-\xab\xff \x8a\xfb\x01|\xd2\xa6q:\x05\xfcC\x15\x1b\
-5\x91^V\xca\xf1u\xa1%/\x8a\xc8\x10Tci\
-\x9b\xdeu\x19v\xa5\x02[UqG\x95\x8bNDD\
-3\xd9\xf2{\x0d\x07\x87\xdc\xfcv\xc4\xb4vC\xcfH\
-\x8b\xaa~\xe0/\x1f\xcc\x85M\xcf\xc5#[b\xef4\
-\x96{\x9c\xaaJ\xdb\x91\xd1\x0fM\x9d\xe7\xb7\xff]z\
-uKFDDDDDDDDDDD4'\
-\xfe\x07\xads\xee\x15W\x0f\x9b\x03\x00\x00\x00\x00IE\
-ND\xaeB`\x82\
-\x00\x00&\xa4\
-\x89\
-PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
-\x00\x01\xb5\x00\x00\x00U\x08\x06\x00\x00\x00\xce\x99z\xeb\
-\x00\x00 \x00IDATx\x9c\xed}m\x8c\x1c\xc7\
-y\xe63\xcb\xe5\xf2K\x149+\xcb\xfa )\x8b\xb3\
-\xbci'\xb6\xcf\x22\x87\xffN8\x1f|\xcb\x03\xeeW\
-rwX\xde\xe5`\xd9pr\xd9U`\xf8\x92\xe0b\
-\xcc\xc4\xb1a\x1c\xe4\x08;0\x14\xc01\x1chW\x16\
-\x04XA|\xde\x85d\x09H\xfc\x91\x1d\x1b\xc9\xc5q\
-\xfepm\xdd]\x0e\x97\x1ai\x87\x09IA6%\xee\
-\x90Ki)\xae\xc8\x9d\xfbQ\xef\xdb\xfdvMuO\
-wO\xcf~\xb1\x1e`\xb0;=\xddUoUW\xd5\
-\xd3\xef[\xd5\xf5\x00\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\
-\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\
-\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\x0e\xdb\x09\
-\x854'w:\x9dA\xd9\xb1\xe3\xd1l6'\x01L\
-\x02\xa8\xd0\xa16\x80Y\xcf\xf3j\x9bgUo(\xa5\
-\x8a\x00\x96\xe9\xeb\x98\xe7y\xad\x88\xf3*\x00\xa6\x01\x8c\
-\x8b\xc3u\x00u\xcf\xf3\xda\x83\xb5\xb2\x7f\x90\xfd\xe7\x00\
-\xb4=\xcf\x1b\x8d9\xafD\xe7\xb5<\xcf;\xbdQ\xf6\
-9\xf4\x0f7~\xedL\x14\x0aa\x1a\x1b\xda$;\xee\
-(4\x9b\xcd*\x80\x19\x04\x84\x06\x00E\x00U\xa5\xd4\
-\xc2\xe6X\x95\x09VrRJ\x8dC\x0f\xf4\xe3\xc6O\
-U\x00\xe7\x880\xb6\x04\x94RE\xa5TG)u.\
-c\x12E\x99VNfmi(\xa5\xceQ\x9d\xdd\x11\
-\xe5u\xd8\xdep\xa46`4\x9b\xcd\x22\xf4\xe0\x0eh\
-\xcf\xac\xe0y^\x01\xc0\x144I\x8c+\xa5\xaa\x91\x09\
-l\x0fL\xd0\xdfE\x00\xa3\xa2\x8cuh\xcfgq\xf3\
-L\xebB\xa9\x9f\x8b=\xcf[\xf4<o\xd4\xf3\xbc\xd3\
-\xdb\xc1\x03\xcd\x09}\xd5\x99\x83\xc3Fbx\xb3\x0d\xb8\
-\x030\x01\xfdt\xdf\xf2<o\x8a\x0fz\x9e7K\xa1\
-\xac*\xc2\x1e\x1c\x94R3\xd0\xa1J\xc6\xac\xbc\x96\xce\
-\x990\xae]\x84\x0e\xf5\xcd\x8bs8lX\x83\x0e\x0d\
-\x16\xe9\xbc)&\x1az\xfa\x9eA@L-\xca\xafN\
-v\xb6\x95Rm\x08\x0f%\x06\xf3r\xa0\xb7\x85V\xa9\
-\xcc3\x08\xbc\xba6\xd9]\x17\xe7\xcc\x91=gE\x19\
-\x1b\xf4}\x9c\xae/\xf21\x99'= T\x85\xbd~\
-\xdd)\xa5\xa6\x11<`T\x94R\x1d\xb2\xf9\xacac\
-\x95\xea\x0b\x94\xc7\x94\xe7y-\xe38\xa0\x09\xbc-\x8e\
-\xd7\xc8V\xae\xcb$i7\xe8\xfbYy\xef,uQ\
-\xf3<\xafN\xf5\xb7D?\x9b\xc7\xfc\xd0\xa9\xa5\x9eC\
-\xedC\x84[\xe7\xe97[y'\x00\xcc\x09s\x96\x95\
-R\xd6\xf0l\x16;\x85\x0d5P\xe4\xc2(\x83y/\
-}\xdb\x92\x96A\xd87I\x11\x93\x12\xd7\x05\x95\xad^\
-.\x97\xb7\xf4\x14\x80C:8Om\xf0\xe0\x0ei\xf3\
-V\xb8\xd3\xf9O\xc2\x14\x16\x9b4\xce\x9b\x94\xe12\xa5\
-\xd4$t\x87\x94dX\x010G\xbf\x99`\x12\xf0\xcf\
-\x13\xbf- \x18\x84\xd9\x96i\x8b\xf7\xd8\x8e\xf1L\x1a\
-\xc2\xce\x89\x88s\xe4|\x94\x0cS\x16)\xbf\x99\x08\xbb\
-\xb9\x8c\xe3d\xeb\x9c(\xcb8\x04\xc9\x08\xc2\x90\x04<\
-I\x03nR\x14\x11&\xaeq\x84\xeb+\x0e\xd3\x08\xd7\
-\xe5\x04\x11)\xdb7mI[~\xb7\x81\xdbM\xc9\xf8\
-+\xff\x97\x0f6\xfc\xa0\xb2\x80p=s\xfb0C\xc1\
-\x13\x16\x9b\xd2\xd4Wf;\x05\x98\xbc\xfc\xdf\xa8=\x98\
-\xf7r\x1c:\x9cmz\x8e\xb1e\xa069c\xd8\x91\
-\xa5\x8c\x0e\xdb\x00\x8e\xd4\x06\x8f8\x0f'D\x12\xd4\xf9\
-*t\xfc4\x85\xf0N\xd3\xf7\x8a ,\xfe;/B\
-}\xfc\x94o\x92Q\x11\xfaI\xb9\x00`\x14\x9aHK\
-\x22-\xee\xe8g\xc59!\xcf\xa9\x17\xe8\xe9\x9f=\xc9\
-9\x9a\x7f\x99\xb6\x10\xdc$\x02oq\x94\xf2\xe3\xa7\xe4\
-I\xcb`\xd5\x22{xAF\x85\xcb,\xae\x1b\x07\xfc\
-\x81\xbcJ\xd7\x8c\x89zi@\x93K\x89<G\xf6\x9c\
-\x16\xe9\x9c\x90'E\xe0\xfa:\xc3\xf9*\xa5\x8aT'\
-\x91\x8bH\xa0\xef\x13\xd7#\xd7\x9f$\x16\xae\xf3)q\
-o\xad\x0bo\x04\x98\x00*\xc6\xdfE\x916\xd7\x1b?\
-\x5c\xb0GR\x17\xf5\xc0\xe5\xb4=\xf4\xd4\x8cs\xb8\xbc\
-\xf3\x08\x97w4f\x11M\x16;\x19E\x00\x0d\xb2\xf5\
-\x0c\xddKn;\xb2\xed.\x22\xf0\xe8\x12\x95\x81\xfe\xe7\
-2\xcf\x96\xcbeN\xcb\xb4\xc1a\x87`CH\xad\x10\
-\x81\x9d\x92_\x8e\xe0\x81`\x9e\xc3\x83\xf4\x97\x09\xabD\
-\x1d\x95\xcf\x93a\x93\x9aq\x8eD\x83\xd2j\xcb\xb48\
-/\xfa;\xc1\xe7dY\x91\xe9y\xde\xac\xe7yc\xd0\
-\x03u\x1dz \x993\xbc$\x1e\xdcf\xd9\xeb#\xa2\
-\xe0\x81\xdd\xf4\x22\xe6\xc9\x9eE\x04\x0f\x00L\x16<(\
-I\x0f\xb4H\xe5Z\x22b\xed\x88<\x93.Vi\x0b\
-BO;\x17\xd8\x10!\xc4\xd0\xb5\xe4!\x15)\xfdY\
-\xc0\xbf\xb7\xb1\xf3r\x9e\xe75\xe8\x1c\xbe_\xe3\xd0\xf5\
-\xb5\x08}\xafK\xe27\xb3\x1e\xab\xa2\x1e\xe6\x8c\xdf\x18\
-\xb2\xbc\x99\x07\xfa\x8cv\xfa6  #\xbe\x96C\xf6\
-~\x18\x1c\xc0l\xc62\xf0\xf9\xb3\x00P.\x97\xdbH\
-\x7fo\x1d\xb6\x09\x06Fj\xc4#C\x85Ba\x88\xf2\
-\xd9\xf57\xe5\xf2\xf1\xef\x7f\xe8h\x11\xc0.\x00C\xf4\
-{.\x84#\xb8\xcb\xcf\xef\xfb\x1f:Z\xfc\x9br\xf9\
-\xb8\x91\xdf\xd0\x06\x13\x5c\x96\xc5\x04\xe65Qi\xb4\x13\
-\x9c\x13\x0b\x9ao\xe29\xa7\x8eRj\xc1\x12\xc2\xec\xe5\
-M\xc8\xf4\x16=\xcf\xab\xd1\x13\xfd\x22\xb4\x97dzl\
-I\xcb\x97\x06[}e^\xd4\x80\x9e\x04\x8b\x00\x8a\x82\
-\x18\x1a\x08\x87\xfbJ\xe2<`\xf3\xea\x22\xad\x9d>\x22\
-B\xdb}\xb7\x13z\xc0\xe3\xfa\xc8R\xf7\x0e\xdb\x0c\x03\
-Y(B\xa41\x04\xfd\x1e\xdc\x10\x80\xc2\xdfW\xca\x8f\
-\x1d\x1c\x1ey\xa6\xd3\x19\xb9\xfa\xb7\x1f\x1a\xf97\xff\xe2\
-\xff\xb6\xfe7\x80u\x00\x1d\x00\xeb\x85B\x01\x9d\x8c/\
-\x92P~\xa1<\xff\xf6C\xa5\x7f~\xe4\xc0\xfe\xbf,\
-\x14p\xf8\xef+\xe5\xdf\xfc\xf0b\xf3y\xce\x0b@\xa7\
-P(\xacg\xcd/%\xb8#\xda<\x05>fv6\
-sP\x8a\x1a\xa4\x8a\x22\xfd\xcc\x03\x19y\x0e\xb3\x80?\
-\xe1?#\xc2m\xe8\xe3}\xac\x16t\x19\xcd\xb0b\xd2\
-\xf2e\xc1\xe2\x16}\x7f\x8c\xefq\x96\xb2\xf2\xb5\x13\xd0\
-u\xd9B\xe0\x91T\xe8\xd3\xb2\xbcCh]|2@\
-d\xb53\x0a}\xb7\x13c\xa1\x93\xec/\x0e;\x14\xb9\
-{j\xd2S\x82&\xcd\xe1WN\x95?upx\xe4\
-\x19\xfd;\x0e\x1f9\xb0\xff/\xbf\xfbK\x0f\x9f\x04\xb0\
-\x9b\xcecO*\xb5\x07%\x08\x94\xd3\xd9\xfd\xdd_z\
-\xf8$\x13\x1a\x00\x1c\x1c\x1ey\xe6\x95S\xe5O\xb1=\
-\x22\xbf\x8d\x08\xbf\xce\x83\xc22r1\x04yC\xec\x11\
-q\xc7\xe7'\xd8\x09\x9e\xd0\xa7\xbf\xfe\xcaDz\xa2\xe5\
-\xf3\xe4\xe4\xf8\xb4q\x8e\x04\xa7UBx\x95#\x94R\
-U\xc3\x93\x8a#a+(\x8d\x05\xb9\x08\x81\xd2\x94+\
-\x1c\x81\xf0\x82\x92\x22_\x8b\x98'\xf8\x14\xe0\xf0\x97\x9c\
-{\x84Rj2\xe2=\xb9\x8d\xf6f\xb8\x0eJ\x5c\xdf\
-\xf47\x89\x1d~\xbb\xe0\xefD\x0cm\x04\xabke\xdd\
-\xd9\xea\xb9\x98\xc3\xab#\xbd\x96\xf6\xa7\xb53\x0a~(\
-\x93m\xa6r\xf0}M\xdbN\xb8\xee'\x01\xa0\xd9l\
-\x96\x90\xa2};l/\xe4:\xa8[\x08m\xf7\xdf\x9d\
-<\xf1\xa9\xe2\xee\x91\x99\xf0y8\xfc\xc1\x83w}\xff\
-e\xef!&6I4\x89\x89\xcd \xb4a\x00\xbb_\
-\xf6\x1e:\xf9\xc1\x83w}\x9f\x09\x8dQ\xdc=2\xf3\
-w'O|\xca\x92\xdf@\x89\x8d\xe2\xf7\x1c\xef\x9f\x14\
-s\x1c\xfe\xb2t1\xc7\xc2K\x93\x8b\xd0\xab\xbc:\xd0\
-\xab\x05\x8b\xd0\x03\x04\xcf)\xf0\xdf\x09\x91\x1e\x0f$\xb6\
-\x05\x1e3t\xce\x12hI3\xbdR\xc0\xbb\x80\xcc\x89\
-tx\xe0`\xd2+)\xa5\x96\xe9\x135\xa8\x8d#X\
-\x99&\xe7plv\xb7\xa1\x07\x94e:\x8f\xc9x6\
-\xc5\x13|\x17\x88\xc8\xb9\xec3F=\xcb\xf6\xe7\x87\xc3\
-T\x7f/a\xa7\xb5\xaf\x85`\xfer\xce\xa8\xa3^`\
-\x92*A\xcf\x1f\xc9\x87 \xdb\x8aB\x9e\xa7\x1cGP\
-\xcf\xcb\xd0\xabL#W\xa7F\xd8\xddF\xe0\x81\xf5z\
-\x09;\xad\x9dqyr]M\x0b\xfby\x11U\xe2E\
-L\x04n\x7f\xd5f\xb3\xc9\xfd\xa0\x8b\xd4\x9a\xcd\xe6B\
-\xb3\xd9\xec\xd0\xee?\x0e\xdb\x14\xb9\x0d\xe8\x06\xa1\xed\x06\
-\xb0\xfb'\x8f\x9c\xf8\xe4\x83#{\xff\xc4v\xfe\xae\x02\
-\x0e}\xe4\xd0\xdd\x7f1\xff\xcb\xc72yl6\x0fm\
-\xfe\x97\x8f\x9d\xfc\xc8\xa1\xbb\xffbW\x01\x87l\xd7<\
-8\xb2\xf7O~\xf2\xc8\x89O\xb2}\xd88b\xabC\
-\xcf[\xc9\x0e\xdd\x86^\xb1u\xc68\xfd\x0c\x82N\xc8\
-\x98\x95!5\x22\x093\xbdE\xe8p\x93y-\x8c\xf4\
-\x1a\x94\x07/T8\x8d\xf0\xe4:\xdb\x95x\xb1\x08\x95\
-\xa1\x86\xee\x01\xabn\xd8\xdd\xa2\xbcm\xf9M\xa1OP\
-\xb8\xb4\x86p8w\x1eb\x11\x02\xd9 \xcb\xb6a/\
-\x16\xd3JK\x19\x0e\xac!\xc1\xe2\x0c\xe1\xedDyd\
-\x90\xc7\x89\x14\xce\x18y\xb5\xa0\xeb9K8\xd2\xacS\
-k\x9d\xa5\xb53\x0e\xd4\x1ej\x08\x87\x0b\x1b\xd0\xab\x82\
-S=\xfc\x88v!\xd3\xb1\x11\xe3V\x9f\x97uH\x80\
-\x5c\xf6~\xb4yh?\xfe\xc8\xd8'\x8e\xed\xdf\xf7\xb5\
-^i\xde\xee\xe0\xda\x8f\x97\xaf\xfe\xca'_\xbb\xf4\x0a\
-\x80\xf7\x00\xdc\x02p\x1b@\xe4\x9c\x97\xcdC\xfb\xe6\x89\
-\xa3\x8f<:z\xf8\xe5(B\x93\xb8\xb8z\xe3\xb3\x8f\
-\xfe\x9f\xa5?\xb5\xe4\xb7\xde\xeb\xda~\xb0\xd1\x0b0\xe9\
-\xe5\xeb\x22\xf4@\xe0V{m2h\x9eR\xbe(^\
-\x81~\x9f\xac\x08\xe0\x8c\xf0l\x1cr\x86R\xaaT.\
-\x97[\x80\xbf\xcb\xcf\x02\xb4\xb7V\xa3\x87N\x87m\x8a\
-\xdc\xf7~\xb4\x11\xda_}t\xec\xb1$\x84\x06h\x8f\
-\xed\xd1\xd1\xc3/?w\xe2h\xa2P\xa4\x8d\xd0\x9e;\
-q\xf4dRB\x03\x80c\xfb\xf7}\xed\xaf>:\xf6\
-\x98%?\xf7\xde\x9e\xc3 \xe1\x87\x9f-\xa1eGh\
-\x03\x82\xd2{\x93.Qh\xd1\x0ce\xda\x22\x1b\x0e\xdb\
-\x18}\x0d\xe2Q\x84v|\xef\xbe?N\x93\xce\xae\x02\
-\x0e}l\xf4\xf0K\x11\xc4\xe6/\xfb\xb7\xe5\xf7\xdc\x89\
-\xa3'?6z\xf8\xa5\xa4\x84\xc68\xbew\xdf\x1f;\
-bs\xd8`\xcc\xa3Gh\xd9!\x7f\xd0\x03C\x1d\x96\
-P&\xcdy;\xec d\x0e?\xe6Eh\x12\xb7;\
-\xb8\xf6\xd7\xcbW\x7f\xf5\xd3\xaf]\xfa\x19\x82\xd0 /\
-\xfbg{\x87\xd0'\xa1I\x9c\x7f\xf7\xc6\x7f\xfdW\xff\
-k\xe9ylp(\xd2\xc1\xc1\xc1\xc1\xa1\x7f\xe4\x12~\
-4\xde\x0b\xdb\x85\x1c\x08\x0d\x88\xf5\xd8\xe4'7B\x03\
-\xba<\xb6]\xa0w\xdd\xb6\xc9\x0e$\x0e\x0e\x0e\x0e\x0e\
-\x02\xa9=51\xa7\xc5\x1e\xd3\xc8\x8f?\x92|\x0e-\
-\x09\x84\xc7\xf6\x0a\x02o\x0d\x9c\xe7s'\x8e>\x92\x07\
-\xa1I\xd0\xe2\x91\xe7\x01\xac\x89<7\xea\x05m\x07\x07\
-\x07\x07\x87\x0c\xc8\xc3Sc/m\x17\x80\xe1\xa7\x8e\xbf\
-\xff\xe1<\x09\x0d\x08<\xb6g\xc6\x8e\x9c\x02\xb0G~\
-\x9e\x19;r*oB\x03\xf4\xe2\x91\xa7\x8e\xbf\xffa\
-\x04\xde!\x97\xd3\xc1\xc1\xc1\xc1a\x9b \xeb\xa2\x08?\
-\xf4\xf8\x93+\xef\xae\xde\xea\xdcZ\xc9\xd1&\x00\x9a\xd8\
->~\xcf\xc1\xef<}\xfc\xc1S\x00\xf6\x02\xd8\xfb\xf4\
-\xf1\x07O}\xfc\x9e\x83\xdf\xc9\x9b\xd0\x00\xe0V\xe7\xd6\
-\xcaO\xae\xbc\xbb\x0a\x11\x82\xcc;\x0f\x07\x07\x07\x07\x87\
-\xc1\x22\xed\xc0\x1dZ\xa8\x01\xed=\xed{\xe2\xd8}\xa7\
-~\xed\x81\xe2\x9f\xee.\x0c\x1f\xcc\xdb\xc0[\x9d[+\
-\xf3\xbf\xb8\xfa\x9f\x01`\xe2\xbe\xc3\x7f6\x5c\x18\xbe;\
-\xef<\xde\xeb\xdc\xba\xfe\xad7\xda\x9f\xf8\xe2\xc5_\xfc\
-\x14\xc0\x0d\x007!\x16\xaa\xb8\x10\xa4\x83\x83\x83\xc3\xd6\
-\x84\x19~\xccBj\xbcXc\x04\x9a\xd4\xf6\x038\xf0\
-\xdf\xde_<\xf9\xf8\xc3\x0f<=R\x18\xba+\x0fC\
-%\xd8\x13\x1c\x04\xa1\xadu\xd6\xdf~\xfa\x1f\xdfx\xfc\
-\xa9\xcb\xed\x9f\x01x\x07\xc0*4\xa9\xf1\xdc\xdamG\
-j\x0e\x0e\x0e\x0e[\x13y\xbf|\xed\xaf\x82|\xear\
-\xbb5}\xf1\xf2\xef\xdd\x5c\xef\xbc\xd3g\x9a]\x18.\
-\x0c\xdf=\x08B\xbb\xb9\xdeyg\xfa\xe2\xe5\xdf{\xea\
-r\xbb\x85 \xe4\xe8\xc2\x8e\x0e\x0e\x0e\x0e\xdb\x14\xb9\xbe\
-h\xfc\xec\x1bo\xb5\x9e8\xff\xfa\x17\x07Aly\xe3\
-\xe6z\xe7\x9d'\xce\xbf\xfe\xc5g\xdfx\xcbi,9\
-888\xec\x10d!\xb5\x8e\xf8\xcb\xfad\xeb\xd0/\
--\xdf~\xfe\xad\xabK_h]zbm\xbd\xb3\x9a\
-\x93\x8d\xb9cm\xbd\xb3\xfa\x85\xd6\xa5'\x9e\x7f\xeb\xea\
-\x12\xc8n\x04\xe5\xe0rA\xfcupppp\xd8\x06\
-\xc8\xea\xa9\xf1\xe0\xcf\x84p\x0bza\xc5{\x00\xde\x9b\
-\xbbrm\xe9\xf3\xadKOnEb[[\xef\xac~\
-\xbeu\xe9\xc9\xb9+\xd7\x96 lF\xb0\x9b\xc8m\x04\
-d\xed\xe0\xe0\xe0\xe0\xb0\x8d\x90\xe5\xe5k\xb95\xd6\x08\
-\xf4r\xfb}\x00\x0e\x98\x9f\x7f?zw\xb9>v\xac\
-62T\xd8\x9f\xaf\xd9\xd9\xb0\xb6\xdeY\xad.]\x9c\
-~qy\xa5\x09\xbd(\xc4\xfc\xdc\x00\xf0.\xc2\x8bD\
-r#\xb7<7)aq\xcd~$[H\xb4\xb4\xc5\
-\x0a\xd7\x96\xdf\x17\x00\xccG\xc8\xd9lk\xd0&\xb73\
-\x9e\xe7\x8dm\xb6-\x0e\x1b\x87~\xfb\x8dk7\xf9 \
-\xcb\xd8\x12\xa3\x12\x13\xfa\x9e5\xfc\xc8\x9e\xccmh/\
-g\x0dz\xc5\xe0\xbb\xf4\xb9\x01\xe0\xc6\x8b\xcb+\xaf\xd6\
-\x96.\xd6\xb7\x82\xc7\xb6\xb6\xdeY\xad-]\xac\xbf\xb8\
-\xbc\xf2*\xdb\x87\xc0^^\xed\xf8\x1e\x82P\xa4\x0cC\
-fF\xb3\xd9\x1c\xa7\x9d\xc1\xb7<H\xbdzn\xb3\xed\
-\xc8\x1b\xa4\xfa<\xdd\xfb\xcc\xd05U\x92\xee\xd9\xb6\xa0\
-2l\x98^\xdcf\xc3\xbcgJ\xa9J\xbfj\xdfw\
-J\x1d\x92B\xfcx\xef3\xfd\xf3;\x96O\x89~\x0b\
-\x8d#i\xd3\xee\x17\xc3\x19\xaf[\x87\xf6\xf28\xf4\xb8\
-\x86\xf0\xeaA\xff\xf3\xc2\xf2\xca\xab\xc0\xc5\xfa\xf4\xd8\xb1\
-\xeafylLh/\x04\x84\xb6j\xfc\x0dyg\x08\
-\xe6\xd7\xee(X\x04Kw\x0a\x8a\x00\xaa\x08\x0bE\xc6\
-\x82\xbc\xd7\xed\xae\xb35\x09-\xcayG,\x86\xb2\xdc\
-\xb3\x0a\xb4\xfaw?\xf7\xf1N\xa9\xc3\x0at?I#\
-\x81d\xd5\x00\xb4\x8c#Y\xd2\xce\x8c\xd4\xa4\xd6\xe9t\
-:\xe4\xee\xb1\xa7\x06X\xc8L\x1c\xc7f\x12\x9bAh\
-\xab\xc6\x87\x09\x8d_\xb6\x0eyj\x83~?\x8dD\x22\
-g\x10H\xcb7\xa0\xd5\xab\xdb\xf4\xfb4\xf4`\x0c\x04\
-\x0a\xd1]\xee\xba\x10\x9b\xac{\x9eWWJM\x02\x98\
-\x86nHm>\xde\xc3\x96\x19\xe8\x0e<k\x0b\xcdP\
-\x9aU\x00S\x9e\xe75\x8c<Z|<A\x19\xfd\xf4\
-\x13\x94\xbf\x03= q\x1dL\xd1\xb9\x93\xfc\x9d\xeb\xc3\
-\x92V\x8d\xeab\x9c\xea\x86\xd3\x0b\x95O\x94\xdb\xb7\x8d\
-\xca\xc6\xa1\xd91:\xaf\x0a\xad\xf8\x5c\x11y\x98\xf9\xcf\
-\xd19-\xfa4\xccz\xa7\xa7\xd9%\x00\xa3\x9e\xe7\xb5\
-)\xddi\x90\x90+}\x9f`9\x1a\xa3\x0d\xb0\xbay\
-K\x94\xa7F\xd7\xf3\xefg(]n\xbb\x0bJ\xa9\x96\
-\x19.\xa32N\x8a|\xe6\x00\x8c{\x9e7*\xbe\xb7\
-<\xcf\xab\x89\xb2\x8f\xd3\xdf\xd3T\xbe9:\xc6yO\
-\xb1\x18-\x85\x97\x1aT\xb7\x5c'g\xc5\xefI\xeb+\
-\x91\x9d\xf4\xf1\xef\x99\xa8W\xae'\xff^\x01(*\xa5\
-\xce\xd9\xee\xa3\x91wd\x1d\xda\xda\x8d\xf8-\xf2\x9e\x19\
-\xe9\x17\x8d:\x9c\xf7<\xef,\xb5\x91sd\xd7<\x9d\
-w\x8e\xf2\xa9S\xd9*\x08\xdac\x9b\xf2h\x88\xba\xb5\
-\xf6+\xea\x0fl\xdb8t\xfb\x19g\x1b\xc8\xf6\xb1\xb4\
-\xea\xe2\x96z\xe1\xbe\xb4\x10\x93vI)\xb5\x04{\xfb\
-\xe8\x1a_\xa8\x1ch6\x9b\xdc\xb6\xa6\xa9\xec\xa3\xd2\x86\
-L\x0bEh\xb0\xf7W<\x22\x08Ar\xe8\x91I\x83\
-_f^}a\x13B\x91\x11\x84\xf6\x0e\xbaIM\x86\
-\x1ecU\xb7\xf3\x025\xd4\x05h\x81\xc8\x02\xf4\x8d)\
-\x22\xe8\x88U\x00\x13\xd0\x83]\x01\xba\xf1\xcd\x98\xa1\x10\
-\xfa>\x07\x1a\xc4\xe9\xf044\x91\x15\xa0\x07\xa0\x12\xe5\
-\x17\x09\xea\x94\xd6\xf86u\x84iP\xc7\xa1<g\xe8\
-{\x01\x9ax\xe6\x22\xf2\xa8B\x0f4\x05:\xb7Ma\
-\xa1\xd8\xf2\x0bT\xe8\xf7\xb3\x94gI\xd4\x87<w\x0e\
-zP\xe02O*\xa5\xc6\xa9\xa3\x9f\xa12\x16\x0c\xc2\
-.\xf1q:gR)U\xa1\x01\xce6\xe7\xc2\x9d5\
-*\xffYa\xab5dE\x1d\xba\x85` \xe3A\x89\
-\xbf\x97@\x9d\x97:\xf6\x04\xf4@P\x80\x1e g\x8c\
-$'\xa0\xebn\x0c\xba\xfe&E\x99\x00Mr\xb6\xf9\
-\x9f\x06\x80\x8a\xb8g<\xf0\xf0@X\xa1\xfcd\xd9\xeb\
-T\x87\x8bT\xde\x2249\xb3mf\xe8z\x12A\x1b\
-i!\x18L\x81\x84\xf5\x95\xd4N\xf3\x9eQ_\xa8A\
-\x13e\xc1 \xad\x09D\xdfG\x884\xa2\xea\xd0\xdan\
-\xc8\xae$\xf7\x8c1-\xd2\x19\x85\xee\xa7Uj#S\
-\x00\xa6\xa9\xdcU*\xa3$\xfcq\xe8>\x1f\xea\x7f\x09\
-\xfb\xd58\x82>Y'\xcf\xaa\xc1\xe9e%4*K\
-h\x1c\xe9\x91\xf6\x04,\xed#j|!\xc5rF\x15\
-Z\x0f/Dh@\x1f\xef\xa9\x19\xc4\xc6\xab\x1fm\xc4\
-\xe6\x13\xc8F\x12[D\xc8\xd1\xe6\xa51\xa1I-\xb5\
-\x8d\x98\x03\xab\x00~#\x00y'u\xe8\x1b\x0d\xe8\x86\
-7\xcbO.\xd4)\x17\xc5\xef\x80n\xac\x0bt\x9e\xec\
-\xb4\x8b\x08:^\xcb\xf3\xbc)\xf6~2\xa0Dy\xf8\
-OQd\xc3<?\x19R\xder\xa0\x96X\x84 U\
-\xcf\xf3j\x94N\xaf\xf23\xa6D:\xf2\xfb<\xf4\x13\
-w\x89H\xb7\xc8\x9d\x9e\xd2\x9f\x8f\xb0G\xa2%\xf2o\
-P\x19\xe2\xc8_\xd6\xf3<\x9fK\xf9\x97\x8c\xfc\xe3B\
--\x8b\x08\x06\xea\x09\xe8\x81\xd5F&<\xf8\xf2@P\
-\x030n<<\x9c\xf5<\xafM\xe7$\x0e\xef\xd0\xf9\
-mJo\x02\xba\xec\xb3\x22}\x9f\x5c\x09\x0d\xa3\x8d\x8d\
-C{\x12\xdc\xaej\xd0\xf7\xb9\x22\xce\xa9\x8b6\x93\xa9\
-\xbe2\xd8\x99\x04\xd6\xfb\x98\x02q\xed&\xc9=cL\
-\xd2\xef]\xed\xdf\xf3\xbcy\x04\x0f\x0a\xfey\x02\xb2\xff\
-1\xd9\xf9Q\x84\x1e\xfd\xaamI/\x0b\x16\xc4|\xda\
-R\x86\xeb\xad\xed\x03\xc9\xc6\x97z\xb9\x5c\x96\x0f]>\
-\xb2\xce\xa9\x01\xf0C\x91qsO\xb69\xb6\xa5\xdb\xb8\
-\xf8\x95\xaf\x8c\x1d\xfb\xdc\xa0B\x91k\xeb\x9d\xd5\xcf-\
-]\xfc\xcaK\xcb+K\xd0\xc4e\xce\xa1m6\xa1\x01\
-\xba3\x9aD\xd3Fpc\xa3~\x97\xe0N.\x07\x12\
-x\x9ew\x86&\xb8\xe7\xe8\x9aY\xd1x\xd2\xa2*\xf2\
-\xe0\xc1\xa3\x04`B\x84g\x18]\x1d\x97\xc2%\x8b\xd0\
-O\x9d%\x04+\x9ez\x95?\x0dJ\xd0\x04g\xda\xb3\
-\x91\xab6\xd3<\xdd2\xa9\x8f\xd3\xff\xf3\x08\x9e\xca\xcd\
-z\x9e\xb6,r\xe1\xb0r\xbfhP\x1e<\xdf\xc1\x0f\
-M\xe3\xd0O\xfa2\x0f\xbf|\x22Z\xe0\xffN\xa1-\
-\xb6-\x09\xd2\xd4W\x1a;7\x1b\x89\xee\x99\xa8\xc3s\
-To\x0cY/\xb3\x08\x1eZ{\xd5\x17\xa7\x9d\xa4_\
-\xb5s\xaa3\xeb\x9cZ\x0eH2\xbeD\xda\xdf\x17\xa9\
-\x01\xb1\xc4&\xc9,\xa4\x92=\x5c\xc0\xad~\xf3\xed\x05\
-\xca\x83=G\x7fE&\x82\x0d\x8b7\x93\xd0\x00\xbbW\
- \x1b~\xd4\xef\x12\x0d\xe8\xd0\xcd9\x0a[\xf8\xe1\x09\
-\xfe\x9f\xe7\xdb\x94Rc\x19\x1br\x8d\xf29\xa7\x94j\
-\x109\xb6@\xf1\xff$\x09P\xc3\xe7\x90\xda\xb2R\x8a\
-Cpq\xe5O\x83\x16tG\xed\x0aEl \xd2\xac\
-\x90k xXh\x10!\xb4\xa0\x9f\xc8[\xe2>\xb5\
-@\xf3(\xf9\x9a\xea\x83\xc9\xb5\x04\xfd4\xdf\x80\x0e\xfb\
-,\x22\x1cz\x0c\xc1\xf3\xbc\x96I`\xc2\x13Iz\xff\
-\xd2\xd4W&;7\x09\x89\xee\x99\xa8\xc3\xd31\x0f\x9c\
-\x93\xd0e\x9dPJ\xd5{\x10\x1b\xd7\x7f\x9e\xfdj\xb3\
-`\x1d_\x92\x0e\xcf\xb9l\x93\x15\x13\x8a\x94K\xfdo\
-\x02X\xfb\xc4}\xa3\x0f>Y\x1a\xec\xbbk#C\x85\
-\xfdO\x96\x8e\xd5>q\xdf\xe8\x836\x1b\xb0\xf9\x84\x06\
-Pg\xa4\x89U\x1e\x14\xaa\xd0O\xed\x00M\xb2\x1b\xb1\
-\xfa\x8a\xf8\x1d\x08\x06\xc0\xb3\xd0O\x87\x15\x0a\xc7\xcd\x88\
-A\x86\x9fp\xa3\x9e\xa0{=Y\xb7\xa9\xd3\xd5\x10\xcc\
-\x9b\xcdCw\xb4I\xb6\xdd\xc8\xd3\x87RjZ\x94\x81\
-\x07\xb2R\x82\xf2'\x06\x91f\x9b\xd3\xa2\xf4\xaa\x22\x14\
-\xc6\x0bO\x06\xb54{\x91\xf2\xe79\x81qt\x87Q\
-\xa5\xbd<\x88\xf1\xca:  :9\xc0\xcd#\xdc\x06\
-\xd2.Qo#\x9e<\x1a\xd0\xdeN\x05D\xae\x08\xe6\
-6zy\x06\x0d\xe89^\xbe\xe7\xd3\xd0\xed1\x09\xc9\
-\xa4\xaa\xaf>\xed\xec\xf7\x9e\xf7\xaaC\x13i\xee\xd9,\
-D\x1d*\xbd\xf4\x9d\xfb\xd4$\xf4|\xf2\x19>\xcf\xb8\
-\xb6\xa2\x82%\xf43\xd0\xfd\x94\xbd\xd8,\xfd*m9\
-\xd3 K\x1dv\x8d/\xc6\x9cZ$r\xdb\xfb\x91H\
-\xc1Fn\xfe\xe7\xb7\xee\xbd\xf7\xa1/}\xe0\xfe/\xef\
-\x19*\x1c\xc8+\xdf(\xec\x19*\x1c\xf8\xd2\x07\xee\xff\
-\xf2o\xdd{\xefC\xa6\x1d\x08/\xdd\x1f\xf8*G\x00\
-h6\x9b\xf2}\x8e%\xea\x98g\xa0\x1bg\x07\xc02\
-D\xac\x9b\x9e\xf4\xe6\xa1=\xa4\x0e\xf4\xa01e{Z\
-\x13\xa4\xc3\x0d\xbf\x05`\x99\xae\xe3E$\xb6\xce\xdf\x02\
-P\xb5\x84J\xba@\xf6\xb4\x00\xcc\x89\x89\xec\xaa\xb0\xbd\
-\x15\xe1\x09\xb6\xa0\xc9\xb0\x03\xbd\xea\xaf\xe1y\xdel\xaf\
-\xf2g\xc0YN\x8b\xd2\xab\x88\xf9H\x9e\xb3Y\xca\x18\
-\xfb\x8f\x85x\xb0\xa8\x8a{\xd5kpg\xdb\xe6\xc5\xf7\
-\xa2\xbc\x8e\xc2\xb4\xb3\x08\xda\xc0\x5c\x82t%\xea\xd0\x83\
-\xa6\xff\x0e\x91a7\xe79/\xee]\x03\xc9\x96_\x9f\
-\x85\xbe_\xdc\xce*t\xac'\xd2\xd6W\x1fv\xce\x03\
-\xfe;UQ\x8b5z!\xb6\x0e-\xb6\xa6\xb9g5\
-\x84\xfb\xea$\x80\x06\x11\xe24\xa8>=\xcf\xe3\xf9J\
-\x93\x1c\x17\xcc\xba\xef\xa3_\xcdB\x93q\x87\xc95A\
-\x99\xe5\x9cZ\xdc\xb9\xa1\xb4{\xd8\x81\xa8\xf1\xa5\x5c.\
-'\xf26S\xef(\x12\x9b\x98^\xeb/w\x1c\xd9\x03\
-\xbd\xe3\xc8\xfe?8r\xef\xa9O\x1f\xb9\xe7\xd9Ah\
-\xae\xc5\xe1\xbd\xce\xad\xeb\xcf\xbd~\xe57\xfe\xf0\xf57\
-\x7f\x0a=\xa7\xc6\x1e\xdb\x86{iy\xee(\xe2\xb0\xb5\
-A\xf3\x99\xe6\x8a5\x87\x08\xb8\xfaJ\x0e\x95\xc3nB\
-\xdb\x11\x83\xdcQ$5\xa6?p\xff\x07\x7f\xfd\xc8=\
-\xdf\xd8hB\x03\x80\xdd\x85\xe1\x83\xbf~\xe4\x9eoL\
-\x7f\xe0\xfe\x0fnt\xde\x0ew\x0e\xe8\xc9\x96\xc3A\xfc\
-\xde\xcfN\x7fa73\x5c}9\x0c\x0ay\x93Z\xd7\
-\xe2\x90\xa7\x8f?\xf8\xe1A)V'\xc5pa\xf8\xee\
-\x89\xfb\x0e\xff\xd9\xd3\xc7\x1f\xfc0\x82E+\xe6\x8b\xe2\
-\x0e\x0e\xfd\xa0\x88 \xe4\xc4+\xd6R\xcf\x0f\xdeAp\
-\xf5\xe50\x10\xe4\x16~\xb4\x84\x1eG\x9e\x19;r\xea\
-\xe3\xf7\x1c\xfc\xcef\x12\x9a\xc4\xad\xce\xad\x95\x1f]\xb9\
-\xfe\xef~s\xe9\xf5\x9f\xc2\xd8\x16\xcb\xa9[;88\
-8l?\x98\xe1\xc7\x5cH\xcdBh\xbb\x9f;q\xf4\
-\xe4\xc7F\x0f\xbf\xb4\xab\x80C\xd9L\x1d\x0cnwp\
-\xed\xaf\x97\xaf\xfe\xea\xa7_\xbb\xf43l\xfe\x0aH\x07\
-\x07\x07\x07\x87>\x90\xfb\x9c\xdav\x224\x00\xd8U\xc0\
-\xa1\x8f\x8d\x1e~\xe9\xb9\x13GO\x02\xd8\x0dm\xf3.\
-\x00C\x05\xb7\x92\xc3\xc1\xc1\xc1a[\xa3/R\xdbn\
-\x84\xc6p\xc4\xe6\xe0\xe0\xe0\xb03\x919\xfc\xb8]\x09\
-Mb\xa3C\x91\x8e/\xe3A\xef\x90My\xc1n\xe3\
-\xa1\xef)\xd3\x9a\x01\x82=\xf0R\x5c7\x09\xbdK\xfe\
-\x96\x90\xe1\xb9S\x97o;l\x0dP\x1f\xac{\x9e7\
-\xbbUggr\x09?\x1a\x84\xb6\x0b\x03&\xb4\x9b\x9d\
-\xce\x8d\x9b\x9d\xce\x8d\xbc\xd3\xb5xl\x5c\x9e\xdc<\xb6\
-f\xb3Ym6\x9bR\xb80\xb5`\xa5\xc3\x9d\x01\xd7\
-6\x1c\x1c\xfaGjR\xa3\xc1^\x92\xda\xeeo\x9e8\
-\xfa\xc8 \x09\xed\xb3\xff\xf0O3\x9f\xfd\x87\x7f\x9a\x19\
-$\xb1}\xf3\xc4\xd1G\x10\x10\xdb\x10tQ\xfb&\xb6\
-r\xb9\x5c7\xe4\x11x\xdb\x1a\x07\x07\x13\xaem88\
-\xf4\x89\xac\x1b\x1a\xfb\x1b\x14\x7f\xe6\x81\xc3\xc5GG\x0f\
-\xbf<(B\xfbmu\xe1\xeb?Xy\xfbu\x00\xf8\
-mu\xe1\xeb_\xf5\x1e\xfa\xcc\x9eBa_\x9e\xf9\xec\
-*\xe0\xd0\xa3\xa3\x87_\xfe\xcc\x03o\x7f\xf4\xebo\x5c\
-\xbd\x02\xda>\x0b\x81\x08j&4\x9bM_l\xb2\x5c\
-.\x8f\xa9\x1e\x82\x95t\x9c\xf7q\xab\xd1\xf7e\xe8\xad\
-\xa5\xce\x8a\xefS\xd0[\xefT\x11\x08\x15\x9a\x22{\xa6\
-Pa\xcd\x16\xc6#\x9bf\x10\xec\xcd6\xe5y\xde\xac\
-\x0a\xc4\x04\xa5\x08\xe4\x19/,\xe0i\x15\xa8\xa4\xdf\xe7\
-\x10\xec\xe7'\xc5+\xadb\x9e\xbdk\xd3.\x1c\xe8\x85\
-\x85\x11\xa5\xe8d\x1b\x11\xdb\x13\xa9@\xab\xaeK\xb84\
-\xe2\xfcH\xb1V\x95\x9f\x18f\x5c\xdb\x88\x14\xb5T\x11\
-B\x93\x962$jW\x9e\x16\xa5\x9c\xa6\xf2\xf0^{\
-\xdc&\xaa\xd0\x82\x9dR,\xf3\x1c\xe5\xd9u\x0f{\xd4\
-[\x97\xf0\xa8\xdc7\x92^\xcc\x8ek\xdf\xb1\xf5n\xd8\
-\x11YG\xca\x22\x9aI\xca\x12\xb2}\xb3x\xa7l\x7f\
-\x80\x0e\xcb\xd5\xe2\xd21\xec\xe8%\x8a\xeb\x0b\x9b\xca\xf2\
-\xc4\xf4\xd1P\xa8\x5c\x05\x02\xb4c\xb4arT\xd9\xe2\
-\x84gy\xcc\xe2\xdf\xb2\xa8fl*\xb2\x84\x1fC\x9e\
-\xda\xd1\xdd\xfb\xde7\x08B[[\xef\xac\xfe\xce\xab\x17\
-\xbe\xfa\xbdk\xd7\xcfCoku\xf3{\xd7\xae\x9f\xff\
-\x9dW/|u\x10zl\xbb\x0a8tt\xf7\xbe\xf7\
-Axj\xe8\xf3\xc5\xecr\xb9l\x0a\x17\xc6\x09V2\
-\x16\xd1-\x84\xc8\xdf}\xf9\x0dj\x84m/\x10\xdf\xe4\
-\x9d\xcb\xf9\xba*\xc2\x02\xa3!y\x1a:\x8f;{\x83\
-\xce\x1bC\xd0qZ\xe28{\x9a\xa6\x17a\x15\xa8T\
-\x812/\xe7?/\xf2\xb7\x8ayZ+0lk/\
-aRY\x8e3\x88\xef\x8cL\xf2l\xc3\x84\xd2Z]\
-\xb6|\x93\x88\xb5\xf6-\x86\xd9\xa3m\xc4\x89ZZ\x85\
-&#\xca\xdc\xb3]\xd1\xf1\xb6(\xef\x14\x82Mwg\
-!4\xd3T \x95\xd3\xf5\xd2t\x8az\x93\xc2\xa3\xb2\
->\x22\xdb\xb7q}T\xbdK\xf4\xaa\xa3\x90h\xa68\
->\x01-\x82zV\x10K\xcdh\xbb\x93\x09\xd2I\x22\
-\x0a\xccB\xbcS\xa2\xde\xc7{\xf4\xd1$\x08\xd9\xa4b\
-DLE\x1f\x9b\x12\xf7lg\x93\x9a\x08=\x16@\xf3\
-O\xbf\x7f\xe1\x8d\x9f\xbf\xb2\xf2v\xae!\x13\xd2C\xfb\
-\xa3\xef\xb6\xaf/!,\x19s\xe3\xbb\xed\xebK\x9f[\
-\xba\xf8Gy\x13\xdb++oW\x7f\xff\xc2\x1b?G\
-0\xafV@N!\xc8\x940\x05$g\x01\xb4h \
-a\x95\xdf6\xe0ot*\xaf\x93\xf2\x13m\x04\x82\x81\
-]\x9e\x01\xc1\x14\x14lq\x9a\xf4?\x8b8\xb2\xd7c\
-6\xf0(\x81JS\xe0\xb4\xeei\xc5\xec\xacb\x9e@\
-\x8cp \xa5[B\xb0\x19t\xac`&\xd5\x07\xa7\xb3\
-\x88x\x1d\xb7$b\xad}\x8ba\xf6@\x9c\xa8e\xa4\
-\xd0\xa4\x814\xedJ\xca\x9c\xb0\xbdE\xfa]\xde\xaf\x09\
-\xba\xce\xb6\xbdU\x92z3\x85GC\x88i\xdf\x8c(\
-\x91I\x13\xbd\xea(j\xc3\xdf\x9a\x17l\xa0\x5cA\xa0\
-\x05\xc8\xf7r\x16\xe1\xb6\x1b\xb7qp/\xf1N3}\
-\xee\xb3\x91}4!L\x9b\xe2DL\xf9~\xfa6`\
-\x1bn]\xd6O\xf8\xd1'\xb6_\xf9\x7f\xff\xf8\xe7\xcf\
-\x97\x8f\xee\xff\x97\xc5\xc3_\xea\xd7 !\xf0y\x1e\xc1\
-\x8aD\xd6k\x1b\x020\xfc\xd2\xf2\xcak\xc8Qh\xf4\
-\x7f\xb6\xaf\xfe\xf7\xc7\x9a\x97\xfe\x1caB\x1bB\x9f\xe1\
-\xc7,\xa0p\x03K5\x8cC7|\xd0\xff\xfe\xd34\
-=U\xcd!\xec\x81\xb5(\x8d6\x80Q\xa5e_\x16\
-\xe8\xb8\xec\xa0\x0c\x9b\xa0 (}3\xe4\x01$\x17\xdd\
-\x8cJ\xb7\x1f1\xcf8\xe1\xc06\xa2U\x02\xba`\x84\
-y\x92\xe4\xdbK\xac5\x0e\x03\x1b\x14T2\xa1I\x00\
-\xc9\xdb\x15\xa5+C\xc7&8\xe4W\xa7k\xa3\xb6\xb6\
-JRo\x91u\x13\xd7\xbe\xd3 a\x1dE\x89f\xca\
-s\xfa\x15\xdf\xcc\x22\x0a\x1cw<)L\x9b\xe2DL\
-\x81\xad\xa7O\x97\x1aYH\xad \xfe\xfa{<>\xd6\
-\xbc\xf4\x83\xa7\xc7\x86\xf6\xff\xdb\xf7\xdd\xfd\xb9\xac\xc6\xac\
-\xadwVkK\x17\xeb\xa4X-u\xcf$\xa9\xed\x06\
-0\xf2\xd2\xf2\xca\xab\xbbp\xb1>=v\xac\xda\x0f\xb1\
-}\xef\xad\x95\xaf<\xbet\xe9\x07\xe8\xde\x13\x12\xe83\
-\xfc\xd8\x07B\xfaQtl\x12\xbaq\xf3\xf7*(<\
-\x03\xf8\xb1\xf0\x90\xc7,\xe2\xfdU\xe8\x01\xc2\x5c\xa6n\
-\x13\x14d\xcc@\x88\x1d\xaat\xd2\x1dQ\xe9\xf6#\xe6\
-\x19)L*<\xb5\x9e\xa0An\x1aB\xb5W\xc5\xcb\
-\xd1$\x11k\x8d\xc3\xa04\xaa\x92\x0aMJ\xf4lW\
-*\xd0\xed\xe3y\x19\x9e\xa7a\xccC\x87\x11Y\xb9;\
-j>\xb4\xdfz\xeb\xd9\xbe\x93 C\x1dE\xa1Ka\
-\x1e\xe9\xc47\x93\x88\x02wM\x11D\x5c\xd7\x0f\x22E\
-L\xa9\x9e\x06\xd6^7\x0a\xb9nh\xfc\xf8\xd2\x85\x85\
-\x17/_\xfdZ\x96k\x99\xd0^X^y\x15Z\x22\
-\xe6m\xf1\xb9N\x1fyl\xf5\x85\xe5\x95WkK\x17\
-\xebYC\x91/^\xbe\xfa\xb5\xc7\x97.,d\xb9\xb6\
-\x0f$\x11\xac\xe4E \x1c\x12\xe2\xc1h\x1c\xe1')\
-\xd9\xa1\xfc'k\xa5\xd4\xb81gP\x84\xbd\xb1\xf2\xa4\
-;\x8b5Z\xe7c\xc8V[\x87\x8b\x02\x0b\x9c\xf2.\
-\xecU\xa5T\xc9\xeb-\xe6\xc9\xb6\xc2\xf2=R\x98T\
-\xa4\xcb\xe5\xe0\x017\x0e|\x1f\xd8S\xb1\xe5)\xcb\x12\
-'\xd6\x1a\x85\xb4b\x98Y\xc4L#\x85&#\xecI\
-\xd2\xae|[L{E\x08\x92\x17\x9eD\x11E?\xf5\
-f\xda\xd0eGJ\xa4\xa9\xa3(,\x22\xdc\xfe*\x08\
-\x94\xa9\x93^\x1f'\xde\xc9\xe9\xf3<'\x87\xd5\xe3\xfa\
-h\x1bB,\x14\xdds\x8e6\xc4\x89\x986\x10\x84\xf3\
-\xf9\x9em;\x92\xeb\x97\xd4\xa40\xe8:\x80\xf5\xdf=\
-\x7f\xe9\x87\xdf~\xf3J*A>\x83\xd0n\x00x\x87\
->oG|\xf8\xf7\x1bY\x89\xed\xdbo^\x99\xf9\xdd\
-\xf3\x97~(m\x17\xe5\x19\x18\xbcd\x82\x95\xbe(\x22\
-]\xe3\xaf\xe4\x13\x83H\x1dz\xc2\x9bE1\x17\x8d\xeb\
-\xa5`\xe6\x04\xc4\x82\x15a\x0b\x0b\x0aN\xd2y\xe7\xc4\
-\xcfR\xa4o\x01)\xc2\x12\xf4\x14\xc8e\xec \x08q\
-\x011b\x9e\x94\xc7\x9cX\xb4\xe1\x7f\xf7z\x0b\x93\x9e\
-\x15\xe5\x98\x89\xb2\x97\xd2\xa9!,\xbej\xab\xbbs\xa2\
-,\x89\xc4Z-ye\x11\xc3L+fj\x15\x9a\x8c\
-8\xb7g\xbb\x12s\x95\x9c\x9e-\xfc\xd5@\x0f\x82\xea\
-\xa7\xde\x08q\xed;-\xd2\xd4\x91\x15\xf4\xe04\x05\x1d\
-\xba\xe3\xbe\x22\xe7:{]\xdfK\x14\x98\xd3_\x10\xf5\
-U\x8a\xeb\xa3\x9eV5XD\xd0\xcf\x1a\xe8\xe19z\
-1\x22\xa6^ 6\xbc \xc6\x0d\xbf\xde\x9b\xcd\xe6L\
-\xb3\xd9\xcc]d7o\xa4\x0d\xafq\xb8q\x18:\x0c\
-\xb8\x07\xc0>\x00\x07\x00\xdcE\x9f\x03\x00\xee\xaa?t\
-\xef\x99\xff\xf4\xc0}\xff\xa5W\x82\x16\x0fm\x15\xc1\xc2\
-\x90\x9b\xd0!H\x9e\xdb\xda\x05`D\xe4\xbb\x0f\xc0~\
-\x00\xfb\xff\xc3\xe8\xdd\xff,i(\xf2\x7f\xbc\xf1\x8bo\
-T/\xbc\xb9\x80\x80 %Yr\xbe\xfe|^^\xbb\
-\x8b\xb8\x1dE\x1c\xd4\x0e\x11\xc3T\xfa\x15\x80\xb3^\x86\
-\xdd^\x1c\xb6'v\xe4\x8e\x224\xb8K\xcf\xec6\xf4\
-\xc0\xff\x1eh\xd9=\x7f\xaa\x17\xde\xfc\xd1\xb7._y\
-6.\xbd\x08B[E\xe0\x89\xbdc\x1c\x8f\xfc-\xa9\
-\xc7\xf6\xad\xcbW\x9e\xad^x\xf3G\xa6\xbd0\xb6\xc9\
-\xa2O\xc7\xed\xdc\xef\xd0\x0f\xd4\x0e\x14\xc3dO\xda\x11\
-\x9a\xc3VD\xd6\xd5\x8fLl\xb7\xa1\xc9`\x8d\xd2z\
-\x17b\x05a\xed\xfc\x1b?\x02\x80_{\xff=\xbfa\
-&\xb0\xb6\xdeY\xad.]\x9c~1\x0892aI\
-O\xcd\xb6P\x84\x89\xa7\x03#\x5c\xf8\xc2\xf2J\xb3\x83\
-\x8b\xd3\xf5\xb1c5\x9b\xc7\xf6\xad\xcbW\x9e%\x9b8\
-\xfdw\xe9#\x17\xa50\xa992s\xc8\x03,\x86)\
-_\xd8\xdd\x96b\x98T\x06\xde\xf2mK\xec\x8d\xe9\xe0\
-`\x22\xf5\x86\xc6b\xdfG\x0eCr8p/(\x14\
-H\x9f\x03\xa0\x10a\xfd\xa1{?.C\x91k\xeb\x9d\
-\xd5\xcf\xb7.=9\x7f\xe5\xdak\x08\x08M~d\xe8\
-\xb1kI?\xc2!\xc8\xfd\xc6g\xdf\xc4=\x87N<\
-Y:\xfayIl\x14r\x94\x84fz\x81\xefZ\xf2\
-t\x1ak\x0e\x0e\x0e\x0e[\x18f\xf81\xb5\xa7\xd6\xe9\
-t:\x85B\x81I\x86=5\xf9R\xb6\x9f\x17\xc8\x93\
-\xaa^xs\xa10<|\xfb?\xde{\xcf\xd4\xcd\xf5\
-\xce;\x7f\xd0\xba\xf4e\x22\xb4w\x11\x90\x8c$4\xf6\
-\x9e\xd8s\xea\x884\xe3\x16tt\x00\xac\xcf_\xb9\xa6\
-\x00<\xf1\x87\xa5\xa3_\xd83T8\xf0\xed7\xaf\xcc\
-\x88\x90\xa3-?&3\xe9\xa99Bsppp\xd8\
-f\xe8Gz\xc6\xdf\xff\x11\xe1\x85#{\x11xP\xfb\
-\xe8\xfb\x1e\x00\xbb\xff\xf5\xa1\xbb\xeeo\xddX{\xe7\xfc\
-\xda\xda\x0a4\x81p\xf8O\x86\x1c%\xa1\xb1\xc7$I\
-M.T\x19\x11\xf9q\x9e{\xe9\xb3\xfb\xf8\xc8\xc8\xdd\
-\xa5}#\x07~x\xed\xed\x9f#\x98\xf7c\x22\x95\x04\
-\xda5\xa7\xd6\xe9t\x98\xb8\x1d\x1c\x1c\x1c\x1c\xb6(L\
-O-3\xa9Qb\xbd\x88\x8d\x09f\x0f\x02!N\xde\
-(\xd8$\x199\xbf%\x09Fzer\x8b.\x93\xd8\
-d\x9e{\x10\xec\xb8_@\xb0\xa0\xe5\xa6\xc8\xc7\x11\x9a\
-\x83\x83\x83\xc36G\xdf\xe1G\x89N\xa7\xb3\x1e\xb3L\
-\xdd\x5cL2\x8c`\xb5\xa5\x5c`\xc2D#C\x80Q\
-b\x9d\x9d\x98\xbd\x18\x99\xfc\xff%\x84\xf3\x00\x00\x06_\
-IDAT8m&5\x90\x1d\xb7,\xf9m(\xa1\
-\xb9%\xfd\xf9@\xa5\x10\x13U\xdb@d\x93\xb62\x9b\
-O\xfa\xceS\x8f\xb42\x89\xa3\xe6\x81\xedP\xd7@\xf7\
-n\xf6\x09\xaf\xc9\xed\x1em\x16\xee\x94\xd9\x94\xbew\x14\
-!\x12\xb0-\xef\xe7\xb0\x22\xbf\x07v\x1d\xe1\x9dA\xe4\
-\xb2|\x9b\x87f\x9d\xd3\xa2cf~kF~qy\
-\xcaE!\x03'\xb4f\xb3\xb9\xd0l6\x97\x9a\xcd\xa6\
-\xbfK\x05\xed\x16\xb0\xe5^b\xe4\x9d?\xb6Zz\x94\
-\xcer\xef3\x1d\xe2\xa0r\x10!UJ\xcd\xf1\x0b\xd1\
-\xf4\xc9m3sz\xfd\xa1k'\x18\xa5\xf70\x95y\
-\xf6,C?\xb6E\xd91\x88\xfcly\xe5]\xafw\
-\x1ar\xd9&+!\xb1\x99\xbb\x84\xf0\x8b\xcerI}\
-,\xa1\x89\xfcLb\xe3\xeb9\xach\xe6c\x12\xe8F\
-\x87\x1cK\x08t\xa1\xb62\xf2\xde\x16'\x97\xf4h\xd7\
-\xf8,\xfbE:\x84\xd1\x97\x08)\x91\x89\x94\x14\x1a\x83\
-\xdeV)\xaf\x01\x98\x15\x03\xcc<\xa5\x84\x0d\xe7\x19\xbb\
-m\x96g\x91\x7f\xe9\xc7\x8e^\xe8#\xbf\xae\xbc\xfa\xb4\
-\xfd\x8eG_\xe1G\x09#\x14)_\xd2\xbe\x85@\xa3\
-l\x08\xe10\xa1\xed\x93h\xd5\xa1\xb1\x0a\x93\xc1D\x17\
-\x92\x8fA\xf8eq\xfe\xc8e\xfb\x83\x9eC\xabCo\
-\x954\x1f\x15\xeeP1\x82\x8a\x96s\x93\x0ap\xfa\x22\
-\x84*\xd0kZD@\xb0\xbe\x10\xa5\x0av\xbf_P\
-J\xb5<\x12\x82T\xf1\x82\x82\x91B\xa1Q\xe9\x892\
-LB\x0bN\x9e\x16e\x1ag\xf2\xa2\xef,\xaa9\x03\
-\xbd%V(\x8d\x14(\xa9@d\xb3\x0d\xb1\x13\x86\xa5\
-\xce\x22EK\xa9LuQ\x1f\x0d/\x10h\xec%\xd8\
-(\x05&\xdb\xd0\xef\xab\xc9|J\xe4\xbd\xdb\x84F\xfb\
-\x16GU\x11\x22\xa4\xaa[@s\x91\xd2\xb7mKU\
-BXN\xa6\x85\xee\xf7\xd5\xd2\x08\x9a\xfayQx\x8f\
-\xf7\x1c\x9cF\x10\x1a\x9c\x94\xf6\xd0\xb1\xd3F\xb9BB\
-\x98\x08\x1e\xa6d\xde3\x08\xda}\xe4K\xe31v\x00\
-\x11\xf7H\x1c\x9b\xf2\xb4x\xa7Y\xce\x06,[\x84\xd9\
-\xf2\x82\xbeG2-\xee\xb7m\x04/\xeeO\xd11n\
-\xcfg\xbc\xb0(m&\x11\xde\x9d\x82\x5c74\x8e\xf0\
-\xd8x\x1eK.\xd2\x90\xe1\xc6\x9e!\xc7\x98\xfcl\xa1\
-H\x19\x8e\xe4\x0f\xe7o\x0bqn\xc4\xa2\x90\x16\xf4>\
-x\xd6'Z\x95LPQ\x9e\xdb%\xc0\xa9z\x88\x10\
-\x12X\x9b\x89\x854\xfd\x8dMy7t\xe8\x0e\xc2\x84\
-\x16)((`\x15\x0a\xb5\xa5g\xa0!\xec\x06\xba\x05\
-,Y\xe3+$\xb4\x9a\x11\x15\x04\xe2\x8e6q\xd14\
-\xa2\xa5\x15\xe11D\x09r\xda0\x0d\x12\xc4\xa4|J\
-\xc2\x06@\xd7c\x97\xe0\xa5\xcaI\x1c\xd5\x8b\x16!\x9d\
-\xa3kF\xc5=\x9e\x8b(C\x1d\xba~\xe2\xca\x1c'\
-h\x1a\x99\x17=\x0c4@\xf7\xc9\x0b\x14\x02\x8a\xe8\xbd\
-\xefcH\x08\x93\xda\x9bO \xa2\x1ds\x9f\x89\xd3\xda\
-\xeb\xb2\xc3([\xd7=2\xf3C@\xaa\xa3\x22\xbf\xae\
-6e\xcb\xcb\x92\x16@\xaa\x0a\xa2\xbf\xf3\xfc\x1e\xa7m\
-\x8a\xd2\xa6\x16\xe1\xddI\xc8\x95\xd4\x00+\xb1\x99\xe4&\
-\xc9\x8c\xdf\x0bKMh\x22?Il\xbcHD\x92\x9b\
-If\x9b\xb5\xca\xb1\x0e\xbd\x0b\xb7-\xac\x91DP1\
-\xea\xdc:\x0dX\xbdD\x08\x01\xdd\xf1\xf9w\x16\x00\x8c\
-\x93\xb5\x88\x13\x14dD\x09\x85\xc6\x82\xceo#\x08%\
-\xb5@\xa2\x8b\x94~)Mz= \xc5E\xf9\xa9\xb5\
-\xa2\xb2\x89\x96\xfab\x8d\xe8\x16\x89\x8c\xc3\x22(\x14K\
-\x83\xd7\x94\x17\xd6\xb9\x8a\x12\xbc\xccM\x1c5\x02\xe3\xd0\
-^\x01\xdbR\x83P\xb7\x96\xf0<oQ<\xf0,\xd0\
-\xc7\x0c\xab\xc7\x09\x9a&\xce\xcb\x06c^M>\x5c\xc5\
-\x89s\x02A;\x96\xf5\x9b\x05IEI\xf9\x1c\xbe\xdf\
-\xf5\xa8\xa8KB\xb4D\xbbm\x19\xdf\xfd\xbe\x9f\xb1=\
-\xef8\xe4\x16~\x94\x10\xa1A\x0e\xfd\x99/f\x03\xc6\
-6W\xfd\xbc\xe8L\xf9\x01\x9a\xacd\x9e\xb6\xfc\xf8\x92\
-\x0d]\x0aT.\x97[\xcdf\xb3\x0ezb7~N\
-#D\x99FL0N\xd19\x09\xe2\x04\x05\xfb\x11.\
-d4(\x0f\x16\xa9d\x22\x1f\x87Pb\x1e\x008\xdd\
-~DKe:=\xe1y\xde\x19Z\xf02G\xd7\xc9\
-A6\x0e\xb9\x89\xa3\x9a\x10\x91\x00\xffz\x0a\x1ds\xfa\
-V\xd0\xa0Y\xa7\x87\x8fsJ)\xf4\x1a\xb4\xb3\xe6e\
-\xe4\xcb\xdajU\x84\xe7j\xe3\xc49\x19\x1b\xb6\xdf\xa6\
-\xa7U\xde\xcf@O9\x94\xa0\xbd\xac\x8d\x08\x01\xf6\xdb\
-\x9ew\x04\x06Bj@h\xf3cD-\xc3\xcf\x93X\
-DZ\x91\xcb\xfe\xb7\xc0\x0e!\xb3\xd0\xa1\x09\xf3\xc9)\
-\x8d\xa0b\x9c\x00g\x9c\x08a\x16D\x0a\x0a\xe6\x84E\
-\xe8\xa7\xcc\x124\xd17\x10\xc8\xc6\x0cR\x81\xd7'\x04\
-d\x17-\xe5t\x12\xc3\x0b\x04W+\xd0s\x8dc\x09\
-\x07\xe3\xbe\xc5Q#\xeci\x99\xa4\x22\xbc\xf0\x9e\xed\x86\
-H\xc9\xf7\x14\x06\x90\x17\x1f\xaf\xa0\x7fR\xcaSh\xb3\
-'\xbc@*\x89W\x8cV7\x80\xd8\xfam\xcf;\x02\
-\xb9\x87\x1fm\xe8D`\xa7\xe4\x97\x14\x22$h\xceI\
-\xa4\x11T\xb4\x0ap\xa2\xb7\x08a\x12\xb4\x11\x1e$\xe3\
-\x04\x05\xb3\xa4g\x22\xa4\xc4L\xf5\xc3s\x15\xbd\x06\xb1\
-4\xaa\xca\x15Q_\xbe\xb8\xa5\x97L\xb4\xd4\xc4\x04\x9d\
-\xc7\x22\x91\x5c\xbf\x91\x82\x8dJ\x0b;\xce\x88A\x9c\xbd\
-\xd3$\x03m\x9e\xe2\xa86\x11\xd2\x06\x84\x80&t$\
-\xa1e\xf3\x22)\xdcX\x15\xdfY\xf44)\xe1\xf4\xca\
-+\xd4^\xbc@\xc8\xb4*\xee_\x16\x05\xecP\x9fI\
-p}\xafv\x1b\x0bjC2,[\x8aI\xaf\xaf\xbc\
-$2\xb6\xe7\x1d\x87\x0d!5\x87\x00b\xbeL\x1eK\
-,\xa8\xe8E\x08pz=D\x08\x13\xa2\x0e=\xe8t\
-\x94V\xaa\x8e\x14\x14\xcc\x92\x9e\xa5,\xbeh\xa5\xf0X\
-\x1a\x08\xc2\x91Q\x88\x14\x13\x8d8\xbf\x85@\xf8\xb0\x02\
--\xdc\xc9\x88\x13-\xb5a\x5c\x05b\x8d\xfe\xcb\xb8^\
-\x8c`#\xddG)R9\x07\xbd8 \x89\xd0h.\
-\xe2\xa8\x94\x96M\x84\xf4,\xd9\xb9\x1cQ?\x12</\
-\xccu\xb5\x80\xeeU\x9cq\xe8\x95\xd7,\x97E\x90\x02\
-_\xc3\xf5:\x89\x94\xe14\xb2O\xde\x9b^^\xa8\xcd\
-\x8e4`\x12\xe5z\x02\xba\xa7\x1c\xf2\xca\xcbDd{\
-\xa6\xf7eS\x098oG\xf4\xb5M\x96C:\xb8\x1d\
-E\xb67h\x90H\xbc\x0b\x85\x83\xc3V\xc2N\x1d\xbf\
-\xfb\x12\x09uppppp\xd8\xcap\xa4\xe6\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\
-\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xe0\xb0)\xf8\xffx\
- \xef\x90roHo\x00\x00\x00\x00IEND\xae\
-B`\x82\
-"
-
-qt_resource_name = b"\
-\x00\x0f\
-\x03)\xa2G\
-\x00t\
-\x00k\x00-\x00f\x00l\x00a\x00m\x00e\x00-\x00r\x00e\x00v\x00i\x00e\x00w\
-\x00\x17\
-\x06\x1a:\x07\
-\x00s\
-\x00u\x00b\x00m\x00i\x00s\x00s\x00i\x00o\x00n\x00_\x00c\x00o\x00m\x00p\x00l\x00e\
-\x00t\x00e\x00.\x00p\x00n\x00g\
-\x00\x0d\
-\x0fv\x18\xe7\
-\x00u\
-\x00i\x00_\x00s\x00p\x00l\x00a\x00s\x00h\x00.\x00p\x00n\x00g\
-\x00\x15\
-\x03=\xaa'\
-\x00s\
-\x00u\x00b\x00m\x00i\x00s\x00s\x00i\x00o\x00n\x00_\x00f\x00a\x00i\x00l\x00e\x00d\
-\x00.\x00p\x00n\x00g\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x01\x18\xaa\
-\x00\x00\x01y\xeb\x98\xf35\
-\x00\x00\x00$\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01y\xeb\x92w\xca\
-\x00\x00\x00X\x00\x00\x00\x00\x00\x01\x00\x00\x19\xff\
-\x00\x00\x01y\xeb\x92w\xce\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
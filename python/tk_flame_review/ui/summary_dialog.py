@@ -21,7 +21,6 @@ try:
 except ImportError:
     from PySide2.QtWidgets import *
 
-from  . import resources_rc
 
 class Ui_SummaryDialog(object):
     def setupUi(self, SummaryDialog):
@@ -1,28 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-#      by: The Resource Compiler for PySide (Qt v4.8.7)
-#
-# WARNING! All changes made in this file will be lost!
-
-from tank.platform.qt import QtCore
-
-qt_resource_data = "\x00\x00Fw\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x01\xb5\x00\x00\x00U\x08\x06\x00\x00\x00\xce\x99z\xeb\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x01\xd5iTXtXML:com.adobe.xmp\x00\x00\x00\x00\x00<x:xmpmeta xmlns:x=\x22adobe:ns:meta/\x22 x:xmptk=\x22XMP Core 5.1.2\x22>\x0a   <rdf:RDF xmlns:rdf=\x22http://www.w3.org/1999/02/22-rdf-syntax-ns#\x22>\x0a      <rdf:Description rdf:about=\x22\x22\x0a            xmlns:tiff=\x22http://ns.adobe.com/tiff/1.0/\x22>\x0a         <tiff:Compression>5</tiff:Compression>\x0a         <tiff:PhotometricInterpretation>2</tiff:PhotometricInterpretation>\x0a         <tiff:Orientation>1</tiff:Orientation>\x0a      </rdf:Description>\x0a   </rdf:RDF>\x0a</x:xmpmeta>\x0am\x05\x0b\x9e\x00\x00@\x00IDATx\x01\xed\x9d\x07\x9cU\xc5\xf5\xc7waw\xa9\xd2\x11\xe9,],\x14\xbb\xa2X\x12b7\x8a\x0d\x22Vl\x7fKT\xa4\xa8\xa0Q\x111\x88\xb1\xc5\x125\xc4\x02\xc6`\x0dJTD,\x88b,\x10Q\xea\x82\xc0\x22\x02\x02K\xef\xf0\xff\xfe.w\x9e\xf7\xdd\xbd\xef\xbd\xfb\xca.\xbb0\xf3\xf9\xcc\x9b\x993g\xce9s\xa6\x9c\x99\xb9\xf7\xdd\xc9\xde\xb9sg\x96uV\x03V\x03V\x03V\x03V\x03{\x82\x06*\xec\x09\x95\xb0u\xb0\x1a\xb0\x1a\xb0\x1a\xb0\x1a\xb0\x1a\x90\x06\xacQ\xb3\xfd\xc0j\xc0j\xc0j\xc0j`\x8f\xd1\x805j{LS\xda\x8aX\x0dX\x0dX\x0dX\x0dX\xa3f\xfb\x80\xd5\x80\xd5\x80\xd5\x80\xd5\xc0\x1e\xa3\x01k\xd4vOSf\xcf\x993\xa7\xe5\xfc\xf9\xf3\x1b\xec\x1e\xf6\x19\xe3\x9a\x0d%\xf90\xae\xa2\xea\x5cXXX'\x0cr\x19\xc6\x09]g\xea{\xc4\x92%K\xea\x95\xe1\xbaX\xd1\xac\x06\xf68\x0dd\xdb\xb7\x1fK\xafM\xe7\xcd\x9bw\xe8\xb6m\xdb\x1e\x80\xe3a\xf8}\xc49;;{\x19\xc1\x07\x95+W\xee\xd7\xb4i\xd3\x9f\x04+\x0fn\xf6\xec\xd9\x0f!\xe7\xcd\x925''\xa7]\xcb\x96-g\x07\xc9]PP\xd0z\xc7\x8e\x1d\xc3\xe8gg\x90\x9f'\x1c\xb7\xce\x9f\x12\x0eh\xdd\xbauAP\xb9\xdd\x0d\x9b;wn\xa5\xbc\xbc\xbc\xaa\xb4\xd7\x0e\xea\xb6\xda\xc8\x83\xa1*\xa0.-+T\xa8p=\xb2\xff\xd5\xc0\xfd!\xe5/\xa7\xde\xcf\x01\xff\xb9m\xdb\xb6\xcd\x08\xb7\xfaq\xf6\xf4t,\x1d\xee\xe9\xf5\xb6\xf5\xdb\xbd\x1a\xb0;\xb5R\xd2?\x03\xfc\xce\xed\xdb\xb7\x7f\x01\xbb\x13\xf1\x8eA\x13k&\xc8}\xf1\xbd6m\xda\xf4\x038g\x0aV\x1e\x1c\x06i\x9d\x913777\x1270\x85\x18\xbe\xc6L\xec\x93\xa8_\x0f\x92\x8eA\x13\xdc\xads\x0f\xc2\xef\xa9\xf3\x91\x82\x95Aw\x05m\xb2\x926\x9b\x9e\x8al\xd4\xcd\xfcWfG*\xe5\xf7\x902i\xe9p\x0f\xd1\x81\xadF)k\xc0\x1a\xb5RP8\x13ww&\xf7\xbb\x99\xe7*b\x0c\x16\xb2\xca\xbf\x00\xdf\x14c\xd0\x9e\xb0/\xb0\x0d\xe4\xd5\xc4?\xbfh\xd1\xa2F\xa5 R&XD\x0c\xd9\xd6\xad[\xd7\x07\x11\xa4^\x7f\xa4N\xce\x11+\xf5\xec]\xb5j\xd5\xba\x84\x07\x02\xbf\x06|\xedJ\xc7\xb1\xdb\x99\x12T\xb6\xbc\xc3\xda\xb4i3\x92\xbava\x07~ u\xd9\xebvi\xe5\xbd\xfd\xac\xfc\xe5W\x039\xe5W\xf4\xf2#9\x06\xediI\xcbd^\xc4DwX\xabV\xadt\xe4h\xdc,\x8e%\xa7q\xcc\xf5\x01\x06\xa0\x16\xbb\x83?\x93q\x91\xc9\xe4\xb9[;\xf2\xee%\xef0\xca\xcb\xf0M%|\x96Is\xb4\xc1Q\x18\x06\x8f\xa3\xc0S\x90\xe5.\xd0\x8b\xa0q\x1b\xf1\x07\x09\x0f\x85\xe6\x02\xc2g\xa0\xf9\x98\xa1\xf9\xe3\x8f?\xb6\xc0X\xddG\xba\x1b\xf95\xc8\xff\x81\xf8;\xd5\xabW\x1f\xd1\xb0a\xc3\x0d\xa4\xd7\x03w\xd09\x9e\x0b4j\xe4\xb7\x15\x02\xb8\x9b8\xa2\x9c\xd4\xa4I\x93\x95$\xe5\xbf_\xbe|\xf9(\xe5\xe1\xcc\x8eF\xf1\x0a,\x00n\xa2\xdc\xb9x\x19\x83\xc5\xf8\xcf0\xfew\xe4\xe7\xe7/\x15\x82\x1cG\x80\xaf\x114\x86\xeeC\xe05\xc7\x9fG\xbc\x05\xb0\xf1\xc8w\xe5\xc6\x8d\x1b;\xb0\xc3\xba\x0d\xf8q\xc0\xbfD\xe7#\xd0\xf9\x87\xe4;\xce\xd5\xd5\x10\x12G\xe0+\x83\xf7U\xc5\x8a\x15\x07\x83\xf3\xb5\x10\xa0?\x06\xd8\xa1\x8a\x13\xeeKZ;\xec\xf7\xd1\xcf\x9d\x82\xc9\xa1;=\x17\x95\xd1>\x9fd{\xf8\xbc\x0b\x9f'\xa0\xf1\x99\xf2\xa5k\xf2\xee\xda\xbcys\x11\xc9\x93\x05\xf3\xc8=\x82dc\x95\xc5\x1fD\xd9\x02\xf8\xf7E\x8f\x13\x84'\xb7`\xc1\x82|\xca\xfe\x85\xe81\xe4\xaf!|\x99p*\xf8\xb7\x12_\x8e,g\x10\x16s\xec\x8e\xdf\x04o?2\x9e\x02\xe7\x1fB@\x96\x03\x91\xf7Y\xa2;\xc8;\x99\x85\x84\xe8i'\xfd'\xa5\x89~\x01\xeeM\x84F\xff\x17\xc0\xa7\x03\xe9y\xe4\xbfE\xde\xbd\xc4\x1d\xc3\xec\xedC\xc8|\x03z\xbe\x87\xbcc\xf1y\x94y\x8b#\xdb\x1bZ\xb4h\xb1)\x8c\x0e)#\x9d\x9cN0\x08\xbf\x09>'\x11n\xc7\x0b\xfe0\xc1\x91\xf0\xff'\xf2*\x9eE\xdfh\x02\x8fW\x15G\xd7}\x08\x9a\x9a\xfeL\xfc\xff\xf0\xc3\xf1k\xa1s)a\xd2c\x22^}D\x0f\xa76\xbf\x1e\x19\xaeD\xae\xe6\x84_\x13\xde\x02\x5c\xe3\xa4.\xf1\xfb\x91\xf5-!Z\xb7\xfb4`\x8dZ\x09\xeb\x9eI\xa0),Z\x88\x0d\x83\xe0Q\x9fA\x138K\x93\x19\x13\x8c&]\x1dM\x1e'\x98\x1c\xc6\xee$&\x8d\xb1\x94\xab\xa24\xa1\x82\x13\x08O`\x80\x1f\xc5\x00\xbaA\x80\xb0x\x94\xab\x87\xd7D\xbe\x05?\x09_\xd5\xa5y\x10\xe1\xa3\x0c\xd8}\x99\x10\x06/]\xba\xb4\x1a\x06m\x02\xb0\x96\x0c\xd45\xf8\x85\xc4\x0f\x01\xff\x88\xf5\xeb\xd7W&\xbc\x83\xc9\xc4\xd9\xa9\x91\xb7\x99\xf46|\x90\x9b\x06\xf0,\xcaV\x86\xdeL\xe8\x7f\x00\xfe\x07\xc0\xc6\x22{\x81\xaf\x80&\x8cq\xe0\xfe\xce\x03oO\xbc=e\xcf\xc2\x10u\xc5\xb0\xcdr\xf3:I6\xbc\x9ei\xd5\x13\x8c\xb8\x82^\xeb\xd6\xadS\x1d\x8f&^]\x00\xe2\xa7\x22ks\xa22\x92\x9a\x18\x8f\x07\xf6\x0e\xbe*\xc9\xb5x\xe9\xe2\x14\xf4\xfc\x1b\xda\xe0\xf7<\xff\x1aG\xba\x13\xbe\x05^N\x93\xf5\x11\xc8=oWr\xd7/\xe9\xc1\xc0\xf750\xe2\xbd\xe0\xa3\xa3\xd4V\x82\x916\xba\xfe\xc5\xe0\x10:r\x13\xfe\x95\xfc\xfa\x06N\xbc#\x0b\x97\xc7I\xef/\x182\xd6\x87\xd6WD\x9d\x97jD\x8b\xf8\x1d\x84Z\x10\x08\xa6]n\xa0C\xae\x15\xe0\x9dE(\xc3\xf5\x0f!AK\xc6S\xed.w\x1a\xfeeE\xc0\xb9\x1cxS\xc2W\x95D\xff\xeak\xa7\x92\xde\x89\x17\x8f\x03H\x1f\x0c\xfcx\xfa\xc5\xf1\xa4w\x906\xf5\xda\x82\xce\xfeK\xba&p\xe3\xfa\x00S\xfb\xbe\x82O\xa8C\x15\xc28M\xa3\x8c#\x1bc\xe5\x08\xc6\xc7d\xf5?\xb2\xae\x82v\x15|m\xe2\x8eQ#\xecNZmQ\x04\xdeL\xf4\xd4\xd9Mo&\xfc\x92|\x19\x96\x7f\x13\xa64&\x12\xd4G\x86\xf6\x1e\xf8\xc8\x00\x9b\xfe\xa6\xb18\x09\x9e9\x84\x95\xf0\x91\xfe \x1c\xebv\x8f\x06\xec\xf1c\x09\xeb\x9d\x8e\xae\xc1\xed8V\x82\xdf\x9a\xb8?d`|#\x18\xf8M\xf5\x86 \x03\xb6\x12\x83\xeco\xa4e\xd0\xbe#\xffH&\x80\xd6\x84O\x0a\x8f\x89\xeazp\xba\x85\xc5S\x19\x8f\xcb#\xfe<\xb4:@\xf3|\xc2\xef\xdd\xbc[1\x1e\x0d0\x5cG\xc2\xb7%\xb0-\xec\x92\x9a3\xa1\x1dX\x07\x07\xde\x9fY\x89?(\x5c\xe2\x8eQ\x03/p\x97&\x1cp\xff\x02\xde\x0c\xc5\xc1\xd3\xa0?\x0d\xb9\xffB8\x9b\x09b\x8c&%\xe5\xc9aP\xfa\x00w\x0c\x1a2\x0ddg\xd7\x1c}\x9dB\xd6\x12|=\x0c\x9bSo\xe1\x1a\x07\xedM\xc45Iw\x22>\xdd\x85\xff\x96\xf2\x0fR\xbe-0\xad\xdc\xc5\xfb\x00\x0c\x7f\x1b\xe9\x8a\xf8\xb3x\x19\xb4g1`\xb5\xf1\xf5\xc0\xbb\x91t.\xfeq\xe1\xc0\xb7'q\xed\x92T\xcf\xe5\x04\xc7\xa1\x07\xedH\x22\x0e\x1a\xdb\xc9\xeb\x81o\x857|Z\xc2\xe7\xd0\x08R\x8c\x08e\xb5\x088\xc7-\xfb\x88\x8b\xd6\x9e\xb2\x07)\x8e\x8en#\x90\xbewR\x97\xa1\xe8q\x7f\xe2\xa7\xe3c\xea\xda\xa5!#1\xd6\x8d\x1f\xcbn[\x0b\x10\xb9sv\x05\xceo\x0f\xfd\x92\xd7\x1e9\xb4\xe0\xd2\x8b>c\xa9\xb7\x0c\xdc\xa9$\xd7\xc2\xe7 \xda\xbc\x09p\xed\x86g\x00?\x96\xf6\xb9B\xb8\x1e\xa7>\xf4\x0a\xfct\x9c\xdc\x8d\xf8\xcf\xca\x93\x01U\x18F\x87\xc2\xc38-\xa2\xbc\x16?Y\xf4\xf7\xee\x0a\xd7\xae]\xab]\xae\xfa\xbd\x5c[\xed4\x15\x81\xb6\x93O\xf4]\xbct\xe88p+A\xe3{d\xb9\x80v\x1a\xa06\x0c3vLy7\x8c[\x1fd\x90\xc1\xbaU\xb8\xf0\xfa\x96\xfa\x9d\xed\xb6\xcb\xdf\xc5\xdf\xa5a\x832\xa0\x81R\xd9\xa9\xd1\x09\xf4\x1at1Ggp\x96\xd7\xc52\xd2\x04\x946\xbfx\xe2\x22\x8bw\xf0\xc5\xd3w$o\xcb\x96-\x9a0\x0fa\x10\xcb\xb0h\xa2\x1a\xc4\xcef\x8a\xcb\xe7&\x0cB/T\xa7\x15\xf2\xb9\xe0m\x0d\x83\x07\xee\xc7ny\x05+\x98\xb4\xfe\xcfM\xcf`\xc0\xaec\x12\xd0.I;\xaaC\x98\x18\x0a\xdd\xbc<\xd2\x1f2\xa1\xbd\x07\x9f\x09\x94\x19\xe0\xc2\x1d\xa3\xa6\xe6\x03\xee\x187\x03\xf7\x86\x1cC\x15\x91\xee\xc8$\xa3\xe3\xac\xbex\xc7\xc0\x13j1u.\xfet\xear\x14tu\xa4z\x9eK\xef[\xea\xfa\x80Kg!\xf9\x0f\x03W\xfa\x84\xc5\x8b\x17\xd7m\xdc\xb8\xf1\x0a7O\xc6\xea\x01wg\xa5U\xf4\x9b\xc0\x0f\x046\x1dzw\x0b\x87z=F\xbd\xfa)\x8e\x8e\xea\x12\xd4%_FH;\x91\x7fcD\xba(\x8f\xb8vEk\xc8\xcb\xc7wb\xe7<\x05\x99\x0f\xa7\x8c\xb27\xc3\xe3SE|n(|^\x17\x0c\x031\x14=\xddJ\xd9l\xca\x84y&:\x14\x9ao\xa8,|\xee\xa3\xdc\x1f\x15'lB\xe0,`\x88+\xfd9<\xeeP\x1eN;\x93\xfb\x81=\xb1+\x19\xfc\xcb\xf1\xeb\xf85k\xd6l\x02\xaf2\xbb\xbf\xe3X\xa4, ~\x00\xd8_Q\xcff\x84\xa7\xb0h\xaa\x82\xbc\x8e\x81\x006'\x9f\x1d0\xfas\x8c+\xe9\x89\xf4\xb7\xaa\xe8\xe60\x97\xc3{\x84\xfb\xe3e\x18\x9fqa\x0a\xd4\x87\xae6i\xfa\xc8k\xc4\xaf\xc3\xab\x0e:}\xf8*\x84\x0e\x85*\xa7\xddUGxK\xa6?!\xafcxI\xabO\x9e\x8a\x17\xef\x1f\xf0\xbf\xc1\xcb\x19\xc3\xed$\xc0+B\x96\x13I8G\x97\xb4\xfb\xd1)\x8e\x89\x98\xf5A\x06\xed\xb2\xcd\x22a\x00\xc6x\xbc\xc3<+\xebFt\xa7\xfe-\xa3g]\x19\xd0\x80&\x97\x12qt4\xb9\x0a\xf20\x90\xaf\xf8i\xdb\xb6\xf9\xef\x1e\xd0\xa4\xb6\xe2\x82\xb9\xf9\xc2\x0b4z\xe0\x84v\x0e\x91]?\x11~\xe2%\x9e\x10\xf1\xf2\x13\xdf\xb4\xf9\x85\x15\x8c\xd5\xeeT\x83K\xc77\x13\x85\x01EB\xf2\x0ew\x13\xf3\x99\x10V3(\xdb*\x8d\xa8;\xabU\xab\xf6A\x04\x91\xdd\x13\xb8\x1f)M\xd8.,\x9e\xa7\xbcS\xd4\x9bf\x80N \xed\x18_&\xb4\x16Lr\xff#\xbc\x1f\xde:\xd6\xe9L\xde@\xc2\xf1L\x5c\xff\xc3;r\x92g\x8cY\xa2\xdd\xc3V\x8c\xd4KL:\x9d1\x96-\xa0\xdb\x07z\x93\xc5\x1f\x9a\x9a$\xaer\xe3N}\x89\x9b\xc9B`\xb9\xf7w\x05<t\xd9\xb4\xa9\x9d\x89+\x84\x96wQ\xa4]\x9b\x5c\x04\x06}\x03\xdb\x95\xb1sg{\x07a\x97\xf1\xf97\x93\xfe\x97\xf2\xe8p2\xb85\xdc<\x07\xc7)\x10\xe7\xc7\xcb[\xc6\x9b\xf2\x8e\xfe\xe2\x14\x89dy\xcb\xa2\x1b\xed\x04\xfd\xce1\x0c\xe0}\xe4\xcd\x80G\xa4n^\xb87\xde\xa0A\x03\xb5\xc7\x87.\xac;\xc6K\x06AN\x06\xf8mHT\xdd\xb0a\xc3\xc9\xc4\xbb\x0bH\xda1\x10\x84F7g\x1a\xbd(\x04~\x93\xf0p~\xbdD\xc9\x82\xacA\xf5\xd8U2\xc1/\xbb\x1ec\xa4\x0e\xd7I\x01<O\xa3\xc8Z\xe0\x0eo\xda\xa7\x87\xbb\x00\xa9\x0b|[\xa5J\x95\xfe\xe3%\x09\xbet\xef\x184\xc131&\x02\xea\xe3\xb4\x09\xfd~;\xfd\xd8\xbf\xc8\x89\xd2\x85W6\x1b/}\x0d\x94\x88Q\xa3\xe1e4\x8cq\xc9!\x9e3\xfd\x90\xb6\x976\xab\x9dW\xd0\xbeZ\xad\x82\xcf\x0eh\xa9\x89Rp\x19\x1by\x15I\xd9\xd0\xb8eU\xde\xd0\xcb\x11\x0f\xf1\x12O\xf1&\xcf\x91\x83\xd0\x91+\x1d~\xd0\x08\xed\x9a7o\xbe\x04\xe4\xd9*\xc0\xe0\xbb\x8e\xc1\xa9\xd5r\x94ce\xf9{\x00G\x0b\x88\x5c\x1f)\xc4\x15\xea\x872\xd9\xbc\xf8\xd0Eq\xd7It\x93^\x04,,\x9e)_,\xc4Pu\x02(\xfd\x88\xdf\xcf\x0a\x99log`7\xc3\xdf\x0c?\xad\xc2\xd7\xe2\xf5R\xc3s\xca\xc7\x10~\xc1\xf1Km\xdc\x11J\x079V\xea\x95\xf0\xda\x11\xaa]\xb20\x96\x0b\xa0\xfb\x1c\xbb\x94n\xd0Y\xe3\x961\xfa0\xf58\xc4\x85;\x01x\xde\xb4\xea\x9b\xb2\xa3.\x0bMa\xe2}\xf1\x17\xf9=\x13\xd6\x17\x06gw\x85\xb4\x81SO\xc2\x93\xbc2\xa0\x8b\xb0cd\xac\xca1\xb9w\xa7H\x0f\xc5\xa9\xe7\xbf\x89\xff[q\xdc\x85\xd0>^\x11\xe0\x0e.yF7\x9f\xf9u\xe2\xa6\xfb\x0b\xbf$\x9cvu\xd0\xfd\x19\x99*bH\xef'\xbe\x0f\xf2\xbc\x07|\x0e\xe1T\xd2\x07\xb3\xe3vN\x16H\x7f\xd6\xacY\xb3U\x09\xe40})\xd1\xd8I@\xe6\xd7lO\x9bTD\x96\xe3\x7f\xcdqba\xdb\xc5W\xcc&KB\x03\x9a\xe03\xea\xe8t\x8e\xd1\x80\xa8&2M\x949S\xbb\xb4\xbdd\x9f\x9c<\xe7\xe8\x82aY\xabq\xb5\xaa\xef\x8f\xdb\xbf\x85\x0c\x9b\x9ec\x08O>\xa5\x1d\x14\xfc\xd4\xa1\xc4\xd3\xd0\xc9\x15m\xf1\x10/\xe0Y\xe2-\x19\x88:\xf2\xb8\xb8f\x17)\x94\x12uL\x0aW!\xa6Vs\xd5\x18\x10\xff\xe5\xb8\xe2R&\xfbV\x18\x93\x8e\xc4\x07\x03\xfb\x97+\xc0\x0ap\x07*\xce\xe4\xaa\xe3\x22g\xe2g\xa0\xf7\x95\x81\x10\x9c2\x173\xc0\x9a*N\xfe\x87a\xf1\x84\xefq\xb5\xe0\xdb\x8bt6\x06U/\x0a\xdc\xa1<\xc9\x08\xff\xff)J\xfe\x10\x8cV\x0eF\xe8avY\xe7\x02\xff\x83ppm\xf4\xc3\x8a\xba\x1e\xc7\xa4\xf7\x15\x15\x15]\xa4t\x90cR\x1d\x8a\xff+2\x7f$\xb91\xe8m\xa1\xdb\x12\xaf7\x13\x9d\x9d\x11\xe5\xa6\xab\xac\xea\xe2\xd2\xe8\x86L\xc7(\xaeg\x8b\xe0\x99\xc9l\x8e\x9e\xbf\xb88)\x05\xac\xfc\xbf\xa1\xa0\xb3\xc3\x84n;\xea\xf6\x0a~\x94<\xfc\x97\x10\xbe\x9c\xff\xeb\xcb(\xce\xea\x1b\xbc\xda\x1c/V\xa6\x5c\xc6\xc7J\xacJ \x8b\xd9\xc9\x1e\x81\xde\x1e\xa2\xed;\xe3\xcfG\x97w\xc6*\xe3\x85S\xfem7\xad\x17\x80\x0e!]@\xdd\xbeg\xc7?\x9e\xf8F\xfcy\xe4W#\x5c\x05|\x92\x8b\xfb\x89B`]\xd0\xd3W\xd2\x89<et\xfc\xf8\x03\xf11.^2AX\x1d\x0a\xcf\xc8|\xa9\x18 \xc7[\x0a\x91\xdf\x09\x89^\xea\xa6\x1d#\xacx,\x97\xe2\x98\x88E\xce\x81#\x8f\x8e\xc87*A;<H\x1f\xeeI\x9bt\xa1}\xf4\x8c6\xea\xe8\x91\xfe\xb2\x1f\xf9O\x90\x7fm\x5c\xa26\xb3D4\x90\xd1\x81J\xa3\x8b\x9e\xbc\x0c\x8c\x0cH\xee\xe7\x9d[_R;7\xefi\xe2\x11'c\xd3~\x9f\xea\xef\xbe\xd5\xae\x991l\xc2U\x99\xa4\x0c\x1b\xfc\xbc\x06\xcd\xe1'\x9a\xa2m\x0c\x9aa*\x19$\x0bi\x19R/\xbf\x8c\xea\xc0\xf0\xf3\x86L\x08\x1f#\xea\xed\xf8\xed\x1a\x00\xf8\x91\x0c\x8c\xb9\xe0L%~\x0fa.yZ}^\xcc\xc4\xbdLe[p\xa4\x05\xcc1p$\x7f\x0f\xfe\x0a\x06\xd0O\xc4\xff\x81\xd7\xa0\xff\x04\xba\xa3\xc3\xe2\xa9\x8cq\x94\xad\x08\xdfQ\xd0[\x8eA\x9dG\xfcL7\xef\x9f\xf0\x9f\xcb\x80\xbc\x04\xd8\x1d\x1c\xf7\xcd\x05G\xcf\xd4\x9e\x85\xffc\xc2\x01>Q!\x86\xf6:\x82\xff\x03\xfe\x04\xf8-\x05\xf3\xb9\x1c\xf8\x98#\xab\xae\xe4=O\x99Y\x94\xd7\x179Tg\xd5a9\x86\xf3\x11\xc5k\xd4\xa8\xa1\xe7f\xf3\xf19\xc84\x09\x9a\x0b8&[\x02n\x17\xf0v\x00\x17\xbf\xb4\x9ct\x85qvv\x1c\xd0\xbd\x8az-\x81\xcf\xbf\xf0S\xe19\x81\xf0\x16\xc3\x00\xbcIn\xbc\x1a\xc6{1y\xce\x0e\xd5\xe4\x97d\xc8\xff\xf9\x86I7.\x8f\x9b\xd1\xf17\xf8W\x80m\x0f\xc3\x97~Q\x08\xee\xb7\x06\x97\xba:;4\xfd\x15\x03\xd8x\xd2fg\xa1c\xbcm\xc2C\xff:nV_\xa8B;\xcd@7j\x83\xb1\xbcM:\x17\xd8X&jg\x81(\xdc\xb0.\x19\x1d\x82\xeb\x18+W\xb6m\xfc\xbfo\x9c\xf8\x007\xc6\xcd\x91\x99\xe3|\xa7.\xf1dHeL\xc4\xa3\xa7<t\xaa\xf6\xd0.Rc@o\x85\x8e\xa6M\xbe&y6zs\x8c\x9d\xf2\xe4\xd0\xdf\x8d\xe4_\x1bgl\xecB\xb4\xbf%\xa2\x81\x8cM\xe84\xach\xc9\xcb8\xc9p\xe4N\xee\xd4\xfa\xe2Fy\x95\x9f ^\xccU\xcc\xce\xaayP\xcd\x1a\xef\x8c\xe9\xd0\xd4\x186\x95\x0bm\xd8\xe0\xe75h\x0eO\xd1\x12M\xd1.\xc6\x10\x80d\x91LD\x1d\xf9<\xfc2\xa6\x87 \xbe\x821(\x861@uT'\xa3\x10y\x0eE5\x96\xe3G\xb3\xba\xec\xc0\xb1\x9c3\x90\x85/G\x99')s\x01\xf9\x8bHV\xc37\xc4\xaf'\xfd\x18/\x04\x9cB|'>4\x9ep\xe5\x18p\xda\x11\xf6&\x9a\x87\x97\xf1\xd1\xff\x97Fq\x94x\xb5\xf2\x99\xe0\xc6\x90\x1e\x02\x9e&\xc1\x13\xf0W\xe0\x9b\xe3\xdfB\xceK\x095\xd9|\x0e\xcef\xa2\xb3\xd9\xc9\x15\x0a\xe6s\xdb\x80\x9f\x06\xceex\x1d\xe99;$\x17G\x13\xa9h\x1d\xe7\x1e\xcff\xe9Y\x90\xf4\x03\xee\x18\xf2\xf4\xdc\xb0\x19a\x1e\xe9\xef\x89\xeb\x95\xf2\xf1n\xd9\xb4\x02\xe9\x14\x02=\xa1+\x9d\xea\xf5t\xedZt\xac\xfa\x01\xa1\xbc\xe38\xfa\xd2\x0b\x1b\xa3Hl\xc1k\xc7x\xc0\xae\x9c\x92\xff\xd5\xcb0\xf0\xeb\xec\xf2\x9fO\xa8\x1d\xe6\xad\x84#\xc4\x9dP\xed\x12\xd7Q>\xb2\xa3A\xaf\x8eaP\x01\xcaF\x8c\x82\x17G\xfa\xa7=\xf4\x9f\xb8\x7f\x02W\xfb\x1cCx:~+\xf1G\x98\xa8\xa3&n\xd1J\xe4\x92\xd1\xa1\x9e\x1b\xc3\xdb\xe1Ah\xfe\xd3\xa8\xbe\xfd-i\xb5\x95\xdc,\x1dI\xee\x8a\xc6\xff\x0d;v\xe2S\x89\xce\xa5\x0f\xde\x8b.\xaf@\x1e\xf5}-\x1c^\xc7\xc8\x1e\x09\x96\xc6\x81\xc6\x84i\x97\xcfIn!\xbf\x00\xbfXy\xd6\x95\x9e\x06\xb2\xe9\xb4is\xa3\xe1\xbc\x06\xcd\xd91M:\xa8\xd5EM\xabVqV\xf7\xf1\x18l\xdf\x99\xb5z\xd2\xca\xa2\xb3.\x9e[\xa8\xb3s\x0d \x0d(\xadHw [\xa0p\xf0\xf3\x1a4\x87\xdf\x0b\xad\x9bt\xeaZ\xa7\xd6[\xb1\x0c\x1a\xf4\x22n\xd1\x86\x8d7t\xfd\xae\xe0%\x00~~\xda\x11\x94\x86\xab\xc0\x11[K\x06\xc4z3\xa9'b\x0a\xfe\xbeT\xbb&\x83\xba\x00\xdc\x98r\xc6\xc3\xe38\xa47\xab\xc7\x17(\xff\x0b\x06\xb4>aEV\xe0m\x98P\x0a\xeb\xd7\xaf\xef5:\x11qD\x8f\xc4\xbe5k\xd6\x5cP\xaf^\xbd\xb5\x91\x0c\x22Z\xbd\xb3*^C4\xa6<\x1e|\x1di\xe6\xab\xed\x98p\x16\x00W;\xc7r\xb9\xe0\xb6\xe6\x18\xec'\xea\xbb:\x16R\xbap\xbd\x94\xc0\x0e\xad.tt<\xe7LL~\x9a\x1c\x99\xd6D\xe4\xfd\xf2\xf3\xf3\xa5\xf7x2\xfb\x8b\xa6\x95f\xa7\xd4\x916\x9a\xe6%\x82N\xdebH\x9c\x89<c\x98`\xcf\xf7\xe6e8\x9eK_iC\xff\x5cI\xfb\xfe\x9c.\xed\xdd\xa5C#w\xbc1ap\xc2\x84\xea\xef\xe8\xbf&}A\xfd\xd7q\xe8\xa93cJ\x8b\x0e\x19\xb5\x03\xe8G?(\xee\xbe\xa9\xab\xbe[j}F|\xadc\xe1\x16\xc3n\x84\xd6\x0d\x03\xac\x98A\xfb\xa8c\xab\xde\xf9\x95\xab<\x1a\x96\x88\x0c\xdb\xc7+\x8b~\x7f\xd9\xdcB\x1d\x99\xf8\x0dM\x94a\x83_1\x836\xb2u\x93\xce\xdd\xea\xd4z3\x8cA32\xcd\xdf\xb4\xf1\xc6\xe3\xa7\x15\xbc\x18\xc0/\xcc\x04m\xc8\x94\xab0\xc0\xa8\x95+\xf9\xf7\x16a\xf55\x11\x8e<\xbf\xa7\xbeS\xf0\xe3\xe8\xf2[\x19\xa7\xa7\xe1\x7f#\x1d\x90\xee\x85Q{Yq\xebJO\x03,*\xb4\xcb\xd7\xdfi\x9e%\x9cI;\x1cD\xa8?\xb67P\x9aE\x88v\xf3{\xec\xfcA\xdd\xca\x85\xd3.'eG\xa3\xa6m\xd0\xc4\x5c\xc6HFid\xeb,c\xd8\x222\xc1CF\xcd\x186\x194\xf9\x8axg\x87\x96\x8aA\xa3l\x96\x8c.\xc67\xcb5l\x029\x0e~:\x9e\xb3\x1d\xd3(\xc4\x86\xa5\xae\x01^\xc3\xaf\x0dS={<\x9e\xf0xB#\xc3\x16v\x03\xf7\xb1\x1b\xb0\x06\xcdh\xa4t\xc3\xb5\xb4E\x15X\xde\x22\xb6\x9ev\x99\xc9\xb3a=\x0e\xb0\xf3\x86\x14\xb3\x9b]\xca;\xb5L\x194o\xfdc\xec\xd8\xd4Q\xcc\xa86\xbb\xb4\xb4\x0c\x9a\x97\xe7\xde\xb4c\xe3\x18\xa6)\x03Q/^l\xe1\x85\x90\xffx\xf5`\xe3eN\x039\xec\xacO\xa4\xbd\xda!\x99^\xd2(\xe48p\x1cG_K\xcb\x9c\xa4{\x91@\xdaE\xb3\xe88\x9av\xc9g\x1c\xadc\x91\xf1\x1dG\xe4\x1f\xa2\x023G\xedE\xda(\x9bUM\xc9\xa8\xd1\x98\xc6\xb8\x98\x1dS^\xb2G\x8e\xb1\xd4\x11`\xd8\xf4|\xcdt\x18\xb3K\xcbMu\x87\x16\xc4\xd7c\xd8\xf4R\x80\xce\xc0\xc53\xe63\xbd \x1a\x16f5`5`5`5\xb0\xfb5\x90\xb4Q\xf3\x184\x1d=j\xc7\x94\xc7K!\xbd\xc3\xbc\x14\x12\xb6\xba\x1e\xc3\xa6\x97Gdd\xcc\xb6\xde\xe1\x89A\xeb\x94\xec3\xb4D\xbc\xdd\x97G\xf4\x8c\xcd\x186\xf1\xb4\x86-\x91\xe2l\xbe\xd5\x80\xd5\x80\xd5@\x19\xd2\x80\x8cD\xb2N\xbb%\xb3c\xca\x19\x91\xbfo\x8bL\x1a4\x09c\x9e\xb1=\xd3\xaaq\x17\x92\x95\xbc^\xb0L\x1b4\xf1T\x1dT\x17\xa22\xd4\xda\x81\x9az\x12\xb5\xcej\xc0j\xc0j\xc0j\xa0<h \x15\xa3\xa6zi\xc2W\xd9\x8a\x93Wl\xda\xb0m\xe76\xbd\xd6\x9dQ'\xc3vb\xdd}\xdex*\xbf\x91\x0c\x9b\xbe\xe8PYq\xc1\x92y\xcb1\xacP\xaa\x83\xea\x02\xbe\x0c\x9a\xea\xa6:Zg5`5`5`5P\x8e4\x90\xd4\xf1\xa3\xe7\xe8\xd1yQ\x83zj\x17U\xe5\xde\xa6\x0d\xba\xf4lX\xfb\xa5\xdc\xec\x9c}2]w\x19\x9b1K\x8b\xf4I\xa7\xac\xf3\x1a\xd4\x1a\x9d\x93\x9dS#\xd3<\xb6\xee\xdc\xb6\xf6\xe5%\xab.\x1a\xbch\xa9\xfeo\xb2\x11\xaf\xff,\x99\xbf\x16\xd8#\xc8L+\xdc\xd2\xb3\x1a\xb0\x1a\xb0\x1a(!\x0d\xa4b\xd4\x22/\x87 \x93\x8cZU|\xb5\xbe\xfb\xd6\xee|M\x8b\x86O\xe5eW\xa8\x9eiY\xcdN\xb0$\x0c\xda\x96\x9d;\xd6=\xf5\xe3\x92kF,[\xa5\xff\xc8\xe9K\x1f\xda\xad\xc9\xa8\x99gk\xfa\xb4\x95yQ\x05\xb0uV\x03V\x03V\x03V\x03eU\x03\xa9\x1e?\x9a\xfa\x98\xe7N\x150\x0a\xf3\x86-Zv\xeb\xe6\x1d\xb1/\x8d4\x85\x92\x0de\xccJ\xc2\xa0IV\xc9,\xd9\x91\xc9\x1c9\xdac\xc7d\x1b\xc8\xe2[\x0dX\x0dX\x0d\x94\x11\x0d\xa4k\xd4\xa2\xaa\xf1\xdc\x92_\xe6\xdd;\x7f\xf1\xe0\x920lQ\x8c2\x90\x90\x8c\x92U2g\x80\x9c%a5`5`5`5P\x064\x90\x8aQ3Gq\x0a\xe5\x9dW\xdf\x09\xf5\xdf\xae\xed/\xfeRT0h^\xe1\xbd[v8\x1f\xc3\x05T\xf6\x9cd\x93\x8c\x92\x15\xe9\x1c\xb9\x09M=L\xbd$\xb8\xa9\xab\xe2\xd6Y\x0dX\x0dX\x0dX\x0d\x94q\x0d\xa4b\xd4T%\x19\x00M\xf8\xc6 \xe8\xbfdz\xb1\xc2\xf1\xffZ\xb1\xba\xe0\xf6y\x85C\xcb\xa2a\x93L\x92M2\x1ay\xdd\xd0\xfc\xe9Zu2\xc6\x9a\xa8uV\x03V\x03V\x03V\x03\xe5E\x03I\x195\xf7\x85\x09\xb3\x93\xf1\x1a4\xbdT!\xaf\x17,6\xc9\x8fY\xb1z\xee\x80\x82E\xc3\xca\x92a\x93,\x92I\xb2\x199]\x99\x8d\xfc~\xc3\xa6*\xa7\xbd[\xe3sGg\xba_\xbb\x87]f\x1d\x1fY=\x87\xaf\x87\xeb/\x0f);\xbe\xa2~\x18\xbe\x8d\x08p1\xa7\xbem\xa7\x97\x81\xf4\x15\xfe\xfd\x90\xfbD\xc5\xf7T\x97H\x7fK\x97.\xd5\x95?\xd6\x95\x13\x0dx\xfb\xaf_\xe4t\xfbs\xa2\xbe\xe2\xe7g\xd3\xbb4\xb0|\xf9\xf2\x98/\x0fz\xe7\x9eL\xe9+)\xa3\xe625FM\xbb5\x196\xed\xce\xa2\x0c\x1ai\xbd\x16\xbf\xf1\xf5\x95k\xe6\x0c,X\xf4@Y0l\x92A\xb2H&#\x1f\xa1c\x80\x09\xcd\xdb\x8e\xaa\x8b\xeadv\xa2i\x1b4h\xe9\xc3\xa7\x7f#(\x91\xfb\xb8\xa0\xfd<\x7f\xb5\xd0\x07pSv\x5c\xbfr\x0d^\x1fd\xcd\xe2b\xce\xd1\x5c{2Xq`\x9d\xf0\xf7(\xbe\xa78\xea\xd6\x97\xc9\xa9\x93\xa9O<\xfd\x81\xd7k\xcd\x9a5\xff5\xb8\xe51\xf4\xd7\xb7<\xd6!\x19\x99\xbd\xfdW\x0b\x12\xda\xf0)S>\xd9\xfe\xec\xd7]\xbc\xbebx\x94\xc7\xd0\xaf\xa7L\xd6a\xc9\x92%UW\xadZ\xb5\x92\x85\xbd3\xff\x11v\xc3\xf71<h\x93\xc8\xdcc`\xe9\x86\xa9\x185\xf14\xcf\x9fd\x00\xb4\xbb\x91Q\x93\x81\x901\xd3+\xf1\x91\xf0\xb52`\xd8\x8cA\x93,^\xd9<\xb2Jv\xd5\xc1\xec\xd4L\xfd\x00\xed]\x8e\xaf\x8d_[\xa7N\x1d\xe72\xca=\xb4\xe6\xa7\xb2\x08h\x1e\xa6n\x5c\xef\xf2*w\xba\x9d\x1c\x06\xb7\x0c\xe3\x84\xaeo\x19\xaeCh\xd1\xbc\xfd\x97\x0f\x0fW\xc2\x10]\x1e\xbapq\xc4\xbdBw\x19\xd0Sq\xcd\xb9\x10\xdd\xb6\xce\x18\xea`\xee\x99\xa3=\xf6\xc7\x1f\x1f\xb3@\x062\xf4'\xea\xa4\x1c\x02\xeddRP\x19\xb3SS\xdc\xbc\xda\xef\x0d\x0d<k\x971Y\xf4\xc0\xb0VM\x07\xe4U\xc8\xd6\xff\xdaJ\xcd\xf9\x0c\x9a\x0c\xae\xd7\xcb\xf8\xca\xa0\x99?[G\xed\xd4T\xd7\x92\x16\xf4\x97_~\xd9\x87\x95\xccp\xf8\x9c.^\xe8v\x5c\xadZ\xb5\xfa\x9a\x0b9\x13\xe5\xfb\xe4\xab\xc8\xea\xf2ih\xfc\xc8\x84<\x84U\xea5\xe4_\x82\xdf\x17?\x93\x9b\x8d\xfb\xb6h\xd1b\xa6\xafLT\x92\x0e~]QQ\xd1,\xf8\xbf\x14\x95A\x82K5\x9b\x93\xff\x12_&\xefG'\xfd\x02\xfa\xfb\x03~\x04\xdf\x0eU\xad\x86\xef0\xf8\x8e\xf6\x97S\x1a\xb9\x0e'\xb8\x0d\x1c\xddA\xa5\xcb\x13G\x18\x5c\xe8\x1e\x0c\xdd\x87\xc9\xd3\x0ej\x09\xfe\x11\xf2\xb4\xbb\xcd\xe2x\xa2+\xb7._Mt*\xf9\x0a\xd5F\xd7\x12o\x0b\xcf\x9b\x89\xef\x94<\xe6\xd6\x01\xad\x0c\xd7\xaf_\xff\x00y\xce\xce\x93\xfcq\xd4\xbb?\xf5\xde\x84\x0c\xe3H\x1fA\xdec\xc8~\x02<n\x22\x9d\xb5y\xf3\xe6\xce\xa4\x9f\x07\xae\xdb\xa6?ab\xbc^\x97\xb7\xc2\xfbpx_\x05\xca\xc5\xc2\x03g\x0a\xf9\x83\xc1\xebG\xb2#\xe1D\x06\xec\x0d\xf0^\xe6\xe6\xab\x0d\xef\x07\xde\x90\xf0\x03\xe4\xfa\x80x[\xf8\xf4W\xbeq:\x8e\x06~*p\xb5\x8fs\xcc\xcb\xfdi\xef\x81\x7f,zu\xbe\xce\x03\xafQ\xa4\x9f\x85\xf6D\xe21\xf5L\xde\xbd\xc8\xf4\x13\xf4\xa4\xbb\xd3\xf0\x0b\xf1wA{|\xac\xfa\x92\xef8\xf2\x1f\xa7\xec\x87\xe0\xbe.\x00\xe9\x8bI\x1fCZzV{7\xa0]\xc6rO\xd8\xd1\xf0\xf9\x0c\x90\xea\xad]\xfcS\xe0\xbc\x16\xa6\xdd\xa07\x09\xfck\xf1\xb5\x89?G\xfd\xcc\xce?\x17~\x8a_\x02\x5c\xe3\xf0I\xea\xd0\x8e\x9b\x08\xfe\xc9W\xef'\x90\x8e\xb8d\xe44\xfd\x971\xf55\xf4^\x87v\x0e\xb2O'\xde\x9f\xb6\xd2\x9c\xa5vT\xfd\xa4{]\x10\xfb<uQ\x9d\xa2\x1c<\x93\xea+*\x1c\xaf\xefE\x11w\x13\xf4\x03]\xda\xdb\x0f\x19k\x02\x9a\x85|\xd7S\xf7\xd9zT\xc1\x0e\xe6\x0dtq)i-\xc4%\xf3\xa3\x04\x05\xc8\xfa\x08\xf1)\xd4\xe7n\xca\x0d\x02\xd6\x1e\xff5\xf1k\xd0m\x01\xf1\xacDs\x86\xca\x83f\xdar,\xb44\x9e\x22z\xa2\xbdU\xf7\xa4\x5c\xac\xba\x88\x08u\x1cE\xbenQ\xd7]t\x03\xe0U\x15\x19\xa6S\x97\x8e.\x93\x1a\xa4\x9f\x22\xae\xf1\xb3\x98~\xff\xa70\xe3Ye}uq\xfae\x05e$\xeb\x10L\x93\xbd1j\xdb\x89k\xa2\xf1\xef\xd66\x003\x7ff\xde\xb0;vl1\x0cZD&\xe43FM\xb2\x1b\x83\xa6\xfa\x94\xdaWD\x18|/\xc3\xafz\xa5J\x95\x0e\x92\xa7\x03TY\xb9r\xe5+\xc0\x1c\x97(\xdf\xe0\x11V` \x8e$\xacKg\x19\xe6>#\xeb\x07MM\x9e\xad\xe8(\x0f2\xe0[y\xf0cE\x1b\xd1\xbcu\xfc\x99t\xca&L\xf0\x1f\xd0!51}\xc1\x00\xae\x07\xceD\xfcp\xe87\xafR\xa5\xca\xc9\xc4\xfb3 \x15\x16s\x94{\x02\x19\xd4\xe9ZW\xae\x5c\xf9\x0cxh\xe2w&t\xe8~L\xdeH\xf2\xf6c`_\x08\xb8?\x9d\xf52\xe5\x83W\x9d\xb2=\xf0+j\xd4\xa8\xd1\x99\xf4{xM\xc2\x95H\x1fN|4:\x1b \x5c\xb9u\xeb\xd6\xbd\x00l;\xb4\xf6\x97\x07\xb4\x83z?\xa1<\x8c\x9bhN\xc5\xdf\x85\xbcfru.\xdd\x84o\x9f}\xf6\xd9G\xf8\xf50r\xbd\x08\x1d\xde\x04-\x15\x97\x83n\x07x\xf5\x06\xf7\x0a\xe4\xd1qJc\xd2\x92W\x06\xa0\x1d\xc1\x18\xea1\x98I\xa1!\xe1\xc3\xe0\xdf\x02\xac\xa9\xf2\xbd\x8e\xb2_\x90\xf7\x07\xf7\xf9O\x16\xf5?\x9b\xfc\xc6\xc0\x9c\x85\xcd\xc2\x85\x0bk\x13?\x8b\xfa\xfd7\x84\x9e\x1b!\xc3M\xf0{\x81\xfa\xb5\x86\xf6\xbb\x94\xbdS\xfcb\xd5\xd7\xc8B\x99\xef\xc1\xbd\xc0\xa4\x09/\xc5\x9f\xa6IQ0&V\xc9\xf3\x13~\x1bx\x1d\xf0\x03\x89\x0fBw\xe3\xf4|*d\xbbU`\x91\xd6\x15^\xe7 \xe7\xa0E\x8b\x165\x82F\x16\xfd\xa9/\xb2\x9e\x81.\x8f\xa3\x9e\x07\x03\x921\xef\x09\xcd\x1a\xca\xf7\xbad\xe4\xa4\x9c\xd3\x7fi\xfb\xb9\x94;\x17\x99\xb7\xd1\xdf\xbaW\xadZU}Um\xad\xab\x97*\x22\xd3\xb1$\xb5\xb8\xe8O\xdb5W\x9e\xd7\xc5\xd2\x1de{\x05\xf5\x15\x95\x8d\xd7\xf7\xbc\xb4\x15g\x9c\x5c\x00\xef\xbe\x8c\xcf\xdf!\xab\xf8\x0fG\xdf\xe3u\x14\xa8E\x12|\x9eE\x17Z \xca\xf8_\x08n7dzZe\x89wp\xe5\xb8\x10\xdd\xa9\x7f\xfd\x00l,\xa1\xf3,<\xd1\x9c\xa1\xf2x\xa7-k\xd7\xae=2HO\xe2\x13\xd6\xc5\xab\x8bh\x88\x1f\xb2\xe7 \xb3x\xc98\x7f\xa86!\xd4\x5c\xab|\x8d\xa9\x97\xc0iM\xfc-\xfa\xc9]\x82\xcb%\xd2\xa9h\xe3#\xfdReR2j*\x08\xa1\x9d\x04\xc6\xb0\xe9\xd8.\x96a\x93q\x93\xdfX\x9a\x86\xcdg\xd0d\xbc\x8c\x1c&\xf4\x1b\xb4\xc8\xd1\xa3[7\x8a\x94\xacs'\xc2Si\xe0\xfe\xcd\x9a5[%\xcf\x84\xa1\x95\xcc\xc9L\xea\xfb'\xca7\xd21\x09W\x00\xff\x19\xd2\xf5\x98P5I\xa9.\xda}\xd6&\xef\x18\xc2<\xad\xf8\x19<\xef\x10O\xdaq\x87TC:\xda\x04\x0a>\x08\x8d\x7f\x88\xc0\xda\xb5k\xaf$\x98Lz\xbc\xd2M\x9b6\xfd\x09\xb9G00\xff\xa8\xb4\xdf\xa1\xd3\x8d\xf8\x134I\x0b\x179\x9d#N\x0cN\x1f\xe0\xd31\x94/Rf\x0b+\xd3\xef\x08\xd5\xf1\xfb\x1a\x1a\xe4\x7f#\xbe\x0d\x1a4XO\xe7\x7f\x15\xf8r\xf0\xff\xea\xa6\xffE\xbev\x7f\x9a(Z\x13\x9c\x82\x1c\x9a\xd4\xd5\x1f\xb7\x82\xaf\x01r\x01F\xbef\xfe\xae\xbb\xc86\x93\xbf\xb2I\x93&+\x81;\x8e\x9dY?\xf8.\xe4\xa8\xe4\x17\xf2^\xc1\x1fe\xf2\xfc!\x93P\x7f\xe1\xc2\x7f9xc\xe0}\xb4p\x98\x80z\x13\x9f\x8c\x9e\xdf$\xb9\x95\xfc/\x08\x1fV\x9e\xdfi\xd2\x026u\xe3\xc6\x8d')\x0f\xdd\xf6`\xb0k\xd7\xd9Civm:\xf6\xfa\xa8~\xfd\xfa\xeb\xc2\xe8\x19\xdc'\xa0\xf9\x99v\xa3L\x0c\xcf\x90vd\x8aU_\xf1\x90\xa3.o\x81\xab\xc9%\x17#S\x9fx-\xe2/\xb3\xa8\xd2\x8eOr\x9dA\xf0\x86\xe2r\xe8\xf2j\xdaa\x0a\xba\xdb\x18\xb6\xdd\xd0\xc3\x93\xaa\x07\xf2}\x0d\x89/7m\xdat\xa4hA[\x0b\x8c\xc7\x81\xcfU;B\xf7o\xf0\xff\x5cy~\x97\xac\x9cn\xf9\xad\x8c\xab%\x8a\xab\xbfIf\xc5\xd5\x97\x90\xe9\x09\xc9\x04O\xed\xfe'\xd3g\x8fP\x9e\xd7\xc5\xd2]\xac\xbe\x92\xa8\xefyi+N\xfd\x07\x10<\xa0\x13\x01\xa5\x91E\xe3h\x1a\xcfp\xcfw\xd3#\x91m\x96;\xaeG\xc0\xf7\x02\xb5\xaf\xf2\xe4\x8c\x1c\xd2\x1dm~\x17\xf5j\x83\x0cG\x86\x9d3L[\xeaD(HO\xbb\xb8\x84\xfbMT\x17C\x05\xbd\xafA\xce\x22\xd2\x1b\xd4&\x06N=\x9f`LMR\xfd\x18\x07\xcf\x80\xa3\xf6\xa8\x10V\xa7\xa6.\xa6\x8ds\x0c\xe1TB\x98\xeb(R\x86-\x96\xf3\x1eG:q\x0c[\xc1\xf6\xacE\xc3\x87\xb7j\xda\xaf\xa4\x8e\x22e\xd0\xfa\x15,\x1a\xfe&\xbc\x10L\x1d\xc11\xaa\x9eP\x1d\x5c\xf0-xM~\xa5n\xd0\xe0\xa9\x89Po\x1c\xce\xf06\xb0\xe2td]\x15\xdf\x86|\xe96f\xbe\xf2\xf0Z}>JS\x9cC\xf48\xbc\xea\x94\xa5\x89\x97\x89\xeaj\xe0\x83X\xe9\x8d\x06G\xc7Yw\xb9\x13\xaaPB9\xca\xd5a\x92\x95A\xcb\xc5\xe0\xbe`\x0aA\xab=\xb4\x0fAV\xefDT\x09\xfc\xc0\x85\x12\xf0\xab({'+\xaf\x05\x94\x99LG\xbc[\x1d\x19x\x1b\xfc\x07\x86\xaeB\xd2\x13\xa0\xfdg/\xcc\xc4\xc9S{E\x1crleRr\xd2\x0c.\x1d\x83j\xb1\xf5\x1e<\x228D\xd6\x81\x93O8\xd5\x0b\x0c\x8aCc=<\xd4W\x13:\xd0\xd6\x82\xe4\xd4\x17\xb6\xcd\x91\xe5co!\xc9\x12\x8b\x14\xb82\x16gb\xe4e\xfc\xea3\xe0_\xa2\x9d\x06i\xa5\x8e\x0cg\xb8\xf9Y\x84a\xf4\xac:;\xaeZ\xb5j\xeb\xb4\xc81\xe9x\xa1\xe9k\xe8\xaa\x1b\xa2\xe6\xc3\xeb-\xf0\xdf\xc7\xdf\xc2N\xecMd?\x816\xbf\xdc\xd0\xe08L\xe3\xc4q\xe4%\xd5n*D\x99uxG6\xc2\xe6\x80\xa2\xf4\xe5\x10\x0e\xf8IV\xce\x00\x12\xf1@\xeb\xd1w(}\xf9\x89x\xfb\x0a\xf1d\xfb^{\xe8\xf5C\xf77z\xe8\xd6\xa3\x1d\xbe1i-vY\x04,BW\x8f1\xe1\xcf4p\x7fH^\x11}g*24\xc7\xd7&?\xe1\x9c\xe1mK?=o\x1a\xf9d`\xc6\x18\x18\xc6\xf4\x08c\x88\x0d\x8c0a]<\xb8A\xd1H\xff\xa5\xce\xebx\xd9\xc7\xc1\x09\xabS\x7f]\xd22j\xe2L#\xc42l\x9a\x18\x8cW\xa7\x91\xd7\xf68''\xdb1\x22DK\xce\xb9<4\xc1\xcbx\xc9\xcb\x90\x19\xaf]\xccn5h\xf0\x97+D}m\xb4\x8b`\x82_-\x00\x93I-`:F*$\xa9c\xd0x\xf9*\x22\xb7\x09\xfc^\x84\xa3X\xa9\x1d\x96\xef\xde\x8e\xccD\xa9\xce8FG\x87t\x90\xc7\xf0w\x90\x0e\xdcI\x01\x8f\xe5\xda2\xd9\xfd\x01\xa3p\x0e;\x8bgA\xfa\x83\x10\x91k!\xc1\x97\xac0\xcfS:\x91\x03O\x06\xb8'\x93\xb8\x9ey]\x06\xbdQ\xa4[\xe1\xa5\x83\xc3\xbd\xe5I\x1fFz\xb1\x17\x16&N\xe7^\xc4\x0eb\x07G*\xdd\xcd3\xc90\xe52\x81\x83\xfe\x17#\xb7&\x80P\x0e\xdc7\xf1\x9f\xa2\x8b/)+c\xa2q\xf4.+\xf5\xb3\x08\xb5{\xbaA\x84\xc0IJ\xcf*\x93\x8c\x83\x97\xe48\x93P\xed\xac\x1d\xebt&\xb2\x8e,\xa8tD\xfc\x95wG\xeb\xa3\x9bV\xbbA[+u\xb5\xbb\xfaEB\x97\x86\x9c\x09ig\x02!\xd9\xbeG\xfd\x17\xa1\xef\xfb\xdd1\x1a(\x02\x06\xedA\xf0FR\xf7s\x19\xc3\x7f\x03\xf7\x87 D\xe6\x8c\xca\xe0t\x80\xde\x12\xc6\xf8*\xca\x84\x993\x82H\x15\x831n\xbf\xe28ZG\xed\x8ec\x5c\xad3q\x13\x86\xa9\x8b\xc1M&LV\xa7\x86\xb6\x0cM\xda\x8eJ\xc9\xd2jW\xa1%\xb3VsZM\xcbh\xc8\xcb\x80\xc8\xa88\x86\xe4\xa2\x06u\x1a\x0dm\xd9t`I\xed\xd2\xe0\x93%\xda\xe2!^$\x8b\xc9\xe0\xc2$\xa3d\x95\xcc%\xfe\x0c\x0d\x15\xe5\xe9\x19\x8a\xf1\xf0\xcc\xa5\xc3\xfc\x8fp\x1a\x13\xc8\xcd\x84\x8ecWt\x13\x1d\xf4;:\xf0\xd4D\xf9\xa6\x0c\xab\x9b~\xe0\xbeL\xfae&u\x1d\xcf\xe5b(\xdb2\x10t|\x94\x05\xadB:\xbc\xe0\x0d\x95N\xc6!\xf7\x17\xec\xee^\xa9Y\xb3\xe6\xe5\x94;\x98\x09\xefV\x95\xe7\xc8c\x14y\xa7\x90\xeed\xe8q\x5cp\x22~_\x93\xf6\x84\x15\x91\xe5:\x15\xd3\xdbP\xac\xf6FK\x1f\xc0\xaa\xd2q_$~\x1c\xf1.\xc2w\x9f\xe7\x5c\x03\xec9O\xf9PQ\x8c\xf9tt7\x83\xe33GF\x15\xd23\x1chw\xf3\x10P?\xd4s\x1b-\xb82\xe6\xd0\xaf\x16\x10'\xa0w\x19d\xbd\xe0\xd2\x8c@\xbb\xd3@G{\xcd#\xe3\x17&\xa1A\x84\xaf\x0b\x09\xd9_\xa7\xdeC\x89\xea8v\xb9`I\xeaYE\xfc.n}\x91\xfb\x0dx\xea\xd8\xb3)\x06\xed;B\x92;\xdfG\xae\xe1\xc8\xf3\xa6\x9f\x98Ig\xa0\xddt\xcc{\xad\x16t\xd0\xcc\xa6\x1f\x9d\x06\xdf\x98\x8b\x82T\xe4d\x5cl\x85G\x05-\xa4\xc4\xc3\xc8\x9eD\x18Ww^:\xf9\xe1\xfa^\xa4\x08\xf5\xf9;:\xee\xe7\xf9\x0fW\x0e\xfd4\xb2@$~\x05\xc8\xf9\x1c\xd3_C\xf8Gt\xf3\x8ay\x06+\x22\xcc\x13\xd7\x128\xf37q\x1d\xe1\x17\xf1\xdcpJ\xd89C4\x8cK\xa0\xa7\xedZ \x1aO\x99\xc8\xae\xca\x94OT\x17\x83\xe7\x86\xd2\xa9\xda<\xa1KV\xa7\x86`F\x8c\x9a\x88\xa1TU6\xc8\xb8\xc9x8\xfe\xda\xfa\xf5\x9b\xdd\xd5|\xbf!\x95*dWS\x99\x92t\xe2!^\xe2\x09\x9f\x88\x0cn<b\xccHK\xf4b\x0d\x95i\xd9\xe8\xc0\xef\xb2\xad\x8e8\x06\xf1c\xf0\xd8\xc1\x04\xaf\x8e|\x12i\x1d\xcb- \xfe[`\xe7*/D>( \xee\xd8\xe1\xc8O\x87\xbe\x9dA\xbc\xd1\xa5\xed\x9c\xdbs,1\x0b\xff)U\xbc\x8a\x89h\x88S \x85\x1f\x9d\xdd\xd3y\xcf\x86\xce@\x06\x5cw\x1d\x87\x90\xeeI\xfau\xf8M\x86\xc74\xe4\xb8\x0dX\x15?yV\x92\xb9\xe0\xb5\x03Gu\x9c\xc8\xf1\xd8\x04\xe4\xbc\x9b\x89{\x8d\xe8p\x14\xa9\xb7\xc0\xc6\x92\xf7=\x06i>\xe5\xa70\x98\x87\xfb\xe9\x84H\xef\xa0\x8e\xe7\x83w,\xbcf\xe0'\xb1\xbb\xfc\x90\xb4\x8c\x98\xe3\x90\xef5x=L\xde\x04\x03\xcbD\xe8>3\xba\x8e\x1d\xe8\xdb\xd4c!\xa1\x8c\xf2;\xf8x}\xeb\x0d\xf4\xa0\x97Z\x9ccQ\xf4\xa1\xe3\xd8\xaax\x1dM:.\x19=\x9b2\xde0Q}1d\xb3\xe1WD\x99\xb7M9\xdaCFV\xc7\xa91\x8dZ\xba\xed\xc6K9\xf7\xc2c\x06zR\x9f\x98C\xfc8\xfcW\xf0\x0e\xd4W*r\xba\xbb\xf5w9\xf2\x9eE\x9f\xed\x0f\xfd\xa4\x5c\x22\xdd\xf9\x88%\xec{^|\xdaz\x04z\x9f\xc8\x9b\xc63\xa9\xfeD\xfa\xe3l\xc6\xc8\xa1\xe0h\x01x\x00}\xf4^\x164=Io\xa3\x7f\xbcF8\x99\xc9Cs\x86q+(2W\xba\x83\xce@\x80\x17j\xc1H\x98hN1\xe5#a\xbaz\x8aW\x97\x08\x137\x82N\xf5F\xf0\x91\x88\xad\xb7<\x0f\xf4\xe7\xfb\xd2I\xe9\xd4\x94M\xea\xea\x19S(V\x88r\xb5\x1a\x92\xa1t\x8e\x19\x09+\xe1+\xe3\xab\xde\xd1\xb8~\x97\xcb\x1a\xd7}\xae$\xee\x5c\x83~L\xa7\xbb\xd2F.^q\xc5}\x8b\x97\x7f\x03\x92\x1a\xdd\xec\x1a#\x86\x0d%\x07\x0e\xa4\x98DK Co\xbc\xd1\xe0\xd9\xb1\x8e{\x12\xe5\xc7\x12I;\x1f\x8cH^\xe3\xc6\x8dW\xc4\xc2I\x17\xce\xe0j\xccN\xaeH\x86/\x01-\xadF\xf7c\x10\xe8h\xb5\x98#\xaf\x09yz\x89B\xbb\xeb\xb4\x9cv\x00\xe8\xb3\x0a\x93\xef\xcf~B\xd2%/\xe5\xe8\xb8W\x0b\x87\x8c;\xeaQ\x89zlf\xe0jw<\x93II\xbb\xb1\xb4]\x12z\x8e\xe2U\x0a\xf5M\xa7\xdd\xf4\x08d':\xd3\xb3D\x1d9weA3-\xaa\x02i&\xd8\xa9\xd5\xd3K@\xa9\x90IEw\xf1\xfa^\x80\x0c\xb9<2h\xc4\xaeDcB\xa7F\x09\x1d\xfd`-/\xcf\xb4\xe5\xd9\xd62\xf4\xd6\x90\xbe&\xbd\x15\x9b\xc3\x92\x9d3\xd2\xd1\x93+t\xd8\xba\xe8\x94\xa62r\xafIXY\x17!\x19\x9d\x96\x8aQ\x1b\xd6|\xbf.%u\xc1g\x18\xa5\x98\x8bF\x07.\xf8Y\x86\xadL\x1a\xb50\xf5\xb08eW\x03\xecF\xf7\xe3\xe8WGy\xce\xff\xc6\x90\xf47\xc4\xefd\xe7q4\xbb\xb8\xe9eW\xf2\xdd#\x19\x93Z\x1f8\x1f\x8e\x1f\x89\xcfCW:fk\xc9\x02\xe0\x18B-8\xad\x8b\xa1\x01\x8fQs\xde\x9c\x8c\x81\xb6\xd7\x823v\xfc\xe8jP;5\xe3E\xbb\xc2S\xf9\x8d\x0e\xdc\x9d\x06Mr\xe9.6\xc9 Y$\x93\xeb\x8d\x9c\x0a\xad\xb3\x1aHK\x03\xda\x11\xb23\xbc\x1d\x22\xe70A\xeb\xb9\x98^\x829\xd6\x1a\xb4`\xb5\xb2J\xff\x07z\xfa\x8e\xdd\x99\x9e\x17\xdd\x02\xd6\x0f\xec>N&\xb4\x06-Xe\x11(\xfd\xeci\x16P\x89NE\x22\xf8{[$c;\xb5\x80\xa3\xc7\xbcgZ5\xeerb\xdd}\xde(\x89\x0b>Si(\xed\xd8>\x5c\xb1\xf6\xec+\x0b\x16k\xc7\xa6#\xae2u\x04\x99J\x9dl\x19\xab\x01\xab\x01\xab\x01\xab\x81_5\x90\x11\xa3\x16`\xd0rG\xb6n\xd2\xb9[\x9dZoV\xcc\x0e\xf7\xa6\xcb\xaf\x22\x95ll\xfb\xce\xac\xd5\x1f\xaf,\xfa\xfdes\x0b\xbf\x85\x93^ \xb1\x86\xaddUn\xa9[\x0dX\x0dX\x0d\x94\x9a\x06\xd2>~,O\x06MZ\x95\x91\x95\xb1\x95\xd1%\x99\x8b\xd7\x83j\xbd\xd8R\xc1\xad\x0bQ\xeb\xac\x06\xac\x06\xac\x06\xac\x06\xca\xa3\x06\xd22j\xe5\xcd\xa0\x99\x06\xb2\x86\xcdh\xc2\x86V\x03V\x03V\x03{\x96\x06R6j\xe5\xd5\xa0\x99\xe6+M\xc3\xe6\xf9\x83\xa5ao\xc3\x18\x1a\xd0[\x84\xfa\x13\xb7\xb2\xbd\xf1\x18\xe8q\xc1|\xb32\x9f\xb7\xec\x8e\x8a\x8b\x14\x90\x99.\xdf\x00\x92)\x83x\x959r\x81k\xcaDlA\xab\x81\x12\xd0@\xaa\xe3\xab\x04D\x89\x22\x99\x92Q\xf3\x194\x1d\xdd\x95\xe83\xb4\xcd|\x0cW>J\xf2\x0c$\x02\x0c\x9b\xea\x92\xd1\xa3H}\xcd\x80\xaff\xc7\xbc$/\x03\xd5\xd8\xa3H\xf0g\xdc\xc8\xc5\xa4\xdex*\x95\xe4\x0d\xb1\x13x\xb3.\xf2\xb5\x96\xb04\xd2\xe5\x1b\x96O\x10\x1eF\xb8\xc4/Q\x0c\xe2kaV\x03\xc9j \xd5\xf1\x95,\x9fd\xf1\x936j\xaeA\xd3k\xf0*\xeb\x18\xb4\x17Z7\xe9TR/\x85\xc8\x98\xdd0s\xc1\xd3\xf2%i\xd8T\x07\xea\xa3gl\x8eQ#TU\xd3~\xdd_\xff\xf2\xe7\xbfJ\xa5zI\x1e\xb2[WN5\x80\x11.\xf1K\x14\xcb\xa9j\xac\xd8V\x03\xa14\xa0\x97$Rq2h\x8eQ\xbb\xaea\xad\xda]\xeb\xd4zK\xbb\x9eT\x08\xc5+##\xf6\xc7Y\x0b\xff\xfa\xde\x9au\xfa\xc7|\x96\xe2\x8f\xb4kv\x1d\x9f\x82/\xf6)\xa6xt\x12\xe5Iv\xd5\xe1\xba\x86\xeb:\xfeuI\x91\xbe\xbc\xa1/M\xe8\x1f\xfa\xa1\xfe\xe1\x9f\x88>\xff\xc5\x89wI^\x84\x07\x7f\xaa\x0c}i#;\xc0Z|\x0cw\x04\xb4\xbba{E\xe3\x9d\xea\xd5\xab\x0f\x94\x11e\xb5_\x03\xf8P\xe0'2I\xaa\x9d\xc6\xf1Y\xa2A\xeegt\xa2\xc4\xd5\xa7j\xd8\x99<\x0cP/\xce\xe8\x1b\x91\x8f\xf2\x1f\xa2\xe7\x88gC\xe7f\xca_A\xbc.\xfe3\xe8\xddG\x9e\xfe\x0e\x91\xf0\xc2\xcc8tUV\xf7\x96=\x82\xd7\x97\xcd\xe3^.*^\xc6i\xd7\x1b\xeb\x02P\xe1\xc0\xf3d\xea\xa2\xaf\xfb7\xc2O\xa0.S\x04\x0fr\xfazB,\xfd\xf9\xf1\xf5U\x16v\xdb\xfal\xd7\xe9\xcaC\x0fQ\x17\xb9R\x9f)\xc0\xd2\xbe<\x14:\xfa\xcfVF/Q4u\xd1\xd7\xff\xf9X\xf2\xa7|\xec\xb9\x9b\xfbY$\xb5\xc3(\xf2_\xe3\x0f\xcf\xaf\x0b\x8f\xfe\xa7KB;\x90\x1e\x88.\x8f\xa6\x0f\x0d\x03\xac[\x02\xe6\xa0\xcb\xbf\xab_P\xe6R`\x1d\xc1\x89\xec\x80\x81\xb5\x04\xa6\x9b \xba\x81\xa3o\xfbE\x1c_\xcbHt\x01\xac\xbe\x8f\xa9\xcf\xa6\xdd\x0aM}\xffSo$G\x5c,9\x84\x00\xdf\x98\x17\xa4F\x08x\x22\xe0\xc7\xecw\x1c\xf3v\xe5\x1b\xacQ\xb2\x80\x7f'r-\xa0\xfe\xba\x83-\x87\xba]\x15\xaf>\xaeL\xeas\xfd\xf0\x83\xf1\xce\xa5\x95\x82\x1b\x97\xa8/\xe9Q\x05}\xed\x01\xf8\x9dE\x19\xcdC\xff\xe1\xa6\x84\x9bt\xadJ\xbc<dU\x1f<\x1d\x19\x9do\x86\x92\xd6\xff%\x8f\xe1\xeb,}\xc3\xd6-\x93\xe3\xcb\xd4ww\x84\x9a\xf0\x92u\xe6O\xcb\x8eQk\x92[\xa5^I\x184]\x1fs\xd3\x9c\x85\x8f\xfcg\xf5\xda\xf9\x08\xa8\x81\xb2Yq\xc1\x94\x97\xac\xd0\x89\xf0U\x07\xd5\x05\xbc\xc8N\x8dx\xda;5\xf1\xa5s\xc5\xbd$O8rL\x1c\xa1/m\xe4\x9e\xadS\xa1\xfb\x11ed\x18\xf4\xdd\xbc\xa3\xf9\xc6\x9d\x99h\xae\xd5 d\x928\x98\xfc\x8e\xf8B&\xf0b\xdf\xdbd\x806`\xe2\xfa\x84\xb2/\xd2\xf9\x1b\xb2\xa3\xecA\xfa(\x8cY%\xbc.\xadl\x8d\xa1\xec\x86\xd7\xa45\x87<}\xfd\xc1q\xaa\x13\xe9X\x17f\xc6\xa4+c\x02\x81\x89\xf8P\x97\x8b\xee\xe2\xb6\xeb\x97\xfa\xc5\xbc\x00\x94\xc9\xaf5\xf2\xe8\xa6\xe3?\xa9.\xd4\xf9/\xc8(\x83\x1c\xe8\x12\xe8/\xaaL\x98K\x17\xe3\xe8\xa2\x1d\xc4\xc2^\x1e\x9a\xf1K\x14ME\xf4\x093\xf4\xc1\xa7\x06\x8b~'\x18\xfa\xda\x97@_=\xe9mp\xd0]/\xe2\xffS\x1axO\xd27\xd1\x87\xf6C\x97\xb7S\xbf\xa7\xe8/\xed\xf8.\xe9{\xe4\xf5Y\xbcx\xb1\x16:\x8e#}%\x91i~\x83\xa6g\x93\x18\x8a\x84\x17\xc0R\xb6=<\xce&\x8c2h\x22\x1eK\x0e\xe5\xe1b^\x90\xba+\xfb\xd7\xdfD\xfd\x0e>\xcee\xb4\x94\xf0\xca\xa2\x0bG\xefD\xb6\x8f\xf9\xe8\xef\xc0D\xf5\x117\xf0\x8b]Z\xf9\xab\x14YY\x89\xfa\x12\xed3\x0a\xbd\xd7\xe1\xe3\xc4\x1dY\x80\x1c@\xd9U|\xad_\xc68+^\x9e\xf8\xf2\xad\xc8\xc8&\x05\x1a\xb5\xf0MU.L\xdd\x84\x97\xc9\xf1%z\xbb\xcb%e\xd4P\x921h\x0a5\xf9W\xbcm\xe1\x92\x9f\xa7\xaeY7 \x93\x15p\xefC{h\xdc\xaa\xb5\x05\xd0\xd5\xb3\xb4\x88\x17\x8c\xbb\xd2\x1e\xca\xb4aS\x1dT\x17\xd5\xc9\xf5N]\xdd:\x03J\xdf1\xe8\x03/\xc93\x94\x93\xb9\x0c\x91\x89[7\x1d\xeb\xc3\xb7\xc73\xe8$\xa6\x0c\x8e\x06\x81:\xb1\x8c~'Vkm4\xd1\xe0\x1f\xc2;+8\xe5\x1b\xc7\x84\xa3O\x15\xcd\x82\xd6\xf3\x84[\xf8\xfa\xc5\x5c\xe2}\xc0U\x99B&\xb4\x1b\xe8\xe8\x1d0\x88\xed\xf8P\xf0_\xe0\xe1\xd07\xe5\x917\xd6\x85\x991\xe9\x86\xb9\xf4\xd2\xd0\xf7\x862Z\xa4OA\x86;\x095\xf9E]\x00\xca\xa4{10]\x85\xa3]\x87sI'\xb8#\x88\x07\xbax\xfa\xf3\x16\xd0DN:\xe6E\xae\x067\x8e.B_\x1e\x8a\xce\x03\xfb\x07\xf5H\xeb\x12E##t\xf4\x81\xe23\x94F_2\x22\x8f\xe3\xdbk\x07\xa0\x1d\x04\xfd\xe6\x18\x166\xfa\x08\xb3nv\xb8\x81\xf8z\x167\xc7\xf1]\xcf\xaf)\xfb\x19\xcfP:\xe8.-\xe2\xef\xf2\xa1\xe8K\x84\x87\xcb%}\x19\xe1\x93N\xca\xf3\x03\xbe\xbe\x1e\x1f\xf7\x02X\xd0\xbf\xa3-nS\xdf\xf3\x14\x8dDc\xc9a\x10\xe0\x1dxA\xaa\xc97a\xc8~WL\x16\xe8?\x8cl\xaf\xe8\x9b\xac!\xeb\x13u\x99\xaa\xe1\xaf0Q_bG\xd5\x164\xdd\xa5\xd7_\xdfj\xd5\x8e\x9a\xfe<\x10\x1d|\x13/\xcf\xcb#N<n\xdd2=\xbe\xe2\xc8Q\xe2Y\x11\xcb\x9e$'\x19\xc3\x88a;k\xc6\x8fo\xbf\xd8\xb6I\xd5\xe3j\xd7\xba+I:\xc5\xd0]\x83\xa6\x0b>\xe7\x93i\xfe\x1c\xadm\xb8\x9c\xf8\xe6\x90\xc7\x00\xc8\xdcE\xa3\x9f\xac*\xba\xbb\xf7\xec\xc2\xb7\xa1\xed5h\xe2\xb5\x1d_j.\x99\xcb\x101X\x7fD\xb0\x1b\xf1c\xf0\xba\xb6C\x9f\x00s\x0c\x17\xc6\xee\x19\x06`\x03`\x1f\x80\xa7\x05\xc1c\x0c\x8eG\x08\xa3\x1c\x03\xb6-\x93\xdb{Q@7\xc1dv\x00\xe5\xc7\xe1?\x06\xb4\x00\x03\xd8\x980\xe6\x22\x08ZkM~<\xba\x0c\xd80\x97^\xbaR\xfc\x1a g\xdcK\x18\x91S\x97\x5cN\xfc\xb5D\xfcX<\xfdyKR\xef6\xa4\x13^\xba\xe8-\xe3\xd5\x05r%uy\xa8\x97\x8e'\xbe\xd3\xc4\xd91$}\x89\xa2)\x8b\x91z\x93\xfa\x0c&\xad~\xde\x039oB\xbe\xda\xabW\xaf\xd6\xae\x7f;\xe9\xc9|\x0d\x7f5y\xb9\xe8\xe7m`\xd5\xd0\xe9\xfb\xec\x10\xb4`hB\xbe\xd3\xfe\xc0\x9e\xe4\x98\xf7\x09`\x0f\x81w&\xe1<\xfa\xd7T\xc2(\x07~\xc2\x8bD\xe1\xa1\x8f\x1f\xc4rq\xe5p\x0bEt\x13\xef\x82\xd40\xfd.H\x16/,L}$\x13\x0b\xc0\xc0:%\xeaK\xe8T\xf3\xdc\x0c\x8c\xe8\x22\xb7n\x91\x80<\x19\xbc\xc0\xbc\x08R\x9c\x88\xb7\x1e\x06\xcd\x0b\xcb\xf4\xf82<vG\x98\x8aQ\x931\x93S(\xaf\x8e^\x01\xa3\xf0\xdeS\xad*T=\xa5^\x0d\x9d'\xa7\xe4d\xd0\x06\x16,z\xc0\xbd\xb1Z\x9f\xb1\x92\x97a\xf3\x1a\xb5\x5c\xd2y\xe0\xcc\xa9\x98\xb5\xe8\x81a\xad\x9a\x0eH\xe7n\xb6\xff\xfc\xb2f\xf85\x05\x85\x9a\xd8\x9dz\x10\x9az\x11u\xe2\x0aK\xcd1p\xc2^\xdax\x1bB\xf5f2\x19/\xe10B7\xd11\x8fR\x9c\xef\x10\xea\xa3\xcd\x83\xf0\x83\x99t\x0e\xa7\xf3\xbe\xc9J\xec+\x06\xcbg\xca7\x0e\xb8n\xd5=\xd2\xa4\xbd!yW\x93\xf7\x1e\xf4\xf5\x9c\xc1\xb9\x97\x8cc\x90K\xbd8\xb1\xe2\x09\xe8.\xa4\x5c\xe8\xcbE\x0d\x0f&\x8a\xb8\x17\x80R\xcf%\xf0\xd53\x99\xb0.\xa6\xfe|\x04\x0a\xa1\x9b\xf2\xa5\x8b\xe80\xa9\xcbC}\xbc\xe3&\x13\xe9\xc4_\x18\x83\xb5\x10=-\xa0\xaf\xe8\xd9\xa0\xbe\xee\xfe\x03;\x80\xd7\x990oD\xce\x8d\xd4S;\x7f=[;\x92t'vP:\xbe\xd2\x18\x14l\x12\x86\xc1\x19\xfb\xf4#]\x95\xa2>\xd7\x8d\xac\xab\xc0\x95\x81\x0br\xd2\xdd\xe1\xde\x0c\xd2\x87\x91^\xec\x85\xc5\x8a'\x92#V\xb9 8|S\xeaw>Zi\xd5\x07Zq\xfb\x122j\x11\xdd\x96{\xd3\xea\xf8o\xeb O\x86.0\xcf\xc8H;jnL\xc9%\xeaK)\x8c\xaf\x94\xe4\xc8D!M\xe4\x19s\xd7\x14,\x1c\xff\xfa\xb2\x22\xef\x9d?\xa1i\x1b\x83\xf6\x1a\xc6\x8aB:>[\xe7\xf1\xda\x05\xc8{a\x1b\x84+#\x98\xeaQ\xa4d\x95\xcc\xd0-M\xb7\x19f5c1d\xe2\xd0\x97\xde{\x90\x1f\xf7\xd2Fp60\x99\xd42t0h\xb5M\x9c\xc9\xe6\x5c\x8e:\x9a\x93\xde\x89Q\xd2\x83\xeb)\xe072\xf9&dG\xf7\x12\xf0\xaeLl\x9ah\xb2xfP\x99\xce\xab\xdd\x9f\x16;\x1b\xc8\x8b\xd0\xe7\x22\xc2:\xc2\x09\xe3\xe2\xd1%/\x99\xcbE#\xec\xf2\xf3\xe3_\x00\x8a\xdet\xb4\xf6\x1b\xe4w\x9e?\xa0\x83\x1a\xc8\xdf3B\xc0\x17!/\xa6\xfe\xbc\xa8\xe8O\xcf\x98b^\xe4\xea\xc5\x0d\x8a#\x97v\xd2\xa1/\x0f\x057n\xff\xf0\xf2H\xa4\x13/\xae'\xfe\x06}\xe5\x11\xfa\xceX\xc10t\x93\x09\xba\xa0\x8fSx^\xf6\x96`\xec\xe84\xfe*s$YIit\xc9\xbbY\xd9\xd5\xc01\xbb\xa2\x9d\xd4\xeb)\xe8\x0c!\xbb\x13^u,\xe6\x98(\xd3\xba\x006\x84\x1c\xc5x\xc6\x02\xa4\xda\xef\xbc\xf4\xd2\xadO\xa2\xbe\xc4\x22\xe2;\xf8}\xcb\xe2\xb1\xaf\xe1\x8b\xee\xff\xc0\xb8l\x11/O\xb8\xb4\xcf\xf7\xb4Gw\xc5u\x94L\xfc<O{\x09\x1c\xd7%\xeaK\x89\xc6\x97\xae\xb9a\xe1|b\x5c&\xa5\x94\x99\xcaN\xcd+\x9a:\xb9\xbcvR\x8e\xbfy~\xe1\x84\xad\xd9\xdb\xf3.\xa8_\xf7j/b\xbc\xb8\xcf\xa0\xe9\xb8L\x83\xca\x5c\x11\xb3\x95\xb89\x06\xd4\xb1\x89V#\x1al\x82\xed\xdce\x04\x93\xdf\xb1\xbd\xb2|\xc5\xd3\xfd\xe7/\x99\x00\x8d\x88\xec\xa2\xe7z\x82\x92qt\x8e\x0fXQ\xfd\x99\xc9w6\xf1sX\xf5N\xf7r\xd2e\x88\xe4\x15\x01\xd3q\xa8\xe3\x18\xdcZM_\xe7v,\x07F'\xbe\x81N;\x0c\xdc\x8b\x08\xa5\xb3\x88#\xaf\x22G\x1d\x9f\x90\xf7\x13\xc0<\xd2\xb3X\x95\xebYS\x94cG7\x93A\xd3\x0b\xda\xba\xe8S\xcfsj\x83\xfb/\x904i=\x04|4\xf0/\x80\xff\x08\xfc\xc7\xa8\xc2q\x12\xf1\xe8\xbay=\x19t\xe2\xf93\xb4\xabA{\x19\x13F\x9f8$\x95\xe5\x5c\x18\xc8\xb1\xeaHV\xf03H\xeb-\xd5z\xc8\xe9\x9c\x0c\xa0G]Tz'\xb0)\xd0\xd5\xaa\x5c;\x0c\xb5os|1\x07\xcf\x98\xfa\xf3!;\x97.b\xd4_\x84\xeeen^\xa1\xe7\x22W\x1fzt\x12\xb9\xbe\xa6\x9c\xb9<T\x06k\x16\xfe\x1d|\xdbh\xcc])\xea\x13\xd5?\x82p<\xb0\xb8:\xf1\xe0E\xa2\xd4['\x01C\x08_s\x81\xea\xffZ\xd8u\xd4\xf32\xc1\x5c\x99\x9f\xe6\xc2\xd6/y\xb1\xe1[@\xea_\x14\xc9vvj\xc2\xa1\xfe\xcfsO\xdfP\xa2\x8f\xd1\xb7T\xafbNm\xcdD\xd7\x9b~\xa4\x0b`\x8b\xe0\xdb\x00\x12\xa3\x98\xa0\x87\x17C\x0e\x00\x84\x91#\xa0X (\x8d~\x17\xa1\x97n} \x94\xb0/a|\xcfc\xec\xbe\x80\xbe\xb43\xe3\x05\xf0\x9dK\xe9{\x1f\xa9l\x9c<\xb2\xb3\x1e\x05W\x97\xdf\xde\x8a\x8eW\xe1\xbf\x00\xd6X\x19!]\xdc\xbe\x94h|a\x88u\x0c\xadg\xd8\xf5\xf1\x9aGw\x9bK\xea\x83\xc6(J\x9dZ\xbb;\x19Cc\x5c\xaa\x10\xaf\x86\xaf\xeez'\xfe@\xb3\xfa\xbf\xbd\xb0a\x83D\x13U\x96\xcf\xa0\xc9\x98\xc9k\x10\xc9k\xb0hr\xf2\x1a\xb5<\xd22j\xe2+\xaf\xab\xda\xab\xf6\xa8S\xa3M\xd8\xa3\xc8\x7f.Y\xfa\xec\x80\x85\xcb5\x90\xb5\xf3[\xef\x86&n\xf8\xca\x98\xeal|\x07\x9d%\xd3\x8d\x94\xf4%y\xc8\x11\xe8\xe8\xc4\x8d\x99$~\x22\xb3\x98\x8c\x8b\x16-j\xc4s\xba_\xc8s\x8e\x90\x02\x09\xb8@\x97\x8e.\xe8T\xbd#No\x8d1y\xadc@k\x91\x91\xb4\x8bEW\x84\x94\x17\xf2r\xd1(\xbe\xec,c^\x00\x0ab\x1e_:\xa8k&\xe8\xa8\x82\x01\x89x\xfa\xf3\xa3'{\xe9\xa2\xbf\xbcv<2\x00LX\xaf\x92\x17\xef\xf2\xd0\xa4\xfbG\x02\x9d\xf8E\x09\x95\xd6\xce\x9d\x17`\xaa\x07]\xb0\xa9\x97Kx\xd6\xb6\x10\xe3v\x08\xba\x9e\x9f\x88 uO\xf9\x22\xd1xr$\xe2\x1b\x94\x9fj\xbf\xf3\xd2J\xa7>\xa2\x93\xa8/Q\xe7Z,p\xb2\xb9\xccv\x95\x97\xaf\xe2q\xf2tkv\x1d\xfa\xd8r\x7f\x99d\xd2\x09\xfaR\xcc\xf1\xa5\xbf\x8d\x84\xb8(8\x19QR\xc2M\xca\xa8\x89\x03vMF\xcd\xec\x98d`*\xe3\x1d\xc3B(\xc3f\x0c\x5c\xd5a\xf9\x0dO\xea\xb9o\xdd+\x80\x05\xba\x18\x06\xcdk\xd8d\xd44\xc9z\x8d\x9a\xd7\x98\x1a\xbe\xa1\x0d\xdb\xcb\xcbV<7p\xd7\x0eM|\x8c!Sh\xf8j\xf2\x96\x11p\xf8b\xcf\xb4\x92\xb5\xcej %\x0d0\x01\xedq\x97\x872\xe9\x1d\xc6n\xe2*\x14R\x99\x05U\xef\x94\x14c\x0bY\x0d\x94\x90\x06d\xa0Rq\xda\x15h\xb2\x97\xb1\xd1\xe4/# /\x83 \xef\xec\xb40\x1e\x1f\xca\x88\x90.\xe6d\xd0\x06\x14,\x1a\xc6\xf1\xe1l2\x8dA\xd1\xaeI\xde\xa4\xcd\x8e-\x8a\xae'?\x0a_\xb4DS\xb4\xc1)\xe6\x5c\x83\xf6!\x19~\xbaF~c@U\xb7b;\x9fb\x04-\xc0j \x81\x06\xd8\xe1\xeeq\x97\x87b\xd0\xfa\xb2\xb8-\xe2\x7fT\xd7&\xa8\xbe\xcd\xb6\x1a(u\x0d\xa4\xb2S3G\x90\xe6\x18\xd2\x1c\x07zwl\xda9i\xc7\xe6\x1c\x11r\x14y\xa2\xf7(RF\xe7\xf6y\x85C\xc7\xacX=\x17\x1c\x19\x18c\xc4L(\x989zt\x8e\x00I\xcb\xf9yF\x8e\x1f\xc93\xbb\xb6*\xe7\xd5\xad\xd9zh\xcb&\xb7{\xdf\x8at\x8f\x1c\xbd\x06\xcdk<\xc5W\x86\xd3\xcf\xb3$\x8e\x1eac\x9d\xd5\x80\xd5\x80\xd5\x80\xd5@Ih \xe9\x17E\xf4|\x89U\x9av2rf\xa7&Cg\xbc\x93\xe1\xa6\xb5\xdb\xd9\xa9\xe7W\xd999\xdb\xf5\xf2\xc8\xe6\x1d;\xd7\xdf1\xafp\x88k\xd0\x22\xbb:\xf0\xbc\x06Mp\xed\x9e\xcc\xce\xc9\xec\x9a\xc4\xc3\xec\xa2\x0c\x0cP\xc4\x09\xb6\x03\xda\xb3\x08\xef\xbd\xafe\x93A\x95*dW\xd3K!\xc8 \x83&\xa3evi^~\xc6\x98\x19~\xe2a\x0d\x1aJ\xb0\xcej\xc0j\xc0j\xa0<i \xe9\x9d\x9a\xa9\x9c\xfbl\xcd<_\xf3\xbe8\xa2\x1d\x9b\xd9A)TZ/v\xe4\x9eT\xb3\xfa~\xf36nY?\x7f\xcb\x965\xa4e@\xcc\xb1\xa2\x0c\x8c16^\x83fvi\xc6\x80\x99]\xa2\xe1g\x9e\xe99;Bhh\xb7&~\xf2\xb9\xf9yy5ZV\xc9\xab6a\xf5\xba\x9fI\x8b\x9f\x8c\x971\xa4\x86\xa7\xd2\x82+_\xfcd\xa8e\xd0\x8c\xe1&i\x9d\xd5\x80\xd5\x80\xd5\x80\xd5@y\xd0@\xcaFM\x95\x0ba\xd8\x8c\x81\x91Q\x93!\xd2\x0b&2Pf\x87\xe752\xc6\xc0\x99\x1d\x9a10\xc2\xf7\x1a5\x196\xd1\xf1\x1b6\xf1\x8a2\xa2.\x9e\xf0\xc5O\xf4\x0c?c\xd8\xacAC)\xd6Y\x0dX\x0dX\x0d\xec)\x1aH\xf5E\x11\xa7\xfe\xeenF;\x1ac4\xbc\xbb!s\xbc\xa7gWz\xbbP~\xad'n\xde<\xf4\xee\x98\xfc\x06\xcd\xd91\xe9\xc8\xd3u\xce\xb1 4\xbc\xfcT\xc6\x18)\xd1\xf2\xf2\xf3\xf3\xf4>G+5\x83\xc6k\xb6g\xe2[![\x94\xe3?<M\x81w\x8f\x02\xdaDL\x0d\xe85r\x93\xc9k\xf1\xe7\xf0f\xa1\x162Yz\x1b\x0f\xdf\xc6\xe4yC/\x9e\x17^\x96\xe2zC2\xd3\x7f\x5c\xa5\xde\xc7\xd1\xb7\x9a\x94T=E\x1b\xdf\x07\x7f\x1e\xf2\xb7\xf0\xf2)\x0f:\xf7\xca\x1b/\x9e\xa8.z\x8d=^\xf90y|AD\x8bq-\xd4\xad\xcb\x80\x06\xd22j\xe2\x8f\xb1\x0924fG\xe4522h\xc6\x1b\x83f\x8c\x8c\x0cL\x90A3;4\xb1r\x9c\x8c\x1b\x11\xbf!5\x86\xcd\xf03\x86\xcd\xf03\xc6\xd4\xcb\xaf\xd4\x8e\x1c\x11\xf9o\xfc\xd9x\x9cwRv\xab\xa3\xeb=\x86\xbb\xf12\x130QE]T\x99\xae`\xfc/\xa8/\x93\x83\xbe<\x91\xb2\xe3\xffrQ\x97\xad\xa2\xd3\xe79)p\xbe\xa2\xc2\x9f{\xaf\xc1\x9f\x12D\xdc\x8b\x17\x94_\x16`\xc8\x1e\xb9\x185S\xf2P\xef\xdb\xa0uT\x10\xbdt\xdaC\x0b\x09\xda\xf2=\xfa\xed$xt%\xbc\x9c?\x07\xff\x0f\xd8\x10\xc3+\x1d\x9d\xcbH@\xeb)C\xab\xb4C\xbfn\xe2\xd5\x059{q\x9d\xcf\x7f\x93\x95\xd1\xcfc\xc3\x86\x0d\xa3\x81\x0dN\x96\x8e\xc5\x0f\xd6@\xdaFMdi\xf80\x86M\x06\xc5\x18\x1bc\xd4\xf4\x1c\xcd\x184\x19&s\xe4\x18\xf7%\x0d\xf8\xf9\x0d\x9b\xca\x1a\xc3&\x9a~>\x86\xb7\x8c^\xa9\xed\xd0\xe0\x15qL\xc0\xb5\xf8:\xc3\x93\x11@\x19\x8e\xa0\xdeL_Ty*\xf5o\x9eN\x95\xfd\x97\xad\xa6C\xcb\x96\xcdJ\xb9=\xf8\xa2\xcb\x85\xf4\x8f\x83\xb9\x9fO\xf7\xae]\xca\xff\xd4tsB'\xbc>'\x96\xb6\x83~%\xe8_\x9e6\xa1\xd4\x09\x84\xd6\x0d\xf5\x7f\x95\xaf\xfd\x9c\x9c\x02\xab(\x1e\xfc\x81\xfd\xda:u\xea\xe8k\x1c\xd6e@\x03z.\x95\x11GG\xdcA\xc76\xb4dt\x8c\xe1\x91\xa1\xd2\xd6Z\x06T\xde\xe4\xe9\x081\xc8\xc75h\x94q\x1c\xfc\xbcoa\x1a\xb0\xd9\xc1\x89\x9f\xbc\x04\x92\xf7\x1a]\xc3Sr9p\xc9N\xbcD\x1d\xba\xb9\x05>\x0f\xb3\xba\xbb\x94\xc1\xf0\x8f f\xfaf\x1b\x86O;\xb7\xd3\x95O\x99\xa8\xcb(\xfde8\xb2\x8au\xc1\xa7\xae\xb9Ht9\xa3>X<\x09\x9a\xd7\xe2\xf5y\xac\xe7\xf8\x12\xc1=\xc8\x17tQ\xe5vvo\xbdY\x95\xf7\x03O\xdf\xad\x9c\xc5`\xbe^\x9f\xf4\x92L\x94\x89yY#+\xd0q\xa0\x1cA\xdd\x1f\x03\xef\x04\xea~\x93\xca\xc8%{q%\xfc\x9d\xcbV\x93\xfdb\x02;\x89C\xe0};,\xdb\xe3\xbf\xe4sC\xd7\xf0\xff\xb1\x1f\x89gi\x07\x18\xef\xe2Q\xe1\x187o\xd7E\x92\xd2\xdbW\xd4\xe7\xff\x5c]\xbcL\xa8\xebA6\xbb\xf9W1\xd1_l\xca\xc0\xf7)\xf2_'\xff}tq8\xf0\xdbH\x1fD\xa8\xaf\xe1\x8f@\x1f\xa3=\xb8W\x13\xbf\x06_\x17\xff<y\x91\xd5;t\xf6\x07\xf6\x08^\xb7\x15\xf8/V\xadH\xfe\xdd\xc0/\x83\xb6\x16m1w:\xb1\xdaCG\x89\x94W\xdb\xe8\x0e\xb1\xa9\x847S\x8fi\x84~\xa7\xef@n\xa5-td\xa6Eb\x16r\xce#\x90\x8f8\xbeB\xd3\x19\x99\x9e\x87Vg\xf0?a\xe2\xbe\xde|\xe5%V\xdfT\x1d\xc1\xd7\x9dx9\xc4\xa7\x13\xef\x8f\x0c\xe3\xd0k3v\xb3Z\x10j\xe79\x87\xfc\xc1\xf0\x1fN^G1\x047\xd1\x05\x99\x81}]e\xbd.\x96nb\xd5\x05\xb9\x0ew\xff\x84\xee\xb47r\xa8\xed.\xc1\xef\x8b\x9fI?\xebK?\x9b\x99\x88\x07\x86\xfc:\xbe\xce2\x8b\xabf^\x82\xc6\xbd\xe0/\xa3\xee\x87S\xcf\xee\x84\xdf0\xd6.!\x1cB\x9d\xcf\x00\xf6\x0d\x9f\x94\xbb<??\x7f\xa9\xe8\x82\x1f\xaf_xY\xef5\xf1\x8c\xec\xd4\x8c\xb6P\xfc\x0e\xe2\xf22\x1c2\x1az\xc6\xa6\x1d\x94\x8e\xfa\xe45\xe0\x8c\x17\x5c\xf9\xfe\xb7\x0ee\xf4B9\xf8\x19\xc3\xe9\xe5gx\x1a>\x0a\x0d\x7f\xc3\xd3\xbb#\x94\xbc%\xee\xe8\x8c?\xf1\xd9\x9b\xcb\x11\xf9q\x8ep4\xb9\x16s\x89.\x10\xf4\x16`b\x88y\x11\xa7\x9e\xd10\xd8\x12^\xce\x88L\x15j\xd5\xaa\xd5\x15\xb9\xcea\xc0\x0c\xd2g\xb5\x80\x15\xbb\xa8\x12\xe3y\x01r\xf7\xe5\x93I\xbfc\x02k\x8e\x1c\xc3\x99d\xc6{\x9e'\xc4\xbc\xac\x91\x81}\x19\xf8\x9a$\xef\xe2\x06\xdf{\xbcuH\xe1\xe2\xca\xa8\x8b\x10\xbd\xb4\x12\xc4{1\x11\xf4\xacQ\xa3FS\xf0fb\xe4\xfeM\xe8\xf4\xfdx\x17#\xfai\xa2\x03\xe7\x22It\xb4\x95?\x1e\x1fB\xfe\xd1\xf8\x13\x80;\xc6G\xf9\xa4[\xfa\xca\xb5 ]C0\xca=\x81\xaeu\x1brk\xae\x909\x03\xfc\x86\x82\xcb\x91\xa7\xdb\x95+\xd2\x1e\xc7\x92<\x93\xbc\xfe\xeeG\xa9ex\xeb\x01\x9b\x88\x0f\xbcX\x95\x89\xedf\xf2\xce\xa1\x8e'P\xc7\x83)[D\xba+\xbe\x98\x0bj\x0f&\xf3K(3\x90\xf2\xbd\x90\xad\x012\xfe\x1dY>\xe6sc\x11\xf9\x0c!\xdap\x0c\xf1\xd5\x1c\x99\x15P\xeeE\x8c\xa1\xbe\xf9Wl\x1e\xa1|/&\xe3>\xec\xe84\xe9\xeaSk\xbdD#^\xdf\x84\xf7\x5cx\x9f\x8b,\xdb\xd0Ow.\xcaT\x9d\xb3\xe9k\xfan\xe9Bt\xd3\x0c\xba=\xc8\xbf\x90\xf0\x00\xd1\x93#\x1d\xd5/\xc8+vA&\xb0b}}W\xe9_\x7f\x83t\xa3\x5c\xca\x06\xd6\x05\xbe\x91\xf6\xc6\xc0\xe9\x99n?\xc6\xc8\xa9\xd4\xa3\x15\xf5x\x10c\xd5\xeaW\xea\xbbb1xh!Q\xc7\xc5mD\xa8K~G@C\x8b\x9f\xc6\x1ak\x84#\xd1I\x07\xc2}H\x9fK\x98\xb0_\x08got\xc5:c\xbaJ\xa0q\xfc\x86\xcdo\xdc\x8ca1\x06M\x06I>\xd4\x0e\xcd/\x1f\xfc\xbc\x86Mt\x0c]c\xdcd\xd0\x0cO\xc9R\xea\x06\xcd\xc8\xccj},\x9d\xf5\xefL\xaa\xaf0\xb8+\x1b\xb8B&\xb0v\x04\x09/\xa34e0Z}\x88\x07^\xf0\xc9`\xd2\xaa;\xee\xe5\x8c\xe4\x7f\x83<O\xd6\xaf_\x7f\x9d>\x1c\x0b\xad/\xf9(\xe9\x91\xc0\xf4acM\x8a\x1bt\xbf\x9b\xf8a\xf0\x06\x10<`V\xda\x0cZ\x0d\xb2i<O8_\xf9r\xd4+\xf0\xb2\xc6\xfc]+\xca\xcd\xe4\xaf\xf4_\xa7\xe1\x96{\x93\xf0\x0c\xc5\xe1s6\xc1\xe3\xf8\xc0\x8b+\x85\x93\x8ac2\xb8\x159\x16\xc8\x88\x22\xc7\x9d\xd0h\xcfd|\x04\xc6\xba5\xf1\x98\x17\x8f\x06\xf1r\xf5\xf6\x84\xf4\x86\x1e\xe6\x81\xf300\x19\xee\x84\x0e<]\xefr\x82\x8c\x94t\xcbNc\x84)\xe4\xa3;\x159'3y\x1d\xa1\xfcD\x17\x5cR\xf6\x0a\xf0\x1f\xd7\xceYu\x84\xee3\x14\xd3.\xbc\x98\x8b\xd1\x1e}A|\x84<\x1d!\xea\x82U\xdd\xde\xf0\x1d\xfd\xe8J?\x01\xb5!\xf5\xee\x08\xbf\xde\xf8Z\xb4\xd9\x18\x8c\xea,\xfci^\x5cvf\xfd\x90g\xa1\xbe\x1b\x09\xde+\xf8\xa3\x94\x9f\xa0on\xa5\xad\x96\x08O\xfa\x81\xd7F\x0c\xe7\xc1$\xb5\xdb\xbbS:G\xb6B\x0c\xc3-\xc2\x09\xeb\x5c\xdd\x16\xeb\xeb\xfe\xf21t\xa3\x8f7\x07\xd6\xc5W^\xf3Lm\x8c\xf71\x84y\x8c\xa9\x89\xe8\xe9\x1d\x1fNV,\x1e>\xbc\xa7);\x15\x1a\xcb\xa8\xf7\x04\xf2\xde\xa4\xde\x9f\xeb;\x90\xd4\xe5?x\x19\xbb\x84\xfd\xc2Gs\xafI\xe6\x94DMQ\xba9\x1a4G\x7f\x0a\xe5\xbdN\xc6\xc8x\xad\xb6\x14O\xc9\xb9\xfcTVF\xcd\xcb\xd3K/\xc2\x0b\xa0\x8a\xa4\xcc\xcfK4\xd98\x9d\xb4\x1fe\xa60\xb8\xff\xc2J\xec#S\x1e#\xa5\x95^\xe8\xcb(\xa1\x13\xf3\x82O\xf2\x12^\xceh\xf8\x9a\x902\xeb\xf0\xb1\x169\xdaY\xf6c\xe2\xba\xd1\xe0\x13\xd6C\x85\xdfx\xd2\x11}\xc6\xbb\xac\xd1\x83\xefDY\xcd\x87\xbd\xb8\xd2_4t\x9a\x897\x22\x9b\x8c6\xf5\xf8\x1a\xd9\xf3\xf1u\xf0\xca{\x0f\x98\x97\xde:\x0cJ>\x00\xed0\xe3:&\xd8\x8fX\xa4hu\x9d\x1b\x17\x91L\xf4{\x15\xc1\x9d\xec\x0e\x17\xc0o2u\xbf\x9b\x89?\xd0\xf8\x80\xb7\x1e\xb9\x9d\xf6\xa0\x9f\xc4\xbdX\x15\xba\xaa\xcb\xc4D\xfcc\xe5S^\xfdE\x93\xa7\xd7}\x08\x7f\xf5\xc9 \xb7\x03=\x8e%c,;\x94\x9a\xf4\xdd\xbb(?\x86\x9d{\xfd\xa0\x0f\xdaBG\x8b\x09g\xfc\x13$\xd57\xa9{s\xea6\x03~\xcb\x83\x04I\x05\x86\x0c\xf1\xfaz\x5c\x92\xde\xbax\x11e\xc0Y(]\x8d\xac\x830\xc4\xa3\xe11\x0a\xd9\xef\x92a\xf2\xe2\x85\x8cG\xfa+\xf8[\xbde\xa0\x1bI'\xea\x17\xder{S\xbcD\x8c\x9a\x14H\xe3\xaaa\x9c\xc6\xa1!\xfc\x06\xcd\xd1\xb1\x8b\xe3\xc4\xd3\xfd\xf1\xd0\x92A-q~\xa9\xca\xcb\xe0\xdc\xcc.\xedB\x8c\xda\xd7\x0c\x10\x1d+\x19WH\x1dB_F\x09n\xcc\x0b>!(Zz~\x13q\xa4\x0f#\xb18\x02H\x22\x22^\x0c\xa0\xfb\x91]GO\x19u\x9a\x0c\x98\xe0\x13^\x5c\x99)\xa6L<z\x11\xe1\x00\x0c\x8a\xbe\xc9\xf8\x0b\xed\xb0\x83\xa3\xc4\xee<\xcfX\x9b\x0a\x0f\xca\xeb\x18r\x05\xde\x99l\xe8z1\xc7\x14\xab\xef\x19\xe0\xf5t\x9f\xe3]\x86\xe1\x1cE\xba\xd8\x11\x15\xb0(\x87\xbc\x0b\x01\xc4\xbcX\x95\xfc%\xd4\xa5\x0b8\xa2\x9f\x8a+\xa4/\xaa\x7f\xfc`\x0aS\x8fC\xa1\xab\x9d[\x94\xd3\xeb\xe7\xec\xa0\xb4+q\x8e\xedi\xbf\xd5\xc0\x86p\x1cy3\xcf&[\x02\xff.\xaa@\xf1DR}\x139\x16#[[\x19O\xf1*Nn\x17\x04]&\x5cT\xc4*\x9b)\xb8;>\xc6\xd0\xc7\x9a \xf3c\xf8;\xa0\xfd\xc7L\xd1\xf7\xd3I\xd4/\xfc\xf8{K:\xd6\xca<\xa3\xf5G\xf9\x81.\xa3L<\xc4\x02\x99\x01\xf4\xa0\xec\xd6\xa8\x1e\x1e3X\xf5B\x86\xce\xc6\x1d\x03\xcc\x84\xa7\x09$\xf4e\x94\xec\x10tD\x14x\xc1'\xcfF\xd2\xba\x9c\x1194i\xe9\x85\x10\xc71a\xfe\x9d\x01\xda\xcf\xb6Z\xb2T\x00\x00\x04<IDAT\xf3\x97\x84\x1c\x06\xeey&?D(z5\xf0\x81\x8b\x0d\xe0\x09/\xae\x0c\xc1#&\x0a\x86\xe7J2\x9d\xbe\x8e\xce.#\xbe\x8e\xe75_\xe4\xe7\xc7\xbfx4\x88 \xedv\x10F\xf88\xe5\xc9@\x12\xe8\xe5\x8e7\x94&\xef\x07\xe8wv\x9f\x81\xe9!~'\xc0\xf2r\xba\x16\xe4:\xc2\x5c\xbd\xc9\xc9\x91\xd6hpu\xc5\x8c\xbe\x82\x13\xd7\xd1\xd6q/V\x85\xaf\xeeH\xbb\xd2\xfd\xbfS\x16\xc7\xaa2\xb4\x87\xc6!\x1a\xd5\x1e\x94\x7f\x0e\x7f\xad^TR\x19d\xea\x02\xbd\xe3\x80\xbd\xe0\xa7\x81\xf1\x1aB\xbd\xdee7\xa2\x974\xa4\xd3\x0a\x1b7n\xbc\x19\xdc\xa5\xd4i\xae\x1f\xdf\x9fN\xd479~\xdc\x0a\xad\x0a2\xfc\x94\xcdf\xa7\xa3\x97U\xe6a\xb4\xfa\x8a\x96\xeaH{\xde\xae\xb8q\xe0\xa7uA\xa6\xa1\xe3\x86Q\xba\xf1\xe5\xc5Lbt\xdb\xa2\xb73\x84\x80q+d\xcc\xbcJ\xb4a\x8c\x02)\xf1\xf0\xd3J\xd4/\xd4F\xee\x11\xbb\xbf\xe8\x1e\x9d.\x15\xa3\xb6Gk0\xc5\xca\xd1\xf1\x9f\xa5\xe8\xbf<\xc5\x9d\x0b\x04I\x9f\xa4\x9d\x8b<\xf1\xdf2Q\xc8\xf09\xabb\x0fn\x96\x0c#\x03\xc7\x5c\xf0\xf9=G`z\xbe\xd3\x12\xbfSy\xecD\xf4\xb6\xa2.g\xfc\x9e\xcb\x1e\xe7\x03\x9f\xc2\xb3\x96\xe1^\x1a\xb1\xe2\xd0\xfd\x80I\xedH\xca\xcefP\x1c\x88\xac#\x988&\xf2\x86\xd6L`\x13\x19,\xb3\xc9\xd7\xa4\xa97L\x13:\xe8\xbd\x86,\xba\xc0\xd0\x7f\xc4\xe5\x94\x85\xb6\x9e\xab5'|\xcd%\xa6\xfa\x8e\xc7\xcf5\xcf\xf1\x5cx\xaa\xc1Z\xe4\xd6s\x9f9\x10\x18\x04\x9f\x0beX\x88;\x17#\x12\x1e\x8bl3\xf0\x93\x98\xa0?$-\x03\x1c\xcbiAr\x11\xb83\xa9\x93v\xbe;9n\x1d(d\xed:\xc9{\x99\xe3\xc5\x02Xi\xc7\xa2\x85\x8bx\xea\x05\x89\x5c\xe2\xed(\xa7\xb6\x9d\xc8\xb3\x97\x09\xe0\xde\x8dn\xd7(?\x9es\xdb\xba'\xe5u\xb1\xaa.C\x9d\x06\xef\xdb\xd0\xab\xde@\xd4M\xd5\x7f\x22X\x83\xc1)$\xff\x07\xf2dd\xa6+/\xc8\xf9\xdbC\xed\x0b\xde\xe7\xea'\x94\x97\x81\xd0\xb3\xdfK\xdc\x9de\x14\x09v\xb5w\x01\x98O\xfexpW\xe1\xd7\x92>\x9b\xf4\xd9z\x06\x16\x85\x1c\x90H\xd47\xdd\x1d\xf3\xbb\xe8p\x16F\xa2?$\xb6!o\x0f\xc2S\xa9\xf7/\xb4\xcf\x7f\xe15\x0d]x\x17\xa9\x8f\x92\x1c\xaa6\xe1e\xab\xf7\xc9W\x1b\xc5Z@\x05H\xf5+\xc8\xaf\x9b_s\x12\xc7\xd0\xdb\x00d\x98\x85\xff\x14y\xae\xc2\x80\x0f\x09*\x95\x0e\x0f/\xbdD\xfd\x02\x15\x0cE\xa6[\xbde\xf6\x8a\xb8\xfa\x86\xf5eK\x07\xbcuV\x9b7\x11\xf5\xbc'T\xdb\xcc\x9a5\xab1\xb8\x9a4\x8b\xe13\xe94\x01\x9e\x17\x94\x97\x00\x96G\xd9\x1a>\x9c\x5cV\xa4\xcd\x81U\xf4\xc1\x8b\xf1\xf5\xe7\xabN\xc0*\xf8\xe1\xa5\x98\xae\xe0\xea\x22;\x88'\xc6\xbb&/\xeb\xec\x17\x94g`L\xb2'\xa3\xebIJ/[\xb6\xac:\xbb\x86\xba&\xcf\x1bB\xa7\x16\xedW\xc5\x0b\xf3\xc4\xf5\xba\xba\xda$\xa1\xce\x82p\xd4\xd6?\xff\xfcs\xb5\xa0<\xe98\xa0\xcd\x02\xf9\xc4h\x0f\xb5yh\xd9\xb8\xe8\xb2\x91\xf4\x16$K\x18\x98\xcb+\xb0o\xfe\xf4\xd3Ozf\x1b%;z\xad,\x18\xedp\x01\x86C\x0b+o\xbe\xfe\xd6P\xdf\x07\xf3\xe6\x87\x8e\xc7\xd0M\xa8\xf2\x9cf\xec\x13\xab_xeK\x87\x87\x97\x8e\x89\x07\xf5\x0b\xf4\xa1\xa3\xf6\x1c\x83\xb3\xb7\x84\xce\x00\xdf+\xac\xb7\xad\xa4\xd5@\x9a\x1a`\x02?\x99c\xb0A\xecx\xbb\xa6I\xca\x16OB\x03L\xce\xaf\xb1\xeb\x98\xc0\x8et\x12/\xa5\x1c@\xd1\xc1\xa4_`\x879,\x092\x16u/\xd1@\xcc\x87\xda{I\xfdm5\xad\x06Bk\x80\xa3\x9c\x05\x1c\x1d\xe9Y\x89u\xa5\xa8\x01\x8e\xe0\xaf\xe79Z_\x0c\xda)\xb0]\xc7\x8e\xe3\x1e\x8eF_)E\x11,\xabr\xa4\x01\xbbS+G\x8deE\xb5\x1a\xb0\x1a\xb0\x1a\xb0\x1a\x88\xaf\x01\xfb\xa2H|\xfd\xd8\x5c\xab\x01\xab\x01\xab\x01\xab\x81r\xa4\x01k\xd4\xcaQcYQ\xad\x06\xac\x06\xac\x06\xac\x06\xe2k\xc0\x1a\xb5\xf8\xfa\xb1\xb9V\x03V\x03V\x03V\x03\xe5H\x03\xd6\xa8\x95\xa3\xc6\xb2\xa2Z\x0dX\x0dX\x0dX\x0d\xc4\xd7\x805j\xf1\xf5cs\xad\x06\xac\x06\xac\x06\xac\x06\xca\x91\x06\xfe\x1f\xdd\xb4l\xb9\xfc\x8e_\xd9\x00\x00\x00\x00IEND\xaeB`\x82\x00\x00/\x14\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x01\x81\x00\x00\x00T\x08\x06\x00\x00\x00d\xdd\x8b\x0c\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x01\xd5iTXtXML:com.adobe.xmp\x00\x00\x00\x00\x00<x:xmpmeta xmlns:x=\x22adobe:ns:meta/\x22 x:xmptk=\x22XMP Core 5.1.2\x22>\x0a   <rdf:RDF xmlns:rdf=\x22http://www.w3.org/1999/02/22-rdf-syntax-ns#\x22>\x0a      <rdf:Description rdf:about=\x22\x22\x0a            xmlns:tiff=\x22http://ns.adobe.com/tiff/1.0/\x22>\x0a         <tiff:Compression>5</tiff:Compression>\x0a         <tiff:PhotometricInterpretation>2</tiff:PhotometricInterpretation>\x0a         <tiff:Orientation>1</tiff:Orientation>\x0a      </rdf:Description>\x0a   </rdf:RDF>\x0a</x:xmpmeta>\x0am\x05\x0b\x9e\x00\x00,\xe5IDATx\x01\xed\x9d\x07\x98\x15E\xd6\x86\xefd2\x03\x0c9gDQ\xc0\x80(\xba\xe2\xef\xba&\xdc5\x80\x80\x22\x82\x88\xa0\xe0\x82\xa8\xe8\x82\x22\xae\xe2\xa2\xe0\x82\x82b@]\x04Y\xc5\x88\xbb\x18APTdA\x14\x03\x229\x89\xe4\x01\x06$\x0d\xfc\xef\xd7t\xdd\xa7\xe7\xceM3sg\x98P\xe7y\xeaV>u\xea\xeb\xeas\xaa\xaa\xfbv\xc5\x1d;v\xccg\xc9\x22`\x11\xb0\x08X\x04J&\x02\xf1%\xb3\xdb\xb6\xd7\x16\x01\x8b\x80E\xc0\x22 \x04\xac\x11\xb0\xe3\xc0\x22`\x11\xb0\x08\x94`\x04\xac\x11(\xc1\x17\xdfv\xdd\x22`\x11\xb0\x08X#`\xc7\x80E\xc0\x22`\x11(\xc1\x08X#P\x82/\xbe\xed\xbaE\xc0\x22`\x11\xb0F\xc0\x8e\x01\x8b\x80E\xc0\x22P\x82\x11\xb0F\xa0\x04_|\xdbu\x8b\x80E\xc0\x22`\x8d\x80\x1d\x03\x16\x01\x8b\x80E\xa0\x04#`\x8d@\x09\xbe\xf8\xb6\xeb\x16\x01\x8b\x80E\xc0\x1a\x01;\x06,\x02\x16\x01\x8b@\x09F\xc0\x1a\x81\x12|\xf1m\xd7-\x02\x16\x01\x8b\x805\x02v\x0cX\x04,\x02\x16\x81\x12\x8c@bq\xec{\x1c\x14\xae_|4\xcf~5/\x1c@6\xcf\x22`\x11(1\x08\x14\xab\x95\x80\x94\xbf\xc8\xbdz\xf2\xe5\xe2;\xbf^\xa1\x12~\x82\xc2J\xf3\x12\xf1\x13Bk\xd7\xaeM]\xb9rec\x1a\x8f\x85!6}\xcd\xd7\xbe\xacX\xb1\xa2\xdd\xe6\xcd\x9b\xd3b\xd9\xc8\xfa\xf5\xeb+\x81C\xfbX\xf2\xcc-\xafU\xabV\xd5\xa5\x8f\x8d\xa8\xaf\xb1R\x14\xa8@\xae{\x10 L\xbb\xf2-\x15q\x04\xe2\x8a\xcb\xa4\xd8\xa3\xfc\x8das\x14~\xef\xef*\xf7H(\x970&3#\xf3\xae\x17O\xdb\xf9\x0a\xd7K\xab\x00\xe3\x8e\xea\xfa\x15\xe0\xca \x1e%s\x0bM\xfe\x8d6\xeb\xa9m\xe8\x10\xb2\xff\x82{\xbaI\x93&\xcf\x12wdrr\xa2\xf8A\x81\xf68z\xf4\xe8\x14\x8ano\xd6\xacY\xd5(\xaa\xe4\xaa\x08\xed\xf4\xa6\x9d\xc9T\xfe\x8dv$\xfb\xe1\x5c1\xcaZ)\xe1\x97_~YIR\x03\xdc@\xf8N\xc8\x9a\x9d\xff1\xfau2\xd7\xe21Z:\x07?\xd5mQ\xd7d:n8\xd7dc\xfeK\x91\xf3\x16\xf2r\xdd\xa9\x9b\x92\x9c\x9c\x5c\xe6\xc8\x91#G\x1b5j\xb4;'\xadS\xb7\x02\xe3\xc0\xa9#\x8c\x9a6m\xda='\xf5m\xd9\xc2\x87\x80Q\x98\x85O\xb2\x1cH\xc4`43\x13\xf5G\xb38\xcd\xae\x13\xae\xf9\xb0J\x9b\x94rI/$\xfa\xe2S\xe5\xf7\x5c\x5c\xf9&7\xcf\xc9W\x19\x5c\xbc[\x9f`\xfe\x12\x06\xe0!\x14\xcd$\x8f\x01P\x83\xc9\xc4O\xe1\xc6z\x1a\x85\xf8V\xfeJ\x90{\xee\xc8h\xb6\xd0rd\xa4\xa2h\xd1\xe1\x1b\x1f\x1fo\xf8GQ%6E\xb8\x1ew\x81\xfb\x12\xbav\x19\xce\x18\x001\xd75\xe9\x89\x9b\xc3\xea\xa0ZlZ+T\x5cn>p\xe0\xc0\xce\xcc\xcc\xcc\x1fr*\x15Fq\x9f\xa9\xc3}\x93a\xc2\xd6/\xba\x08\x14y#\xe01\x002\x04\x8eR\xc7O\xec\xfc^\xe56\x95\x9b\xc4\x7f\xe0\xbd4eR\x93\x9e\xed\xf3}\x95\xe7\x95\xefq\xaa\x97\xef\x86`\xfb\xf6\xed\xe5i\xe7^\x9c\xf6\xa3\xe6\xe2Z&$$TG\xf9u$\xe95\xe2\x07\xf0G)\xbf0\x123\xbe\x97\x90\xb5m\xa9R\xa5NA\xbeX\xac\x02\xd4\xcd\xcc\xc4\xc4\xc46\xe0p\x06\xcaebA\xf6\x9b\x19\xed\x05\xb47\x1a\x97\x04\xf6\xdbp\xbdSRR\x1a!\xcf\xa9\xa4\x8d$~\x14#\xd0\xd4]\xfd\x90d\xc9E \x13l~W\x18|\xfc\x06\xc1\xa2St\x11\x902,\xb2\xc4`\x94\x02\x17\x19\x03\xe0\xac\x02\xda\xdc\xee\xab\x9czR\xe2\xbf\x13}q\xde\xd9\x9dS0\xa9L\xe2\xf5\xbd\x96\xa6\xc5\xff0i\xfb\xd0\xff=\xed\xdb\xe5$\xfa|G\xf0e\x08t\xe3\xe7\xcb\x8ct\xd7\xae]\x8da-\xf9D\xcbP\xaa?\xe3\xab\xad\xad\xb8\xb9<#\xa8\xd1\xa0A\x83\xdf\x08;\xc4,\xf5M\x02\xb5\x91i\x0c\x0a\xf2\x0d7\xd9G\xfaW\x84\xd5\xf5\xc1\xa4+\xec\xa75k\xd6\x9cz\xf8\xf0\xe1\x7f\x92w\x06\x89kp\xcf\xd0\x8e\xb6\x98\x1c\xf2\xf0|\x02Y\xea\xe3:S\xb6\x01\x99\x1f\x97+W\xee\x96\xdf\x7f\xff\xbd%\xb3\xc3\xfbH?\x9f\xf4\x85(\xfd\xb1\x8d\x1b7\x9e\xa3\xca\xcc\x88/%}\xc4\xc1\x83\x07\xd3\x89^\xa24dn@{\x8f\x10\xfc\x03y\x15\xa8\xf3\x13\xe1\xff\xc2kl\xcd\x9a5\xf7\xab\x0c\xca\xf6f\xf2\x06\xe0\x9a\x12\xddJ\x99oq\x8f!\xfb\x02\xe5\xd3\xde\x8bx\xb5)\xe7\xedg<\xf1A\xd4\xb9\x16'\xa3\xb3\x09\xf7ERR\xd2\xb0\x86\x0d\x1bn!\xec\x90\xa7?cI\xa8M\xd9.\xb8V\xf0_\x85a\x19\xc2V\xc7l\xb7h6\x8fr/\xe04\x09\xca\x80\xefY`\xbf\xd6S\xe8{Ve\xab\xe1SZ\xc6\xcf\x93\x1eQ.\xe1\x84\xe1\x18A\x9dt\xea\x0f!|?\xbe\x0c\xfd\x06\xdc(\xf8\xbdK\xdf\x86\xd1\xf6\xd5\xb8T\xf2^+]\xba\xf4\x83u\xea\xd4q\x14\xab\xe9\x13\xd8\xff\x93\xba\xad\xa8\xd3\x95r\x15\xf1\xbf`\x0bgP\x80\x9c$g%\xc6@s\xb6y\x1e&\xb5\x1d\xae\x14u\x17\x81\xc5\xfd\x5c\xc7\xc5*\x09\xff\x19\xa4i|H\x89W#\xae\xeb\xf0\x11r=\xa0\xb4H\xf5U\x86zR\xfe\xa5qv% @\x8a8\x15Y#\xc0\xcdc\x0c\x80nd\xb3\x0d\x94\x84\x01\xa8t\xe6\x80j\xffI\x88\x8b\xab\x17\xea\xda\x94*\x9b\xd0\xad\xcd\xc0j\xad\x8e\xc4m\xbdb\xc9D\xdfN\xb7\x5c&\xbe\xd8\xca\x8f\xf9s\x02\x14\xcd\xcf\x87 Xk\xab\xa1?7\xdfE\x84?\xa0\xbdOP\x88\xef{\x0d\x80\xda\x87ZS\xae\x11\xf9\xd5\x8fG\x8f\xff\x92v\xb6B(\x89@\x03W\x01\x85\xfc\x05Y\xe5(\xa3\x22\xa7\xe1&\xd1N\x1a7\xb8\x14\xb5\xc8\xe1I\xbef\xddiJp\xcbv\xcf\xc8\xc8H#|\x0eI\xe5\xdc\xf4\xcbPB\xf5\x09K\x09\xab\x9c\xf2\xa5X\xb6+\xbee\xcb\x96\xb2\xb47\x9b4\xc9\xb8\x07\xb7\x9e\xf0\xe9d\xb5\xdb\xb7o_)\xfca\xb4\xdd\x8f\xb4gT\x1eZN\x99\xca\xc4\xaf\xc2]\x8c\x01\xa9C\x9feP\x02\xfb\x19G\xbdY\x94\xf9\x93S\xeb\xf8O\x0b\xbc\x16\xb4\xf7g\x94T\x07\x0c\xc1r7\xcf\xa9Kx\x22\xe5\xab\xbai\x92\xf54\x14\xe1\x04\xe2'\x994\xaf\xbfa\xc3\x86Z\x94i\xec\xa6M\x08\xa6Xy>1\xc5[\x87pTr\xc1\xd7\xe0t\x88\xb0\x8cty|\xb1\xd2\xb6\xd2\x14\xfa6\x9f\xb8\xbfo\x84\xefak\xe6\x7f\xe4\xbd\xa1B\x90\xd3'\xb0\xd7\xb6\xa1\xf7\x1a\xff\x99\xe1s\x1e\x06\xa4\x05\xe3e\xdb\xf1\xa2Y\x7f\xc9\xbb\x80:\xff\xc5\x95!g/N\xe3\xedR\x0c\xedE\x18\xb5\xbf\xd0\xa7Y\xc4[\xe3\x1a\xe0D\x1a\x8b\xed\xb8.\xab\x15\x89\xb2\xbe\x8aJ\xf9\xa7Q\xcf\xae\x04\x84F\x11')\xcf\xa2L\xc6\x00\xc8\x98%\xc9\xb5\xed[uRBr\x9c\xa3\xb8\xc2uLed,\xae\x9c\x96\xda\x86r\xc98\xf1\xd0L\xdd\x99\xad3\xc0\x8d\x91!)\xef\x84\xa29\x80\xe2\x1e\x04\xdb\xa3\xe2\xc6\xcd\xd7\x147\x90\x9b\xfd]\x14\xc3*\xdc\x1d(F)\xcf\xdcR2\xbc\xa7\xe1Z\xd2N\x17\xfc\x1f\xc4\x886\xee\x0b|\xa3\x87<m=]\x8ekm\xca\x11\xfe#\xf5\xc6\xb0\x1d\xd2\x8c\xb4\xc7\x89\xab\xee\xc9\xabW\xafn\xaap \xa1\xe8\xcf&\xbf\x11\xe9\x870p\xf514\xa7T\x86\xa8\xfb\x183\xd61*O\xfe\xf5\xf2\xc5\x0f\x05\xd4\x822\xd5h\xa3#\xf1;]\x03\xa0\xec,\x84\xb2\xeaC=GIR\xf6^\xe4\xa9\xcfL\xf6R\x0am\xc6\xa5a\x08\x8cQ\xf1\xd7\xa3\xbcVrW\xc3\xb71n\xbc\x9b\xd1\x02\xd95\x93\xceF(\xdd\xb6&\x91\xf2R\xc0\x11)\x17riLM\x01\x9b\x16\xb4q\x8f\xdb@Y\xfc:\xf4\xeb\x02|)\xdf\x8d\xf8\xc2\xe9*\xf9\x01\xb4\x8fr\x7f\xa6LK\xd2\xb5\xba\x93%\xa9\xccx\xb9/\xa0\x9c\x13E\x81\xa7\xc0G\xab\x1b\x19\x80\x17\xc0\xbb\x12N\x8a\xfa\x0e\xe2\xba7&\xa8\x0cXv#\xfcO\x9c\xae\xcb6\xbc\xf3\x91\xf1\xa1h\xeb\xbb\xf5d\x04$\xb75\x02\x02\xa2\x88S\x914\x02\x0c^)hc\x00\xa4\xb45\xc8\x13o\xfa6mbr\xb9\xf8K\xa2\xbd&2\x045\xda%\xcd\xec4\xc51\x04\xe2a\x8c@\xbe\x18\x02fp\xcfpc7G\xfcI8g\xbbD\xb2r3\xd5\xc5\x8dG\xc1\xbd\x14\xad\xecA\xca\xed@\xc9\xf6\xc3-\xa3\x9d\x19\xe4\xdf\xe9\x96)\xbb\x7f\xff\xfe3\xbc\xe5ik\xb4f\x85\xb8\xefH\x7fGy\xa4\xfd@\xbd\x91l\xa1\xac@\xc6\xa7Ly\x94N\x15\x13\xf6\xfa\xc8/\x05\x22JF\xee9(\xc9G\xd9\xf2jG\xfbC\xeb\xd5\xab\xe7l\xb3\x992\xf0\xd6\xcag\x1a\x8a\xe66\x94\x90\xb6\xc2\x9e;^5\xfb/u:+\x15\x7f\x09\xf2\x8cF\x9e\xf5leh\xc54\xce-\xddq\xd3\xa6M\x812\x8d\xa2/o\xc3W[8\x8f\x18\xae\xb4[\xc7\x84\xbd>\xfd\x93\xd1p\x88\xf22\xfe\x11\x89r9\x95k\x072\x0dh\xc8\xaa\x05\xb9\xc6S\xdf1\xfe4\xf4\x00\xfd\x9aG\xdeB\xc2\x1f\xb9\x0d\x07\xf6G\xd7\xe3\x1f\x94\x9bI\xdde\x94\xd5\xb5\xfc\x9f[\xb6\x83\xeb\x07zm\xa8##x\x8c\xfe\xcd\xc4\x00\xb6\xc5\x9dI|\x11n\x0f\x85\x1b\x92\xdf\x1a<\x17\x91\xbf\xd2\xad|\x10\xde\x9fc\x90\xb55\x19U}\xb7\x9ec\x04\x08\x1b\xdfM\xb6^QD\xa0\xc8\x19\x01\x06\xb41\x00\xc6\xd7M\x9c\xd8}~\xda\xed\xa5\xcb'\x5c\x97\xd3\x8b\x90\x10\x17_\xb1\xe69I\xef^\xf7Y\xa5\x1b\xc5\x07\x97\xaf\x86\x00\x85\xb6\x92\x1b\xbb?\xdd\xa8\x8cB\xbc\x10_\xb3f3\xb3\xea\x9a\x87\xb7Q\x9c=\x07\xd3\x7f\xda\x98\x0b\xef\x83\x8as\xf372\xe9\xf2Q\x02\xde\xb2Z\x15\x88\xfci\x947i\xc7s\x82\xfc\xa2\xdc\x96\xc2\xe7Q\xb5Ay\xad\xa6\xee\xc5\xff\x18c\xb0\x14w\x96[e\x18\xf9\xcb\x08k\x8b\xaa;\x06e\x22\xdb4k1\x08\x9a\x89\x06]iQ\xae\x99[\xf7c\xd77\x9eQ\x98>f\xf2\xcdM\xa2|o\x7fP\x9c\xc68y\x8bd\x09S~\x89I\xa0\xbd\xf6&\x1c\xce\xcf\x85\x5c~<\xe1\xab\xad!\xb3\x02\xf4\xa7\x93\x16\x12go\x9f\x5c\xb9>\x94\x0f\x9e\x0d\xe4\x07\x12\xbc\xb4e\xa6k\x1d\x07\xce3\xc1y\xa1\x1c\xe1/I\xab\xe0\xe69e\x02\xebz\xf3\xa2\xac\xef\x8cWd\xb1+\x81``\x16\xb1\xb4\xa8fA\x85\xa5O\x0c:)\x0e\xa3<\xcc\x0a \xb9\xcb'\xa97T\xac\x99\xf0Pn\xe5\x94!\xa8\x5c;\xf9)\x0c\x81\xef\xb5\xf3wM\x09\xe0\xe3<#\x08H\xcbU\x14\xe5x\x197\xf7Z\x14\xd5O8)\xe8O\xe5P\x8a[\xb9\xf9\x1e\x13S\xbaX\x0fo\xab\xc2\x22\xd2\xf5\x00.\xc7\x04O\xbd\xff\x9e\xa2\x8a\xf8\xbf\xe5\x98A\x14\x15\xe8\xc3\xdf0Z\xe3\xe0\xdf\x1d\xd7\x01w1\xd5\xf4`v\xb2|\xcdb\xf1OF\x96\x8b\xf0/\xc3u\xa4\xcci\xf8\x83H\x9bO\xfe\x9b\x84\x03i#\x09\xf5)w\xba7\x03\x9e\xa7\x93f\x926\x98@n\xfc\x86<\x5c\xa6\xfde\xf0\xd33\x83\xfel\xc3=\xeb\xce\x86\xfd\xecX\xb5\x0c&R\x81\xed\xa8\xf1\xe4\xa5\x13\x8eV\xae\xc6~&1\x0c \xeb\x19b\x87\x1f\xf4Z2\xae\xd6\xb3\xf7\xef\xb4Hx\x08\x81-N\xc4\xf3\xc3\xa4c\x91'\x9a%\x98\x93\xfa\x15*T\xf8\x0b/\x11$\x81\x8b5\x02YP,\x9a\x91\x22\xb3\x12@\x09\x18\x03 _\xc6K.\xe9\xd2g*\xb6\xae\xd20e|,\xe0\x97!\xe0\xcd\xa1I.oa#\xc73f\xa7\xed<5\xc1\xd2\xbc\x1el\xa6q\x13/B\x01\xfd\x1d\xe5y!\x8a\xa6*\xe9\xff\x07c\xadBd\x002\xcb\x96-+\xc5\xa9\x9b\xdd,\xb5\xaf\xd4~-I\x09\xd4\xbbUy!H\xff@\xee\xa2<|m\x83\xdc\xaf0<\xb5=\xb0T\xe1\x18\x93\x1e\x94>\xcc\xfe\x7f\x22\xc6`\x1c\x0a\xfdZ\xdaq\x9e\x01\xd0NS\xb5E\xfeE\xc8\xd2\x9d\xbc\x8fq\x83qz\x06\xf1\x8d\xf2\xe8\x9f\x99\xf1+\xea'\xf2\xe7\xb8\x91?\x80\xd1\xb9\x0ao\xdc\xb8Q\x0f\x94oS\x98\xfc\x15\xac\xa6\xf2d\x04\xc4\x07Y\xfb\xc0Ko\x83\xa5\xb0\x9d\xb5\x009o\xc7\x18\xe89\xc2\x99\x84\xc70\x83~\x02\xf7 yS\xddv\x0bD.\xb5%B\xae.\xee\xaaP\x7f0\xbc\x9a$\x8d\x13\x91\xb6\xf0\xb2\x11\x0a^\xb8\x9a\x15es\xae\xc9k\xb8ir\xf4s3\xfet\x8c\xdfr\xb7\xa2cMi\xa3\x92\xfb\x1c*>'\xf5\xf7\xee\xdd{9\x0f\xa9\xc7\x80\x93&,\x96\x8a8\x02E\xc2\x080\x88\x83\x1a\x80+\x9eO=\xad\xee\x1f\x93\xdf\x8a\xe55\xd0\x9bC\xdd>\xaft\x03<edb\x86\x0f7\xdc\xc9\xf0\xd3?\xb4K\xe3\x863k\x9b\x8d\x92\xd9\xca\x92\xfd\x13\xe2\xe6A\xf6\xa3\xd5\xabWwfWty\xa6\xfaE\xdey\x94\xdb\x8e\x22\xd8N\xf4\x19\xa5\x05#\xca'P\xee5V\x1b\xdb\xf0\xd7PO\x8aC4][P\xc7\x83\xb1\xfbE\x9e\x9e\xb41\x8c\xad\x99\x95\xb4\xa9g\x02/\xd0\xeeSj\x81t\xadp\x84\xdf$\xd2\xa6Rv\x15\xf9z3\xe6=\xd2\xda \xab\x0c\xd3\x5c\xc2\xd9\x88Y\xe6h\x12\xd7\xe0\x12\xc1h>u\xd6\xf1Lc3<\xdbR\xef(\xe9\xb7g\xab\x94\x8b\x040\xf9\x92jw\xe2\xb4US\x119'\xa0\xd8\x96\xb9[(\x9aI\xcb\xe0\xfc\xc8\x7f\x07z(\x5cPr\xa9-\x97: \xd3f\xfa\xff\x1b\xf2i\xc5\xa4\x07\xffzG\x7f\x94)\xe0\xf5\x99\x95\xa7\x83\xa9\xf3\x00\x9a\xf2}\xc1[u_\xc7}\xab\xb1\x86\xaf\xbe:D\xb9\xf9n\xb0,}\xdeD\xde\xe4h\xeb\xeb\xad0\xf8\xff\x8b\xfa7#\xdf\x08\x97\x8f\xf5\x8a0\x021Sr\xf9\x85\x01\x83^\x06@$?\xc1u\x89\xa7\xf4\xf4U\xa9\xf1\x87\xa4)\xda\xcaQf\xac\xe8\xe0\xfec_M?o\x97n:\xb5%|\x8c\xcbS\x13(\x9d\xf7\xb9yd\x08\xa6\xe2\xd6\xd0-g6\xe62\xfd\x95\x1bs\x003\xe5\x07\xdd\xb8\x8f\x19\xf6\x8b\x84?\xc0\x1d\xc1\x95\xc3m\xa7\x8c\xb6T\x82\x12\xbcw\x90\xdf\x03\xbe\xc9\x14H\xc4\x97\xc2\x9cZ\xa9R\xa5~A+\xe41\x11\xa58\x836\x1e\xa6]=\xe0\xee\x88\xbb\x19W\x1f\xf7.o\x9b\xdc\x84\x7f\x04yn\xc4\xff\x822\xf5\xf0{\xe0_\x81\xdb\x82\xeb\xc5\xcc\xf4+\xd2\xb2\x91\x8c \xf5\xf4\xe6\xcc\x0c2\xa5\xa0UW\x0a\xf0G\xc2\x17hU\x91\xadR.\x13\xe05\x9e\xb6\xf4<\xe3}\xf8\xef\xf1\xb09L\xfce\xfe\x18w\xb1y\xc8]\x90rI\x0e\xda\x7f\x08o\x0e}\xae\xea\xca\xb5\x19Y;!\xb3\xb3Rt\xd3\xb2x`\xaaIB7\xean\xc0\xd7\xab\xaa\x9d\xf1\xb5=\xf7\x09\xbe\x9cC<\x1c\xfe\x9e\xb4iD\xf4\x0a\xa9VY\x1a\x97\xbeh\xea\xbb\x93\x94\x85\xd4\xcfD\x9e\xcfT\xcfR\xd1F\xa0P\x7f;\x88\x81f\x0c\x80Q\xc4\x9a]&\x9d\xda\xc7W\xa5\xdd\x9d\xd5\xdeKL\x89s\x06o\xac.\xc1\xc1}G\x96\xcf\x1e\xb0\xa3\xdb\xba\xcf\x9c\xfdT=\xb4;\x8c\xd3\xde\xbd\x14j&7\x8bWq\x93\x94{\xd2?\x88\xf7\xec\xd9\xd3\x00e\xbf\x89?\x0a\xed\x0c\xc5I\xafw2\xdbNh\xe8\xf9\x93T\xa8\xb2nz\x02K\xfc\xa6\xfc\x01i\x83YUD(\x9f\xe7lw\xdb\xa2Z\xc5\x8a\x15\xd7\xa5\xa5\xa5\xed\x0d\xc20\x99\xd9fc\xb6\x1c\xf6\xa1\x806\x92/<\xa3\xa1$\xea5\xa1\xde\xaf\xd4\xdb\x1dM\x85\xbc\x94\x01\xb7\x06\xccn\x93hk-|t\xedCQ\xbe\xc9E\x7fW1\xcc\x1a\xa1`\x07\xa0\x94'\xb2\xe5R\x95xy\x94\xff\xeaP\xc2\x04K\xe7\xff\x14\xd5Y\x01T!o\x15|4\x86\xb3\x11[_\x15\xb9\xc5j0\xb6V\x91\xa9\xc9\x86\x9f\x22\xd5\xd7\x16]\xb8q\xebgd\x03\x85\x1e\x81\xa2`\x04\xb2\x18\x00\x10M\xbe\xf9\xbb\xaa\xaf\xe4\xe4U\xd0h\xae\xc2\xe1#\xc7\xf6\xbe\xd3ug\xa7\xedK\x8e\xe8\xa1\xac\xb6d~\xc7\x19C\xa0\x1b$\xa6F\x00~\x96,\x02\xd9\x10\x084\x02\xd9\x0a\xd8\x04\x8b@\x8c\x11\xd0\xcc\xbaP\x92\xbb\x0a0\x06@[3Ir\xfc\x17`B\xac\x0d@\xe6\xe1\xa3\x19\x0b\x1f\xdf{'\x06@\x8a_\xab\x0f\xe3\x08\xfa\xdfFR\xd8\x92E\xc0\x22`\x11(V\x08\x14J#\xe01\x00R\xc62\x04\x92S\xff\x05\xb8-7\xff\x05\x88t\xc5\x16?\x9f\xf1\xc8\xd2\xc9\x07\xb4$6\xdb=\xc67\xdbQ\x91X\xd8|\x8b@\xac\x10\xe8\xc7VP\x19\x9e\xab,\x8d\x15C\xcb\xc7\x22\x10\x0e\x81B\xb7\x1d\xe4\x1a\x003\x13\x97\xf2\xd7\x0a\xc0\xf9/@\xac^\x05\xf5\x02\xb2\xec\xed}\x13\xe7\xde\x951\x8b4=\xe0\xd4+vr\x0a\xcbi/U\x0f\xcf\x8e\xb0/\x9b\x89o\xc9\x22`\x11\xb0\x08\x14+\x04b\xbe\x12p\x95xX\x90P\xa8f\xa6\x9d\xa5\x5c\x10\x03\xe0\x18\x81X\xfe\x17\xc0\xdb\xe0\xba/\x0e\xbc\x89\x01\x98M\x9a\xf6\xfc\xa5\xec\xf50Pa\xe7\x19\x00~P9I\xb7d\x11\xb0\x08X\x04\x8a\x05\x02\xdaj\x89\x09I\x81\x8b`f\x9cx'\x5c\xf3y\xc5\x86\xf2]\xa7\xb4\xe3\x05\x8f\x97%z\x9c\x02\xea:\xdb?\xe4$\xe5\xc7\x7f\x01\xd4\xe2\xb6\x9f\x0e~>\xeb\xc6\xdd\xaf\x13\x94\xf2\x0ft2\x02\xce\x1bA\xae\x8fg\xc9\x22`\x11\xb0\x08\x14?\x04bb\x04\x5c\x05.t\x1c%\x8f\xef(\xf1>\xcb\xaa>Q\xadV\xa9U\xbd\x97U\xbe\x834\xaf!PX\xdf\xef\xf7\x13qc<L\xb9|\xfb/\xc0\x9e\xdf\x0e/{\xa3S\xfaD\xda\xd4\xdb?\xe6- c\x08\xccJ@F@N\xab\x01\xf9\x96,\x02\x16\x01\x8b@\xb1C \xcfF@Z\x1cT\xe4\xc4K\x0a\x5c\x06 \xe1\x86\x85\x95\xff\x9c\x94\x1c?\x90\xb0/%9il\xdfe\xd5g\x9c{\x8f\xf3\x0d{\xed\xf1\xab\x8c\xea8\xc6\xc0\x0d\x9b\xb8\xc3\xa3Uo_\x95\xf6C\xab\xbd\x9b\x94\x10_\x97\xfc\x98\xd1\xbe\x9d\xbe\xf53\xaf\xdf\xf98\x0c\xa5\xfc\x8d\x01\x901\x903\x86\xc0l\x0b\xe99\x80v\xaf\xec\xb6\x10@X\xb2\x08X\x04\x8a\x1f\x02yz0\xec\x1a\x00\xa1b\x0c\x80\xfc\xc4\x8b\x9fIn\xd0\xe0\x8f\x15\xe7\x07\xfe\x9b\x97\xa7\xab\xebw,>\xdc\xfd\xad\xebv\xe9\xfb'\x8e\x82\xc57\xb3lc\x04d \xf2\xe5\xbf\x00G\x0e\x1e\xdb\xff\xef+\xb6\x0e\xdc\xbb\xda9H\xc6<\xfc\xd5\x7f\x02\x146FA\x06@\xc6\xc0y.\x80\xfe\x97\x9c\x96,\x02\x16\x01\x8b@\xb1D \xcf+\x01P\x11\x0fc\x04\xa4\xc0\x93\x1atL}5\xd0\x00\x08=\xbeeP\xaf\xfa\x19\xc9\xf3{.\xa8\xaa\x15\x82\xf3y\x03\x95\x0fp)\xbd\x96\xe4\xec\x5c\x00\xeaG$\x19\x80y\xc3w>\x8c\x01\xd0\x17!\x8d\xc2\x97\xf27\xab\x00\xbd\x09\xe45\x00f;(\x22o[\xc0\x22`\x11\xb0\x08\x14U\x04r\xbd\x12pW\x01\xc6\x00H\xf9;\x06\xa0\xd7\xe2\xb4GK\xa5&\xf4\x8d\x04\xc8\x81\xdf3\xdf_2a\xfbm\xdfNr\x94\xb2\x8a\x8bWb\xb7\xb9i\xfdR\xeb&\x8c\x8cT?\xa7\xf9\x0b\x1e\xdb\xf5\xf0\x92g\x0f\xe9;\xf22\x00\xe6\x1f\xc1f\x15 C`^\x07\xd5\xcc\xdfy0\xcc*\xc0\xacRH\xca\x1b\xf1i\x85&p8\x85o\x089\x87\xb8x\xb9\xf1i\x80\x93\xf9\x5cA}\x0e\xf8\x98\xe5M/\xa9a}\xc9\x93\xbe\xa7\xf3\xf9\x86\x15\xf9\x85\x01\x9f\x88\xa8\xc1g\x15Zr=\xe6\xe4W\x1b\x85\x81/\xff@\xbe\x9a\xff\x1c\xccj\xc0\xc9v\xb1\x90\x07~:\x7fz5\x9f\xa2\xd8\x18\x0b~\xe1x\xc4Rv\xee1}#\xaa\xa9\xa7=\xe11\x97~x\xbf\x19\xe5\xc9\x8e>\x18n\xbc\x16\x85q&\xc5\x9bcr\x0d\x80\xb6o\xe4\xcc* \xa9\xcb\x7fR;Ec\x00\xd4`\xa9\xd2\x09\x97\x9eqg\xd5\xcf.\x99P\xf1t\xa2\xfaf~\xe9k>\xacp}~\x18\x80\x1f\xdf\xd8\xf7\x1c\x06@[Pf\xd6o\x0c\x81Q\xfe2\x00\xce\xf6\x8f\xeb\xeb\x13\xc313\x00\xf0\xf4q#\xee@\xe9\xe8[0\xbd\x157\xc4 I\xa5\xad\x0f\x88\xd76i\xc5\xdd\xd7\x97(\xb9\xc1'\x85\xea'8\xf5\xc3]\x1a*?\x16\xe9\xf0o\x8d{(\x16\xbc\x0a3\x0f\xc6\xd6\xbf\xb8_+\xc5JF\xf8\xdd\x07\xaf\xf6\xc1\xf8\xf1\xe5\xd2!\x5c\xd7\xd6\xc1\xf2\xa2I\x0b\xac\x1fc\xd9{3\xd1z\x0c\x9e7\xc8\x11\xbe\x1b__Z\x1d\x16\x8dl\xe1\xca\x84\x1b\xafEa\x9c\xe5\xd8\x08\xb8\x06@\x98d\xd9\xc3?\xf7\xc1\xa4F\x15\x9b'?\x19\x0e\xac\xc0<=\xf4mxi\xa9O\xba|T\xb9\xffy\x8f\x94i]\xadI\xe9'\x02\xcb\xe45\xbe\xf6\xf3\x03o\x7f64\xe3\x13\xf8H\xe1{\x95\xbf\xe2r\xc6\x00h+H\x86\x80\xb1\x11[\x03\x00O\x9f\xbeF\xc9?A{\xc3\xfb\x09V\x05u\x95&\xe2{\xf5\xe3\xf0\x96\xb2\x0ax\xdeI(\x01?\xf4Y\xe7\xe1f1\x86%\xa0\xdb%\xa1\x8b\x97\xa1\x1f\xea\xe7\xa1\xa3y\xad\x1f\xb6id\x9b\xc5\x87\xf8\xae\x94\xe3~;\x8f\xf8\xd5\x8c\xc3\xa1\xfa\x98c\xd8\x8a\xc5<S[8\xb9!\x19\x0f9\xf36Pb\xcb.\x95^N\x8c\x8f\xab\x90\x1bfU\x1a'\xdd\x8f\xcbM\xd5\xb0u\xf4_\x80\xf7o\xda\xfdo\x0aI\xd9{\xf7\xff\x15\x96\xf2\xd7\x03`\xa3\xfc\x8d\x01\xc8\xb7\x07\xc1,=?d\xe6\xf1*\xb3\x90\xc9\xb4{1\xab\x82N\x0c\xc2N|\xb3\xde9O\x80\xb8\x0eY\x1fD^-\xfco\xf1\x073X\xb5\x82\xd1\x01-\x7fg\xd0.\x87\xc7T\xc55\x9b\xe6+\xa4\x0b\x18\xd0\xad\xdc\xfc\xaf\xf1\xef\xc6\xdd\x8f\x9bD\xfa\x9bJ\xf7\x12\xfc{h\x06\x04\x1f}~{9_\xe7\x1c\xc0\x96\xcb/\xf0\xbe\x9a\xb8\x0e\x7f\xe9\x82\x7fT_\x88\xe4\x1b\xfe31Z}i\xef'\xf2\xbfF\x9e\x91\xd4\x1bN~\x0b\xdcb\xc2\xfd\xc8[E\xd8\xa7\x9b\x88\xf3\x85\xf5\xc6\xd5\x15\x8a\x937+55u\x88\xf9\xa2\xa8\xea\x93ld{\x0f^:^3\x91\xf4\x1f\x08\xdf\x13b\x1b\xac\x02\xf9\x93\x5c\x9e\x9b\x90\xe5A}\x8e[\xfc1\xa2\xe7\xd0\x8f\x7f\x10lA}\x9d\x89\xfc\x22\xb2\x08S\x1f\xb3\xc9\xb3\xf0\xee\x83\xbfp\xd9\x8d\x1bK\xbf^\xc5\x0fJ\xb41\x90\x8c\x81\xf0)O\x9d\xa9\x94\xfd\x1bq\x8d\x09a~\x12\xdex\x5cs\xf2w\x93\xff\x0f/\xafPx\xbauu\xbd~\xa5\x9ef\xc6\x97\xe3\xd6\xe3FP\xffc\xe5{\x89\xed\x84\x0e\x9ccp+\xe5\x17Q\xfe6|]\x9f\xe9\xf8\xf7\xd2\xaf\x83n~_p\xba\xd1\xd4\x136\xe4\xbfE\xfeG\x91\xfa|\xf0\xe0\xc16\x94\xff\x17\xbcu\x96\xc3g|\xb9v@\xfd\xfa\xf57\x8bW\x84>\xea \xa3\x91\xd4\xebE=\xddC\xba\x1eA\x09\x19f\x91\xd1\x8e\xb2OQ\xa7#\xfd\xd48\xd6\x01G!\xc7\xb4\x97Q\xa8\xfay\x90\xdd\xcb>h\x98q\xb3\x1ay\xfd\x8a'\xdc\xb8\x12\x03\xfau\x13\xde\x10\xea\xd4\xc2\xff\x96\xfaw\x80\xff\x8f\x84\xb3\x10}\xe9\x0a^=\xf8\x8c{W\x93A\xdd\xa0\xe3,\xd2\xb5\xa5\x9e\xc6\xd1:\xda\xd4y\x1a\x89\xb4\xd7\x97\xb4\xaf\x09\xdfO\x9a\xee\xa9\xd3\xf0?\xe5^\x1e\xc8\xfd\xa1\x8f_\x86\xbd\xa6\xa6=\x8a\xcd\x86\xc7]\x5c\xa7\xb6R\xe4Q\x13\x95\xcc\xf6\x8f\xea\xc9\x80\xc8%\xdf\xf0u\xda#\xb1\xfe\xacs\xd4B\x85(\x98\xbe\xf9\xc8\xcf\x9e\xff\x02h\x00\x9bU\x80|\xc5e\x04\xcc* \x930X\xe6\xff\x9b@|\x87_\x17\xae!\x17r\x18\x8a\xec9.\xdem\xba!\x198=i\xff^\x8e3\x942\xae.\xc5\x06\xdc\xf3\xd6\xad[W\x93\xf2\x22\x19\x86\xca\xc7\x83X\xdf\x84\x84x\xe2\x8e\xf1P\x1a\xe1\x96\xaaOp8\x9f\x91\xd6\x0d\x99\x85\x18\xe0\xd7\x91?\x04\x83\xf3'\xf8k\xb6\xf68K\xd5\x8feL\x88\xbfM\xbc42\xdd\xa7J\x1c\x1d\xf8<mk\xbf\xf4'\xc5\xc5\x9bxw\xda\xec\x8a\xfcuI\xfa\x89\xb4\xf7\xf05\x09\xf0a\x00\xa6\xe3\x95\x83w+9\xfaUz\xe7\xce\x9d\xaf)O\xa4\xfa8G6n\x8c\x97\xe8\xdb\xb5\xc4\x8f\xe8{\xfde\xca\x94\xf9\xf4x\xa9\xac\xbf\xe4\xf7\xa0\xbd\xa9l\xa35!\xfc.<G\x98\x12\xc4\xf5\xcd\xfcA\xc8]\x03^\x7f#o\x12\x9f>n\xae|\xd2\x9f&MF\xb0\x09\xfced\x0d~\xa6\xba\xdf\xa7l[\xf2\x8fa\xb0\xda\x22\xf79d\xe8$4\x19\x01\x9f>\xe1\x8d'\xd9\x1e\x17^`z\x09\xe1{\xc0Q\xbe\x0cQH<\x95\x0f\xd5B\xaeA\xc82E}\xa0\xad\x0fh\xea\x81\xe3YY\x7fI/G\xfe5\xb8\xc3\xe0\xa3\xedQ\xc9\xd2\x91\xf4\xfbUR\xf9x\x8d\x14\xf6P\x03\xc2\xce\xa4\x8bza\xfbL\xbe\xae]\x9f\xf2\xe5\xcb\xcb\xa8\xa5\xa1X\xbb\x8bO\xa4>2\x1e\x06S\xecj\xc6dG\xae\xfb\xa9\xc8\x91N\xbc\x83\xea\x06\x12}\xecE\x9a&.#\xc0\xea!\xe5G1\xa6U\xcc\xa1`\xf5\x95\x91[\xd9\x8fs\xcd\xf6\xdbD\xd7M\x8e\xeb\xdc\x9f\xf1\xff\x0a%F\x99\xc9\x0a\xfd\x0b9\xae(\x7f\x03e\xefG\x9e\x1b1\xc6\xd5\x09O\xe0\xfa:c\xc1\xdb\x0a\x98\xe9:\x8e\xc6\xdda\xf8\x12\x0e9\xce\x22][x\xeb\xbe\x7f\x80q4\x8f\xf1\xac{\xc8\xb9\x9fh[\xf7\xc7\xcd\xf0\xd6\xe7\xf4k\x13\xef\xaa\xbcH\xd7T\xedQ\xe7\x1a\x8a\xb6\x80\xe7U\xf8\x87\xa36\x02T\x94\x01\x90\x13\xa9\x9e\x14@R\xe7\x99\xa9\x97\x97OK\xe8\xa3\xc4\xc2B\xfa/\xc0\x7fn\xd8\xf1\x18\xf2H\xe1\x1b\xe5\x7f\x80\xb0\x9c\x14\xff!\xd7\x97\xf2w\x1c\xe0\xc8\xcfwr\x0f'\xe9IC#q\xf3\xb0\xdeFY\x0e!>\xbe!\x07\xb8\xe3\x1fF\x01OE\xa6\xef\xd9:\xb9\x85xT\xc4\xa0\xb8\x15\x85\xf55\xdfyW\x9f\xb3\x10\x83d(\x09\xa3\xcd\x0c\x90r\x9a\x91~\xc7j\xa2\x0b\xfe\xb1r\xe5\xcaI&\x9dH5\x91v\xab\x93\xefW\xba\xa4\xeb\x90\x9b\xbbY5\xac\x97\xfc\xdc\xb0#(\xd3\x94\x9b\xe9lW\xf9^\xc6\x00\xbdG[^r(\x81\xa1\x0c\x97K\xb8!\xa4t\x1c2\xb2\xe9\xc6\xa0\xac3\x0b\xad[\xb7\xee\xaf\xc1dU\x05\xea?M{\xf3\xf5@\x93\xc1\xfa<\xed\xb5#\xd9\x19\xaf`3\x10~\xfb\xb81\xcf\xe7\x0c\x03\xadJ\xbe\x00\xa7\x96\xaaG\xb9\xdfq\x1du3\x88?7\xecX\xa5\x07#\xca}C\xfe\x84\xaaU\xabf\x80\xcb\x1a\xe2\xff\xc49xs\x84\xa2\xfc/]\x9c|\xe2E;cQ\x1c\x7f\x15\xaf\x08x:\xcd\xa9\x0f\x5c\xdf/\xd4\x070\x93a\x95r\x0fJ\x92\x85~=-Yhs5\x85tv\xb3\x14kD\xa2\x5c\xd8>\x9bkW\xb3f\xcd\xed\xc8\xf0\x1a\xae\xbd\x98F\xea#|\xa5d&h\xb5\xa8\xeb\x0eV\xcfSm~0\x81\x18\xb7[H?H\xf9\x9d\x9es\x06\xa2\x1e\xd3!\xea\xfb\xc7]Ne\x0f&#\xfdi&\xe5\xe9:\x19\xc2Z\xc8\xbb\xd0\x94\x8d0\xae\xee\x12\x16\x94YB\xf9#`\xf1v\xe0\xd8b<^I\xde8\xae\xf5\x9f(\xb7\xca\xf0\xa5\xdd\x90\xe3\xcc\x94\x09\xe7\xd3\xee8\xe9\x09\x0f\xae>&-\xf7\xe8~\xa4\x9dm\xe4\xcf\xa0\x0dglE\xba\xa6n;\xdf#\xfb}\xf0\x5c\xa9\xb8f\xf29!\x19\x01)\x7f\xc7\x00\xf0\x1c\xa0a\xeaI\xc9Z.\x17\x1a\xd2\xab\xa0o_\xb7u\xe4\xde\xb5\xbe]\x08%\xa5/\x85(\xb7\xdf\x13\xd7r_J\xff\x88|\x00,\x10\x03@[\x0e\x01\xfe\x97(\xc85(\xb7i&\x8d\x0b\xd9\x147\xdb\xc4]\x7f\x0e\x03\xb6i@Z\xc8(36\xf5'\x14\xb5 \xe3n\xda\xbd\xc3S@\xa7O}\xa3\xb8n2\xf2\xc6\x10|\x12\x05\xdb\x01?$&(\xb5t\x8c\xc5\xb7\xc8V\x1fW\x89\xb2\xcb\xa4$\xf1\x1dR\x18^?\xabO$,Sb\x04\xd9\x9cz\x01?\xc7L\x1c\xa3\x91\xc1\xf6\x94\x89\xea@\x97\xff wY\xf0\xfb(==][$uh\xcb1\x10\xf8z3\xed\x81\x8c\x8c\x8cu\x94\xfb\x92\xbe\x8c\x9411\x95\xc3\xf9\xf0\x13\xde\xb5)\x93DX[M\xa7\xc3\xe3+O\x9d\x14\xd3\x0eia\xf1t\xeb\xf8\xfb\xc0\xd9\xd1\x19\xcc\xc0\xa3\x9et\xa1H\xe6r\xf4c-\xc9\xe2i?h0'}\xa6\x7f\xfb(\xefL\xe6\x22\xf5\x91b\x0d\xc1\xe0\xd3\xa0\x8dF\x91H\xfd<\x8fio39\x91\xdd[\xcf\x84\x91G\xcf\x04n3q\xaemk\xfa\xb7`\xfd\xfa\xf55\x99\xbcd\x84\x1bW\xd4i\x86\xfb\xc8\xd4\x0d\xe2_\x0c\xaf\x8bH\x7f\x8e\xfb\xe3\xe7 \xf9\xfe$\xef8\xf3'\x86\x09\xc07\xdc}\xad\x09\xd3^\xaa;c+\xd25U3\x81\xfc\xa22\x024\xa2A\xa3F\x8c\xafzyz\x0e@\xfd\x98S\x11\xff/\xc0F\x06\xf9\x99\x80\xe2l\xc1\x08\x1c`?\x83\x0b\xa6\x95\x81C\x84#*\x04S6\xd0\xa7\xee\x06\x06\xc8\xa3\xcc\x1cf\x04\xe6)\xce,F'X\x0d\xa1\xcd\xf1\xccv\xb5\x8a\xfa\x03.\xe8\xe0\xe3\x8d\xa6R\x94k\x09\xbf\xcd\xc8\xbc\x8bzM\xd9k\xac\x88\xb2\xdd-^\xee\x1bO\xda\x02\xd9\xa8x,\x09\xe3s6|[3\x93\xa9\x0b\xdfC\xe2M\xda|dq\x14\x1b7\xb9\x8cN7V\x02e\xf6\xed\xdb\xd7\x8b\xbeL#\xde\x18\x17\xb4/\xa4{\xe9t\x22;p\x87\xe9\xd3z\xfc\x85\xf0\xeb\xec-`\xc2\x91\xf04\xe5r\xeb\xb3\xb2\xf1\xcb\x22\x1e\xf49\xe4\xbd\x9a\xdb>G\xd1G\x1di\xd9\x96\xe6\x1dC\x9e\x8b\xbeD\x1c\xd3\xb9\xe0\xe9T\x89${4|\xc1m)cg/'\xf7\xb5\x97\x1fn\x5c\xc1Oc\xf9l\xdc\x8f\xc1x#\x8f\xee\x87\x0b\xb8\x1f\xde\x84\xd7\xa7Z)\x04+\xe7\xa6E}m\xc3\xf0\x08\x9a\x95\x1b\x5c\x1c\xeb\x11\x94[\xf0D\x95w\x5c\x97OR\xbb\x15\xb6\xe7\x00\x8b\xc6\xa7?\xf1\xcb[G\x96#\xa3f\xferZ\x09\x98\xd5\x80\xd9\x06\xd2*\xe0\xa8q\x80\xe6\x9f\xad\x91v\xc2\x88\x018\x19\xd7\xdf\xbc\xa9\x80R\xd6>\xa2\xde\xc9\x9e\x22\xa1\x08\xffD\xf8\x8f\x04\xa5\xec\xe2\xd8\x87\xbf\x09?jb\x80\xbe\xc8\x00\xbd{\xdb\xb6m\xda_\x16%\xd2\x86Qpq\xe4M\x81\xff\xd3\xdc\x18z\xa0\xb7\x81Y\xd1\xc3N)\xf7\x87Yi\x7f\x82\xcex!\xac\x87}\xe9\xec\xe7\x7f\xad\x1b\x89\xf4\xefx\xb09\xd8\x94'\x7f\x10\xbc\xbe\xc7\xe0h\x8f8\x1b1\xb3\xd7\x19\xbe\xf1R\xd4d:\xca;[\xa1\x10\x09\xcc\xec\xb5$(\x05N)*B\x1f4;\xd7\xe1\xe7\xba\x8e\x09\xc4o\xc7Obe\xb3\x9fm\x90WIN&M\xedd#\xea\x9d\xc2\x96\x96\xb3\x8c&3\x19\x0c\xfa\xe1\xbf\xa3\x82\xcc\xc4\xa7Q\xf7R\xcd\x16\x15\x17Q\xf6B\x5c5\x85#\xe0\xa9\x229\x22diE[\xe7\xab\x92\xfa\x84w+\xceQ$\xe4\xe9\x19L\x1bw\xbfW\x0f\xfe$\x93\x91+G}\xa6\x9e\x9f\x22\xf5\x91v\xdf\xa1\xdd[xQ\xa0\xb4*\xd1w)\xaf3\xfc\x0c\xb2\x07t\x8f\xe99\x85sM\xa9\x1fvLg\xaf\xeel\xd5\xfa\xeb\x07\xc9\xf7'E\x92\xdd_\xd0\x13@\x9eD\xf5EN\xd7\x11e}/i\xc9<+\x99\x1ba\x5c\xc9\x08O\xd6\xf8\xd0\x04G,\xb9\x06'Q\xff*\xc3\x9e\xfc\xf1\x8c\xf7\x05\xf0\xd1=\xf5\x02\xd7P{\xf5\x0e\x91\x17r\x9c\x91\x17\xee\xda\x1a\x16Q\xfb\xb9\xc1%\xe4\xec\x22L\xabR\x04\x09\xaf_\x94\xfe\xd6us*5\xa9\x5c?YO\xbdO8\x15\x86\xff\x02\xe4\x05\x04\x06\xd0X\x06Vu\x1e\xa8\xaeA\xc1\xeb0\xf6T\x06HOw\x96\xa7\x07\xc1\xaf3\x08ob\xe0m\x22=\x1d\xa7}\xf2\xa8\x9bt\xf9Wf\xfb\xe4g\xdc\x0a\xea\xd6\x87\x87V\x05o\xd1\xaeV\x00\x09\xb4\xf5\xb8\x18\xb2us+3\xe8o\xb8Q\xe6\xb2u\xf5\x81\xdb\xc8\x0e\xda^I\xb9L\x5ci\xeaw\x95\xa2U\x1e\xca\xb63\x8a\xff\x15\xf8\xf4r\xcbn$\xedZ\xc22\xb6\xd9H\xcf\x05\xe8\xe3\x07l\xd9,\xe7f\xd1>\xeb\xe8l\x85B$ \xcfb\xday\x16\x9c\x16\xc2C\xfb\xb32\xf6\x88\x14\x17\xc7\x0d\x9a\x84\x5c\xcd\x91s\x1dQM\x06t\x86\xeeH\xf8\xef\x09\xc1n9\xfd\xec\x05\xbf\x17\xa8W\x8d\xb2\xdf`\xd8\x86\xaa\xac\x96\xf4\xc8\xd6\x0d\xcc\x85\xcfo\xe4\x97%\x7f+\xd8\xf4Q~8<\xc9\x0e\xb9\x95\xa6\xba!H\xdbg7 \xfbs\xe4\xa7\x11^\xcc\x16\xd2\xbd*\xab\xbd_d\x98\x0e^\xab\xf0\xd7\x93\xa4\xb7\x88VPF\xab\xae\x9c\xf6Y,\x1d\x8a\xd4G\xc6\xdc\x83\xe0\xf3\x0a[q\x1biW{\xfe\xdf\xd0\xe6\x0fn\xf5l\x1e\x86\xf1M\xf0\x1aG\x1fz1\x13\xbe\xd0\xc5(\xe4\x98\x0ed\x10X?0\xdf\x1b\x8f$\xbb\xb7\xac\x09#\xdb-\xf4\xe5\x167\xae\x95\xe1\xc7\xb8\xeb\xddq\x1cr\x5c\xa9\xbc\xfa\xc2x\xa8\xca8_\x09\x16\x9bI\xd2\xfd\xa9\x89\x91!\xe7ft\xb7z\x87q}\xdee\x9b\xe9L73\xe48\x0bwm\x0d\xe3\x9c\xf8\xb9\xc1%\x0ea#\xb6Age\xd9\xf5\x1c@F#\x19\xa7\x99\x8af\x07e;<Z\xe6\xbc\x96W\x95\x1d\x9b\x90\x14of\x98$\x17,\xe9\xbf\x00\xbc\x0a:\x9dV\xa5\x10\xf6\xb9\xce\x84\xcdj@+\x009]|\xba]\xb0\xcf\x01h3Z\xd2\xcc\xb5\x1a\x83nc\xb0\x0a\xdc\xf45\xb8\xd0\xba!#_\xb8`\x0c\x98\xe4\xf20\xb7V\xc3\x86\x0d\xc5?*e\xc5M\xbd\x97\x07Q\xcdxx\xba\x15\xd9j\x22\xdb\xa6`\xed3\xe8+q#\xc7y\x1f`\x05\x17\xe1x\xaaf\xb6z\x16\x11\xaeL\xa8<p(\x85L\xe5B\xd4\xd7*\xa7F(\x0c\x03yju\xc4\xcd\x9dR\xbbvmm\x05e#\xfa_\x9b\x07\xd0\xe9z8\x9a-3\x17x\x06\xf2\xc0\xd8^\x82\xb2\x1d\x8e\xe2\xec\x10N\x16\xfa\x9c\x8a\x11:\x08\xbe\x1a\xdb\x81\x94\xa3>\x07V\x0e\xd7G]W\xf0\xc9\x04\xcfP\xc6\xd4\xcfNe\xd9_\xd7\xb6\xa0w\x02\x10vL\xfb+\x13\x08Q\xdf[$[8\x9c\xec\xd9\x0aGH\x880\xaeT;\x89\xb1U=\xda\xb1\xe5m.\x0f\xd7\xd6\xcb&\xeap\xb4\xb8Dk\x044\xfb\x97Kr])|-\xb1\xe5\xca\xa56\xf7\xd5\xb8\xf2\xe5\xaa\x0f\x97\xad\x16\xdf\x8ax\x81\x92\xfe\x0b\xc0\xab\xa0\x13h\xd4(}\xe3\xeb\x86\x95\x01\xd0\x12UN\xca_F\xa00\x1b\x00\xc4+|\xc4`2F@3 K1F\xc0k\x04b\xcc\xda\xb2\xb3\x08DD@\x8a=/\xe4\xccF\xd3\x97\xfb2\xa6\xb4\xdf6l\xe3\x82\x03\xda^(0*\xac\xff\x05(0\x00\x0a\xa8!f\xf7\xcf\xf2\xa02\xd8,\xb8\x80$(\xde\xcd\xb0M\xb1\x0e\x8c\xdf(\xde\xbd\xb4\xbd+\xac\x08\xe4d%\xa0-!\xb3\x120\xdbA\xfe\xd5\x00y\xda\x0e*}j\xdf2m\xdb\x0d*7\x98\x87\xc6A\x1f\xc6\xc5\x0a\x08\xfd\x17\xe0\xed\xce[\x1e\xdc\xbb\xd6y\x9b\xc3\xcc\xfe\x8d\xaf\x15\x80\xc2\xf2\xb5\xe5\xa1U@\x81\xbf\x0aJ\x9b\x96,\x02\x16\x01\x8b@\xa1F \xa7F@\xcf\x04d\x08\xccs\x81\xb2\x84\x9dg\x03\xf8R\xfa\x8a\x97*S\xcfW\xe9\xaaW\xab\xdcY\xa1fbs\xe21'{.@\xcc!\xb5\x0c-\x02\x16\x81\x12\x8a@\xb4\xdbA\xe6!\xa4y\xb5\xd2\x99Y\x83\x99\xde\xd3\x96\xd3\x9e\xbbf\xde\xce\xec{\xffz\xdf\xaei\x1dv\x8cZ7\xef\xf7wI\x8b)\x15\xf1\xff\x02\xc4\x14\x0b\xcb\xcc\x22`\x11\xb0\x08\xe4\x15\x81\xa8V\x02j\x84\x17\x84d0\xcc\x96\x90wE\xa0\x87\xc4Z\x0d\xc8\x99\x07\xc6&\x9cr\xda\xcd\xc9\xad\xce\x1a\x92:0V\xdbC'\xfa\x5c\x00\xfah\xc9\x22`\x11\xb0\x08\x14\x1b\x04rc\x04d\x0c\x9c\xcfF\xe0kkH\xcf\x07\xe4d\x00\x8cA0a\xc7\xafX\xd7W\xf1\x8a\xe9U\x06\xe5u{H\xff\x05\xe0\xb3\xd0z\xb7W\xef\xa7k\xd5\x91\x813o\x01\x99g\x00\xe6- \xf91?\x17\x00\x9ey&\xf7\x0b\xa0\xed1\xac\xa7\xc0\xecW\x1e\x0a.\xd0\xfb\xc2yf\x9c\x7f\x0c\xe2yC\xe8\x12\xde\x1b?\xc6{\xd0\x1f\xd1LT\xaf\x96\xe6\x9f8'\x96\xb3\xfel\xc4k\x9aZ\x01\x97h\x1cN\xecU\xb0\xad\xc7\x0a\x81h\xb7\x83\xf4^\xa5\xb6\x82\xb4-d|\xf3\xde\xbd\xd9\x0a\x92b\x96\x93R\x96r6\xf1\xfd\xbb7\xf8v\xe6u{\xa8\xb0\x9c\x0b@\xbf\xf2D\xbcc|\x01\x1fm\xd3\xbf\x04G\xe1N\xc2\xdd\xc8;\xe2KI\x1f\x01\xe3\xa8\xafG\x9e\x84\xc8ae\xfe\x1c\xa3Wp\x07\xf0\x16\xcb\x85\xc8\xd9 \x87\xd5\x8b]q\xfep\xf4*F\xf1\xfeb\xd71\xdb\xa1\x12\x89@\xd4+\x01\x83\x8eg[\xc8\xac\x08\xb45$g\x1e\x16\xcb7+\x01\xef6\x91\xb3b\xc8\xcd\xf6Pq\xf9/\x00\xef\x83\xd7E\xe1\xeb\xf3\x0f\x03\xf9w\xee\xcb\xe0\xe4\x10\xdf\xddiF\xfa\xfbD\xc6\x91\xfe\x94\x9b\x5ch<\x8c\xc0V\xfe\x8e~\x16\x7fR[[h\x84:\x81\x82\xe8\x0f{|uu\x9f\xf9T\xf0\x09\x14\xc56m\x11\xc83\x0296\x02j\xd1c\x08\xbc\xff$6\xaf\x8f\xca\x97\x11\xf0n\x11y\x8dBJN\xb6\x87\xf6\xfcvx\xd9\xb4sw\x8e\x84\x9f\xb6{\xbc[@\x0ak\xb5\xe1\xfd3\x98\x96\xe7\x85\xf6UPf\x8f\xcf#_\x05\xfe\x19z\x1d~\x16b\x86\xado\xdf\xebP\x9342\x0e\xa3xup\xc4\x15\xfc3q\x9b\x0a\x12\xd7)H\xe7Rw\x88\x1b?\x09\x7f<.\xdb\x81'\xe6\xe0\x08\xca\xde\xa8\xb2\x22\xeaO\x82\x9fs\x08\x89\xe2\xb4\x17\xf4\x80\x19\xe5\x19\xe2\x9f\xc5\xd5\xf9&\xd0l\xda=\x99\xb4\x9f\xd9\xb6z\x18y\xa6\x91~*\xff\x1b\x18\x07?}\xbff3n<r?\xa7z\xa6m\x82\xb3\xc9w\x0e\xad \xacU\xa3\x9f\xd47x\x8e$\x7f8\x89-pY\x0e\xa9Q>iw\xe34\xdbv\x0e\xc8\x09\xd7&e\xf4]\x9bS0\xa4\xe3\x08\xb6\xc1mD\xd6'\x91u\xb2\xf2\xe0\x17\x12+\xae\xc9Y\x14\xb9\x0fY\xf4GG\xfd\xd3\xd5\x7f\x08\x0d\xf5\xfa\x11\xef\x89\xab\x86\xfb\x19C8D\x7f\xcb']\x07}8\x07\xfc\xb8\xfd\xd5\x810\xf3)\xd3\x1fW\x89\xf0d\xda~\x88\xb0(\x896\x14\xeeI\xba\xc6\xec3\xf4\xbd9\xff\xfc\xfd7[\x80\xb3U\xc0\x92E\xe0D\x22\x90\xab\xed\x07\x06\xb1yKH\xdbCR\xbc\xda\x7f7\xcaX\xef\xe6K9k[\xc88\xb3=\xa4x\xd4\xdbC\xfa/\xc0\xcc\xebw>N\x1d\xdd<r\xaa/\xferj\xcf\xbc\x99$\x19\x1c\x87l\xf2\x0b%\xa1\x04\xce\xc4\xbd\x1fB8\xed\xb5\x97E\x995W>\xfdh\x89\xd2\xd1\x0a\xcb!\xea\xe9[%u\x15\xd1\xe7\x16\xf0>\xc5\x05=\xf0\x84\xba\xfa\xcfF#\x9c\x97\x1a\x10\xd1\xc7\xb9\xa29\x10E\xc5||Zb\x1b\x1f{\xbb\x98v\x8f\xf2-\xa0\xab\xf8\xd0\xd6;\x9a\x05c\x18\xe6\xa1d_B\xf1\xd7\xe09AW\x8a\xde\x83b\xec\xa5:j\x9b\xf2\xd7\x10\xf4\x1fZ\xa1t/\xa9o\x94\x09yH\x8d\xf2q\xf7R\xc79 'R\x9b2VlU}F\xf9W0|5\x91\xe9\x1a\xe2\xed1t)\x91\xb0B\x8e\xa0\x07\xb2\xa0\xdc\x9b\xc2\xefn>Mq\x19\xfdlL\x7f\xc7`\xf8\xf45R\x91\xff\x80\x1f\xd3_\xf8\xc4s8M\x07\xca]M\xdb\xc37l\xd8PK\x05\x91A\xdfe\xea\x84L\xe7\xeb`\x16\x92\xf4\xe9\x85n`\xe8\x5c\x0b\x95\xb1d\x118\x91\x08\xe4\xca\x08H`\x06\xbfH\x0aW\x06AF@NJ\xd9(f)j\xa3\xb8e\x14d\x08\x1c#\x80\xaf\xf8\xfeY\xbd\xf7\xbc\xfe\xe5\xa8]\xa3\xf5\xda'\xf1,t\xf8\xe0\xb1}\xee\x9f\xc1\x0a\xed\xb9\x00Y\x04\x8e\x22\x02^\xd5)\xb6=XQf\x8e2j\xfa\x9c\xad\xca\x84\xa5(\x0f\x8e\x08\xc9\x03%5\x94\xccP\x07\xccx\xeb\x1d5\xe7\x04Pg\xb3\xbe\x9d\x83\x22\xd4\x17D\x7f@\xdeW(x\x88\xd9\xec\xf7\xf8O\xe2\x9c\x15\x8a[9\xcb\xa1\x15nZ\x16\x0f\xa3\x12\xf4\x90\x1aS\x08\xa5\xe9? 'R\x9b(\xd4>\xd4[\x8e\x01\xf8\x17\xfe!\x1e^\xaf$\xdcG\x98F\xc2\x8a\xbe\x84:\x90E\xd7\xa3\x12g\x00\x9c\x8b\x9f\x0c\xcfO1\x06\xff%\x9c\x8d\xe0\xa1\x03a\x9e\xd1\x810\x94[L\x81\x85|\x9e\xf8l\x15\x047\x19\xc7\x09\x92I\xf8i\xc5\xc45\xfeJy\x96,\x02\x85\x01\x01\xffL3\xb7\xc2p\x03\x1c\xd5,\x88\xfa\xe6\x81\xb1V\x07^'C\xa1\xb8Y=(.\x83!?\xf3\xbb\xc9\x87\xbeY\xf1\xf1\xd6\xc1WM\xaf<\xa8B\x8d$-\xdb}2\x00\x9f?\xb0\xf7\xa1\xbdk};\x89\xca\x90\xc8\xc9P\xc8\xb0\xc8\xe9\x06\xd5\x16\x83\x0c\x8ex\x19\xde\x04\x0b5-\x03\xabf^\x09\xb5\x8dA|+8\x8aR\x99\xfd/\xf3\xe6\x07\x0b3\xdb\x8ct\xe0I\xb0j\xde4m\xc1\x84<`\xc6[00\x8c\xfc:(\xe4\x13o:qm\x19=f\xd2\x08\xeb\x9aDMl\xb1\xf8\x0f\xa9\xa1\xd2\x17\xaa\xc8v\x89\x9fG\xa46\xc9\xd7\x89Q\x1f\x06k0\x12V\xd4\xedK\xbdl\x87\xd0\xe8m-f\xf1\xb7\xd2\x97\xe1l\xe7\xbcJ\xb9i\xf0\x1a\x812\xdf\x1a\xac\x1do\x1ae3p\xce\x04\x0b\xbf>y\xf3\xbc\xf96l\x11(L\x08\xe4\xd9\x08\xa83\xdc(2\x04q\x045\xf0\xa5\xdcEF1+\xae\xb0njG\xf1\xbba\xa5)^\x8a?\x97mg\xdf\xff\xc1N\xd3*^[\xe7\xecR\x9d\x17O\xda3z\xf9\x1b\x07\xa4\x0c\xa5\xec\x9dU\x03\xbeYY(M\xca_F\xc0\xb4\xa1WAeh\x0a5\xa1D\x9cC\xd6\x11\xf2)\x9c\xb3O\xce>v/\xa0\xbb\x00\xf1\xe7\xe1\x7fcf\xde\xea\x08yz\xbe\x92\x8d(\xbb\x9e\xc4\x90\x07\x9e\xa8\x02\xbcB^[\xea\x87=`&[\x83Y\x136R\xff,o\x12\xf13\x89o\xf2\xa6\xe5$\xccv\x8f\xff\x90\x9a\x10\xf5\xc2\xb6\xa9\xfe\xd0_g\xe6\x1dX\x9f\xbc\xb0X13\xd78\x0bz\x08\x0d\xb3\xfb\x19\xe4\xcd\xc0\x18\xd4\xc1\xc8<\x85\x1bF\xfc\xaf\x81m\x84\x8b\xd3\xfe\xaf\xe4\x0b\xaf\x88\xc6=\x1c\x1f\x9bg\x11\xc8/\x04\x9c\xd9J,\x983\xd8E^\x85/\xa5\x1f\xcd\xf6\x90\xb6\x89\x9c\xad\xa2\xf7\xae\xdf=\xe5\xfd[\xb6\xf7^\xf2\xe4\x81\xff\x91\xa6\xad#\xb3}\xe4]\x01\xc8\x08\x18\x83\x22\xbfP\xfe\x17\x00\xb9\xb2\x11JE\xca_\xc7\xd8\xbd\x87\xe2k\xa0\x02\x9c\xc7;\x16O\xfb\xc3\x83\xd9\x02\xf1+\x18\x94\xda\x8f(\x9d\x8bUF\x07\xcd\x10\xee,\x80\x15g\xb5\x10\xf6\xc0\x13\xea\x86=\xa8\x02c\xf4\x22\xfcB\x1d0\xa3&B\x123\xf4W\x10\xe3|\x14c[\x15r\x0f\xc1\xe9G\xda\xe4\x90\x95\x82d\xf0ib=Du\xc6\x1fa\xff!5A\x8ajU\x10\xb6M\xf0\x98J\xfb\x1d\xd8\xc7\x971\xf2\xc9\xa8\x80\xf1\x1d\x04\x13#`\x15\xf2@\x16x5\xa3\x8f\x9d\xc4\x8f\xeb\xa6\x07\xcdo\x10\xac\xa9x\x0eIg\xfa\xf6\x87_E\xea\xc5!\xd7\xe5\xc8\xda\xce\xf0`\x95q\x1a\xab\xc1&&n}\x8b@A#\x10r\xb6\x98[A\x18\xe0\xd1n\x0f\xc9`H\x89kF,94\xeb\x8d_;'S\x06\xc1(y\xa3\xfc\x8do\x0c\x80\xea\xa8\x0c\xcd9\x0f\xa9\x09\x16\x09:\xc2\xc3\xc1\xf3\xf8\x9f\xc0\xe3\xecs/A\x01h%#\xc5>\x1b\xb7\x05\xc5|\x0b\xfe|\x9c\xe8I\xfa\xa6\x03:t\xc0\xf5.\xdc\x02\xd2j+Co\xa8\xa0\xa0B\x1ex\xa2\xad\x0c\x94M\xd0CHT\x1f\xa5\xa6\x03l\x82\x1e0C\xb6\xaeKHR\xdb(\xad\x1e\xacR\xde\x83G:2VG\xb6i\xec\xc1\xeb\x01~N(\xe4!5\x81L\x22\xb5\xe9\xe2\xd1\x1d\x99t\x00\xcc\x1ed\xd2\x1b:\xaf\xc3\xe7X8\xac0\x16!\x0fdAi\xd7\xe0z\x0c\x05\xff1\xf0\xd9\x0a\xbf\xa3\x18\xa3\x81\x81\xb2E\x8a\xf30\xfd\xef\x1c\x06S\x03\xd9t\xe6\xb1\x9e\x07\xbd\x89[\x84\xc1w\x0c:|G\xd1\xce\x06\xd2\xf4&\x92%\x8b@\x81#\x90\xabWD\xa3\x91\x92\xc1m\xb6\x87\xe4\xeb\x1f\xc6\x9a\xf5I\xd1K\xe1'\xbbN\xaf\x91\x9a4\xf9\x22\x957F\xc0l\xfd\xc8\x973\xca_>\xf7z\xe1}\x13\x08\xf9\x22\x12\x0a\xa66\xcaS\xafX\x1e\xd5\x81\x13<\xc4\xac\x85\x02\xff\xc5SQ3\xd5\xca(\xedm\x9e\xb4,A\xf1\x08u\xe0\x09J.\xdc!$\xe2\x93\xe3\x03f\xbc\x8d#[\x1dd\xd3\x1e\xb9V|Q\x132\x9b\xf3\x09\xc2\x1eR\x13\x8ca\xa46]L%\x93\xc6H\x16\x0a\x83U\xc8\x03Y\xb4\xd2\xe1\xe1pr\xa8\x03g\xb24\x10>\xa2q\x7f\x0c\xf9\xcb\xa2\xf47\x11\xee\xc0\xb5\xff\x8ex\x0a\x18\x9a\x09Qx\x0e6\xd7\x22\x90\x0f\x08\xe4\x9b\x110\xb2b\x0b\xa4\xfc\x8dA\x901\xd0\xcd`\x0c\x81\xd7W\x9e\xca\x89tS\xc8\x19\xa5\xef5\x00N^Q7\x00\xeadI%\x8f\x11\x90\x01,\xd6\x84\x92\xefC\x07\xf5L\xe0%\x5c2\xe3V3\xfeF<\x8b8\x17_\x93\x1dK\x16\x81\x13\x8a\x80\x94p\xbe\x12\x83>\xdc\xf6\x90n\x029\xc9a\x0c\x85\xe41\x0f\x8d\x8d!\x90oV\x07\x85\xf6\xcf`\x12\xdcRd\x04\xd8_/1\x87\xd40\xcb\x7f\x99m \x9d\xc9\xfcW&D\xa5Ag\x11\xff=\xb8\x0d\xdf\x1a\x80\xc8C\xc5\x96(\x00\x04\xf2}%`\xfa\x10b{H\xb3\x7f\xb3\x02\x90/\x0a\x5c\x0d83\x7f\xd2\xe5\xeb!\xb0|K\x16\x01\x8b\x80E\xc0\x22\x10\x03\x04\x0a\xcc\x08\x18Y=\xdbCR\xf6^#\xa0\xb81\x00zh&g\x14\xbe|'\x8e\x11\x90o\xc9\x22`\x11\xb0\x08X\x04b\x80@\x81\x1b\x01\xc9\xec1\x04N\x94\x1f\xf3\xdc\xc0\xc4\xe5\x9b7g\xa4\xf4\x9d\xb05\x00\x82\xc5\x92E\xc0\x22`\x11\x88\x1d\x02'\xc4\x08\x18\xf1\xdd-\x22\xef\x0a\xc0d\x19_\x06@\xba\xdf\xce\xfe\x0d\x22\xd6\xb7\x08X\x04,\x021D\xe0\x84\x1a\x01o?\x5c\x83\xe0O\xb2\x8a\xdf\x0f\x85\x0dX\x04,\x02\x16\x81|C\xa0\xd0\x18\x81|\xeb\xa1el\x11\xb0\x08X\x04,\x02!\x11p\xfe\xb6\x1f2\xd7fX\x04,\x02\x16\x01\x8b@\xb1F\xc0\x1a\x81b}ym\xe7,\x02\x16\x01\x8b@x\x04\xac\x11\x08\x8f\x8f\xcd\xb5\x08X\x04,\x02\xc5\x1a\x01k\x04\x8a\xf5\xe5\xb5\x9d\xb3\x08X\x04,\x02\xe1\x11\xb0F <>6\xd7\x22`\x11\xb0\x08\x14k\x04\xac\x11(\xd6\x97\xd7v\xce\x22`\x11\xb0\x08\x84G\xc0\x1a\x81\xf0\xf8\xd8\x5c\x8b\x80E\xc0\x22P\xac\x11\xb0F\xa0X_^\xdb9\x8b\x80E\xc0\x22\x10\x1e\x01k\x04\xc2\xe3cs-\x02\x16\x01\x8b@\xb1F\xc0\x1a\x81b}ym\xe7,\x02\x16\x01\x8b@x\x04\xfe\x1f\xa6\x17z`\xc8\xef\x04\xf8\x00\x00\x00\x00IEND\xaeB`\x82\x00\x014\xf1\x89PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\x00\x01\x9e\x00\x00\x01\x19\x08\x06\x00\x00\x00\xa7\xc9Co\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\x00\x9a\x9c\x18\x00\x00\x02\x0biTXtXML:com.adobe.xmp\x00\x00\x00\x00\x00<x:xmpmeta xmlns:x=\x22adobe:ns:meta/\x22 x:xmptk=\x22XMP Core 5.4.0\x22>\x0a   <rdf:RDF xmlns:rdf=\x22http://www.w3.org/1999/02/22-rdf-syntax-ns#\x22>\x0a      <rdf:Description rdf:about=\x22\x22\x0a            xmlns:tiff=\x22http://ns.adobe.com/tiff/1.0/\x22>\x0a         <tiff:ResolutionUnit>2</tiff:ResolutionUnit>\x0a         <tiff:Compression>5</tiff:Compression>\x0a         <tiff:Orientation>1</tiff:Orientation>\x0a         <tiff:PhotometricInterpretation>2</tiff:PhotometricInterpretation>\x0a      </rdf:Description>\x0a   </rdf:RDF>\x0a</x:xmpmeta>\x0a\x86\xd2\xae$\x00\x00@\x00IDATx\x01\xec\xbd\x09\x80\xe4\xc7U\xdf\xff\xfa\x9a\x9e\xfb\xdc\x99\xbd/\xad\xae\xd5-\xd9\xc26\x08\x19c\xfc\xf7Al\x02\x01\x02\xc1\x7fl\x08$\x84\x10L\x0c!w\x00'$\x1cq\x80\x5c\xdcGL\xc0886\x06\x0c6\xb6ec\x8c\x84\x0f\xd9\x92-\xc9\xba\xf6\xbe\xaf\xb9\xef\xe9\xe9\xce\xe7\xfb\xea\xf7\xeb\xee\xe9\xed\xe9\x99Y\xed\xaeVV\xd5\xcc\xaf\x7f\xf5\xabz\xf5\xaa\xeaU\xd5{u\xbc\xaa2\x8b&R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R R`C\x14\xc8\xa4\xd0\x87\x0e\x1d\xba\xb9T*}M\xa5R)\xe4r\xb9\xc7\xae\xbb\xee\xba\xcfd2\x99\xc5\xd4\x7f\xb57\xf0\xf9g\x9f}\xf6[\x80\xfd\xfc\xf5\xd7_\xff\xecjp\x1bq\x7f\xea\xa9\xa7\xde\xd0\xd9\xd9\xf97;w\xee\x1c\xddH8\xc1\x1e>|x\xef\xd2\xd2\xd2\xbdX?p\xc3\x0d7,l4\xfc\xe5\x82\xbfV\xd2\xa1\xfcP\xb6[(\xdb\xfb\xb3\xd9\xec\x87\xf7\xed\xdb7\xd1\x98G\xca0s\xf0\xe0\xc1\xaf_^^\xbe\x15\xbfs\x94\xe5\xa3\xd0\xee\x89F\xb8\xf8}\xe9\x14hE\xe3+\xd1\x86.=\xa5\x97\x1e\xf2\xc0\x81\x03\xbb\xca\xe5\xf2\xdf\x22?\x0f\xdfx\xe3\x8d\x9f\xbetL\x97?$<\xea6\xeaw\xee\xa6\x9bnz\xf4\xf2c\x8f\x187J\x81\xac\x02\xc0\xe8\x7f\x12f\xfd8\x95\xe67\xa84\xbf\x0c\x93\xfa\xabg\x9ey\xe6\x11\x0a\xeb%k!<w\xee\x5c;\xe1\xdeC\xa1\xben-\xd8\xf5\xf8\xc3\x00w\x03\xf7\xc1\xb9\xb9\xb9\x1f\x14<ix\x15\xe9\xfb\x0d\xd2Sl\x16\xbe\xd1\x7fqq\xf1\xeb\x94\x1e\x98g_3\xf8\xab\xe5v\xb9\xd2\x01}{\x94\x7f\xf2\xf95\x97\x9av\xca\xe6\xee\x84&\xa2\xed\x0as\xf6\xec\xd9nh\xfb e\xfeQ\xca\xfe\x97x~\x1f\xd8\xc7\x9f~\xfa\xe9w+\xee\x15\xc0/\xd2\x8f\xe7Z\x06k\xd1\xf8r\xb4!\xca\xeb\x9f\xf1\xbc\xed\xf9*\x22\xd5O\xea\xd9!\xea\xce?\xa1\x0e\xfdg\x9ej\xa7\xf6\xf9JS}\xbc\xa4\xed\xb7\xf8~W\xbd[\xb4?\x7f\x14\xc8\xd2K\xb9\x91\xe8\x7f\x82\xe7\xcf\x0a\x85\xc2\x96\xb6\xb6\xb6\x01F<\xdfL\xc5\x19\x83y\x9f\xbb\xdaIc\xa4u\x84x_CZ\xfe\xbb\xe2&\x1d\xb7\xf0\xfa\xfb}}}\x85fiY\xcb\xbfY\x98\x17\x92\xdb\xc4\xc4D\x87\xf2O\x83V9]v366\xf6\xc3\xd0\xf0\xe5\xd0\xfc\x87\x19evB\xf7=\xd8\xff\x0dn\x99M\x9b6M_\xf6\x08_\x80\x08\x9fk\x19\x5c%\x1ak\xa4qY:\x7f\x97RD0\xf6\xbfG\xfcG\x19Q\xec\xe7\xf9Z\xeaP\xe5R\xf0\x5c\xa90\xa4\xe7-\xf0\xb5\xef\xbaR\xf8#\xde\x8dQ OOw\xb3\x82P0\xa3{\xf7\xee\x1d\xe5\xbd\xc4\xe7\x1f%\x8f\x9d<y\xb2szz\xfa3|\xff4\xc3\xe7w\xf36zV\xff\x80J\xf6\x8f\xa9`w\xea;1\xc3\xb8\x7f\x00\xfb+y\x9eeZ\xe7\x87\x99z{P~\xb8\xff2\xf0]\xe0~\x86\xf7\xf7\xe0\xb4\x98\xcf\xe7\xff1q\xef\xc0\xed\x9f\xf1\xdd\xc6\xf3\x93\xe0\xff\xfd$\xbe_d\x04\xf6\xd3\xf4\xc4\xb7\xc2p\x7f\x0c?\x1b\x1f\x1f\xff\x0cx\xfe}\x9a\x06\xb9\xe1\xff\xf6F\x7f\xb9\xcb\xe0\xfe\xb5\xc0\xbf\x8d\xf8n%\x8e\xbf =o#=g\xe5\x87\xb0\xbd\x97\x86\xa2^\xd9\xdd|\x1e\xc6\xefg\x99Z\xfa=\xf95\x1aF\x1b\xdf\x8f\xdb[\xc0q\x1b\xefG\xa9\xbc\xef`\xba\xeac\x82\xdb\x08\x9e#G\x8e\x0c,,,\xbc\x938_\x0f\xaee\x82\xbf\xaf\xa3\xa3\xe3\x9f3\x9d8'\x5c\xa4\xf5e\xbc~\x96\xe7n`\x94\xa6\xdf\x06\xee\xa3\xa4\xf3\xbd\xf2\xc7\xed?\x00\xf3J\xf2\xff\xd6u\xe0\xdaO\x90_\x16.\x9e\xcfC\x8b\xf7\xf1nj\x88c\x0b\xb8\x85\xffx\x92\x96#\x00\xfet=\xf0Z\xf1Q\x0e?H\xf8\x1f%L7\x8f\xea\x88z\xbb\xdbH\xeb\xb7\xad\xa7\xfe\xb4\xa2#\xf4\xfff\xd2\xf8\xefy\xfe\xb5\xe2\xe0QG\xe4\xcf{zz\xfe\xe9\xb6m\xdb\xcecoJ;\xca\xf3\x17\xe5\xb7\x06\xee\xaf\x02\xe4G\xc1\xfd\x1a\xde'y\xff.u\xe4\x9d\xbcK\x0a+CO^S4\x17\x95\xc1\xb1c\xc7\x06\x19\x95\xab<_\x0b\x98\xf2\xfb\x11\xd2\xf4\xf64M\x0a\x9b\x1a\xf0\xb5\xa41#\x22\x07\xa5\xcc\x87\xc8\xef\xbb\x80\x7f-x\x9f\xe1\xad6\xf1Qy\xb6\x8a\x8fz\xf1a@^\xcaS\xc6\xfe\x18\xf5\xea\xfe\xf6\xf6\xf6%\x04\xde/\x82\xe7\x9bp?O\xbd\xfd\x09\xea\xc1\x8f\x83\xf37\xa1\xcd\xff\x04N\xf5\xa3C\xf5\x89\xb7\xa6c\xf7\xd0\xe6\xfe\x14\xb8\xb7\xa9~\xcb\x1f\xd8N\xc2?\xc6\xf3\xbd\x80\x14I\xdf\xaf\x12Vut\x85\x01\xf6\xff\x02\xf3\x1a\xe0\xf3\x8a\x1f\x1co\xa0\x03y\x8cz\xf1\xc3\x00\x8aW\xec\xe4\xad\xb6\xf3/\xa0\xef_+p\x1a?a\x1e%]om\xe0%\x9a\x85\xf1r'\xec\x8f\x03\xfe\xaf\x81\x13->\xb2Zy\x82O\xa3\xbd\xb7\xf6\xf7\xf7\x7f\xed\xc8\xc8\x88w\x98\x88_tTy~7\xef\xef'\x1eu\xe2\xde\xca\xb3j\xbd \xcc\x0e`?\xc4\xf3oI\xd3\xfb\x05\x0bn\xf1\xb5\xd3\xc4\xff\x0f\x93\xef\x1f\xe0\xfd\x03\xd0\xf9\x15i\xfb\x95{4\xeb\xa7@\x96N\xee\xe7\x00\x7f\x8aB\xf9n\x88~\x86\x02\x7f\x0f\xef7Bx5&C@d\xb1\xdf\xca3T\x87v\x98\xc2\xd4z@\xbdy;0\x8f\xe0\xf0\xf3\xbc\xb7\xd3X?\x04\x9ea\x01\xf0\xbd\x1b\xf87\xf3\x5c\xcf\xf3\x0b8\x0d\xe1\xff>\xec\xdf\x86\xfd\xbf\xf3(\xae\x9f\xe2Y\x11\x1f\xfe_\xe0\xf9\xac\xdcy\xbf\x87\x8a\xff\xb4\xec\xa9i\xe5O\x9c?\xa10\xc0\xfe/\xec\xdf\xc1\xf3\xf7\x14\x8e\x8a{#q\xff\x15\xd6y\xf0\xa9A\xfd\x15y\xff\x1d\xd2\xfa&\xf9\xd7\x1b\xad{\x81\xe3W\x81\xfb\x13\x1e\x8d\x02\x1f$\xac\x98\xd4\x86\xf0\x10.\x83\xd0\xf9 \xef\xaf\x03\x8f\x98\xe8;A\xf1\xcd\xb3\xb3\xb3\xbf&\x5c\x8a\x87\xd7_\xf2l\x07\xe6\x1d\xc0|\x904\xfd\x00\xa3\x8f2\xf6\xff+\x18\xc2<\xc4\xf3\x91u\xe0j\x07\xfcC<w\xf1\x88\xb9\xfc9a\xfe\x15\xef\xa6\x06\xfc\xa2\x91\x18\xed\xfbh`2\xbf\xc0t\xe7M)\xf0Z\xf1Q_\xde@Z\xff\x07p3<\xff\x9e\xa7\x8b\xb0?\xc4\xb3O8\xd6\xaa?k\x95\x07y\xee\x07\xe7\xad\xc4\xf1\x0e\xec\x7f\xc0\xf3\xfb\xa0}\xf3\xcc\xcc\xcc\xdf\x15\xfe\xd5hw\xfc\xf8\xf1\xa1u\xe0\xfe5\xf0u\xf0h\x8d\xf2\x17\x89CB\xc4\xa7\x9f\x85[\x86\xf4_hR\x06Y\xcaN\xccI\xf5\xf7\x0fx\x94\xa6o\xa6\x83\xa6\xf2\xc9a_a\xd6\xa2q\x0aL\xfc?F:\x0e\xf3\xfd\x1fx\xdf\xc0\xfb\x1d\xf2\x03g\xcb\xf8\x80\xfd\x000g\x00=\xc9\xfb\xf7`\xf0\xf3\xa3\xa3\xa3jgo\xc5\xef\x01\x9e_\xa0\xde\xfe\x10~\xf7\x10\xc7H\x82S\xd3\xae{e\x97\xc1\xbd\x0d\xff[\xe9\x0c\xf6\xea\x1b\xfbn\x9e\xff\x9f\xe7\xa5\xa4_\xf5\xf5\x04\xf6\xff\x08\xbd\xb7\xc8\xbf\xde\x80\xff\xcf\xf8>\xc1s\x0e\x98\xdf\x83fS\x08\xec\x1f\xc7.\xc1w\x94\xf0?\x09\xccf\xd2\xf0\x09\xca\xe4v\x85\xc5}7\xcfw\xf1|;\xfe\xa2\xdf\x0a\x03\xbc\x97;\xef_\xe1\x91\xb0\x22h\xcb\xb6\xfb\x17\xe0\xba\x8b\xd1\xe9\xb7\xa7\x88\xc8\xd3?\xc2\xde\x8e\xb0\xfb\x02~\xd5\xfc\xb6\xc2\x83`=N\x986\xe2\xfcV\xe1\xd1Z-a\xc5\x1b\xbe[S\xa6r\xc3|'n\xa3Q\xe8\x04b\x5c\xcao^\xc4\xa32\xbd\x9c\xde\x8ez&?\x08\x92o\xa7\xc0\xbe\x1dF\xfc\x04\xee\xdf\xc8\xf7\xf9\xf5 \xa6\xa0\xdeA\x8f\xe0\xe7\x05\x0b\xf3\xfa\x0c\xb8\xfe\x02\xab*\xc1\xff\x90\x1b\xe63\x14\xea[d\xc1_L\xf1\x8d|\xbf\x89pe\xe2\xea'\xce\xff\xa4\xde\xb1\xfcSC\x85\xf98~\xb7\xa8\xe0\x99j{g\xda\x93i\xe5\x0f\xee;\xe4\x0f\xd3~\xa3\xa6\xedd\xc7\xed[\xc1\xff\x0a\xac\xbfH\xe5\x7f;\xefI\xe2}\x13\xf1K\xf9\xe0\xbd\xf8\x8f\x10\x87z\xec\x7f\xccS5\xc0\x0e\xe1\x9e\xc1a\x90\xc6|\x92\xf4\xfc\xcb\xd4s#x\xb4p\x0f\x9eW\xd0\xc0^G\x9c\xea\x9dj\xb4\xa6\x86\xfa\x07\xd0\xf8\x9f\xd1\xd8\x95\xa6\x02\xbd\xd4W\xee\xda\xb5\xeb\xa4\xfc\x81\xffw\xa4\xb1D\x03\xfe%>%8>H\xd8\xdf\xa3\xd1\xbcz\x0d\x5c\xf7\xe2\xbf\x8b\xb0?@y\xfc\xaap\x91\xbfgqs\x01\xa6\xefz\xa3\x1e(i\xb9\x0b\xfa\xfcS\xdc\xd5\xa0~\x84\xf4\xbc\x8d0\xef\x22\xbe\xef%\xed\xafj\x15\x1f\xf5\xe6{\xf0_b\x8a\xf6\xfe\xbd{\xf7\x8e\x0b7a7\xf3\xda!\xfbZf\xbdt\x84\x99\xbd\x91\x9e\xf8Q\xe2\xca\x80\xff[y\x7f5\xb8\xffG+\xda\x01\xf7\xd3\xc04-k\xc2\xff\x19\xf9\x1e\xe0=E\xd9\x96\xa8+\x1ai\xfcFcz\xf7\xec\xd9s\xaa\xb1\x0c\xc0\xfb\x1a\xe0\xee\xad\xa71\xb8\xb4F\xfa\x9b\xbc_\x87\xdf\x07\xeb\xf1\xacEc\xd6x\x1c\x1c|?E\x99\xfdg} \xd0\xf7\xf2\xfd#\xb2\x83\xf3\xd5\xbcV\x8d\x8f0\x1a\xc1\xfc]\xf22K/\xfd?\xf1\xce\x22\x04\xdfL\x98\x8f\xe0\xe7\x8c\x18\xb7\xdf\x06fJ\xf86`>\x0b>\x17\xf0\xa4\xe7)p|\x92\xf2z9\xe1\xff\xa8\x1e\x07\xf5\xe47\xc1\xfdM\xf8\x0f)~\xf9\xf1\xfd/x}\x8c\xef\xd7\xeb\x9bQ\xf3o\xcf\xcf\xcf\x9f%\xbc\xda\xd9[\xe5F\xfe\x1e'\xec}\xbc5\x03\xb0\x9ay-y\xf8\xb2<\xc1\xf9+\xbc\x9a\x96'0\xaf\xc4\xff/)\x83\xbf\x0f\xccoQo7S7\xc5\xbf4Z\xaa\x90|\xac\xc1\xacU\xe7\x80\xffc\xf0\xbc\x85\xfcd\xa1\xfd\xdf!\xd4gy\xb6MNN~#\xed\xefC\xd4\xb9\xaf\x06\xe6\xc7\x12t\xf1u\x09\x14\xc8+L\xc20~\x0e\xeb\xcfQ@w\xc2 \xbf\x0f\xc2\xff\x10\x0b\xe4\xef\xe8\xea\xea\x920Z\xd3PHs)\x10\x95\xe9/\xa9\x04\xeaEW{T\xd8\x17R\x7f\xde\xea\x1d\x97(\xbc\xb2\xdc\xb0\xcf\xe8M\xbcb\xf2\x97\xc5\x90\xfejz@(M\xad\x14\xf7~\xbe%P\xc6I\xa3\xc7\x85]tp\xa6\xe9\x0e\xc9\x8f\x18\x06\xf4\xf8/\xf8\xffc*\xf1\x8f\x03\xff\x08h~D\xf9\x03d\xddxH\x8bF4\xca\xe7\x07\xc0QI\xec\x19\xbe3T\xe2\x9byk\x84\xf1\xa5T\xe8\xc8\x9fxD\xbf\x8b\xcc:p\xedQ \xc2\x7f4\x0d\x0c]\xe7hl\xe9\xe7Eo\xf2\xf38\x8e\xdf\x87\x10\xfc!\xe0\xa4\x9c\xf1\x93\xa4\xe9-4\xba\xf7\x82G=\xc5Vi\xd7h\xf6\xe1\xa4\x0e9n\xc2\xce\xe1\xe6\xf6u\xfc\xac\x8b\x8e\xe0\x9c\x17.\xf0\x8a\x89\x88S\xfb\xc8d\x0d\xda\xad\x8a\x1b<%\xf2\xf7O\xc0\xf3\x0b\x94\xc1_Q.\x17\xf8\xfeyh\xf1\xb3\x8a\xa7\x95I\xe2l\xa4\xf1G\xa1\x9b\xdcT\x96+\x04\x8fp\xb5\xa21\xd3C\x9f\x10L\x9aG\xd9)\xb3\xb3\xe0s\x22n4>z\xe9\xeaH\x15A\xa3z\xea\x86t-\xaa\xeeaR\xa7\xf5\xbc\x9d\xe6\x02D\xf0\x9f\x81NF\xfdX\xb3`\x13\xa6\xdfO\xb0\x8f\xa5\x91\xec\xde\xbd{\x8c\xf8\x1f\xe6[\xf4I\xcd\x04\xe9Z\xbdb\x02\x05\x1d.\xa4\xc0\xbcW-\xcf\x04F\x1d\xad\xdf\xa7\x1e\xdfL{}#\xf62\xf8\x7f;\xf1\xab\x7f\xb5\xc4\x03\xdd5\xb5\xf6\xa3\xd4\x87{y\x7f\x0b\xcf\xfb\xa1\xdb\x0e\xdc\xffN\x92\xde<\x1d\xad\x15\x9d\xd4z\xe4\xd1\xbe6\x054\x8d\x96\xa5B|g\x0aJ\x0f\xe5Q\x18\xae\xe6\xbdgq\xdb\x9e\xbaS\x01\xbaR;\xef\x96\x95\x8f\x8aw'0y\x0a\xeaT]\x98k\xc2J~\x8f\xf0\x8c\x93\x9f\x1b\xbb\xbb\xbbw\xeaan~+\x8f*\xe3E\x06z\xfc\xe8\xc0\xc0\xc0\x16z\xc5o\xc03OXM\x0d\x8aIl\x04\xcf\xd1\x04\xf1\xf7\xa6q\xf2\xdeA\x9c\xc3\xd0\xfaAp\xa9'\xbf\x9f\x06\xa3\xc6\xba\x96i\x89\x8br;-\x04\xd0^\x8d\xc6M+fAo\xfez\x1a\xd8\xcb\x05\x88\xf0\x98'=\x9aBJ\x99\xef\x0e\x9c\xd7\x8a\xef\x14\xf0\xb7\x91\xf6v\x8f\x8c\x1f\xd2pQ\xfdX\xad\xfe\x10v#tL\xa3\xa8\xbe\x09\xbf*\xed\xd6\xc2\x8d0\xf8c\x9e\x1b(\xdb\x97\x92\xe4\x0f@\xb3\x9f\x81\x16\xb7T\x91\xafb!/\xc7\xe4\x05\xfe\xafJA\xa0qJo\xf7K\xdd\xf5^\x07\x8d\xeb\xc1/\xb2o4\xbe={\xf6H0/\x92\xa7\xfbRd\xa4Uu\xb7\xb1\x5c\xd2\xa9\xa3\x14\xec\xb2\xbc\xa9G\xea\xe8\xa9\xf3\x91\xd2DkT\x1d\xc4\x7f\x1b\x11\x5cD\x9f\xf5FJ\xf8\x96u\x85\xf8\xde\x07\xae\xf3\x08\x9d\xef\x05\xf6{\xf5M\xf1\x8a\x16+\xccZx\x18==H\x80\xf3\xc0}?o)\xde\xfc\x91\x1e\xbe\xdf\xc0#A\xf4%h|h\x05\xd2\xf8\xb1!\x0ah1\xf0\xcd\x84\xf8_\xbc\x7f\x80\xf7\x07y\xce\xd2\xf8\xbe\x05\x02wR\xe1\xffbxxx\x86\x85\xfd\xa34\xca\xbfG\x03\xfa\x14\xee\xdb\xb1\xff#\x0a\xa21\xa2\x1f\xc3\xff8~t\x8cJ\xff\x0e\xcf\x12\xbd\x02\xe1{\xaefR\x08\x98\xbb}==\xb9\xcf5)\xf0\x15\xfe\x8c\xd2Z\xc6G\x9e~\x93<\xbc\x19F\xf1\xd3\x0c\xfd\xa5`0Oz\xff!Ss\x1a\xf1\xad0\xd0\xe1\xeb\xf0\xff>\xa6-~\x0e\xe6\xf4\x10v=r\xcb\x92\xd7u\xe3A\xc0<@\xfaUQ\xff%k\x13S\xc5b\xf1a\x16\xa6\xbf\x11\x1a^\xe0\xd1\xda\xca\xaf\xe3\xf7]4\x98?\xc0\xae4m\xc2\xfd\xdb\xe8\x09\xbf\x05\xf7Y\x16\x89K\xb8}5\xe9yd-\x5cLW~\x9c\xf4N\x10\xee\x1d\x9a^ \xbf\xa3\x84\xfd\x0f<8]l(\xaf_\xc0\xef\xb5\xc4\xfb{\xc4\xa9\xf2\xd5\xf4\x93\x1a\xdc\x124\xf9\x04\x0b\xa8\xc7Z\xa5\x9d4i}\xe1M\xa4\xfd\x7f\x13\xdf/\x81\xe3.\xc2\xaa\xb7\xe9\xd3#k\xd5\x9f\x8d\x94\xc7\xc5\xa9w!\xb7*\xedH\xf7\xaae\xa4i\xdd\xa9\xa9\xa9\xf72u\xf2\xdfH\xf3\x83\xa4\xe3O\xa8\x13\xdfK\x1cU\x01\x9a\xc6\xd7\xdb\xdb\xbb\xa2\x0c\x98\x12\xfd\x0b\xd6x\x0e\x93\xef\x9f&\xcfm\xc0\x89\xb8\x9a\x1a=N\xf9\xfcY\x1a.}\xafE\xe3\x14n\xb5\xf7:\xe3\xd3\xe8\xe1V\xd2\xf3\xb5\xd4\xcd\xcf\x90\x9f? }\xdf\xc5\xb7\xa6\x10\x1f\xa0|\xbf\x1b\xfcJkjT>\xaf\xa3\xfc4\xb5~\x8a6\xa0\xe9\xdc\xcbb\x88O\xd3\xe7\xbf\x09\xde\x7f@\xbc?C\xdb\xf9\x08\xf5]S\xb9\xea\xbc\xfe\xda\xa5F\xb2V]A\xc8,\x10\xdf\xef\x80\xff\x9f\xf0\xb4\x93\x8e\x7f\xd4,\xae\xb5\xf0\x10n\x19<\xe2]\x12`O\xd3\xf9\xfc2\xefg\xc9\x93\x14\xaf\xbe\x03\x7fM\xe1j:T\xda{?\xceh\xf0\xfb\x98\xaa=#\xb7h\xd6G\x81,\xd2\xfdw)\x88\xb7\x03\xbe\x8d\xe7g \xf0o\xf3\xfe\x06\xdc\xdeI\xefW\x1a!\x15\x9e\x9f\xe3\xd9I\xc3\xfc\x14\x95Is\x9b\x0f\xf04\x9a\x8f\xe0'\xa6\xf9'x\xdc\x02\xfc?\xa0\xe7\xf3d#\xd0F\xbfit\x1f\x04\x97\x04\xdf\xffa\x81\xfe\xad\x8d\xe1\xd7\xf2o\x84\xa7r\xfe%\xf8\xde\xc2\xf3:\x98\xe5\xa3\xe4Ii\xfc*\xd2\xdd\xd7\x08\xcb\xb7\x18\xf8\xf54\xcaG\x10hc\xc0h\xfd\xe4G\x08[\xde\x08\x9e-[\xb6\xcc@\xcf\xbf\x05\xaei\xf2\xf1\xc74\xc2\x13\xd8\x7f\x0a\xb7\x02o\xa3\x0c>\xa94\x81\xfb%<\x1f\xc1\xfe\xdb\xbc\xc7`\xda\x8bZ\xd7\xe2\xfb\x7f\xf3\xfc}\xdc\xfe\xf7Z\xb8\x12\xad*-\xda\x0e\x80\xfa\xdd\xbc\x7f\x97\xe7\xe3\x8a\xa7\x99a\xe4\xf5=\xb8\xbf\x07\x98\xbfE\xda~\x83\xf7\xcf\xf3]$\xbe\xefP\xf9\xad\x15\x1fu\xe4w\x80\xff\x9f<\xdf\xcc\xf3I\x1e-\xc4~\x8a\xc7\x0dxZ\xd6\x9f\x8d\xd01\xc5Y\xffnE\xbbV\xb8)\x03\xd1\xfe\x04y~?\xe5;N=P\x1e~\x860\x9f\xaf\xc7/{c\x19h]\x94\xb2\xfbF\xbc4\x0d\xf4;<\xff\x8bgR\xa3b\xd1\x0b\xfb\x0a\xb3\x16\x8dW\x007\xf9XO|\xd0\xf9]\x04\xdd\xc2\xfb\xc3\xa4\xedv\x98\xe1\xdb(\xcb\xdf\xe7[\xe5\xf1\xafp\xfb-\xdeK|\xfb\xd4\x16\xfe\xbf\x83\xff\xd3\xe4\xff=\xb8K\xd1\xe7\xb3\xbc/\x9ba\x8a\xfe\x9f\x83\xec]\xc4\xf1v\xe8\xfbQ\xdeZ\xe3\xfc>\xca\xab:\x05\xbc\xd1\xc8Z\x95g\x8a\x8b2\x90`\xd34\xe3S\xc0\x7f\x22u\xaf\x7f\xaf\x07\x0f\xe9U\x87\x0a\xb2d\xfeHayK\xe8|Pn\xc4\xf1\x01\xb9\x91\x9f\x97\xf0z=4\xd4\xcc@4\x97J\x01im\xd0\x03\xdc\x05q\xb3\x8d8pk\xa3\x97\xb8\xa9\xd1\xbd\xf1\x9b^\xc0v`}\xed\xa8\xd1\xefR\xbfU\xd8\xad\xe2^\xcb\x7f\xb5x\xe9\xc1\xec\xa8\xd3TY\x0d\xcc\x04C/rd5\x80\xf5\xe2QxM\xa7\xf1li\x85\x8b\xfc\xb8@\xaa\x87Q\xfe\x95\xcfz\xb7V\xb8\x80\xd5\xc2\xe8\x8e\xc60\xf5\xe1\x1b\xed\x8c(\xb7J\x1b\xac\xd1=\xfdn\x15\xdf\xe9\xd3\xa7\xbb\x88oX\xb0\xd4\x81\xf7\xd0c\x5c\xc1\xc0I\xc7\x9a\xf5g#tL\xd3T\xffN\xf2{\x11\xed\x04\xb3\x1an\xd2\x95\xa3lw\xae\x87N\xcd\xca@j\xcez\xea\xd3\xd1\xca\xbe\x16\x8d[\x85\x95_\xab\xf8T\x06\xa4\xb1SpR\x81\xd7\xb7\xec2\x94\xc7\xb7P.\x15\xdeZ,\xaf\x1a\xa5\xa7\xfaq\x05,*\xf7\xf5\xd2w#\xd1\xafV\x9e\x1b\xc1!\xd8\xe7\x8a\x87\xf0\xbd\x1b\x8d3\xc2#\xc8#\x11\x22\x05.7\x05$x\xe8!\xde@\xef\xf6\x9e\xcb\x8d;\xe2[\x1f\x05\x100\xbf\x04\xe4\x1b(\x07\xf5\xdc{\xb0\x7f3o\xa9\x86\xbf\x8c\x1e\xbfOO\xaf\x0fS\x84\x8a\x14\xb8\xfc\x14\xb8\xac#\x93\xcb\x9f\xbc\x88\xf1\x85H\x01\x98\xdd\x87H\xf7\xc3/\xc4\xb4\x7f\xa5\xa4\x99\xe9=\xad'j_\x8f\xa6o\xb5/\xe5\xbf\xb1\xfe\xf4\xcbL\xc5F\xa1\xf3\x95R\xc81\x1f\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02\x91\x02kS \xb36H\x84\x88\x14\x88\x14H(\x90\xbf\xe9\xa6\x9b:fff\x0a\xe5r9\x1b\xa9\xf2\xe2\xa0\xc0K^\xf2\x12\xeb\xee\xee\xbel\x99\x9d\xbe\x14LW/\xd0\xbaS\x97\xcf\xe7+\x8b\x8b\x1d\xe5\xce\xce\xa5y\x02-\xfe\xe1\x1f\xfe\xe1\xf2z\x03G\xc1\xb3^JE\xb8\x173\x052\xb7\xdez\xeb\xc0\xf2\xf2\xf2\xcd\x8b\x8b\x8b\xf7#t\xf6/--uB\x90\xd8~\xbe\xc2kEgg\x9f\xddr\xc7m\xd6\xd9Y4\xab\xd42\xeb\x1c\xb6\x5c\xfb\xaez\xd6\xc1\xd4\xfb\xd6\xdb\x1ddyE`+\x83\xbcy\xd0\x84\x977\xf3\x14\x0a\xdcW\xe7\xf6\xf5\x81\xea\x80sfe\x02\xad\x1e.Mm\x80p,\xb2\xaeL\xb2e2\x95\xe5\x5c\xd6\xc6-\x9by4S\xa9|jr\xb2x\xf0\x13\x9f\xf8\xc3u\x89\xc8\xd8pR\x1a\xc7w\xa4@s\x0ad\xf7\xef\xdf\xbfsnn\xee\x07ggg\xbf{~~~\xcb\xc2\xc2\x82CV*\xf5\x0d\xbby\xe0\xe8\xfa\xc2\xa5@.\x97\xb3\x9d\xbb\xf7\xdaM7\xdfrQy{\xc9W\x8b\xbf\x99\xd0H\xdc\x1c\x06\x8e\xcd;\x05\xaf\xaf7\xa9\x9b5\xd6\xa5\xe4;\xbc\xc0U\x05$)|\xac\xf8\x5c\xf1%\xff !\x1c\x86\x9fr]\xe0j\xb8\xd4S9\xab\xfa\x83\xb7N\xb8\x04\xe7\x10\x22\xfd\x0d\xef\x90\x1f\xf5\xbb\xb2\xd9\x8c\xe5s\xf9\xa5B\xbe\xf0TGO\xc7\xaf\xce\x94\xcb\xef\xfe\xd8\xfb\xdf\x7fAh[\x99(xZQ'\xfa\xbd\xd8)\x90\xd9\xb7o\xdf\x0eF8\xffqtt\xf4\xcdSSS\x86\xfd\xc5N\x93\x17E\xfe3\x99\x8c\xf5\xf4\xf4\xda\xedL\xb3u\xb5w{\xb9\x8b\xdd\x07\x86Y\xcf\xf8a\xc5\x15\xb9\xa6n\xbc\xfd[d\xaa\xb9I6\x04\xa6\x9d\x90\xcf?j\x8e\xe13\xc0W\xb1\xb9\xb7\xf0%a\x12\x0c\xfe\xed@\xc1#|\x936\xc1\xeb\xa3\x0a_\xb3:\xe6\x04Q\xb0\x07\xbf\x0c\xc0U\xf0T\x9ex\xd2\xeb\xdc\x09\x17`\xf4\x9b\xd8\xaa\x81B\xda\x0am\x05\xeb\xea\xec<\xd7Y,\xfezgg\xfb\xcf1\xed6\x91\xa6\xba\xd9\x9bAW4\x91\x02\x91\x02\xcd(p\xfd\xf5\xd7\xf7\xe2\xfe\x03\x08\x9d\xb7MLL\x84F\xdd\x0c0\xba}\xc5Q\xa0Ph\xb3=\xfb\xae\xb7\xe1\xe1\xcdLK\x85)\xa7\x8b\x84\x8e3\xdf\xaa\x98\x08,9\x11B)\x83\x16a\x12~_\xefT\xe7(k\x8d\x8b\xa7\xd8\xdc%qO\xe3M\x89\x8cL\x5c\x11\x9e)\xaf\x9a\xd0I\x81x\xd7\xbaH`KpUc\x02G\x15\x8d\x1c\x05\xe2a\xeb\x7f\xe5\x80\xd0\x91D[\xe1\xeb\x80I\x98 \x94\x96K\xcb\xb6T*ue2\xf9]\x85|\xee\xec\x1dw\xdc\xfe\xa5'\x9ex\x22 K\xc0\xeb_q\x81\xb4\x9e\x1a\xd1\x1e)P\xa3@\x965\x9d=(\x12|\x8fF:\xd1\xbcx(\x90\xc9d\xad\xbf\x7f\xc0\xb6l\xddfe\x18j\xcd\xa4=\x7f\x5c\x9c\xa5\x06\x86\x5ce\xcb\xee&v\x1f\xe0\xca|\xd7\xc9\x94\x10F\x0e\xa9\x10p\xab\x07\xf2(d\x93\x10\xaa(\xa0\x1e}'\x7f\xfe\xe1\x0e\xb8\xd4#M\xe0\xabn\x09:\x17:\x0e\xa7aLH\x8f{\xc9M\xffz<\x81\x01\xb3\xfb)\xae\xc4O@\xfe\xc7\xdc\x9b\xa7Ii\x09@\x89D\xab\x84u)\xb9\xb9G\xc5JKK637\xbdmzv\xf1\xef.,\xf4l\x0e\x98\x9b\xff\xe6\x9b;G\xd7H\x81\x177\x05v\xec\xd8Qlkk\xbbwlll/\x02\xe8\xc5M\x8c\x17Y\xee\x8b\xc56\xdb\xb9w\xaf\xb5\xe5\xdal\xb9R\x12\x9f\x0e\xc6-\xe1\xab\xcao\xdd'\x85H\x18|\xfa\x99\x86K\x84H\xfa\xe9\xdeU..\xbe\x1d\x02\xa4o\xc1\x05Li\x88\x1a\x8c\xbb\x00\xef\xfei<\xbceM?SA \xd8*\xce\xc4\xd3\xbf\xab\x80\x0a\x93z\xa4\xe1\xf9v'M+J\xb8\xac@\xcc\x94\xa3\x1c0u\x1e!\xf9\xc1\xa3T*\x15\x96KK{\x0a\x85\x89\xbb\x80:\xe9\xb0M~\xa2\xe0iB\x94\xe8\x14)\xd0\xde\xde^@\x89`\x1f\x0d)\x12\xe3ED\x81,\x0a\x05\xc3\x9b\xb7\xd9\xd0\xc0&\x84\xcer\xca\x96\x9d\x19\xa7L:\xe1\xcbP%a\xda\xbcS9\x92\xba\xd4\xbc\xaa.\x09L\xed[d-\xa7\xab\xf9\x89s\x1aG\x95\xe4.d\x92/\x87\xd1\x08\xa4\xfe;\x91\x01\xee\x04\xf3O\xfd\xf8v\x5c|\xa7\xef\xd4\xaf\x06\xe2\x9e\x89s\x88\x19\xed4\x0f\x99\xca\x97\xe0\x89\x00J\x03\xf9;|\x84t\x04xwQ\xf4H\xa6\xe5\xf2R\xdb\xfc\xfc\xf2`\x92\xca\xa6\xaf(x\x9a\x92%:\xbe\xd8)\x80\x12\x01m\xb0R\x8c\xca\x04/\xae\x9a\xc0\x02\xb9\xed\xdc\xb5;\xf4\xf65\xcd\x94d?\x15\x085f[\xc7\xe3k@5Gw\x0b\x1e\xb50+\xbfS\x9c!\x8a\xda\x97\xa0\xaa#\x15\xf7\xc4E\xffUi\x90\x84pt\xfe\xa3\x10\x0a\xc4o\xfa]u\x0a\x96\xea\xaf \x05\x8b\x83\x1b\xbe\xdc\x1e\x1c\x14\x85\x7f'\xfe+`\xab\xf4\xc0SkY\xbe\xf6\x93\xa0\xf2\xb4\x09W\x05\x81]\xc9\xd0zZ.\xe3D\xc1\x93\x90?\xbe\x22\x05\x1a) \xa1\xb3\x92\x01\xd4 \xa4j\xdb\xd1\xc9\xa6B\xda\x9f\x1a\xaa\x16j\xc3O\x0d\xa6\xd6\xb8\xeb\xdc\xb0z\x9bV\xbb\x95s\xda\xc0\xfdCn\xfa\x0b\x8e\xfaM\xbc\x13\xf7\xda\xb7\x82\x06\x93\xc0\xf2\xf2\xb0\xe0\xd1$\xc9\xaa\xc6U\x9f\xe4\xdb\x02F\xbe\x82\x13H-\x015\xbb\x82'Fq\xca#\x05K\xdd\xf5\xae\x0f\x9e\xba\x07&\x97~\xad\xf2N\x02\xea%#\xdc\xa9\xdd\x1d\xf8H\xbf\x9b\xc5\xeb0\xc9O=\x9c\xec)|jO\xdf\x02W\x99\x0e\x0e\x0d\xd9\xc2\xe2\xbc\xcd\xcf\xcfVa\x1dU\x12\xb0\xbel\xdc\x9d\x9f\x14g\xe0\xd8\xa9+i\xc4\xa3\xea\x87\xb3xs\xaaEV\x8d7\x01\xd0\x02\xbeF\x1b\xf5\xf0a:\xab\x1eG\xf0\xaf\xc2\xd4\x11\xb3\xea\xe6q(\x0c.rL^\xd8\x12S\x07\x89U\xe9H\x01S\x9f\xf4\xedSm\xcb\x1a\xed\x90r4\x1a\x04\x9b\xc9\xe4H'\xed\x82\x8f\x8c\xe5\xac\x0dm\xb6\xd4hT\x94\xe1'\xa4\xb2\xf5\xf4t\x14<)\xd5\xe2;R`\x03\x14(\xb4wZO\x7f/{\xe7r\xd6\xd9\xd1aY\xfe\xd0\xea1\xcb\xd2\xe3cM\x88\xbd\x0d\xd6\x8ef\xd42\x1b\x053\xecuP\x03\x9d\x9b\x9b\xb7|>g\xd9|\xde\xe6\x16\xe6\xadB\xa3\xce\xd1\xa0K\xcba\x1dA\x8c\xa9TZ\xf4\x9em6\x9b\xb5\xaeb\xc1^\xb5k\x97\x8d\xcdN\xdbgO\x9c\xb1\xd9\xd2\x12\x0d_\x1dI\xb1\x86,xC\x82%\x1c\xfb\xfaz\xad\xb4\xb0ls0\xcc\x12\xbb\x03\xa5\xf9\xc4.\x8b\x046\xc0\x85_\x18\x08\xe9\x91\xa9\x88\x8187\x94\xa8\x0an\xc1\x83\xb0\xc4\xef\x0c$a8r\x0f\xa3\xbf\x95\xb0J\xa7\xe2\xaf\xd4\xc3iM\x8c\xef4\xf6\xc0\xc8\xc2\x9e\x0f\xc7_\xc5\xa54&\x06<n\xc4\xbc\x12\xc7\xd4O\xe1S\xbb`\xea\xbf\x03n\x0f\xd9\xf4'\x0d\x97\x86I\xe1\xe5\xde\xe8&\x04s\xf3\xf36w\xf2DS\x5cr\xac\xc7\xb7*P\xe2\x91\xc2\xa6p\xf5\xf1\xa5\xf1\xcb/\xb5\xeb\xad=7\x1d\x1d\x9d\xb6\xa0\xfa\x81]\xe5\x9dg\x97\xa6hr\xf1tW\x10\x83\x22\x1d\xa0!C\xfeR8a\x0b\xb4\xccf\xb5c\xd4?\xfdGxK\xac]e\x90\x1eZ\xc5)W\x11\x0bO\xa0\x90\x87\xc7\xbeg\xf7\x1e\x1b\x19\x19\xb6\xe9\xa9i\xa7\xcd\xc9Sgl\x81:F\xc5\xb7B\xa1`\x85\xb6>p\x12\xc6\x83\xe9\x87\xb8\x08\xa7\x0d\xaa\xadL\x14<\xad\xa8\x13\xfd\x22\x05V\xa1@\x9e\xbd\x1djl\xb7\xdev\x8b\xdd\xf7\x8a\xaf\xb6\xe9\xe9i\x9b\x98\x9c\xb0\x1c\xc2F\x1bL{:;|\x1f\x08\x9bN\xad\x1d!\xa5\x05k4\xe4\x08R\xb1i\xde33\xd3\xa6\xf5\x84\xceb\xbb3\x1a\xed\x83\xf8\xd2\xe3O\xd8#\x8f>j\x8b\xcb\xf3\xb6\x89\x9e\xf7\xab\xef\xbb\xcf^7?n\x9f~\xfc\xcbvl\xa0\xcf\xa6-\xefBm\x99V-\xc6\xb4\xb0\xb8\x88\xd0Z\xb2{\xee\xba\xdb\xfe\xbf\xd7\xbc\xc6\x0e\x1d>l\x0f=\xf4ig^\x8b\xf4\xda\xa5\xe2\xda\xd1\xden\x9c\xb6\xe0iu\xc1\xb6\xb4\x88\xe6\xd1,\xccf\xd9\xfaz\x07\xad\xb7\xbb\xd3\x19\x0a\xe2\xd1\xd5\x86s09q9\xa5O\x82Q\xdd\xf6E\xb4\x95\xb2\xd9\xbcm\xdf:l\x9c\xd8\xc0h\x80\x0d\xb4p;1\xa7\xd9\x99)\xcb d3J\xd3\x12\xcc\x0c\xb7\x9d\xbb\xf6\xda\xe2\xc2\x0c\xe9C\x10\xc3\xdc\xda\x0ay\xc71=\xcb>(\x04\xb1x\xdb\xc8\xc8\x16[r<\x88<\xe1A\xb8\x06\x16l\x08\xf0%g\x80bc\xa9\xa9\xb7\xcb\xad\xf1;\x85k|\xd7\xc35\xb3\xd7\xbb5\x86m\xf6\xbd\x11\xf8f\xb0\xa9[\xfaV\x1c\xa9]\x82}hh\x93\xddv\xcb\xadv\xfc\xc4\x09{\xea\xd9\xa7\xac\xbb\xa3\x87\xfa\xd1NyL\xd9\x8e\x9d\xbb\xa0\xeb\x22\xf4Y\x84\xa6\x05\xea\x82Y\x01>\xbf\xb0\xb8d\x03h\xe1M\xab\xcc@&A4??G\xe7!g\x8b\x08\xd2\xf3\xa3\xa3\x96\xa3\xc3\xe3\x86J\x90\xa3<\xee\xba\xf3N\x9b\xa2\x1e\x1e9x\x08\xd1\x13:>\xedmmv\xc3\x0d7\xd8\xe1C\x87mzv\x86\xb5\x9a\xb2\xbd\xe4\x9e\xbbl\xd7\xce\x9d\xf6\xf43\xcf\xd8\x92\xe2&\xae3gK\xb6D\xbd\x0b\xf8\x88\x10\x19\xe7y r\xc5\xbf\x1e\x13\x05\xcfz\xa8\x14a\x22\x05\x1a)\xa0F\x86[{{\x07j\xb7[`\x04E\x1a\xe5\x82\xe5a\x08b\xf4\x93\x93\x936E/Q\x02\xa7\xc8\xc8e\x96\x86\xdc\xd1\xd9\x8e\xb0\xc9#,\x96m\xf3\xa6a+v\x14\xfd\xbb\xa7\xa7\xc7\xfa\xfb\xfa\xec\xc2\xd8\xa8=\xfa\xc5G\x19\x85Tlhp\xd8\xee\xba\x87\xcd\x8b\xcb\x0bv\xf6\xe4\x98\x8d\xf4\xe5m\x0fB\xa2\x04W\xc9\xe63v\xec\xd0!;J\xcf|\xb9\x94\x85\x89o\xb6\xd9\xb99\xbb\x81}'\xe7\xce\x9c\x83\xf1\xe4H\xdb\xb2\x9d8v\x8c8\xdam\x00\x5cm\xf4D\x97a0\xa3\xc4\xf1\xcc\x81\x030\xa99\xeb\xe1\xfc\xb1\x91\xc1!\xcb\xb7\x17\xad\xb3\xab\x87\xdcH\xa0-\x90\x97\x9c\x1d<x\x90\x91\x13L*[\xb6\xb3\xe0\x94p\xe9\xef\xef\xb7\x1e\x84U;\xf0mbx\x00<\xfe\xf8\xa3Vl\xef\xb5\xf2\xd2\x1c\x0c\x89\xb8\x19\x01\x0e\x83\xb3\xads;L1K\xf8v\xcbC\xab\x85\xe5Y\x84\xea#6\xcd\xa8\xafM{d\xf6\x5cgm\xf96\xeb\x80!V\xf2Y{\xea\xc9\xc7\xe9\x85g\xacH\xdeN\x9c:\xadu\x82F\x8a\x7f\xc5\x7fk,\xa9\x93\x00\xda\xe9\xb4|\xfd\xd7\xbf\xca\x8e\x9f<\xe9\xd3\x5c\xbd\xbd\xbd\xb607CG\xa6\xcf:F\xda\x18\xbdhD\x9bc\xd4\xbcd\xcb\x08\x83i\xfc\xa4\xfe\xdd\xd9\xd3M\xb9\x14\xbc\x5c\x17\x16fmjv\xde&\xc7Gm\x96\x11\xca\xd4\x04\x82\x1d\x01\xaf\x11M\x0fut\xff\xcd\xfb\xed\xdc\xb9\xf3v\xf8\xc0A\x8fS\xa3\x9e!:;\xf7\xdc}\x8f\xcd\xd3\xa9y\xfa\xe9g\x9c\xde###\x94\xd5\x1eC\xbb\xd3\x8e\x1d=\xe6\x9d\x95b!c\xcf\x1e>\xea\xfe\xde\x0a\x92\xb2\xd2K#(\x06Sk\x9a(x\xd6$Q\x04\x88\x14hN\x01\xda\xb1\x8ftN\x9c8\xe5Sk\x13\xe3c\xce\xb8\xd5p;:\xbal\x80Q\xca\x89\x13'mfzF\x13\x1atEsv\xd3M7\xaa\x83hclH\xdd\x94\x1f\xb2\xe9\x89I;H\xe3W\x0f\xf6\xf4\xc9S\xce\x184\x02X\x5c\x9c\xb3\x83\x87\x0f\xd9y\xa6\xf1\xbe\x0c\x039{\xf6\xbc\xe5\xe0\xf6\x9a\x02S\x17S#\x0d1\x0b}\x1e:t\xd0\x06\x11\x0a\x93\xe3\xe3\xde[\x9d\x85\x11u H&'\xc6\xc4\x06\xec\xfc\xf9Q\xcd\x8c\x00\xaf\xd1\xc4\x02\xa3\x96\x12\xeb\x19Y\xbb0z\x1e\x98\x09\x04c\xd1\xba{\xfb\x89\x93i:\x1f\xdd\x98M\x91\xe6\x92\xefa\xa9\xd0\xbbe<TYdDu\x04!s\xd66mB\xe3ki\x01\x866O\xde`j\xd3\x9c\x11Y.)\x87p\x9ee{\xf6\xc03.\xcc\xa4\x8e,!Ufd\xb3Ta\xa4\xa4\x11\x11 \x1am=\xf3\xec\x93\xd6\xd3\xd1K\xbe\xc3\x14\xe58\x82\xba\x84\xbf\x98\xe32\xf9z1\x1a\x09\x9d\xb1\xf1\x09\xfb\xccg?\xe3\xb4\xe8\xa4c233k\xe7/\x9c\xa7\x13P\xb1\xe3G\x0e\xd3\x01\xa0\x0e8\x11\x11\x22\x99\xb2\x97\xa5\x84\xc9\xe4\xd4\x84\xd7\x87\x1c\x15b\xb0\x7f\x90\x8eH\x98\x1a\xd3To\x8eNCGWz\xb4 \xe2\x8d\xb2\xff\xdc\xe7>gst\x94\xb29\xe8\xad\x81)%s\xe1\xc2\x05\xfb,\xee'\xa9\xcfT\xb4D\xc0elp\x90\x911\xc2\xef\xd8\xf1\xe3v\x9c\xa9\xb6\x8a\x0b>\xd5C\x8c\xa4\x8d\xea\x96\x8a\x0c\xbb\xd2\x12J\xaf\xf5\x5c\x9b\xb2\x10M\xa4@\xa4@\x03\x05\xae\xbb\xee\xba>\xa6\x95\xfe\xdd\xf9\xf3\xe7\xdf\xce9m\x0d\xbef\xddC[\x98\x06)\xc0\xb4\xdb\xad\xab\xab\xcb\x19\xaa\x98\xb6\xe6\xe8\xa5R\x9ac\x1dG=\xfb\x05\xa6<4\xc2\x910Q\x93\xec\xe8\xec\xa2q\x22\x86`\x08\xda\x1d/um\x09\x03&\xae`\xf0\xcbL\x91\x84\xb9}\x8d\x94\xba\x81\x15\x93\x98b\x1aoa\x9e\xe9\xae\xa4\xb5z\xd3\xa6u\xa7M\x9cs\xb2\xe8\x0dw\xfbHijz\x12F\xc2\xda\x11\xa3\x882Se\xbeh\xed\xa9K\xa1\xc5\x1f\x02kH3\x95E\x01I\xa3\xa80\xd7/\xbf\xd03V\x08\x81:\xa3K\x80\x95\x8f\xbc\x8f\xa8\x18SI\x92)\x1d\xca3i[\xc1L\x80\xd3\x1a\x82\x18\xa1\xe8\xa1t\xd4\xce\x0c\x13d\x05<\xcau\xd6\x05\x8d\x98\xa8Fz\x9e\xb2F\x5ciB_$o\xad\xb7i4\x5cbZK4\xce\x22\x04D\xf7@\xb5\x84\x08\xd0V\x0a N\xaf\x06\xbaHI\x22\x94M\xf0U\xc8\x15\x90 \x12N\xd5C\x09\xa6\x9aJ7\xe5E=\x90\x9b\x8c\xca\xfe\x16:J\xc3\xc3#v\xe6\xdc\x19;z\xe4\xa8\xafSz\x85\x00\x87\xeao7u?\x94<1\x00\xaf\x0e\x0d\xed\xe10\x82\xea'>\xfa\xe1?\x7f\x97#j\xf2\x13G<M\x88\x12\x9d\x22\x05\xd6\xa2\x80\x18\x81\x16W\x97\x99\xeb\xd64\x843\x01q\xdf\x84S\x07\xe6\x1e\x16yC\xc3\x0f\x18}}\x84\xb0b\xbca\xb1>L\xaf8[\xc1=\x07S\x97\x91@\x1a\xa5\xf7\xeb\xc2\x06w\xf5\x86\x15&\x04EP\xd0S\xcd\xfa\x87\xa2T\x8f\x97\xd3\x15<\xee\x9c1\x83\xe5V\xe4QS#v\x14\xb0%\xc2\x02\x071\xa6<\xc2J\xa6\xd1_\xdf2i\x18!\x97\xc0($\xf0\xc1\xb7\xc9/\x01\xc5\xc24\xf5\x97$\xd5q\x0bR\xb8\xd4K\x16\xee\x1cy\x0bJ\x13\xf2\xb94S\x9f\xc6V\x18\x04\xa7\xb8\xafuSb}L4\x11\x8dE\xedP\xee\x8di\xf7ZsQV$H\x5cP\xa5D\x07b\x05\xa4\xd3\x9d\x1f\xfc\xa5\xecB\x09Tq\xa8.\xe5\xb4p$\x03\xc8\xa1\xa3G\xed0Sl\xea4\xa8\xbe\x16X\x07J\xd1\xfaz \xee\xe1/\x09\xc27=\x88\xf0\xd1\xe27\x0a\x9e\x16\xc4\x89^\x91\x02\xabQ@\x0d\x9b\x93\x0d|\x1aCSU\xea\xd9k\x01\xb7\xd8VtA\xa0F\xabo\x8d\x82\xb4^\xc1\xdd%\xac\x01-2\x1a)\xf9\x1a\x90z\xb4\x9dL\xc7i:K\x8a\x02KL]\x89\xd1HKLa\x8bLQ\xa9\x85\xcf\xb2\x00,\x01\xd7\xce\x94\x9bF\x10K\xcb\x8b\xac\x9d\x14l\x92\x91\xcd\xdc\xec\x02q\xa9\x91kf]\xed\x9dQ\x03a\x9d\xb1JP\xe9\x03?\xad\x07HH\x81\x9e\x9e\xf0\xb2\x8f\x88\x82\x8f\xfc\x80\xe3\xbf\xc0t\x8c\xe2\x93\xf1\x11\x8c\xf0\x02$8w\xd5\x0f\x1fB\xebZR\x02\xc4\x94\x99b\xd3pG\xcc'\x81\x0c\xf1\xb9\x0c\x0b\xaeJ\x9c\xd2\x99Bxz\x82\x8c\x0b\xc2\x97t\xca\x8f\x0cz\x1e\x1d\xcei\x91\xa4\xc7GB\x0d\xe9\x1180U\x0d=\xa5\xc0%Y-%\x9a\x96\xf2i!\x8d']p+\xbd`O\xd2\xa2(e\xa4\xe4\xd1\x08\x17|\xae\x8d\xdf\x84:\x97-1\xa2\x93\xe8!Z\xf8\x86Q\xe8\xeeCV\xc5@\xb9\xa8S\xe1S\xc3r\x86V\x22\x99JB\x9d\x22\x090\xa5G\xf5\xd45\x1a\xfd+\x94\x93\x00\xc3\xb9nk'5\x0a\x9e\xb5i\x14!\x22\x05\x9aR@\xbd\xbf{\xef}\x99\xdd}\xc7\x1d,\xea\x86=\x0d\xdd\xa85\x17Q8\x98E\xb1\x00]i\x16\x8a\x8b67\xc9\x1a\x0f\x8dWSi\x15\x16\xeb\x17Y\xc0\xbfp\xee\x9c\xf5\xb2X\xac\xbe\xe5\xa1#\xc7m\xf3\xe6\xcd\xb6k\xf76\xa62\x16l\x9e\xa9=M\xb9\xb5#\x98\xfa{;\x98\xaa\xa3\xb1k^\x1dm\xa4\xa9\xc9i\x1b \x8e\x8f?\xf01\xfbk4\xd8f\xe7\x17Y\x14\xdeb\xc3\x9b\x06\x11bh\x83\xc14\xb2\xac\xb3h\x91_\x82d\x99\x09\xfc\xc9\xa9q\x1b\x1f\x9f\xb4y\x04\xdf\xfe[o\xb7\xfd7\xeecm*\xac\x11\xe9\x82\xb3\xb3\xa7O\xdach\xceI\x03\xaf\xab\xbb\xcfvl\xdb\xca\x9aB\xd9\xf2\xe0(\x95\x97\xe8u\xb7\xb9\x06Z\x1e\x817\xbb0m'O\x9f\xf2\xe9\xb1\xae\xee\x1e\xdb\xb9c\x1b\xe9Ek\x8e\x98\x0b\x08]fZ\xec4\xf8&H\xa7\xd6rv\xef\xba\xce\xfa9\xe5Yj\xde\x12\x04Y\x18\xd9\x89S\xa7\xd0\x9a\x9a#Oe\xa6rnC!\x83\xb5\xb2\x99yWF\x10SS\xdcc\x17\xce\xd9\x84\xd6\xc6\x10\xd4\x8e\xa3\xaf\xcb\x15\x13*\x9a\xa2D\x88k\x04x\xe6\xec)\x1b\x9f\x02\x86<n\xdb\xba\x03M\xc0A\xb2\x8cF\x1e\xf9\x10\xc3<C:E\xc3%4\xfc&\x98\xae\xec\xe9\xea\xb3\x9b\xaf\xdfG\x98\x094\x07Y\xe7\xf2\xa1\xa1\xd9\xa9\x13G\xb9\xe8m\x13\x1d\x80\x19\xa65\xa5\x0d\xd6\xb4\xb8\x9f7\xc7\x15\xa3\x95\xe7\x9a\x0a\x97\xdfe\xeb\xeb\x19\xb4\x9bn\xb8\xce\xd7u,[\x80naD\xb3\xcc\x9dn\xf9\xb6Nh\xba\xe4\xf5X\x07\xa4.\xd19\x92\xa0\x1ae\xadI\x1a\x87\x9d\xed]v\x8e\xf5\xa0t\x80\xefRIBG\x1d\x08\x09+\xe2H\xa7\xebVKn\x14<\xabQ&\xbaG\x0a\xb4\xa4\x00\xec\x80FVB\xabhL\x8b\xbf\x8cl4`\x80\xd7\xa2]\xd4\xe7\xea\xd0m\xed9\x16y\x19\xb1\xc0\xb0Kh IK\xa9\xb3\xa7\x13!\xb3\xc9\xca\x08\x0fx\xac7\xd2\xa5%\xf6\xdf0\x9f\xaf\x91\x84\xd6=\xba{\xba|\xedH\x0b\xcb\x17FK\xbeGG\xdcp\x91\xe9\x97\x22\xc2G\xf1\xb4\xb7\xc3|\x11l2Z<\xd6|\xbb\xb4\x9e\xda\xe0\xe2\xf30^\xb9\xe5\xd1\xa6\x93fY\xf9X\x09A0Id\x9a\xc3\x07\xae\xb7\xdb6\x0d\x0fi\xcb\x91e\xdb\xf2\xd6\xd5\x91\xb3\x03\x07\x0e\xc0\xb0\x11\x06\xb8\x15\x8a\x1d\xd6\x8db\x80\x84]gW\x9b\x95aL\xe8\xd2\x22\xcc\x0a6>\x99\xb7SgX`FY\xa0\x03\xb8N\x14\x04\x06\xfb\x95\x16\xe2\x81\xf9\x88i\xcf\xceL \xecP\xedu\x8eT M\xed\xd6\xd6[\xb0|G\x1b\x0a\xe1004\xadf\x10\xae\xda\xfb#\x22t\xb3p-\x01!z\xe4\x18\xdd\xb5A\x87%\xe8659e\xcb \x14\x13\xd4\xe2\xfa\xa6a4\x01\xb3a\xaaGLn\x0a\x012\x0e\x8cL\x96|KACe\xd2\x89\x00RZ\xa4\xac\xd1\x0e\x93\xf4u.\x04\x8fFHS\xd0fph\xb3\xf5\xf5\xf7!\xd4\xe6\x11\xa4\x0bv\xfe\xecI\xd4\xce;\xe8\x18h\xd4\xe9\xe8^\x04?\x08h\x84vOg\xb7\x0d\x8clCYd\xcef\xa0\xc5\xdc$\xf7\xba!x\xda\xe9Dp\xa9(\xa5\xc5\x08\x1e[.\xc3\xc8\x9d:>\x8av\x5c\x17*\xfa\xe7\x5cu\x8dz\x81\xa7\xca\x22X\xf4\xebc\xa55\xe9\xf7\xa2!\xf3\x9a\x94\x88\x00\x91\x02u\x14XK\xb9\xa0wx;j\xc3\xbd\xf4\xbe\x0ba\x0a\x82\x96\xa4\xc6\xa4yp\xf5\xec}\xaa\x0c\xbb\x9ad\x1e\x98%\xf6\xcf,2:\xa9\xc0\xed5\xedVDPh\x81W\x8b\xc0\x8b\xf8\x89Q\x8aq\xfaB/=F\xed\xeb\x91\x02\xc2\x82\xf6l\xb0\x87&\x87\x80p\xe6\x8e\x0a\xb3\x14\x17\xb4\xafc\x16\xd5d\xf5\xec\xc5P\xb5\xc9P\xf7\xc0\x84\xb5\xa6\x90\x96\x94\x8bjz\xcd\x17\xee\x99\x16S\xdc\xc2\x93#\x8c\xa6\xbc\x02\xe3@\xa9\x01\xc1\xa7\x9ej\x86\xc5e-N\xfbt\x0b\x0e\x9a\xa1R\x8f[\x7f\xae8A\x86\xb4\xf9\x90\xc8<\xfd\xbe\xf0-\x01\xc8\xb7\x986+\x04\xbe\xee%\xcd4M\xca\xe43\x88\x1a\x84\x91x\x93Ow)\xcf\xe4\x09oL\xc0\x91\xf3\xd1Y2M\xa8\xa9F\xdc\x97\xc9\xa7\xa8\xa7?\x8d\x0a\x95V\x85\xcfK\xf0\xaaGM^42\x12\xdd<\xd6\xc4_v\x19\x8d|4\x8d\xa9\xf0\xcaAp'o\xca\x09\xf9\x932\x86N(XZD\xc9\x1c\xc1\x16\xee\xd0\x09\xb8\x14\xfe+\xd6@;\x09\x0a)\xad\x88\x16\xf4v\xb8]\xb5\xd3\xa7\x7f\xbd\x8eP\xe6:\xa3\xce\xa7\xd2\x18=\x87R\xa4\x8ea\x13\xadEs\xb9:U\x09\xcb\x18V\x08\xfd[4\xcb\xb2&\xd5\xdd\xd5\x8drA\xdfO|\xfc\xa3\x1f~\xd7jt\x8c#\x9e\xd5(\x13\xdd#\x05\xd6\xa0\x80\x84\xcc\x82\xb4\xd0h\xbf\x9a+\x97\xd0PC\x15\x9b\x9b\x9c\xf6I/\x98e\xd20\x05\x033\x94\x9f\x1a\xad\xdf\x0f\xcc\xb7\x9a\xacz\xe9b\x8e3s\x0a\x9d\xb0\xc8\x19Y\xf0\xc7\x93}\xe2\x81q\xeb\x0d\xf3\xd5\xb1$\xce\xe5\x1d\x93\xfcP\xab\x85Q;3\x00\xa6\xde\xb8\x1b\xf0\x15M\x9f\x5c\xf7r+\x0d\x8c\xe0M\x9a$x\xf0t\x81\xa0Hq\xca\x1d~\xd4\xec\xdc\xd3\x08<\x04\x8b\x16f0\xb2\xc9;5\xc2G\xc8$~\x04\x00qg\x04T\x85\x0a\x1b\x0bu\x22\x83\xdc\xbc\xff+f\xa7/\xd7\xb0\x15^\xa6\x03\x13\xa4r\x17\x0e\x01\x04\x98$\x1f\x84\xf7x\xf0\x97\x91\x9f\x18_yA\x91%\x8c\x0f\xfcU\x05\x0b\xb9\x8a.\xee\xab\x98\xa1\xa5$\x1e\xa6\x96\xfe\x10NS\x80\xda\xec\xeb\x92\xd6cQ~\xf4/\xc8\x1a\xb4\x07\xfeJ\xfb\x91\x14\xf7\x0a+\x0a\xc9n\x8ct\xa5\x98\x92\xe6]\xee\x1ae\xaa\x06\x84:P#\x01\x82\x1b\x01\xafQ\x8d(\x9bC\x1b2\xc0(\xac\x5c\x09\xa9ia\xfe(\xd5Z\xb0&\xb6(x\x9a\x10%:E\x0a\xac\x87\x02:\x16\xa7\xd8\x99g\xca\x86\x86\xc8\xa8F\xc7\xd6d\xfc\xc8\x1cz\xfa\xf8I1@;\xc0\xb5\xa9T\xd3V\x0b\xecgQ\x93\xac\xb26\xf5<\xab\x11\xd5\xecU7$Cjw>\xae\xb0.)\x14\xc8\xd9F5\xb4,)l\xbd\xa3\xbb\x89\xcbs\x1aB\xee\xc4c\xd65\xc3\xe6NMI9\xb4\xd8G-T&\xc3:\xcc@\xbf3\xa1\xc0<\xea1E\xfbW\x14\x05j\xc5\x1e\xaaR\xfd\xf7z2\xaa\x8e\x01r\xe9\x02kq\x8e \xa9\x8e.\xbft\xe2Ek\xb9\xc3\x94k4\x91\x02\x91\x02\x1b\xa6\x80\xa6+z\xd8ty\xdb\xad\xb70}Ua-\xa1\x83]\xdd\xddv\x04\xf5S-\x9ak\xa1]L]\x1ak\x9d\xec\xc7)\xb1Y\xefK\x8f~\xc9\xc6\x11F\xae\xb9\xb6\xe1\x18\x9fc\x00\x98Aai\xca\x8a\x8bL\xcbU\xe8\xb5^,\xb7\x9c\x7fh\x1a*\x08\xa3f\x00\xad\xd2P\xcf\xb9V\x0b[\x0f\xd3\x0a\xd7\x95\xf2[-]W*\xbek\x11o\xb32H\xe9\xd2\xcc\xafY\x1e4\x9ad\xdc\xaa\xe9\xdd\xea\xe8\x1b)\xa4\x81k\x18\xbe7\x0b\xb4\xc2-\x0a\x9e\x15\xe4\x88\x1f\x91\x02\xeb\xa7\x80\xa6\x88\x8a\xa89\xef\xda\xbd\x99\x85W\xd6\x1cX\x9c\x95\xea\xf3\x1cg\xa1M\x8d\x8eY\x0f#\xa0\xbd\xd7\xeda:\x88Q\x11\x0b\xb3gX\x94\x1f\x7f\xf6\xe0\xfa#\xb8\xac\x90\x8ca\xd2\x11\x16\x0cbu\x16\x93\xfa\xa4\xefKI\xc4s\x09{)\xf1\xad7\xcc\xb5\x9a\xae\xf5\xa6\xffJ\xc1m\x94.\x01>\x88+~\xa9W\xa9\xe8\xf2\x09\xb7\xf4\xa3Er\xa3\xe0iA\x9c\xe8\x15)\xb0:\x05\xd8S\x83\xa09z\xe4\x08\xaa\xd3\xda@*%\x02\x9dT\xa0\x05\xed\x02\xea\xcd\xbd\x1c'3mG9\xd3J\x87y.\xa2&\xbd\x88p\x92\xa2Au\xa7\xf8\xea\xc8\xaf\xbc\x0f\xccB\xf3\xf8\xd5\x85\x7f\x9f\xd6\x0b\xf3\xfeb+\xce;\xb4\x9e\xd4\x98\x121\x192{\x91{#\x5c\xfc~\x11P@\x9d\x19\xb2\xe9\x95\x01\x8b\xec>\xd7&K\xeb\xb9\xb6(x^\x04\xd5#f\xf1\xf2S@\x8a\x02\xf3h\x95\x1dx\xe6\x19;\xc8\xba\x8e\x9a\x9a4\xc5\xaac\x09\x1a\xa3k\x5c\xa5\xedQ\xf3\x100wo\xa8\x97?9\xeb\xc2(\xf5\xe9\xc0#\xc2\x9e\x9b\xcd#C\xec\xef\x99f*\xb0\x9d)\xc19_\xa7Z`S\xaa\xa6P\xb4,$u\xeeET\xbd\xb3\x9a>\x91\xb0a\x1a\xae\x83#\x82\xd2\xbbjt$\x0f\x839?\x14Ro\xc7\x1dE\xd2\xba\xca\xe2\x85\x03\x94T\xe0\xfa\x04\xab\x97U5\xd4\xebr\xe8\xb0\x00\xe9k\x90\x17+%T\x81\xab\x96(x\xaa\xa4\x88\x96H\x81\x8dP@\x0d\x92S\x00\xd4\xda\xbc\xc5\xad\xd4\x02\x92\x93\xdc\xc5\xb3\x13%\x22\x17:\x81\xf1'a\x04\xf3<\x18\x9d\xe5\xb6u;\xa7_\xdfv\x13\x9bWO\xd8\xe0\xc0\x00'\x15\x9f\xb3Y\xf6\x09\x0d\x0f\xa0^\xeb\x07Jr\xae\x1c{`\xe6\xd8\xdb#\x15\xe6v]\xeb09\xe7\x87}\xe6\x18\xb5\xb5q*\xc3\x1c{\x98\xfa\xd8\x1c:9;i\xfd]\xbd\xf6\xe4S\xcf\xd8\xf9\xf1\x0b\xae*]\xcf\x9a\x9e\x87,\xc6(/\x07\x05\xe8%-He\x1f\x5cE6K/\xb1\x99\xb8\xcc\xa8\xbd\x80\x86d\xbe\x8dN\x96\xea\xb6<\x1dBv9H\xeb\xcd\x1d[\xa6 \x0a\x9e\x96\xe4\x89\x9e\x91\x02-(\xd0l**\x01w\xc6\xab\x1f\x9e\x94\x09\xa7ow\xa8~\xb4\xc0\x7f9\xbd\xe8\x98\xba\x81'\xe8,\xae\xbd\x5c0\x97/t\xdb\xce\x9d;HN\xd6\xc6\xc7\xc6\xed\x1c\xa7\x12\xdfy\xc7\x9d\x8cjr~Z\x81\x9f\xc560h\xa3\x9cb-u\xed\xa1\xa1>6\xa5\xb6\xf9\xdd9\xa3\x13s\xb6\x8f+\xa2\x8fp5C\x7f\xdf\x00\x07Cv\x22\xb4:\xb9\xfb\xe5B\x90\xb6\xd5\x5c_\xceLD\x5cW\x93\x02\xaa2e\x9dT\xc0\xe9\x16\xbe\x87\x8a\xcb5ftp)\x1d.v\x83yR\xc2\xbaa\xa26\x8f\x8b\x0b\x9d\xb4\xae\xb5Hl\x14<-\x88\x13\xbd\x22\x05ZS`\xed\x9e]\xeb\xf0W\xd37\xa4U\x8c\xa1\x0d\x8d\xbb\x93\xa7N\xd8\xb3\xcf>\xc3Z\xd4\x80\x158)@\xf7\xf4\xcc\xb1\xab\xff\xf4\xd9\xd3\xa8\xc9\xd2\xb3e\xfad\xfb\xd6\xcd\x9c\x0e0\xe3G\xf5wrgP\x96\xb9\xbaI\xaeghkk\xb7\x1ev\xaf\x1f8x\xd0.p\xad\x82\xa6\x1c3\x5c\x95\xb0\x88p\x92\x10[k~\xffj\xe6:\xc6\xf5\xdc(\x90\x8e\xd65\xadZd\x94\x9b\xee\x8d\xaab\xa5Z\x95\xb5\xa3W\x86\x97k\xb5\xad\xa3YD\xc1\x13H\x16\x7f#\x05^\x14\x14\xd0\xda\x94\xce.;\xc6\xf9p\xcb0\x8c\x0b\x17F\xc9\xb7\x86_b\x1e\x15;\xc2\x9d;\x9a\x1e\x949\xc9\x85l\xda$\xebG\xf3\x9f>\xe3\xbd^\xad[I\xb8\xb0\x0c\xc4\xd4\x0bgx\x11\xe6\xcc\xb9\xb3v\x90[+u\x02@`BW{8\x17\xd2\x1b\x7f/3\x05(F\x9d\x18\xa1\x0e\x89\xb6\x0b\xccPo\xb4\xb9\xb8@\xc7#5>\xbd\xc6G\xad[\xa3u\xcc\xb5\x87<Q\xf0\xa4\x14\x8c\xefH\x81K\xa4\x80\x9f\xfc\x9cL=\x84}\xf7\xc9\xee~\x98\xf9\xb5x\x93\xa6\x98\x04\xabS0\x08\x8e\x95\xa9j\x1f9\x97\x81\x83,\xbb\x08\x12)tuvj\x5c\x13\xaf\xf6\x89\x90I}\x08\x07\xa3\xd1\xb1<\xc1D\x8d\xb7\x942/\xf4\xb7\xc6\xae\xc5.\x9d\x8a\x8e0\xa1\xc3\x92\xe3\xac\xbelO\xedZ\x04\x8d\x9e\xa5H\xe0%\xaeJ\xe5O\xb0\xa4\xb5a5\x1aD\xc1\xb3\x1ae\xa2{\xa4\xc0\x1a\x14P\xcf_*\xd4E\xceU\xf3\x0d\xa3h\xb5\x89A\xab\xbf\xaf\xc6\xb8\xc8\x99d\xba\xb2Xw\xeb\xb8\xe3\x1a\xf8\xae\x8a7|A\xe9KEc\xfa\x95\xf6YC\xca\x93\x94\x88\x87\x04\xe0\xc4a\xb5W\x0b\xa0u\xe3X\x0d7\xee\xc2!\xd3\x22\x9a\x00\xc0o\x0a[u\x88\x96uQ\xa0)m%l\xf0\xe0\xdf\x8b\x91wX\xd9\x11\x9d\x13B\xf3\xaa\x8dz\x18\x0d\xa3\x5c \xe8\xb5\xc6<Q\xf0\xac\xabT\x22P\xa4\xc0\xc5\x14\xa80:\xd0\xb2*\xf3Q~:\xb5o\xe6\xf1i\x06&\xa0\xf0\xd3\xc1\xa0\xba(.l\x98i\xda\xb2/Fz%]\x92\xb4\x95\x96\xe8\xa7z\xba\x12\xe6\xc1!\x9f\xbaUt\xc5\xfc\xbd\xf8\x0d\xe7\xccU\xa4\xb6\xe7`\x09\xec\x06\xd3\x97\xd1Ef)\x0e1+\x91A\xa8\xea\xc9\x91\xa2\xaew\xab\x8f\x07^&A\xce\x81\xd8!\xf0jpB\xcb!\xa7+\x91+\xcc\xb5bH\x9b\x92\xe7\xf9M3\xdd,m\x01\xc85\x22\xdd\xbb\x91`\xcd\xc2\xac\xdf\xad\x9a\x04\x12\xe2t\xc5A\xd7M(]AY\x00\x5c+T\xa6k\xb8C\xaa\x09\x85\xe4\x10\x88F=\x8eCa\x01\xd3A\x06\xae\xe9\xb9\xc6\x90'\x0a\x9e\x1aM\xa3-R`\xfd\x14\xe0\xc4h\xeb\x1a\xe4\xe0x\xd6:\xd4\xf4\xbc\x11\xf2\x91\x1eL\xc9\xdcx\x99\x13\xa8\xad-\x5c\x8b\xed\x88\xd52\xd5\xea\x9f\x07\xe3\x1dT\xce\x8f\xd3\x94\xc9\xec\x0c\xd7c\x93\xbe<W\x11\xe8\x12\xb4\x85\xc91\xb6\xbc\xb2\xb7\x87S\x17\xfc\x0al?\xe81\x5cm\xbc\x84\xfal\xa5L.\x81Wo\xd7\xaf2@\xa8\x06#\x97\x84a%.\xd5\x17\xf9\x14\xe3l\xd3u\x03\x08\xe0\x8a\x0e\x1e\xd5q<\xe0\xd6yv\xe9I\xc8\x22\x89\xd2\xe0L\x16\xc1(F&b\x06\xa6\xcb\x17\x9f\x05.\xdaS<\xcb\x9c$\xed'\x5c\xe3\x16\xae\xd3\x0e\xb19\xf3\x93\x1b\xe1\xda;:\xc1\xf7<\x11\xb9\x9a\xf9U,\x12\xfc\xe2\xca\xda$\xa5\x0a#\xc3g\xf2Ss\xc3q\x8e{\x81\xb4A*K\x99)?\xe1FR\x81(\x9cN\x16\xc7[\xf4\x82@Z\x87QGGF\xbe\x12\x05\xad\x0d\x87y\xd2\xd1\xd0\x14q\x09\x81\xd3\xde\xad}\x5c\xf3\x04\xccp\x1fS\x915@\xdd\x19\xb5H] \xb9\xa0\xf5\xb2\xf3xU\x1e\xe0\xe6_\xd7X\xe8\x9al\xefw\xa5\xca\x05\x8a\xd4;7\x84\xabN\xe16OI\x14<\xcd\xe9\x12]#\x05ZR\xa02\xb2\xc7\x96\xdf\xfa3u0\xe2 j\xf0Zn\xd7\x88G\xfc\xc5Y\x22\xeb\x1f\xde>\x03\xaf\xc1]\x90\xe2=\xda\xf1\xa0\xb7\xa0\xae\xb8\x81\xd1,\x9f|\xda*\x8f\xbc\xdfl\xe2\xbcUv\xdcjK{\xeeF=\xba\xc7\xca\x8f\xfc\xb9\x95G\x8f\xc3Hr\xd6\xcb\xe5n%\x84\xc44\xa7.(\xd5\x15]\x81\x800\xedlo#\x1f\xe4\x8c\xa4\xe6\xb2Ez\xb6\xac\x05\xf1d2\xc5j\xbe$6\xc4\x18\x95\x1b\x9d\xa0\xbd\xb0\xc8\x85l\xd8}*\x06\x1c[6\x8d\xd8\xd4\xc4\x14W\x12t\xa2\xd2\xcd\x8d\xach\xc1\xe9b\xb12\x82I\x9avA\xa8\x11Vt\x03^\x97\xd8\x8ds\xf4\x90\xe8)\xad\xaa6\xc2\x8c\x0co\x22}\x5ce \x0d:\x88761\xee'&\x8b\x09N\xf9\x1d@\xa2\xa4\xa7@\x96k\xc6\x88.%N\xb0\x98\x9f\x9f\xe3\xae%\xce\xf5\xe38%M\xcavu\xb4\xfb\xfa\x98\xf8\xb5\xd6R\xc6\xb8\xa0O\xc9\x17\xd3\xef\xe9\xecA \x94l+\xda\x85\xcao &'\xa2s\xee_\x11\xb5\xf66\xa6xg\xf1\xef\xe4\xca\x0c\x09\x10]\xdav\x0eE\x8f9\xe8\xe9\xb0\xab\xe4^\xb5t\xd3\xd0&\xbfO\xe9(wD\x09VW^d)\xeb\x8e\xf6A\xd2\xc3==m\xdc\xb5\xc4f\xe1,\xd7h,\x82W'o\xcc/\xcey\x9c\xba\x03\xc9\xeb,B(\xbc\x93\x88\xc0Q\xce\xe1\x22\x19Hr[\x99(xZQ'\xfaE\x0a\xacF\x81<\x8crx\x8f\xfb\xa6\xccU\xef\x02\x83\x80\xdb\xfa\xcc\xb6\x16a\x22\x0b\x8c\x22ham0H1_\xa9(\xab=J\xd8\xcc\x962v\x80\xab\x0f.,\x88\xd1:\x9a+\xfaS\xe12\xba\xfc\x1c\x0c\x83\x1e\xb4\x18\x1c\xdb1L\x03\x19]\xb3\x90CH0\x16\x22}0\x18\xd6\xa5\xa4T\x00H\xd5\xb4\xb1\xefg\x91\xd1\x86n\x95\x940-\xe5\xf1G\x10\xa8\x97\x9d\xe3\x88\xe2pc\x8e\xc0\xc3\xfa\x96l\x0a\xce\x0cd\xd5T`^\xa3\xa3\xa30P\x04\x0d\x0cN\x17\xd6\xb1\x8f\xd5\xe9\xa2k\xbfu\xc9\x9d_\xa5\x0c3S\x0f_\xe1\xb5\xd1\xd5\xef\x1b\x12\x16\xe8\xaa4\x8cMLz\xa7:G:8S\x813\xf2\xd4\xb7f\xcc\xb9\xa4\xd1\xd7\xb5k$\xb0\xf5\xe8\xfe\x22\x19\x09\xd2\x1c\xd3\x90\xba\x0a]\xb4\x91\xc1\xe6o\x0d*\xca\xe4}\x8e+7T\x10\xd3\xa8\xb4\xcb\xcb\xaf\x19GXIx\xcd.\x16\xacHY\xeaV\xdbr\xa1\x88\xb0\xd0\xed\xb3L\x99B\xd7\x1c\xe5$:\x13\xa3\xe3\xbb\xe8\x07\xe7E\x84\xa0\xae\xb2\xd6\xa9\xe9)\x9c\xb4\x17u\xcf\x93n\xbf]\xa4F,\xcds9\xa1N2'\xe1\xba5w\x89\xe9\xd9\xfa\x9bE=\xb5\xa4Oo\xd5\x17\xbds^\xe6\xeesQ\xb4\xf5\x0eQ\xf0\xd4S#\xda#\x05\xd6K\x01I\x0b\x1an0\xa1\xd5i\x1a\xa2@\xcbk\xafpX\xa8\xd4\xbe\xca\xb0s^]9X\xa4\xb7J\xa0\xf5\x06\xaeM\xa3\x08\xba\xb5\x17\xc0qU\x04\x8f\xc7\x03S'\xfe<=\xee\x8e\xf3\xcfZy\xec0<\x07\xd5\xe8\x12\xe9eg\xbaz\xe5s\x1c\x99\xa3\xa90\xf5t\xb5\xc6\xa3\xcd\xa6\xba\x90\xce\xa7t$11\xba\x06B\xccHkB\x9a9\xd2\xc4J0b}\xc0\xe0&g]X\xa7\xeb\x884\x92\x92H\xd2HELn\x01\xa97O\xaf=\xe4\x9b5 \x80K\x92\x82\xeeKX\x9f\xae\x01\x0f\x00\x19\x98\xabne\xe5\x1aT\x17xs\xdc\x5c*\xa3\xe5k)w(:\xfd\x88\xfd\x89\xe9\x0a\xf4Z4\x12\xcfYn\x84\xed`t\xa2\xf4\xcekT\x82p\x09\x14\x0d\xf4\x02\xc4\x8d\xdc\xf2\xd0]t\x11\xec8{\xa54\xba\xd3\xb7h\xa6\xd1If\x8e\x91OF\x82\xc9\xfct\x09\x91\xc2\x0d\xdf\xba\xc8O\xd3\x97\xad\xcc4{\xaff\xb9\xa6#\xaf\xe9`\x90\xea\x82\xc02\xefyn\xca\x15]E\xdf\x05\x15\xae\xd6\x02\xddP\x16>\xa5\x07\x9d\x19i\xa5\xf7 )-Jc0\x92:\xd8U~\xd4\x99V&\x0a\x9eV\xd4\x89~\x91\x02\xabQ@\x0dr\xf2|\xd5WMOSg\xbaq\xe7\xf3\xe3\xa1\xe7\xaf&)\xd6\x22\x16\xe0MSm\xd2\xdb\xa9~\xc4@8\x13\xcdmW\xfa\x07\xa6\x81\x90\xcb\xcc\x8e;Sh\xe7\xc6\xc9\xdaN\x0c\xc5\x9d\xaa\xc8z*I\xab\xd8xH\x99F!h\xd1bB\x9ae\xdb\x88\x11\x9e\x02\xc3\xc0LA\xb8S\x1c\xe9{}\x98\x1cZ\xda\x83ni\x1d\xd6Y\xb9\x86\x0c\xd7\xa4Q\xbaB\xda\x9ca7\xc9J\x9a\xf26\xa6\xd2\xaa\xe4\xba\x82yQ\xddT\x9d\xf4\x8e\xc7:#\x14\x8d5p\x0b\xebt\x04V\xa2A\xe2c\x1fFM\x12\xb2k\x99(x\xd6\xa2P\xf4\x8f\x14hB\x81\xcc\xd9\xc3\x96\xff\x9d\x1f\xb9\xc8G\xd3)\xea\xebi\xe3\xa5Zd\x96\x9e\xaaF\x0c~S\xa7\xb7V\xb1u\xa6\xaah\xac9\x98z!\x19E\x5c\x84\xe82;(5\xbe\xa6T@(j\x01\xe1\x22#f\x91\xb2=y\x86oX\xccE\x90\xebwp\x16\x05\xb8s&\xde\x97&f\xab)\xa8ZVO\xc1:@V\x0f|\x15}\xd6N'\x10k\x03]\x96\x14\x87h\xd6\x1f\x99\xa6[\x97\xe6\x98\x8cc\x94\xe4R\xcb\x85\x0eI\xa1\xcaH\x9bZ5\xa76\x0a\xf6\x8f\x8b~\x9a\xd5\xc0\x8b\x80\xa2C\xa4@\xa4@\x03\x05\x98\x9e\xb2\xf3GW8j\xbe\xbc\xab\xb7\xcf\xee\xba\xebN\xdb\xbey\xd0N\x9e8\xeb\x8b\xe4\xba\x97G\x82H=Dm(\x15\x9c\xee\xe79|\xf8\xa0\x1d9\xce\xe2\xeeU\xe00Z\xd7ae\xd8*\x1c\x08ZYu\x1a&\xb0\x8c\xf0\xab\xac\xd5l+2\xba\xa1\x8fz\x1c\xf5\xf6\x0d!\x89\xc0\xd7\x12\x05(\xc6)\xd6\x82\xfaPD\x09\x8a#\xa9\xd0R\xf9\xf2\xa8\xae\xada\xa2\xe0Y\x83@\xd1;R`U\x0ahxSo\x98#\x97\x96\x96\xce=\xdb4\xd8\x07\x83\xaf\xd8\x04\x8b\xe1\x85\x8e\x22\x9aW\x00\x02.\xf5X\xad\xfbj\xd5CZZ\x1a\xf0\xacgj\xa2>\x9aK\xb2;3H\x19D\x0d\xc3\x22\xeb-e)\x13\xd4\x9c\x82\x8d\x84\xd5C\x075\xde\x00U\xcfW\xb4\xe6\x90B\xfa\x0c\x97<\x05\xe6\x81\x83\x8f`\xea\xf1\x87\xf0\x08\xe0\xc41\x01\xf5x\x0b(Ah\xef\x8f\xbb\xadH\x13\xa3G!z\x8e&D\x99\x8e\xc4.\x1d\x99O,\xa5\x19h@#Z\xa54i\xf0z^>[\xa5\xf5\x92\x13\xe4#\xfadm/-sj\xb2O2\xb7^\xde\xf1(\xa3\xe0\xb9d\xca\xc7\x80\x91\x02+)\xa0\x05\xe0\x054\x82\x1e\x7f\xecq{\xf2\xc9\xa7|b\xc9O-\x00L\x02\xa6\x91O\x89\x91\xa2\xe8\xf6\xbc\x19\xc5\xff\xb2}7\xd8H\xdf&\x04\x03'-,\xa0\x1e\xcd\xbaS\x8e\xbf%\x18K\x89\x91\xd9Ry\x1ee\x00\xa9\xcf\xb2\xef\x87\xa9\xc1,\x0b>\xc5<\xea\xd0\xec tM=x\x8f\x84\xadkG1\x92\x9a0\xf6\x08\xc1\xdd\x17\xa4\xf1\x86f\xd4\x22Z[\xf9\x0a\xaa\xbfR\xc1\xce,\xdb|f\x86\x89\xc6e\x940r\xe0i\xb76\xfc\x8a\x19\xf6\xde\x10\x06\xd5\x0c;1q\xc4\xceN\x9e\x04V)\x0aFL|\x09e\x84\xa9\xc9\x09\xd6\xc5\xd6\xc1\xd5V\xa5h\xd6\xafs\xc8\x13\xf7\xbc\x04nc\x81\xac\x1a\xae\xd1\x83\x9bg\xd1$\xeb\xea\xebc\xc1=Me\x0dfz|\xdc\x95'V\x8a\xdb\x9a\xff\xd5\xb6\xf5\xf6r\x10l;{\xa1.9\xbf\xab\xa4\xd8\xebt('\x09t=\xaeD\xb3\xa2\x9b\xd1<l\x14<\xcd\xe9\x12]#\x05.\x89\x02io\xb7\x04\xa3\x14c\xce\xd3\x83\xd7H\xa0T.1\xdd\xa6\xa6\x09\x83e\xadG\xccOZD\xcf\x1bsR\xda\x98zk;9i\xe7\x1e9\x85 (\xb2i\x914/\xe5\xd1\xb8k\xb3\xb9\xe5\x19\x9b\xa9L\xb1\xf7d\xdc\xa6\xcaS\x08\x90\x8au\xe5;\xd8\xff\xd9a[:6[O\xbe\xd7r\x15\x1d\x8e\xdf\x06\xb3A\x94\xa0\xce[B@\x8c\x96\xce\xd9\xcc\xf2\x9c\x1d\x5c:k\x9d\xf9.\xf2\xce^\x95\xec\xa0\x15\xb3\x1d6Q\x1e\xb7\xf1\xcc(\xca\xcf\xa8\xe9Z\x11\x0d\xaf\x0e\xebYl\xb7\x81\xdcf\xdbT\xd8j]\x08\xa0mw\xee\xb53\x99\xd3\xd0\x85\xfdC\x89\xe8\x11M\x17fg\xec\xf0\x81g\xd8\x8c\x9ajY\xe1}\x09F\xca\x12ZHW\x07\xe1\xb9\x98\xae\xae\x1e\xdb\x7f\xe7]\x17\x09\x1e\xa5\xf5\xd8\xb1c69\xae\xc3WCy?\x97x.G\xd8\xfd\xfbo\xb3\x22\xa7\x89_\xfe\x91\xb5\x8f\xa5\x92\x5c\xca\x1e\xb2,[\xaa\xe7\xb8Z\xfa\xa3\xe0Y\x8d2\xd1=R`\x83\x14\xd0n\xfa\xae\xee^\xdb<\xb2\xc5\xb6o\xdff\xc3\xc3C6=>\xc9\xa8\xa1b=}0a\x18i\x09{\x91\xe1\xcf\xb1#\x07\xed\xb1'\x9e\xb4\x05N\x06p\xf9\xb3\xc1\xb8.\x0b8\x11\x9f[\x9a\xe3B\xb7i\xb4\xdc\xe6\xc2\xde\x0f\xd4i\x99\x18D\x95v\xceF\xe7.p\xd7N\x9eM\x8e\x8cV&\xd8\xa0\xa9u\xaa\xa5q;\x99)Yon\x9cQ\x0c\x17\xc4Y\xaf\xb5\xe7:\xacPA(\x95\xe7\xac\x97\x11Sg\xb6\xdbf\x8ae\x9bf\xa1\xb9\xb3\xb3\xdfJ,D\xcf/s\xedB~\xc1\xdaQ\xc9\xedA\x1dw\xaa\x94\xf7\xf5\xae\xf9\xdc\x8c\x9d\x5c>a\xbd\x85A\xeb\xc9\xf6\xa1\x8c!=\xab\x8bG5\xea\xack\x9d,(m\xa4\xb9O\xa6\xb4\x90\xdf>\xb5\xe5=p\xf9\xd5\x18\xbe\x04\x81k_%A\x14\xbeT\x9au\xe1/'\x85\x0bSQ\x17\xc7\x99\x04\xf1\x97\x04\xd6\xca\xb8\x89\xc3G_M\x14&p\xd7\x9e\xa8\xd4(\xecjF~\xea\xa0\xf8Z\xc9j@\x97\xe0^\x9f\xd6\x1a5.\x01Q\xcb \x09\xc1\xd5\x7f\xc2\x84\xc1\xa8b[;\xc6(x\x9cd\xf1'R\xe0rP \xe3\xbb\xed\x1d\x13|lfj\xd2\xc6&/\xd8\xf4\xcc\x02\x9b\x01{\xd9\xad\xde\xaf\xe1\x8e\x9dg\xcah\x94\x8b\xd7\x9eo#f7\xdb\xd7f\xe7\xe6\x86\xac\x9b\xcd\xa5m\x08\x8es\xd9\x19\xcb\xb2)\xb3\x7f\xd3V\xcbO.!\x94&9\x1e\x85\x94\xb2a6\xc7H\xe8\xc6N\xf6\xfat\xcd\xda\xe4|\xc9N\x8dq\xacJ\xe6\x8c\x8d\xb4m\xb6\x91\xf6\xad\xb6\x98\xe5\xdal\xf2\xdd\x81\xe8\xda\xca\xa8\xe8\xfc@7\x9b\x1c\xdbl\xaar\x01\x815\xcf\x08\xa9\x8d\x13\x10X\xe3B\xe9\xdcOYA\x08,0RZ\xcc,\xd9i;e\xed\xcbL\xbb-\xb3\xfb\xb6\x99i\x90\xceY\xa9\x87\x97Q\x96 M~\xe2\x81\x8bu\xd6\x81$\x0f\xb4\xf6\xe6\x0bN\xac\x15\xc9Z\x15db\x88a\xbf\x10\xbb\x83|\xfa3\xc3\xf4\x9f\x12\xa3\xcd\x93Z\xe9\xaa\x89\x1f\x84\xac8)\xa3S\xf1\xd5<\xebN\x1am]\x8a\x80\x90\xf6\xd72{\x98R\x01#a(#\xf7z\xa1$a!8\x1d]\xa4\x0d\x9e\xf5Fn\x8d\xa3=\x85\x17N\x85\x91Iq]\x9cF\xf2\xad(\x95\xfd\xcbl\x1c%d\xf27?\xa2\xa0\x0f\xeckr\xb7i\x8cQ\xf04%Kt\x8c\x14\xd88\x05\xd25\x9eC\x07\x9f\xb1\x83L\x0b\x89\xeb9\x8b\xa1Aj3\xa66\xe6i\xf9U]C\x1d\x09#\xd3\xc0O7\x1e\xe9s\x09\x01\x87\xe8\xe4\xf8\x9a\xe5\xd1\x19\x1b\xe9\x1ed\xd7y\xafML\x9f\xb7gN\x8f\xd9\xbe\xc1~\xdb\xbd5k\xb3\x87\x17-\xc3\xd1)\xd3\xac\xed\x8c\xf4l\xb5\xa1\xe2\x09\x9b\x9e\x9bd\x87;L2\xcf^{$\xcd\xd1\xb9c6\xcbZP_\x01\xa1\xc14\xd6\xdc\xd0 \x5c\x95\xb5 6K\x16u2C\xfb\x80e\xbb36\xb94\xc1\xe6\xc6\x92\xcds:B\x99\x91UVSq\xa8\x9a\x17\xba\xbal\xccf\xac0s\xd0\x86\xb2L_\x91'gd-\xf3\x06\xfd8\xae\xa7\xe2\x9b\x1au\xee\x02c\x17\x04\x98\xc8\x9a-\x87M\xb9\xa2\xad\x04\x0a\x80\x8e)\xfc\xe2O\x19\x00ay6\xa5j\x97U9\xab\xc3^\x99\xda#R/\x15I+\xdc\x15,\xa4\x03-D\x9d0\xa0a\xd7%\x1a\x09\x0e\x09\x96\xfaG\xa8tJ\x80\x8c\x84\x86\x1e\xc1\xb5A\xc3TP\x09>\x8dW\xf6z\x93\x0a\x9d\xd4]\x02M\xf6T\x00\xd5\xc3^\x11;\xe4\xd0h2\xad\xc4\x12\xd4\xc4\xbe\x8e\xb2\xa3z\x5c\x91\x04E\xa4\x91\x02/V\x0a\xc0\xf9\xd4\xf0\xc5\x14t1Z*Xt\x1e\x99:\xe1\xd2j\xd3\xfa\x8e\x9b\xe7\xc0\xc8\x9e3yI\x98\xa7\x0f\x16\xd0\xd7^\xb1\xf6b7\xe9f'\xfb2,\x81\x85\xe8\xd3sL\xbf\xb1\xe93;2l'\xc6\x98\x8e\x13k\xe6D\x86\xc9\xd9.\xeb\xe38\xb1)q\xf1\xe2\x92\x0d\x14\x96\xed<\x07LN\xb2\xa6\xd3\x83 \xc9\xb7\xf5\xdb\xfcp/\x0c\x1fe\x85\xb1\xf3\x96\x99\xcf\xd9\x96n\xce\xfdBp\x8d\xb2\xde5\x0b\xce\xca\x12\xcc~|\x06\x81\xd4cmE\xce^\x83]\xcdL\x8f\xdbYF/\xa7\x16N\xad\x8bq\x89\x98\x12\xde\x156\x8eduT2\xfc\x8fI4^\xe1 \xd1 @81\x82t\xfa\x9dH\x92S\xacII\x9a\xe8\xe8~\xed\xc2\xd74\x1bcT\x06<\xe0\x01P\x02\xc9G9\xe0\xd6:\x9c\xb2\x98\xee\xcc/\x09\xd1%\x1a\x09\x03\x8d`$\x18t\xaa@:RIGB\xf2\xaf\x7f\x82\xa0a\xebm\x22\x8c\xf4V\xb8\xe1\xe1a\x9b\x9c\x9c\xb4\xf4\xf4\x06\x09\xa8t\x14$A%\x1c\xcd\xcd\xa5\xa7\xbd9\xbe\xd45\x08bO\xaf\xd7\xe5d\x9d\x07a\xa4\xf1c+\x13\x05O+\xeaD\xbfH\x81\x0dP@k<\x9d\xdd]\xb6{\xcf>\xdb\xb3m\x07\x0b\xba:r\x86\xc5zNW\x96\xd6\x97\x1f1\xc3\x1a\xc6\xd1\x03\xcf\xa2\xf9\xf6E\x9b\x9a\xe6\xca\xe8\xe7\xc0\xd06\x90\xb4\xe6\xa0\xf0\x8d\x85)\xd6\x9f\xd8$\x7fh\x92s\xd48\x1c\xf2\xe4,\xc2\x92\xb9\xb5I\xa6\x03\x9f\x98`\xda\x87\x11\x8d\xceD\xbb\xb3\xb7\x9fu\xaa^\xa6\x0c5mT\xb1\xee\xec\xac\xed\xe4\xcc\xb6,\xe7\xd1U\xe6\xd1\x98b\xda+\xd3Q\xb0\xb9\xfen\xf2\xcc\xe8fn\x16\xa68m\x99\x85\xbcm\xd9\x0e\xb3\x9d\xaf\xd8\x0c\xd3\x8d\x85\xd2\x8cMW\xda\x11\x10:E\x01f\xdc\xb5\xd9\xcf\xb3\xab\x8c#\xa48Q\xe1\xd0\xf9c\xd6\xd9\xc1\xf8\xc5\xa7\xca\x9a'[\xaee\xe6\xd4\x82 A\x88\x8b\x86\xeay\x97u\x94\x0b4g\xfa,\x83\xc2\x83\x06.A;\x0e\x81\xa20L\xa9e\xc1\x9bc\xa4\x94gD\xc3\xec\x19\x82\x06qC:\x0c\xa1\xb4\x5c\xd1\xe8\x03\xa5\x0b\x18}j\xa4\xf9\xa7QQ8G\xad53M\xc3\xac\xf6\xf6\xce\x08#'\x19\x09\x13\x8dnRA$\xa1$\xe1\xa1\xb7\xe0\xa4=\xb8\xc0\xa1\x9c2\x12P\x12\x5c\xfb\xf7\xef\xb7\xfb\xee\xbb\xcf\xde\xf7\xbe\xf7\xb1N%e\x15\xadW\x05|\x82S8\x85\xbfZF4\xad\x1eo\x84]b\x8f\xd3\xa1p[;\x05Q\xf0\xacM\xa3\x08\x11)\xb0>\x0a\xc0\xf4J\xa8\xe9.\xccN\xdb\xe9\xd3'`d%\xd7&\xca\xd13-\xa8\xf7*\xe6\x02\x1b\xbbp\xfe\x02\x8c\x04\x86q\x15\x99D\xd3\x0c\x10\x7f{~\xd6f9\xa4\xf3\xe8\xcc\x1ck4\x9c`]\xe8\xb2e\x94\x0dz\xdbs6\x90\x99\x83Q\x17\xed\x86\xcd7\xdaMl\x8c\x9df$\xb4<{\xc2*\xa3gl\xf8\xbav;;Vb\x04\xb3\xc9v/\xc1\xec\x98Z\xeb\xda\xdac\xcff;9\xc9\x98\xc5\xfb\xc5i\xa6\xde\x18)!\xa4\x0e\x95\xb7\xdb\x89\xde\x97\xdb\xf2\xe4\xe7l;g\xb2m/f\xed4\x0a\x0b\xd3\x5c\xa5\x5c\x99\x1d\xb5\xae\xae\x01\x1b\xe9\xec\xb5,'5sb\x18#\xab\x1a\xe3\xaf\xa5\xbb\x19C\xd5\x04\x1bF\x1br\x11<Y\x94\x1e4\xe9\x96\x87!\xfb\xd5\x0b.\xbc\xe8}\xe3\x9ea\xfaM\xa3!\xd8\xbdO\xc7)\xa0O{\x12\x96\xd0\xfc-\xd8\xdd\xb7\xed\xe74\xe8e{\xf6\xd0Ag\xe2\xb5\xb8a\xa8\xe0\xaa\xb1\xf8z\x9f\xb5\xed\x122\xe9(G\xc2\x22\x15\x10\x12&\xa9\xe0HG7\x12F\x85\x8e\x1e\xc8\xd9\x0b\x9d\x8f:cWX\xc1}\xf1\x8b_\xb4W\xbd\xeaU\xb6e\xcb\x16;z\xf4\xa8\x0b\xaa\xc6Q\xce\xd5\x14<\x12\xd2A\xc6 r\xb0\xd4\xe4\x0d\xd2g\xb5\xc1WB\xae(x\xd6\xae7\x11\x22R\xe0b\x0a\xd4ZY\xd5Ord\x91\x05\xe8\x83\x07a\x5c\xb4\xbc\xc0*\xf5\xabV\xa9\x00\xd8Sa\xc3;\xb5V\x11\x5ce\x8bRv\x8a\xbbxN\x9f\x9f\xb1\xf9|\xb7e\xfa\xfbm\x19-\xbcv\xd4\x9co\xbf\xf1z\xdb\x93;d\xe7\xe7\x07lxh\x0f\x03\x1a6\xbcv24ZD+\xaf\xadb\x03;\xf2v\xfa\xa1c\xd6;\xc0Hh\xa0\xcb.\xb0>T\xe60\xd0\xddL\xdb\xcdL\x9eEi gS\x83\xdb\xecT\xfe\x06;2\xf8Z\x9b)/\xd8\x80}\x81\xa98\xa6\xea\xba\xba\xad\x07\xad\xb6\xf9\xc9sVZ`_\x0f\xfbyr\x8c\xb2\xbef`\xc8\x9e\xeci\xb7\x0b\xd3\xc7\x9do\x05\xfa\xd5\x13\xa5\xe6\xe2J\x04\xd0UL\xdcI\xeb# \x09\x08\xf6\x0f1\xd4\xc9\xb2\xde#\x8a\x87\x91\x0a0\xbe\x8e\x93\xb1n~y\x08\xb5\x00\x00@\x00IDAT\xb4\x0eKs\x08\x22\x0d^\x14\x10\x19\xb7o\xcfn\xdb\xb3g\xbb\xf5\x0f\x0f\xd8\x97\xd14\xf4i<\xbc\xa4\xef\xa6\x91\x90\xc4[\xc6\xb5!\xea\xd3\xb2~{\xba^\x93N\x99)d\xba\xe6\x13\xd2OmA \xe9Q\xe7dp\xb8\xdf:{\x07m\xfc\xdc\x11\x92\x18\x94\x0d42\x92\xf09p\xe0\x80\xed\xde\xbd\xdb\xce\x9e=\xeb\xa3%\x85\x97\xd1[\xf1\x5cU#\xf2 \xf0]\xbe+b\xd9\x19\xf2$Ij\x99\x94(xZ\x92'zF\x0al\x8c\x02:\xb59H\x9c\xfa^{\x8da\xa6\xd8.vI}\xae\xee\xfb\xe4\x04\x1b39E[\xc7\xdf\xc3\xd98\xa6\x7f\xc1^2\xdcc7\x0d\x16m\xa8\xfdv\xcb\xb3\xafgd\x10!s\xe0\x09\xeej\xd9e\x9b7u2\xba\xd9dR\x0e\xdf4\xb2\xc9\xa7\xaczQDx\xb2|\x93\xcd\x1f?a/\xeb]\xb0\x89\x9e\xb2\x8d\x16\x07\xedK\x9b\xdel\xc7{\xba\xec\xfe\x99\x87\xecLO\x01\xfbn;\xde\xbe\xc5f2G\xac\x03\xd5\xea\xce\xc2\xb8\xcd\xb0\xf9tiy\xc1\xef\x01z\xcd\xbe\xedh\x01\xce\x22x\xd6K\x83Z\xb7Z\xf4\xd4\x14[\x16\xae\x97\xe5\x9dCP\x94\x13\x8e\xa8\xd5\x9c2k:\xbbv\xef\xb1v\xd4\xbb\xcf\x9e\xbc`K\xac)\xcd3*\xdb<8l/\x7f\xd9\x1dL{\xce\xd8c\x8f<f\x07\x0e\x1d!=\xda\x91\xc4\x08\x95)6\x85\x950\xd05\x01\xcf\xc5\xa4\x82%\xc5\xa1Q\x8c\x0b\x1aFC\x1a\xa5\xa4#\x15\xdd\xb3s\xf6\xf4\x11\xdb\x84\xe8\x1d\xde\xba\xdd\xe6I\xd7\xdc\xec\x84\xdf\xc1\xa3\xb0\x1f\xfb\xd8\xc7\xec\xf5\xaf\x7f\x83=\xf2\xc8#\x5c\xe8\x87\xd0FX\xc9(|*\x84\xb0^5\x93\xc6\x19F8\x12\x82A\x10\xae5\xe4yn\xd4\xbcj\xd9\x8b\x11E\x0a\xbc\xb0(p\x15\xdb\xfe%\x13F\xcb\xe7\x15\x8e\xea\xd7B{\x89i\xaf\x12\xea\xdf\x05F\x0e7\xf4.Z\xd7\xcc!\x9b,\xb1N\xd59b\xf7o\xcf\xdb#g;\xed\x0b\x87N\xda\xd6\x1b\x06\xac\x1d\xe5\x82!]\x95P\xbe\xd9\x1e\xeb\xdefONs\xdc\xffP\x1e\x81\xb2l\x7f=\xd6\x01\xeb\xe9\xb3\xb9\xc51\xdb:\xff\x80-q|P\xb1\xbd\xd7\x96\x8ao\xb2\xf1\xad\xfd6\xb4x\xd2r\x93\xc78A\xa0\xc7/\x22\x1bG\x8b\xae\xcc\xe2\xfe\xfc@\x9e\xc9\xaey\xeb\xe4\xe6M\xfa\xcd\xe4i=\x14\x04\x8e5(\xad\xdbd\xd1\xa8\x92\xb0\xc9e\xb59\x15f\xcc\x7f\x1bG\x16\xe5Pr\x98\xc5\xbe\xb9\xbf\xcb^q\xf3\x88}\xe6\xc9s\xecK2\xeb\xe5\x22\xbf\xbd;\xb7\xa1\xa17j'\xce\x5c\xb0\xa1\xc1\x11\xd6\xe6\xf6\xdb\xed7\xdf\x0b3_f\xff\xd5\xb4\x1d9r\xcc\xce\x9e9i3\x0bR\xad\xb8\xf4\x8d\xab\x12\x0a\x1a\xed\x88I\xa7\x8cZB'U\x0cH\x0bP0\x82\xd5\xe6\xe3\xe9\x89Q\xdb\xbd\xf7:+\x8c\x0c0\x1a\xddf\x1d\xbd\xdd\xec\x89B\x03q~\xd1\x9ez\xeaI\xbb\xe3ew\xfb\xda\xd6\x14\xc2g\xec\xdc\x05FG\xa36?\xc3\xba\x1aS\xbd~Kh\x8a\xf4\x0a\xbcU2\xd5\xd2\xd1\xf0\xc6\x05\xbc\xcaL\xf9\xe3W?k\x98(x\xd6 P\xf4\x8e\x14\xf8J\xa5\x80\xf6\xadttv\xd9\x0c7\x85J\xbd\xb9\xc0\xe9\x0a\xdfq\xcfV\xfb\x86\x91\xa2=\xc3:T\x96\xa96\xddl\xb9t\xa6\xcfv\xf6\xf4[ni\xd2\x0e/\x0c!`\x8a\xb685n;'\xd8\x0d\xbf{\xbb\x1d\x5c\xc8\xda\xe63\x1c\x88Z\x19\xb4\x81\xcd}v\xfa\xd4\x84\x0dw\xcc\xdb\xb1\xfc\x88\x9d\xe9\x7f\x85-\xb2\x9e\xb3\xaf\xfc4J\x0b\xdc\xb6i\x0cg:\xb6\xd9f\x18\xec\xd6\xe5\xf36\xc6F\xd4\x85\xcc\xa2\x9d\xe1X\x9e\x0f\x1e9lG\xc7a\x9c=u\x8c\xad\x05\xf1\x19\xc7\xb8\x12\x81\xa6\xdd4w\xa6\xa91\x8d8%\x84\x8a8v\xa1\xedv\x1e\xa1#\xcd\xb7\xfe\xbea\xf6#m\xb7o\xfd\xa6\xfb\xad\xaf\x17\xad;\xf25\xca\xe9\x02gN\x1d\xb3\xfd\xb7\xdc\xc1&\xd8N\x9bE\xe8]\x7f\xfd\xf5~\x97\x8c\xd4\xdfK\x5c\x01}\xfa\xcc\x09\xfb\xec\xa7?k\x8f|\xe9s\xf6\xf4\xb9/3\x8a\x02\xe1\x06M\xba~\x93\x06\xd3\xb74\xd2dRa$A$\xa3\x0d\xb4\xdb\xf6\xed\xb2\xed\xd7\xed\xb6\xed\xc3[m\x00U\xf3e`\xdb\x18\x91\x12\x0c\xe1\x8aF e\xd5\x06M\x95\xc62S[\x8b\xa4i\x09\x814=7c\xa7\x99\x82\xfb\xecG\x1f\xb4Y\xce\x08\xbc\x92&\xaf;\x96\x5c\xbehRYF\x1f<\xfer\x0fw]\xed'\x0a\x9e\xd5(\x13\xdd#\x05\xbe\xc2)\xa0^kIG\xd0\xc0\x84\x19\xbf\xd8\xdf\xbey\xd8\xbe\xeb\xee-\xd66\xbdd\x9f\x9f\x1e\xb0\x0b\x5c;}G\xdb\x05{x\xfa\x9cm\xcfu\xdb\xeel\x9b\x0d\xb0\x8e\x90Gxtr2\xc1X\x11\x95\xe8\x89\xa3\xd6\xd7\xb9\xd5\x86Q\xac\x98\xee\xe0x\x9c\xb6\x19\xbb\xb9g\xd6\xdaPFxb\xba\xcb\xb6\xdbI{E\xe6\xa3\xc4\xd3nG\xba\xbe\xcd\xe6rw\xd8\xde\xce%\xbbw\xf4A[\x9a\xe9\xb3\xc7\xd8\x08\xba\x84V\xd9\x02\xdaq\x9f\xaeL\xb3\x89\x15M7&\xf2\xd6c\xb4_'\x88(-\xfb\xeb\x09*Ub\x84K\xfc\x9c\xc3\xa9\xa3\x87\xa9\xb4[\xef\xb6\xbd{\xae\xb7\x12J\x06\xda\xc4[h\x83\xf1\xe7\xb2\xb6\x7f\xcb\xf5\xb6\xf7\xbaa\xd6\xac:mza\x96\xab\xb3O\xda{\xff\xe2\x13\xb6m\xd3\x1eT\xde{m\xef\x8e=\xac\xb7l\xb2\xfb\xbe\xe6U\x9cu\x96\xb5\x03\x1f~\xda/\xc1\x03\xfd\x86\x8c\x84J\xaaD\xa0\x80\x12<2\xf5n:\xd2\xe6\xba[o\xb4\x9d\xbbv\xd8\xd0\xc0 B\xb2\xc3\xcf\xb7\x93F\xa4\x98<\xdbe\xc3\xe5|\x1a=u15\xc7\xa9\xb3>b\xd5\xbaJ\x1b\x13\x82\x1dt#\x86*\xacW]g\x07\xbf\xf0D\x83\xe0Y[\x10x\x82\xd6\xf9\xa3\x11iO\xff@Pn\x08\x92&\xc8\x1cE\xe3\xbd\x80\xb5\x11E\xc1\xb36\x8d\x22\xc4s\xa7@\xf6C\x1f\xfaP?\x0d0\xd7\xdd\xdd\xfd\xdc\xb1]\x05\x0c\x0f<\xf0@\xcf\x9f\xfc\xc9\x9fth:\xa4H\xe3o4\xdd\xbd=\xd6\x83\xeat\xcd\xd0\xea\xd2\xf6\x0ds\x90\xa9\xff\x0d^)@-\xd4\x15\xb1i\xaaCi\xf0WH\x85z\xeam\x85v4\xc88\x90\xd3\x8f\xa5\xd1L\x8d\x0e\x06\xe5\x98\x9f\xde\xa2\xf5-/\xda\xcb7u[\xf9\xec\x9c=\x92\xdfa\x9f\x9c+\xda\xe49\x18\xd90{P:/\xb0\x07\x87=;\xec\xd3\xb9\xb1\x8dk\xaaQ;n\x83\xf9\xe5\xb6\xb4\xd9\xdd]\x13\xf6\xb2\xfc\x8cu\x0c\x0e\xda\x033\x83v\xf0\xf4\xb4}\xd3\xad\x836\x9d\x9d\xb3W\x1e\xf9\xb0\xcdV\xb6\xd8R\xefW\xdb\xd3v\x0b\x17\xd1-\xdbu\x0b\x9f\xb0\xd7qL\xce\x10\x97\xd2\x1d`$\xd2\xd7\xd9\x8d\xf6\xdf\x02Szl2\xe5f\xd4\xa5\xdcY\xce=\x10\x9dB\xba[\xd3G\x8b\xe9z\xa4\xc8\xa1\x11O0\xea\x89\xe7\x0a\x1dv\xc3\x0dw\xd8\xb6-\xfb\xd02\x9c\xb3\xa7\x9e\xfd\x02\x0c{\x81\xab\xc6\x9f\xb1\x9d;\xaegO\xcc&\x9b\x98:c\x13\xe3\x17\xfc\xdc\xb6\xe3\xa7\x0f\xd9\xa1#R\x0aQ\x0f~\xde&f\xe6\xed\xe3\x9f\xfe?\xb6u\xcbV\xdb:\xb2\xdbfrA\xb59\x89bC\xaf\xc6\xa9'M\xa7\xa9^I )\xcd[v\xef\xb4;\xee\xb8\xc3\x867o\xf6\xf2iG{0\x87@nc\x1d(OYI\xc0\xe86\xd7\x0c\x02H:\xe2R\xcb\xcf\xb1\x1fL\x05\x5c\xdd\xc0\xd9\xc1z\x94N\x19\x07\xb7\x0ep\xbd\x92\xc6u\x09I\x87\x1fp\x8b\x80\x0f#\x9e\x10c8\x9eH\xe5\xd7\xda\x5c\xd9\x14\xb6\x8e;\xfa~\x85S\xe0\xbf\xfe\xd7\xffZ\xdc\xb9s\xe7\xb7\x8d\x8d\x8d\xbd\xf1\xe1\x87\x1f\xde\xc9\xc6\xb7\x22\x8dn\xedZy\x0d\xd0EB\xf2\xfe\xfb\xef\xdf:==\xddt\xce:\x8b\xfa\xb06\x82\x86yyX\x00\xb9r\xc6\xc7\x8f\x18\x0d}\xd2$\x17z\xd3Ha\xfc\x8d\x0c\xe8Jd\xd3\xd7\x13`L>%\xa44\xd1\xbbVZtv\x98\xfb\x91f\xbdS\xa3\xb3\xe3X%\x81\x9f\x95\xedP1o\x87`Z\xd3l\xf0\xbcnp\xce\xca=\xddv\xae=\xc3a\x9e\xbd6\xc6\x14\xcf\xc3\x9eI\x04\x11\xc7\xe7h\x7fOn\xb8\xc0`I{b\x18a0=\xd6>0i\xb7\xb2\xcer\x84)\xb6\xce\x8eE+\xecb\xdfN\xb9\xd3\xfa;flw\xe6\xe3\xec\x0db\xbf\x0crb\x92\xd1\xc6\xec\x10\xb4+o\xb1\x97\x97\x07lN{n`\xb4\xc5\xf6Nkk\xbf\xd5\xce\xb1f\xf1\xf43\x07\x9c1\xa7\xe9l\xfe\x96\xd0\x91\x00\x85\x81'Y\xd2\xa9\xda[\x866\xdbm\xb7\xbd\x14\xc1s3\xa3\x8ay\xeb\xddV\xb41\xa6\x05\xa7\xc6\xce\x81\x7f\x885\x91\x13\xf6\xe4S_`\xc1\x9e\xb1\x15#\x8ba\x94#\x06Q2\xd8\xb1\xe3\x06\xa6\xdf\xa6\xec\xc4\xc9'9\x09{\x0aU\xf0\xbc\xed\xbb\xf1V\x04\xd7\x19{\xec\xc9O\x91W\x8d\xaa6n\xd2\xbd:\x0a\xa9:\xa0\x8e\x8cT\xa9\xf5\xbe\xfd\x9e\xbb\xed\xba\xeb\xaf\xb3^N\xban\xe7\x96U]\x95QP\xddB\xc9 #\xa1\xc3\x1e%\x0f\x8f\xa0\xc9\x85\xb9-e\x98\x11\x8f\x14\x1f`\xfad\xdc\xeb\x1a4\xe5\xbcV\xcaQ\x07\xd3\xd6+\xb6l<\xbd\xeb\x0eA\xfd\xd2X\x99\x04\xf1\xf0A\xdc\xfc\xea\xb5\xa6\x89\x82gM\x12E\x80K\xa1\xc0\xfb\xdf\xff\xfe~\xa6\x12\xde\xf9\xe0\x83\x0f\xfemF\x0f]\xa3\xa3\xa3\xf9\xab\xae\xeey)\x09_\x19\xa6\xc6\xa1W\xba?\xe7\xaf\x94\xf9_\x0da\xb4\xfe\xc4\x86\xec*m\x12T\xbdLKm\xdb\xbe\xcb\x99\xa5\xd6O\x82h\x0d\xcc%e\xf4\x8e[<G\x826\xfc;\xe3\x11\xa6\x94\xff(\xac\xdb\x13\xc6\x94\xa6Gn\x89\x8f\xc7\xc1\x0eV\xf6\xaf\xe4\xed\x8e\xdbo\xb1\xfb\xbf\xfa\x15\xf6\xd0g?\xc7\x14\x1cg\xee45!\xb4Fm\xda?\x9a\xb2\xda\xebw\xdfh\xdf\xf0\xda7\xb0ns\xbb\x1d9\xf5\x14\xea\xed\x15\x989\x0c\x92\xcd\x98;v^\x87\xb0\xc9\xd9\x89\xa9\x09\x0eg(\x02s/\x8c\xbdb;6\x0fp\xcd\x01{\x98Pr\xf8\xcc\x17\x0f\xdaM\xb7|\xad\x8d\x9dy\x9a\x93\xb8\xd9\xe6::n\xd3S\x9c\xd2\x8d\x10Z\x0fCm\x96T\x8dl\xf4\xd4\x9b.\xd6\x99^v\xdf\xcbl\xe7\xf6\x9dh\xf8\x15QUog\x0a\x90k\x22\x18\xd5d%T\xe8<hzM\xbb\x5c\xa5q(!\x93\xcd#bDxu&\x10.9\xf6H\xe9O# _\xdf'\x5c\x1e\xb2H\x1f\xefJ\x1bQ\xdfOu\xf0l\xa5y\xc35\x14\x8b\x8fC[\xa5a\x85\xe0\xa1\x11HaeW\xab\x00\xd1\xef\xf9\xa7\x00Uo\xac'\x939\xf7\xfc\xa7d\xd5\x14d\x11:?\xf5\x91\x8f|\xe4;5]\xd5\xd8\xe8V\x0d\xf5\x22\xf2H\x05N*\x80\xae\xb5\xac\xab\x97=\xb2e\x9b\xb5kj\x945\xa0 tx\xad\xc5\xd3R\xee,\x06\xd4h\x12\xbf\x8b\xbc\xd20T\xec\x12\xaa\xcc\x9f\xfb\xc2#\xb6\xff\xc6\x1b\xec\xde\xbb\xef\xb2\xbfz\xe8o\xaaQ7\xa2\xcb\xb17G\xea\xceA\xd2U\xec\xbe\x97\xbd\xd2^\xfd\xea\xd7\xdb\xce=;\xec\xd0\x89/\xd9\xd4\xdcQ;~\xe48\xc2\x8c}G}#\xb6}d\x07g\xd1\x8dYGn7\xaa\xe0{\x99\xe2\xeb\xb0i\xa6\xfc\xe6\xb9ratq\xc2\x8e\x1f?l\xf0v\xdb\xdaw\x93\xdd\xb4\xebU6\x88\xe0=p\xfc1;{\x81\xc3Qo\xe0\xc4\x89#gW\xac\xcb4\xa6g\xb5o\x95u}\x1b\x18\xd9<b/\xbf\xff>\xdb4\xb4\x09\xe5\x8eN\xeb(h\x831\x02\x07!S`\x04\x16\xee=\x22!\xe4M\x17\x08f\x98fCA\xcf\xbfU_tQ^\x16\x01\x0d\xd2\xa4<\xf8\x96\xbf\x0b\xe1D8\x09\xfc\xaa\x18\x8f\x18y\x13\x84O\xa8\xd7\xb8\x85\xc1\xe8\xaa)X!x8\xc0\xfd\xaeJ\xa9\xf2\xd0\xaa\xd0\xd1\xe3\x9a\xa0\x00U\xeb\xbf\x90\x90\x1f\xbd&\x12\xd3$\x11\x08\x9b\xbb\xd8g\xf0\x96?\xfd\xd3?\xedH\x8f\x01\xb9V\x19l\x93\xe4_\x15'\xa9\xc6\xaa\x91\xea\xdc\xadk\x8d6\x1a\xed\x0c\x8dl\xf3\x05d\xb83\xbdi\x18\x9bz\xda-L*H\xc5,\x13\x1e\x09\xb4\xdb\xfc\xed\xfe+P\xa4~@\xa5\xee\xd0C\x02\xaf\xbb\xbb\xcf\xbe\xf4\xc4S\xf6u\xf7\x7f\x0dWL\x8c\xd8y4\xec\xaa]\xe9$\x0dY\xd2X ]\x9a\xb8\xcd1\xe4y\xf5\xd7\xbf\xce\xde\xf0\xc6oA\x09 g\x07\x8f=fK\x0bc6;u\x81\xeb\x99\xa7\xed\xe6\xfd\xf7\xd8\xbe}w\xda=w\xdf\x06\xbdKL\xe5\x1d\xb1/\xb2\x00\xff\xc9\x87\x9f\xb1s\xc7\x8f1*\x9afz\x8a\xcd\xa5]\x05k\xefB\xf1\x80i\xc43g\x8a60\xb8\xcf\xfaGn\xb2\xe1Me;u\xf4CI\xcc\x97\xf6r\x81\x01\x0d\xb7q]\xc6+_\xfb\xf5L\xef\x0d[\x17kZ\x124\x12:y\xfctO\x90\xd3\x19\xbb\xd6t\xb2\x1a\xfdH\x9b\x8d(5\x92\x91I\xf1\xe8l\xb9\x8c\xa6\xde\xa0\x9d\xbc\xf8\xb2\x0c\xa3\xb6y4\xde\xc6&\xc6\x1c6\xfdI\xc9\x9b~_\xbe7uC\x9d\x06\x0aAip+6)\xaa\xaceV\x08\x9e\xb5\x80\xa3\x7f\xa4\xc0z(\xc0\x89\xbb\xdf\xc0\x9aN\xdf\x14S\x14\x1d4,U\xce\x1acZ\x0f\x86\xafl\x18\xf5~Y\xfb\xf2^\xf0\x13O<\xe1\xc7\xa9\x5c+9V9\x159\x8dz\xdb\xce\xdd\xba-\xc0\x85\x82\x18W`-+S\xd9\xb2L\xb5\xa6\xb5\x12<\xf9\x0a\xaebR5\xc3G\xf2\xed/8\xad\xd6?\x9ey\xfaY\xdb\xbem\x8b\x0b\x1eW\x93f\x8aI\x02[\xbb\xfe\x8b\xac9\x15X\xdd\x9ea\x1f\xcb\x9d\xb7\xden\xf7\xbe\xfc\x15\xd6\xd1\xddn\x0f\x7f\xe9\x93v\xe6\xdc\xb3\xb6y\xa8\xc7f\xe7\xce\xd9\xce\xcd\xd7\xb3?h\xc8\x0e\x1d\xfck\x94\x07\x1eb\x84\xb4\xc5\xa6\x18\xe5\x8c\x8d^\x00\x17\x97\xd0\x0dw\xda\xc9\x13c\x08\xa3s\xd69\xc1\xa9\xd0\x9c\x91v\xee<W8\xa0\x017\x8fJD\xb9\xfd6\xeb\xe5\xec\xb8\xd3l\x8e\xad\x1f\xb5\xd4\xd2\xbe\xb6\xcd\xd7h\x98\xef\xcb!Hv\xee\xd9c\x13\xa3S631\xc3\xf4^\x9b+\x0fHi@\x0a\x1fy\x09\x13\x08 \xe1\x92\xd5:\x8dO\xa9\xe9\xa8\x1f\xa9Q\xe3&\x8b\xda\x12\x05\xa2QP\xfa-\xe1\xe3+y\xc0\x9f\x1f\x1f\xb3\xb1\x0b+\x05\x8f\xa7\xd0\x09\xbbvZ7\x0a\xe1\xe5H\xfc\xbe\xfcD\x1c\x14\xbb?k\x0dy\xd6\x16< \x8d\xe6y\xa6\xc0\x15\xaa4W*W\xf4\xe2w\x9d<y\x92v\x136\xcd]\xa9x^\xa8x\xc5Xt\xac\x8e\x8c\x98RK\x06~\x953)\xe6\xba}\x17;\xfcY\xe8\xaf\xb48\x82e\xd54\x8b1\xa6R\xe4\xa2\xb4\xe3sQ]\x16\xb7\x0a\x80\xe1\xc5/\x5c\xac\x8d\xf5\x8e\xc9\xe9)\xdbQd\x8dI\xde\xd0L\xa6\x8fEx\xed\x81\x99\xe2\x94\xe6\xc9\xf9\x194\xec\x96\xec\xd3O}\xd1\x1e~\xe7\x97a\xc8\x95p\x0d7\xdcO\x0b\xec\xda\x83\x94\xcf\x7f\xd1\xd7\x80\x14\x89\x9fR\x0d\xb2,BKe\xa0\xab\xbd\xc9$\x02\x05?)\x0e\xc0\xd1Ug\xf3\xb9\xf3\xee\xa7\x18\x97\xcb_\xf6\xa8+~\x83l\x98NR:\xc2m\xb2\xebc\x8eR$H\xcdg\x1e|\x08\xa5\x01\x85\xd3\x18\xa5\xc1(\x8f\x10Hi\xbbT\xa3ri\xdc\x98\xea\xebo\x97\x8ap\x95p\x9e\x03\xd2\xe9\xca\x05\xac\x8dy\xc1\xaa\xa0(\x83\xa0p\xb0J\xc0\xc4yu\xc1\xe34P\x81H\x84\xb5FR\xef\xdb\x8ad\x17\xa3i\x05]\x8f\xb5\xb9}\xd5\xd0\xabz4\xc7s\xa5\x5c/O2\xc2\xe2\xa9*\xea\x0b\xc5\xb0\xbe\x93WcS\x03\xba\x98AQY\xb9\x8fE\x0dy-sq}IB\xac\xea\xd1\x04\xe3\xc5\x9c\xce\x81\xd6\x8dB\x80\x22}\xfaN\xa3\xa8C\xb0\x11>\xa1`J\xd2<\x07\x89\x06\xb3\x12\xf9\xf3Y\xcaJ\xd7 w\xe9l\x1a\x1c\xb2\xd2|z\x82\x80R\x89\x87\x12\x1el\xc1R\xff\xeb4\x0e\x00\x09X\xf0\xf5\x8f:\x97\xb4,\x12'\x09\xa8L\x96\xa9$z\xfci\x1c\xf2r\xc1\x05/[f3N\xd9\x85\x9f\x98\xb1\x04\x06{s\xce\x9d\xf5z\x15\x14U\x02\xb5t>\xdeb\xc3\xc9\x02\xda \xca\x84\x157\xa9\x8a\xe9\x87\xf0y\xb4\xc5zY\xd4\xd7b\xbc\xae\x17X\xaa\x13\x08\x1a3\xc8H\x1dXk(e\xd6\x9a\x82\xd1=<\xa1\x0a\xe4\x10J\xaa\x0bE\x04_;\xa3\xa5\xa6\xe5\x0ep\x07\xe7\xceM3\x22i6BR{\xa80}y\xa5\x8c\x8e\xe2\x91\xf0\xd4\xd3\x8d\xba\xff\x0c\xa7\x19\xb8\xf2\xc1\x95\x88P\xd9pY\x9c\x96\x1a\xa3\x5c\x0d\xc7p[c\x89\xc75!\x9b&IE\xba@\x8f\xe0\xc2\x02\x9b\xbb\x10>\xa1\x88\x03h\xbd\xbdY\xe0\xa6\xfeu\x8eu\xd6\x10<)\xd8F\x5c^\xb0\x090\xec\xb7\xd1{]\xdf\x17\xc5\xd5$\x94\xc3\xac\x01(\xefF\x90\xc6\xef\x80z%d#L}\x9ej\xf0M\x12\x958i\xe8\xddI\xc3\xec\xa0B\xa5\xedvu\xe8k\xcb\xc7\x1bYC\xa2+\xdcQ\xd3\xc1\x1c~4\xd7&\x05J\xd4\xb7G\x1e\xf9\xfcUM\xdc\xedw\xdc\xedZZ\x8a\xd4\x85\x0e-\xcd;,\xe2gr\xa3\x0eurb\xf3M\xb7\xdd\xa1\x0fgl:\xc0:\xb4\xad\x95#\x07\x09'\x9f\xf6!\x5c\xba.\x95~KRh=H\xe1R\xa1\xe0\xa3 \xbe\xeb\xdb\xa9\xef\x8d\xc1\xad\xde\x84P\xa4\x8ex5-\xd6\x86\x10\xc3R\x0f\x12\xec$o\xc7\xae=\xb6y\xdbV\xf2\xd2\xdcT\xe3\xaa\x0d\xa0j\x80>\x1aRzD\x09aP\xcc\xd5\x10U\x9c5\x17\x05\x0d19\xb4\x18\x0c4B|\xbaj\xf62\xe7\xef\xe5\xd9\xd3\x14\xae/\xa8Es9l\xb5\xfc\xe9\x0c\x8c\xd4`S\x19\xad!yV\x1f\xf1\x80G:\xf1S\x1c\x99>\xc9\xc6$e4\xcdl\x95\xdc\x89C\xea\x1e\xa2^\xf9%\xb7\xd4\xc5\x99n\xe2 \xb7\xe0^\xb3\xc9\xeb\x22\x93\x06\xc6\xa3\xbe\x00R8\x9f\x13M?\x1c&\xfd\xa99\xd6\xa1p\xc7\x95\xdf\xe1\xab\x9a\xb6$\xd8J\x189\xa6.\xe9\x1b\x97\xd4\x9a\xbc\xf5jpJ\xb05\xbcR 9\xd3C\xa8\xff\x94\x93\xbeEc\x15\xa6*\x90\xb4\x5c8\x9a\xb1\xaep\xf9\xb8\xc6\x8d\x1av3\xc1\xb3\xcc\x15\xc8L\x984M\xbd3\x9b\xa6>5\xba\xd6\x88\xbe\x0a`K\xe7\x8bi\xdd\x12\xfcE\xe0Yc\x18\xca\xac\xbeT\xfbV\xba\xcagM\xe3\xcc\xeeb\xa8\xf5L\x1b\x95\x18\x95\xe4sl\xd2\xadF\x1b\x98n\xcaz\x85U*\xc6\xedyZ\x01\xc9\x93\xf0pE;-(\x10\xa8\xc4tY\xca\xe8T\x87\xb4\x1e\x12\x0c\xa3k`\xb4P\xafS\x9e\xb5\xe3QSd\xe2\x19\x9a\xe2\x94\x9d\x17\x18\xa8\x17\x8e\x10\xf4\x0a\x8b\x0a\x99x\xa7\xab\x94%\x98\xb4\xf8\xef\x06\xa1\x93\x1a\xd5\xa6j\x92\xab\x8e\xb4W\xf6\xdc\xf8\x94\x1da\x84;\xdd\xc3%\xe6_Be\x5c\xa7\x0e(oA0jzO\x82\x90\xef\x909\xa6\x04\xc5\xb5\x85\x99\x07\x1c9\xdd\x19\x84\x7fz[\x84FL\xa9P\xad\x95\x17\xed\x8dE\x1f\x8dn\xb2\x00J\x14,\xd3\x8b(\xe8\xe4o\x22\x08\x94J\x13\xf9\xdc\xdf\x9e:\xf2\xe3\x02M\xa4\xa9\x12B9Sl\xad%OK\xc1\xe3\xc9##h\xb8'\xed=-\xd0\x90]\xd1I\xa6\xe6\x9a~7\xba4\xc0(\x91\x80\xa4iM\x8b\xaf\x91-8\x96\x046`n\xc0#\xc7$\xaa\xfa\x18\x83\x9d\xdf&~\xcd\xf1\xd4B\xa7\xf5\xab\x0eu\x1a\xc4\xdf!\xadu\xf0rm\x9a\xc6\x06\x98:,\xaa\xf8i\xda\xd2wc\xdeS\x90F\xc1Z\x87\xe6\x9a\xb6\x8a\x01H\xf8\xa4=\xcb4\xb1\x8d\xdf\xa9\xbb\xdei\x185~Qo\x05\xd3R\xc18I5\xf5\x98\xd0VN\x0e\xeb\x16\x85p?\xcd\xf5\xebB\xb0b\x1b\x1b\x1d9\x04S\x0du\x81[2\x97\xc5t\xf4\x97\x04W\x9cW\xc3\xa8,\xdd@\x934OblJ\x87\x0b[\xcfC\xb0\xa7\xfei\x90+\xfd\xf6\xb49\x97\x0d\xd58\xa4S\x0cE\xdf\xfc\x05K\xd2VCgB\x9e\xa2\xa4V\x91\xe5\xef8DSY\xd2\xef$\xbc\x18\xfc\x9a\x86rI\x22p$\x8a\xd2y\x17\xf5\xa7j\x04\x83)\xa2F\xac\xb8Y=d=Gw\x97VP@@\xed\x9br\xce\x22\xbc\xa40\xd0\x89B\x8b\xd6q\xa4\x1d\xd1\x81\x92\xc2\xc9\xb3g\x98Z\x9bf\x83j\x11\xd5\xe5\x0e\xc2,3\x055m\xdd(*\xf8\x9d8D8\x84js\x85\xe9\xb5\xa9\xe9Y\x94\x17Po\x06\xdf\xf4\xc4\x84o\xd4T\xe7pjj\x1a9\x94\xb3\x0b\x17N\xdb<\xb7\xc9\xe6u:@\x9a\xe7j\x22\xb18YX[B8\xfa\x1d<8(\x9dKt\xe0u\x5c\xcf\xc8\xc8 d\xe3\xb4\x08\xaeg(\xa0\x85\xd6\xd9\xd1\xc5\xd4\xf3\x12kj\x9cc\xc7l\xc0\x93\x07\x0f\xf9\xa6Vi\xb8\x15\xb8\xb1u\x92\x83[\x8bL\xdd\x99\xa6\x0cI\x87(\xb2}\xd7.;u\xe4\xa8\x15;:]\xa8.\xd0\x99+\xb1\xdf)O^\xa7\xb8\xc0o\xcb\x16\x0ewe\x03\xaa\xae\x86\xf8\xfc\xc3\x8f\xfa^&/\xaf\xfat^&\xbb\xd7\x0f'\x04\x08\xd3\xb2_\x07\xee\xb5\x05\x8f\xf0\xf1\x88\xc6\x17\xd9\x12\x8f\x9a\xbf\x03\x01\xafl\x86\x10\xc1\xa5>d\xe2\xd2\x18h\x05\xf6\x14Ox\xd7\x18u3\xcc5\xd84\xc6\x80\x9a_\xcd7\xf2\xdf$\xaa\x06\xb7\x1a\x84*}\xca\x98j\xae!\x0e\xfd\x06\xb7\x9aO\xd5V\xb5\xa4\xb0r\x90i\x14U\x01\x87\x10\xa5\xf1\x08\xaaY\xce.B)\xc0\x17\xbaI\xc9\xd2*\x1f\xaa\xc0\x08\x0e\x81\xfa\xe8\xbaJ(\xfa\x84\xf5\xe5\x99\xba'o1m\xd1\x91>\x9f_\x96u\xd7\x9d\x1c\x99\xb2};\xd7*\xcf\xd8\x13_~\xc2\x9e}\xf6\xa03\x9aVQ_\x0e?\xa5[G\x9a\xb4\xb7q\x0e\x19=\xdc\x02\xccR\xc2RiS\xcbP/QG\xa2\xe8-\xd5e\xc1\x86\x06\xcc\xda\x0f\x02\xb2\x94\xcc0\x5c\x8e\xb4\xac\x85Cm\xa6Z$\xaa\xfc\xfe\xadv\x83\xdd?\x83=|\xaa4`}\x1e(\xe4%\xd8=\x98\x87L\xbf\xab8S\xaf\x16o\xc1\xa6\xf9\x0fq\x06J\xd5\xe3\xf0).\xb5g\x004Bp:\xfaZI\x96\xe3f\xee\xb4\xad\x1c735;\xeb#\x98ET\x8a\x97\xb9jay\xa9d\xfd\xbd\x03l\x0e*\xdb-\xb7\xddn\x8b\xd3\x0b\xdc\x17\xa3\xb0eN\x9f\x1eeo\xcf \xf7\x09\xf5p1\xdf\xa8\xf5o\x1a\xe0\x1e\xa1Y\xeb\xefG\x1b\x8e[X\xf3\xedm\xae\x9c\xa0\xf3\xe0&&\xce\xd9\xb4N2\xe0\xa4\x83\x0enY=}\xe6\x147\xb1rS\xebjy\xa2\xac\xd5\xf1\x11\x80N\x12\x90\x86\x9a:\x5cC\x9b6\xdb\xd7\xbf\xfa>\xf0/s\x1a\xc2\x94\x0b\x9494?\x17\x11JE\x8e2\xd24\xf4M\xd4\x8b\xbd\xbb\xae\xe3\x8e\xa4\xe3(Q\xf4q\xa4\xd1\x84\xcd\xcc.\xd8\x0d\xd7\xed\xb4\xb1\xb1I\xd6\xc3\x0a\x1c\x10\xdaa\xdb\x86\x06,\xcfqC:\xefMJ\x12}\xc5N;?\xc6fW.\xd6\xcb\xe7:\x10dE\xee;\x1a\xa5\x9e)\xbf\x97\xdf(\xef\x81\xc7\x83=\x89@/\xaat\xf5\xbbU\xac\xeb\x16<5$B\x1fH\xee\xb6\xe4\xb3\xe6\x1a C\xb5\x5cY4\x8d0\x9e\xe0\x95 \xcd\x9c\x82[5p3\xcci\x9ci\xcaB\xde\x9d\xe5_M\xe1\x93\x10II\x95\xa9\xa3R\xf3|\x01\x98\xf0L\x87_=g\xee\xfd\x82\xfa\xf1\x9ep\xc2\xc8\xea\x13\xae<\xb62\x0d\xd5!\x80:\x91\xf0q\xcf\xa4K\x93\x10N}_7\xc9\xb7\xa2\xdc\xb4y\xd0\xfe\xf67\xbd\xd1^\xfa\xd2\x97\xb8\x16\x94\xb4|\xee\xbc\xf3v{\xef{\xdfo\x8f=\xf1\xf8\x15g\xec\x15\xa6m\xfaQ\xe7\xdd<\xb2\x19\x95\xdeYz\xb9\xc3\x94\xb3\xb4\xa5r\xbe\xa8\xad\x91\xd7\xf00\xa7<#\x10\xc54z\xba{\x0c\x15t?\xfb\xed\x91/|\xd1F\xc7P\x87\xad\xaf\x18\xad\x08v\x19\xfc\x5c`C8\x91\xd7KGq{\xd9itH\x89y\x1b\xc2G\x9e\x0e\xe4\x05Q\xf5\x0b\x22\xb5\xde\xcf\xb1\xac?e\xe2V\x8e>\x89C\xe9P\xfc\x9e\x86\x14\x8d\xa6\xd7\x10\xd2\xce\xd8\xe8\xf9k\xe6Lp\x08\xe9\x8f}\xec\x01+\xb2\xfb\x7f\xde\xaf\x8aVz\x1d\x81O1it\xe1\xa78\x93\xf02\xb0\x0a\xa5\xdf\x02e\xa1\xeb\xc8%\xc5\xca\x94\x97\x8e\xa9\xd1\xc8$\x07\xa7V\xdc\x9a*\xd3\xe9\x01K\x84\xd14\x9dNT\x10Z\xba\x14\x89\xe2A\xf8r\xa7\x86\x1f\xf9\x94\x88\xb7\xa0\x04\x12\xaf\x84\x83\x14(\x8e\x1c>`\xefy\xf7\x19N\x92\xe6\xe6U\xa5\x03m0\xbd}\x94\xeb\x1c[\xf4\xce\xd8\x83\x7f\xfd7~'\x90:P\xe9\xe8\xfe\xa1\x07\xff\x06\xe1E\xba\xf0\x17\xf5\xfd\xd4\x00\xecZ\x12RZ\x95\xb8\x12#\xa7p\xccN\xc8\x83\xf2\xeeS\x8d\x1a\xf5+)W\xd4$t'&\xfd\xade\xd6%x\x84D\xa8Bu[\xf9\xe5\xee\x89\xe7J\x18\x85Y\xdf\xc8G\xe1d\xea+\xb0\xcfw\x06\xe7\xdao5\x82f\x98\x03X\x15\x84\xcf`\xe7\xf7*\x09\x1fE\xa86\x9b\x9aZZ\xaa)q\xaf:\x10o$+\xc3\xac\xa4\x99B\xeay!\x1a5\xe0\xc6\xa95g(ke&\xe9-\xbaH\xa9#N\x8dn\xd8\xc2\x7fR)\xd5\x18\x83\xaf\x1a\xdbK\xef\xb9\xd7\xfa\x07\x06\xec\xd3\x1cg?<<\xcc4\xc9$S)\xc3\xf6\x92\x97\xdc\xe5W\x06_q\xc6\xae\xa40-\xa3]\xf8\x1d\x9a\x0e\xc1\xbe\xa0^m\xb1\xd7\xcf\x00k\xa37\x0aG\xf0\xe3`\xa4\x01U\x861-r\x8fJ;\xfbg\xa4\xd6\xeb\x8ch-\x1a]f\x7f\x17>Jv\xc2\xec5\xe2\xd4\xc4N\xf2)\x1f\xfe\x92z\xec\xb4\xa7\x0d\xfa\x08\xc4\x03y\x1bS\xb6S\xa6\xa3b\xab\x85\xc5\xa3\x85Q\x18\x0f\xe7\x15=`H\xac\xd5P\xc2\xadQD\x89QN\x10\x86Z\xcbA-\x9a5~\xa9}\xcf\x958);\xa9+\x82UCL\x99s\xa8sa\xe4\xa11t\xd2U\x81I\x8b\xfdi\x9d\x07\x0d4\x12\x9bN\x0b:-\xf8\x96\xa0\x0b<]\x1ajB*\x13\xca\xc7G\xb0\x9e\xff\x86\xd6I8\x17\x16\xbc\xa5\xce\x0dz\xaf\x99Z\xf7Q\xba4\xc5\x17\x92\xa9/\x89@\xd1I8\xf4M\xde\xdd.\xc1\xd8\xc8\x9aI\x9f\x12\x93\x98D\x07\xc1\xbf\xd26\x96M\xc2\xf8\xba\x0b>\x12\xb8\xfaK\xcb6\x0d{Y\xdf$\xbd\xecSR`%\xedJ\xbfr\x13r\xb6zL\x8d\xb9[\x1dRxy\xbcP\x1d\xaa\xf6\xe5\xb6\xe4\xb3\xe6\x1aP)\x19)S\x08.\x8dx\x9c\xdcv\x82\x02QbE\xdc6\x9e\xa2\x1e\xe6Q\xd1l$R\xc5\xca\x9c)\xef\xf4h\x08M\x05\xa8\x8cD\xd4\xe0\x9bb_\xf9\x0e\xe9\xe1\xf7\x12\x84O}\x86\x1b\xf3\xa5X\xaa\xb8\xeb\xa8R\x1f\xa6YJV\xba\x85\xaf\x90\x8f\x9aO3\x9a\xd5|_\x186\xaf\x80IE\xacOq\xda\xb0\xea\xddR{hz\xe9W\xf2N+\x5c\xf2\xf6W\xd5^\xb58\xb0\xbe\xb4p\xab\xd1\xc4\xe8\x85\x0b\xf6\xd8\xe3\x8fs\xdao\x97ob\xd5\xa6\xc3ANP\xd6\xf1\xf3\xcd\xca\xb2!\xd6\xe7\xf4\xa9\x1e\xe8\xf8\x85Qn\x8e\x9c\xf5Q\xce\xb1\xca1\xef\xadjZMe-U\xdf\x13\xa7N\xd3\xcbf:\x87\xe9\xa0\x1ci\x96\xdb\x93_\xfe\xf2E{0\x9eSB.%\xb0\xda\x1a\x89\x14-E'\x99\xc4IM\xd0\xdb\x91\x0b$\xf7\xa9\xf9U\xe1\xb1\xb8\x88RF\xeb\xdbE\x02\xdf\xf4%P\xaf+\xa9\xaf\x1c\xe8\xadWS\xe0\xd1\xc2\x8d\x03\xe3\xad\xa6+\x05\xe7\xad\xf8/\xb7I\xe3i\x86WmT\x7f\x8dF.\x19\x9d\xbb\x03\xc3O}\xf5u%\xd2\xd7\x18w\xb3o\xc5[O\xc7f0\xcf\xc5\xcdq\x8b\xb7zy+\xc7t6\xb1W\xe5\xf4*\xc87$x.\xc6\xe1dvg\xb7%\x9f5\xd7\x10\xa2\x19#\xad\x87Y\xa2\xc7\xf2\xa1\x03O\xd9\x19\xc6\xd1Y\xf4\xfa\xbbYt\x1b\xe2\x08\xf7>\x16\xf9\xda\x19\x02w\xa0I\xd2\xc1\xd0\xb8\x9b\xef.\xf5\x1c\xc8\xa7z\x15\x9a\xbfT\xafG\x02\xca\x1b\x07\xd1\xc9]}5i\xb6\xf89N\xb8\xc9O\xbd55\x08\x1fI\xf9wH\x1b\xd6\xc4\xe0[\xe7\x1eB\xe0U\x97\xd0\x90\x8f\x14>\xbc\x83w\x0d\xc8m\xb5\xcf\x15\x95/\x0dY\xe7\x9d:\xad\x88G\x8e\xcdhV\x03~a\xd8$d\xd2\xdeX\x9abM\x17\xacj\xbc\x00(\xd4\x86r\xa8\x95\x91\x18\x0f\xe1\xab\xfe\xf2Q\xa9\xea\xcf\xad\xea~q\xdc\xc99\xa6\xd9\xee\xb1[o\xbd\x95\xa9\xb6n\xe6\xd4\xd1\xa4\x03\xb7\xee\xa9_`\x9a\xa3\x86O\x81\xae\x8c\xd1\x14\x87\xae&.\xb0\xe0\x9b\xf6\xc4\xd5cWo];\xd8\xd5\xdb\xd6q(:.Ee\xads\xc7f\xa6X@\x16\x0d\x9e'\x93\xf6\xf4\x95\x02/\xa5\xbaQO\x18e8\xe9\xf1\x0biLG\x1e\xee\xaa^/\x0c(\x84\x0de\xbc\xde\xac\xa4\x9d\x94P\xebC\xe6]\xb1+\xa4\xc2\x1d\x02\xc6\xf0\xfb<\x91g\xdd\xd1\xbe\x90\xd2\xba\xeeL5\x01\xf4|V\x7fT\x8b\x13#K\x8b\xcd\xc7\x82\xda\xb0\xe0I\x917k\x1e\xf2\xf3Q\x17\x9enW\x0c\x89i\xc6Hk0\x19\x9b<\x7f\xde\xc6;\xda\xfc\xb6B\xae\xe7\xe0\xb0\x8a)o\x83\x12\x14\x1d\xf4 \xdb\x11H]4\xd8\x1e\x9d\xe4J\x0fQ\x82\xa8H\xe3-\xca\x8e_2\xa0\xf1\x8a\xaf3\x9c\x8aH%\xb9\xabQ\x88]I\x0b\x92\x03*\xd8\x0fC8\xfc\x02\xb3b \x8a\xa7\x84\x95FSm\x84\xd3\x9fR\xafF\xa3\x90A\x90a\xafkEr\x93qZ\xa8\xa7\x86=\x9d\x86H\xddS:\xe8\xbbf<\x04\x9f\xf5\xd0\xc17\xe0R<\xf5\xd0AX\xd6\x5c^8\xb6\x1a3\xb9\xb44;\x19\x92\xf9\x84\x94$N\xb5*\x81p\x95G\xea\xa9h\xb0\xabl\xbe\xc0}\xf47\xef\xbf\xd9^\xf1\xf2\x97\xf9\x88GS&\xa7O\x9d\xb2O~\xf2Sh-\xa5\x1b7/-]\x1b\x09\xa5:S\xd2&E\xa5\x99z\xa2\xa9\x90,\xf5U\xeb=\x8b\xac\xfd\xcc\x93\x96\xb2o\xa4\xc5M\x15\xb1\x9a\xb7\x8d\xc4r\x05`IGu\xca\xcd\x09\x5c\xab\xb7\xde\xc0\xd5\xd8\xdc\x84\x9a\x1f\xb2\x17\xc4Q\x15\x12\xc7V\xa3\xdb\x95\xa9V\xbf9\x0d\x89\x0dk\xa8?+\xa1\xe2\xd7\xb5F\x01\x95\x15c\x9bP\x01<q*\xbb\xb0\x00\xd7z\xcc\xb3n\xc1#|iuS\x0c\xb5\xef\x9a\xad\xea\x9e8\xad\xf4Q\x98\xe6\x8cTB`\x89\x8d\xaae\xaen-n\xdbl\xcb4B\x85M\xcd<\x8cc\x8eg\x94\xcd\xc4\x9c\xce\x84\x90\xd04\x9c\x84Q\xde\xba\x18\x1dI(\xb53'\xa7YT\xc5 e\x17\x11d\x09*p F\x98\xeb\xc5]|\xac\x00n=\x12/\x1a\x15IH\x15\x98(\xd6&\xcdnFW\x05\x80\xa4\x00\xaa\xde\xa9\xf6\xcf\xb4\xfbh\x8bQ\x97\x84\x95\xe2\xc5M\x9b9]\xb8aw\x86\x01\xbc\x1aJ\xbd8\xf1\xbc\xd7\x11 \xcdOs\x1a\xa69\x15\x9ek\x87\xff\xd4R\xb51\x9b\x16Se\x9a\x09\x9f5\x99\x11\x04\xaa\xd1H5CF\xa5\x95\x98\xc4?\xf5\xd1\xdba\x92\x1f\x1dGr\x06\xf5\xd9\xff\xf3\x87\xef\xb5#G\x8f\xd8\xae\x1d;\xd1\x0a\x9a\xb5\xcf=\xfc\xb0=\xf9\xe4\xd3>\x95\xe5=\xfb\x155\xac\x0e\xb9\xbb\x87XS\xd7\xb5\xdfi\xe9\xae\x02\xe9\xad\x11zh\xb1\x97:\xa7\xa95\xe7\xddD\xa3\xe6)&\xdf\xeax\x9aF\xacjG5\x13\xd2\xba\xde\x14\xaf\x0c[\xc3R\xb5\x81\xc8\xeb\xb23\x93\xc0T4\xb2\xd1\x1aG\x88U1iA\x5c\xdf\xa2=B#M\x8e\xbc\xd2\x1e`\xd5\xb1\x8ayU\x8b\xaf\xab\x8b\x06\x82\xa8\xfe\x08/n\x1b\xc0\xb3j\x04\xd1\xe3\xcaR`E\x19\xa5\x95\xa1u\x94k\x0b\x9e:<\xb2\xaan\xa5\xa6\xf6]\xb3\xc9\xcf\xbf\x12\xa7\x95>\xf2k&|\xd4\x18s6\x05\xc3\xd8\xd4\xd3c\x95\xbe\x1e\x04\x86B\x06Se.\xc9\xb7\xe6\x10g+%\x9b\xa1\xb7x\x9e\x9b{\xc5\xf05Zi\xe7\xe9E\xf7\xbd\x8b)\x0c\x8d\x88\xda`Be\xf4'K$z\x81\xb1\xbb.\xbdZ@eQ\x82\xc9\x17\x1e\xc1\xa7\x06\x94\xe2O\xed\xf0\x05_k*\xe0\xa0\xa9<\xe1\x91\x10\x92\xa0\xea\x04\xff\x00S~\xbd<\x9bQk\xdc\xc4\x94\xa0\x04\x96\xe6\xf5\xbd\xc1z\xba\x03\x95<\xef\x8d\x04\xf0<\xa4y\xab\x17UI\xe6x\xa9\x1c\x95\x16\x99\xd0\x1cS\xf8\xe0\xf6<\xfff\xee~\xf7\xd17\x92\xc6\xafb\x9f\xc4C\x8f|\xe7\x9e?\xf3d\xae3Q+\xea\xe8:\xc2$d\x00R\xb6::\xe83%R\x15O\x10B\x1a\x09\x8f\x9e8c\x1f\xfa\xc0\x07}O\x86\x8eW\xd1\x0enu\x12\x8a\x081\xa7\xaf\x0b\xb3\x1a\xf6\x80B\xf8U&*\x001=\xb8-u\xa6\xa2\xd32\xbd\x96\xa8KB\xfd%X\x88)\x0d\x1fF\xd0r\x0dF\x18\x82]\xbfu\xa96\xce\x9e\xc4\x04\xc1,\x01\xa8S\x87\xc3n\x14\x89\xd7dA\xdc\x91(\x9e\x80W\xab\x1d\xc1\xa8>\xaa\xd3\xa4t\x04\xe3i\xc5\xbaL{H\xebt\xea\xa7$x\xddV\x82\x9d\xf0\x1a\xd9\xab{\x16\xd2VKobK\xe8\xa9|\x97r\x9c\xfe\xac\xbb@\x09'\x85\x07\x09K\xc5-\x8d<m\xd8D\xf4\x80SW\xc8\x89\x9e\xa8\xf4\x96\x16p\x099\x15\xf6\xfa<W\xd3\xb3\xaaE\xb4\x96g\xc8\x8d\xec\xe1\xbb!\x00\x8e\x01o\x8a=\xcdG\x0d\xee\x22\x97\xaaC\xd5R\x03\xae\xb7Uq\xd7;\x06\xfaU\xc9\xb5\xd2k\xd5/\x17\x98\x14Y&\xd9\xd0)\xc04\xc5\xab\x06\xc2C)t\xb8\x86\xcc\xd7\x9f\xa4\x10\xcey\x03\x96\xb2Z\x0fN\xc5\xb7F\xce\x05r\xd9\x8c\xd2\xd4\x90\xfc\xa6\xb8\xd7\x16<i\xf6\x84\x91\x1c$\xaf*\xb2\xdaw\xcd&O\xffJ\x9cV\xfa\xc8o\xa5\xf0Q}\xcf3bY\xe2\x0c\xaf9\xe6\xe7;\xba;\xad\xcc\x08C\xe1V3\xde\xa0\x1c \xf4\xb8\x16a.\xf3\xdc\xdd>V\xe6\x8c)\x1a\x07\x97\xf1Y'\x0c\xa8\x9bSa{\xb4N\x94cC\x15\xa3#\x8d\xa6t\x04P\x18\x0d\x85\x0a\x9fje\xf8\x1c<\x99\x94\x80\x91\x12\x83\xae\x91\xd5\x5c\xfd\x22\xeb\x06%\xa8)\xf7E\x16\x81'\x16\x17\xdc~`*o#\x08\x9f\x1b{\xfal\x07\x1b\xc1\xf2\x08\xa9\x90\xb7Z\x8e\xddV\xfb\xf4<\xd5*B\xf0\xa8\xf3\xaefW\x85'\xba\x5cc&w\xd7\xef\x1e\xf87\x94\xdeO\x86\xda\x9c\xb3\xbb\x7f\xef\xd0\xcf~\xe1\xbb\xf6\xfek\xd2YUdQ\xc3\xd3\xda\x8e\x18\xbe\xabz\xd6eB\x8a>k\x19\xcfv}\xe6q\xf0fF\x07@~a\xf24`\xa9\xd2\xcea\x82\xdb\x166}\x0c\xa2A\xd6\xd1\xc6Q!\x8a\x0f\xa6\xb9\xc0Y^KD^^\xa6LI)\x13\xb6t.T\xfd\x85S\xf5\xa0b\x8bA*@w\x98+!\xe6\x16gPs\x1e\xa7\xc3Rb$\xdc\xc6\xdd\xf6\xec\x8f\xc0O#\xe6\x5c.h\xabI\x5cP\xbb\x10\x05L\xeb\x92\x86l\xd2\xe3/\x93\x86\x0a\x0f\xb1Q\x91T\x97\xc5\x89\xd8\xbf\xa3:\xa5/\x95/$;W\x9a\xb0\x13\xcbct\x9c\xb8\xea\x98\xbf\x89\xf2\x04u\xd3\x93\x8c[\x07\xd3\xca\xedt\x96\x16\xa8\x7f\x8bt\x80\xda\xa8\xc7}\x8c\xb8{}\x8a.C}[X\x9e\xf5\xd1\xf9\xe8\xd2\x19\x9b\xe1Jj\xd5?\xc5*\xba(\x86\x02iv%\x9d%\xbar\x08\x8e\xfe\xb6m\x8c\xd6\xc97\xe9\xcc\xf1\x08\x07\xb7\xbd\x80\x83'\xf9\x9b\xc9L\xdb\xc9\x8eS\xb6\xb5\xc8\xec\x03\x1b'\x17\xb2\xec9\xc9\xb4Y\xb1\xc2\xdd<\xcc.\x9c\xc9\xb1!\x92\xbf\xd9\xca\x8cue\x86\x88f\xd9\xc6\xa7\x9e\xf4\xf8<Z\x8f\x5c\xb8\xfdk\x1d?Ju(\x03\x01+x\xa8C!\x17rS\xdb,\xa0\x18\x92Q\xda\xbd#\xe0P\xde\xd6\xb5n\xa8\xa8\xd4f\xc2\x18\xb2\xd6\xb1\x5c)\xcc\xe5/\x13*a\x80W hAGU*\xcf>\xfa\xc4\xc5\x99=\x95GBXe\xa5T)M\xc1\x16\xd2\xe7\x09u\x97\x95?]\x9d]\xec\xa3)x=\xd3\x06\xd0zm\xb4z\xc8\x94<\x9e\x02\xf2\xa7z\xa6\xda\xa8\x8d\xa7\xc2-\xe1\x22m\xc8\x1e\xaeY\x0fu\xb5\xe2g\xaf)\xb3\x1a=\xeb\xbd\x1e#\xed\xba4\xed\xeb\x81_7\x8c\x12.\x9a\xd4\x17\xb4\xd3H\x1e\xad\x8dZ^K\xa3\x0a\xe1T\xf0\xdcbm\x99Y\xc1\xd6\x00\xea\xbf\xea\xed\x8aPxEd74f\x8d,\xb4\xe025>n]\x13\x83\x96\xe3:Z\x8dz\x14\xae\xa9q\x8f t\xd2J\xc25\x1a^\xa7\x14JLf\x82\xfd\x1b\xa3\x5c\xf2$=|\xddj\xd1\xcb\x1c{?*\xab=\xa8\xb3\xb6\x17\xe8\xcd!\xec|4D:\x90-\x1e\x97z\x8d\xf0&\x0c\xa9\xc3\x1e\xae\x96\x0d\xb9r\x1a\xc3\xfc4\x22R\xda\xd5S=\xc1\x09\xb9\xe3T\x8e\xa5\xfeMv=\x02H\x0d:\xe4\xad\x96c\xb7\xd5>\xabyJr\xef\xd9\xab\xf3\xf6o\xffQ~\xea\x81j>\xcf\x87M\xf3]\x5c\x06_\xf8\xa1\xfa\xc8+\xd9\xfc?\xbf\xed\xd7\xbf\xf4\xd8c\xdf\x7f\xfb\xbbq\xaf\x0a\x9f\x14\xe6\xb9V\xf8@\x17\xfd\xa6F\x04\xe1[\x0c^\xef\xb4\xd2'NY\x0ai S\xb4\x1d\xd9\x1e6\xd5\xf51R\xa5\x0b\x82\xdbl\x06A\xc2\xa6\xbfE\xb8\x88\xca\xb1=\xdb\xe9\xc2\xc7{\x8e8\x94\xd8\xe5=\xb5\xcc5\xd7T\x22\x8d\x0a\xb8\xf9\x9a\xcb\xc1flf\x9e\x8e\x07\x02\xa9H\xb8r\x89\xa3\x8b`\x10m\xec\x0a\xe7rb\xeaAP\x1c\x18\xc8s\x83e\xb6\x8b\xba\xa7ZA]\xa6\xd3T^n\xf3\x11\x88\x92I\x10F$\x0c\xcdabY13\xd5u=\xc4[\xe4o\x0c\xc12\x98\xeb\xf6\xa9\xe2\x19\xe2\x5c\xa2fI h\x04\xcf$0\x81U\xcf\x11\x22\x95\xa2ug\x06\xad\x87c\xfe\x97\x81\x12\x05\xc6\xd8\xd1\xde\x91\xeb\xb5\xf3\xcb\xe7\x08E\xc6d\xf0\xa8\xa8B\x13>\x8b\x80\xcc\x97\x11j\x8cH\x96\xd1\xa2\x1b\xe2Z\x80,~\x82l\x07_\x11\xe1F\x8d\x86\x1e\xca\x8b\xc6Ry\x1b\xb7\xf3v2\x7f\x81\xbd+Y\x9b\xcb\xcc\x91\xb6\x9c\xf5g\xe8\x14\x8e\x1d\xe6$\x80}\x96\xeb\x1a\xa2\x036e'\xe7&`\x96s~{\xa6\xc7\xeb?\xa1\xcd\xaa\xdc%l\xbd]\xd7<\x9b\xda\xbc\x9a\xabP0z9\x06\xffN\xdc\xd8K3\xb8}\x87\xdd\xfe\xba\xef\xb6^.s\x13\x1d\x17\xe7\x11\x883\x13l\x92\x9cD{p\x9a\x8d\x96\xb3V\xc6\xad\xb48K\xdb_d\xf3\xe8\x92\xef\xf1\xd1>\x9fr\x99Ci}\x9a\x83\x91\x9c\x8f\x0cU\x16BC\xccJ'\xa3\xe1\xad\xfbv\xdb\xee[n\xb2\x0a\xa7\x12\xcc\xcf-\xd8\x02\xebo\x0b3\xe3~b\xc1,\xfb\xad\x16g\xe7\x88\x93s+9!`\x89\xfd2\xda\x07\xb4\xb4\xa0\x03DU\x0a\xa9\x01\x17x\xff\xed\xbf\xfa\x97v\xfbm\xfb\xed\xd7\x7f\xe3\xb7\xec\xc1O}\xd26m\xda\x04m\xeb\xe1Rx%\x83\xb2 \xd0\x0c'q\xfb\xc9\xdb(\xa3\xf4\xf6\xf6y\x1d\xd2\xf5\xdbw\xb0\x09\xfaMoz\x93\x9f\xc2!\xba<\xf0\xb1\x07\xec\xe3\x9f\xf88\xd7<\x1c\xf4\xad\x02\xab\xe1Mc\xd0\x9a\xe7\xa93\x17\xec\x1c{\xc3\xfc\xaa\x85\xd4\xe3\x0a\xbdUb\xa1\xd4ZG\xb0\x0e\xc1#\x04B\x95\x10\x0ekJ\xeb\x94\x94iD\xe1\xbb\x0eV!\xf9tw~V\xfa\xe8;\xb8\xa8\xb9j*K\xef%\xf6>\xcc\x9c:\xebR~\xc6\xd5\x12\xd3X\x94\x8e\xc4(\x98\xfa\x8d\xbc\xbd\xf2\x08\x8f\x18\x8aW$\xdc\xd5E\x91\x9d\xca\xa6\x86.vX\xa2\xe1_\xa0\xd2\x9c\xa5\x07\xa2\xd1L\x07\x8dl\x90\xd1J?;\x86\xbb\xd8k\x91a\xeal\x89\xf8J\x9a\x9e#\x1d\xca\xa3\x04_\x9eH\xd4\x87\x94[\xd6\xa7_\xd4\x9c\x82\xf0Q*\xf2\xf4f\xe7a\x0c_d'\xf4&zd\x83\x9c\x8d\xa4\x86\x14\x0c\x11\x01+\xe3\xb6\xda\xa7\xbb\x85\x1f9\xca\x04fP\x9f\xdb\xd4'\xf8?\xef\xbf\x9a\xdf\x81P\x99M\x8d)\xc9w\xf7\xff\xca-\xef\xfc\xcb\xc7\x9f\xf8\xd1W>\x8a_5\xfb\xce|THuf\xe5W\x9dG\xa3\xd5+NB\x0d\x0aC\xa3O\xc8\x7fQ\xdd\xab\xa7\x97(\xa8`\x93\x08\x98\xd1\xe5\x19\x9b\xa5\x5ct\xaf\x8b\xb3S\xf5\x94)\xdfeF\xab\x92\x8e\x9a2\x82\xbd$T7N7\x9e\xb7\xa9\x12'\x16\x97\xe7\xe9\xf9\xa2\x04\xb04\x87\xaa3\xeb\x89\x1dl\x1c\xe4\xe8\x9d\x99y\xa0\x17f\xac,?\x18\xce\xfc\xc2\x1c\x19e\x1d\x10\xbc3\xed\x8b\xd6\xdb\xd6\x8d\x90\x90\xfa\x0a\xd7\x16S'r\x8c\x104E\x86*\x0b\xe9\xd6\xd8\x06F\xc8\x9f\xef\xa8'\xfel\x16\xb5n\xd2PD0n\xcb\xf7\xd9\xe6L\x9fM3\x82\x18b\x84s\x9cQL\xe8\xd9\xff?\xf2\xde\x04L\xb2\xec\xaa\xef<\xb1GfD\xee{\xedU\xdd\xd5]\xbd\x22\x09\xadHHH \x7f\xb2\x05h$\x10`#\x06\x06\xbe\xcff$\x03\x1f|\x06<f\xec1\xf6\x0c\xf2\xe0\x99a\xf1`0\x0c \x0fB\x06<#$\x83<\xc3\x08\xac\x95n-\xbd\xaa\xf7\xae\xee\xda+\xb3r\xcf\x8c\xcc\x8c\x88\x8cu~\xffs\xdf\x8b\x88\xcc\xca\xaa\xca\xd2Z\x12\xb7*\xe3\xbdw\xdf\xbd\xf7\xdd\xf5\x9c{\xd6\xab)\x5c\x06\xf1\xd5\xb5'cJ\xc3.\x06Im\xd6p\xdb\xef\xd4M\x0b\x843o\xc5\x14\xde\x0e\xf8\x97\x13{\x196\xf36\xf3^\x00Q\xffR\x9a\xd72\x82\x94\xe5e\xb2n\x0b\xdbg\x98j\xda\xe4e\xedH\xea\xb8\xcf\xcb6\x88\xb5N;\x04\x0c\x04\xa8\xb4\x8eD\xe9\xcf\x92\xfe\xbe\x13\x13v|d\xc2\x86\xa0^\xd78\xc3\xe6r{\xc2\x06\x1as\xb6\x91\x98\xb2\xb1\xb5\xa4\x95\xebPk\xfd\xd4c5^\x13\x8c\x88\x0f\x14\x03\xa1\x99\xd0#\x9e\xe3i\xcf\xa0%\xda\xd9\xa0h\x82h\xcdE\x7fZ\xc7\xaaK2_\xb4\xfc\xd8\xa4\xe5\xc6\xa6\xe9\x14\xe4\xc1\x1b\xb4\x93\xfeK\xd6\x9a\x96\xa5n\x0d\xfe\xdai\x10\x0a\x1e\xad\xe52\xa9\xa5](Ui\xd1w:\xc2\xba\xa5#<I\xaf\xf9!\x04\x9dbc\x11\x9e\xc5:$)\xdc\x90\x1c\xe7\xf9\xb4\xb6\x19o\xfa@p\xc8\xeaY\xba\x8a\x06\xa8\xef\xf9'vf\x0d\xcaS\x06\xa7Z\x0cJ\xe7\x1d\x18\xb5\xca\xfb\x9coM\x8e\x8fq\x96\xd0\xf3\xf6\xd0\xe7>\xe3*\xfc]\xaa_\x8d\xeb\x0d\x1a\xa1P\x84\x5c\xe6\xa8\xb8!\xbcg\x7f\xe7w\xbe\xd5\xee\xba\xeb.{\xe8\xa1\x87\xec\xd5\xaf~\xb5\x0d ~\xb8r\xe5\x8a{\xd6\xfe\xb6o{\x83=\xfc\xf0\xe7a!\xa3P\xa5~q\xaa\xdd\x9b\xda-8*T_s[\x1eU\xf6\xab\x15\xf4Qu\xf2\x0d\xc2\x0d\x11\x8f\xf2{\x03\xa2_//D\xf4\xc6\xf4Fwrxd\xfct\x8d<^:\x03\x9b\x91\xf0\x9e\xb4\xea\xa8\x12T\xcf\x10\xee!2\x13#,W\xa5\xe8i\x88\xdf\xc6HG\x0f\xfci\xa1EH\xc7\xc9nG:a\xc2&\x98\x90!\x8e\xc9\x17O\x18\xe2\xca\xc8z6Pf8\xbf\xd8\xb4<r\x9ba\x0c\xf9&9\xeb\xa3\xc8 '\x01V\x0d\x00LS\xa4M\xf8BT\x07\x81\xb6\xd0\x1f\xdd+\x93\x98\x9ao1Q/lm\xe0\x86#\xdf\xc9\xd3\xcd\xdds\xa7\x8c\xe1\xb1\xd3\xaa\xe8qW>\x7f\xbc\x95~4}q\x1a\xd5\x0d\xad\xca\xe6\x95d_\x11H`\x85\xec\xf4\xb1?>\xf5\x9e\xff\xfd5\xcf\xfe\xc6?\x5c\xe9\xa6\xf8\x12\xee\xb4\x0a\x09q\xdf\x84\x9e\x0f\x0b\xb5\xf3\x22J\x13&\x8eR\xf2\x9e\x85\xdfd,\xca \x98m\x16f\x1a\xf6\xadB\x9f\x9c%\x8a\x0a\x00 \xe9\xe4\xc6\x1a\xf1bL\x09Q\x08\xac\xe8\x5c\x97Z\x1d \xcf\x0e\xbeY\xc3\xa3/l\x8f\xbe\x9c\xd8;(\x92\xb0\xc8\xc5\x9a\xad#/l3?\xb7q\xc1\xb2\x05\x02\x10D\x12\x0bd\xae2\xc7\xe6c\x14\xad\xcb\x82+\xbd\xc8XPV\xf1i\x90O_\x8a\xf9\xc4W\x9a\xf2\xb5\x05jJ@%\xb5\x01^:\xf5R\x94\x0dX\xceF\x15O]\xfbI?\x98.Z\x96o\xa3s\xed\xdf\xc4N\x1e\xdb\xa3\x02;\xe0\x0cG\x15\x88b\xab\xf2\xfd\x12\x1b$\xe4V\xcc\xa5\x06l\xa7\xadd\xd9\xdb\x95\xc3W\xd9\x00\xae^6\xd0\xa4\xab\xb5dY\xc9~\x9a&\x0b)5I_\xa0\x8c\x0a\x94\x8a\x94u\xd2\xd0M\x19\xe6|\xaa\x9d\x01\x09\xab-\xf4\x1dl47\xaa\xa4\x5cQ\x86S\x00\xe3\xe9\xbe\x11;\xc4\x94\x9e\x86]\xbd\x92\x99\xa0\xab\x06\xac\x98;oW*\x9bV\xd9\x1e\xb1\xc7\xab\xcbV\xe1;\x01\xbfh\x0c\x22\xb6\x17w>.\xba\xde(\xd0\xf6\xb0\xb0\xba+\xdd\x11Og\x85\xd0\x1d\xf4G\x0e\xe4\x93\xa5\xce\x8d\xaa\xea\xca\x06@\xc3\xc9\x9f\xbe\xea\x05t\x00^'\x86.\x10\x03Q#L:\xde+\x89\x9ch2@\x94\xce\x16\x84\xf9\x12\xea\x8c\xecK\xaa\xed\xc8\xb6\xc4\xd6\x13\xa6\xd75\xf6fM\x22Bh\xa5\xee\x9a\xaas\xcf\xb3\xe2\x14\x94g\x1d\x1fo\x1f\xfa\xd0\x9f:\xcb\xcc\xd9f\xfe&|\xc7o;?\x8a\xd3\x9cE\xa3\x16\xdflg\xce\x9c\xc5\xd7\x5c\xc1^\xf2\x92\x97\xf8\x81wo~\xf3\x9b\xa1\xb86\xecO\xfe\xe4O\xec\xc1\x07\x1f\xb4\xa3G\x8f\xda\x0f\xff\xf0\x0f\xe3\xd6g\xc4\xa9(y\xbb\xa0&\xb4\x89\xb9\xa0\xc9\xa0\xd2\xbc\xe9l\x92\xa9\xaa\xa8\xe6\xaffP\xdfj\xfd\xed'\xec\x0b\xf1\xa8\xa0\xd0E\xe1\xd7\x0b\xee\xb9\xed\xfdP7\xba{\xd7\xc9\x1fE\xed|\xe3]\xef|\xe7\x10/y\x0a\xbbV0\xfc\xd0\xe8\xa0\xd5\xd9\xc5u\x82\x120\x85\xd4@\xedV|:\xf5 \x1d\xa7t@.\xbeccq\x09\xc0\x08\xd9h\x12\xeb\x5c\x0fy\xa0U\x1a9\x03T\x5c\x92\xbc\xc2Q\xd5F\xd5.a\xc0z\x11;\x8f~\x10\xce\xc4@\xd1&G\xc68\xfaw\xc8\x12PEM\xe2|D\x19UJ\x08\xd3M\x9f\x0f\xa3\x1c\xf5\x8d\xd9\x02\x13\xa19\xa4\xddP\x17A\x91*z\xea.\x06\x1f\x9b\xf0\xa8\xd7Q\xf0\xc6q\x1f\x83\xd88\xfe\x96\xb9j\xd5I?\xbd\x13.\xfd\xde/\xfc\xbb#\xef\xfe\x95\x7f\xcc\x8a\x85\xacH\x9e\xcc\xbe\xea-\xbfk\xbfa\xdf\xa7\x04\x0e8\xe8c]{\xc3\xce\xa7\xde7\xbb\xee\xa3\xbe\xf5\xd8\xb8\xaf\xa2+K5\x8a\x8e\xefz\xf2\x92O\xa6\xc8\x80^\x1ba\xf5\x0d\xb1\xb3\x97b\xc1J\xa5\xa4\xaeu\x0a\x15~\x0c\xac\x18v\xca\x8c\xa4X\xa9\x9a\xdd\xa2\x88[\x8d\x0a\xd4\x01\xd4\x03\x9b\x92v6\xc9<(0\xff\x12hTJ\xc6C\xe3\xb3:\xcb\x05\xebs(\x934HHbz\xb1[\x1b\x00\xa1\xad\xc6\x06\xbb\xe4*\xc8&\x01\x1bW\xbbW\x00X[,;Q\xca|\x87\xf23\x92\xd9\xc0\x02\x14\xdb\xb7M\xb9)\xfa\xa6\x8a\xc5\xbd:Vh0\x0b[l81`\xd3|\xac\x06\x85R\x02A\x09b\x0e\x0eN:\x82\xdb\x82\xed\xd5\x86j\x17\xcc\xabC\xb6\xd3\x0a\x90)\xb2*\xc9/\xd3\xb0\xbc05\x18F\xb6\xd0l\xc9W\x99\xe4J\xfa\xa3\x08\xd8Nr\xf8\xa2\x9dw+\x03\xdbq\x1b\x95r\xd6\xc7bk\xc9\x0e&\x0fR\xc7\xbaSF)\xa8\x1e\xa5o\x80\x884\x0b\xab\xb5\x96=w\xa1\x0c\x8b\x8d\xbe\x19\x96w\xe8\x86M\xa2\x0d\xd1\x0fkO\xea\xe0\x1778{&;n\xeb\x09Qhd$\x84\xde\x0c\xf7\xfb\xfd\x15{[,\xd2\xee\x5c\xe1^+M\xebW\x85\xe8=HS\xf2\xaa\x14\x9b\x80\xd85\x8c\x00v\xccjR\xdb\xc4\x22\xef\xcc/\x97\x03uk\xe0\x1bS\xde\x0a\xf9\x08\xf1\xb8\xb7j%\xf6zk\x04\x18\x0f\xfe5e\xb1\xce&X\x94\x9fk\xacrM\x8a\x0bB:\xc9\x82\xe3b%\x11S\xf6\xce\xf7\xf4)\xd2\xc8(\xf8\x81\xcf<`g\xcf\x9euJE\xd1!\xd5\x8e\x94!\xba\xf3.<\xca\xb5\x92\x8c\x9c%\x1f\xfd\xc2\x17\xbe\xe0^6\xde\xf4\xa67\xb9\xfd\xd9;\xde\xf1\x0e/O\x07,*(\xcd\xca\xca\x8aSAj{\xb7\xefBYu(?f\x89\xf7O\x13\xd6\xe0W*tZ\xe57\xfa\xf1\x0e\xbd\xe1\xe7\xf6\x8dxTR(\xb6\xa7pn\xc5\x92\xda\xfd\xa9n\x8a\xee]'\x7f\x14\x15\xbf\xf1\xab\x0fXW\xb0\xa7]\xcc\x1a\xbb\x86\xd1\xb5M\xcb\x8c\x0f\xb1\xf3c\x190a\xbc\x0c]4I5%\xf9\xef\xc8F\xbb\x17&)\xa3\xe1\x7f-v\x00\x01\xe9p\xe5\x9d\x90\x8f\xf3\xc9c\xa4\xe3T\x90\xd2*\x0f\x14\x11\xef\x1d\x09\x11_e\x90\xce\xb2\xcb8wy\xd6\x86 \x7fg\xc6'mbj\xc2\xfa\xa0\x86\x12\xc8\x86Z\x08 \xb5\xcaT\x1d\xd5I\xedW\x0f\x888\xda\xa6\x9c\x1a\xdf\xcb\x8b\xad\xb3sJF\xcf\x9e8\xf4\xa3\xda\x11\x1e;){\xde\x864$\xb9\x85\x82\xaa\xa7\x15\xda\x09+\x9f\xfe\xe0\xd9\x81\xbb_\xf3{#o\xfc\x81\xffV\x91\xc9L\xeem\xf7\xff\xeeS\xff\xa8Q\xfd\xf8\x8et\x9d\x0c\xfb\xb8\x89\xba\xc4S\x86{\x8a\xf2\x9b\xf8\x0dW\xdd2\x06\xbd\xa1\x83\x82\x88\xae\x16\xb2V\xc2\x0fV\x92S4\x0b\x9c\xe3\xd2\x80?\xbf\xc5q\xc7m(\x15\x1d\xf0\xd5\x84\x8f\x9fe\xae\xe8\xa8\x09\x07B\x0c\xa9\xdc\xeek\xf7\xdb\x06H\xd7\x98\x135\xee\x11\x03B\x15$0\x04\x85\x95#\x87\x93\x8c\xd9*TP\x95\xb2\xa7\x90\xe9\xe4\xa0z\xb4\xa4\x13P\x04\x89t\xd0\xf4jT\x9aP\x1c \x07\xea\xa1]q\x09\xd9\x88T\xef\x873\xc3\xcc\x11v\xa6\xa0\xaa\x14\xea\xfbip5\xfc\x1f\xc6\x19\xc4\xc3s\x00\x84\xcc\x1d\xd0\xd2\xc1d\xd1\xd6\xfbAZ\xa0y\x01\xf8,\xb2*\x9d\x01\x93k\xa4\xf96s\x8d\x0dS\x0ac7u\x01`\xd4\x81i\x9f*\xab9\xc5\xe2\x91\x9d\x1b\x98\x87<\xf2\xd1\xa5y\xae]1\x08\x928\x8d\xa0\xdaV\x07Q\xce6\xcf\xdbX\xbb\xe0r\x9a\x01\x10\x90\xd2\x0a\xf9n\xd77\xe8\x17\x00\xdb\x16\x08\x18\xe4s\xa9R\xb3\xd3\xabM\x1b\xc3Af\x22\xb9\xc8\x1co[\xa9\x22\xf9)\xc8rh\x04\xc4&\xa3\x5c\xd6\x04\x9f\xf5@=t\xab\xea\xec'\x08\xf1\x84\xf5\x1d\xaeam\x91\xb3\xb7\x00\x10B\x12E!\x1d\xd2\xe6\xb6P\xb4\xb1-@\xb1+\x84\x18\xda\xec\x95\xe1J\xd0\x99;49\x94\xe7\x9d\xa6\x96\x12\xe1\x08\x88\x0b\xfd\xa3GGb*\x804R\x02\xf1\xceR\xbcZ\xc3\x7fj\xe7\xe9\xf4\xa3\xb7\xbb\x83\xe2\x84\x14?\xfd\xa9O[\xa1?f\x0e\x90G\xf9n\x18\x94\x9b/\xf1\xdd\x0f\x7f\xf8\xc3\x8ex^\xf7\xba\xd79\xe5\xf3\xeew\xbf\x9b\xe1\xc4\x16\x8d\xcd\xf8\xd8\xd8\x98\x1d?~\xdc._\xbe\xec\xb2\x9f\x8f|\xe4#\xee\xf8V\xca\x111\x12\xee\xfd\x94\x90\xe7&\xf3\xff+\x164XQ\x88o\x15\x13\x0e\xea\x8b\xdf\x5c}\xbd.\xe2\x89\x8b\x8c\xaf\xea\x1a\xdd3\xe4\xfe\x1b\x17\xb7\xf3)\x8e\x8d\xaf;\xdf\xfaS\x14\x15\xbf\xd1\xc0f!\xa5;\x81\x0f\xc9\xab\xef\xc6\xec\x15+\x8e\x0c\x1a\xac\xe4(hBE\x93T\xb7B( \x19\xa7b\x84tD\xfd\x08\xe9\x88\x92a\xa0|\xc7D|B\x00G\xf9\xd8\xc9\x8a\x9c\x12\xcfX\x0b\xd3Yp\x12>jA\xeaO\x0b\x94\xf7Ix\xb9\x12F\xae\xe0\x19viu\xc5\xfa\xce\x9c\x01\x01\x8d\xd9\x81C\x87l\x18/\xb8\x09&\x95\x9f\x9a\xc8$Q\x1bB\x80/\xcc\xb7\xcb\xec\xae\xfb:\x0e\x05\xc3\x9b8Mo\xbfy\xdb\xe3\x0e\x88J\xe8>\x86;j\xb9\x13\xd2G\xe9\xbeF\x17\x0d\xff\xee\xb0~\xfe\xb7\x7f\xf6/\xf3\xc7\xef=\xdew\xec\xde\xb7\xe8e\xaa0\xf4\x8b\xcfnO\xfe\x85#\xe5x\xaczr\xa9e\xd7\x0b{}$N\xafw\x0e\x04\xe2\x08]C\xa4\xc7x^\xc6D\xbc\xfa\x0a\x08\xa024ekb\xcd\xd4\xe7\x9c\xb2\x19\x10\xe5\xca\xff+\x8c\xf3:\x89\x07\xc4\xd2b\x0b\xdb\x842\x19\x19\x9bA\xd8\x8e\x9c\x049F\x15\xa1y\x1bD\xb3\xb2\x5c\xb7\xe2\x18tM\x16@\x0d\xfb\xcd\xfa\xf0F\x80<\xa4\x09\x9bg\x06*#\xaf\xf1\xefCf\xd4\x8f\x04\x07\xc4 \xea\x1c\x22\xc0V\xf1\x82\x5c\x85\xaa\x12\x1b\xac\xdd\xdarVn\x06$ \xc7\x91\x83PC\xd2 \xabA\x1dI3L;\xe9\x9c(\x16\xa8\x0e\xb5\xcd\xd5\xf7\xa9_\x1a\x84Y\xa0\x1d}y\xa8\x15v\xfa\xb2]k\xe5\xa0V\x10\xa4K\xbd\x1f:\xc7Yq-\x90Y\xbb\x89\x8a?,\xde\xb5\xf55dQb\xd3Q/Qm\xb0\xde\x94O}\xae\xb5P'\x0e\xb0\xedk(\xc9\xce\xbc\x86v\xda\x5c\xe3<\x9ai\x05\x1b\x81\xba\x92\xdat\x13\xa4#\xea/\x03R-\xe6*l&\x90OAe]A\x96\xb2\xdc\x84\xf1\x07@\x97cS\xc9I$7JS\x1f_W\xb4C\xfd\x1f\xc6W\x0f\xfc\xc5\x90\xc8G\xe7\xda?\x9d\xb9\x12\xd0\x81'\x14\xa2\x0c\xc8(\xe4\x13\x00Mg\xc3\x06\xcfe+DKV\xab\xfes\x1c\xd3\xc1zQz.\xbe\x19\x0d\x8f\xa1.\xd4'\xb0<\x95Q\xac\xca\x00Xh\xc9\x0e\xa4\xd9)A\x0d\xa2\xaf\xbd\x1ed\xf1zj\xf3\xeau\x8b\x0b\xdey\xd5Y:\x0dQ\xd3\xb0\xceD))\xed~\x83\x90\x87(\x1a\xc9t\xde\xf3\x9e\xf7\xd8\xc1\x83l\x06\xa8\xb3\xa8\x9b\xa7\x9f~\xda\x8ep\x1c\x82\xde\x8b}'\xaf\x1c\xc7\x8f\x1f\xb7\xef\xff\xfe\xef\xb7\xdf\xff\xfd\xdf\x0f\x9ap{|HM\xf8J\x860\xde|\xc1o\xa2\xa7}\x8c{\x0f\xb4\xdf\xbbz\x9d\x82\xa3\xb2\xd5\x10\xc5\xd1\xa5\xfe\xbb\xebB\x5c\x08\xd1\xdbk?\xf5f\xa7P\xc9x|\xe6F94h\xcb\xab\xcb6\xb2\xc1\xf9\x18\xc3\x05vY,0\xe5\xd1\x8f\xffi@u\xaf\xff\xfc\xf8\xf8\xf2#\xfc\xc1`;?\x97\xc9\x95`\xd0|\xe2\xb0\xd3\x15b\x125\xe4H\x07d$\xd6\x9b\xce\xc0H\xb8\xe6\x0b\xf1\xc49\x9b\x8egn\xfc\xbd\x18}Uvt\xa7/\x5c\xb4\xf3PA\x07p:y\xf4\xc4q\x1b\x9bA;\x08\xc5\x04\xdf)Gu\xd6\xc1y5\x16\xaf\xfaH\xd5\xd9{\xd0\xa9k\xf4\xc6\xef\xba\x8fQ)\xf1%\xbc\xd0\xef-\x1c$\xcfI\xbc\xf0K\x7f\xf77\xef\xfe_>~\x2258v\x07}\x9d\xfe\xcc\xd0\xcb\xded\xc5Q\xaf\xb6\xf7\xfd\xcd6\x00`\xa9\xb0\x03\xc9\xec\xd1\x99qT'\x1d\x11\xda\xf5e8\x8e\x00\xb9\xb8e8\xe9T\x92\x95~\xbc?\x03=\xa1&\x126\x90K\xd8z\xb5l\xcb\x1b\x15+\xd5\x83\x5c\xb1\x01\x05\x93\x1e\x1e\xb6\x22n\xf2G\xc6\x17\xac\xbdr\xd1\xb6\x97J\xb8\xc2\xaf\x92\x1fjx\x08Y\x0f\x94nc0\x03\xf5\x83\xb3Od\x0d\x13\xd4\xb1\x98\x03\xb8\x0fQ\x1el\x8d\x0d\xe6L\x1ae\x85\x12\xf1M!!\xe6(\xb3\x8dy\x88\xea>\x93a\xa9\xba\x84\xfc\x87\xf3\x81\xd0\xa6C7\xca\xa0\xc1H'\x80'\x0a\x0b\xad+XH\x12\xef\xcb\x83\xb2L\x09R \x1ei\x95e\xd2}x9\x86\xad'$'\xf9\x03H\x0f\x05i(\xb9\xb45p\xc9\xa3\xbdw\x16\x8d\xb8<i\xa7\x87\xb7h\x13\xc0\x15 ,\xa6\xb0d]\x09\xdc\xe5\xa7sh\xae\xe9(k\xe6\xbe\xce\x92\x91\x5c\xa900\x8cZ[\xbf-n\xac9\x12\xcc\xd6.\xb8\x86\x9d\x94e\xea \xc1,ig\x0a5%\xe5\xb8\x00\x10\x11\x94FK\x1aa@zm\x0a\x93BBZ\xb3|k\x0d@\xbb\xc6\x17C\xe8\x99\xb1B>\xfb\x08\xca\xc1\xd6\xd0\xd7\xb2\xff\x10\x11\x96y\xb7,\x8d\x14 !\xec\xc4\xd4\xb7\xf1+\xe2<\xbf\xafs\xddk\xe5\x11\x88\xf4\xaf\xfb8\xf0H]\x1a\xd2\x84[\xba\x88D\x12-\xc4>Q\x91\xc0\x07\xfe\xf989Ba\xdd{\xd0\xd8Q\x80\x0a\x8e\xf2\x0b\x9e\xe8/*\x95\xaf\xa8\x0e{\xb7\xaf\x00\x5c\x08\xd4\x87\xd2\xef/h\x9d\x08Y\xc9\xad\xd3\x1b\xdf\xf8F\xcf\xf4\xf8\xe3\x8f;\xebM\x88H\x14D\x19C\xe8\xc3\x87\x0f\xdb3\xf8\xf4\x13\x92z\xdf\xfb\xdego{\xdb\xdb\x5c\xd3N\xdavBP*'^sJ#\xe5\x9ap|\xf8\xfe\xeaqs\xa9\xa2\xf6y\xbfts\xee\xa7\xd5a\x85w\xf3\xdc\xf0..4\x5c\xe3\x0f\x87l\xf1\xbb\xb8\x90\x9d\xcf{<EQ\x1a\xfc\x9c(\x1e\x7f\xeeD\xda6\xbb\xccM\xc9]|.\x85\x19\xd6I\xa28\x16\xb5w2\x08E\xf7\xea\xf8\x800\x98J \x1d\x15(\xca%\x96\xe9x\x9c\x90\x0f\x93LH\xc7\xdd\x950\xa0\x22\xb5\xdb\xb2s\x80Z\x11?\x1c\xf3vk!\xa0\x15\xdb\xa5\xc5\x80B\xcb\xb2\xf8\xf5\xben\xe7\xe7\xe6\xec\xc1\xcf}\xde\x9e\xf8\xfc\xc3V\x82\x22k\xe3q!\x04\xc9\xa6X\xf4\xe0\xb7xrF-\x89\xde\xab6q\xd8u\xd7}\xf44=\x8f\x9ea\xf7s\x5c\xca-pEpb\x8b\xcd\x8d\xb5\x85\x8b\xff\xf6\xa7\xff\xe7v\xa3\xb6\xae:\xd5\x93\xd9\xbe\xdc\xf7\xfd34\x82n\xb8\xaf\xd9\xbb\x09\x9d\xf5\xcc\x8d\xdfw\x22:\xe9{\x91\x8d\x22C\x8a\xb0\x1d\xca\xb0#\xcc!\x0c\xafn-Z\xbe\xb1i\xd3\x03\xfdN\xb1\x0e\xc0?O\x8e\x0c\xdb\xcc\x01\x10\xccX\xd1\xb6a\xa5\x96H\xb7)J\x85\xb1M\x16\xf262\xc9bE\x9e\x01\x07\x0a\x99I\x02\x85\x01\xc4WM\xac~P\xef_g\x17\xd2\xce\x0f\xda\xf8\xccqK\x0d\x8fY~\x92y;\x80\x82\x02\x0a\x08\x02\x8a\x0d?\x07&P\xd7\xe0>\x1b\xecO\xc1\x83G\xa9\x81\xfa\xac7@v\xf5u\x9b\xaf\xce\xda|\xfd\x12\xde\x94\x91\x8b\x08\xe1A\xbbHa`\xb3\x98\xb5\xad\xc9\x11\xdb\x18\xce[\x8d\x03\xc3RhZ\xea \xb06X\xab\x09\xabKr\xc3,X` \xd3\xcf\x01f\xa36\x8am\xc7h\x81\x83\xcd\xf8P\x1f\xac>\xed\xb2\x07\xb8\x19\x1e\xd0V\x09 \xcdL\xd2\xee^\xc8&\xc9\x81g)\x99\x0f\x10/j%\x0b2\xca\xc1\x22K\xc2:\xdeF\xdbk\xa5\xb1j\x97\xaa/\xda6*\xe7\xf9\xcc i%\xa3\xa2\x87A.\xb2\x1dJIS\x13\xaa\xab\x09\x02kRN\x02J\xaa\xc0u\x84\x13Ae\x7f$5lVY\xcf\xd8\x84\xdb\xabG\xad\x93d\xc7M\xe0\x5c\x04\x80)\x18\xe6kZ\xd7\x9e25\xc0Z\xf2\xce6\x17\x92\xe0O\x1bL\x97\xe1ziq~\xc5\x875\xaert\xef%\xb1\xde\xfb\xfas\xf6\xad\xaf\xba\xcb\x0e\x14\x03r\x95Gp\xb9Srl\x06\xec\xd0?\xaf\x0b\x1f\xa2x\x87\x0bT\xc6\xcb\xf0Rv\xd7\xc9\xbf\xbb\xf3G\xf32\xcd\x9c\xf2o\xfa\xb7w\xbe\xbf\xd6S\xcc&\x93\xbc\xe6\xb3\x9f\xfd\xac\x1f\x93q\xf2\xe4IWT\xd0;!\x1d\xc5\xaf\xa1xu\xec\xd81[\x5c\x5ct\x84\xa3\x83\xec\x84\xac\xc4\x86S\xdc*j\xd3%T\xcc\xa5\x94\xa0\xab\xe2\xe53\xf0\xab\xa1J\xddi\x9b:\xeb\x06\xe1\x8b\x82\x0c*W\x93*\x5c\xa3\xa7\x9d\x97\xceg\xe3\xb4!b\xef'u\xac\xac\xa2\xd9\x1fF%\x87\xc2e\xa5\xbb:\xbf`\xc7\x0f\x1f\xb2R\x8e\x1d\x9e\xa8\x15\x0d&\x7f\xfa\xa7\xc9\xa1\x9d\x9d\xfek\x92I\xf0\xe7\xd4\x8e\xde\xea\x9d\x90\x8e\xd2\xeaOl9e\x80$\x0a\x9an`\x08v\x97\x8a\xd7\xe2\xf6\xab\x10\x0f\x88H\x14\x10\xab\xd6w\x9f\xe4\xf4\xaa\xbb\x159\xbb^\x9d\xa9\x22\x04\xf6\xe2\xe5\x8b6\x0f\x1b\xee\xce\xdbO\xda\x91\xdbOX\xdf \xc6u\xec\x16)\xc9\xd3\xc7?zR\xab\xe2\xd0}\xdeu\xd7}\x8c\x93rU\xe4-\x1d\xa4V\xb3\xc1\xdf\xf6\xda\xe3\x1f{\xb1\xff\xcf\x7f\xeb\x7f\x9b\xfc\xaf~\xf2\x7f\xe09\x99:z\x9f\x1d|\xd7?\xb5\xd9?\xf8\xc5/\xaa\x01\x9d>\xeb\xdc\xa8\x18\x1e\xf4\xcc|\xd9\x19z\x9f\x936>\x86\x1dD\xbal\x8b\xa5e\xa8\x93\x03\x18\x12\x03\x0c\x00\xbe\xe2\xf5o2\xb4\x85B\xc2F\x91\xc3l\xc0\x96jl1b\xc0\xea\x0av U\x90A*\xc9.\x1f\xf9I\xae?c\x07n\x1f\xb0\xfe\xa1\x82\x9df\xc7\x0f\xd7\xcd\xb6@,\xe3\xa3\x13PF\x836\x87\x90}\x0b\xb9Mb\x8by\x87\x96U\xb2\xcc\x06\x84\xb2\xf2m\xd4\xa8\x93\xe4\x07\xf6\x14\x8ah\xc3\x81\x02\xaa\xaee\xe6;\x12\xcaY@\xbe\x84&[f\x0a\x0a\x035\x03\xe6\xfdv\xa2j-\xa8\xb2\x0aZ\x9c\xcd2\xec1\xa4\xe4\x09X\x5cl\xc8m\x0b\xb6\x9fU\xb0\x1f\x92\xed\x10;\xec\xc1,\xc0\x1eJ#\xcfz\x98\x1e\x83\x15\xb6\xc1N\x17J\xa4\xca\x9c\xdd\xd8\x06\xf9\x0c\xe6liCBe\xbaI\xf6ePw\xa9\x02\xc8\x04\xfb5\x09\xcc\xb3h\xb1I\xf6%\xf6]\x03\x1b\xb7\x9a<\x0e\xd0/[mT2\xc8\xd3\x04\x22\xc8\xbf\x83\xa8\xa6\xc5Z\xca\x86\xb8&\x1a\x08\xdda\xdf5H\xa0u\xd2\xc4\x9e\xa9\xaa:\x02\xf87`I\xcax\xdb\x01g<]5\x1c\xf1\xfd\xce\x81\xda\xfb\xc9\xd7\xa8\xf2h\xad*\x09W\xd6j\xcc*\x8b\xd7\xa0\x1b\xff*\x1e\x8aK\xebSK\xda\xf3\xe8\x99\x8c\xfe\xd9(\xbfJ\x89CU\xb2((\xcajE\x8e[\x9b6\xcc\x98>sz\x11U\xcc\x018)\xeb\xacy\x145\xaa\xd3\x01\xbe\x88\xeb\x01\x17Dk\x9c\x96r\xe59\xaa\x97ok(_\x1ad\x92\xce\x85\x0f\xea\xab\xbb\x82\x987>G\xbd2\xbb^\x86\xc7\xa0z\xadt\xb4\xc7\x1b\x8d\xb1(\x9b\xdcW\xbc\xe2\x15v\x08\x96\xbe\xee\x1fx\xe0\x014\xd8\x869\xf5t\xd9\xd5\xab'''=\xfe\xc4\x89\x13^\xbe\x14\x0e\xe6\xe7\xe7\xfd\xf4R)%\x88\x05\xa7?!/\x05\xd5A\x9ao\x97\xe0\xd4\xa8OC\x85\xf5\xe6+\x1d\xae\xdd\xee\xf8\xcb\xfbB<{U9\x8e\x0b\xd7\xe8i\xe7%\xfe\xc6\xae&\xc79\xc3\xeb0\xd1\x98\xec\x1a\xbfx\xc2*\x09A\x0b\xa5T\xc1p\x0b\x17\xf3\xf9\x03\x93h+\x91@\x19\x84@\x98\xf4\x81\x9d\xa6\x94\x9a\x1cB[1\xf2Q\x01\xd1\xc4%\xde\xf3DWM2\xddv\xe3\x84\xcc@@\xa2\x96\xf8\x0b\x9ao\x9a|L:\x91/\x8a\xd7$b\xf7\x9e\x10CY\x83J\xf1R\x99\x95\x22\xc2\xe3\xcf?kkh\xc4\xddu\xea.\x1bD\x0e\xa4\x1d\x8f\x82\xaa\xe9sO\xf7\xfc\x85X\xbd\xe9}\xee\xbe\xf1\xbb\xee\xa3\xe7\x09\xa9\xe3\x1c\xdd\xa7[\xe8\x8e\xce3ty\xe1\x1c!\xaa\x98\xfd\xe3\x7f\xfd@\xff\xf1o\xfa@\xf1\x9b\xde\xf0.\xd5q\xfc-?j\xe5\xd3\x8f\xd8\xdag\xfeL\x8f\xfb\x0bq\xa7\xf5\xa4\x0et\x8cz6\xee\xc5\xee\x9d\x92\xc5\xb1\xe1>\xc1b\x9d\x84\x0d\xb6\x0a\xc5\x8c\xc5=;\xf3\x16\x94\x82x\xef\x02%Z\xe8I\xb1\xb8\x98\x04\xe2\x14\xc9\x10PA\x16\xe2s\xa55\x10\x14R\x90\xbeA\xa8\x094\xbc\xfarv\x91\xd3(\xcfq*\xe8\x1a\x82\xf6\x22\x14E\x05*\xe2\xc2\xc2\x05Gb\x19\xd4\x9f\x0b\xe5\xa2\x8d\xe3U:\x07\xf5\x22\xc0\x98)\xa0\xb2\xcc\xe0\xe7\xa0\x1e2P\x13u\x00s\x0aV\x1a\xbafTT\xdf\x02\xd91\xa7\x04\x1a\x5c\xdb\x8d\xfb\xac\x94\x02a\xb3HqE\x0a,TS{\x22R\x22\x05\xc2v\xa8\x01\x02h5@\x1e\xb44K}%[Jn\xa3=\x87\xe6\xdd8T\x15x\x01\xd9\x0eZhl\xa0\xa4\xfe\x8b\x88\x91%\x02p\x94D\x1d\xc4\x22\x8a>)v\x1b\x94J\x8av\xb7@\x22\x9a\xdb5\x8c\x16k\xd8#\xe5\xb0)J!\x83Z\xc1pt\xbd\xc5I\x9b-\x141\xe8\x9c*\x1eD\xb2\xd8/e\xa5\xad\xc7\x08\xa7a\xf9i9H\x8c\xb4\xcdU\x94\x1a\xccFU7\x04\x06B6K\xf4n\xe79~u\xbd\xab\x03v_\xd3J\xa5\xdc\xe1_\x9cG\xa3\xad\xd75q\x1f`o6\xd0<\x14\xf7A\xc8G/\x1c\x0e\xd0^g\x93\xeb\xaa\x8cTTc,\x96}\x03V\xf9\xca\x959\x0cB\xcb6\x7f\xb6\x82\xc2\x08\xf6G\xd5\x02\x9a\x8b\x8bn\xd7%\x04S\xc5p\xb7\x05\x1b\x12\x1c\x0eb\xa5\x8f\xc8\xdf\xc2\xba\x5c\xdc\x11\xd5\x0fQZ\x88\xf3\xef\x10\x17\xa6M\x5c\xc5]W\xf5\x88\xfezgf\x9c\x84\xfe\xa1\x821\xb2\x09i\xf0\x88\xc2\xe6D\xd4\xca\x993g\xec\xc0\x81\x03v\xfe\xfcy\xbb\xfb\xee\xbb\x1d\xb1T\x80\x81R*\xd0\x9f\x82\x0e6|\xd7\xbb\xde\xe5\x14\xce\x07>\xf0\x01\x97\x05\x05D\x17\xbe\xa1\xf2\xb5\x8c\xd4\x06\xb1\xef\xf4W\x01\xf9\xee\xb1\xb4B\x86\xaf\xc1o@\x8d_\xe4\x87}\x80\xc9\x1b\xae\xd1\xd3\xceK\xa7\xe48m\x88\xd8\xf5\xa4G\xc7<z\xdb\xfb.\x0c\xfa\xca\xdc<\x82\xe00\xc1\xf4:\x9aZ!-\xcfZdZc1Y\xed\xb3\x94qWI\xce\x97\xf5\x91V\xd9\x8aT\x01LJ\xcddM*E\xf1\xe7Zp\xfeN\xf1Qf\xff\x02\xd3\x9e]\xa9\xfbH\x12\xd2\xd1\x1f\x0b\x97(\xa7\xd2\xe4q\xf8\x02\xbb\x8e\x87\x9ex\x8c#t\x17\x10v\x927j\x83\x8a\x8bC\xcf\xadG\xe99\xc4u\xdf\xf8]\xf7\xb1\x93..\xe3\x16\xbc\xaa\xb6,U\x04\x16f\xcb\xfc-\xbe\xf0\xaf\xde\xf5\x81\xbe\xc5\xd3\x0b\xdc{8\xf4\xf7\x7f\xd9r\x07O\xc6\x8f7w\x8d\xd6\xad.{-\xe1\x10\x19'\x8a\xafZ\x98\xd8\xfbg\x0b\xb0\xa4t\xaad\x05Eev~\x80m\x1f\xb7\xcc6H\xa4l\xeb,D\x8dT\x12VU\x02`\xbe\x0d\x10\x9b]Z\xb4\xa7\xe6Kv\xa9\xcc\x98\x02h??\x0b{\xe3\xdc\xaa-\xacA\x19\xc0\xf6\x95m\xd0|i\xd1\x968\xd7~\x09W2\xcb\x1ca<\x07R8\x8bV\xda9\x8e\x1b\xbe\x80\x22\xc3\x05\x0c6\xb7\x91\x87\x08x\xd5\x11\xc8\x0f!\x979:\x82\xd7\x0c(\x94>\xe2\xddI-U\x85Fqd(\xcd\xac\x06^\xd9\xd1op\xed0\x18d.0\x0f\xfe\x0b$\xf0\xc7]\x0e\x86\xacB\x14\x02\xa2\x93\xc5\xa6\x1d\x1c\xac\xd9$\xf8\xbe\x1fM\x06\xe4\xff\x96\xad\xb4m\x18\x96\xd8\x04TS\x11\x8d\xbe\x14\xf2\x9e\xd8\xae\x03ZE\x05#\xe3\x80Z/\x14a'bW\x84Al\x83\xcdRec\x05$XwWSB!\x1b\xd9-\xbb\x92Z\xb0U[dnR/\xea\xbc\x85v]%\x85\x06\x1b\x08\xaa\x04\x12+\xa14\xb1\x0d\xd0w7>Pv-\xea'\xa4\xae\xe0#\xd0\x03\xdd\xb4&\xf7\x13\x1c\x08\xb3X\x84\xc2\xf4\xcf\x11\x91\xd6\xa8VH\xb4\x88\xb4\x11l\xca\x910\x88\xb0\x09\xe5\xd9\x10\x1b\x11\x0eE\x13\x0c-e\x08g\xbdiSI\xcf*\xad\x90\x90\xe2\xea\x92iQ\xbd\x0c\x9b\x8f1<\x08\x94I\xbf\x09\x92\x1e\x9b\x1a\xb1\x92\xa8\xdd\xccA>!\xb5w\xd0\x0f\xd8T2_QpR.\xd17\x9a\xc4\x8b\x9d\xe7\x0aIT\xc7\xaf4*\xd4m?\xad\xdb\x99F\x88L\x88$ \x1e\xbd\x0bl4\xb1\xcb\x14/\xd6\x98\x14\x09\xf4^T\xcc\x1dw\xdc\xe1\xe7I)\xa5\xd7\x91\xba\xc9\xaelff\xc6\xfe\xfa\xaf\xff\xda6#o\xeb\xdd\xf2\x189\xef\xf8\xd0\xf9\xa2~rlfb\xeaQ\xe5|%\x83\xbe\xaa?\xaay\xddpc\xc4\xa3\x09\xe1m\x08\x0d\xd9]Z\x1c\x1b\xae\xd1\xd3\xceK'K\x9c6D\xf4>\xa9\xb3\x10\xa8vRvo\xa4\xcd\xb2\xb6\x8eu4\x80B\x02\xd60\xbby\xdf\x9b}\xe7CO\xf1!Q\x9cT4\xd1\xd5!\x8a\x0b\xab& @m\x85Y\xe4\x09\x91\xad\xa8p\x065N\x01(x\xd9\xc4K+IR\xd76\x00Kq)\x80\xd72n5\x1ey\xf6Y4\x9a\xc4y\xea~'Z7\xfe\xd9\xb8\x1eW\xd7\xa1\xfb\xc6\xef\xba\x8fW'?\xbe<[\x00\x00@\x00IDAT\xbd\xf5bT[\x09\xba\xd4p!\x9f\xa5C\x0f\xff\xe1\xe3\x8d\xc5\x0b\xdc\xd2M\xc8\x13\x8e\xfd\xf4o\xc3\xdeAh\xb2\xaf\x10\xfaN\xbb\xdc\x10t\x8d\xefw\xde\x86\xe8\xf8\x1d\xd5\x88n\xb7PH\xa9\x94\xdb\xb8\x81\xc1\x18\x19\x16\xda\x15\x16\xe7\x1a\xc7\x22\x97\xf1\x020_fW\xb9X\x82\x92\xe6\xdc{v\xe7MQ\xb2\x8c\xb1\x00J\x15>\xfa2J\x05g\xae\xac\xdb\xb3\x17W\xed\xe2\xfc\x1anv\xc0\xabh\x80\xc9\xee\xa6\xc8\xd8\xdf3:fw #\x9a\x80\xb5:2X@\xd9\x04\xa7\xb6c\xfd\xb66\x90\xb5\xc5\xbe\x14Zo\xb8wA\x13m\x0c9\xd1D\xa1\x81\x0a2\xc8\xa7\x00\xab\x0ccL)\xd0\xa8N2\xe4lC\x0dI7L\x86\x90\x95\x91\x22J\x00\x18\xaa\x02t\x13\x00\xf1m\x00\x9e\x0cT\xdb\xb0\xfe\xe4\xfa\xa5\x05\xb0\xaf\x81 \x92\xc8\x9c&\x06\xb6\xed\x10J\x04Gr\x9b \x1f\x10O9c\xa95(\xa1\xad\x94\xf5W\x11j\xd7$\xcb\x01\xf1\xd0\x1d~Z\xa7\x9e(K\xedk\x8b\xa2\x82e\x97C\x89\x02\x157\x80C\x15\xca\x8c>\x00\xa9m\xa3\xe4\xd0\xe6\xec\x22\xc4:\xd4\x95\xb9\x0d\xc0\xadCa\x94\x99\xc0e\xea,5\x865\x00<4\x12\x1e\x160b\xe5O\x08g\x9b8Y\xf4w\xc7+\x1e\xb5@\xa7\x86\xa7\xeb\xff\x8a2Q\xfd\xb4q\x14\x80\x14\x10\xf5\xfbx\xf10\xaeB2b\x1b6P\x92h\x81\x1c\x1al\x04\xa4\xa5'9\xadS'\x8eh\x84\xac\xe8Ci+jV\x92\xef\xca\xe5\x05\x0c\xd2\xb1\xe9\x82EZ\x18\x18\xb4|\xdf8\xc0\xbaf\x97\xce<\x8f|M\xf6G\xdb\xaco\xda\x0d\xa4\x94bG\x0d\xa4&9o\x13\xf9\x8f\xd8\xee\xfaV\xa8\x9f\xde\x07d\xd6\x05\xf2\xd7o\xd7\xee\xb7j\xce\x16\xf2\x16\xb1\xc3$\xf8W\x90,F\xb2\x19ytW\x9c\xe42\x9f\xf8\xc4'\x1c\xf9\x88\xcd\xa6\xf4R\x9d\x96|\xe7\x83\x1f\xfc\xe0\x8e\x22\xef\xbc\xf3N6#]\x10\x1e\xd7+\xe0~\xc1T\xba\x80\x1fq\x8e\xbejA\x8dT\xdf\x0b\xdb_'\xec\x8b\xd5\xa6\xfca\x1c\xc3\xef\xee\xf2\xe2\xd8\xf8\xea\xefw<ts\xec\x8c\x0eO\xfa\x8d\xa1\xc6\xce\xf7\x00.fO\x19VGei\xd5\xfa\x8f\xceX\x89\xc9\xe0\xe9\xf5\x132zn\x7f\xf0\x09\x1b=\xee\xd1\xd7\x1a\x22q\xcb\xe2 \x9d\x16\xb9\xd7p\xbe\x07@H\x07t\xc5>\xae\x5c0\xaeNd\xd0\x94E\xac\x07\x919~\x88\x97\x160\x9aK\xaeR\xcdd\x91\xf08\x0b`\x11\xdf\xd6\xd9\x01^1U.|\xac{\x17\xf7c\x5c\x83\xde\xe7n*\xbf\xd3\xcf\xd7OPme\xfe.\xe5\x82\xcc +z\xfd\xf7\x7f\xceF~\xea\xf7\x9d\xc5\x93\x9b9a\x87\xff\xc1\xffj\xe7\x7f\xed\xc7\xf7\xd1\x22\xed\xb5\xd5o=\x03\xe5\xfd\xd9]`\xbdo:\xf7\x22A\xa3P\xc5n!\xcf.o\x18\x8d\x9e\x1al\x96\xb9Md=\xda\xf1\xe3Re\x89\x0dBE4\x1a\x14B\x931u\x03R\x00\xaf\xe4\x15RBi\xb1\xd3\x05v!\xa4\xd2\x1fc\xcb\x9f(\xa2\x01\x10\xd4\xb7\xc2J=:8bK\xc8_.\xf4\xa3m\x09\xe0\x9d\xc0\x05\xd3\xfc\x00\xb6\x12\xec\x9e\x0b}(#\xa0@\x90\x00@\x1e\x9c\xc6A)\xf5X)a\xc9.\x0a\x0c\xf6\x9e\x9c\xd4\xca\x1e\xa7\x00\x85\x94(\x0e\x82\x19\x00\xf0\xb0\xb8\xaa\x08\xbd\xf3\xecbs\xcc\xa3-6X\xeb\xf8\x1b\x93\x9b\x97\xac\x0cH\x01\xb0r<*V`\x02\xe3\xd3\xbe,,?dB\x17\xd0~\x98\x87}\xc6\xe6\xdd\xd2PDm\x10\xab\x8c\x06S\xb0\x87\xd2\xc8qRPW\xdb\xc8|\xa4s\x9c\xa4\x9em!\x08\x017\xa8\x9e\xdc\xc1i\xab\xc3V\xec_\xcdp\xe0\x22\x0ey)\xbf\x82\x06\xa0a5\x8fUbXJ\x12\xba\xaf\xac\xba6X\x85~!\x91h\x910*x\x7f\x90\xbc,\xe9q\x8c\x80\x00[g\xbeF7\x1a\x18\xca\xddO\x10\xc0\xf4\x7f\x9e\x95\x1f])\x9bJ\xfb\xad`\x80\x8c\x5c\xabl\xea\xf0\x0d\xe8c\xd4\xa4\x8fZ\xf4I\x93\xf1jI\x01\x83:\xea\x14\xd7\x80\x84\x94W\x14g\x1d\x8d\xbc\x16\x14\x02\x08Rl4\x10\xb0a#\x95/4\xad\x1f\x85\x8c\x1c\xc8\x1e\x01\x16\xf1\xea&\xfc6\xd60\x1e\xa6,\x9d\xa1${\x9c\x80|T\xb6\x10\x10\xadW}\xf8\xbb\xd9\x10\xf2\x88\xb2\x81\xcd\xc78\xbb'\x0c\x90\x9b<\x1c\x08\xb1(8\x82\x10\x82\xe7y\x10\xb79b\xbb\x09\x19\x09\xf9\x88\xb2\x91f\xdb\xdb\xdf\xfevO\xab6\x0a\xe1\xdcv\xdbm\xce\xa2S\xfd\xf4\xac2\xc4\xb2\xcb\xe3\xbdB\xdal\x0aBd\x9b\xcc\xf9\x9e\xe5\xe1\xf1_\xd9\x9f\x1b\xf7\xd1\x0d\x11\x8f\x17\xa1\x9fhn\x85}\xcc\xd5\x13*J\xe2\x13(\xbc\x0d\x19\xe2\xb9\xd7\x9b#N\x1b\x1a\xef_\xa0c\x02\xe0\xe8\xbe\xd3D\xf7\xcf2+P2\x80\x14\x9d:\x0c\xe2\xb9^\x8f\xd1\xf1$\xf5|J\x16\xf8\x9e\x02c\xd4\xda_h'Eq|+\x0d\xdf3\x83}F\x9a\x89\xac\xb3vX\xaa\x00\x19\xe2I\xa7\x89\xeeA\x93\x8c2U\x0f\xad\x06\x01\x22\xd5\xd3\xa93!\x22\xfe\xe4B%\xcdd\x1aE`{br\xdaNML\x83\xebC\x9b\xc2\x0a\x8a\xfa\x81\x12\xb4>\x15\xbam\xdc\xfd\xdc}\xd3\xbd\x0bi\xbe\x0e~\xb5\xc5\x91\xacg\x95\xc5Ri-\x9c\xb3\x8b\xbf\xf3sv\xf4\x1f\xfe\x1b\xaf\xfa\xd0+\xff\xb6M\xbc\xf5\x1f\xd8\xfc\x9f\xfd\xe6\xf5\x9b\x12\xf5\xd1\xeeD\xd7\x88\xde\x91Li\x9c\xb5\x0a\xd0.\x82\x04\x860x\xdc\xc45Mu\xb5l\xab\x18B\x8am\xa2J\xca%RB\x7f\xeadv\xf5\xda\xe1\xea/\xc9N9\x07rHC\x8dhah\xca\x0c\x14\xa1l\x18\xdb\xe3\xa8P\xbf\x1cd\xd1\xae\x83\x04\xd0t\x1bA\x88?\x82S\xd1\xe1+\x17A m\x1bBp}\x04\x0d\xb6\x1c@mi\xb9\xcaQ\x199[\xc0Qh\x199P\x1aKP\xcc\x81PF\x80\xd2A\x0b,/\xfb\x91\xc1a`#\x9au\x08\xf9\xeb \xb9\x94kX\xb5Pr\x80\x9a\xc0\x95S2\xcf\xf9P\x00\xc7\x0d*!\xb5\xeb\x9a\x10\x0b\xd7\x12\x93h#9l\x8f\xf6\x1f\x02\xa1\xe1W.S\xb6!\x10\xd6\xb0v\xfc\xc8>r\x08\x1f\x8a \x9e~\xb4\x1bj\x00e\xa9>\xc3\xc9c\xf3\x06A\xca\x5cO\xf7I\x09\x86\xef\x81\xb4\x86aG\x1eC\xf1@e.\xf6\xd36\x80^\x1f\x00:\x05\xbb8!\xd7B\x18\xaf\xcac\x80\xdc\xd5\x80\x1f\x01\xd0a%HB\x15#\x8a4J\x16\x8e\x1f\x85\xa8\xe2u\xd3\x99\xffD\xed'\x08\xa0ka*pQ\xd9Bl\xf2\xec\x10\x02\x1b\x04\xb1.Q\x87\x96Q\xac\x9c~\xd6a\xfd\x89\xe5&\xaaM^\x9d\xc5\x1a\xd3\xf1\x0c\xd2bu\xf5a\xaa*\xe7\xa1\x8d\xda\x15\x9b\x9c:\x0e\x00\xde@\xc6\xb3\x0c\x9b\xad\x8e\xb6\xe1\x18\x0a\x22P\x99\xb4Q\xec\xcb\x16HFk\xbb\x81\x0f\xbe:e\xd5q\x06Z\xc3\xa3D\x1bd'D\xd4a\xdd\x89\x95\xa7o\xa8\xc1\x12\xf2\x00\xcd\xf7BD\xbd\x08*\xbc\xd7&\x00$\x09\x82\xe8\xc3\x13\x8a\x90\x83\x14\x06\x14\x17`Th\xa5\xd2\x0a\xa9\xc8o\x9bXo\xd2`\x1b\x19\x19\xb1\x9f\xf8\x89\x9fp\xcaH\xf2\x1f\xb1\xe1\xa4n-\xaaINE\x95_\xe5*H\x963==\xed\xec\xba:\x14\xad\xda&V\xdc \x1a\x90\x1b8\x0au\x11c\xf8\xd4\x97\xfc\xab\x91\xd9\xab\xed\xfb-\xf8\x86\x88\xa7S\x90\xbe\xc4B\x0c\x97\xe8\xa1\xf32\xdc\xc4\xb1;\xd2D\x91\xf1\xbb8\xcb\xceg\x80\xba\xa0\x86\xff\xc4)\xbaW\x19\xd5\xad2\x08G\xf0\x1a\x9bbA26!(\x0f!\x5c\xf4K\xa9\xba\xf0' \xafoH\x7f_\xc8O\xbcU\xa99\x16\xd9\x0dL0\xf83,\xfc\xc3\xfc\x0d\x16\x0a\xf0\xcd\x07l\x80]\xa7l$\xdc=\xbc2GAwa\x22Q\xbd\xb8~D\xfa\xae\x5ce\xf3^\x08\xab\x08P\x91\xcf7\xed\x0a]\xe6\x14\x17\xe0)By\xbdm\xee\xbdW\xd2\xee\xf3^w\x9d\xc2n\xf5\x1b\xd1\x12evl\xdbB\xee\xab\x7f\xfd!+\xdc\xfe2\x94\x0c\xfe\x1b\xaf\xf7\xcc\x0f\xfc\xbcm\xbd\xf8\x18\xdb\xb0\xcb\xd7iG\xe8\xab8Ax\xd2\xa6\x84;\x7f\x08\xf4P\xfc~\xf7UC7\xd0Wg\x81\xc3fC&\xb3\xca\x9c\x91K\x1b?\x5c\x10\xd9F\x12J \xc1U~\xac\xe4\x89XBj!\x1di\x8aM\x0d\xa1\xaa\x9c\x94\xec\x07\x80\x04\xc0\xe9o\xf6\xdb\xc1\xe1\x19\x9b)\x0es\x06\x13\xaa\xc7T\xa0\x01R\xc2w\x8cS\xb8\xa2z\x07\xa0v\xca\x97K\x96G\xce\x92Z\xcf\xd9\xc1W\x1cBP]\xb1\xf9%<[\xb714\x1e\x9cB\x05\x1a`\x82<$\x0f\x82\x02\xc2\xa1\x9a\xccwF\x99k\x08\xb9/5\x0a\xeeE\xa1\xa6\x1d;@\xb1\x05\x02\x92Ve\x1e\xe0_\x84E\x97\x05\xb0KW\xb2\x82\xe3\xd0\x06\xac\xb7\xe7VR\xb60v\xbf\x9d-\xdeo\xe9\x8d\xe7Pnx\xc0\xca \x916,\xb4>\x80\xf0h\xaef\xa7\xf2\xc8'p\xa7 c\xd2\x86\xdc\x031\xf7\x1b8=-\x03\xbcu\xdc\xb6\xcd\xb1\x80\x00V\x03\xb4\xa9\x9f\xbc\x97\xe8\x83\x1c\xbb\xebQ\xae}\xc5\x82\x93\xae\x17\xa4}'\xd5<dW\xf2w\x06\x19e\xfd\xb0\x0d\x05\xa4k5\xb9\x18\x12\xa2\x13\x8bMk\xcd\x07f\xf7PD\xe3uu\xf4\xee\x18\xad\x17\xb9\xcc\xd1\x22\x10\xd2\xf1\xff<\xfb=\x89e{\x97\xa7^\x83\x00Zq)\xaae(\x17\xda\xd5\xd2Q\xc5\xb4-\x01\xd2c\xafOz\xeaG\xbd0\xa2r\x04\xb2\x89\xe3\xde\x22,Pi7\xb7Q\xfch\xe1\x9fn\x08\xb9I&\xc9\xfeH6< \x0fq8\xa0\x11}CP\x85\xad\x96\x90\xfcHsBH\x88\xf9!V\x9e\x80x\x9b\xab\xea\xa1\xf4\xd2\xaaK\xa0\xfd\x08@\xa1vq\xdb\x85\x94B\xcb:\xac\xbf\xe8Y\xac:\xc9o\x8alb\x84t\xc4Z\xd3U\xfd\x16l\x81\xe22(\x978\xbd\x13\xc5s\xee\xdc9\xf7\x5c0\x87\x09\xc7{\xdf\xfb^W\xa9\xd6;!\x9d\xd7\xbf\xfe\xf5\x0e\x97\x0a\xc0/)\x1b\x08\xe9\x08\x91IF$\xad8\xf9v\xebG\x93S\xe9^<s\x96\xba/9cgw\xdf\x7f\xad\x9eo\x88x\xa2\xbe\x0b\xf5\xd3\x03}\x14.\xd1\xc3\xae\x9a\xc7\xb1;\xd2D\x91\xf1\xbb8K\xef\xb3:<t\xbfbw\x05^l!X\xac\xae\x95\xac0=n\xab\xf0\xd1}\xb2G\x05\xf8\x00\x92F\x88\xa1\x8dv\x91\xb6\xb2\xa2J\xda\xec\x10\x1d\xeb\xb0p\x06a\xbd\xdc\x81\x97\xdd\x97\x1d>b\xb7\x8fM\xb9W\xea>\x04\xc1\xfaf\xf8b\xfc\xddP\x8b]5\xf0A\x8b'V'E\xe7&\x94\x11\x1c\x07\x86\x9cQ\xd5\xa2b\xa2'.~\x17\xe5\xdb\x99&\xae\x87\xba\xb8\xfbF\xdf\x8c\xbf\xbb\xbbN\xb7\xe8s\x9d\xc5\x80\x11?;B\xc2\xe5?\xfc\x97\xd6\x7f\xdb\xfd\xd6\x7f\xf2\x9b\x1d\xe8\x1e\xfb\xc9\x7fkk\xbf\xfec\xd6.-\xdd\xb8\xfa\xdeO\xdd\xbe\x08\x19\xa2\xce\xf3Kt\x1f\xcd\x1c\xbd\xf7]#\x12\x89\x85\x8d\xaa]^\xae\xd9\xfc:\x14\x04TFZ~\xf74\xde@!\xc9M$\xa8n\xb2\x88%\x9c.\xc2b:0=\xc3\xb1\x16u+T\xce\x93\x17\xd9\x06\x88ixp\x1a\x7f}\x93h\x9b\xf5\xd9\x0a\xf2\x9b\x14\xac\x19\xb1\xc3\xea\xb8\xc1\x11\xd5\xc2r\xb7\xea\xf4\x01+V\x91\x0d\xa0b\x9c9q\xd0Ff\x00~/p\xb4\x00\x8a\x07m\x10\xce\x10T\xd2\xf0(\xdad\xabk\x96\x5c\x5c\xb7\x1a2\xaf\xa1I\xceo\x1a\xc6\x13vj\x1b\xb6\x1a\x8ep\x1b 5v\xec\xcd\xea\xba\xabP\xa3\x8f\x00nCk\x0d\x8a\xa7?\x8b?6\x90P\x05 [\xaa\x17l!\xfb\x12\x9b+\xbc\xd1J\xd9c(\x15L[j\xe93\x80\xdb\x0d[\xc6\xf6f\x8c>_\x07 \x9fB\xd3\xed6\x1b\xb4Y\xf8p\xa5u$I\x00\xca|\xa6\xcf\xca\x9b\xebV^\x83\xdd\x07\x92\x93\x07\xed:k\xe4\x02\xe9\x05\xb8\xef\xc1Vg\x0a\xa3\xd5\xf9\xd4\x98-@\xe9\x18\x88G\xe7\xdf\xe8@\x11Q\x00m\xa9T\x93^\xc6\xb6R\xdf\xd6\x14\x15\x95B7uao\x18\xa0\xceo<:\x9d\x88k\xde\x04\xa0\xad\xb1\xd3\xdc\xd7\x88\xfb\xeeR\xfb\x0d\x05>R\xc3\xd7\xde\xea\xc2s\xacC\xea\x8d\x92\x03\xd8\x14uq(\x15`A.\x05\x95V\xa0]\xc8\xea\xf2\xd4o\x95\xb4/<\xf5(\x1b\x0b\xe4\xc2l\x80f\xcb\xcf\x93<\x81\xed\xd6!(>N\x10\xeeC\x0d\x9e\xd1\xa31|Fl4!\x006'R\x5c\xa0\xef\xc5\xe2R\xdd\x05\xe0\xd3P\xc6\xd0\x88\xd6\x00Ig\xf3\xdb\xd6\xc7\x9ciT\xb1g\xa2\xedJ\x1bv\xfd1\xd2\x09WQ \x14\xa1\x8a\xfb\xda\xddf\xaei#\xa6\xb4\xf2\xaf&\x15g\x87Y\xce\x0e\xd2.:\xec\xa4\xb5\xa1\xd6\xba\x11\x95\xa22\x9e|\xf2I;~\xfc\xb8\xd7G\x08G\xec6Q4b\xd1\x09\xc9\x08\xe1\xdc\x7f\xff\xfdnP\xaa{QS\xfa\x86\xe4FR\xb9\xbet\xe9\x92\xb3\xf5\xd4\xb6[-\xdc\x10\xf1\xc4\x15\xf6\xc9\xc0\x83\xb3'\x18\x95\x00\x0e\xc2o\x9c&\xbe\xc6\xb1;\xd2\xe8\x81\xa0\xbe\xee\x9d\x90\x8af\x0c\x99@\x11\xe2\xf1\xc1\x88\x12\x87\x1c\xfe\xab/.\x83\xf9\xc7g&\x10$\xb0{QEH\xebz\xf0,\x08\xd7wT\x14\xb7b\x95i\x17\xc5K\x15l\xdf4u\xd8\xbe\xe3\xb6\x93v\x02\xbfk\xfd\x00\x1f\xcd\x06\x0d\x85\xfb\xae\x8aJ\xf7:u*\x16#\xc1\xe8%\x17\xa5\xef\xbc\x8e\xf3t\xaa\xc9\x9b\xe8eo\x1a\xbd\xee>\xb7m\x09\x1b\x82\x7f\xffT\xd3N\xaf3ioj.\x88\x83\xb5#\xfc\xccK\xfe\xc3\xc5\x9f\xd9\x11\xf3U\x7f@h\x10B\xa7\x17\xe2gx\xd8\x88N\xa2\x96\x03\xe4\xce\xfe\xea\x8f\xdb\x9d\xbf\xf4\xffXzh\xdc\xff\x86~\xe8\x7f\xb4\xd5\xdf|\x8f\x03\xbc\x9b\xaf\xf6\xce^\x0d_\x09q\xba\x17\xd8\xba\x08\xb5Q\xc7I\xe6\x06\x0a\x04rt\xd9\xc6\xca_\x00D\xec%\xb1J\xeb,|g\xaf\x89\x02\x80u39}\xd0\x0e\xcd\x1c\x84Rj\xda!@m\x1e\xd5\xdb\xc5\xf6\x88e\x87\x8f\xe0\xf9\x19\x19\x08\xc2\xf6\x81\x11\x94L\xc8\xdb\x802\xca\x22\x17I5@`\x94S>p\x08Uj\xe4\x08rqs\xcfq\xdb\xd8z\x0aJ\x0b\xd6\x0as\xb3\xc0\xdc\xcb\x83|\x0a\xc3Ej\x85\xf2B\x0dU\xe7\xe2\x94Uq\x035\x87'\x83&\xcf)\xdc\xe0\x0c2\x97\x87\x06\xb1\xfeo,\xd9\x16|\xb7\xa1\xf60F\xa1\x00R\x04\xdfM\xec\x90\x92\x09\xce|\xca\xdfg\x97'\xdfl\xab\xa3wC\xe1\xcc@\xa1`\x1c\xcb\x19<\x19\xea\x02\xe4\xc4\xd4\x07\x95Y\xdaw\x1e6\x12\xd3\x0cE\x9c\x06l\xc2\xc0\xe2\x11\xab(+\x16\x8fd\x22\xc814\xf9\xd2\x18\xa8n\xf2\xacC\x0d\xbf\x05V\xcck\xb1M*\x15F\xed\x89\xf4\x11\xab\xcc\x9e\xf1a\x09g\xd8\xa0\x16\xae\xa3\x05\x00\xe8\xd5mZ!\xe8\xc8\x82\xd5\xbeBrO\xf5\xb7\x14\x11\xb4bt\xff\xc5\x04-U\x07\x8eZ\x97\x0c\xa2\xaf]\xee\x15\xaf \xd8\xd0\x92\xa2E\xe9\x0an\x83\xe8\x17\x00\xa9\xc6Z,Q\xed3u\xc2\x01\xdd\x08\x80\x96\x17p(\x86\x01\xbc\xcd\xc3\xf6\x5c[\xaa\xda4\x96\xfe\x09Q\xa9\xe48\x8e\x86X\x1e\xe0-\xf6\xb8T\xcd\xe5\xd5$\xb4\x07\xf6:>\xf8\xb2:\xcc\x11%\x92$\xc8\xd7\xd5\xee\x05\x93\xc4\xe5\x10\x82\xe5O\xc7KH\xfd|\x1b\xef\x15%l\xf8\x9e}\xfc\x09g\xeby=\xbd\xbe\xfa\x0e\xd4 X\x87b\xfc^\xc8I\xc6\x9f\xa2L\x84P\xf4\xa7.\x0c\xc2\xf7\x80\x8c\xa8\x8e\x07!\x0dqf\xe4\x16I6;\x9f\xff\xfc\xe7\x9db\x11\x02\x94\xa7j\xb1\xde\xa4R}\xef\xbd\xf7:\xf2\x92\x0d\x8f\xe4A:BAi\xc5\xa2\x93\xfcHr\xa2S\xa7N9\xe5\xa4o\xf7B\xa1\xf0\xa5\xaf\xfd\xef\xbe\x11O\x5cU\x1f\xc20\x8e>\xcd4\xdd\xf6jX\x1c\x1b_\xe3\xfcJ\xee\xb8eW.WY\xee$\xdau\xc3@\xe9\xfd\x1aj\xac\x07\x19T\x09h5\xd9\x15t\xaa\xa2\x5c\xdd\x07\x9e\xab\xd2\x85\xf2\x15->\xf1\xf1\x91q\xfb\xce\xbb\xee\xb1\x13h#\xa9\x9e\xe2\xf3\xfb\x9c\xf0\xdc\xdd\x1f\xafg\xa7\xb2ZBW#\x9f\xce\xeb([\xf7\x99;5J\xdf\xf6\xaf\xec*\x97\xc7\x06;\x92\xf7=\xd9\xb0\xe7\xba\x8e\xe7\xba\x89\xbe\x0e\xef\x9a\xeb\xcbORm5\xf7\xaa\xc0\xae\x8d\xb5\x1dV\x93\x16S}\xe5\x8a\x9d\xfb\xf5w\xdb\xed\xff\xfd\x1f\xd1GP\x06\xc7\xee\xb3\xe2w\xfe\x84m~\xf8W\x18\xaf\xbdF\xa3\xb7\xc8\xdd\xef\xf5\xbc\xab\x97{\x92h\xdc\x966\xd0\xd2\x02\xf1h\x97\x8b\x94\xddm[$\x1c&\x86\xdd*\xc0\x17\xe1\xbf\x0e\x08\x93\x00~\x02e\x81\x19\x04\xeb\x92\xf1\x19l\xb1\x14\x14\xcad\xa6\x88b\xc2A[\xaeA%\xc0r\x19\x9f\xc80\x8f\xcc\x1e\xff\xc4c\xa8Zo\xd8\xcb\xbe\xed[\xdd\xde\xa6\x84\xedG\xb6\x803Hd\x8f\xa2~$S\xa9&&\xed\xe8\xf1\x036>\xb2\x84\xe7\x84\x8am\xac\xce\xe1\xf5`\xc0\x12\xc3\xd8\xe9\xe4\x0f\xdb\xc5\xa1\x93vn\x09\x879\x8bxv\xc6\xd8\xf4NT\xa3_Z(\xd9\xd1\x93y\xfb\xd8\x03\x18{\xb6\xc7`\x05a\xe0:\x98\xb4\xd3\xcd#\xf6\xf8\xed?\x06\xca\xc2\x9em\xf8\x10@v\xd4\x8e\xac=k\x83\xc9\xd3\xb6\x96X\xc4\xa0\xe6)1\xf6\x99\xfe:*\x1e%\x86\x81q\xab\xcdL\xd9\xca\xc2\xbaePR\xe8K\x95\x90g\xd0\x06\x00\x91\x1cy\x16`)\x97\xb7@< \xd2&6I\xd2\x96\x1b`c\xf0\x9a\xb1Q\xbb\x1fO\x06\x8f\x0d\xb0\x9bn\x8fZ\xff\xdc\xb90\x97y\xd7DYA\xc0W\xec>Q\xf4p\x9d\x9c-&\x8f\x08\x02\xb0\x1a_q\x10\xbf\x94@\x11\xc0v\xadaJ\xf1?\x00\xb0\x90Ko\xb9\x92\xdd\xa0I\x97\x041\xfb\xca\xd7\x02\xd7\x82\xd36S&\x0c\xfce\xf0\xe5\xa6c.\x0e\x1c9jS\xb8\xb4\xaa\x81d\xfb\xf00\x0e\x99\x0b\x22\xa6h\xcd5\x869\x03\xf5\x22\x85 \xc1\x11\xdf\xf0\x82@e\x16!\xadA9 \xd5Q\x17b\xbb\xa3\x03\xe2\x9a\xadb\xa5\xab\x07<\x80\x18t\xa2\xe7\xea\xc5\xcb\xf6\xfc\xe3O\xc2\xd2\x0b\x88W\xf3NsM\x00\xa8\x06\x0b\xaf\xc5\xfcST\x0dv\x9d\xce:\xd2\xa9\xafk \x94*;\xe3 \xcf\x16b\x0d\xedT\x83t\xaf\xfa\x94\x99\x9b\xc7\x8e\xa14\x80\xff\xbe\xa7\xcf_\xb2\x07\x1e}\xcaYg\xb7\xdd\xf72\xe6\xd3\x16\xc6\xaf\x83\xb6\x85\x9a\xfe\xda\xb9\x0b\xf6\x7f\xfd\xc9\x1f\xd9\xcb_\xfer\x97\x17\x09\x81\xfaZ\x03\xce\x08\x01\x89b\xd2Ul\xbd\x8e\x88 \xb4\xe0\x96\xf8\xbdi\xc4\xa3Zk>\xf8\xa4\xd0`\xea>\xfa\xd5\xbb\xde\x10\xde)\x8d\x0f\x0b\xaf\xc8\xa0\x10\xbd\x88\xdf{\x5cg\x22\xf9SH\x13\xdd\xea\xa2\x8d\xc7f\x85E\xb3\x89\x00u\xb8\x1f\xdb\x02\x90\x8f^\x08\x01\xf1NsJHHW\xcd\x11Mf\xe6\x96\xbd\x81A<\x06\xd2\xd1s\x5c\xe8\xae\xda\xe8\x85\x07\xaf\x8f\xff\xe8\xf1\xcb\x87|4\x09\xb6\xd9\x1d\xbf\xb0\xceL\xfe\xba\x0fp\xf6W\xe6\x9f\xb9\xfc\xfe\x7f\xf1\xafi\x0a`(\x0c\xc3\x8d\x9a\xb5\xf9\xf4\x836\xfb\x81\xf7\xda\x81\x1f\xfc\x05O\xda\xff\xad\xef\xb4\xfa\xf9'\xad\xf6\xf8_^7\xab\x863\x9e6\xdd\x84\x1e\xdb\xf3\x22~\x0e)\x1a \x9c\x16s!\xc9\x11\x01R\x89\x17\xb2\xf3\xf9\xc1T\xd1Ap\xda1K\xcd \x87\x9a\xf4}\xa3\x09;Q@\xf0\x8c\xfb\x19y,Hm\x22\xfc\xcf\x1f\x87\xcd\xc4\xc9\xa0,\xe2\x22\x94\xc7\xf8`\x0a\x99\xcd%;\x07\x02\xcd\xc3\x96\xcb\xb2\xeb\xcd\xb3\xf3n\xc3z\x03\xc7\x1a\xc2\x18k\xe0I}p\x05'\xa0\x00\xae2\xbbN\xa9\xf7\x0dA\xd9l\xafdl:\xb5b\xa3h\xa2\x9dM\xdfm\xcf\xb2\x11\xaa\xce]\x00\xe8#/\x92\xd2\x80\x0cS\xd9\xaeO@\x19\x95a\xcf4\x8a(-0\xb7\x0b\xe3E{t\xed\x1d\xb6R\xb8\x87\xb6\x00\xb8\xd6\xce\xd8\xd1\x95\xffd?\xb2\x8d\xca>;\xfb\x8f\x1e<e\x9b\xd4\xb1%\xb6\x0f\xb6D\xcd\xf4\x84-!\xf7\x19\xda\xbel\x85\x06\x82d\x16\xa8\x0e\xa3\xcbf\x90\xd9d\x1a(-Tp\xed\x03l\x04@\xd7\x917\x00\xa5}\xe4$\xe79u\x02\x0f\xec\x18\xcd\xde\xcb\xf7\xbf\x19\x15\xf2M\xeau\x99f90S\x97\x02\x5c\xb5a\x0b@\x16`\x09\x80\xd4\xb1\x12\xc1\xb8\x92N\xbdz\x80\x94k\xdf!P;$g\x91\x0axj\x09j\x84t4w'h\xcc\x84\xf5\x88\x93\x06b\x93\x01\x15@u\x96\x95\x92\xf1'i\x98\xc6\xb9\x85\xfc&\x09\xe0\xee\xc3\x00XA\xb0CEi3\xe4\xdbI(Dq\x0b[I\xe46\xda \xe1IBl7\xcdf\x9a\xe6e\xba\xbcW4=l>\xcf\xc3\xaf\xe0\x063\x8b\xb2`}2\x8fd+%E\x866\x8a$9N \xce\xe2J\xa9\x0d\xe5\xdb`\x8e(\xab\xb8\x1a\x0d68\xaag\x89F\xd5\xc6\xb0&\x0b\x80H\xd5\xf2\xb6\x16\xa0D\xa5\x81\xa6v\x8b\x05\x97\xe4\xaf\x0dU\xb3\x89;\xa2\x1c\xa7\xad~`1m\x83\xc8\xea2 \xb5\x0c\x86\xc6\x13\xb3\xcbV[_\xb4\xb3\x0f\xe3\xd5 \xbd\x8d\xdc\x0bE\x93G\x1fu\x16\x9d\xc6K\x14\x8e\x0cP\xa5\xcd\xa62E\x15I\xf9I\xc6\xca_\xce@wz?}\xb1e\xee\x0b\xf1h\x22\xe8C\xbd\xc1\xe3\xa2\x17\xe1\xb2W*M\x86\x90\xf7\xaa4\xd1\x0b]\x14\xd8TD\xdf\x88c\x88\xec\xdc\x06T!\xc3\xb5*\xea\xab\xf91\xdc\x8bhT5\xcb4\x99\xb8\x95\xa7\x5c\xd5Q\xbb\x1ay\x18\xd0.l\x86IpjbR\x91\x14\x15\x0a\x0b\xed\xd0\xfd\xde\xe8\xd2\xdf\x84\xd7^\x810\xd9\xb8\xed\x09\xa1\xa4\xb8\xbe\xa1\x9a\x9dr5\xc3\xf9\xdf)\x82|\x9a|\x12.6\xd9\xe1\xc6\xe1{7\xffsX\x08jCO\xd8\xf9\x14^\x14\x01\x9eR^\x88\xe7\xec\x99\x17_\xfc\xf3\x7f\xf9O\xff\xd9\x1f\xf4d\xfbj\xdc\xaaj\xf1\xec\xe5@\x17\xbb\xc2\x9f\x5c\xe6\x08\xf9\xec+,\xfc\xf9oY\xe1\xe4\xcbL\x1an\x0a\x83\xdf\xf7\xdf\xd9\xea\x95\x17\xad9\x7fv_\xf9\xf7\x9b\xa8\xcd\xceU.a\xc4\x0f\x12\x00\x11\xe2\x91/>\x18o\xd6d\xd7(\xcd$\xbd\x93/\xb5c\x83u;\x82\x82\xc0Fc\x16\xeda\xec\x7f\xb2ch\x81\xa1\x0d\x87-\x8d\xe0\xdc!\x04\xfc\xb7\xf5\xd7\xec\xdc\xc2\xa6\x1d\xc7~\xa7\x06\xa0\x9e[^\xb4\x19\x8c4'\xd1\x1b\x1fj\xcf\xdb\x06\xae\xaeS\xe8h\x8f0\xf6M\xb4\xe2\x0a\x89\x09\xbb\x92(i\xefm\xd3PSK\xf8Z[\x06\xa0T\xf0\x13\x97F\xb1ah\x08\xaa\x06\xc1}\x0e\xbfm\x1b\xd5\x8c\x9dCM{\xfd\xca\x05\xcb\x1c<\x00\x82+#W\x1a\xb0G\xd6\x8fq\xba\xe8!\x1b\xac/\x81\xa4\xd8D]\xfa\x8fV\xdc\xfe4\x07\xb3\xa1\x89F\xc4Sv\xd0^\x18\x18\xc5\xa8u\xc6\xcac\xc7\xac:p\xc2\x9a(A\xd8\xfc#6\x90x\xd1\x95%r-\xac\xf3\x91\x7f\x14\xf2\xd5pb*J\x0fZ+\xb5\xca\x06\x9bs\x10'Z\x9d\x0d\xda\xd1?\x84\x83Rd\x1f\x93\xeb-{s\xadd\x8fC\xb9=\xa0IL\xbf\xd1M!p/\xef\x0b\x92s\xd5\x11\xc0C6\x845\xc5D\x97\xe6\x9c\x0cQ\xe3\xa0)\x1d\xcf\xd58\xeezWW.\x10\xe5\x10\xfd\x13\xa2s\x04DA\xce\x0a\xa3.JSG\x9bL\x8a\x17\xber\x01\xe6\x0d\xa8\x0a!\x15F\x19\xe4,\xa4\x80l\x06x\x00-\xc6\xbd\xea\xaf\xaf\xf2C\x22\xd5\xc9\xe3\xf4\x1b\xbd\x92r\x88\x92\xe8\x0fa\x10_\x0f)4\xcb\xddV\xcf_J\xaa\x14\xea\xa3\xba\xc8\xb7\x9bD\xc7\x1b\xcb\xab \x1d\x10\x17\x08n\xf8%o\xa4\xff'l\xee\x99Gmk\xe1\x0b v\x90\x87\xde\xa9\x5c\xf2\xdel8M=\xdc>\x09\xc4\x16w\xbf\xe0\x9a\xfc\xade\xa1`\xfb\x86\xa7l\xf0\xe4\xfd\xf6\xfa\xd7\xbc\xd6>\xf8\xd1\xff\x17\xf6\x9dT\xb0\xa1fA:\x92\x03I\xd6#\xad8!2\xb1\xf8V\xd7\x10N\xc4+\xf7f+\xf3\x15J\xbfo\xc4\xb3\xd7\xf7\xd5\xa57G\xf9D\x83\x1c\x17\xe6\x05\x84\x07g\xb9hF(\x5cs\xd6\xb2s@H;x\xf4\x90\x1f\x95 \xfb\x03\xe5\x10\xcf\xb6\x83|\x98\x8c\x92\xf3\x88T\x9f\x91\xb6Z\x96m^\x5c\x1e\x89\xbb\x9f\x0cw\xddg\xff\xb2\xffx\x5c\xe7\x85\x96C4!\xbbI\xae\xba\xeb$\xd7\x17v!\x1f\x090k\xb0xz\x83\xc8\xf7,\xfe\xb3D\xf2+\xc4M\xf7{\x8f\xe9\xfe\xf4K\x1b\x8f\x85\xcez\xf400\x08\xb4\x84\xf6\xeb\xa6\xf8\xaa\xdcE_w\xa5'ts\xf1\xaf\x02\xfb\x9a?\xc0\xe2\xfe\xc3\x85\xdf\xfa\x19;u\xf4n\xcbL\x1dE\xbb,o\x83?\xfc^[\xfd\xb5\x1fE\xadYE}yB\x0a\xe0\xcfV\xdf\x81\x95\xefH\x01\x8a\xb2\xf3\x10$\xd0Y<>g9\x10\x0dQ\xac[\xa9\xaf\xa2\x08P\xd3\x8e\x97\x04\x15\x16\xfbJb\x14\xeb}\xec-\x18\x94\x93S)\xbb\xf7\xce\x94\xcd$\xc7\xacq\xa5a\x9f\xdeX\xb4M\x0cLg\xe7\xd6\xed\xcd/\x1b\xb5\xa3y\xbc\x96\xaf\x0fZa\x0bo\xd2Y\x90\x15\x08\xa5o\x03M6\xd8*\xb9\xe4\x88]\x9a>fOW8\x12\x01e\x87qd0)\x06\xf1\x8e#9[\xbc\xb0\x84\x81\xeay\x8ec?\x88\xcc\x00\x95\xea\xb5\xe3\x08\xaf\xd1D\xb3G\xec\xc1\xb3\x97-\x8b\xa1\xe8+\xc7p\x15\xc5\xd1\x1cM6-\xcfl\xceC\xb9\xacq\x04\xc3\xb8m%\x0eZi\xe3\x84-\x15\xee\xb0r?l6\x0c q.`\xe3\xeb/X\x7f\xed\x22\xc8\x16\xc6\xa1\x03\xcd,\xd4\x14\x86\xab\xf0\x8cV\xf9\x13\xd5-\xab|\xf9\xa3kbh\x9a\x86bZ\xe6p\xb9\x0b\xcb\x0b\xc8N\x0f\xdb\xc2\x0a,\xc0\x15\x90'\xeex\xe4\x8d{b\x02\xf64\x9d\xa5\xe5#D\x90\xe1\xbe\x0f\x03\x98\xe5\x85\xc5\xa0\x96\xcd\xba\xd0\xeaX]A\xf0\xcf\xba\xec\x9d\xc373\x92\x8edDI\xf8\x0cS\x89>\x14\xbe\x8eu\xabr\xb7\x00\xaa\xcb\x17\xaf@\x80\xb0^\xd88$\x5cqH(AAP\x95D\xd4/l'#\xcaF}\xa0@\x01>\xe6\xf1\xb3>\xa48\x87\xc6\xa1}b\xb9\xc5@\x9e\x9a\x80x\x00\xfedUI^?\xf2\xc8\xf5Pl+T\xc6sE\x8d\xcd\xef\xc8+\xdf\x827\x07\xb3g\xdf\xf7\xcbV\x9e?\xa7\xaf\xddTp\x8a-j\xf7\xcddL\xfe\xd5\x1f\xdb\xf2\xb3\xef\xb4\x93o|\x1b\xd4\x10n\xbb\x90\xffH\x01a\x06\x16\xe3\xc5\x8b\x17\x1d\x09\x09\x11IYAp\xf2V\x0b\xfbB<\xbd\xe0z\xcf\x06\xa8\xe3h[\xb8D\x0f\xbb\x12\xc6\xb1\x9aV\xa1\x1b\xa2\xce\xe0\x85\xdei\x80\xbd\x90=\xf2\xc5Q\xda\xcdl\xa0\xd11\xce\x8c\x10\xdf9\x110\x0c9!w{\x91\x8f\xa4\x8d\xecN\xfaa\xa5\xc8wU'D\x95\x88\xebr\xbd\x1a{\x9aN\xc2P\xeb\x9e\x92\xbc\xc8\xce\xeb\xe8\x03\xddg\xeez\x90\x8f&\xae\xd8m\xbda\x8cs}\x06P\x0f\xcd\xe1fE\x81y\xbe#\xf4>\x0e\xc3\x16\x19\x86\x97\xaf\x85\xa0044\xbc\xca\xe5y\x7f\xf8\xea\xfe\xa8\x89j\x88(\x1da\x0ai=\xecl\x18\x11\xce\xa2\x09P\x84\xa7\x9d\xa1\xc9\x91\xc9K\xbf\xf336\xf5\xb3\xefw\xe3\xd2\xf4\xc4a\x1b\xf8\xfe_\xb0\xd2\xbf\xff';\x13~\x09O\x8e\xcce}\x0f/\x5c\xd4M\x13\xdb\x98\x96\xd4\x8c\xa8}B;Q\xed\xdeQ\x0f\xbe\x0d\xb6\xd6\x04\x08JJ&u\x80\x0a\x16\x9f.@\xde\x06\xb8\xd5\xa1|\x0e\x22\x079\xc2\x09\x9f\xe9+\x9cd\x8a\x96\xd8\xf4@\xc3\xee\xdc\xca\xdaR\xbb\x02\xa5\xb6m\xe7\x9f)\xdb\xf9\xe9\xbb\xd1\x82\xcb\xd8\xeb8h\xae\x90-\xdb \x8b\xbf\x05\xe2\xb9\xbd~\xdc\xb6\x11X?>\x81\xcc\xe5<\x02ifi\x12\xd5\xee\xc9\xcb\x97\x90\x1d!d^\x81\x07o\xd3|\xb3h\x8f\x9f\xa5N\xd8\xe0\xf4\xa7Q.\xd8\xd4q\xdd\x1bv\xe7h\xdb\x8e\xe4\xcb\xb6\x04\xeb\xabYY\xe1\xf07\x8cK\x0b\xf7\xdb\x7f\xec{\x93\xcd\x0f\xbe\xca\xce\xe7\x0e\x81\xa48\xcd\x149\xd3\xc8\xdas6\xba\xf9\x84\x8d\xd5\xce\xb2\x1b\x01(3\x99d\xdc\x5c\xdf.p6\x14V\xf1 \xa5\x14Gj\xb7\x90yh\xc7.\x10[\x03\x09%\x87QMFC\xefyTw\xc7\xb6\xfb\xedQ\xfc\x985A\x84\x1bm\x8e\xfb\xa0\x8c\x8c\x0c,\x15\x98x\xee\x82\xa6\x8a\xb1#\xfb\xa7\x11L\x0f\xea\xf4\xafv\x1c\x02\xf9)\xc7rJ\x18\xc25\x86>~}\xd5U\xac6\xb1\xed|\x80\x18\xa4\xd8{\x81\xd6\xb0\x07\xca\xaf\xac\xe2\xcah\x09\x1fr\xd4>\xac\x0dM;\xdd\xf1\x07\x02\x90\x9d^x\xa3r\x14B\xde.\xb4\x89!O\xfc\x9e\xd4B.|C\xdfV\x13\x04S\xe2\xb7\xbd$B\x07\xf1\xd00\xa7r\xa2<\x99\xc9\x83\x96\x18\x9a\xb1\xd3\xef\xfb%\xab,\x9c\xe7\x9b1\xea\xf2\x0a\xec\xeb\xa7\x7f\x90\xa3;@\x10\xd2J\xbb\x99\xa0:\xcf}\xe2\x836~\xf0\xa8\x0dL\x9d\xb2\xd2g>\xc2\x18g@@%\xef\x07!\x1c\xc9\x8c\xd6\xd77@\xd6hs\xee\x1a\xa3\x9b\xf9\xd6W\x22\xed>\x11O\x98\x12\x1a\xe6\xddA\x03\xe5\xf1\xd1M\xb8tbw$\x8fc\xe3k\xefKG$\xbd\x11\xd1\xbd\xd2\xc6A\x93|\x83AJ\xb3k\x95\x9b\x9a6<Z\xdf\xe3\x80h\xb4?\x11\xf2\x91\x95\xb7\xfc\xa5%\x88C\xc1\xc5\xa7\x9f\xf2uB\xf4\xf1n\x1d\xbaw\x9d4\xd1\x8d\xbf\xe9\xbc\xfe\xd2\x91Oo\xf9\x83X$\x8f\xc0b\xc9\xa3k\x1f\xf5\xa0_z\xfb8\xbe\x1f\x85\xbd3\x8a\x9d\x86\xafMR\x0f\x0f\x8d\xc8\xdcY\xac\xae\xafvPo\xe8O\xab^p\xe7*\xa4C\xdc\x0dC\x13\xe3\xd2\x95?\xfcE\x1b\xff\xd1\x7f\xe5i\xf3\xf7}\x9b5\xbe\xed]V\xfe\xf8\xfb\xaf\xca\xbbs\x0c\xaez}u\x04\xc0A\x9e\x06\x04I\x04\xd0d\xad/\x1b\x0c\xc5\x89*\xd6\xb1\xd69Xq\xdfq\xc7\x98}\xcf\xc9\x11\xeb\xe3\xfd\x05\xd4O\xe7\xf02\xad\xfds!\xc3\x11\x05\xed5@\x08F\x99md(\xa8\x88\xad^\xaa\x83a\xdb6yp\xd0^\x87{\x9c*q\xb9\xd6\xaa]\xb0\x11\xfbX\x1aAp\x1ft\x0a\x83\x93\xab\xe5\xed\xe4r\xdb\xa6\xcb\xb8\xc5\xc1\x8eF\x9b\x8dcSY{Qj\xcdt\xd7`z\xde\xb2\xab\x1c0W\xe7L\x9e\xd60\x1a\x96\x03v\x849\x9b\x9f\xc2\x19'v\x16\xf3+\xeb\xf6\xccJ\xddn#\xcf\xd116Y(\x0e>\x9a\xfd{PI\x15\x9b=t\xd8*c\xdf\x84[\x1e<\x14\xb79\x9a\xa1|\xda\xa6\x97\xff\x0b\x9ak\xa8\x14\xe3\xde31\x80\xe0\x1a[\xa2\x0c^\xb2\xc7\x04@A4Sx\x9c\xae\xa3!\x97\xca\xac\xc0IB\x09\x01*;\x85\xdawVk\x87\xa1k ;H\xc2J\xfc\xb4\x9c\xf0\xae\x0d\xd0\x07uX\x8c P\xd8ym\xca\x8a`\xb7V\x16\x7f\xb0/\xe9\xc3\x1c\xacBlea\x1b3\x11\x94\x04\xcaCctm\x08q\xf5\x10\xed\x8eq\xed9\x19\xa2F\x18\xcb\xcb\x152\xd2\xc6\xb2'\xa8\x16\x12\xfc\x0b\xa8J{M~\xd5\xa4@4=5\xcd\x0e\x9f\xa3\xc7\xd5\x1e6\x0d50\xad6\xa9\x92\xe9\xc8+\xb5\xc6]\x1e\xc2\xd3 c-2\xed\x09\x85X\xabp!\xfaX\x7f\xc1\x10S\xf2\x90e\xe6J\x84\x00\xf8\xbeB\xb7N|]\x08\x87\xef\x89\x9b\x22\x99\xd7\xe0\xb1\xbbm\xf5\x85\xc7\xac\xbc0G\xba\x9du\xf5\xcc7\xf8\xa1\x0ah3\x8e\xa2\xcd\xc8\xc6\x07\x98\xd6\x81\x037\xc8\x17^\xd3\x0e\xe6\xf5\x95\xcf\x7f\xd4&\x7f\xe0\xa7l\xa9\xf1g\xccX\xce\x84\xa2o4\xceB\xdeR\x08Q\xf0f\x87L\xb7\xcc\xefu\x11O\x98P\xaa\xab\xeeh\xa8\xff\xeayg\xe8\xc4G7\xd7K\x1d\xa7\x8d\xf7\x1f*W\x00V\x9c\xd4\x18\xd0\x86\xd2\x95R\x7f\xdd !\x9d\xf8\x96\x18=\xc0&\xc8:\x8fW\xd6\xc7>`\x9aM\xfacB\xc88\x10\xe4\x8f\x0bz94\x84'\xab\xc9\xc7\x84\xd9Y~\xdc*\x95\xdf[\x9b\xee\xf7\xc2\x1bJ\x8f+\x1d\xa5\xbbv9!o'\xb9\xea\xef\xf5\xda\xd9\x0e\xa5\xca P\x14\xd2\xe9\x87\x07\x1bB\xb7TM\xc88\xe8\xb6\x9f\xc5^ }\x8cx\x8aE\xf4[\xbf\xfa\xac\xb6\xb8J_\xf2U;\xb1\xea\xa3\x1f\xb5\xd2\xc7\xee\xb3\xc17\xfe\xa0\x97W|\xeb\x8f[\xfd\xe2SV?\x83\x81\xe9\x8e\xd0\xed\xcd\x1d\xd1\xfe\x10\xbf\x8b\xafD\xd2y:\xb6X\x80\x81\xd5\xc7\x08\xc8h\x12\x83Q^\xd5\xa1|\xe43\xed\x1d\xdfr\xcc\xde~j\x0c\x7fgh \x95\xe4\xaf\x0b \xcc\xfc\xc0T\xd0N\x8cm\xbaG\xf45lj\xb6\xd66\xec<\x1ac\x85\x1c\xf8\xd5\x0f\x8d\xd3\x1a\x90\xa0~\x1b\xe7\x99m{1=\x02\x12\x00\xa0\xe31y\x05\xe1~?\xf1\xe7a\xc1\xc8\xfb\xf4\x14\x1e\x0e\xb6\x98\x9b\xd9\x12\xde\x00\x8eLY\xbb\xbfh\xb3%\xce\xe5\xd9\xc6\x0d\x0d\xd5\x15\x01\xec+\x0aJ\xf6\xe5\xaf\xb8\xdb\xc6\x90\x05\xfd\x1f\xff\xe1\x01<\x1c\xac\xd9[\xee=j\xab\xad\xb2=\xb2\xf5\x06;?\xf9=l\xa8\xa0P0\xe4L2\x97\x07+_\xb0oo?bo\xe9\xff\x88=\x08\x10^\x1a\xfe.\x10\x1f\x88d\x13\xe4V\x87\xaa)\x1c\xb4\xf9\xf4Q\x90\xe7\x88\xbd\xb4\xf2\x9fl\x14M\xb8\xb3Y\x10)\xf2\xac\xa7\xea+Vf\x12I\xbe$\x15q\x0ca\xdc\xa0\xf6\xf9:\xb2\x81m\x0e]DE\xfc\x91\xf5Gm\xba\x89\x5c\x14\xe4\xac\x8d\x9c\x00\x98v\xd7%\xda\x95\x82Z\xec\xe7\x90\xb3\xd9e\xe4W:f\x01 \x97\x07\x89\xf9\x1c\xbfzpn\x22& \x1d\xa7,\xb4f\x08\x01\xe0\x87{=k\xfc\xe4\xd7.M\xbdD\xa9$P\xb8\xd0\x81u\xea\xcb\xbb\xef;\x85~\xc7\x80\x0d\xe2\x8bM\xea\xe2\x9f\xfb\xdcg\xd8$\x1c\xb7C\x07\xc7\x91\xedAA\xb2~\x9e{\xeei\xca\xc8\xda\xdd\xf7\xdc\x81^E\x0e_m\xa7\xed\xe9\x17.\xd8\xab_\xfdj\x94\x16`=\xe2N\xe7\xe3\x9f\xfa\x14\x8eC\xb1\xb9\xd1\x07;!\xae\x03\xf3\x09@\xa0\xf9$CR\x97K\x159?\xe9\xc5\xd3\x8e\x00:\xc9\xf7q\x13\xea\x1f\xca\xbdr\xf9\xbc\xe7\xd0\x9a\x90\xa6\xe0\xb5\x0e\x97\xdb\xabX\xb5\xbd\xbc\xbe\xe2}\xd0d,@\xc7\xd4O\xb3J\xfd\xa3m\x94`!=\x07\xdc\xbc\xd5\xc2u\x11\x8f*\x1bw\xbb\xae\xaa~|\xd5\xbb\xde\xd0\x89\x8fn\xc2\xa5\x13\xdb\x9b\xb4SF\x9cF\xc3\xe9\xea\xb7|\xe0Z]\xa4\xb4\x0a\x0e \x10\x10\xe7p\xac(\xf6\x85\x0cF#V\xad#\x08i\xd0\x0a\xc9\xa4A>W\x90\x1b\x9c\xdf\x5c\xb3\xbb\x87':\xed\xf0B\xe2\xc2H\xdb\xada\x5c\x9b\xab\xeb\xe0o:\x09\x03\x92\xda]O\xbdV\x88\xe3;\xc9\xf5\x85\xf8eH\xd2\xf9\xdd\x19\xbd#\xc7\x8er:\x19\xbeAn\x82\xaau\xdb\xd6?\xf4\xab\x96;r\xb7\xe5n{)\x1d\x87\x91\xaf\xec{~\xe5G\xba\xc6\xa5\xea:\x01\x99\x1d\xed\xee\xf6\x93:\xd6\x17Y\xf4\xbe\xf3F\xbb\xe5\x88\xd2\x91(\x80\xc9\xc5\x86\x04\xdfg,\xc0\xef\xfe\xa6i{\xe7\xcb\x0f\xdaa\x8e=H#D\x17\x06(\x22C\x19f\x97?\xbb\x89'\x81U\x5c\xc9\xb4J6\x8d\xed\xcc|{\xd5f\xd7\xb7\x98g\x18\x8c\xa2Qt$9\x84\x0a4\xc2k\x80\xd3\x22l\xacb\xb1momc\xa4'\x0d'j2\xca\x0e\xb4T\x84\xc2\xc2\x86f\x15\xbf\x5c\xf8\x7f\xb6\x8b\xa7+\xd6\xb8\x07\x19\x10\x07\xc9\xc9\xb3r\x85\x7fr\xcd\xe3\x9aYT\xab\x0fO\x03\xc7&\xca\xf6\xb1G\xc42\xdb\xb6\xb7\xde1\x82rA\xc6\x1e?\x7f\xcc\x9eM\x7f\xafU\xb3 \x01\xfa\xa0\xb8\xf8\x17v\xb2\xf1a;\x91\xbfl\xaf\xed[\xb7\xdc\xea9d\x0b\xa8i#\x0bJe&\x91\xbb\x14\xecr\xeaN\xdcF\x1cDa\x00\xbb\xa1:\xday\xcd'\xec\xdb\xb3\xcf\xd8\xe7\xd6'\xa0\xf8Jv\x9a\x8e\xac\xd3\x07\x1c\xd8\xe7.yd8\xc9)x\xd6\xc4\xcd\xcf9\x94!\xb6`+n\x82\x84\xcel\x9c\xb7\xf6\xb0\xecv8Q\x17J\xa1\x8c\xe2DU*\xe8\xd8\xfdT\x91\x85U\xe9\xb7\x04G\x22$\xa0\xea\xe4\xc5\xa0N_;\x80\xdb1N\xfb\x7fpV\x9b\xa0\xa8\xc6\xd3\xaf\xdc\x85\xc7n!^o\xd1]\xd4_/\xf5>\xfc\xd8SO?\x8b\xe7o\xfc\x93\xa1\xc5X\x81\xe2\x93\xe1kis\xd5>\xf7\xd9\xf3N\xf1\x8aR\xe9GM>\x85\xc1\xee\xe7\x1f~\xc4\x11\x8bT\xed\x07A\xa2\x8f<\xfc\x19\xea\xce.\x15\x16d\x05\x8f\x08;\x91N\xf8\xbc#D}\xd2\xbf\x1b\xea\xe8\xb6K \xc2\xb6\xec\xa2\x22\xea\xa8[\xd9\xeb\xddA\x19\xb3\x89\x1cB-:*\x9dK@\x14\xea\xeb\x15\xfc\xe3\xed?\xd0\x17 M\xc9\x9e\x84h\xdc\x18\x96\x09\xdf\xf1\xc8/\xa4s\x8b\x86\xeb#\x1e\x1f\xdc\xa8\xe6t\xba6\xef>\xf0Q\xd4\xeef)\xb9\xc7E7\xe1\xd2\x89\xdd\xd1\x05q\xac\xae\x1a\xcf \xcaS\x12\xc5\x5c\x1d<\x96\x1f\xe0\x07\xce\x02\xb1\x9fpl\xc34\x119\x22ZZ\x96d\xdc\xcb\xd9\x9f\xca\xd3d\xa8\x90\xf8\xd3\xf3\xb36\x8e\xaf\xad)|Ti\xff\xab\x97\x9dz+\x1d\x0f\xd1E\x99<\xa2\xfb\xccc\x14<\xae\xf3b'\xc0\x8b\xd3\xec\xbev\x92_\xa3MJ\xdfM\xd3\xf3D\xa4\xc7w*\xba\xbb\xe4[\xff9\x06 {\xd54F<2l\x5c\xfe\xbd\x9f\xb7\xa9\x9f\xff\x80\xa5\x06\xc7\xb1\xa1\x19\xb1\xa1\x1f\xfa\x9f0.}7CJ\x0f\xd0\xfe\xbd\xba\xc0\xfb\xa6\xb7\x83\xc2\xc4\xf4O\xe9\xbb\xf2F v\xab\x94\xd7B\x09\xb2\xbdh\xd8+&\x0b\xf6\xb7\x8e\x8f\xd9\x0c\xbc\x87\x1aG\x1dl\xa3\xfaX^\xc7\xdbrc\xd4.\xe6\xa6\xeca\xe4.\xabW\xf0\xbfV[\xb6\xd7\x0d\xe2\xe8\x13U\xea\x14\x85\xbc\x00b\xa92\x9fN\xe2\x91z\x88\x9d\xf6p\xae\x88\xbe\x1a\xc7G\xb7V\x8cS\x16\x9c\x12\x90'h\x88\x17\xab\xe7\xc5V\x83\xf2A\x0eTOq\x8e\x0a\xbb\xf2\xa9\xe7\x1e\xc4&d\x94#\x12F\xec\xb6\xec6>\xdc\xd8@e\x99\xb3i\x8e\xbfN\xadbe\xbfn\x9f\xfe\xe4\x0b\xf6\xf7\x8e\x99\xddsj\xdc\x9eE\x9dn\x03\xc7\xa63\x8d?\xb2\xbb\xaaEdB\x07p\xd8\xf9q{y\xdf_\xd9qT\xb7\x0fM\x0c\xdb'\xe7\x06\xed\xd922\xa2\xe5\xa3V\xea{\x85mrzj\x15\x07\x98\x05\xda\xff\xaa\xc4%\xfb\xe6\xfa3\xf6\x92\xe4\x1c\xca\x14\xac\x8b\x0d\xdc\xec`\xcd/\xeaE\x1d*\xbfg4\x9a\x93I1\xa8\xc5kB\xb2\x8a\x8d\x89\xce\xb9\xc9m\xdbX\xf6\x80{f(a\x9c\xaa3\x5cH\x09\xf5\xc8\xdeY\x14\x9a(/\x80\xa3\xd8T\x0d<\x19HU]F\x95u\xf1\xdd\xf6\x08Z\x87\xfb\x81}B<\xfaS\xe8\x02y\xad\xd6\x9d\xa3\xaf\xf2j\x18\x04S\x0d\xf6\x0b\xfa&\xacC~\xe7/\xf5p\x9d\xa3\x0f\xaa\x9c\x90\x9b_\xbf\xe1Hs\x15\xa0l\x0a\x8a&\xad\xc7\xf9\x97\xa0\x94i\x8f\x92\xba\xe3`Ot\xf5\x8f\x17AU\xd5'q\x9d\xafNu\xfd\x18!Bi\x9e\xe9\xfbb\x15\x0a\xa8\xc9~(\x0b%&\xcf\x06Q\x85\xaf_H\xcf[5\xc9\xfb\xcd\xeb\x14^\xa8\xf5\xfa\xe7e\xa9k\xd5Q\xb7P\xb8>\xe2QE\xe3\x81\x8a\xee{\xd6\xf8\x9e\xcdPr\x1f\xe7\xe8\xa6\xf3\xbcG\xea\x9d\xef<\xd7\x1e\xa9vF\xa9\x83k\xf2>\xac\x09\xc6\x9f{.\x10\x7f\x95\xff^Y\xde;[\xcd\xe3\xda\xf6\xec\xc6\xaa}t\xee\xbc\xbdf\xfc\x80\x1d\x94g^x\xc0\xf1\x974\xe6q\x03\xbbu\x09w\xddg\xa5\xe9N\x85\x98\xed\xe6\xdf\xa5\xa4\x98A(\xd2[aw\xbe\x10\x1b\xbf\xf1$W\xfd\xec\xcc\xb3\xf3\xe9\xaa\xc4\xdf\x00\x11Zp\xb2+\xd0\x1059\x13f\xe9\xf7\xfe\xb1M\xfd\xe4\xbfc\x0c\xd1\xc0:v\xaf\x15\xbf\xfb'l\xebO\x7f\x8dq\x040h\x98\xe9\xd5\x80\xea}\x90{z \xee\xab\xf8\x1a^5\xd8\x917\xa4\xfd\x04\xfbAy\xa5\x89\xa4SH_39`\x13\xb0^6/\xc2\xcb\xd7?\x19\xe2m\xe7\xec\xc1\xf4A{\x10{\x89\x85-\x8eZ\xdf*q\x04G\x16ee\x8es@}w0\xb7\x85\x8c%\xec&e *\x9fh\x83 $\x1d\x891\xca\xb1\xd7-tC\xda\xb8\xccY\x87:\x18\x02p\x08\x99n\xc2RkT\xc9\xc3\xce{\x106\xd8\xf1\x8du\x9bA\xcbm\x0679\xaf,\xa6m\x9b\xb8Y\xdc\xa8<\x81\xb6\xdb\x17\x12w\xda#g9\xa3e\xf31\xbb\xeb8\xb2\xa1\xc33\xb6\xf1\xc4:e.\xa0J}\xd1\xde\xd4\xbfb\x17\xd7\x0e`\x0c\xbafo;|\xc9>\xb7q\xbf]\xea{\x8d=<t\xcc.\x8e\xbe\x1cK\xfe\x13.\xc7\xc9\xd7\x16m\xaa\xf2I\xfb\xe9\xa99{Yr\xcd\xcah\x8057+v\x09\x00\xbd\x84F\xdd2\x0e6[\xb4C,H\x01M\xb6\xca`?\xdc\xc0\x0c\xe0\x85!\xc9i\xa4Rx\xc8l\xa2\xaaK\xb7A\x05)I\x0d*GA0+\xa3\x9d4H\xd7)\x1bXB)\xa8\xbaDS\xaa\xe9\xa2.)\xab\x134\x167\x17\x1ch\xaaJ\xbe\x86\x18\x17\xae\xe1\xbe[\x8e\x96{\x1a\xd5o\x95.\x1c\x95\xd2\x09\xadh\x1e\xc6k\xb9\x9b\xf2K\xbdcl\xfd+\xa1\x9c\xb8.B\x162\xd3\xd0\xf7e\x07\x96\x04\x13\xef\xae\xe3\xfe\xbe,_l\x1c.x\xee\xfc5\x92\x7fq-\x12\xc5\xe32<\xb1\xdc@\xa0A\xb9\x00\xe8D<\xff{Zt\x8d\xcf~\x95\xa3o\x8cxvWH\x93B\x00\x9fx\x0d\xc2^\xdd\xd4\x89\xdfq\xa3\x82\xaeN\xad$\x0a\xb1um\x5cn\x88\xd5/)\xe2D<i\x02j\xd7\x05\x97#\xaa\x83\x90\x8f^h\xb2F\xe5+\x82z\x0aLi\x91=\xbc\xb2\x88\xda*>\xac\x86G`\xb1\x0c\xd886\x1e\xfd\x0c\x90Ns\xcc\xb8\x81\x18\x09\xa3\x10\x95\xe0O\xf1\xbd>\xef\x8e&\xb9\xf1\x85\xeb\xfb\xc0P-\xd9\x13\xe5\x11\xe6\x8d\xe0++\x9e\xb0J\x1f\xe7UAz\xbeQ\xd8\x99'<i\x1d\xf6\x96s\xa32\xbe\xae\xde3FN\xf9\xd0\xc8\xfa\x99Gm\xf5C\xbff#\xef\x08^\x80\xfa_\xfbNk\x9c{\x06\xe3\xd2\x8f\xd2$\xf5\x85F\x92\x9e\xd8\xd9I\xd7l\xae\x14\x0a H\x5c\xb6#\xfev\x93\x83\xdf0j7\x8e\xc8\xb1:\xde\x04V6\x00\xbe\x94\xd7\xc6e\xcd\x99\xc9c\xf6\xd9\xad~\xbb 6\xd8\xda\x92\xd5A\x12r\x0a\xb9\x9c\xc5\x8a|\x08o\x19\xa8\x1e\xd71H\x94z\xf1r\xb2\x8cb\x00j\xd1u\xf4\xd1\x10\xde\xa7\xf9N\x0a6\x9e\x5c\xafH\xd1o\x05\x8f\x09\x83\xa4\x1bB\x85y\x8a\x13C\x07\x0be\xfc\xc4\x951\x0e\xcd\xda\xa1c\x9c\xf4\x89\xa7\xec\xe4\xd6 \xec:\x5c\xfa\xa4\x0f\xd93\xc9\x13v\xf9\x02r\xad\x04\x1at\x83w\xd8\xf1\xb1u\xab\x8e\x0f\xd9H\xb1d'\xa7\xf36\xb1>o\xc7\x0b\x1c\xbb\xbd\xc2I\xaa\xcc\xd9s\x83\xdfe\x1f\xa9\xbf\xd3\xe6\x97_i\x8bhDV9\x1a!\xbf\xf1\xbcM\x96\xfeo;\xb0\xf5$\x9b\xaa9\x8caG\xad\x05\xe2\xd8B\xd9}\x8b\xb9Y\x85\xaa[G&\x9aem\xf8\xa6I\x9c\x01\xaf\xaf\x10\xb2d$\xc1.&\x0d\xa2\xad\x83\x8c\x96\xfa\x90yUP\xc0@.z\x14\xb3\x05?\x0e\xc0{\x1f\x8a@@\x8d\xf6\xd6A4\x19\xda\x14\x8f\xcc\xc5K\x9793\xe6Rg\x0dw\x07f\x7f\x03\xe6\x1am\xc2&\xc2v\xd1j\x89\x05\xf9qYZ\x0bb\xa3{\xf8\x8a\xef\xde\xe3\x0f\x85\xda\xa8V\xb2\x13\x12\xa3O\x7f\x10\x7fN\xa9\xc4\xe0Fu\xd2F\xf4\xcb\x13\xae_\x8e\xbf\xd5\x8f\xaa\xc8U3OAW\xff#>0$\x95@\xb01\xc0j\xa5\xb9\x95\xc2\x0d\x11\x8f\xda\x18\xb7\xb3SqfA\xd8\x89\x86\x1d@w\x98:)\xbay\xc8\x1c\x0f\xd0uSS\x88w\x91\xd2w\x8b\xf1;/?\x8e\xa4#\xb7\x11\x12\xcb\x9b-\xb7\xc2/QP's\xeb\x89\x89\x8ffiR\xfe\x9cH\xf3\x02\xac\x869\x0c\xe8F\xe1\xafN`O1\x88\xb5\xb1\xd4\x94\x07\x00\x14\xda\x15H\xedZ,\x04e\x17\xf5\xa2b\x95OwbQT\xd8\xe1\xd4\xb4\xcb!^\xfb\xe8,\xbbs!\xcb2,\x9c)\x1c?\x0e\x8f\x04+i^{P\xba\xa8*\x9d\xe7\xf0\xe6\xda\xbf;\xf3\xec|\xbav\xae[\xef\xcdn\xd5\xf1\xbdj\xe8;g^\xb8\x06\x0e\xbd\xba\xf9\xb1\xf7[\xf6\xf8}Vx\xe9\x9b=\xf9\xc0;\x7f\xde\xd6\xae\xbc`\xcd\x85\xb3<\xab/\xf4'\x04t\x8d~\xd1D\x88&D\x00d\xa4\x95l\x87A\xd08\x09\x99\xac\xc2\xff_\xe69\x87\xb3G\x01\xb6\xb9\xda8Zc\x87mn\x09m\xae\xe5\xcb\xd6\xe0\x8c\x9a6GM\xb7\x00\xd6[\xc8?\xea8\x06\xdd\xce\xd4m\x88\xfc\xa3\xa8\x10W\xd3(!\xe0\xffm\x10A\xbfP\xd72\xec\xbcTf\x09WNh\xaamd\xad\x1f\xe0y7\x22\x99\xbeC9\xbb\x9d\xe9P\x1c_\xc1<\x89\x94\x8d,\x9e\xaf/\xd9\xf6f\x9f-\xad\x1e\x00\xc9\x1d\xb7\x07\xaawa\x1a\xf0(J\x02\xa7\xed\x1c\x9afW\xea\xc7`\xd0-\xe2\x9e'm\xf7O\x97\xec\xd80*\xbeK\xeb\xf6\x81\xcd\x9f\xb5\xa7pV\xba\xd9?\x85R\xcd!\x9b\xcd\xe1\xa7\x0d\x05\x87\xd7\x8f<d\x076\x1e\xb4\x87\xae<\x81\xd7\xeb%\x1b\x81\xeaB\xf1\xda>z\x0e\xa7\xa8ku;\xd0\x1cE\xe7\xae\x0f\x178\xb8\xf8\xa7\xe4\x93\xb01[\xd8+=\x87\xbcF\x87\x17\xba\xa1%\xd4_\x0b\xffk\xc9A\xcc\x0e\xb0\xe9i\xc3\xc6j\xe2\xc5\x1a\xf2\x8a\xcdT\x03\xe7\xa9\xc8\x8a\xe8/\xb9{\xca\xb3n$\xcb\xd1z\xc8A\xc9I[L\xb6hz\x9f[\xe4\xc0Y\x0d\x8b\x07\x22<U\xf4\xb8\x8f\x8b\xb3\xac\x18\x8f\xb0\x96\xf9\x82\xd6\x9f\x10Q\x88\xf0\x12b\x18\xb2\x8f\xe2\xbeBI\xd4r524\xd4\xb5\xc6\xfa\x87\xa0|\xd5^\xb3\xb1\x19\x8c}\xf1J\xa1\xf9\xa6\xf9\xef\x06\xcb\xc0\x8b\xa6\x8e\x1e\x17[\x90\xb6\xd0\xdb\x0eT\xd46\x87U\x9a\xceD\x85K\xa0\xccU~\x1e\xd9S\x1a\xd8\xe4\x1b\x03\xfaE\xc8_\xbcN\xb1\x90U\xbe\xb6\xd4rw\xb4\xb1.\xef\x04\x94\xe1\x7f\xa1v\xba\x8f\xeeT-\x82^\x86:\xfa\xe3-\xf2sC\xc4s\xcdz\xaa\x81\xb4GM\xbaV\xd3:\xf1\x9d\x1b\x95\xb6\xe3\xe1\x9a\xc5+\x996\x11\xeaX\xe5\x88\x83\xbe\xb7\x0d\xc5\x93f0t$\xc6\xd5!t\xb2\x1b\x98\xf9\xcb\xf0\x8c\xf7%<\xfc6\xed\x22g\x9d\x5c\xc2\xfb\xaeN3\xd5i\x90\xa2x4\xf0\x82Q,G\xee\x84\x1e\x03\xb2\x92\xda\xa4\xbe\x9dC\x88\xd8\xc7nO\x9e\x89\xf3\xa2\x92@:\xd2\x9cJ\x81\xb0t\x0a\xa3\xde\xed\x15z\xeb\xbd\xd7{\xc5)M\xa8aH\xb1\xf3y?%\x84|_\x8f\xbf\x01\xf9H\xed5\x8c\xf3\xea\xfb\xff9nGNZ\x06\xa3K\x1d]0\xf8_\xff\x92\xad\xfe\x9b\x1fc\xc0e.\x14\x85\xde\x0e\xe2^\xfc\xf8xO\x17\xf7\x96\x0b[Y\xfc\xda9\x88\x9d\xa7\xd0\xe0~\x0d\xc4\xb3\x06\xe5\xb0>q\x82\xf3yrv\xa1\x9c\xb2\xd3\x17Q\x9fF{\xad\x81uw[F\xacP\x01\xf2\xc5\x95cC2\x00\xe0\x9d\xcc\xe1\xc7\x8dc\x10\x86`\xd3\x22\xc6\xb7\xba\xd4\x95\xa1h\x06s\x0d;\x87\x9a\xf46>\xd5\xae\x9c\xd9\xb2\xa7\xafl\xe0\xcf-eGF\xae`E^@%\xb9hkX\xb0om\xa34\xc1\xf7\xb7\xab8\x1d\xe5@\xb2\xe9\x89E\x94\x00\xee\xb2\xa5G^\xb0\xb7\x8e\xbdh\xaf?Z\xb3\x876\x17\xed\xf7\x1e>j_\xc0s\xc2\xab6\xcbv\xcf}iT\xb6W\xed}\x0f\xbd\xdd>Z\xff\x01+\xcd\xf4Cq\xf7\x81L\xe6\xed\xef\xde\xfd\x88\xfd\x9d\x97}\xca\xee\xa9\xfe\xb9\xcd>\xb2j\xdb\xcf\xf6\xd9ZS\xbe\xc72vWz\xc8\x96\x01P\xfd8\xc9\xbc\x0c\x9bl\xa29\x80\xe1+K\x9cy\xbc\xc9\xb1\x0a\x079\xc7\xe79\xdc\xe9\xc8W[\x02a\xbcl\x9a\x9ax\x9end0\xaa\xc5\xa6)\xdb?bU<z7a\xbbA\x001\xb7\x99\xff\xf4\xa3\x10y\x83rk\xc8\xba4[\x93~\x8e\x8d\xd8^A\xbd9\xac\x19\xf5rO\x88\x07\xa3'\xeaZ\xb7\xbe\xc65\x96\xd1zs\xb6\xb5\xf2\xdfD\x19\xd7*\xfb\xcb\x1a\xefuT\xbd\x98W\xac\xff\xf4\xc8\x0c}\x13f\xdf\xb7\x7f\xff\x8f\xda\xeb\xbe\xeb\x9d\xcc9\x0es\xe38\x86Z\xb9d\x8b\x0bWl\x1dg\xa2\xb2]\xab\xa1\xc0\xd2@\x11@\x9e\xb5\x1b(i\x8c\x0c\xe0\x81\x809\xae{\x1dZ\xa8C\xe7\xceA9\xcaN\xe8\x8eo\xbe\xcf&\x0e\x1f\xb0ji\xd3\xb6@.$\xe2pA\x1d\x95\x80\xeb%(\xdd\xc3\x87\x0e\xd9\x13\x8f}\xc1\xfe\xfc\xcf\xfe\x0c:\x1b\xa4\xa4*\xf9O\x17\xe5\xc4\xdd\xd7\x0b[<\xe1-\xf2\xb3/\xc4s\xcd\xf1\x8f\x06@\x8d\x8b\xd3\xecn\xa8\xe2=\x8e\x9bx\xd7\xb2\x9b\xf2Q\x9a8\x7f\xdc/\x8et\xe2\x87\xe8\xbd\xf2\xa9\xac:\xbcv\x9d~(\xa3\xa8nW\xf7$\xf6\xdbnM\xe2\xef\x0b\xb1\x04\xe4\xc2.\x82\xfcbE\xc0\xe8\x892vk\xc0+\xdf\x91\x14Y\x9c\xa3\xa8\x8d\x0e\x892\xe2/\x07\x82Q~\xa5T\x1a-\x14'k\xa3\x86)\xbe\xfb\xd5\xa8\xd8k^\x94:\x84\xdd\xf9v?\xc7\xe9\xbe\x11\xafB>1\xcb\xad\x01\x1bk\xe9w~\xda\xa6~\xee\x0fQQF\xf60q\xc8\x06\xbe\xef\x17l\xe3\xff\xfc'N\x95\xc6}\xbb\xbb\x7f\xc2sO\xac\x06\x07\x04\xa2\xc1P\xacc6.[\x9cws\xe9\xd0\x1d\xf6t\xe6\x80]\xbeR\xb2\x95\xd9\x054\xb9\x9e\x07\x18`\xf4\x89\x1d\x88\xb4\xbd$\xaf\x90=\xc4$\x82\xf7\x83\x13\xeb6\xc8\xb1\x04m\x84\xfb}\x18S\xb6\xd9\xa4\x94q\x1c\xdaL.\xdb\xa3+8\x01\xc5KF\x1a\xc0<\x9a\x1a\xb5o>\x8a\x7f\xae\xfeu[\xeb_\xb6\x0d\xb4\xc3\xb6\x97\x8b\xb6\xc2\x11\xcb\xe5-T\xb9\xabx\xa8\xe0l\x9fQ\x10\xd64\xfc\xbe\xe7\xf1\x0d\x96\xab\xbe`\xb7\x8db\x0f\xc4\x19@w\x1e\xae\xdbA\xbc\x22\x5c\xe48\x86\xef\x00\x98\x8d\x1d*\xd9\xc3\x9f+\xd8\x876~\xc4\x9dv\xd6\x9b\x19{c\xe6C\xf6c\xf7\xfe\x7f\xf6-\xf7\xe2\xaeg\xec\xbce0X,C\x99\x1c\x18\xecC\xc1\xa1`\x19\xd2\xdc\x9e\x1d\xc6\xc3r\x0e6`\xc1V\x16k\xb0\x04a\x9fA\xd1d@4\xe7\xaa-\x9bm\xe22G\xf3\x97u+{\x98\xb6vn\xd4_\xc7\x224\xd9\x90\xe5\xfaFAH\x9cjZ]\xb4\xa1~\x0cg\xa1h\xb6\x9d\x9d(n\x00\x88\x86\xce\x14\x90L\xb1\xf1\xd2\xcaiB\x196\xf0\xa0\x1d;\xec\xdd9?\xbd\xe7wF]\xe3I\xf5\xd1&O\x1f\x88\xd7\xb3(\xd2\xf8\xbe\x93M\x13`_\xc5\xee\x9d(\x8e\x8d\xe7Q\xa7\x5c\xbf\xd9;6\xa4\x89s\xee\xcc\x11\xb7[o\x07\xc6\xa6m\xec\xf0I\xfa\x04\x15u8*\xeb\xcb\x8c1\xae\x92\xfa\xe8\xdf:\xfd(\xd7M\xf2\x0e\x9e\xac\xa1M\x89\xfcQG8$\x19\x17\xf7\xb4\xcd\xa6Aee\xdc\xdb\x06G\x98#\x12\x18\x9a\x98`\xa3\x02\xd9\xcc\xaeLc\xa3#)2\x1cs.\x0e\x81X\x9d\xea\x9dx^w\xeb\xa8\x9a\x84~\x0c\x1d\xb5w\xbdw\xb6\xe2k\xf3\xb4/\xc4\xa3\xaa\xa9\x09{\x0e\x8d&\x0b\xc0c\xcfwQ\x9b:y;7\xd1\x8b]\x97n\x19\xbb;\xac\xfb\xac4r\x83\xb27\x8d\xb1\xab@=zV\xfd\xf0\xe7\x17\xea\xebqjOo|\x94\x948!\x9a\x09\xd4k'\xf0*0\x80\xaa\x92\xa8\x22_h,\x0e\xd6\x1a\xf9C>\xf1z\xc3~C\x1fR\xd0R\xb9\xba/\xa2\xcf\x85$\xbd\xbf*G/iTt\xe9\xbc\xdd\xfd\xdcy\xf1ur\x13\xfah\x7f\x95u>4\x0b,\x09 l\xc8\x8d\xcc\xfb\xff\xb9M\xfc\xd8/{\xe6\xdc\xbd\xaf7\x19\x97V?\xf9\x87=\x85E\xfd\xec\x9d\xd4\xd3\x81\xde\x8b$c\x11\x8b\x12\xe5\xecc\xb4\xc9\x10@K\xd1\x00ju\x15\xd6S\x09G\xad\xcf.\xceYin\xc1\xfa\xb0\x09\x93\xc7\x82m\xc65\x81\x1d\x87v\x9bl\xf1\x11Y'\xed\xccv\xde>\xce\x81i\xe3\x1c\x8e3\x80\xb0\xfe\xee\x815v\xa8i\xfc\xadql@n\x9eO\x94lan\x04\xad\xb5!\xcbo\x15p\x87\x83\x86\x17L\xad\x8b\xa7\x8f\xf0\xbd\x0c\xd4C\x1am4\xde#\x90\x9f8\x00\xc5\x96\x92g\xe5~[)O\xd9\x13\x8b}xL\xc0\xc5\x0cj\xd3+\xd9A\xcb\x0c\xe4\xec\xcec5\xbb|\x893\xa78\xa7\xe8\xca\x93\xdb\x96[\x1a\xb5\x9f\x9c\xf9\x0b;_z\x8azO\xd8m\x03\x7fb/\x9b|\xca\x12\x1cW\xfd\xe2\xb3:\x16y\xd8>\xfb\x02\xbe\xda\xa0v\x06\xd0t\xbb'=lc\x1b\x1cl\x88c\xd0:.o\xf2\xb8\xcd\xd1\x11\x0e_(/[\x1a%\x8a\x83}C8.E\x05\x1abF}#\xc0\xaev\x0a\xde\xa7\x04\xf0\x00\x8c\x0dv\xdd\xeaM\x1d\xd1\xad1\xc9\xc9V\xc7Y\xca\xf2\xd9&\xf9N\x10\x5cob\xd3\xa3\xa3\xa4\xa5\x12\xde\x87CLyC\xf09Lfg\x91\xf5\x8c\xd4\xfenY]\xbe\x16T\x80\xca\xd0\xf8\xee\x0c\xbeV\xd9\xe0\x857,\x18\x01\x82\xdd\x89\x88\x08\xeea\x84\x5cC\x92N)\xda\x1cB\xa9u\xe3\x95\x19r8*\x87\xe6\xd2\xe6h\xf5*NAI\x88\x13\xa7K\xb7^\xc5\xe8\xaa\x876\x94\xb8\xea\xeaE\x80$\xc4\x9e-c]\xbbQ\x86u\x8bb\x87\xd8\xbb\xce\xb6\x17\x12\xa5\xaf\x82\x9d\x8e \x06r7ND]U\x7fk,@$\x1a\x08\xf5\xb96\xc4\x9d\xb5C\xc1\x12\x01\x94\xa0\x9cKK\x0b\xb0\x83\x97\xed\xec\x99\xb3\xeem\xdc\xa9MJ\xea\x06\xd5\xa2\xf7O\xa4~\xf4\xec\xbbx\xdd\xdf:a\xdf\x88GU\xf6q\xd8\xab\xee\x1a\x84\x08\xf9\x5c+M'\x9e\x1b\xcd\x81\x00\xf4U\xd8\xcdw\x88vG\xc1\xcb\xeb5\xf2\xeac\x1e\xf4\xb1\xf0\xe7\x17\xb5@\xbba\x85(>\xdc\xabmL \x8a;\x80\xef\xab\xc3\xe8\xfc\x8f\xa2\xee\xa8\x93O\xe5\xeaO\xb6C1\xf9\xaft\x0a\xa1\x18\x95-\xe4\x13\x95\x19\x15\xb6\x1f\xe4\xd3\xcd\xa1\xbb\xd0\x8e\xee\x9d\x17\xb4\xa3\xd4\x10\xf3\x8d\xfb\xdb\xa1|\x00\x96\xd5\xc7\xfe\xca6\xfe\xcb\x1f\xd8\xc0\x9b~\xc8\x1b\x5c\xf8\xdb\x7f\xdf\x1a\x97\x9e\xb6\xe6\x99\xc7\xe9\xa9k\x8cyO\xd7\xe8\xdc\x1dQ'\xb2\xe5\xd1\xf2K\x01\x14\xda\x00\xd1\xd3-v\x90\x17Wm\x95\xf3z\xd2P8\xf7c\xcbs\x06m\xb46r\xc0y\xf8\xe7Ch 4\x9b)XW){\xa2\x94\xb4\xf3\xa7Q\x99\x96|'Y\xb77n\xd6a\x8b\xe1\xb0\x93E\xbcT\xc6\xb7\xda&\x87rq0[b$\x89\x1f\xb5%\x1bE64R\x9feCt\xc8U\xf7\xab\xc3-\xbb\xb2\xb4a\xa7\xd0\x84N\xa66\x00\xf2\xdb\xd8n@\xed\x5c\xe1\xa0\xae\xd2s\xf6\x86\x03\xa8\xc3\xb1\xd3-m6\xf12l\xf6\xca\xc3-\xfb\x8d\x87\x1a\xf6\xe1\xbf(\xd9\x0f\xbd\xf6\x1e;\x00\x22\x1bD]{\xb3\xb5l\x95\x81\xa2m\xb1\xd3\x9a}\xf6\x88\xad\x01\xccf_,\xe0\xd4\xb4m\x0bu\xa8)\x8e\xb9\xbe\xaf0l\x07\x1aC.w\xe1\xd8\x1a{fa\xc5\x16a\xef\x8c\xe7\x06i_\x09\xb6\xdd\x1a\xc8u\x1c\x99\x16\xf7\xa8w\x83\xe2q\x01\xd4O\x1f!\xa7A\x8d-\x85\x8b\x9c\xba\x9c\xbd!\xcb\xa9\xa3\xd5\xa7\x93EE\x0d\xf9\x81h\x02\x86\x02\x9a|\xcf\x81(@\xd2\xdd\xafl\xa3\xbdWFI\x82\xb4M\xd4\xb3o<*=\x03\xb4\xeb\xd6\xd5\xbc{\x01.\xeb\xcd\xa9\x89\xee\x22A\xc3\x0e`\xbe\xb6\xca\xe6$a\x87\xa6\xe5\x1c\xb5n\xeb\x9b\xd8O\x91OZ\xac\x92\xb9\xde\x8e2D\x01\xad\xc1!\x0e\xfd\x1b\xc5+\x88X\xe1\xdb(\x96\x086\xdd\x86\xb6`\x9e\xcd\x87\x90\xa4dVk\xb8\xdeZ\xc4\xc6O\x9bG}fcu\xc3..\xacB\x09\xe3\xfc\xd3\xd9g\x09\x0c\xb7\xc97\x93\xb2\xbbN\x08\xf8\x97m~\x96\xe3\x10J\x82\x07(\x99\xe0\xe9\xa2\xb9t\x81\xf1\x0e\x95\xccA\x09\xe2\xd8\xc2\xces\x16\x93d\x8a\xeed\xd4\xdb\x19\x10S\xb8%m\xd4&\x928\xbc\x09\x86\xceD\xf2M\xbdr{x%\x160\xe2\xcf\xff\x918h\xada\x18\x0f\x0b8'7O\xcc\x838\xc8[A!\xc5\x5cL\x16\x90\xbf\xf5AQ!\xb3\x93f\x9b\xac\xe8\xa1\xdf[\xcd\x05(W\x1c\x85\xd2\x1f\xb7J\xb8)\xc4\xa3J\xabs\xf6\x9cd\x02\xe4\xea\xac\xeb\xa4\xe9\xe4\xe5F\xc8G\xa1\x83\x80\xf4R\x7fW\x85]\x91|\x83u\xc0\xd2\xb9\x06\x08\x8a\x93k\xb1\xa8N\xfa\xaf\x0c\x8ag\xe7\x11#\x1cG$\xfa\x96\xd2q\x91)\xd0qH\x5c\x9dR\xda\x8f\xcal\x9dxY\xa0\xfb[% \x15IB9\xd1\xc5\x8b$>z\xad\xb7Q\xe78\x1a\xdb\xbb\x9fB*\xff\xf5|\xba\xdbG\xdf\xf5d\xfb\x86\xbcu\xaa\x87\xb1\x15\xdbM\xbd\xb7\xfa\xe1_\xb7\xec\xd1{\xbb\xc6\xa5?\xf8/lM\xceDK\xb2s\xa0\xe7\xa2\xb9\xa6[\xb9\xa9'\xa7\xc7k\x99'\xa1R\x05\xa0t\xc2\xa8\xc6\xcc\xdd\xe5@\xc5.jw\xb9t\xd1\x9a\xeb\x1c\xf3\x0cEP\x80\x1a\xf9V\xe4!\x0bx\x1c\xb8\xa3\xd8gc\xa8\xe8VA@\x9f\x82E\xb6\x04\xe0\xde\xe2\xe8\x02\x01\x90\x0b\x94\xb5\xb59l\x19(\x96\xf1<\xf3\x0f\xf7.[\xc8wt(\x186\xa5\xb6\x95\xe5\xb4\xd3\x0b%;\x98\x1a\xb4\xf4\x18\xb6.\xe9\x8ae)\xef\xfc\xf3\x15\xfb\x14e\xe7\xf0\xbd\x96m\xa7\xed%3\x05{v\xb5fG1\x1a\x1d\xb3Qk/\xc9\xdb0\x9b(\x80\xfa\xa9\xa9\xa4\xbd\xee\xf0\x90=\xf4\xd4\x15\xfb;#\xb8O\x01\x987\x00\xee\x05\xb4\xebj8\xe1\xac\xae\x0f\xd9S\xf3\x0d\x0e\x90+\xdb\xe6:\xec\x17\xda5=\x85\xaa6\xc7\xb7\xdf\x9e\xd0yB\x1c\x04\x07R|\x11g\x91\x97\xf0\x8e\xf0\x04\x16\xed\x85\x1c\x1e\xb1\xa1\xc3\xaa\x1c\xf7\xf0P\x05\xcdNd7Y(\xa2\x99\x91\x93\x00\xd5a\xec~tH\xdd\x01+\xcf\x9d\xb6J\x01\xf71Y\x0cR\x01\xe6\xdb\xa8^W\xfbZ\xf6\xd4S\xcf\xf0\x15M\xcf\xc0\x9a\x0eWT\x89\x19#QL\xee\x8e\x88onsfQ\x18\x8e0\xa35\x9do&\xf8\x0a\xf2L\xdc\xf9\x9a\xf5\x18\x0d\xad\x07\xcd\x0d9w\x9d\x9b\x9d\x05\xe0\xd6\xf0\xf8\xcd\x18@\xc5-\xcc\xd3:\x8e\xfbV\xc2\x03\xd8XM\x153v\xdb\x1d\x9c\x87t\xf4\x84{\x83\x172\x9a\x9e\xbc\xc3\x0e\xe0\xa1>\x85\x97\x86\xba\xb4\x0a\x19\xf3\x0c\xf3cuu\xd9>\xff\xe4s\xee\x9d\xa1\x80\xfcN\xce[\xff\xf23\x8f\xdb3\xcf\x9f\x01$\x00\xacE\xc5\xc1\x1a-\x1c\x86\x85ZZ\xb6\xea\x12N\x8fV\x879\xbd\x15\x19o\x16\xb6,\xb2;9\xb9\xf5i\xa7Z\x8a\x95\xd6Y\xf1\xaay\x84\xd2b\x90\xe3-QU\xf5.\xb4L\xda\xb9\x0dN\x85\xcdrdF=\xc3D\xf2\xfc\xe4\x13L\xa2\x1f\xe2\xbe\xe0\xc6\xe7\xb1w\x8dJ \xbb\xfe\xe2 ]\xbb\x0c\x88\x86\xf3\x14@3(&$\xd8\xd4`\xf0\x9cbc!/.\xf8\xda`>\xe9\xa0\x8e['\xdc\x10\xf1\x84\x8eRWu\xf7\xf1j\xf3^\xc8\xc7;\x8aI\xa2w\xd7L\x13\xe7\xbdV\x82}\xf4M\x0csv$\x8d\x07\x82A\xd3\xd7\x85c\x02\xa2\xd1\xc8\xf3\x9f\x88@\xee\xd2\x8e\xc8\xe0- \xa4\xb0\x93\x1bF\xd0w\xcf\xd8\xa4\xab\x89\xd6\x01Pa`;\x85\x86\x06u>\x18z\xc5\xdb\x1b\xc5)\xa5\xfeD\xd5\x86\xce\xe9\xed\xb1(\xd1\x1e\x97n\xf2\xe8\x8e\xce\xeb\xc4\xed\x91\xfe\x1b9J\x00FF\x07I\xf9\xffb\xe1/\xffnd\x5c\xca\xc9\xa5\x09v\xf5\xc5w\xfdK\xdb\xfc\xad\x9f\xa2\x83\x82v\x95::\xf4w\xd8\xbe\xc4}\xaf\xfe\x13\xcbB,\x0cWu&\x22\x8d\xcc\xc6\xe3\xf1H`\xe9\xaa\xdd\x96\x1f\xb1\x11f\x7f\x96\xb9PD\x03!\xcf\xae\xb2\x84\xaf/\xbc\x9b\xe1\xebK\x9e\xd9\xb0\x08G\x7fL\xbb\xe5\x16i\x96\x91\xa7<\xd6\xe8\xb3\xf1-\x84\xca\x00\x8cm\x90\xce(J\x07\xc0v[\xc7Nf\x16?g\xc6\xc9\x95'\xf2\x05;\x8b\xd5|\x02V\xcb\xf2\x06T\xc1j\xdb^:|\x18\xd5}\x8e\xcf.\x0d\xd8\x01\xbe5=\xc2\xd1\x06\x87Gi\x07\xee\x5cPu\xd6\xcaj\xc1\x9ey\xd3\xa9I\xcey\xd9\xb4\xa7/\x97\xec\xd4\x91q\x5c\xc0\x00\xd8@J\xc92\xfd\x81l\xa0\x04\xc2\x5cC\xed;M\x19\xc79\xe0\xec5\x9c\xbb\x82\xabj\xbce\x93\x1fo\x08\x92\xc7,Cy\x9d\xd9\x04Hr\xc2\xa84\xda\xaa8\x1f\xad\xe0e\xa0\x98\x13\x1b.c\x03h\xc5\x15\x0b\xd3\x9c\xc8:h\x1cP\x0ax\xe4\x00\xb9j\x89\x1d\xfd\xa25\xa7\x8fZ_a\x10M7\x0e\x92\x03Q\x1f9|\x08E\x0bY\xc5\x83x\xf1\x16R\x86\xc2\xc9\x02\xb4u\xea\xa5N\xc5\x94\xcb\x1c-\x94K\x97.\xda\x85\x0b\xf2\x84\xbc\x13*\xf4\xae\x8f\xeb\xcd[\x8d\x95\xb4T}=zBF\x8a\xb8\xb0\x12BNA\x15\xf9a\xc3\x8b).\x8b8\xd7\x86\xa3\xbc\xf38ams\x16\x91\xf2iw\x9f\x87\x12\x18\x1b\x1bG\xa8\xbfh\xe7\xce_\xe6\x98\xef\x92\xdds\xe7I[\x92\x97o\x0cwWW\x97@<fS\x1cs\xbe\x0e\xbb\xf0\xcal\xc9\xce\x9d]\xb2\xd7\xbc\xea%6}p\xc0\xa6&\xc7A\xd6y?D\xb0\xcd\xb1\x18m\xd4\xe8/\xa3z?\xb7\xc4\xb1\x11\xed\x19\xb4Z[\xb6\x86fle\x03\x85\x0e\xb4\x18O\xa0\x04\x13\xb4W\xd4\xfff\x8b\x8c\x93\xbc\x9c;\xbb\xcc\xeb/\xe4C\x10L\xf2\xf6\xd1&5\xcb\x7f`\xcb\xe1#p\x00*\xf4\xd4]G\xecs\xa7\x17\x9dr\xcb\xa4\xa0\xca%{\xa6\xdfU\xa8\xdc\xf3\x90\xd5\xdf\xc5\xe5D\x85\xa8 \x0f\xfa^\x02\xd7MM6`\xa2\xc8u\xf53\xa74\xbf@<\xd7\xd8\xa2\xc7\xd9\xbf&\xd7\x1b\x22\x9e\xdeZ\xf5\x82R\xf5\xdf\xcei\x16\xa5\xf4^\x0ao\xae\x95\xa6\x13\xcf\x8d(\x1f=\xef/(\x03\x9d,`\xa0\x19\x14\xe7\xf4\x02b\x04\x13M`\xd5\x83\x01\xd1\xce\x0c\xc8\xe1\xf9\x82Z#;5\xe2d\x19\xef\x0b\x83\xab4v\xfa\xb1\xc3)\xb0\x83\xa9\x04swJ\xd6\xbf\xce\x17\xe2/y5\xfdsQL'UT\x1d\xbd\x8b\x01\xa0r\x0b\xa8\xdc(x\x9eN\xc9!}7\xeeF\xb9\xbf\xc1\xde3\xb6N\xf3\xb0[mm\xae\xb8g\x83\xc9\x9f\xfamvp\xec4\x8f\xdcc}\xdf\xf5\x1e+\x7f\xf8W\xa3\x1dv\xdc\xb7;{K\x1e\xa9\xe5JI\xfd/?\x5cZ\xb0\x0d\xe6K\x0a\x95`6\xa6\xf8MK\xd9\xc5:@\x14y\xc7\x18\xf2\x18\x01\x0f9\xa4\xac1\x17\x0a\x08|\x0f\x02T\xab\xe4\xdb\x06)\xc8\xca\xc5m\xbdp\xfcy\xfe\x0a\x1ap\xb0\xed\xfa\xc4vB\x03n\xab\xc0q\x03\xab\x1c\x83\x5c\x03\xe8\x22\xdc_C\x8e\xd3\xc6#\xc1!<\x14\x5c\x82e5\xbc\xddg\xb3\xa8/\x9f\x06\x10\x1c\xe9\x07x\xa16]\x80}S\x84\xa2^\x98\xe3\xec\x1f\x10\xe3\x00\xbbjW\xc5\x07o\x15ao\xbd\x8d\xe3\xb3\x13[\xd4\x07\xc5\x85E<`on@]q\x8aX\x99\xb4\xa3\xc5<\xc8d\x13'\xa2\xc3\xf6\xf2\x99qv\xe0i{xv\x85\xe3\xb6\xdb\xae\xfc\xf2\x04\xee[6iG\xb5\x0f\xed4<ZoVWa\xbbp\xa0X\x02\xe5\x03\x90R\x16\x0d\xbdt\x0e\xaa\x86\x1eNj]\xb0?N\xf2\x9d>\x8e\xcb\xde^:g\xd5\xcb/\xd8\x10\x86\xd6h\x18\x00\xa0\x11f\x03\xc8\xab U\xa9N\xcb\xcd\x8b\x90M\x8e\xba\xebdK\x057C\x805\xaa\xf8\xdda\xbfHG\xf9\x94\xb6\x83t\xfc\x9e\xfe\xd5\xfa\xd5\xb0z\x00\xd9\xb3\x19\x19\xce\xc3\xd6\xc3\x88T6u9\xfa-\xdd\x82\x92D\x19\xa2I\x9bs\x1c\x8a6\xcc\xb9B\x05N\xbb+C\x95\x1c;r\x87U\x067\x11\xf2\x83`.>m\x87am\xa6\xd2b!\xc2.\x9bG\xdb\x0c\x1fz3#\xa3v\xfb\x91S\x18\xf9\xa2\x0a\x9f\xdc\xb2;\x8f\x8e\xdb\xc7aU\xa9O\xca8I\xdd\x82ZE\xe5\xcf\x06QE\xdfF\xa3/\x052hT\xb3\xb6\x06UX\xc3#D\x0b\xaaYA3Mp\xa6\x81\x22G\x1b\xa5\x16\x1d\xc1\xa16\x05\x04\xa4\x0do\xa0\x7f\x04\x8f\xd4&i\x0b6Q\x90\x9a\x99\x9e\xb6\x1c\x9a\x87\xcf_\x5c\xe2\xb8\x17l\xb5\xd8\xc8\x94q\x08\xbb\xcd8\xb6\xa0\xbcu\xf0]\x9d\xb9\xa6\xd3r\xb5\x11\x13K\x92\xac\xd4\x89\xefu;'|K\xaceUF\xeb\x871\x11WMH\x08\xa2=\xe0F\xbd\xbb\x85\xc2\xd53\xe6\x06\x95\xa3\xe9L\xdc\xeb\x03Gu\xba\xef^)Ks'\x06\x0f\xbdEw\xe2u\xa3\x91\xf1\xd0{\x8d\xef\xa3W\xbaDQ\xb2\x1f\x90\xab\x09\x07\xea\x9e\x97aP\xaf\xf3\x13\xf8\xc5<0\x11\x9c\x5c\xd6`I:\xc8\xc0\x05}\xf8\x90F\x13E\xfbd_ \xa4YF\xd8\xb7\x88\x1a\xe40'\xfa\x05\x9d\x91\xee\xf7\xbbwQ]z#\xb8\xef}\x8c\xab\xb9\x13\xf9D\xf9z.{\xe6\xf1\xcczC\x8fi\xc2\x84\xbb\x9e\x5c\x7f\x13n5[X<,\x1c\x1d{Q?\xfb\xb8\xad\xfd\xe9\xaf\xd8\xf0\xf7\xfc#o|\xfe5o\xb7\xfa\x8b\x8fY\xe3\xe9Ot;\x83\x8e\x0anN\xd4iB\x0a@q0\x8c\xecU\xa4\xb5\xd5\x06h\xb7\xe0\xd1k~HX.c\xc0\x05d\x1a%T\x8b\x8b\x15\xf2\xd4\xb0Y\xc1{\xf3$\xd4\xca(@z\x88\x9duQn\xea\xd9mj\x9e\xb5\xd0\xdc\xaa\xa0\xce\xdc\xaa\x0dc\xc7\x83*?\xef\x072\x98\xf8\x03\x182PI\x936\xee^\x0b\x86\x11\xca\x0f\xe1\x05@\x07]\x1cK\x8c\xd8,\x94\xd3\x16\x07\x146a\xf3la\xc0\x9c\x84b\x9a\xa7nC\x1ceP[H\xa2\xc5\x86z\xadZ+\xf79\x02\x12\xd8\xd1H\x98\x5c\x842\xc9\xe9\xf4L\x84\xd55\x8c\x5c!\xbe`\x07nbX\x9a\xb6cc#l\x92\xd2\xf6\xfc\x02V?\x0b%\xfb\xd4\xfc\x9cm\x88\xc1\xc2\x1c\xae\x0e\xe1B\x07\xf0\xb3\x0e\xd2Y\xab,\xe0\x0e\xa7\x86\xbci\x1a\xeaE\xa7\xab\xd2v\xf1\xffq\xf7\xa3\xe3\x11\x12\x94\xe1rYd\x9a\xc3\xa3\xb7\xd90\xfe\xd9\x16+s\x08\xb0gY\xbbth\x02\xf9\x91Xj\xf4_\x95\xb5\x22\x80\xaduOm\x1c\xc8J\xd9@\xdar\xf2\x0a\xe1[\x05\xad\xc7\x98\x7f~\xd5\x8a \xd3\xf5\x82\xd6\xa8\xc6\x90o(\xf0\x14\xddk\x05(\x1e\x19\x0e\x8eM\x0fLq>\x10\xf7\x19\xa8\xc7\x1cr\x8c\x9c\xda\x85=\x9eT\xe5Em\x15P\xb2\xd0~t\x80\xc3\xef\xa6\xa6\xa7,{h\xc2\x9e|\xfa1\x9c\x84\xca\xf6\x08-r\xd5\x99\x93=\xe5\x9cWJ\x11\x19\xd4\xe5\xa7\x0f\x1ct\x95\xf2M\xd4\xd8\x87\xa0\x22\x87`\xd9\x958~\x81&C\xc1B-hh\x98?\xaa\x9fCp\xf5\x85|\xdc\xd1\xcf\xbe\xc6\xb9ShC\x05\xd7\x18\xe3\x06\x7f\x92\x955\x91\xa5i\x83\xdbQ&U\xbeo\x00\x00@\x00IDAT(\xa0m<y\xfd\x05\x87\x84x&\x0e\x1e\xb5\x97\x9e:f\x9f|\xf0A;7\xf7\x04\xc8\x10\xaf\xfbh\xd26AxM\xcah0~\xdc\xd0>$\xcdP\xdd>\x17i\xabJ\xa2\x84\xf0a}\x9b\x7f\xa2\x8c\x9c\x01\xcb\xa6K\x9b\x0a7\xc8\x07\xfb\xa8\xa6\x0e\x13;\xa9o\x8d\x9b\x9bF<\xaa\xb6\x1a\xfaeE>\x9d\xbe\x08\x13\xad\xf3\xd8s\xa3\x0e\xe4\xb3\xfa\xcf\xc2\xc7\xb1\xa1f\x98\xcf\x06\x86\xd3'.o\xb8\xc2xf\xd2\xe8^\x00\x87Y#\x84\xa3+\x0bH\x88\xc8\x17\x90\x93\xc3\x9a8\xb4Dy\xf9\xb7\x81\x86\xd3\xc3/<ow\x1f>b\x13\x1c\x95\xado\x88\xe5\xb6g\xf0\xd1\xdc\xf3M'R\xf5\xfc\xa2\x91\x8f\xb72\xb0\x8fT\x8e\xfe\xfe\xa6\x04\xb5U\x86\xbc\xf4\x1e\x0b_\xbf\x18\x97~\xfc\x8f0.\xbd\xdf\xfa_\xf6\xb7\xbc\x1b\xfa\xde\x80m\xcb\x93\x1f\x070F3qgg\xfb\x0eQ\xf6\xc3B<,W\xc6\x81\x07\x9f\x07\x00\x10Io\x99\x0b\x1a\xd9M\xe2\xb6`G\xc9\xa9g\x16\xfe\xff*T\xd0T~\x90\xf4i\x8e\x16H\xda\x14\xf2\x905\xde\xcfs\xf4\xd0&\x87\xad\xadr\xbf\x5c[\xb5c\xf8D[\x00\xe1\xc8~K\x1e\x0c\x86q\xca9\x89\x1b\x1c\xd9x\xc9\x7f\x85\x8e\x97\xc6\xec\x02*%iw\x1f\xe4\xc4<\xect6p/\xd37\xc8\xb70\xf4\xcc\xe0K\xedr\xa5h\xcf\x97\xfa\xac\xc6\x1c\xa4F\xb0\xe2t\xc2,\xf9\x1c\x90\xb3\xb3\x96\x8b\x1a\xe6\xa6\xbc\x91q\x8b\x04'k+\xb5\x0c\x9aSy+\xa2\x90\xb0\x80\xb1\xeb\x8b\xab\xf8S\x03\xcd5\xf1\xd8\xbc!C\xc5\x0a\x14\x0eelmC\xed\xd0\x96>v\xc1U\xb4\xda2\xfd3\xfc\x8d\x03\xa4\xa5\xf1\x86\xfc\x09$\x0b\x06\xb2\x84(\x17\x09\xa2a\xef\x1c\xed\xbf\x1dJ\x02V#\xf2!\xed\x96\xd5\xf3\x1a\x85\x22'[\xa6\xd8\xd9W@\xdc:\xb5T\x1bJ\x8dO\xb5Zq\x04\xa4\x0d\x9c\xfe\xc5\xc1\x97d\xfc\xb0\xcf\xab\x94\x17\x84\x18\x85`|\xae\xeb\xba\xa3 \x9c\xfe\xc2\xfa+\xc8\xb1&\xe9\xb6\xf1\xac *\xac\x1fo\xd4u\xc6\xa8\xcc9G9\xdc\x18\x15\x90\xd1\xf5AuNc\xf7\xa4\xa4u\xd8\x963\xf0S\xc5\x12\x1c\xe4\x00\xbb\xf1\x03\xc7l\xfa\xd8)0P\xc2\xe6_\xe4\xf0\xb4\xa5\x15(\xbaY\xcb\xa3H\x94\x07)\xe7\xebm\x9b\x1a\x1d\xb5\xf3\x0bk\xb0\x14\xd5\xf3E\xbe\xc7$\x14\xac\x91,\x89\xdaIv\xa8J\x8a\x12\xd6\x1c\x8b\x83\xe4}uX\x9cu(#\x1dq\xd0d3\xa3\x0d\x8fX\xfca\xc3K\x9b\x04\x97\xa8\xbf\xceX\xca\xa2<\x92`C\xf2\xd4s/\xda\xd9s\x97)\x06\x85\x01\xc6-\x897q\xf9\xfdk\x0a\x89\x89\xa5\xabr\xd8\xe0\xa8\x1c\xf7O\xc7\x9c%\xc6a]\xe8u\x1f,\xde\xa3\x14R\xdf`$P\x1ai\x8eY\xa2\xff\xb0+\x818\x0b3\xae\xe4-t\xbd.\xe2\x09\x93`\xef\xdaFK\xde_*]\xcf\x18t2\xec/MH\xae\xb4\x1e\xa2K\xa7\x10\xdd\xf4\xbc\xd2\xad\x9c\xe99\x09\xa9\x09*\xc4\xa1I*\xaa\xc6\x91\x0bW\x06I\x9a9\xda\xadiW\xea\x08G\xf7\x22Y\xb9\x8a\x02r\x16\x9c&;\x83\x1c\x7f\xe0Re\x1e\x9fYe\xbb\x0d\xde\xf9\x01vL\xda\x15\x89E\xe3\xe5\xa8\x1e{\x86\xb0\x0f\x8c\xaa\xb8#\x85\xe2\xba\xbb\xa2\xbdR\x84/\xf7\xf6\x9d\xe7Q)j\x93\x03\xe0\x1dE\xfe\x0dx\x083\xc1\xd1.\x10P\x94\x8f\x16k\x0b[\x868\xb4\xa1f\x1cH\x11/\xe1\xa9\x07\xba\xcb\xa9\x1e\x00\x83X\x0c\x0e6Y\xa4\xeaaQ8R\x05\xf6yD\xbf\x0a!\xb9\x0a+\xef\x952\xb0ma\xe1\xf0\xbdul-\x8a\xa8M\xe7A>m \xbe\x84\xd7\xb9l?`!\x03\x02\xc2\xc6\x87o\xa7\xeb\x18\x07\xa2\xe4\xa0\x9a\xbe\x02*#\x87\xcd\xcb:T\x10\xdc6\x9f\x86\xa2\x01\x16\xf0\xda\xbc\xc4\xdcK-#{a\x8e\xcd\x22\x9b\xa95/\xa1\xa6\xdfog\xd7\x92\x06\xa7\x8d\xcd\x0d\xc0\x86MP\x16Ap\x1e\x00\x9a\xa5\xb1ii\xd6\xf1o\x0b\x9b\x9b2l\x96\x0d\xa1HX+y\x00\xca\x16vNO\xadmZ\x13\x84\xb1\x0a\xd5$s\xce,\xb2'\xf81V\xa9\xae\x01\xf0\xd6\xc4<\xa3\x9d\xb0\x8eU\x9e\xdaF{j\xc8p\xf2(\x0e\x88\x85\xd6\x96g\x82\x02l'\xd28%\xc8F\xed\xf2\xeai\xb4\xb4^@\x06\x04U\x87[\xa0<\xc8HsO\x14\x8d\x80f\x06JN5\xc8\xc2zS\xbf\xbb\xac\x85\xbe\xda\x16+\x8ao\xf8\x5c\xe5.t\xb0\xdf\xdc\xd4OX\x8ba\x1dk\xbd\xe8\x1b\xaeI\xa7\x12\xb5\x0e\xf8\x0f\x87\x0d\xad4\x10\x9f?B'R\xbf\x16\xd4\xa5k\xda\x91.\x0bb\x02W\xd8p\xb2b# \xa1\x04n\x89\xda\xb8\x00\xba\xe3\xc0\x98#\xdb\xe4\xc0\x10\xe7\xf5 \x1b\x02\xe0/q\xa8\x9c\x8e\xf1>4\x86\x8a9\x1b\x812\xdc\x8e>\x5ciMrb\xf1\x81\x89\x11\xcb\x9d\x85\x9d\xc88e\xc4b\xccJ\xc5^Gg0\xa3\x98k)\xa8p\xfd\xf3\x8d\x0dT\xa8\xe6\xa6B\x8d\xf9\xb9\xbd\xc5hIa\x00\x05\x90\x96\xa8\x1e`\x90\xe0PS\x14\x8b\xeeI\xbb\xcd<\xd8\x5cE>\x88\xdf\xc0\xb3\xe7\xce\xd8\xf9s\x0b\xae\x158\x80\xc0-\x9b\x19\x03\xc1S\x06\xf5\xac\xd1\xb7u\x90O\x93\xf1\x93b\x85\xa8\x1f!x\xf5\x0b\x85\x02\xe3\xf8\xeb\x04\xfa\x02$\x9ba^r\x167&\x02\xeb8\x80\x9d\xe1>\xef\xc8\x87.\xbb\xe5\xc2u\x11O\xa7\xb6\xaay/t\x8c^h\xe1\x85}\x91\xcf\x8d\xab\x93\xf8$!\x0d\x83\xa6p\x8db<>*\xf2\xea\xcb\xae^\x13\xe6\x97\xeab\x0b@\x12\xd4>I\x10S6\x02$,\x946\x0b\xd1\xcf<W\xbc\x10\x90?k\x01+^i\x02\xdbM\x86s\xda\x84\x08Qy\x00\xc9,2166a\xbb\xad,\xdb\xc1)\x8c\xf9\xc6G\xfdH\xe2\x06@\xc1=\xc9j!x\xab\xa3\xb6w1K(c\xd7\xef\xae\xea\xefz\x1b\x1eC\x89\xddW\x9dg}+\xea\xbb\xee\xdbo\xf0;\x9a\xacM\xa5f\x8c\xfe\xc4\x0e*\xbc\xfa\xbb\xad\xf8\xda\xb7w\x1a^\xfe\xe4\x1f\x87\x0d\x87\x03\x83h\x16z\xa7\x85\x9e\x13`lJ\xa3\xa7\x05\xd9!@\xc1bM\xf1\x97@\xee\xc3\x88\x03\x7f\xa5\x04\xcb\xce\x1d\xc0..\xbd\xac\xc2\xea\xec>\x07\xc9\xd7\x07\x0b-\x97\x85e\xc3\xc4h`\xed_\x009\x14\xb3#\x18\x87NY-\xc3\xf1\x00\xec\x90/\xac\xce\xf1\x0ev\x15y\x1f+\xcdQ\x22*\xb7-\x0eh\x83\xf5\xa3\xdd\xaa(\x82\x05\xbe-\x18\x91\xa8LQ\x07\xd87[\xa87#\xe7\xa9\x22\xf7\xd9\xc6\x1bv\x0a\xfb\xa0\xbe\xa6\xe4\x0e \x03\xa6\xa6\x0e\x12k\x89OO\x9e\x02\x5c\xb6T\x9a\x9d1nk\xca\xf20\x80\xa2\x82Xmk\xf5u\xd4\x88\xb5\x13\x87e\x86\xb6[v|\x8ac\x11\xa4\x16\x0d\x9a^\x04\xf8 \xbbh@\xd1\xe5i\x95\xb4\xf1p\x9e\xc3\xbd6\xec\xf4\x11\x88\xa2\x85`\xbe\xcd\x8e|\xad\x8d\xdaw\x85c\xb1\xf3\x13 D\xda\xb3\xf6\x8c\xf5a\xb0\x98\xc7\xd8\xb5\x8eg\xee\x06\xd4Y\x81C\xf0\xb40\xd3\x08\xed\xc5\xb6Q[+P\x16\xba\x07\x1e\x13\xe8\x1fv\xf4\xd2p\xabk\x9duB@ \xfe\xa8\xe1\xd8O`\x9e\x07j@c\x19\xe5w\xea \xca\xcc\xc7\xb5?\xd4;-\xb7$}\xa6\xfa\xf4\x15\x8bh\x9c\x05\xb71\x92G\xa5\xf9\xcb\xc3.\xcd\xe15\x82\x9a\xa3\x9c\xc1\x09\xac\xa8\xcc/\xce-Xc`\xc2\x16\xce>gG\xb1\x13K\xaf\xe1\xc9\x81\xf1\x988v\x08\x83\xdei[\xc2#tE\xda|\xf8\xe5\x1b\x1a\x02A\x13\x1c\xd1\xe8F\x18F\xb8\x9c[\xd1\xa6b^\xc9\xb06\x09L\xa9\xce\x9eU\x0a\x0f\x8eTP\xd1w\x84!O\x05\xc8\xfd\xa4\x81\xe7\x9a\x95\xc0\x1dyG\x17\xdc\xd9\xc4#E&\x89\x97\x0c\xbc\xcb\x9ey\x01\x0dK\xa8,\xa9\x7f\x0b\xa6e\xb3\xa8\x8c\x97\xd6\xe9W\xea\x02\x85Y\x85%\xaa\xf2\xdc\xbe\x8a\xef\xc9M\x8e\xdc99\xf5\x13\xc3\xac\xe8\xfb\x9a\xd9\xf2\xa8\x92a\x0e7@\xb8M\x90\x93\xec\xac\x82AA\x94\xe8\x16\xba\xec\x0b\xf1\xec\x17\xfeip4!v\x07\x9f0\xd1\x9b\xbd\xd3\xb0px\xa1w\x9d\xd0y\xe8\xdc\x84Wt\xa6\x84\x9b\x9c\xb3E`\xc23#\x83\xe0\x8d\xd5+J\x86\x9d\x86HS7\x06\xe4*#B\xdfm\x08\xe9\xf0\xec\xc8\xca'\x81\xf2\x92\xbew\x005\xc7XH\x15\xf2\xbc\xc0I\xa7\x8bL\xc8\xc9\xf1\x09\xdc\x9cL\xda\x08\xe7\xa9d \xc7\x85\x08\x82*6\x89Y\x05b\x83D\x9c\xd4N\xfdw\xf7\x81\xda\xd6y\x19Zq\xd5\xaf\x92\xf4\xe6\xdb\xd1\xea\x1d\x0fWe\xfd\x86\x8e\xc8\xe0i`\xf0{\x7f\xb6\xd3\xc6\xad\x87\xfe\xb3\x95?\xc7i\x8b\x00d\x85\x1d\xfd\xc6\x83w\x15\xac\x15\xb9\xf0ocH\x99\x03\xe0\x16\xd9\x19\x8f\xb48\xce\x19\xb6\x094\xadm\xa1\x8a\x9b'~\x1a$#\x81>[\x15[\xc3\x99g\x12*!#\x01<\x02k!\x1ea\x84&\x00\x7f\xabz\xd92(:\xf4\xa1F\xbdY^q*\x02X\xe4a\x1d`\xfe\xd0\xdaE\x9b\xcf\x97\x9c\x1ajA)\xdd70n+\x026\x0c\xbc\xe8\x92Y\xdc\xecT@z\xd5\x15\x01\x8f\x0d;\x89\xdb\x13\x8e\xf4\xb1\x17\xd8i\xe7\xd9\xa9O!k\xa8A\x8dW\xa9\xd7\x00\x14\xcf,\x82\xef\x85m\xfc\xc6\xe1\xbd\xe1\x80\x15\xd0\xa4\xda\xc6\xcb4^\xb2\xf9\xe8 X\xb9\x8e\x86\x99m\x22\xff\x81\x05X_C\xd6qp\xd2\xf2 !xN\x96\xd8\xc0n\x85t\xce\x0e\x03\xf9%`\x93\x8d\xc3\x1a\xacn\xce;0\x95m\xda\xe5\xcd+\x08\xc7+v\xbc\xef\xa8-\xa7\xe5\x14u\x8bc\xb7g8\x9a\x875\xa25\xc5\xbc.\xb3\x83\xff\xc2\x13O\xd3FzGT$\x80L\x00\xcf)\x90\xa8\xed.\xdfa=l\xb3Cg\xd9\xf8\x1a\x8e^E\xeb\xd9G#\x8e\xba\xe6U\xa9\x04$\x05'\xc2\x7f\xd5B\xb1\xdd\xfc\xda0P\x01\xd6\x08\x08\x94o5[P\x04\xeb\x8c\x0f\x14\x86\xb3\xd6\xd9h$\xc5B\x04\xf0\xa2\xef\x0e\xf2\xc1\xb0\x17\xaf\x10\xfd\xc3\x9c\x9b\xb4\x8e\x0d\xce\xfcE;y\x08[\x1e(\x9eV\x9e\xa30\xd69\xbc\x0f\xa3\xcc\xbe\xe1\x09\x1b;p\xc46\x16\x97p\xc6\xba\x0c\xf8\xd6f\xb4i%\x10\x80`Hq,\x0f\xa5\x15\xea\xe3\xb2\x19\xc6\xf4\xf0\x81\xa4\xadr\x0am\xaa8L\x0d\x03%$e\xeaj\xe92\xec6\x1c\xc3\x820\xea \x9f6\xdaw:`N'\x85\x82\xa6m}\xe9\x8a\xad\xce\xcd\x82\xb8\x18\xbe5\x8ei\x80\xc2,\x8c\xb0\xd1\xc9I\xb6\x07eD?\xe7\x90e\xd5\xe0\xd3n`gTg\x13\xdc\xc0xT\xcf:~B\x07\xe1eQ\xee\x90\xfcH\xe2\x03\xba\xc1A\xa0\xb6\x05\xa2\xee\xea\xa8\xcdK&\xd5\x16\xdb\x96o&\xd8\xbc\x88U\xd8\x0bW\x94\xe5V\x08\xfbB<\xaa\xa8O\x8e=j\xdc\x8bT\xae\x99N\xf3I[\x15\x0d\xd2^e\x11\xe9\x1a J\x17\x17\xd2{\xd5}'08 \x80\x9a\x06S\xc0\x81\xc9\xe1\xc8\xc3)\x1d!\x1d\xe2E\xd5\xc0\x1b\x15\xd2\x91\x90\xce\xe308\x0b\x08\x88+\xf6\x11R\x97\xd4\xc2\x91\x1a\xaa\xe6\xb4S\x16\x00#7\xfe\xd2\x8e\x8a?Y\x16\xafB\xfd\xcc\xe1\x1eEr\x9f\xf1\xb11?&Wgih\xd7\xa5\xc0\xba\xeb\x09\xa1\x8d\xe1\xb7'\x9a[oWO\xd4\xeeg\xbd\xda\x9d\xcf\xd3\xec\x95\xb0\xa7\x9co\xbc\xdb\xd0\x0b\xfaM\xe69\xff\xe6\x87\xdf\x8b \x9c\xdd7\xa1>{\xda\xd6\xff\xe8\x97\x1c\xa8\x06+s\x22\x85\xd5w\x0c\x02c\xca\xae\xb0\xc1B\xee\x83\xed0\x8eQ\xddh\x12F\x15HE\xac&!\x06\x14\x90Q\xa3N\xa0 0H<\x86w\xb0\x96\xfak,t\xc6\xb2)\xe1\xaeS\xd3\xdbx\xa2\xde\xe4\xc07\x1c}\x02\xe4\x92\x08\xf9U'\xb1]ueK\xe3A\x9fFU\xc0\x9eG\x1dY\xd0W\x0a\x11\x9b \x89\x09\x10\xd8\x9a\xd8$p\xa3\xb6az\xa5\x00*\xeb B1\xd2f\xf1\x90]\xa5\x9cU\xa9\x053\x07eoqqs\x93w\xc8\x9a\xb0\xe9\x90|Fj\xcb\x85f\xd6.s$v\x09\xde}\x13#\xd7qN<\xcdr\x95\xdf\xb5\x06\x08\x04\xc1\x85S\x02\xe5\xcb\x97\x81\xb7\xb8\xb8\x018I@\xa3\xaf\xa4\xb4\xde\x00:\x1b\x8d-\x14\x1c0`\xe5\x91}4\xe2\x0d\xb8\x05 \x98*\xf3~]m\x83%\xa5c\xe7\xcbK\x97\xf1\xa4M\xff\xf0O}\x05\x8cg\xa7-\xcb|d\x0bp\x06\xc2\xca\x15\xc0\x97\xbb\x1ddg\x11\xa2\xf0>\xf1{>\x1d\xf5I\xb8\xf0fg\xc4\x8e\xb7\xbd\x0fBf\xfe\xa7\x9e\xd5\xbd^j\x5c;\x81\x82X\x8b\x0d\x9c\xb4F;=\xed\x09\x1c\xd1\xa7\x88\x93_\xbd\xb52'\xc6\xe2\x0f\xadZ+Z9\x872\x01\xdd\x93\x05qoa@\xba\x89\xdar\x05\xaf\xe3\x8d\x16\xca\xf2h#VP\x10\xd9\x82\xe2\xa90\xe6\x99\x81\x11\x1b?\x8c@\x88OhlA\xb1>\x9d\xe4RHGE\x00^\x80\x11\xf4\x0b\xedV\x1d\xeb\xf4\xc9\xa9\x99\xaa\xdd\x91\x1f\xb5\x17'\x0f\x91V\xf3\xa2e\xcb\x97\x9e\xb1\xe1\x02c\x09\xe2\xd3a\x0dYv\xa4-N\xaeMr8]\x15\xa5\x91\x8d\xd5-(e\x10>\x1b\x98\x14\xdat*{\x06\x96\xfe\xc8\x14\xa6\x02\xb4s\x10\xc5\x88~4\x07\x9b\xcd\xbb\xed\xffo\xef<\xe0,;\xaa;]\xaf\xf3LwOO\xce\xa3\x09\xca\x12\xca(\x83\x10 \xc0\x02\xa1\x05,\x89\xcc\x82\xcdb\xef\xc2b[\x06\x83\xc16\x02\xdb\xbb\x8b\x01\x1b\xbc\xe0\xfd\x11\xcd\x1a\xdbH\x02\x8412,Q\x02\x09$\x81PFBBa4\xd3\x93c\xcfLO\xe7~\xfb\xffN\xdd\xf3^\xbd\xdb\xaf\xc3D\x8d\xc4\xad\xee\xfb\xaa\xea\xd4\xa9SU\xa7\xc2\xa9\x5c}l(P^\xce\x9e5K\x07\x94g\x87\x1d\x9d\xba\xbaihn\xe8\xd4\xe5\xa1\xad\xea\xa8\xb0]|\xab\x84f\xf7\x13Z\x1b\x12m1K\xf9%QM\x9e)\xc2<\x19\x11\x99\x0f?+L<\xa2\x0cS\x12<\xc4\xdd\xca1:i\xca)\x8a\x8a\x17L\x9c\x0c?\x87\x13\x81U\x17\xe7\x87\x93\x8b\xc5\xcd\xa1\xf5<G\x18\xe1\xb7p\x92\x1b\xa1\x81\xb0a\xc4Bc`CQ\x04\x8a\x04\x8f\x0e\xb4\xf12\x1f\xa3\x9fQ\xcc\xea1\x96)\xb8\xeaAp/\x976\x1a\xa9\x82k\xc1Q\x95\xbbY\x8d\x12U5\xce\xf3+\x15\xeaVR\x98\x98Z\x03V\x96\x80a\xaeu\xbdn\xe0\xdd.!\xc4\xfb\xec]\x9a/\xee\xd40\x9e\x05I\xba/\xb1w\xe6q\x8ei\xac\xa6\xd4\xe1y=\xa68\x0f\xcd\xdb\xa1\x93\xf62\xf3\xee\xcf(;\x8d\x8d58T\x7fm\x9f}\xdd5\xa1i\xf6bKbY\x87\x1a\xb7~\xfe]\xb6\xc3\xc8\xce\x8fXA\x8c\xa5'rRy'\xbfL)\x0dI\xa8\xb0k\x88m\xd0m\xfax\x1c\x90\xdepc\xd3\x0c]a\xa3k^4\xc5\xa5!\x8d*\xb1\x0e\x04J0\xb1\xfeS\xd2\xd4\x19SL\xcd*O\x83j\xac\xf7\x0ej+\xf7 \xf7\xb1\xa9\x83\xa2\xd8P~%\xcf\xac\x91Hs\x8e\xe8\xaa\x98\xc8\x99\xb8\xabL\xaaE\x5c\xaf\xb5\x96\x1d\xbaB`H\xa3\x04\xf5Q\xb5ez\xaehh\xfb\xaf\xe2\xd5\xa3x\xed\xd5\xad\xd0\xad\x8a?\x22lP\xe5t-Shjl\xca:c\xd4\xa2\x8a6\xa3i\x815 \xdb\xb5\x91\xa1M\x0d \xb7\xa23w\xbfI\xd3`lzaGZ\xa3.\x22\xb5i :Z\xa2Q\xd6\xa3m\xd8a\x8b\xc4\x8e6-\xd0\x83\xd6\xa8Kq\xdf\xad\xc3\x83\x08\x93\xf5#\xba4H# \xa6\xc6\xca:\x03\xd3\xa3\x1b\xdb\xe9Q#D\x865\x8a\x1a\xd2\xce0\xa6\xe9\x1aG\xd5c\x96Ov\xd8\x0d(\xaeC\xe2i\xab\x1a\xd2F\xcd.\xb0\x95\x19\xd5 >\x0e\x8a!t\xd4\xb80\x97\xe4\xc3\x9c\x98\x85X\xb0\x0a0\x05E\xf8q\x16!\xfa3!D\xa7\xd2\x95\xc8hF\xca\xe2R\xe2In\xd5\xd8!\xf1\x8bm\xdc-\xe2O\xb3\xbe\xddzBb\xcb\xf6\x9da\xcf\x82N\x13H]3\xba\x94\xfe!m[\xdf\xa8\x9b\x1b\x06T_5m>_\x0d9\x1b\x0df5kGY9l\xdf\xb6)l\xde\xa2\xa9\xaf\x19[4\xba\xe0\xc9r\x09\x0a\xf1\x87]\x8b\xdaQ\xad\xa9:\xa6\xbf4}j#>\xad\xb3(>e\x8d\x9eY\xe3\xeb\xe8\xdceB?\x96\x08\xb5\xffj\x1b\xe6IxL\xd3&\x86\xde^u((\x14\xfa\xef\xd4\xe1\xd4\xdd\x12r\xbf\xde\xbd3,?Qw\xb9\xf5/\xd7\xae\xba8s\xd2\xd8\xa4iS\x95\xbd\x06\xb5!3\xd4\xaeL\xd3n;c\x99:!\xa4\xadYS\x89\xec\xc4\x0b\x82\x93\xdeYJ\x13#\xe46u\x80\xa7m\x99\x13\xee\xfa\xd1O\xd5\xbe\xa9m\x13\xd3Y\xd7D\xb1\x8b.HPb\xb3\xce\x01S2f\x11\xc0\x86H\x0aB\xf9\xc5\xaeDnA`m\x8c\xb5,;\xb8\x0d\x1d\x95\xff!\xb5\x9b\x83\xb4\x9djW9\xc7U\xb7\xfd\x89\xc1\x11\xe4~\xa9)\x09\x1e(\x13\x0e\xc5\xc8u`\xa9\xa2\xe2\xa5\x05\xad.\x9e\x80\x86GA\xcd\xa9X\xf0\x1c\x88\xef\xbc\xc2s\xbc\x1a\xa3E\x8b\xa3\xfdV\x19i\x10\xf4I\x00\x99\xf0Q/\x817\xd65\xb9\xaa\x9e\x8a*\xb2\xae\xd9\xa0R\x0ek*\x80o\xa6\x04\xc5B\x1d\x1e[\xac\x9d+\xb3\x94\xa9\xdc8\xdc\xae\x82e\xf3\xb9\x1e%\xc5\x8d\xb5\x9c\x01\xd1\x1fR\xe1\x1f\x92YU\xdb\x1a\xc2a\xdc\x14-\xdefi\x93?v\xda\x94UH\xbb4\x0f.\xb4\x847\xc4?\xf6\x90\x9dl>5\xd1\x1e\x9b\xb0\x14'\xfa\xac\x8f\xfdL\x87\x92\xf6\xa8t\xa8\xf3%o\x0d\xad']\xe0\x80\xb0\xf5\x9f\xfeBW\x94\xac\xb3F\x81\xf3#\xde\xd3d\xea\xc5\x98\xaf\xbc\xb1\x12HF\xa8!bc@\x8fF*\xfd\xc3;\xb4,\xaf\xe9&\x0d=\xda4w\xde\xa2\xed\xb4\xd3\xd5x\x8c\xd8\x06\x03m\x81\xd5K\xa1\x12K\xb2\xabAfo\xb3F\x1b\xccW\x0cJ\x08q\xf8rX\x15\x19\x92\xe4\x11m\x09\xd3]\xc3\x12 Tj\x1a\x5c\xe2a\xbdar_\xee\xa4\x81\x05\xe0^\x85\xc7\xbaD\x87z\xe4V\xbed\x1e\x14\x80\x9dI\x83\xaa\xcc\x5c\xd7i\x9b\x03$\x14\x87J\x88 \xe0\xec\x94\x9b\xa5\x9di\x9d\x12D[U\xb4[\x15?M\xfeH\xa0\xcc\x14\xbcOgxv\xeb\x0a\x1c\xb6\xf3N\xd3\xb4q\x93Foj\x1d\xf4\xc5\x9e6\x81[\xf8\xd6K\x8c\x91Q\x93\x221\xa4\x11\x8d\xe23\xa0\xa9\xb7~\xa6\xdf\x84\xc4\xce=\x1e\x86c$4\x925ZmzU\x14\x01\xc5^@\xd5\x22\x85+\x01\xa5\x91\x94\xce\x9a\xea\xd0\xac\xa6|vF\xe1\xcbTO\x8b\x1a\xcd&\xdd\xb6\xdd\xaf\xf3.lQ\x8f!K\xb3\x18\xa0K\xc1\xb8)(\xaa0\xb9g\x0d\x9c\xbc\x98\xe0\xc9\xe80\xaba\x9b{\xc4\xb3\xbd\x12\xb2\xba\x9aN\xee:\x8d\xcf\x8c\x86:\x87\x1c\xad\x18R\xda\x18\xec\xad\xd7\xa6\x81Mz\xbb\x88]e\xcd\xed\xed\x12\x8cZ'\xdb\xb0M\xd3Wj\xe8[\xe6hz\xb3S\x9d\xd6N\xddl\xa1{\xd5\xb46\xb4\xb7\xbc[$t\xb0t\xe3\x06\xd5u\x8d4\x95\xf5<\xa72]\xf74\x0e+\xefgk\xdd\xa5Y\xa3@^=e\x0d\x8e\xb5d\x95\x0c\x8d\x94\xb4\xe9`\x804W\xd5\x1e\xedh\xbb\xff\x97z\x13I\xebL\xe47\xbb\xd1\xa61\x82Q\xfe\x0c\xd0\x90kt\x0bO\x99\x02\xed\x93 bd\x8a\x02W?\xa1W\x07ZiS\x18\xe9\xf6\xa8\x130\xd2\xd6\xa9\xad\xfe\xda\xcd'\x01\xb1K\x07w\x9b4B\xda\xd9\xbcQkV\x1a\xc5i:\xaf\x9f\xcd\x07\x08g\xa2!\x12v\xee\x07F\xaa\x83B\xbe\x0e\xabS\xa0IY]\x1e\xab2\xa2\xf2\xc5\x8e\xc4\xa5K\x96\x84%\x8b\xd5\xfe-Zd\xa3\xa9\xe9\x12h\x5c\xfa\xda\xa2\xf6\x8b\xad\xf3\xc6w\xd1@\xf0\xf43*\xd4t\xeb\xd6\xad\xdb\xc2\x86\x8d\x1bC\xf7\xba\x0d\xa6s\x8d\x92)\xd8a\x15&Z\xf7\xf5wR\xc1\x93\x16\x1d\xcc^\xa6\x95\xd61\xca\x84\x0a\x5c\xc8\x94\xe1\xbb%\xd1S<\xa7o\xd29\xc1\xa9g\xa4\x17<\x9d\x0d\xf9\x9a\xe7d\xef>k;tCm\xb3\x80\x18\xc25\xefe1\x83\xe95F:%\x8dt\x86\x95A*\x99\xe1\xd4\xe5\xab\xc2\x19\xc7\x1c\x13V.^\x1a\xe6\xe9j\x9c6\xcd\xa56\xabR\xc5\x85\xd3\x18g\x8f9\xf1\xb3\xdd2\xca\x84\xd8\xa8(?]\xb2d\x15\x84L\xe2$3MF+\x82G\x7f\xa8j\x9a\xa3\xc9\xd3W/=\x11\x86\xcfTd\xa74\xc6\xf7\xf5Lvi9\xfe\xdc\xd0\xf9\xe2\xdf\xad$q\xd7w\xbe\x10\x06\xee\xff\x91\xed\xa6\xa2\x82PWa\xb4:\xa2\xa6cO\xb9\xd86\xa2\xf9y \xf4\xd6\xf4\xd7/\x84-\xa3z\x0aC\x8dJ\xa3\x1a\x5c\xa6\xb6\xa8\xa3lL\xb5m\xbc\xf8W\x03\xa3LVN\x98OMAi\xe1\x5c7S\xb7Z \xd66X|\x10z-\xcaw5\xf5jD\x18+\xcb/\xc4,R\x86\xa2\x9f\xd8\xa8\x10+\xda\x17=='\xfa\x8a0\xe1\xe8L\x09\x8aF\x88kZ\xca\xa4G\x16F:\xec4\x1b-\xf5h\xf9Fo\x02i:\x8c\x0d\x11\xd0\xa0t\x0d5h\x0dIv\xd6\xa4\xd8\xe6\xaf\x15#\xd1\x8b\x8d\x05qb\x5cF\x5c\xec3\x86\x94\xe3\x8d\xda\xf2\xab\xb3\xf6\xe6G\x13\xc4\x96:\xa1e\xa3\x14\x9dl\x97\x8fijT\x89\x15SDz\xfc@\xa3}\xa5@A\xf7k\x96\xa0\xac)\xcba\x09\x1c\xa6\xa9\xfb%4\xe3\x9a\xa8\xb8\xa4\xce^\x93\xa6t\xa8\x07l2@\xd5\xc8\x19YbJ\xcdi\xc2\x1f0mw*\xba\xfb\x13o\xf4\xaf\x8d>\x83\xe1\xc9\xb5\xba\xeeE#\xcf&\x85\xd3\xa0{\xf3\xc8xh\x8b+\x8a\x9f\xf8A'S\xdb\x5co\xfe\xd9\x93\xe1\xbe\x076j\x9aM#7\xbbkQ\xe9Q<\xa9]\x1a0\x84&\xd5\xfb\x06\x1d\x16e\xd43\xaaN\xe9^=\xfc\xa73\x9b\xd6\xf3\x1f\x940%\x19\xdbu\x03\xc5\x1a\x9e\x22P\xd9a\xba\xae\x896F\x5c\xe1\x1c\x0d\xb5\xbdO\x12\xae\xa7\x87\xb5\x98\xa10\xf7L\xdc\xa2\xda\xbeQ7\x9dkm\xcebF\xe4(\x02\xe8\xca\x10\xb6\xf3\xdb(=Z\xf5\xeb\x06\x0a\x84\xdc3\xc1\x0f\xff\xc8?z8\xbd\xb3W\xaa3\xb4\x1d\x9b\xfc\xeb\x80\xf0\xf6\xc7\x95\x09\x91\xcf\xc0\xac\xfcJ04hG$\x1bZt-`(\xd1\xe9\x96\xdf\x92\xa6VGv\xfeJtuS\xf9\xc2y\xe1\xcc\xd3\x96\x85g\x9d|aX\xb1|Y\x98\xa5\x8d\x0c\xd35\xe2B`#\x04\xadS\x94\x94]\xf8\x0f\x8c|\xa6\xe3\x01\xff\x98\xae\xdc\xa6\xd1\xe4\xe3\xab\xd7\x84\xfbu\xcd\xd0\xbd\xbaJi\x9b\x9e|\xd8\xa5M6\xfb\xab&\x11<p\x8eJ\xa2\xc8\xc0<\x99\x0d\xa2\x1f\xd3)\xa0\x86\x91\xfe\xe0b\xec3`j\xab@\xf1/f{s\x0b\x8e5\xf4\x94\xb4\x1aUkg~\xb9S=\x99\x11\x0d\x0d9\x04gk<\xb6\xd6\x83\x80\x10\xd3%`\xe2\xe6\x02Ie\xa6\xd6\xf4\x91\x19\xe7\x9fxRx\xe1\xb3\xcf\x0eG\xcd_\xa0a\xa5\x92L\x0e\x1bi/\xf0\x04\x1acg\xbf\xfa\xb1&E\xd34\xea(DU\x89\xbc\xc7\xda}\xc8Y\xf4 iJx\x18#z4\xb9S\x86a\x9a\xe1W\x1c\xe4\xbf\xc2\x8d\x88\xe5N\xae\xa7~\x9f\xc9\xe6\xd2\xac\x05a\xe6\x1b?$\x06F\x0e\xf6?|G\xd8y\xe3?h\xfaD\xe5\xcf\x84\x8e\xe0\xb4\xe60\xd0p\x94\xef\xf4F\xe1:N\xfak(k\xb1\x9b\xb2$\xbb]\xa6\xa8\xe9\x99!\x9d\xd5\xb1\x1e\xa2\xca1\x94'\xe5\xab\xe8\xdbz_\x9e\xd9\xd4x\x95\x89X,d\xae(\xa8J\x19\xe1\x8c\xba\x05\xc4\xa8\xaa\xda`D\xa4\xf8\xcb\x08\xca\xf03\xaf\xac\xcb\xd0\x98j'vT\x06\x97E\xfa\xa0\xce\x10\x99RR\xb9\xf2\x89kQ\xac\x01\xa5\xdc\xcb\x17\xec\xb0\x87\xd9\x94\xee\xf8\x87=.,sL\x15\x11L\xca\x114<\xe1\xcd\x19\x12v\xd4\xb1V\x89\xf0Ex\x0c\xaba\xa3\xe1\xa1\x97]\x96\x80\x1e\xa6!3e\xa7\xa1TGE%\x8b\x1b\xb3\x02C\xba\x89\x19e\x827\xc3\xc3\xbf\xc1\x80\xebo*\xca\x84\x8d\xfc\xd9\x9f\xbc\xd0\xd9\xa3\x03\x00\x85\xbe=\xdb\xc2\xd6ulr0k\x85\x22\x943\xb6\x99\x13?\xdb$ S\x85\xbb\xe3M-&\xa9\xefh\xf6\xf4T]\xcaz\xae\x8f\xb0K\xe1\x9c\xad\xdd\xe2+\xc2G7\x1d\xf4h\x14##[\xe4\xcb\x9c\x0d\xd3\xa8\xc3\xa6\xaf\xe4J\x07\x87\x0e\x8f\x8dnd\xb7\xf6\xd4(\x90\xd6a\x8d\x86T>(\xc2\x89*m\xd8$\x9b\xf3?\xe8\x86r\x958\x95\xff\x0aH\x85\x07\xa1\xa0\x0c\x15\x0d\xad\x17\xb2\x86\xa5\xad\xd8\xb1Nl\x91\x90Y\x1e.\xb9\xe4\x05\xe1\xdcs\xce\x09G\x1d\xb5LS\x8d\x9d6\xa5F\x99\xf04\xa5\xba\x9b\x89#ft\xee\x7f\xa3\xb9\x9c\xa6Q\xd1\xac\x993\xc2QK\x17\x863O=!<\xf1\xc4i\xe1\xb6\xdbo\x0f\xdf\xff\xdew\xc3\x06\xdd\xd0\xb1?jB\xc1\x83D\xe4\xc1\xb4V\xf5*4\xb26V\x91\x99\xc6#\xc1\x0d\x22\x8dF\xda\xacY\x0c\xdc\x5c\xcb\xcb\xac\x18xI\x00W\x8d\x004\xa80\x5c\xe8Gq\x8bE\xc5\x1c\xf9\xa9Ub\xc8\x0cIl\xad\xd1*3ULU\x01\x11\xfd\x5c)!\xee\x0b(\xb32\x92\xab&\xb8\xba\x82\xad\x88g\xac::\xbc\xfc9\xcf\xd5\xc10\x1d\xaa\x12.=5W\x84VU1b\xf6\x0b\xd9\xac\x17Rq\xc7\xc1\x14\xd5\xa3\xb6\xf1\xaa\xa1\x13\xc9T\x0a\xbc\xa7\xa7\xe2\xdd\xc9H7X\x86\x8f\xcd\xe9&(\xbfYFU\xda\xd9o\xf9\xb0\xce pa\xa2\x84\xc6\x8e\xcda\xcb\x17\xde\xab\xf2%\xceh\xfa\xcczh\xe2=}O\xcb\x01\xf1\xce\x8a\x90pc\xc9\xc9\x98\xa9,\x1e\xd2\xe8\xf7u\xafy\xad\x1a\xd9\x81\xf0\x83\x1f\xde\xa4i\x94\xfe\xd0<{\x96Zc\xdb\x0bl\xf4\xe3O\x9a{\x95\xccH\xdc\x8f,#\x8d\xf2R\x9d5i\xd6\xad\x08O>\xf9\xa4\xa6N\x96\x99\x80\x9c\xae\xe9\xe7\xee\xee\xf5a\xa6\xea\x07#1\xec\x8f=\xf6\x84\xd2\xaf\xb5NU\xc8\xe7\xe9X\xc0CzXl\x93\xd6t^t\xc9\xc5\xda\xb5\xa5;\xe1\x1ez(\x9c~\xfa\xa9:\x0c\xda\x1f\xee\xbd\xf7\xfe\xf0\x867\xbd6<\xf8\xe0CjT\xee\xd0\x94_\x5c'\xb0\xfa%\x164\xaa\x05jPc\xca\x9a*\x02\x8f\xf3%Vf]\xd0d\x8d\x15\xdc\xca@8OI!\xb8\xe2\x0c\x83\x89\x1e\xf9cD\x09\xa1\xec\x07\x81\xe7\x94d\xa0\xa1\x9d9S\xd7\x06\xa93\xf9\x93\x9f\xdcj\xf1\xa7\xa1Ls\xb2\xc6\xbb\xf9\x8d\x14*tR\x04\xa7\xbd\x0f:t\xf6n\x5c\x13;8\xf8S\xf8\x08\xec\x06\x9d\x01\xe3\xc6\x09\xf6\x9c1\xbe\x1cU^4\xd1\xef\xd0Y(\x0d\xc4,\x1d\xde.\xb2\xe5}X#\xb5\x12\xedW^1\xa7\x9b\xa8J\xda\xac\xc7\x83[\xde\x8f8&>u\xea,\xd2o\xff\xf6o\x87W\xbc\xe2\x15a\xb16/\xa4\x82\x06rq\xc4\x9a\x10\xce\x8c.\x14S\x17\x17F.\x88\xb86i\xde\xbcya\xfe\xfc\xf9\xe2\xfdY\xe1\xe5\x97\xbd,|\xe5+_\x097\xdex\xa36lh\xf28k\xf8\xd1\x09w\x225\xbe\xe0\x11gU\xd4t\x15\x88\x16\xb3T\x08\xad\xd2\xd3\xeb\x145\x98Pa\x84\x02a\xfd**11s\xac\xc1I\xf1e\x06\x1d:Q\xd0h\x9aA\x92\xb5C\x8bz\x152r\xabQ\x89\xc3\x0c5\x1e{(\xfc*\x9c\x08\x1b\xd3T\xd2\xe3-\x05\x9aj\xd3<\xac\xa4\x8bF\xe6Z\x8c\xd3!\xb0\x97>\xfb<=\x9c57\xce\x81z\xa43z4Z\xb5\xf1\xc4!\x0e\xe3M\xee\xc8\xd1\x83v\xaf1^\xb5Bb\x0cN$c~\xa3?\xc7\xa8I\x95Y2\xd4\xcc\xa1\x96\xae\x01k#8\x96\xc0\x11\x0a\xf1B;\xd5\xe8\x81\xdfy\xc5\xbbB\xf3\xb2\x13\xcd\x0b\x1d\x87-\x9f\xbbZ\x8b\xe6=\xb6\x00\xcb\xce\xab\xac\x5cGw\xe5\x13S\x10\x11H\xa5\xcb*\xaa\x8d\x1a\x04\x17\xa8M\xd3*p\xd4\x5c4B\xa0\xbc\xd1('\xa5w\xaa\xd1;r\xf04_\xdf\xa2i\xa4vvZ\xa9\x13e\xd7\xa90\x9fo=`\xf5\xad5%feJW\x011# .i*O\xb7Vk\x01\xe3h-~oe\xeb\xb3\x84/\x82\x04~\xf2\xe6\x0eO5S\xea\xa7i\x0d\x94\x85f#\x90q\x993BT2\x04\x8d]\xf5\xaf^\xf70\x9buL\xba\x10\x92\x9c\xcd\x5c\xd5\x13\x02\xe6>\xd9\x8f\xf9W\x18Q7\x82Y\x14\xc8\xbd\x8cZ\x0c\xcaf,\x9e\xff\xfc\x17\x85K^\xf4b\x8b/\xd1\xfb\xde\xf7\xbe\xa7\xb4PQr!g\xf12\x07\xff1:\x191\x87\xed\xa7\xeea\x9aw\x91l\xd0Ac\xb6;\x0f\xc2c\x8dz\x9a\xb5\xb6\xc4\xe1Ov02u\xc7z\xb1\x18]\x89$\xe2\x95\xf2\xc8\xddj1\xc1\x9a\xc0U\x07\x8b)\xae\xf1\x04\xc4DQ=\xf1\xc4\x13\xc3\xdb\xdf\xfe\xf6p\xe6\x99g\xdaZ\x11\xb8\x9e7\x13\xf9\xdbW7h2\x9a[\xb5jU\xf8\x83?\xf8\x83p\xee\xb9\xe7\x86O~\xf2\x93a\xf5\xea\xd5\x06'X\xb9g\x8bA\xf5\xa9\x8f+x\xc8\x1avfLW!e\x93\xa5U\xfc\x1c\x8d\x0a\x0fe\x88\xd5\x1e_\xb1\x00\xb8\xe6^\x80f.\x19(\xfa\xc0\xc2\xee#;\xe4V-f\x86\x03\xb5\x8a\x92\xc5\x9e\x9e\xd6\x90q\x8b\x0ai\x5c{A\xc8\xc8A\x92\x9e[\x88\xc9,\x83+\x93\x99N8\xed\xe8c\xc39+\x8f\xb6\x1d\x22\xa3\x92\xc0&\x93\x14\x06\xbd+\xa6\x0a`\xa0\xad\xdd(\x10\x8a\xb8\xacf\xa2@at\xe1\x03t\xac\xc2\x07\xd5\xba\xaa\xccO\xd5j&#\x993\xe5P,\x5c\xa3c?c\xe9\xe6\xf1\x9f\x89\xf6\xb6\xb3_\x1e\xa6\x9f{y%i\xdb\xaf\xff\x9b0\xb4\xfa\x01M\x05\xc5\x85O\xd61b\x9e(\xcfU\xda\xe2S\x08b\x98\x80q\xd4\xc3(\x08\x9c\x98+\xec\x18\xfa\xeaWo\xd0t\x91\xa62\x98\xbc\x17|Xg'\xac!\xce\x1a\xa9J`5\xb9X\x85\x1e\xa9\xa6'\xf5X\x1c[\x9a)\xa7\x9b\xb5\xb6\x10\x0b\xaa\xb1\x22\x0cl\xd2H$\x1b\xad\x9b\xa8\x15\x0e\x9b 6\xea,\xc8N\xf1\x82]T?\xfa\xd1\x8f\x8d\x1fL\x9d\xfd\xec\x8e;T\x07\xb4\xa0\xac:\xf3O_\xfag\xddF\xa0\x06SB\x89\xba\xc1\x1f\x853\xd6\x0b\x96Si@%\xd82\x80\xc3\xe1\x13f\xd8\xea0\xf3;E\x06\x12~<7\x15\xc3\xb4_2\x1b\x85n\xe6\x08`A\x9c\xde\xfcK~\xeb\xd2\xb0SOA\x7fW\xd3=\x8e6\x8e\xa1\x0aN\xe8\x18\xf0 \xfe\x94\xb5i\xe3\x84\x0b/\x093t\x9ej\xfb\xea\x07uNg{8V\xd3R[7\xae\x0d\x8f\xdf}\x7f\x983s\x8e\xda\x1f\x1d\x5c\xd5\xa6\x86f\xad/\xb7\xb5\xe99s\x09s\x0e\xe52J\xed\xd7\x88\xa1O\xbc_\xb8`^x\xb2{\x9dm6\x10G\xa7\x1c\xc3K^\xf8\xfc\xf0\xfb\xbf\xf3\xe6\xb0\xec\xa8\xa3*\xf93e\xcf\x07\x80\xc8\x99\xca\x8b/\xbe\xd8FW\x9f\xfa\xd4\xa7\xc2\x1d*O\xda\x91\xd7\xa7#'\xda\xeb=\xbe\x1aW\xf0\xd4z\x19[\x8c`I,\x0a\x1135\x03\xc9\xb3l\xac{\x15\x02u\x84F>\x94*\x06\xf2\xa5\x1cf\xa9\xd0\x8dj\xbb\xe2`\xb6\xb3\x82\x91\x16\xcd\x10\xf5Le\xd7\x0a\xbd-R\xca\xc2\xfc\xe7\xb9\xab\x8e\x0d\x0b\xb4\xf5\x9a\xe9\x01\xf0@`\xd0n\x82G\x00\x06\xab\xdc\x14K\xc1\xe7\xb0\x1fkHvs\xac\xe1E|\x191X\xe3f\x8d\x16\xd6\x8a\x22\xc6\xb5\xc2'q\x8aF1\x22MG\xc5=g\x00\xa7\xca\xb3\x09\xe8\xe6\xfc=\x13\xac\x8d\x8b\x8f\x0b\x9d\xaf\xba\xba\x92\x94=w\xdc\x18\xf6\xdc\xf2\x15\x9b\x82e\xa4\xed-\x9a]jY\xc1\x8a|\xb5Q\x8f8g\xc2G\xf9\x88\xf0a\xea\x96\x5c\xe9\xd7\xf6ytz\x91\x86-\xe1Eg\xca\xd6\x10\xe8i\x8a4>(\x17\x98\x09\x87~\x8c\xd9\x05\xb0\x1em,\x00\xa2?N>'\xf19\xdcF\x9e.\x98Hq\xeb\x00\xd1gj\xca\x04\xb7\xf8\xd3j\xdb\x91\x19]\xb0=\x82\xce\x18i\xd7n6\xed\xe4b7\x13\xbb\xaa8Cb\xc7\x14|\x1e\xd3\x03\xc9xQSR\xe1\xb9x\xe3\xc2\xc8\xf8\x0c\x1e\xff\x15|'P_7t\xd1\x89\xac\xcf\xfb5h\xc5#\xed\xc4.5\xde<\xd90S[\x90O;\xf5\x94\xf0\x8d\x7f\xfb\xba\xe5Y\x05)3\xd4\x06\x0f\x9dC\xab8K\xd5\xaa\x9b\x13H\xfc0;\xd7\xd4@q\xa7\xdc\x90\x04>;\xd5(bl\xf7g\xb6\x9fG\xf4H0\xb7h\xec\xda\xad\xad\xec\x12B\xf0k\xbd\xb6\x7f\x0fj:t_\xd4\xc5\xc7/\x0a/\xbc\xf4j\xad\xe3\xa8\xad\xabM\xf4\xbe\x909 \xdc\xe3\x8f?>|\xe0\x03\x1f\x08\x9f\xf9\xccg\x06%|\xee\xd3\xc8\xfb\xbe\x89\x08NQ\xf0LD\xe2`\xb8i\xa1L\x05\xcf\x0ak\x9e\x5c\xc6H\xf6\x93\xcf\xd2\xae\x94\x01\xf5\xc6\xb8}\x18t\x1b\x97\xe0N\x99\x92\xf4\x89\xe3\x94hm\x11\xde2\xcdG\x92\xd94(\xcc82\xac\xad\xcc\xf0\x0b\x8072\x8a\x0faD\xd1g$\xc4d\x05\x15\xd2\x84\x90t{\x14.s\x8f\x19\x8b` \xfc\xa8R\xe1\x03\x1c\xe5n\x86(\xbb\xc3\xcd\xb1\x8e\x1d\xb8\x82\xc8\xe2k6\xf99\xf2\x1a;bv0UiZg\xe8z\xf3\xff\xa8\x1c\x12\x1d\xec~$l\xfd\xd7\x0f\xd9\x90\xddv\xb0)0\xe3B\xc6p\xd3`\x94\xa0q\x1dNB\xc6\x18\x179N\xfe4\xa9\xf1<z\xc5J\xdb\xce\xba]\xbdb\xa6\x90x5\x93\x06u\x8fn\x0b\x98;o\xae\x1a\xd8\xe6\xb0Q\xdbDg\xe8l\xc4,\x1d\xd4\xdb\xb5{\x97^\x06\xed\x0ds\xb5\x16\x02\xa5\xb5\xeb\xd6\xa97\xaakq40\xe7\x16\x84Q6\xab\xa8\x01\x1f\x93\x91\x07\x93\x19\x07\x91\x16|\x98\xa6\xe3\x02\xd3\xb4\x83\xc9\xca\xb6\xea\x0f\x9b\x09P\xac}rN\xc4\xa6s\x94XF\x85-Z@\xee\xd1\xd3\xcam\x9a\xc7\xe7\xed\x9dAM\xa7\xc1\x07\xe3\xb4\x0c\xceb\xb6\x15\x97\x98\xb6\x94\x83\xaa\x95\x94\xfd\x98\x19\x18*\xd3\xa2e\x0a\xbfv\xcd\x95\x0e\xc6\xe2\xdfj\x96\x0c\xb1\x9e\x8d\xf5L\xdc>\xfb\xb9\xcf\x85G\x1f{\xcc\xe2\x7f\xd7/\xeeV\xd81\x0e\x8e\xed\xf1\xd8\xf7\x988\x85}\xd7\x89A\xdf\xeema\xa8\xab\xdd\x0e\xac\x96U\xe6\x864\xcadJ\x8ai\xe0]\xda)\xc7\x19A\x0aTY;\xe7\xd4|\xc5u\x10\xda\x17M\xc7q\xaf[\xe4\xa5j=\x85.\xe3\xab\x0c\xe3*h\xbf\xee\xcaW\x85\x97\x9dr\x94\xce2\x8d\xcf\xb3q\x09\x1cD\x07\xf2k\x8e\xce\x17i\xea\xad\xe1\xa1\x87\x1e\xda\xf0\xb6\xb7\xbd-\xb7\xd5\xa36\xb0#D\xf0(o\x94\x01D\x9e\xdds\xd5\x82\xa3\xc8ZaDh\x94\xc2,5\x18\xea'T*\x83'%-\xe8L\x09\x92i\xadm-\xbawK\x0dN\x86\x0f\xae\x15j\x0c\xa6b\xa3n\x85V\xb4M0\x09n\xb4\xe4\xc9\xfa_\x8a\x08\xd7Xph.\x0a\x22\xe6i\xa3\x99a3\x02\x0a\xe1D\xbc)H.&\x08\xb3F\xa5\x11L\x1c\xea\x81\x81U\xa7\xf8b\x8c\xeb\xe1%d\x9e\xb6F\xd2\xd5\xf5\xba\x0f\xe8$\xf7\x22K\x03\x87D7}\xfa\x8f\xb4\x13QgMX\x9cT\x05\x8c\x8dJ\xc6\x01i\xb6\xe6 \xbe\xc7\x91N\x9cr3\xce\xd3o\xa1^\x93\xcb\x94%5\xb4\x0d\x126]z\xb4\x8c{\xbcxu\x12x\xabt\xcea\x91\xd3\x9d\x12:\xd3u\x11,\x1b\x10xo\xa5\x9d\xcb3%d\x068\xb1/\x5c\x9b{W\x1c4\x11\xac\xed\xcd\xea\xd93\xcdd%\xea\xc8g9|\xeb\xd5N\xa7^\x9d/Q\xa4\xa3R\xc1\x8c\xf5\x8c^\x1b\x0db\x14 v\xe8P\xe9B\x10q\xfe\x8d\x1e\xba)\x9bJ\xc0\x04\x01\xf14\x0e+\xb3\xfa\x89=\x12v=\xe2\x99\xcf\x8a[\xb4M\xfc\xcb\x8cC\x0c\x22\xeaF5i\x04\xaa\xf4Y*\x19\x09\x8fK\xe8\xac\xeb\xee\xb60lM+\xc1\x9d8\xa4C\xe9\xaa\xdb\x13\xd6=\xac\xed\xd9\xfd:x\xaa\xf7`\xa7\xeb\xe6l\x09\xf8\x92\xde\xf9*q\xc3\xa96<\xa9\xc1P2\xd5iV4\xb8\xbaH\x0c\xb7\xfc \x1f\xa2\xb0!~cZ\x8fq#\xfd\xd2\x97^\x1a~\xe7\x0d\xaf}\xca\x85\x8eG\x90|\xd2Th\xd3\x05\x17\x5c\xf0\xda\xbb\xee\xba\xeb\xa7Zk\xfa\xaa`*\x8a\xd6\xa29\x9a\xe9G\x86\xe0\xa1\xa1W&\xc4\xc2\x9d\xc5/\x96i\xb3`\x9c\xa6!\xeb4m,\xd8\xa2]k\xe4\x1c\xd9c(t\x0e\x106\xf4,\xf4\x99\xe0Q\xa6\xb2a\xa1Q\xd7\xd5&d\x8c\xd6D?)\xae(Y\xa3G'E\xc7\xc8\xb2\x8a\xa4m\xdcb.\x1f\xc2\x88s<C|\x12;\xc3\x1a?c&\x15q\xf4\x14C\x22z\xa6R\xe2\x09\x00p\xbe\xa8Uac<EZ\xcf\x90\xdf\xf6K\xde\x12ZN8\xbf\x92\x9a-_|\x7f\x18\xd6\x16U\xdb\x1dD^\xaa\xf14^\x88\xdf6\xd5e\xec\xc8\xcc\x15_n\x90#\x9d\x161\x93\x87\xb86\xe8\xc2\xcc\xd1MqK(e\x8b<\xb1\x13\xf6d\x88\xed:b\xdb\xb0\x0e\x1f\x0e\xad\xd7\xa7m\xf7L\xd1\xc9\x0d<\x0bS\x90J\x83'\x9a1\x8f\xf29\xe5a\x1f\x99\xba\xc5_\xe9AyZ*:\xa37K)\x02\x04\x0c\xec\xdav\xae\x91\x9d\xab\xccg\xe6N\xda\xe1\x8d\xd3\x8bX\x15z\xb9ppu\xb7\x889\xfe\xaf\xe1e\xc2\xc7B\xb0<\x88\xe1\xb4h\x04\xc6\xa9\xfe,X\xa8Fc\x16\x1e\x9b!\xb8\xc2j\x22\x15Q#=\xc73[\x12gF\x0f\x94\xb7\xbcJ\xd3\x80\xd9?\xcaT\xbas\x8bs:\xeb\x1e}\xc2>o\x9d\x9a5\xad\xa9F\xc9\xa6\xd6\xec\xb0\x16\xad\x83\x05,\x01o-\x85\x9c-H\x0a%-\xc7\xd4\xd5\xe9\xa7\x9d\x1a\xde\xfa\xd6\xb7\x86v\x96\x1f\x14\x97#E\xc1\x1f=\xe9\xbdP\xbc\xfc\xc8\xad\xb7\xde\xda-\xfd\xf6zq;\x22\x04\x0f\xbc'#\xd2\xa2QcV\xa1\x9c\xa5\xb77F\xdau9(g\x0dH\x09y%\x01\xc3X\xc3\xe6\xaf\x11>\xf4\xe2h=\xd4\xa3\xe5*w\xae\xb0\xcfj\x0d>\xf6O)0\xafl\xc4\x93\xed\xe5\x088]\xc0\x12\xa6S\x10\xf5\x17\xa7\xe6\x18\x09!\x8ct\xeb\x01BH\x0b\xb1\x8c\x86\xb4\xe1H\x18\xe3\xa9\xe8\xc2/\xb4SE\x9d0X\xde!E:B\xcd4\xe4\x93\xa9\xe6\xe3\xcf\x09\xed/yk\x05m\xd7w?\x1f\xfa\xef\xffq\x9c\x9a\x10\x8f-\xd9\xf0\xb7\xa61\x88#b\x1c\x8dg4V*\x08q\xcaM~`\x1a\x8exV\xd9h\xd3\x0e#z\xc8-zY\x96i;*w\x0b\x07\x90\xa5\x10N\x8cn\xf6\xe8\xaa\x13;p\xac\x12\xc8\x0d\x014>\x16\xb6B\xa8\x09\xda|==\x7f\xbc\xf1\xcc\xebV\xb2a\x19u\xcfG3\x96\xc4\xac\xc4\xc3\x7fsw]\x8e\x99=-\xd5\x11G\x90\xcc\xe0\xba\x91\x9a\xc2\x0f\xf8\xfe\x81\x8e\xf0'`\xa6\xc6\x8f^\xb5*\x5cy\xc5\x15\x15*\xe4\x8dE!\x83XXYFa\x8ey\x17\xe3B^\x9a{\x8a+\xb3\xc3\x13}\xaf\xa6]o\xf8\xd5\xaf~\xf5\xc3\x0c\xb5\xa2\xa9\xfc\xa8X\x95\x1b\xf5\xe9\x11\xd7\xe16}\xd3\xf5u\xea\x9b\xd56{\xc1\x85\xa2q\x9c\x90\xb3v4\x0b]\xf1\xe8\xd4;F\x17\x9e\xa7\x9b7\xf4D\xc3O\x7f\xfc\x13\xb5G\x1c\xf4\xd4\xa6'\x8d\xacm\xe7`VNY_\x1b\xd5\xc6\x84]z\xa6{\xaaj\xee\xdc9\xe1Mox\xbdm)\xa7|\x1fi\x8a8)\x8d\xcb\xb5\xe5\xfd\xaf\xef\xbf\xff\xfe\xd7\x9dr\xca)\x1cJ\xaaQ\x87T\xf0P~\xbc T\x0d5\xe1\x1b\xd8\x0a\x13+nx0\x95\x15\xfc\xcc\xc6b\xf0\x9c\xf9\xf3t\xd9!\x99\xa4\x11\x0fB\xc6:hj$4\x9dR\xd6Qk;\x01.\x81\xd3\xa8goG\xa5\xdb\x1dDL\xd7\x1cde1\xcc\xe2I\xbc)\xbc\x5cK\xd2\xa2\xb0T\x86$l\x98~\xe3\xc0_\xbc\xe7h@\xc2\x88Cz{\xac\xe1\xabF\xc6S\x1a\xabQ\x85KU\x04\x99\x0c\xe7\xc8\xe9\xcc\xd4\xc4\xed@,\x0d\x9aZ\x9b\xf1\xba\x0fVHpH\xb4G\x87DM8X\xa1Q\x9e\xca5]\xbb\xa9 \xe3\xc2\x7f\xd6\xd8\xd8\xb6\xfa\x9c\xf0a\xea\xa6Wwc\xed\xd5\x0d\xceV\x02\xa5!v\xa2\xd9M\x84 \xb3\xdc\xc0B\xca\xc4\xb6\x17\x81\x93\xf9\x8b9\x80\xeb\xd3L\x11\x7f\xd2\xa7\xdf\xac\xac\xe6\xf5\xaa\xb0\xa9\x0a\x9d\xe8%\xab{\xe2a\xf4\x8aP\x88\xf4\x22\x8d($R\xda\x1eV\x0a\xf3\xf0\x80M\xaa\x14\x90\x8d4\x09\x90\x7f\x0f[\xf5\x9cs#K\x96,\xb1t@\xd3\x85\x054=\x0c\xd7c\xbeUCKqS|\xcc)\xae\x1a\xc9!\x9dC\xf9\xe5}\xf7\xddwm\xd5w4uww\x93x\x96\x86\x19V\xf1\xde\xc2L}s\xf5-j\xee\xe8:F\x94\xf4\xd5\xaax\xce\xa8#\x5c\xf6\xdc\xb3t\xe1[_\xb8\xff\x1e\xad\xb3\xeb\xe1=\xf5vt\xeb\xb7\x9e\xde\xd0t/\x9dd\xe2\xdd\xa0\xdd\x97\xc3\x83\xadZ\x17\xd2f\x04\xa5\x9bs?q\xd3T\xb5\xe2[\x89\xcd\xb2\x947\x81^\xff\xda\xab\xc2\xca\x95+l\xa4^\x1b\xf2\x91a\x83\xb7\x08\x1f\x8d\x08/\x96\xfe\x1e\xc5\xeaj\xa5U\xe0\xea\x94\xdb!\x13<\xbe{,\x16\x7f\xf1\xd9\x0d\x19o\xe0#\x1f\xaa\xa4\xfb\x85|\xad\xc4J^\x04\xc7_\xf9c\xea\xa5CO\x13\xe8\xc9$\xf3\xc4\xc0\x86\xbb\xd1\xd5\x0f\x91_QQ\xe6q\xe5\xbd\xa4R\x18\xd5\xa6\x02\xce\xf14kn\x95K\xf0,\x0c\x0f\x08\x8a\xb9x\xc4@\x0e\xf4\xd7\x05e\xdc\xba*Y\xa8\x11\x91\xe2\xa1\xf3O\x08\xa2&M_\x0c\xb6\xd4N\x07\xd8\xc8\x89\xe8\x10\x1fcN\x8cd\x1a\xd5J\xac\x0eI\x9c+\xd4\x0f\xab\xa1A\xa3\x8f\x19o\xfak\x1d\x12\xd5\x05`R#;7\x85m\xff\xf8\xa7\xd6\xbb%\xb3\xec\x86\xe0L\xa8\x18\x82\x18\x14\xa7\xd9\xa2\x0e,\x96\xa5\xbc]\xbc4\x07M\x99\x18O3\xde*\xc3Y7\xb4jL\xb9\xa1\xb2+\x1cA\xd5\xf8D\xc4\x98\x05\x91\xc9\xb6\xcd\xdez\x91\xf2\xe1\x02(\x22\xe0)\x1b9Y\xccr?us.\x87s\xa8\xac1\xee)uf\x01\x98>\xf2F\x19\xb7h\x8e\xb8V\xee\x94 \x17*\xa4M64\x19\xa6.t\x9c\xbe\xeb\xd5p<< \x13+\x84\x0e\xdb\xa9\xe3\x0d\x08\x16\x11<\xdb\xc7t\x16;\xedRA\xe1\xd4<L\xd7\x81;^\x0as|\xdc\x80\xf39\x1en\x12<\x9a\x85-uJ\xc8\xe8\x95\xbc1\x8aR\x13\xe7!\xd5\xd2\xc8\xcc\xc9Y\xae\x91\xd0\xfc,\x17\x0b\x8dUt\xa0\xd8\xa9\xf6\x8d\x1f\xfe\xc8:3{\xf5@\x5c\x87\xee\xff\xa4}b\x9dph\x80\xddn\xba\xc8\x95\xb54Qk\xd6\x1a\xd0\xe2\x05\x0bt\x07\xdc\x90\xeek\xd3\x13u\xe2\xff\xa0\xb6WO\xe3)o\xb1\xa1O\x9b\xa9Z\xd5\xae\xed\xd4\xe8\xfc\xd4\x93O\x0e\x17^p\x9e\x9d\xd7\x1a\x1b\xf2\x91\x03\x11\x8fK\x9ar+\x89\xb7\xbf\xfb\x8b_\xfc\xe2F\xf1\xf7\x87i\xec\x0e\x99\xe0!\x10\x16\xe4U\x84ca\x06\x10K5&\x95\x90\xa8\xf1\xcb\xbb\x17\xdc\x82k\xceU\xb0L\xb10vi\x9b`\xd0m\xbc\x8c\x1e\xf0\xa6\xd9\xfa\xe8_\xf9^\xe2p+\x0bv\xbaN\xb6,AC\x01n\xd0\xc5\x8c\xcdz\x8a\x98i\xae\xbd\xda-B!\xb3O~itl\xae_\x94\xac'a\xf4\xf4s\x90T\x9a\x06\xe2JXm*\x88\xed\x8a[\xaaf\xa92u\xaa\x17\xc4B7\xd3sl\xe7\xb6J!|\x8fW\x8a\xffL1/}\xcb_\x85\xe6\xa5\xc7[r8$\xba\xf5\xb3\xefR&\xed\xd2B~\xe4O\xdc\xc6+^\x88\x0f\xa88}fF\xfb\x89\xf0(L\xaae\x88\xfa\xef\x5c\x8b9@\xbb\x95\x91\xb0rE\xfe\xd3\x98E-\x0a\x1d\x1a]\xef\x84\x99 \x92;Sp\xb3\xd5\xc9a3\xc2\xa0\x9ewn\xd6\xc5\x8d\x146:;\xca&\x9d\xcf\xd8a\xd3%lvQqd\xd6U\xf4\xd5\xc3\xd3\xeb\xa0\x84y\xb8\x15a6j\xdb\xb4*8\xb5\x85\xc8\xd8\xd5\xfd\xf0\xa3\xa4{\xbc\xa2\xa2la2\x0c\xe3\x83\xd92X\xf4\xe6n\xfb\x22t2\xeaY\xc2)\xbf\xfb\xa3\xac\xdcsF(\xf3NL\xbc5H\x05\x8f\xd3'/\xdd<Yx\xe0Y\xde\x0b15\xa7\xfe\x14F\x83\xd6If\xa7\xb0\x031#\xf4w\xee\xe8\x097\xdf\xfa3\x93X<\xce\xd65\x83\xabj\xb8-]\xf1Q:y\xac\x10!\xc4\xe5\x9eMzz\x9cQ\x92\xbd6\xaaN\xb4\x95|\xd1\xb0\xcbQ3\x9d\xfb\xf3\xda5M|\xb9n\x0b`G\xa2\xa6\xfa\x0e$\x8a\x87\xc5/\xfc\xd67C\xfc\x7f\xf7M7\xdd\xf4\xd3\xe7?\xff\xf9\x08m\xcb\xe5C&x`_\xa3\xba\xfe~E\x8d\x97IB\xb5\x22\x9e\x1528\xc0\xa2\xfcx[U\xe9\x0d\xcd\xd3n\xb6\xbd\x5cE\xc14\x9b\x0a\x1dSZl\xeb\xe4\xba{\x0d\x96$l\x94\xa9\x06S\x81\xe5h\x83\xfc\xb0\xa7\xbeW\xd7\xc2\xef\xd0\x0e)\x82\xa2Y\x92O\x09\x9e\xd8\xb07\xa9\xc5h\xd1z\x10W\xf5\xb4\xd0\xaa\x1cf\xd5\xa5\x11\xd9\x5c\x1d\xbej\xd2\xb6\xcb\x01\xed$\xea\xd3\xfc\x1c\xd3slX`\xe3\x02\xbdtE\xd5T\xc2\xaa\xc3\x1c\xcb\x83\x1b\xdc\xdc\x17\xbe.\xcc\xbe\xf8\xd5\x15\xa2;\xbe\xf2\xe10\xb4\xf6A[\xa4\xf5\xde9iua\x93\x0a\x1f\x1f\xf58S(C\x5c\xaeY\xa6'a~\xa2\xf0\xb1Q\x8fM\x0d\x19\xd8\xd1)\x12f\x8e\x8d\x0fE\x04\x7f\xf8\xc9\xfcKC\x80\xb0\xeb\xabW[\xaei\xcc\xd9\xed\xd6\xa8\xa7\xa0\xb9\xd9\xd7v\x1d\x89\x08g,8x\xc9\x94\x08\xbb\xc1F\xd5\xe1\x91/]T\x89o\xe8J\xcf\x1aF7\xc7\x98\xc4_wKanN\xf1\xa7\x82g\x17\xdcZX\x1a\xe9\xab\xdcX\xbd\x226\x96\xb6\x98\x16\xa7M\xea\xe0AU\x8ff\x81\xcd_t\x1aO\xe8$T\x22\x91\x84\x96\xf9\xb4t\x1b\xc5\x8a{\x84W}\x8eo2/Y<\x0c\x0b3R^\x0a\xc1\xc3!EW)\x8fR\x18p\x94\xf3\x8d\xf24\xde\xa2;\xb8^\xde\xf0\xa30t\x1e\xb7a\xb6\xe0\xf2n\xc3`\xc0\x07\xa4\x88\x07\xcf\x1d\xa8\x80\xd8\xfb8\xbc\xd3\xd3\xa8QN\xbb\x1e\x7f\xe3\xb0\xee\x1a]\xb8\xd9\xa7WF\x19\x1d\x95\xb7p\xfb\x9b\xe2\x8ey\xfb\x8e\xaa\x99\x9eM\x06G\xbf\xe8\xb9\xcf\x09\xc7\x1dw\xec\xa4B'K\x1f\x0c!=x5\x05\x9cOJ\x9a\xa55:L\xf2\x8b\x1f\xe8\x90\x17(x\x87\x02\xee\x9f\x95\xbf\x0c\xcf\x1c\xb3\x1fM\xb5\xe9e\x99\xa6\xe7i\x03\xc8\x0b\x04\xfaV\x16\xaen\xae;D\x8a\xe42\x9d\xc4=Q\xf4\xe6Q\xfek\x15\xd4 \x11\x08\x9c\x07\x8c\xea)z\x0b3\xd4\x03\xdd\xca>u\xa6\xd5T\xb1\xacl\xa8\xc11\xe1#\xaa\xac\xe9@\xbd\xc4s\xc7\x0a\xafA\xe152dU\xe1\xe5\xba\x0a\x84\x97\xc0\xe6\xd7\x1b\x1b\x04P\xa3^\xfe\xe2\x1e\xba\xe9\x0a\xa3]=F\x9f\xfe\x02\xf3`*\xcf|ng\x18\xcd\x1a\xc5\xffr\x0fSM\x1c\x14\x9b\xcaa1\x16\xebk\x16\x1f\xaf>\xfd\xcbk\xaf>\x98q\x9c2-\xdd1\xa9d\xdc\xa2\xad\xcfo\xbd\xe7-'\xae\x9e\xaa\xbf\xe9G\x9f\x16\x96\xbc\xf9/+\xe8\xbdw|3\xf4\xfe\xe4\xeb\x99\xd0\xa1a'?\x95\xc7\x19F*|,\xeb\xdc'8\xc2\x8d0a\xf3\x1f3W\x02\xab*|\x22\x06\x15\x83\xda\x17=\xd3 c&\x9c\x08#\xcc\xe8\x1e\xf5\x08W\xa73\xb4\xeb\xba\x9d\xe9sx\xafG\xf7@\xebJ{^\xd9l\xd7\x05\xb5\x0d\x82\x0d\xea\xca\xfb\x11\x09\x9dF\xae\xcc\x97pb\xb4\xc1M\x02<.\xc6\xc9\xfa\xbdz\xbd\xb6U#%\xee\x15\xe4\x0a{\x22\xc9\xb4/q\xdd\xa3s(\xecD\x22\xbdl\xe1\xe6\x90\xa7\xc7\x8f\xbb\xb0\xe8\xa8q\x8d\xfe\x90^\xd6\x04\xafO[r[E\x9f\x04s\xab\x00qp\xfc\x0d\x1b6\x84\xdd\x9a\xd2\xb1\x19\x03\xf5\x9c-\x00\xa5Q\xc1\x88\xaf\xa4\x9d\xf4`\xc3\x0c\x13\x22?d03\x88\x82\xa0\xc90\x9e\xd0\xc1\x1fn\x86\x05\xa6\xf1\x0c\x9f\xaeR\xb7\xe8\x1e\xdd\xf2p\xc7\xcf\xeb`[,dp3\xd3n\xf0\x88\xc6\x0e\xbex\xf9\xc8\xfb\xdd_\xbb\xc7\x0d\xbaR\x0d\xca\xc3Y\xb7\xddv\x1b\x12\xae\xdet\xdb\xfe\x06\xa3\x0e\xaf\xca\xcf^\xbd \xbbf\x8d\xdaB\xb2Q\x85K\x89\xe4\xad\xa4&\x96\x058\x03\x10\x9b\xaf\x18Fff\x9d\xd2\xce\xfd\x08J\x5c)c/|\xfe\xc5V\x1e\x19\xedd\xf1\xae\x89\x17x\x8c\x86\xe8(Ip\xab\x0a\xe9\x0d\xdeR\x89\xf4\xd0\xb8bo\xd67]<m\x02w*\x9b\x80\x08\x80\xa9N\x94\xea\xc2&\xf9[/\x7f{\xa4\x0f+,\xdd#\xda\xc4\xc5\x8a\x8b$xX\xf7\x1aC3\x13Hz!\xa2\xf5\xcd\xd7\x5cs\xcd\xff\x13\x0aY\xec\xbb10\x1e|e\xa3\x1eUH\x86\x8cT\x0bW\x162\x96\xcc\x00\x13\xfa\xb2\xa1c\xac\x1e\x99\xa3$\xfeL\x9d\xc3(\xcf\xec\xd4h@\xc88ZA\x91A\x19T\xd20'\x92P\x0fF2\xb4\xac{\xac\x94\x8d\xd6c\xe6\xce\xa4i\xaa\xd4\xad\x84\x0f\xb9\x8a\x8a\x15\x13+\xed\x14\xef\xee\x90\x89\xad\x1a5\xb1\x96t\xa8\x14a\x1c\xd5\xb0;\xac\x1e\x89k\x1b\x87*\x9cCNW\xd3\xd3\xe2\xf9\x0bua\xd8\x17\x14\xd6K\xf4M\xba\x85\xadI\xaf<\xae\xfc\xc3O\xeb\x94v,\xc0\x83\xdd\x0f\x87\x1d\xd7\xfdO\xabD4\xec\xf0\x86\xcf\x94\xf2\xb9*X2P\xd4\xec7\x15H\x00\xc6\xda\xab\xc2G\x84\x8c.\xe5+\x92\x17mUt\xcc\x063\x02.|p\xc3\xac\x04\xaa\x87=CO\x12\xf3V\x09\xb76wv\xa9\x0c\xaa\x13\xd36Mv\xcd\xc3s#B\x9f^\xb2\xech\xef\xd4\x15\xf9=z\x14\xac#\x1e\xc2\xd4M\x02\x1dz \x90\xc7\xc3h,\x11\x12\x9c\x8b\xe1\xac\xd0\x88\x04\x03\xaf\xdar\x0f\x17\x0f~q`\xb3OB\xc8:\xb5Y\x9a\x97.Y\x1a\xd6mXo\x8f\xc41\xa7\xcf\xd0\xbeS\xefFq\xf0\x13\xeetjg'\xb72\xd0\xb8p0\xb6_\x07\x14Q\xf2n\xf16\x8bjD\xd5\x1e\xcd)\x5c\x98\xf6\xcfO\xfc\x83\x19\xf5\x84\x0e\xbe\x08\xb5*t\xe0MTQ\xaf\xda3h\xc5=C\x9b\xaa\x96\xc5\xdf\xa8Ze5\x80\xf9&\xad\xbe]\xda\xc3\xa3\xac`\xf62\xe3fw\x9fj\xb0\xe0ee\xafA=\xf3\x19;w\xeed\xf3\xc0A\x15<\x84\xa1\xf1\xa8:\xdf\xe2\xa5\xe2Mkd\x8f\xb6\xa9\xd3\xc2\x06\x5c\x1af;\xb3f-$\xad\x97\xb2\x83Nx\xd2\x0f'\x8e'\x9ep|8\xfe\xf8\xe3l\xb4\xe3\xe96\xe4\xe4\x07\x01100\xb0\xa1gw\xcf\xf7\xfb\xf7\xf6\xffLNOh\xb4\xb8\xab\xa3\xa3cP~J\x12X\xcd\xd2\xda%x\x8e\x96\xdb\x8b\xa4\xbfH\xfatF%\xd2\xc9\xecT\x95\xe5\x8e\xb7!}\xdf\x93\xdf\x1b\xf6\xec\xd9s\x9f\x04\xe0F\xd1\xdc\xa3\xf5\x9b\xd1\x1d;v4\xcb\xdc!\xd8\x02\xe5\xd3\x19\xc2{\x85\x08\xbc@_\xe5\x9c\xbe\xcc%\xd1\x87\xee\x0b.\xbf\xfc\xf2S\x84s/\x96C6\xe2\x818\xaaIS\x12l4\xe0\x1aw\xca|=E\xef\x86\x87\xddhDR\x14\x04\xc3l\xedf\xdb\xa3\xc2\x17\x17\x1e\x95\x0a\x1b\xf9 \xd2T!\x10>\x92@dWY\xef\x8b3=%\x04l6G\xdf\x81\xe0\xd1h\x06\xacH9\xa5.<\xf3/\xa1\xa5\x8c\xe5\xda\xfdC\xa5\xc4l\xeb\xb9]\xde\xb16|}\xe7pXW\x9a\xa9\xd8\x13\xcf\xa7\xb1jl\xbcP\xb1g\xc7\x04ME\xda\xaf\xa8I\x14\xd3\x07\xcb\xff\xfb'C\xf3\xdc%\x06\x1f\xd1z\xce\xb6\xcf\xbd[\xa5Q/\xc1J\xd0\xbb\xe0\xa9\xf1$\x8b\xd5\x84\xac!3AD\xd9\x10\x1fQc\x85M\xcc\xd7Zw\xe59\xbd}s\xc2\x9fQT\xdd\x17\x1d\x19!eN\xb2\x90?>\x22\x80\xfe\xd0\xd6\x9e\xb0e\x93\x0e^\xab<5\xeb\xd1\xb8\x01\xddw8 \x7fl\x9b'\xa9\xc3\xf6\xcc\x01t\x10lF\x05o6\xea\xa1\xac\x1bGd\x8fa\xa5\xe5*\x0a@\x0f\x8bpS\xb5\xfa\x89'DS\x14D\x02\xaa\xa9+0\xa0\x95\xb8\xcbni\xa0\xccg*\xd2\xb5\x96;\xc1\xc5\x8fS\x93n\xff\xd8c\x18\xf5\x84\x8e9\xda\xcfX\xa1\xe3\x8d\xfbT\xf5*\xad\xf1M\xc4\xc6\xa2\x18\x7f,\xed\x8e\x8d\xe0Q\xe3fy\xe40t\x0f\x1fs\xcc?\xcf\xc7\xaa\x8e\x1b\x0a\x5cp\x9c\xdf\xee\x17\x9d\xf2'\xc5\x1a\xcfL}\x9d2\xc7y/\xa0\x07A\x91\xb6f=\xad\xde\xa2W\x8b\xcbz\xca\x05\xae\x13\x0fF%\x03\x1aI\x97t\x81\xa4\xed\xcce\xcd@9Nn\xd26p\xbc$U\xcf>\xebL\x1bMs\x93\xb8\xa7#u\x17\x9f\xca\xba\xad\xfc&\xdd\x16\xfd\xa9{\xef\xbd\xf7\x97J\xcbN\xa5\xaf\xf7\xc2\x0b/\x1c\xf8\xf4\xa7?m\xf5Sn^X~\xa8\x97\x94\xbf\xa8\xed\xce/V\x07\xe9c\xaa\x87+s\xa3(\xa6\xc7T\xcd\xcak\x04\xff\x0b\x09\xfe\xafI\xd0\x0c\xe82\xd6\x91k\xae\xb9\xc6\xb2\xcb\xc3\x16\xce6\x99\xd7h\x03\xc1]\xc2\xb9^\xb87\x88\xa7\xcfKGS\x8aKYy8[\xb7N\x5c&\xdc\xc3#xH\xa9\xf6\x8ch*\x0d\x96\xf3\x97\xa9\xc4\xc0\xed\x00\xdc\xbf\xe6u\x88\xba\xcc\x14/;<\xa6\xeb\xd2\xbc\xad\xd6X\x08\x001z\xacl&aW\x1b\x99\x93\x09\x1f*\xe1\xa8\xedpC\x14\xa9g\xadF\x8d5\x13\x1b\xdfz\x985A\xc7\x8c%\x1a\x14=DY\xa7\x0a9k?\xc0\x0e\xa6\xa2\x81mU\xe5Y\xda5-\xbcf\xe0\xd7\x9a~\xe1\xfe\x05\x1b\xba\xd6\x14\x22/\x15\x1e\xb6%\x97\x0a\x93\x8b\x90Nn\xdf\xf8\x97\x7f\xfe\x17_r\xbc\xc3\xa4\x13\x9d\x06M\xf1\xfd\xab\x85\xa7\x81\x81t\xf6\xea\xb0`8\xae\xe0Yx\x85\xee\x90:\xe5\x22\xf3\xc2\xcf\x9aO\xfdAh\xde\xbeN\xd9\xc3\xed\xc8\x8c>\xf2\xa9\x16\x92\x1a\x84Z!R\xf1>\x06^\xc5\x03\xc7\xfd\xa9r\x1b\xcf\xa2\xf01>fB\x82\xb6\x8d \xad\x91\x96\x1e\xdd\x84O\xae[|t`\xb8\xb9]\xb7?k\xef\xac\xa6C\xda\x94\xba\xc1\xb6\xa5\xa1W\x1bV\xd6\x0f\xec\xd0\xf0N\x00m\x8a\x80\x0e\xe1\xa5\x8a\xd1\x0c*MR*\x98\x1c\xb7\x0a\xab\xf5oG\x052$\xe2\x85\x8a\xe1D3\xbf1\xee\xd1^\x89\x83\xd2\x16k\x16\xe1;MtA\xdd\x0a\xdc\xfe#f\xb4\xb8;\xbaq\x22\xc1\xaf't<\xdcH\x94\x86\x1b5\x9e\x1e\xb1'\xff5*\x95Q\x97Q\xacx\xa2\xee x\xc6S\x84]\xb7\x0c\x8d\xe7\xa1>\x9c\xc4w\xa9Q\x9f/\xfd\xf1\xfa(\xfb\x0b\x1d\x09\xed\xb3\x16\x86\x95\xa7\x9e\x1dvl\xd03\x15\xbbw\x87\xf69z\xf9\xb8cZx\xe4\xae{\xc3^\xedXS\xe37!q\xae1:\xf9\xe4\x93\xe2\xe8(-\x5c\xf2E\xfa\x99\x86\xbb\xfb\xfe\x07n\xf9\xb3\xf7\xbe\xe7\xffl\xde\xbcy\x8dx6(\xd8\xf0\xee\xdd\xbbG\x7f\xf9\xcb_\x96u\x7f\x9a\x15L\xe1\x8aU\xc8\x13-Zh$\xa3\x05\xffoj\x94\xb4Y\xe6\xafI\xd0,\xc8F&&t\x04\xbbSB\xe7\xf7\x14\xc4\xfd'\x9dt\x92E\xf0\xd9\xcf~v\xcc\xf0$\xb6\xd0\xc3*\x814\x22\xbc\x9ec\x8e9\xa67\x13\xe6\x09\x96\x96cU7\x94\x8f\x17+\xcc\x8fi\x93A\xff!\x1f\xf1\x10\xba\xdd\x91\xa6\xf8\x0d ((\xac\x95\xe8\xc7J\xc0hf0J\xa6\x18Y\xdc\x05\x9b=g^\x18\xd4]S\xb1\xa7\x19\x9d\x5c\xf8\xb0\xcf\xb0$\xe1#\xc9\xa2\xd1\x8e4\x9d\xdfa\x0d\x85\x9a\xc9PvT\x87G{5\xc4\xd3l(\xc4\xec/\xa3\x10+W\x12\x0d\xea\x5c\x9fp\x07\xcb\xcdz\xef^7\xc7J\x00\x1dL\xc5T\x09\xd3\x05st\xf0\x8br\xb3g\xfan\x9b\xaf\xb7\x98e\x95\x97\xf0\xb0\xa7\xca\xec\xb9\x82\x86{\xe7\x8c\x19Loi\xe3\xffaU0%\xdf\x02`\xa7\xabVWu\x9d\xf9\xc2\xb0\xe0\x95\x7fPq\xdb\xf4\xf5\xbf\x0f=w}?\xcc_\xb0h\xdc\x91N\x05Y|\xa9\x0a\x95h\x9ex\xa4\xe3\xc2F\x14\xc43r<V\x89z\xc2'\x1b\xa9X\x19\x88fa[\x99Cv\x0ct4\x85\x13t\xcb\xef\xf2V\x95\xa1\x9e\xbe\xd0=43lm\x5c\x11\x9a\xb6\xdf\x1d\x86w=\xa1sc\x14P\x94h'\xf9g\x10\xc8\x98s>7\xcd\x83\xe5\x7f4U\x7fs$\xaa\x0e\x99)\x1fF\x04\x136&~hW<N\x84\xaf\xd4\xcb\xcag\xed\x829\xc1\x11\xfe@\xb5_\xc3\x8bi0`f\xaf5{\xd8\xd1\x0btS\xbf1\xacH\xb2\x16\x0el_\x94\xd3\xcf\xfb\xa1\x11\xa3a\xad\xa7\x88\x8b\x1a>\xfbh\xd8\x5c\xe1\x07;\xba\xe3\xb8[jw\x9c\xac\xa1d\xbdb\xa9\xe3ME\xb7\xb1\xd2$\x88\xbc\x196\xadkfXr\xec\xa9*;\xbcD\xabY\x9c\xa5\xcb\xc2\xcc\x05]\xe1\xf1\x07\x1eT~h\x83\xc1\x98\x9a_Kt\x96nlY\xa8\xed\xd6\x99`\xa8qT\x9c\xc3\xf6\xbe\xa1\xe1\x7f\xf8\xdc\x97~\xb0n\xdd:[0f\xb4\xc1\xc8\xe8}\xef{_\xe7\xa5\x97^z\x8e\xa6|gJ\x88\xac\xb9\xf9\xe6\x9b\x7f\x22\xcf\xc3.,$\x00\x86\xaf\xbf\xfe\xfa\xdb\x8f;\xee\xb8\x0fKX}D8j\xaal\xa4\xb3\x01\xa1\xa3wv\xee\xd1\xc5\x9fH\xab\x98\xb9I\xc8\x12 3\xf5.O\x83\x04[\xdfUW]\xd5'\xc1S\xd6\xd7p\xec\xb1\xc7\xd6-\xf8\x19\xafOT^\x22\xdc\xd7\x1c\xdc\x166\x89Xj$&\xcd\x9a\xd0\x1c\xd1\xb0\x92\x16\xd3UL\x8dM\x9a\xd9\xf3\xb5\x0eG\xa77\xdc\xb5p~\xd8\xcbJo\xac.Ug\x08*\x07\xe3\xac\x9a\xdcU\x009\xd3c\xc3$+\x88\x12vz\x96\x97Q\x8c\xa1BO\x7f\x16\x9e~\x8c3\xfa\x89\xe1[\x93cw\xb0m\xd7\x82n\xbf\x16wgJ\xe8\xb5+C\x99&<\x18\xcazm\x12<\xb3f\xcf6\x01\xc4b\xb5\xed\xf6\xcb*\xf1xa\xc4x\x8e-\x96]]3\xd9\xfa\xf2\xc8x\xfe\x0e\x11\x9ci5\x0e\xcf\xa5*\xce\x0f\xa4\x10\x99UAJ\x0d\xb3\x17\x87\xa3\xfe\xdb'*.\xbbu+\xc1\xc6\xaf~\xcc\xecTto0*\x08\xf5\x0c\xe4+\xf9\x99\xb9\x91_&|\x04CU\xec\x983\x18U\x84\xe6\x15\xfa\xa6\xc7L6\x5c\x93DY\xcf\xde\x08\xe8\x87:\x95\x8e~X\xf4=J\xe7'Vj=\xe7\xd4\xce\x96\xb0[\xe6\xce\x86\xe9\xba\xa5\x82\xcb3\xe7\x86\xfb\xcb\x8f\x1a\xddH\xd0b`a9=o\x98\xbdt\x11y\x8f?8\xb5Y\x8eK\x16\xc1\x8c@\xad{\x06\xach.lRA\x93\xf7\x9f\xd83b\xf0\xa1\x02\x85\xa7f\xc9\xd2\x9d\xb9T\xe3\xcdH'\x06\xe8\xb0\xfd\xd5+\xd1\x9e\x92\xa1\x12\xc3\x1al\xc2v\xa1\x82\x99|\xcd\xab<\x1c|\xcb\xff\x1c~\x8a\x879\x138F_=\xff&M\x15\xad\xcc\xd3>`\xbb\xa2;\xb8wOX\xf7\xf8\xaf\xb4\xc5z\xb3\x1e\xe8k\xb5\x8d)\x83Z'\xe4\x08A\xb5t\x8f\x1f\xd21\xabVi\x9aM\xbb\xe1\xb8\xda)I?i@(?\xb6v\xc7\xe0\x03\xbfzx'\xed\x0c\xc2\x89\x11\x22\x82\xe7\xb2\xcb.\xfb\xd0\xec\xd9\xb3\xdf\x86?\xc1\xfa\x84\xfbI\x09\x9a?\xd3\xa1\xdc\x16\xad\x05\xb5h#\x8c\xf6\xad4\xcf\xd4f\x98'\xd41\xde!\xffs\xf5\xe9\x11\xe7\xa1k4\xba\xb9K\xf4\x15\x5cU\xe8\xfc\xf8\xc7?\x9e\xa7\x97L_/\xf8K\xf5-\x15^\xe9\xe8\xa3\x8f\xee\xd5\xbdl\x0fK`\xfdHk>\xdfV*\xaa=\x80$I\x12d\xacM.\xd6\xd4\xde\xc9\x02\x1f\x1e\xc1C\xf8\x08\x01\xae(\xe1\xda\x88X\x0d\xb2\x82F9\xd2\xbc\xdaP\xb2\xc6\xc3\x8e\x8e.-\xcc6j\x81\xb7_hI\xb5\x81TT\xf8\xa3\x11QFp[\xae].j\x8d\x08\x85Sn\xec\xb9\xc6\xd9\xb0\x93_\x19\xbd\x88\xb35\xc1\x0a\xa8g\xbf\x1c\xd8\xda\xbd[\x19\xc5\xbaO\x87\xef\xa9\x8f!\x1e\xd0/\x05\x84\x82\xce\x825\x85CeF\x11\xf1\x98D\xd21\x96\xd5`\xccN\xfa\xaa 3\xcd\xec\x9a\xc5\x5c\xdd\xc6\x1c\xf8P[\xe3}\xef\xb5\xa1\xe4\xa3\x86ki\xa0\xdc\xd4\xdc\xfe\x86\xbf\x0e\x8d\xedlx\x11O\xb7\xad\x0fO\xfe\xefwh\x10\x1b\xcb\xa4\x0b\x1es\x9c\xc2\x8fs\xa9\x12\x98\xf8\xe6\x02\x09\xb7\xda\x91\x90\xf2T\x7fT\xca\x98\xb7\xc2\xa0\x93b\xb9\xae_\x11\x81\x0e\xacw\xa1cu\x0b4\xc1\x19\x9d?\xb9\xa5/\xec\xde\xb9%tw\x8d\x86e\xed\x9a\x12l\xe9\x08\x1d\xbdO\x86\xad\xdb\x86CsY;\xcd\xcaq\xa7Z\x8c\xba7\xe0\xd8<\x86Y\x9eY@\x91\xae\xffF?\xfeK\x88\xe3(E\xb4\xea\x8a)\xfdj\xfd\x90\xd6Ta\x8f0\x09\x11K\xb9\xdc3\x9c\xa8y\x9c\xa3\xbf\x88\xeb~\x22%\xa7\xb9\xafz\x1a\x8f\xfd5\xa7\xa9\xa1\xc1\xe2Fj\xf2\x12ey\xaaD\xb8=\x1fF\x0aO\xcd\xee\xd7u\xd2\xe5\x82\x07<\x09\xab\x16\x85u,A\xe8#\x0a\x9e\x99x\xa9\xab\xea\xb6\xb0yL\xad\x1d\x0f\x0d\xee\x0dC\xbb\xbb\xc3L\xdd|\xde2]\x97m\xb1\xebLa\xb6iS\xca\xe8\xa6\xadv\xa6'\xef-\xb5\xafX\xb1|\xc2\xf4\xee\xe1\x8e.)\x1f\x11!tPJS\x8f\x84C\xbft\x1d%l\x98\xa6\xef\xea\x93O>\xf9X\xd9\xbb\x94\xd6\xf9\xe2\x81\x9e\xe4U?[;\xdd\xe4\x97)6h\xdc\xb7u\xeb\xd6\x7f\xc1\xbf\xf8R\xc9\x8a\xbb\xef\xbe\xfbt\xf9\xff\xbc\xda\xb13\xc9\x13\xd1\xb02\x86\xb0\xd3w\x96p_\xa7u\xa3\xb5\xa2\xd5\x8a\xa0\xcb+\xf8-\x1c\xed\xafi:Cn\xdf>,#\x1e\x8fD\x8b2\x81\xfb\xb0x\x89\xaf\x92\x229\x12)\x9bj\xcb\x10\xd9\x870k\xc1\xfc\xd0\xab]\x1a\xb1\x97\xea\x14r\xba\x17\x0d\xb6$\xca\xec\x02\x88=\x1a-\xca\xdcN\xed\xa2j\xb3\x11S\xe2OnJ\xbf\x01h\x1e0\xfa\xc8\x08(n\xc0\x18\xedD\xac\xc4\xef\x01\x1a\xc9$\xdbV[\x09\xbd\x96`><\xb3\x13\x9fZ\xb4\xd0\xd1Qz*\xa6\xda\x88\x05\x8b\xafy\x95\x8f^\xd3\xad\xf3.|nS\xc72\xc3+\x0f\x0f\x86'\xfe\xeemax7\x83\xb4\xa8\x9c\xffn\x9fP\xa7\xac\xc0\x83L\x077\x154\x04NYJa4\xb2\x84\x91\x15v\xc3\x10\xa4\x8a#\x88e\xb2\x95\x05\x1a\x5c\x00\x11D\x07\xa6\x7f\xa0G\xeb9\xbb\xc2\xda\x1e\xf5\xd2l\xeb\x91\xa6n(\x94\x84\xa4\x9d\x93\xb1\x8c\xe4\x93m$\xb2\x9f\x8c`\x05\x04\xee\xc4\xe5)\xfa\xe07\xf3\xab:_\x1b\x82\xdb\x5c\x8f\xf5\x86 \x9c\x9f\xa4\xd7\xed\x96~\xb3\x09\x06\xef2\xb2\x80\xa2\xd9a\xb1\xf9t\xbf\xd1=\x22;,\xaf\x1bY\xa3\x93\x10\xcd\x80\x8e\xeb8\xfb\xa2\x1b\xb5\xea\x8fy\xa5\x11\xd5n33{:\x9dfjO\xcd\xee\x8e\x9e\x87#l\x88#\xba+\xcc\xfa\xb8\x8b\xedxM\x17u\xe9\xe3\xec\x82#\xc0pF\xf6\xe9\x87[5#d\x19O\xa9\xa9\x0d}=;B\xf7\xa3\x8f\xc4\x83\xeb\xf2E\xe7F\xd2'\xf4\xee\xd8)\xa1\xe3\xc1\x8cGA{\x95\x17-\xb48\xd7\xc3 -\x9dm\x5c\x7f-\x92\xd9\x88\xc7\xf1\x94\x8e\xbf\xd6t\xdbu\xdaDp\x92\x1a\xfc\x95\x12\x16+%\x14\x8e\x93\xfb\xd1\xb23\xbai\xd4\xc8\x07!b\x5c\xcf\x04\xcf\xbf\xbd\xe4%/\xe9\x15]\xb1.\x0a\x1e]\xf6\xb9X\xf6\x7f\x11\x8fN\xd2\xe8\x88\x02C\xda+\xe9\x17\xdf\xe4l[\xb9\x97\xa1#\x94\xf2*\xa3\x05\xcd\x93p;\xac\x82\x87\x81e\xb32\x99+!\x10\x0e\xa4\x96\xd8\xa3\xc7\x03\xa4\x98\xb4mUO\x1a\xb4i=d\xa7\x1cI\xc8\xa4\xcaY\x90\x09 \xd6\x7f\x9a\x95\xb935\xca\xb0\xf5\x9a\xcc\xbd6\x8bi\xd0\xa3\x03\xbfN\xc2\xc2\xaa\xb1L\x1az\x81P\xe5@\xe3\xa9\x9f\xbb\xff\xbfmm\x9fy\x8c\x83\xd6}\xf1/\xc2\xde\xc7l#\x8b\x83\xf6]O\xca\x00B\x08\x95\x0a\x1a V\x962<\xc3I\xfc\x18\xbe\x90\x22\x0e\x9e\xb1 \xd02\x8f\x08\x05\x1b-\xab\xe7\xab\x0d){%t\xf0\xced\xed\x00\xeb9\xe0e\xcaJ\x8d\xd9\x13\xa0\xdcb\xb4\x9c`\xad[\x0d\x01'4\xa1NL'V\xf9zQ\xb5#p\xf1K\xe3\xaa4V\xda\x00\x174\xd1\xcdq\xcc\x16-\x95\xba6\xb1[\x8c[5<X9\x16\x06\xdd}Q5a\xca\xa3qR@z\xd7\x08\x9f|\x18\xd8\xd5\x88Y\x10\xee\x96\x86W\xcf\xcda\xe0a\xc6\x1f\x1f\x0d\xb6\x14g[\x8e\xd6\xba\xc5i2\xdf\xaa\x8f\xcd3$\x8c@Xd\xf2\xcf\x05\x90\xb6\xda\xda\x22\xb3\x9c\xea\xab\xb2\x0e\xbc7\xe9\x8a\xa8\x91\xc1r\xd8\xb1y\xb3\xa81\x02\xad*{J\xbc\x22\xdf\xaa\xf0\xbc\x89\x07\xef\xc6i\xcc\x8d?+\xe7\xb4\xb7\xac\x5c\xbe\xac\xe3\xc1M\xab\xf1Z)|\xdf\xff\xfe\xf7\x87\xf4Q\xf9~\x81\x83\xab\xdbo\xbf}\xa9\xd2|\xae\x04\xcde\xe2\xc3\x15\xd2;\x10\x1e\x8cz$\x88\xeer<\xd75\xcay\x83\xa6\x22OR>\x10\xfd\xdaf4\xf2\xc8\x049\xfe\xe5^\x09\xdf\xfd'\xbaX\x5c\xb6u\xb4\xc3*x\x88\x15\xdb\x96\x1b\x94_\x1c\xc0sE\xe6se\x04qfgP\x97\x0e\x8c\x0e\xea&\xea\xdalr\xec\x09tO\xb2\x0a\x15\xf3\xa7\x8d\x12>\xf1z\x9cz~\x5c\xecD\xb7\xc98V\x8fB\x01\xab\xe1@\xc3I\x7f\x7f\xc7\x05\x0d\x1d3?\xec\xb5k\xfb\x8f\xae\x0f[\x7f`\xa3\xf6\x1a\xc4\xfd\xb1X\xfe\xa8\x9c\xa0\xa6*|(\x0e\x94-odL'r\xc0\xac~d\xd3Yt\xec\xf4O;FC\xcdm\xd6\xf1\xd4\xb9\xa6/(\xa7r\xa3W\x1c\xdfz\xb2(\x18\xcc\xe2\x22Zv\xdd\x8f\xf42\xd3\xc5\xda\x9c\xa2\xc2lB\x8d1\x0e\xe7xx\x80\xae\xe2!\xf3>\x15\x8d\xb8\x8f\xa7\xf2n\xb6Ne\x8c\xc7\x8f>\xfe\xe9\x88a3\x09k\xa6\x9c\xb9J\xdf\xe9\xc5 #\xbc\x0a\x8b\x0dt\xa45\xd6\x0d\xf8\x81+\x85\xe1D\x88D&T\x00\xd5\x8b\x87\xc3i\x90=\x7fS<'\xe5\xba\xbb\xb9?\xec\xee\x0f=\xfbX\x84\xbfB8\xf7\xe8\x83y\x14!>\xdaI\xee\x1fB\x18\xb9\xde\xa4\xb3]\xf9F\xd8\xf8n>\xf438\xc0\x8d\xe7\x12\x9a2\xeb\xc0\x86Q\x82\xd8\xbe*\x9d\xc31\xc1C\x1c\xf3\x0a\x811\xaf\xa3\xb5\xe9]\xef\xf8\xfd\x17\xff\xfe[\xefxP\xebT\x16g\xad\xc5\x94\xb4\xab\xcd=\xa8\x9f\x16\xd3+\xff\xe5\xf3\xce;\xaf[:\xdf\xd7~\xf6\xb3\x9f\xfd\xa3\x84\xca\xa7%\x5cN\x10\x8e\x8eS\x0eo\x22\x0c\x85Ev\x98?\xad\xe1\x9c\x97\xf1\xcf\xe9Y\x9e0B\x92\xbf\x0amp\x98f\xab'$\xa1\x89\xbb>\xa6\xf7\xc6H/`\x87T1\xeaiah\x9b1\x91\xd4)>:4\x15\xc5\x8c\xb6\x96\x84\xe9\xf3\xe7\x84\xbd\x1a\x82&EqJq\x82\x02t\xdb$t\xb8-\x1ae\xf43\xdd\x00\xc5\xcf\xa1\xe0@\xe9\x98k\xfeyq\xcb\xdc\x85_\x16\xc3\xa9\x98aH\x87D\xbb\xbf\xf0\xfe\x83\x1a\x16y\x19\x0bK,\x195v\x0a5\x90\xe6\x83\xce\x00\x002OIDAT\xce\x86\x13\xf1\xccl\xc6h\xca\x0a>\x18\xc2\x13\x8c\x82\x97\xe9\xd8\xed\xac\x98\xaa\x16\x07\xfe\x00\xbb\xae\x22k\x8a\x19\x898\x82`d\xa4\xd2f\x16u\x9a\xb2uK\xbb\xe8\x96i\x06+\xd0\x90\x80f\xa4\xeba\xef\x8b\x1eC\xf5_\xa7\x15u\xa0\x16\x8c'\x838\x13i\x8b\x97p\x0c!\xe2\x18\xdc\xe2\x020\xe2\x11\x0fC\xb1\xf8U\xcd\xe0z\x1c\xdd\xdd\x10\xf5\x93\xfa\xc9\xbb9\xce\xfe\xeaF\xdb\x13\x94\x10\xa1\xb1eD\xc2GC\xa7F\xd2\x16\xd41\x03\xc3\x9e5\x80f\xc6\xce\xe1]5\x88\xa6\xbb\x19;\x1f\xb8\x8e\xef:t\xb2\xe9\xb6\xe93f\xccx\xe9{\xde\xf3\x9e\x8b\x15\x05\x1a\x106\xd4pd\xc0?\xec\xec\xe44\xe1\xa3\xfc\xaf\x08\x1ef\xcfx\x03\x8c\x83\xc1\xcd\xba\xde\x8bv\x8cC\xec\x5ckDGDM\x9e\x1d\x18u\x9d\x196\xcc\x0d:\x1a2\xd9\xc7C\x86\x13(.\xe3\x0cg\x9ez\xf2E\xd7^{\xed\x7f\xbd\xe2\x8a+\x18Q4dB\x87\x92k_=\xa1%\x9e\x97\xce9\xe7\x9c\x1f\xeb`\xe8\xdb\x94\xfe\xed\xb2\x8b%M\xb10\xc4\x00\xcb\x1f\xfc\xe0\x07\xe5\x95\x05\xf3Z\x05/%`~\xac\xa9\xb7\xb7\xeb{\xa7\xd6\xe1\xde\x89.\xac\x07\xe1\xeb\x04\xca\x123!\xc6\x04\x9e\xf7\xdb\x89T\xb1\xd63\xa4<\xb3\xca+;\xa3\x9c!\xab\xd4#\xbafdf\x18\xd1[\x16\x5c-\x93U\x9f\x09\xc3\x02\x07\x9a\xcd\x5c}\xa3B\xda\xacN\xc8^\xf5<\xa7\xc9\xee\xc2mB\x02\x85\xe3\x81r\xa0t\xcc\xa5\x97\xb6t\x1c}\xc1\x974$X\x02\xb1\xd2P\xff\xd0\xf6\xcf\xbf\xaby\xd4\x0e\xcc\x1d(\xf9Z\xff\xe4u:\xcdf\xaej\xb02\xd9\x90\x8d\x86d\xcf\xe6\xd1\xac\x16\xd1\xc9\x01\xc7\x90\xe2\x14\x0b\x15\xd1J\x8e\xf0\xe2\xb8'\xfe\x82\xcf\xcb\x91\x83e\x8e'E\xe5\xb43\x02\x02\xe2'\x83V\x1c\xe5S4\x87\xcb\xf1n@\x0f\x0b\x0a\x84\xb5/\xca\x1b\xf8\xf1\xfc\xd0>W\x15\x16\xa5\xa4\x06\x16]c\xcd\xb0\xa4\x1b\x0e\xd0\x88\x17\x91=\x9cz\xb0\x88[\xc5\xab\xe2Va\xe0\x1cJ\x05\xdf\x10$\xf1\x9a\xa0*\x0f=.\x84\xed\xbcMa\xc0S{jN\xdd\xac\x0c(\xf1\xb8gt\xa4\x95\x8e\xd2\x88\xe0\xcf?\xfa\xd1\x8f~\xe2s\x9f\xfb\xdc\x1dz\xa3\x87\x9b\x0ch,\xf9\x18\xf1\xa0\xd3nfSmq8\xc9,\xd3\xbc%+B\xa76E\xed\xd1m\x16\xfdC{\xc3\xfc9\xb3B\xef\xde^{b\xbd\xa9\xa9\xcd\x04\x0f\x0f\xed5H0q\x03E\xdfnm:\xe0\x84L5i\xb2\x8cU<M>\x99\xd2H\xa3\xa434/\xfe\x93?\xf9\x93\xd3\xde\xf1\x8ew\xdc!ar\x8b\x84\xcf\x9d\x12\xaaO\xea\xad\xa1m\xef|\xe7;\xf3\xc7/X\xc4!3K\xcfy\xcesn\xb9\xe7\x9e{\xfeM;\xdf~G\xd3iv\xf5\x8d\x87w\xcd5\xd7\x8c\xbe\xece/\xbb_\x02\xfcr\xc1\x0c\x1f~!\xac5\x03p\xd7Yg\x9d\xf5\x0f\x8e\x8b.:\xdc\x88p\x92FN)85\xdb\xce\x83\xc3.x\x88\x01\x95\x96\x11\x09\xcfH\xa3\x06\x14I.\xcad\xd7[\x87n*\x18`\xd7\x87\xf5\xcc\xccy\xccO\x1c\x1b)\xe7\xd5\xcd\xe0\xae5\xf5+B\xb3\x84\xd7\xa8\x0ec\x0d\xe8\xba\x89]\x9a[=j\x91\xde!\x9f$C\xc7\x10.\x00\xfb\xca\x018\xdc4\xfd\xca\xbf\xfd\x80.\x9e\xba\xd8<\xab0\xcf\xfa\xf9\x97\x1fX\xbfc\x03\xbbW\x0e\x89\xcaJ\xbf\xd1f\xda\x8dH\xa40\x04@\x14*\xb1\xac\xe1\x1a\xd7}bt\x90\x03\xd5\xc6&6\xcf\xb1\x0aB(\x96\xae\xac!\x8a\x1e\x92\xdfX\xa4\x08M\xca,\xfcd\x9f\xc0&\x02\x8d\x98a\xd8O\xbe\xe1\xab\xbaLfR:\xb2\xa0\x22&\x96\x04@\xa39\x0e\x09\xfcE\xbf\x11#\x8dC\xad\x19\x02\xb58\xb5\xee\xd5\x10\x1c\xee\xfa8AW\xc1Y\xfd\xae\x02\xf6\xddD\xcfZ\xd3Fc<\x92?\xc4\xc3u\x10\xdc\x9eGNqps\xbb\xeb)\xbe`\xba\xb2\xb1t\xda\x9c9s>\xfa\xacg=\xeb\xae\xb5k\xd7\xfe\xf0\x9b\xdf\xfc\xe6\x9d\xff\xfe\xef\xff\xce\x0e\x072\xba*\x80,\xb3\xa3o\xa6Y\x17/Y\x1e\xe6\xce_\x10\xd6\xaf]\x1dvn\xdb\x14V\xacZ\x11vl\xdb\x12vhs\xc4\xdc\xd9slJv\xb7.\xa0\x9d\xd6>]\xa3\xaf\xa6\xb0N\xaf\xdf\x8e\xe8\x06t\x0e\xc5\x8f7=\x05u\x09\x10\xdb`\xa05\x14\x17\x901P\xfd\x92\x06>Fl\xa4_\xd3r\x0bf\xcd\x9a\x85\x90\xb8\x9c\x8d\x00r[\xa7\x83\x9d\xab\x7f\xfe\xf3\x9f?!ap\x9b\xb6<\x7f\xed\xa5/}\xe9V\xbc\xea#s-\x83\xe5\xf7\x16\xed\xb6\xfb\x1d\x09\x9f3\x05\xfb\xb6\xec\xf2\x1ak\x85\xd6}>\xa3\xed\xd6\xafV^\x1c\xc3\xe8\xca\x95\xa6\x1a\xe1\x05\xe1\x82\x1bn\xba\xe9&\x1e\xcc\x1bW\xa6\x80\xa3\xcfv\x19\x8d\x8b\xe4\xc4\x0f\x85NJui\x90\xdd\x0aM\xff\xb0oXo\xdeK\xaaO\xd7\x5cfy\xe6\x0c\x9f4\xa8\x09:k\x0e\xecf\x81i\x08\x1c\xf1\xadI\xd3s\x0d\xbd\xfdaH\x8b\x8f\xbcY\xb1[;\xa8\xf6\xc8\xf7\xe2Ys\xc2\x19\xb3\xe6J\x22#\xc0\xaa\x15\xa7\x86`a9\x18\x1ch<\xe1\xc3\xdf\xb9\xbcaz\xe7\xd5*}F\xaf\xf7\xa1\xdb\xbev\xec\xc6\xfb\xa7\xa9\xd7\xb3\xcf\x82\x87^\x14\x07m\x9fJE\x1c\xf8\x9e\x19\xaaZ\xf6\xa9\xf4\xaeR\xb3\xc3\x8eT\x1d\xc1\xc3\x88G\x0d\xda\x98Fw\xaa\xb0\xc9\xd2\x96\xa7C\xe3\xa9\x86|\xbe\x04\xde\x8bu\xe6\xe5\x22\x1d\xb0\xdc\xa4C\x92\xb7}\xf7\xbb\xdf\xbd\xfd\x86\x1bnX\xaf\xd1\x04$u\x17qu\xaa\x0d\x00\xaf\x8b\x0e\xaba\xe6\xd6\xe9^]\x14\xbb\xb7\x17\xa1\xa2\x8dSj\x9b\xd6m\xda\xac\xb9;\xad\xfai\xa4\xb3K\xfe=7Z[\xdbu\xcf\x1f\xeb\x22\x8c\xb0\x1d\x0a\xb5\xaa\xda\xd9\xa3gC$X\x10<y\xa5\x91N\xb9\xaf\xdc82\xdc\xbbs\x8b63l\x93\x00\xdb$\xdc\xf5\xc2[\xab3<\xffI\xf5\xe9d\xe1,\xd3\x88\xe5\xb9\xe2\xe3\x1b5\x82|\x8eF1of$\x93\xd1\xb2B\xa24\xf7\x0f\xa9\x0d\x96\xfeR\x9d\xf5\xf9\x88\xcaHE\xc2hD\xb4\xe6\x8e;\xeex\x87\xce\xfd|Z\xdfr\xd6q\xa8#\x12d\x9a,4\xe1\x07\x8d\xfa\x91\xcf\x02\xc94\x91-uc~J\x04\x0f\x01\xb3\xf0\xda\xaa\xc8\xc3\xcc\xfeAn\x18\xd0\xe5\x89\xf3\xe6\x84!\x0dC\x11\x16\xa4\xc4R\xa3\xe4p\x8d\x8dN\xf5\x84V\xf5\xa0\x1a\xb9^\x82\xe7\x8a\xb5\xb7\x9f\x9b~\xf7\xec\xed\xd3\x9b;\x83aP8\x9d\xba\x8c\xf1\xd8\x85\x0b\xc2e+\x8e\x0f+u7\x925\x86Sa\x07\x11*\xd4>s`\xe1\xe5\xff\xfd\xe8\xb6e'\xfc\xbd\xf8l\x5c\x1e\xda\xbe\xe1\x9e\xc7\xff\xd7\x1b\xbe\xf8\xdc\xd7\xbf\xfe-T\x94\xf1\xd4\xba\xee5\xe39=-\xe14\xe4s\xb5\xfd\x7f\xba\x0e\xee\xd1\x88!\x83\xad\x04[!\x8e]&\xe0\x14h+\xdb\x98\xa5\x0c\x06\x04\xb8~\xb2q\x9a\xa6\x99\xa3\xd9\xf0e\x06;\xe2\xa2G\xb3Q\xc0\xe2\xfe\x0d\x19\x9b\xda\x13\xfc\x80g03\x10\x5c\xc5\x1e\xdd@\xc3\x0d\x1a\x99\xd9L\x11d\xd0\xcc-CH\xb5h\xd6/\x19\x1f)\x18\xe8\xa0\xff\xd0\xc01\xdd\xe6\xe9\x87\xd7SU\xc6S\xe1\xbb\x9e\xf7\xe7p\xa7\x8d{J_f\xeepc\xddg\xc5\xf1\xc7\x1f\xbfT;\xde.{\xde\xf3\x9e\xf7\xe8O\x7f\xfa\xd3\xfb\xbe\xf6\xb5\xaf\xad\x15\xe1Jd\xb8\xa8\xabo\xcf\xd60\xd8\xa1.\xb1\x84\xc8\xc2\xf9\x1c\xd0\xe7\xa9u\xd95\xf52\xaa\x8d\x06\xda7\xa7y\x5c5\xee\xec^\x96O\xbb}Z\xd7/\x8d\xf0\xdc\x8bq\x92\x18\x8cU\xeb\xd7\xaf\xaf\x89\x97cP\xc7\x10J\xff\xf7\xc1];~\xf8\xc9k>\xb5\xe9\xb1\x078T\xce\xe6\x00F4\xbb\xbf\xfa\xd5\xaf\xfe\x5c\xf1\xfe\x07\xf1o\xb6\xdaY]\x9b\xd80\xa2\xafg\xf5\xea\xd5\xb4\xfb6\xe5\x95\xf1\x80,<\x89\xb5J\xf1\xfb\x1c\x09\xda7H0}\xd1o-\x10\x8eXQ\xfa\x8eFM/\xd0\xfa\xcd\x1be\xbeH\xc2\x87\xed\xd9\xd53\x12\x220\x91\x82\x06a\xc9\xcf\xfd\xe0=e\x82\x87\x94\xb2\xe3\x8c\xa9\xb2a1\xbfQ\x8f\x1c\x95f\xcd\x107\xc8\x11\x8d\x88\xb4\x0e\xd4\xa2|m\xd1m\x07e\xddmV\xee\xd9\xa3\xfd\xf0=\xa1wgO\x18PobT\x02\x88\x9dG-\xed\x1da\xe5\x9c\xd9a\xfe\xdc\xb9a\xe5\xfcE\xe1\x8ceK\xc3\xb3\xa4\xb7i\x9f<a\x14\xea\xd0q`\xc1\xab\xde\xf1q\x0d+g\x10By\xa0o\xcb\xea\x8f\xbd\xed##\x03\x03[\xd5Sd^\xfc7F\xb5\xeb\xd6\xe8\xe9\xd3:\xd5\xa0 dhT$8\xa4qI)\xe7\xd6L\x99F\xc5C(\xc4M0 a\xb6\xcbL\x85\xc4Z\xa7*\xb5><\x0b\x80\x1f3\xd3\xdb\x17\xc8\xc0\xfa\x11\x0c\xb0\x01,<\xef\xbc\x02\xe3p\x22\x82\x0b\xb4\x88k\xcd#\xe1\xe0\xac\x8f\xdf\xe8&\x7f \x024\x82n\x96\x0e\xd0<\xd8\x8f\xe1E4~\xa3\xc2+\xcaI\x98\xc5\x9c#\x8e\x85XE7\xe7}\xf9\x817\x08\x1e_\xe3\xc1\x0e\x7f\xd0]9\x0c{j\xc6\x9e\xc7u\x18:*\xa5\x93\xb7\xbb\x9b\x1aJvj\xd9\xcd\xce\x1a54/^\xbc\xf8t\x9ds9Z\xb7\x92\xdf\xba!NE\x19-5faC\xf7\xda\xb0\xbbg\xbb\xec\x1c\x96\xe718\xda\x7f\x8dx\xb4\x9d\xda6\xaa _D\x8fR\xd2\xa8\xf5zh\xa3`\xbd\x9d\xedqFf\x8c\x8d\xce\xa3\xe1\x89\xd5OVp\xcdC\xf6C\xa7}\x91:\xda+7\x0c\xb5\xec\xda\xbdkH\xbc\xe2&h|70s\xa0\x8d\x06\xb7\xeab\xd07.[\xb6\xec%r\x9b\xa6\xa9\xb7\x07~\xf0\x83\x1f\xdc\xf0\xc5/~\x91\x80\xe9\x19\x8ej$W\xd2\x14\xd9,\x09\xa4\x97f\xeb2l0x\xf7o\xfd\xd6o\xdd\xae\x8d\x05\xbf\xcaxj\x0c?\xfb\xec\xb3\x1f\x97\x9f\x0f\xea\xb2\xd0.\xd1o\x97[\xa5\x9e\x83w\xf3\xcd7\xcb\xb9\xbe\x22/\xa4\x94\xe4\xd1\xbb1<e\x82\x87\xc0\x19\xf5\xf0\x18\x1b\x15\xb6ivW\xd0\x9d\x0e\xa1Qs\xa5-\xda~\xda\xd4\xa7G\xb84Tm\xd0\x13\xb0\xcd2\x97u\x05\xfc4e\xd9|U\xf0\xb6\xd9s\xc3\x1c\xdd\x7f\xc4\x94\x1aW\xd6/\x91>W\xfa\xbc\x8e\xae0\xadU\xd3\x8ebS\xb5h\x12R\xa1\x0e\x05\x07J\xad\xd3\x8f1\xba\xe5\xd1\xa1\x0d_\xf9\xc8\xdf\xf4>~\xcfZ\xd9\xb7\xa8\xa1\xe0\x1a\xf6C\x11\xe4\x11G\x93{\xf8f\xcc\x9cU\x15:\xaa\x80\xf1O\x1b]\xd4\xf9\x993Kg0\xb4%{\x87:L#\x9a\x1a^\xb0@k\xb7\x12>\x9b\xb7nU\xe9/I`\xc5\xa9En\xa5\x9e\xadr\xbc~\xc3\x06K#o\xf2x)\xa6\x9d\x8d\x0d\xa1\x0c\xf4\x96\xadp\x13J\x1cMa7\x1c3\xe0-\xc6\xc0\x08\xc9L+c^\xcco\xf4\x17\xdd\xecWn\x91\xa6\xe1`\xc3\x10\x7f\xaah\xe6\x181\xa2\xaf\xeao\xd5)\xbaG{}\xdc\xaa\xaf\xc9M\xa4\x99^=#\x9e\xfdQ\xf5\x04O=:\xe01}\xc4\xfa\x05\x8d/\xba\xdb9C\xc4\xcd\x09<\x7f\xc1Z\x8b\x1a\xce\x91m\xdb\xb6\xf5vww\xefm<\xb6\x5cY\x88\xa7\x15\xdf\xa5\x99\x18=I0&\x88\x06\x1d\x22mn\xd6[K%I\x9el\x22\xc0F9\xecxc\xf3\x9ct\xb6\xea\x9b$\xb0\x9c2\xd9\x11\x1a\x14\x17\x84\xcf\xe3O<\xa1\xe9\xbb~\xbb\xf5\xc4\x85\x15\x81\x10o\xd9K/8n~\xfb\xf7O<q\xce/n]\xf7$;\xca\x98\x02\xeb\xeb\xeb\x83\x5c\xc3\x95W^\xf9s\xe9\xb7\xeb#C\xf8(\x0e%\xdd`\x10t\xcf\x1a\xeeM:`\xfa\x0e\xf1\xf9\x0c\xd2\x0d\xcfE\xf7\x04\xad\xf5|Z\xcf\x18\xfc\x9ep\x1f\xce\xfcx\x86\x96^\xf4\xa2\x17\x91\xc8\xb1\x09\x15p<E\xbc\x14\xc6\x06\xf1\xf3W\xe0<\xa5\x82\x87\x94p\xaeg\x9a\xceM\xcc\xd6\xf58\xbc\x06\xca\xad\xc0\xed\xdab\xd8\xa9\xad\x88\xad\x8d\xd3BiF)\xcc\xd1\x14Z\xa7\x16\xe4:\xa7w\x86\xd93:4\xa51M~ZC\x87\xee\xd3j\x90\x9f&\xf5\x1e\xe8|\xc4\xdedL\xfaoF\xb3\x17\xd3z\x98~c\xc1\x1b\x19\xea\xd1S\x8a\x9a\xc7\xac\xaa\x9dw|\xfb\xf3\x9b\xff\xe3\xb3w\x09\xc2\x95\xf2;T\xc0FbCY\xc5y&\x9a\xa8\xf8\x9d\x1d3\xb5^\xa9\xde\xab\xeex\x83A\xb4\xd7QWgJ\xa3\xf8SO;%\xf4\xa9\xf1\xb2\x9drL\xb3\xa8\xdew\xe9\x8d\xa9\x85\x12D\xf8oa\xab\xac\x04\xc2\xea'\x9f\x0c\x8b\x17/\xd2\x02\xf5\x22\xe1\x0f\x84_?\xf2H\xd8\xa5\x85h\xdb\x14\x01E\x08\xd3d\xc8\xec\x02\x07\x909\xb9;h\x98\xf95\xb3LU\x83\xa0F\xa0\xea'\x92\xe3W.\x15\x0f\xb2E*\xe6`\x81\x98\xa9\xe6\x87PL\x99!\xda\xa2\xb1\xe2\xe2\x18\xfb\xad\xab\x01-\xdfr\xcb-}_\xff\xfa\xd7\xe3u\xee\x19\xa5\xacq\xac\xd0\xcd\xdbq\x18\x0fV\xf1$\x03\xfcw<F\x0f\x08\x1d\x1av7#|\xf4\x8drpR\xa3\x85A5\xe6;$|\xd6\xef\xda\xb5\xab[\xc2h\xe7y\x17\xbfeE\x0d=\xba\xd2\xec\xab\xce)\x9buV\xc7\xc2w\xd9\xc6\x91L\x144\x12\x1d\xba\xda]\xad\x15Yc\x92\x87\x8d\x02\x10\x00\x8ej\x08;\xb6\xf7\x84\x8d\x9b6\x85\xa3W\xad\xb4\xf8\x198\xfbQ\x5c\xcb\xf3\xda[\x9a\xfe\xe2=\x7f\xf8\xaa\xcf\xcf\x9e\xbe\xe3'?\xf9\x89\xae\x9c\x1clT\x9cK|\x10X\xb0`\xc1\xc8\xa6M\x9b\xbcIl\xb8\xf8\xe2\x8b\xcb\xabV\xadj\xf9\xb3?\xfb\xb39\xd2\x7fW\xf5\xf5O\x94N\x0b\x15\x9e\xc0w\xd6\x82d\xfe\xb2\x0e\x9b\xbe\xf7\xce;\xef\xfc\x91\xd2=\xa8KE\xed@\x9ax\xe6\xb4\xe0\xa1\xac\xe5\x92\x9eEh\xd2L\x07\xef\xfd\xb4\xa4\xc2\xd1\xe3\xaa0\xe0\xf5C\x0aG'i\x9fb\xc1C\x04\x98\xef\x5c\xaa-\xd4\x97\x97\x8f\x0e3\x1a\xb4\x90\xa8$\xe9MF\x09\x9e(\x5c\xa8\x98|&\x5c\xac\x8f(O6-\xa0\xca\x91UD\x0e\xf9\xc5\x99\x82\x0a? ]\xa8\x83\xcb\x01Z\x94r\xff\xda\x87\xbf\xd5\xb6\xe2Y\xafu\xd2}O<\xf0\x83\xd5\x9f\xf8\xfdo\xc8\x8e\xd0\xd9\xa6\x8fk\xd1\xb5Lq\xf0\x1a \x0f\xebH\xd3y\xf0\xadc\x86\x1eyC\xe8(\xb9\xc6\xa0\xcc\xc0\x19\x9f\x01\xbdNz\xdf\xbd\x9a\xd2V\xe1l\xd7\xc6\x195\x0462\xda\xb4q\xb3d\x8d\xc4@Vn1\xef\xd2\x5c\xfd]\xf7\xde\xab\x11\xbb.$\x9d\xde\xaaWL5\xca\x87\x16\xa3\x14\x13\x04Qh\xc40\x0c\x14\xc5\x83\x87g\xa1\x03\x8f\xe2\xc5\xfcf\xc8\xa9\xc0\x81\x87&V\xe4\xe6\x94\xa3!\xda\xcc\x1d\xa3\xa9\x8a\xc1\x01U\xa89E\xf7h\xac\x8f[\xe3q\x1f-jTG\xd5`>\xa4\xf5\x94\x9b\xf6\xd1\xeb\x01\xa3{\xf9\xf5FT:\xeb=$\x92\xa1(\x93f\xcd\xe2u\xa5\xc1\xb1\x11\x8b\x1aW\x1a\xee\x0a\xef\xe5\xeav\x16\xeeM\xe1#cUe\xab@F\xc5\xed\xae#\x80\xf8\x06\x87\xfa\xc2\x83\x0f>\x18\x8e=\xe6h\xa3\x0d\xcdD\xd99\x9e\xa5\x8b\x17\x1d\xf3\xde\xf7\xbe\xf7\xdd\xba\xa1\xfa\x07z\x97\xe7\x96\x0d\x1b6<\xa0m\xd4\xeb$\x84\xfa$xl\xa3\x00S\x96K\x97.m_!\xa5M\x13\xe7k\xe3\xc6\x7f\x12\x9d\xb3\x11\xb8\x9e\xde\x8cn\x89\xabt4J9U~\xae\x97\xdb\x8d\x12*\xdf\xd4}m?\x95\xc0\xdd\xa6M\x16\xa3\xda\xf5W\x96\xff\x92\x04S\xa36\x1e,\x90\xa0:O\xf5\xfee\xc2=\x1b\xc1\x9dSz\xa1^/\xf4\xf6\xf5\xde\xcc\x93\x08\xb8=\xa5#\x1e\x22@\xa5\x9b\xa3\x9bW/j[\xae{\xb1\x98\xdff\x02\x0e\xa5\xdc\x89\xff\xd2\xc9\xcclZ\x01'!\xd4\xb0\x1eX\xa1\x0e5\x07h\xf9\x06\x1f\xfd\xe0+?\xb3\xf4\xbf|tg\xeb\xc2\x95'I\x08=\xd2\xfd\xd9w\x7fSp\x17:l\xf7Q\xa7F\x0b\xa6c\x0b\xdf\xa1\x8e\xdfa\xa5O\xe5\xef\x98\x11\x07~\xf4`cc\xae_kT\xd0\xf5\x0c\x88F.\xdd{\xba\xcd-6`Y\xa95\xa4*.\x11\xb7\x06J\xfa\x9e]=\xea\xebj\x8d\xc0PcA\x87\x96\xad\xda\xa0[\x9d\xc8*\x86\xd9q3W\xeb4[\xdb\x98\xe1Y7\x1a\x0fR\xe0d\x063\x9b\x8d\x1fs\xcf\x5c+\xc0\x88\x9a\xfeV\x9d\xcc\x94:\x1d2\xb3x6\xaa\x86\xef\x095\x82\xdf:d\x81LN\x98\x9c`4\xc0\xa1Q\x0e\x8f\xb6\xebc\x7f\xf7,\xad\xd6WZ\xd8\x11\x1d\xe3\xe8\xd2\x86\x82\x193\xe7\x84\xe1=\xdb\xe3\x15`\x9aFk\xef\xea\xd0\xcd\xd4O\xda\xd3-\x0c\x86\xb8\xa1E\xf7\xa9h}\x9a\x89V\xde)\x1b\xd6\x1a\x90\xd6}b/Zd\xab*\x8e\x8c\xa2\xfd\xe7w\xde\x15^t\xc9\x0b\xed\xf0+\xe5!U\x94\x1d\xea\x1c\x9b\x08t\x96\xe7J\x8db^.\xfbn\x09\x82-r\xebQ8\x03\x16\x98\x0e\xc4\x8a\xa5s\x05\xe3\x9e\xb6\x19\xd0A\xe8\xd4S\xd0\xccF\x80\x1d:\xc0\xfa\x1aM\xbd\xbdR\x1d\xa7\xcd\x12@\x8fkjn\xb3\xe8\xf02\xa96\xb9M\x9f\xaf\xb0VJ\x08\xcd\x11\xbd\x16\xe2\x91\x8f\x9f\x84Niphp\x9bpn\xf4\xb0\x9er\xc1CD\xc8\x00\xcd\x98\xc5J\x95e@VE=\x9e\xa6\xd7\x83\xd5 \x14\x96C\xc9\x01*Y\xffp\x7f\xff\xf6\xd5\xff\xfb\x1d7\xc8\xfc\x1d}\xec\x01e\x05u\xf3\xdc\xb9sw\xeb\xe0ZYg\x06\xdat\x88,\xe8\xa6Z\x9b\x1b\xcf\x17B\xe1Vz\x81\x98\x19\x82\xb3\x80<\x91R!7<*\x03\x0a\x9anv\x7f\x8e\xe3\xf6\xbc\x8e\x1f>\xc2s\xbf\x1e\xb7\xd4\xee\xb4\x1d\x96\xd2\x01F8\xe0\xc4\xd1N|\x12\xdb\x9am\xb5\x05Y\xf4\xe2&\x01\xe1\x00\xb0&\x02\xb3\x14\xb1\xb7>\xb2:\xce#\xd6yV\xc9\xd7}j \xc5\xb8D\x01@}\xc0NX2\x08G-\x96\xf4\x88c\xa4\x8c\x0e\xb3\x05\xc0\x8c+F<\x86\x131\xe2\xaf\x8d\xacD\x87\xb8\xd3\xeb\x04?\x86\x92\xc5\x074\xc1\x08\xcb\xd2L\x22\x8cL\x95\x96\x9cA2\x1c\xf8WOy\xdc\xd0\x1d\xc7a)>0\xc2\xaa\x84\x07\xe5\x18@\x8afeB\xbb\xc9\xcaj\xd8\xf6\xe8\xea\xfd-\xeai\xf3\xd4\xf2\xb0\x84P5b5>\x0e\x99\x05\xce\xd2N\x22x\x5c\xe8P\x17Z\xf4du\xa5\xd5\xd6Eg\xe1\x843.\x0c+\x8f?6\xecx\xec\xe7\xa1\xbfw$\xb4\xce\xec\x0a+\x8f]\x1cn\xf8\xd2\x0dB\xd6\xa1\xd1\xe6\xc6\xc09\x9e\x16\xddE9M3:,\x13\xec\xed\xdf\x1b6m\xd4F\xb4\x8a\x08\x13\xe5\x9c\x82?\x0f\xfd\xea\xe1\xf0\xf0\xc3\x8f\x84\xd3N;\xd5\xd6\xa0\xf2\xe5\x13;\x9d=}B/\xeb\xf2\x96\xc66\xc1\xe6\x01w\x5cxN\xde\xa0K@\xc0G+:\xb9\xe0*V\xfc\x11\xb6FM\x14\x99V\xf9\xe5\x12\xd0e\xf8G\xa1\xe3\x0e\x1e\xa3y\xe9\xf5h\x96u>\x88\x87\xe0~\xf8\x8do|\xe3~\xe1\x0b\xad4\xfea\x9fJ\xe8\x87\xcbp\xb8\x8b\xd3\xe1J\xd73'\x1c\xaa\x06s\xed\x8cn\x86\xd4 LS\x0fkDC\xf7=\x1a>\xb7\x5ct\xd1E\xa7\x08~\x96\x0a\xe09z\x0c\xea\xb9o\x7f\xfb\xdb\xadPR0Q\x14N\xcc\x08\x19\x16\x1a\xe5\xdfv+\xb1h\xab\xed\x9dZ<\xed37/\xc8\xf8\xc1\xac^RX\xb1bE\xd0b\xae\xe1Pq\xbca\x83&\x95\x8d\x1d<K\x96,\x09\x9af\xf0\x0a`\xb4pG\xd1\x0bSO-,\x5c\xb8\xd0\xe8`'\x1e\xeeN8\xc04}\x10\xd4\x9b\x0bl_\xa5\xb7\xe78\x84G8L?,Z\xb4\xc8\xc2\xd3\x14\x90\xfc\xe8\x99\x04\x1d\x04DAk\x80\xc5YUF\xed|2\xbf\xe0P9I\x83\xa7\x8b\x0a\x0a]p\xd8\xbe\xbay\xcb\x16s\x83'\xe0\x80O8\xad\xbaze\xe1\x82\x85\xd6\xc8l\xd9\xb2Y-\x84FA\x19\xce\x88\xe2\xc6\xf3\x22<\xb1\xb1p\xe1\x22[\xf4\xde\xbe}\xbb\xf1\x85)\x1f\x04\x12q#\xf9\x5c\x19C\x9c\xd5h\xdb\xe7\xe1\x10g\xe7\x83\xf2\xd1p\xb6(.Z\xbf\xb0\xf8\xe1N\x5cx7\x8a\x1b\x94\x9d\x8e\xa6p\x02\xe7X<M\xf0\x05E\xfa\xc9\x07M\xeb\x18\x8f=\x9d\xa4\xc9\x15\xf4\x98\xeeY\xb9r\xa5\xe5\x07t\xb4vb\xbc\xc5-\xc5\x85\x9e\xf8\xde,\xfc\x8b\xb5\x10>]\xf9q\x8f\xe2w\x9f\xd4Z\x95\x97^-\xf0\x8f(\xae\xc3Jw5\x00\x0f\xe8\xe0\xea\x14\x22\x0eJ\x12\x0eR\x97\x9d\x0eL]\x0d\xaaG\x10[`YPm\xed34e\xba7<\xf0\xe0\x9a\x98\xc7B\xe7\x0d2\xd2\xd6;\xc0\xd3\x0e\xdcQ\x19\x94\xe6>\xe5+\xfbw\xb3\x83\xa3\x0co'\x10<\xf0\x82\xf2\xf8\x83\x9b~\x14N9\xe5Y\xc6\xeb\x18b\xdd_\xa1W;H\xf50p\x97\xb2\x9fz\xeec`Y\xdf\x86t\x90\xdf\xf2_\xe1\xb9\xf2\xcc\xc2\x1b\x8f&uGn\xdc\x01\xf7\x8f\xd7\xe8\xec\x90\xb6h[\xb8G\xc4\x88gLB\x0b\xc0\x11\xc7\x01\x1a\x85\xbf\xfb\xbb\xbf+?\xf6\xd8c\xea\x00\x0d\x8eh\xaf\xff\x2252'\xaba8S\x8d\xd2)j,W\xa9\x90\xb5\xd1\xb0P8i\xe8)\x8c|\x14>\x1a[.;\xd4\xdc2S\x026g\xad\xeb\xd6\x83\xceD\x04=\xd7k\x95\x93D\xe3\xd7\xf1)\xe8\x08(\x0d\xf3\xadA\x04\x8e\x99\x86Yq0\x01\x06\x0e\x0d\x1e\x0d#\xbb\x8e\xa0\x8d\x22\xbe\xe0yCKC\x09-p\xbc\xd1\xc4\x8d\xc6\x17\x5c\xe8A\x07\xfa\x08A\xe8P\xd9\xd1iD\xc1\xe1\x03\x87\xb4\x80C\x98\xf8G\x07\x87\xb8\xa0\x08\x87t;NJ\x073\xe9\x80O\xe0\x13.\xf40\x13/\xfc`\x06\x07:\xe0\xf3A\x0f\xde\x10\x168\xc4%\xe5\x07vW\xdc\x13\x86\x10\x04\x1f\xda\xd0\x81\x17(O\x0b\xe9$\xee\x1e\x16\xe9\xc2\x0d\x9e \x0c\x18)\xb1\xe3\x0e\x1c\xc2\x87\x0e8\xceS\x84\x06aB\x9b4@\xc7\xc3\x22~\xa4%;hY\x89+\xe1\x83C'\xe1\x82\x0b.\x08\x17^x\xa1}\x84'Ab#d\xc2\x82n\xf6\xb1r\xbdB~V(\xfdWI\x80\xee=\xf3\xcc3\x9f\x90\xfd^\xf9\xf9\x85\xe8?\xa0E\xed\xc7\xd4\xe1\xd8+\xa14\xac\xb5\x8d\xe15k\xd6T\x19A\x80\x07\xaeh(\x11<\x88\x06\xcc\x8c|X\xa7\xd0T\x13\x82\x87\x8d\xe9\x08\x97\x91\xb0q\xcd\xafC\x8f6\x02\xec\xdc\xd6\x13ft\xb4\x85'\x1f\x7fL\x1e\xfa\xc2.\x8e\x80\xf4\x0djzM\xbe\x106\x12\xe6J\xa0M\xb7!\xce\xd8\xed8\xa2\x9d\xbc\xea3L\xa8~v\xc7\x1d\xe1\xe1G^\x14N8\xfex\xcb\x93\x09\x91\xe5H\x999\xd8*\xa3Y!<Y\x18\xca+\xb6\xa2\xffHyuS\x8cR\x9d\xd5\xf8\x9e\xf2\xe0yz\xd6\xf76\x8f\xec\xa0\x98\xb9[=\xa7A\x15`\xdb\xf2\xe7\x0ePH\xcc\x18\xab\xf6h\xaa\x97\xe6*\x0e\xf8\x89M\xc6\xc4f\x94k\xed\xd1V\x81\xc9P1g\xf1\xc8aT\xdd\x13\xc4\xc4h1\xae\xb5'43\x87\xaa{4U\xed1P\xb3'\xc0\x9a4Y\x08Y\xe4\x12\xad\xca\x97<v\x12~\x86\x1f\xe9\xd7\xc3+\xfdmWs\xcb\x1f'd\x0f\xbaQ\xa7\x97\x1b\xd5\xd3lT#\xd2\xa4J\xde\xa5\x86d\x95\x1a\x99g\xab\x10\x9d\xaf\xeft}G\xa9\xe1\x9bF\x03A\xa3C#\x87\xa2 \xa6\x1f\x0d\x10\x8d\xb7NQ\xdb\x88\xe2\xba\xeb\xae\x0b\xdf\xfa\xd6\xb7\x82n\xc5\xad4\xa44v(t\x1a\xa4G\x1f}\xd4F\x1d\xc0\x9c>\x8d,\x1f\x0d\xd7s\x9f\xfb\x5c\xbb\xffJ\xdbA\xad\xe1C\xc8!\xbcP\xb8\x83w\xfa\xe9\xa7\x1b=-~Z#H\xf8.\xe0\x1c\x87\xc6\x97\xad\xb2\xc4W[D\xd5\x9b<%|\xfc\xe3\x1f\xb7JM\x5c\x80\xd3\xd8\x82\xe3\x0d+\xa3\x22F\x054\xd2\xd0q\x1ck\xac\xc5\x07\xec\xe0`\xe7#.\xc0h\xa0\xa1\x03\x9f\xb0\xebZ\x133C\xcbq\x08\xcb\xe9\x90\x16\xd2E<\xfc=\x1a\xf0\x9c\x0e\xf1\x817\x1a]\x867\xbd\xe9M\xe13\x9f\xf9\x8c\x8d4\x88\x93\xd3!,p\x10V\x9a\xb6\xb2-\xc1\xe03\x0d\xcab5a;\x1d\xfci\xba\xd4\xc2\xc2\x1d^\x90\x0f\xab5\x1a\x85\x06\x1fa_r\xc9%A\xb7\x15\x07Fs\xe4\x15#V\xf2\xc1q\xd0\x89'\x1fJk\x0e\x96\xf7\xe4\xb7\x0by\xe2\x85\x00#\x9e/\x7f\xf9\xcb\x83\xce\x92\x843\xce8#\xe8\x01\xb2\xc0\xc8\x0d<\xc7u\xba\xd0r\xda\xf0\x04\xfa\xb2\xf7\xaa|=\xa94\xdc+\xf3\x1dJ\xcf]\x12<\xab\x95\xcf\xbbDkX\xbb\xb1Fn\xbe\xf9\xe6\x9aQ\x09t\xf6QQ\x0d\x11<\xec{\xef\xd0\xc7+\xbcl\xa3^|\xd15_zS\xf7\xf7\xae{\xce\xea\xdb\xbf\xa3\xe7\xbft\xc0]\xfc\x19Q\xdc\x99\x1aU\xae\xdb\xf8\x88;\xd9xm\x94\xb57.\x0c\xb55\xb8T\xc2d\xb1\xcb\xd8%\xb2\x13+\xdd\x22\x10>\xf4\xa1\x0fV:O\x13c?\xb5\xae\x94s\xe5\xd5\x16\xe5\xf5\x15\x5cF\x9a\xc6&i6\xb51\xbb\x10<\x917\x19W\xaa\xcc\x89\xa6\xaa=AK\x80y\x11\x918Ux\xae\xbc\xc8T\x1e\xfb\xa9\x15<\xaa\xb8%5Fz\xf1\xbb\xa9M\x8d\xdf,\x09\x8bcd>]\x91}\xb6*\xf6\xb3\xa4/W%g\x9e\xd7\x1a\xccT\xd0x#CAs\x85\xd9?`4l|4d\xf4\x90i\x0cq\xa71q\x7f\x08)\xcd\xe7[\x03D\x0f\x18\xba)m\xc7]\xb9r\xa5\xd1`j-UN\x07<\x1d\x9a\xb3\x86\xed\xf1\xc7\x1f\xaf4\xae)-\x1a\x5c\x8f\x1f\xfa\x8a\x15+\xac\xb1{\xe8\xa1\x87*\xf1\x81\xb6\x87\x09\x0e\xe6\xd4\xeeaC\xcbi\xd7\xf3\x93\xc2\xdc\x0ftP\xf8s\xb3\xd3\xce\xe3\xa4\xe9\xc2-\xb5\xd3x/_\xbe\xdc\x04\xb1O\xb7\xd5\xa3\x03o\xc1\x85/\xf0\x1e\xbe\xa8\xf3`\xb4\xc0\xf7\x0f\xda\x08E\x9d\xd27\xe1\x8fpJ\xc3s\xda\xd0`\xe4\x82\xe0a\x8a\xceq\x88_J\x0b:\x84\xab\xd1\xc8\x98^:|\xa3,0\xfa\x83\x16\xc2\x06\x98+7C\x0f\xe5v\xd7\x81\xc1?\x95S+\x93JO\x9f\xe2\xb1Z\xe0\x07\xf4\xdd)\xfb\xbdj\xf4\x1e\x93\xc0\xdc!?\x03Z\x7f\xec\x95{$&\x84)*$h*xf\xc9>O\xdf\xe2\x8b>\xf8\xcfo\xee\xfe\xee\xb5\xcf]}\xfb\xffk\xb1Q\x8c\xcd\xc6U\xeb\xc0D\xf4\xc5f\x89&~(W`\xc6<\x98\xcc\x0f\xe9}\xff\xfb\xdf\x17^\xf5\xaaW\x8d\xe1\xe7D~\x0f\xb7\x1b|V\x1b\xa2\xdb\x80\x86>\xaaQ\xea\xfb\x94\x87\x02Uy_L\xb5\x1d\xee\x1c9B\xc3\xfb\xcew\xbe\xb3P\xd7k\xbcQ\x05\xe4\x1c5\x04\xa7\xab\x90,E\xd0H\xb7\x0a\xef\x95\x9dF\x00\x01B\x05\xc0\x8d\xcf\xd5dvhh\xc7M\xa5\x91v\xbf\xa9?F\x124|\xf4\xbe]\xa5x\xc0\x10z4|\x9a\xee3\x94\xbc;v\xef\xed\x83S\xcf\xddi\xa3\xe3\xce\xf4\x90\xb6\x9f\xdah\x05\xbb\xfb\xc1\x9d4\xf3\xa1\x1c\x8e\x0e,\xd5\x0d!\xfb\x01\x9e\xf2\xcc\xfd\xe5q\x9cn\x0aws\x9e\xb6\xd3L\x85\x15a\xb0&E\x9e0\x8d\x99W\xf8\x81\x17\x8c:i\xdc\x9d\x86\xf3\x0e|\x8f\x83\xeb\xd0D\x08\xb0&\xc6Z\x14pws|p\xa0\xcb\xe8\x88u1\x87\xa7x\xc0\x10n\xe0\xadX\xb1\xa2B\xc3q\x5c\x87\x16x^\xa6\x8c\x98~H\x138\xb8\xa3\xb0\xe7\x15n\xe0\xe0Wi\xe4\x8e\xc0\x13\x95\xc6\x13\x05\xbbRi\xe8S9Y+\xd8=\x82\xdd\xa6\xd1\xcf\xb5\xf2\xbf1Oc?\xec\x14\x06Z\xd2D\x88Q\x0f\xaaua2\x9a\xbc4\xc0.7\xf6R)\x8b\xec\xf3\xb4\x8c\xe7W\xc9\x14/\xcb\xe1\xb3\x9f\xfd|\xd0\x05\xa66\xda\x85\xb7G\x9a\x22?\xe8\x0c\x88?\xb7\xa8\x0d\xf9\x04\xf1\xab\xe5\xd5$\xdb\xa9\x8d\xbb\x22\x82\x9egi\xc2qK\xf7S\xe1\x9e\x0f\xd3\x22\x92\xfd\xe4\xe3\x078\x8f\x9f\xc7\xd9W\xf74\xbc\xa7\xbbYk\x1f/R!\xfe0=T\xe6\xe6\xb3\xa9+\xeb\xa6\xa8\xd0Pp\xec3>\xd61\xe3\x9e*\x1a\x82<.v\x1a\xb4<-C\xd4\x8f\xd3\xa0\x11r3nnv\xddi\xd3[N\xdd\xcd\x92\xe0cgJ\xc7\x95\xfb\xc3\xee\xb4\xdcLe\xa1\xe1F\x9fH9\x0d\xe8R\xb9\x18I\xd0`@\x0f7\xfc\xe7i\xd4\x83\x8d\x17\x06t\xd2\xb8y\xfc\x80y\x03L8\x08h\xec\x08`\x0f\xcf\xf5z\xb4\xf1\x8fpEO\xf1R\xb3\xd3\xcf\xfbOq\xdc\x0d\x98\xc3\xf3fp\xf2n\x9eW\xee\x96\xf7\x93\xe2;N\xbd\xf8\x80\x07\xdcy\xe4\xf6\xd4?f}d\xe44\xe5\xe9q\xeaH\x1d\xa7\xd1\xe0e\x1aEs\x8f\xd9\x97\xa1\xbf\x9f\x0a\x9a^@\xa4\xa7\x82g\xea\x14c\x1e\xb0)\xa6C\xb7[0\x98\x1a\xb5i\xcf|\xde\x8cGq\xc3\x86\x8d\x9a\x12\xfe\xfb\xf0W\x7f\xf5!\x13\xfa\xf5\xf84\x9e\xdf\xc3\x01\xa7\x83 \xf6?\xa9)\xe2\xf7kj\x10\x9e\x8fQ\x13\x8ex\x98\xa7\xe4\xa9j\x14\xd29\xafj\x9b\x1aw\x154\xfe;\xc0tpk\xf1\xc7BR\x0f\xb5\xb89\xbfr\xcc\xbbG\xbfUhMt\xab\xe0j\x10\x14\x9b\xaa\xcdLf\xe7's\x88Z\x15\x90\x81s\xbe\xaa\xd6\x9a0\xab\xe0\x1aSJ#5\x83\x94\xb7\xd7x<\xc4\x16M\xa9\xb4\x22lX\x9f`\x01^\x17\x02\x96\xd5Xh\xc7h\x1c\xdd\xd0\xd8\xf1Q9\xf8\xb2\x1eM\xc5\xeexD\xd3\xf1\xd0Q\xe0\xe3\xee~\xd1Q\x8e\x87=\xc5\xc5\xcdq\x81\xe37U\xee\xdfq\xdc\xcd\xf1\xdc\x9d\xb6\xc7\xc3p\x1ctww\x18\xf6\x14/\xa5\x0b\x0d\xb7\xbb\x19\x7fL\x1d\xc1\x03vq!L\x19Q`\xa7\x11\x00\x0f\x1d\x01\x8a\xf2\x86\x01\xf8D\xca\xe3\xe5\xe9@\xf7x\xa1\x13\x0e=\x5c\xe0\xec\xf2Cg\x9a-\xa5\x9f\x0f#\xb5{\xbc<\x0e\xee\xcf\xed\xe8y\xfc\xd4\xee\xf8\xc0\xfcs\xbf\x8e\xe78\xe8io\xdc\xdd\xd1qs\xff\xf5t\xfc9<\xa5GX\xee\xe6p\xec|N\x13=\xb3\x97\x94'e\xad\x07\x96\x98\xeaS\xd9.i\x8d-\xee<\xf1H\xef\x9bN\xe6\xd5|\xb2H\x02B\x84\x9f\x89\xf3\x16\xac\xa8(O\x94\xe7Q\xdd\xd62[\xbb\xe0v\x84\x19]\xb3tH\x94\xdd\x8c{\x01O\xaa\xa8>?\xfd\xe9m\xe1\x93\x9f\xfcT\xb8\xfa\x8f\xaf.Okkc\x13\xc6\xa4\xfe\x0e\x07\x02eX|\xdf\xa8\xb6\xe3\xdd\x12:\xb7+^\x02\x8d\x15\xd0\x13\x0a\x1e=L\x11\xa6\xab2M%I\xb1)\x998iS\xc1\x99\x98B\xe6\x9a\x11\x1aKo,$\xa57\xb1k\x8aY\xdf\x9c\xe7\x83\xd1\xab!Zc\x19Cdb\xd7Ztp\xf3\xe1\xd5b\x1c\x5c\x9b\x1aM\xed\x04\xaeTZ\x1aM.\x1c\xb4F\xd7\x1b\x01to\x08\xd3\xa9\x11`(\xc7\xf7\x06\x13|oLqw3\xf8|\x8e\x0f<\xc5uz\xc4\xc7\xe3\x04\x0ept\xffps\x5c\xe8cG\x01sx\x1a\x869f?\xee\x8e\x95\xb0\xdd/\xb4S\x95\xda=\x5c\xdcI#\x8b\xea,\xb23\xd5\xc4\xe2=0\xe8@\x8f\x8f\xb0\xd1S\x95\xb7\xa7n\x1e\x96\xc7\x0d\xdd\xc3\xc4\x0c=\xd6qXwAg\x03\x00\xc2\xc8iz\x1a\xdc\x0e\xed\xd4\xeca\x01\x83.\xba\xbb\xbb\xee~\xdc\xcd\xe1\xae\xa7\xeeN\x8fp\xd3t;\x1c=\x0f\xcf\xf3$u'\x0cw'~nv\x9c\xd4\x8e\x19\x95\xfaq<`\x99\xd9N\xf5\x83\xcb'\x1e\xd6f\x86Q\x98\xd2\x0f\xfe\xfc\xa3\x90\xf1i3Z\xff\xde\xa6\x8e\x19\xaa\x14*3\xfb0\xe3\xd5\xd6\xa6\x1d\x96\xed]\xda\xac\xd1\xae\x1b\xaa\x1bC\xa7\xae\x01k\x9d6]\x97\xee\xeb\xd1\xb8\xf5kD\xba\xb6\x0c\x0aP\xa3\x94<\xe5_\x08:\x17\x13\xe6/]^~\xcb\x9b\xdf4\xaaU.\xde\xc2\xa9\xc1;\xdc\x16\xf8\xabo\xab\x84\xce\xfb\xb5\xae\xf35\xc2W>\xd6\x8d\xd4\x84\x82\x87\xcco\xa1\x80\xc2\x87\xba\xde\x0fw\xd2~\xb3\xc2\x9b\xb8\xf8\x1d\x5c^h\xea\xc8\x04\x8d\xf7\xaa\xa9\xb8TV\xca\x807\xa8\xc0\xe8\xd5\xd3\x08z%\xc7\xdd\x15\xf0\xb4!\xc0\x8e\x02\xc7\xf1\x5c\x07/\x85C\x0f\xe54\x1c/\xb5;\x8e\xfbC\xf7\xca\xe6\xf8FD?\xe0:,\x0d\xcb\xfd\xa6\xee\x8e\xe7~\xdd\x8e\x9e\x86\x99\xba3%\x09_X\x5cG1\xf5\xe5\xca\xe3\x84\xddi\x01s80\x8f\x93\xeb\xee\x177\x1f)\xa5x\xee\x0e?\xd8\xedv\xd4QG\x99\xc0#\xbf\xf2*\x1f\x8e\x87\x81\xee_\xea\xc7\xd3\x98w\xc3\x8eB\xf7\xb8`\x07\xdf\xcb\x86\xfb\x05\x8eJi\xe0\x86\xdd\xf5\x88\x11\xfdcv8\xb4\x5c9\x0c;p\xa7\xc79\xa4_\xff\xfa\xd7\x16\x0fp\x98\xeat76'\xb0f\x85\x1d\xe54\xdc?\xfc\x04&^U\x0b\xabaN\xe9\xc7[>t\x17:\x0ce\x87\xf6\xac\xeb\xde\xd4\xb9t\xd5Pc[G\xeb\xe8\x90\xbf\x1379\xcdam\x9d\x9e\xde\xd1\x19\x9a5\x12\xeb\xd2\x03q\xf0\xb6\xa5y0\xf4\xec\xe4\xc6)\x82\x99<\x9a\xc6W\xa5\xf7\xc6;\x7fY^\xf5\xbc\x9dk^\xb0\xbcc\xb6\xcac\xa7\xd2\x1c+\xdd\xe4\xd18\xa8\x18\x0a{D\xdfz\x85\xff\xe7\x12:\xffw2\xe2\x13\x0a\x1e<\x1b\xd7\x9d\xf5\x93Q+\xdc\x9f\xb6\x1cP\x81\xd1\xad\xfc\xa3\x1c{n\x94\xb1\xa6\x12\x93(\x1a<*\x88\xbb\xd1\xe8\xa2\xbc\xb2\xa3\xf3\x81\xc3\x87\xa2\xb2\xbb?\xec\x98\xbdQ\xc0\x0c\xbe\xbb\xbb?`\x84\x81\x02\x06\xbe\xbb\xb9\xee\xfe\xd0\xf9\x1c\x17w\x94\xc3\xa1\xed\x0a7\x0f\x13X\x8a\xebf\xd7S\xf7\xd4\x7f\x1e\xce&\x08>W\x84\x9b\xd2p|\x8f\xa3\xe3\xed\x8f\xee\xb4\xa1\xef\xf4\x5c\xe8\xa40w\xf30\xf2v\xe0\xf04U\x8eS\x0f\xeen\xe0\xbb\xd9\xf1\xdc\x8e\xceG<<\xef\xc0\x07\x0f8:n\xe8\x0es\xbf\xd8Q\x8e\x87\xeef\xe0\x8e\xcfZ\x1a\xd3\xc0\xee\x860!,\xdc\x99\xe6L\xfd\xb9\xe0v\xf7\x8c\x06\x85\xaa*\xe1 >uE!\xe3#\xb2&t\xa4\x0f\xad\xbd\xfd[\xbf>\xf5\xca\xb7o\x9as\xdc\x19\xd3\xb6\xdc\xfbc\xbd\xc665\xf2\xacw\xf5\xec\xd8\xa2sR:K\xa5\xed\xd6\xa8\x1d\xda\xc5\xb9}+\x82\x872<y\x83\x0bV\xd3\xec\xc5\xe5Eg_\xb2\xf7K7\xfe\xf0\xbb\xbb\x96\x8c\xf6\xebe\xd1W\xea\xac\xdcB\x95\x8bf\xf1#V\x06\xe1\x1dJ\xa5|\xe5\xce\xb6A\x85w\xbf\xd6\x10\xaf9\xf7\xdcs\xffc*\xe1M*x\xa6B\xa4\xc0yFp\xe0\x01\xf5\xda\x7f\xa1\x02t\xb4\x0a\x13g\x16ZdnT\xa5\xb5\xf9c*\xaf\x0b\x1bOm\xda\xb0\x0b\xd7\xc040\xde\xc8xC\xef\xba\xe3\xa0\xa7f<:m\xc2q\x1a\xc01{8)<\x8f\xe7\xb8\xa9N\x18\xf8A\x87\x06~Rw\xb3\xe8\x07\x9cTy8)\xdc\xcd\xe8\x1ew\xe8\xb9\x19x\x1a\xa7\x14/5\xa7\xe1`N\xfdcw\x5c\xe0\x98]\xe5\xf1\xdc^\x0f\xcfa\x9e^\xc7MiC\xd7\xe1\x1e\x06\xba\xa7\x017>\xa7\x91\xe2\xe4\xdd\xdc\x0e\x8e\x9b\xd1S\xbb\x9b\xa1\xe74\xf3\xb8\xee\x96\xc2\x81ag\x13\xc5\x8a\x15+*\x1d\x1f\xa7\x8f;\x028'd\xf0\xc3\xe2\xc2\x88\xbe\x01\x19\xf7\xaal?\xa8\xef!\x8b\xd4\xbe\xff\xb8\xd0\xa1\x00!]\x18f\xf6o\xbf\xff\xf6M;\xcf\xbf\xf4\xc7K/\xbc\xacC\x13\x9esz\x1e{\xb0\xa9\xccS\xd6\xf6\xb0\xdb\xc4\x81\xec\xd1%\xb0k\xb5\x1b\xb1U7\xeds\x13\x05w\xf4\x85\xc6\x16\xd5\x83\x89\xfdq\x0a\xb5\xa4\xa7_\x9a;\xe7\x97\x97\x9c\x7fIo\xa9k\xe1\xbd\x8f|\xf1#\xf7\xfcU\xcf\xe6n\xdd*\xf1\xb37\xbe\xf1\x8d\xafTg\xe8<\x09\xdf\x85*\xf3t\x22+\xeb?iy\x9a$\x94\xba\xce\xces\xe8\xa8\xbe\xc2\xe2a\xe9\xdd\xca\x83o)\x0f\xfeVB\xe7q\xc1\xe4\x5c\x7fz-%Z-\xd9\x82\xcaS{O\x18:1E(\xccG\x1e\x07ZB\xf3\xc6\xe9\xd9\x13\xb2\x07)v\x94\x83\xf2\x9f\xfe\xe9\x9f\xce\xd3\xa1\xc0\xe7i7\xca\xf3u\xce\xe34\x15\xda\xc5\xea\xcdt\xa8 \xd1\x83\xe2\xbas\xae=\xa7\x8b\xa6\x1b\xdec\xab(\xf8\x98Q\x0bq\xc29C\xc1:Fx\xb80J\x85\x8a!\xe6p\x81A\xa7\x1e\x1enN'\xc5\x01\xee\x82,\x8d\x03p\xc7C'\xee\x0e\x03\x1f\xbb\xe3\xa3;N\xde\x8c\x1f\xc7\xc7\xecqs\xffi\x9cpO\xc3q\x1c\x87\xa7a\x00s\xe5~R\xbb\xe3\xd2\xd8bFG\xa5\xb8n\xce\xeb\xe0\xd18\xbbJ\xddS3\xeen\xc7\x8c\x9f|\xb8\xb8\xfb\x97\xc7'N\xee\xdfu\x87\xd5\x8bs\x9e\x8e\xa7\x09\xba(\xb7\x83\xe7\xe6\x14.\xb3\x9c\xca\xa3\xa2\xcd\xc7;PCjtu\xe6}d\x0f\x8d\xe2\x8a\x15+\xee\xd1H\xe9&\xddpp\xeb5\xd7\x5c\xc3\xbd\x82V\xd6\xa11E\x05>\xe2\x80\xedg\xad\xfa\xb8\xaf\x8d\xdba\x19\xea\xce\x0b\x8dm\xf3V\xbd\xfe\x0f/\x1an\x99u^\xff\xfa\x87\xe7\x96wno\x19\x1d\x1e\xd2\xbb \xbc\x00\xe8\xa3\x0eH\xe4T%\x16\x94AYR\x94X,\xab\x1e\xcc\xb9Tn\xd4\xddn\xa5\xe6\xc6\xd1\xc6\x96\x8e\xe1\xe6\xc5+z\xdb\xbb\xe6?\xb8\xe1\xc6O\x7f\xafg\xf5/Wk\x0a|\xb3\xd2\xbd]WW\x8d\xbc\xff\xfd\xef\xbfDS\xc1\xaf\x10\xecx\xc1\xe6\x88\x90\xad\xff\x88\x7f&\x84\xc8\x87\xfdQ*\xd7\x163\xf9\x1fV\xbb\xb0U<\xbeO4\xffIS\xa0\xff\xaeC\xc0{\x94\x0fr\x9a\x5c\xe8\x10\xf6\xfe\xc5`\x7fb]\xf89\x929@9\xe0\x8b-\x99\x0c:o\xd3\xa5\x9b\x0b\x96jG\xd0*\x15\xb0cU\xa8NR!;^N\x0bT\xb8\xbaT\xa9\xb9\xe9\xb6Q\x05\xd0\xfcR\xe2(\xd8RB\x89\x8a\x82\x88\x09\x18\x9f\xec\xa6g\xce\x15-+\xb0\x15{jp\x7f\xde\xb8\xa7\xf41\xbb\x00\xc8\xd3\x06\xee\x0a<\xf7\x977\x833UX*P\x9c^\x1aFjN\xdd1\x13?Wy{>\xee\x8e\x07\xdc\xdd\xdc\xbf\xeb\xe0\x88\xdf\x15\xc1\xeb\xf0Tw3x\x1e\xa6\xc3\x5c\x87\x8e\x0b\x17\xf0\x1c\xee\xb4qs\x95\xba\xe5\xe99\x0e:~\xf3\x0a\xbf\xf8AI\x975\x0a\x12\xe7i\x06\xaf\x84o\x88\xb4\xdc\xf2C\x1c\xb2\xfc\xc7\x1f\x8c,\xabA\xc5MW\xd6\x8d\xf4\x09\xd4#\xf7\x0d\x0a\xf7\x115\xb6\xbf\x94\xfdQ\xad\x01=\xae\xc3\xc0\xeb\xd5\x81\x8a\x8bp\x91 \x9d&\xf3\x9f\xd1\x9f\x8aF\xa4\xf1\xc7\xec\x10\xbb\xe2\x98\x0d\xe0\x06\x03\x84\xcf\xec\xec\x9b\xd3\xb4\xec\x84em\xcbO=vdz\xc7|=g\xa9\x87\xc4F\x9b\x875cP\x1a\xa5\x0e\xc4j \xdc\x8aR\x0f\xae\x22\x96\x00\xc6\xe6Z\xd3\xcc2\xdb\xfd\xb1\x11\xd3\x0a\x8d^cVM\xd2\xf5<M\x0d\xda\xf1\x13\x06F\x87\xfav\x0co^\xf3\xe4\xde\xfbo\xfe\xb5\xd0x\xf2\x949:t\x16\x9av\xeb\xeb\xd5\xc6\x83\xa3tX\xf8r\xf1\xe5\x05\xaa\x0b\xab\xc4\xaf\xb9\xe2\xcf4\xf1\xac!\xb2P\x8c0V\x0a[\xca\xcd\xf0\xdb\x95\x9bE\x83\x8dG\xa3\xd2\xfbDk\x0b|\xd6\xf7=\xf1\xf8k\xe7\x9f\x7f\xfej\xc7\xdf\x17\xbd\x1a\xca\xbe\xf8*p\x9fI\x1c\xa0\x0c\xa4\xe5\xc0F4\x82Q\xd1\xb8\x06~\xba>zM\x8b\xf4-\xd1\xb7P\xc2h\x8e\x0a\xe1\x0cU\xf2\xe9\x9a\x02i\xd3\x1c{\xab\x0a$\xb7\x1a\xe0G\xe5\xd5\xde\xaa\x87\x8eY\xd0\xf2\x9f\x0a\xae\xc1\xbcp\xe3)+\xfc\x158vw\xcf\xfc\xa7v\x81L\x81O\x05u\xff\xf5p\x22bB\xcc\x00\xd5xY\x05\x87\xc6X\x14\x03f\xe8\xd1\xdd+)\xc0\xf1\xf0\xf38\x9e\x16\xd7\x9d`jO\xfd\xa4\xb4\x1d\xee:a\xd63\xcb\x8f\xa5\xc3\xdd\xa0\x91\x9a\xdd]\xba\xf3,\x8f\xef|\xc0k\x8d\x82N\x96Vp\xa2\xe4\xc0\x905TI8\x15\x1a\x99\x1f\x0f\xc3\xe1n\x87>fvB\x99\x8e\xd9\x95\xe8\x1a\x9e\xdctm\x9c\xae=\xd5'\xa5Y\xa9\xe1~M\xebh\x99d\xb0OBg\xaf\xbe]Z[\xa0\xe1\xdd\xa0\x8f\xab,8 J#\xcc\x85\xb6\x1c\xe2bM\x06I\x98JC\x0fO\xe0))\xcar~\xd4\x83\xf0\x99\xa1\x0f\x01\xc4\x09Z\xf4N}\x8c\x88\xa87\x08)\xea\x83\xd5\x03\xe9\xae\xe0\xfdT\x94\xa5?C\xc4\x8cL\xe2\xe0\x1ai\xd2\xbe\xeb\xb0G\xdf.}\x08V\x04\x0e\xba\x09\x1d\xe9\xect\x01wX\xc7\x22\x96\xab~>_\xbc\xbbH\xf5\x95\x83\xb5\x0b\xc5\xdb\x0e\xf1\xadM\xb0f}z\x8bS\xfc\xcfb%\xbb\x9cK\x08\xf5\x11\xf1~P\xf5\xba_\xb0\xdd\xb2\xaf\x17\xcf\x7f)\xfb\xcd\xda\x96~\x8b\xb6J\xaf\x11}\x94\x97\xa5h\x9b\xe2\xefT\x990Er\x05\xda\xd3\x8c\x03\x9e\xff\xe8\xfe\xb9\xc0\xa1b\xa5\x1f\x02\x88\xde\x1e\xd3\x0dT*\xaf\x8c\xe8\xfeA#5c\xa7\xc2:m\xdcP\xe8\x0e\xc3\xee8\x98]\xe1\x9e\xaa\xd4\x9e7S1S\x18\xfeR{jv\xb7<\x0c\xb8+\xdc&\xa3\xe9\xb8\xa9>\x11\xcd\x14o\x7f\xcdicT\x8fF\xde\xdd\xd3\x90\x87\xa7~q\xcb\xbb\xa7\xf6\xd4\x8c?\xec\xce\x1f\xec\xa8\x14'5\xe7\xdd\xb0\xa7B\x00\x5c>\x17\x0a\xe8\x0e\xa3\xa1u\xb7\xbc\xee4\xc0\xe1\xb35\x17\xe94\xb8\x08\x1c\x1ae>\xcc4\xc6.\x80\x9c6:\xca\xf5h\x1b\xff\x97\xf4RF\xf9(\xfb\xd4\x01\xea\x03B\x06aC=I\x85\x0e\x82\x87\xa99\xf0\xbd\xcc\xefo\xd9\xf0\xb4\x93f\x84(i!\x9d.|H'iD\x07\x86\x9b\xa7\xd7yX\xd6\xbdu\xd3%lN\x9309Ew\x14\x1e+\x9ce\xb2\xcf\x93P\xe9\xd2|@\x9br\xd4FB\x08\x1c\x09\xa7~\xe1\xed\x90\xa0\xda*A\xbfF\x82\x9e\x11\xce}\xba\xef\xf0~\xdd\xf5\x07mz\x08B\x9d\xda\xb4\x1a\xf8y\xb5\xbf\xcc\xc8\xd3)\xecOO\x0ex\xfe\xa3SA\x10:T,\x9f\xcf\xc6\xee\x9fW$t\xc7\xc7O*D\xbc\x92Q\xe1Pnw3\xfe\xfcs\x18:\x0a\xb8\xab\xd4\x0c,\xb5\xa7\xe6\xf1\xf0\xf3~&\xb2O\x85\xdeTp<.\xae\xd7\xf3\xe3n\xfb\xa2O\xd68\xd6s\xcf\xc3\xf2v\xc2w\x98\xeb\x1e\xa7\xd4\x9e\x9a\xdd=\xf5;\x1e,\xef/\xb5\xa7f\x178\xc0\xfcs\x18\xb41\x03w\x98\xdb\x1d\x86\xdd?\x1ae\x17B\x08\x22\xcc\xc0h\x88\xd1m\x04 \xddi\xc8X\xe1\x01\xe6\x89\x14y\xc9G\xb9\xf6:B=\xa1#\xc6\x87\x10\xe2C\xe0x\xc7\x0c\xbc\x83%xH\xaf\xa7'/|\xb4\x9b\xa1\x22pH\xab\xa7\x13<Kk&$d\x8d\xe9\xe5\x02`=g\xd2\x22\xe1B]\x9e\xc6\xe8G[\xf4\x1b\xd9\xa2.a\xc2\xfaM\xbf\xeeA\xec\xd7\xcc\xc6\xe0\xc5\x17_\xcc\xba\x19tL\xd8\xa0\x1f\x88\xc0\xc1?\xea`U\x8eH\xad\xf8}\xbaq\xc0\xf3\xdf+\x15\x82\x82\xca\xc2\xe7\xb0T'}\xd8\xf3_\x0a\xc7\xec\x0a<Wnv\xbfy\xb8\xdb\xd1\xc1\xa1\xb2\xb9\x1f`y;\xb0\xa9\xa8\x94\xc6\xfe\xe0\x8f\xe7\x7f<x\xbd0\xf6\x05\x17\xff\xa4u\xaaj<\xdc<<o\x9f\x8c\xfe\xbe\xe2C\x0f?iZ\xdd^\x8fV\x0a\xb3\x86-\x8bP\x0aO\xcdN\xdfa\xe8\xf9\xcfqh\xa4\xa1i\x0d\xaft\xec\x0eCOi\xc8:\xa9\xf24y\xfd@\xa8\xd0h\xf3\xb9\xa0q\xa1\xe3ni=\x9a4\x80I\x10\x88/i!\xee\x08\x14\x04\xabO\xbb\xb9\xee\xa3\x1c\x17\xba\x9evO\xab\xbc\x1c9\x0a&\x15\xaa\xe0\x00\x1c\xf0\x82\xea\x05<\xe5\x8aW<\xd7\xeb\xb9M\x06s\xf7z4\xdc-\xafSi\xc0\xf7\xca\x93\x9a\xf3\xb8\x07\xcb>^\xfc<.\x07+\x9cCAg\xa28:\x0f\x0fE\xb8\xd0L\xf3\xc6\xcd\xe3\xf1\xb2^\x1c&\x8a_=\xb7\x89`y7/\xdbyx\xbdx\xd4\x83\xe1\xcf\xd3\x04-\x1a\x7f`^W\x5c\x10\xf8(\x07\x1d!\xc5\xe7<p]\xa0}R\x84\xe3\x9f\x87\xed\x02\xc8\x85\x10\xba\x7f.`\xdd\xcf>\x05v\xb8\x90\xf7\x97\x19\x87+~E8\x87\x96\x03i\xfec\xa6\xb0\xa2Rx=\xbb!\x1d\xa4\x9f4\xdc\x83D\xb2 s\x84s\xe0P\xe7\xb9\x97cg\x83\xdb\xf3\xe1:\xdc\xf1&\xd3\xf1\xef\x9f\x0b\x16\x1f\xd9\xa0\xfb\x88\xc8\xdd\x1cw2\xba\x93\xb9\x13O\xff\x5c\xd8\xb9\x80Aw3n|\x9e.\xd7\x05:\xb2\x14\x8c)T\xc1\x018P\x94\x85\xa2\x1c\xfc&p\xe0@\x1bc\xaf'\xe8>\xa2\x19O\x87\x9f\x8e\x7f\xa0\xbcu\xc1\xe3z*d\x5c\xd8\xb8\x1ba\x1dh:\x0f4\xbe\x13\xfa?XL\x990\x90\xc2\xb1\xe0@\xc1\x81\x82\x03\xcf0\x0ex\xdb\x89\x9e7\xbb\x9d$\xa7\xe6\x03a\x81\x0b\x92\xbcpI\xe1\xd0w\xfb\x81\x84u\xc8\xfd\x1e,\xa6\x1c\xf2\x88\x16\x01\x14\x1c(8Pp\xe0\x08\xe5@\xbdv\xb4\x1e\xec@\xa3_O\xa8\xd4\x83\x1dh8\x85\xff\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\xa9s\xa0\x94G=\xe3\x1b[\x16\x97\x06\x86\xce\x1d\x1d\x1d9\xaa\xb1)\xdc\xbejt\xe9\x9d_\xb9\xaa4\x92\xc7+\xec\x05\x07\x0a\x0e\x14\x1c(8Pp`\x7f8P\x11<W^_n|td\xdd\xfb\xca\xa5\xf2\xfbC9\xb4\x86R\xa9\x1c\xca\xe5R)\x94\xb6\xea\xe7\xe5w\xbdf\xe9\xed\xfb\x13\xc0\x91\xe2\xe7\xac\xeb\xba\x9f?Z.\xbf~\xe1\x8c\xa5o\xff\xf6KK\x03GJ\xbc\x8ax\x14\x1c(8Pp\xe07\x8d\x03\x0d\x9e\xe0GG\xbb\xdf-I\xf3\xa1R\xb9\xf4\xcd\x96R\xe9\xf8c\x1b\x96\xb45\x84\xc6\x8b\xca\xa5\xb0\xbd\x1c\xc2\x17\xce\xbf\xbe<\xcdq\x9f\x8ez9\x94N*\x97\xc3\xef\xf6\xed\xd9\xd2\xfct\x8c\x7f\x11\xe7\x82\x03\x05\x07\x0a\x0e<S8`#\x9esn\xe8\x9e38X^\xaf\xd1\xcd\x9dw\xbdz\xc9sJ\x8cv2u\xfe\xf5=\xb3gv\xcc\xe8e\x94P\xd6\x08\xe8\x8c\xeb\xba\xdf)OoSC\xbeL#\xa3{\x9b\x1aJ\xef\xbd\xf3\xd5K~\x02\xfa\x19_\xee\xfe?\xa1\x14\xda\x05\xff\xb5FNo\x09\xa14(Jo/7\x84\xa5a\xb4\xfcn\xd1o)\x87\x86k\xeey\xed\xe2\x7f=\xeb\x9b\xeb\xa7\x8f\xec\x19\xf9YC\xa9\xf4\xb9\xd1r8_4_(\xbfw\xb7Lk~\xc3`\xdf\xd0\x07$$^\xa5\x91\xd6\x03\xe5\xa6\xf2\x7f\xbd\xe7\x8ae\xbf\x86\xfe\xe9\xd7n8\xbb\x14\x86?\xaa\xb0\xcf(\x85\xf2\xeaRh\xfc\xf0]\xafY\xfc/\xb8\x9dy\xfd\xfaW\x8e\x8e\x8c\xfce(5\xbc\xbf\x14F\xff8\x94%hB\xf8vcG\xc3\x1f\x8d\xf6\x8e\xbeI\xa3\xb7w\xc9\xbeHi{H\xa3\xb9\xbfl+u|\xa7\x7ft\xf7\xf7\xe4\xf5\x13w\xbff\xe9?A\xa3P\x05\x07\x0a\x0e\x14\x1c(8p\xe89`#\x9e\xc1\xe1\xd2\x99\x12\x16\x1a\xe8\x94\xbf\x98\x0a\x1d\x82\xbf\xed\xaa\xae\xed>5u\xe6\xb5\xdd\x7f\x22\xbc\x8f\xeb[#Aq\x8d\xbe\x05#\xe5\xf2\xcdg]\xbf\xf1\x14\x8bj),W\xe3\xfe\x06\x09\x90cJ\xa1\xe1\xef$t\xe6\x84P\xbe!\x8c\x86+K\x0d\xa5O\x06\x0d\xa7J\xa5\x91\x0f\x82\xdb\xd9\xd7D\xd8'k\x94uMh\x08\xf7hd\xf5%\x09\xb6K\x06\xf7\x0e= \xc1\xb0Kq\xf9\xb8\x84\xcf\xf3KC\xa5\xb7\x80\x7f\xce\xb5\xdd\xc7\x850|\x8b\xe8\xf7\x97\x1a\xc2\xefH\x88\xc9<\xfa\xc53\xae_w9\xee\x12l3\xf5{r\xa9\x5c\xfe\x90\x84\xdb\xb5\x0a\xeb_\x15\xf6\x1b\xca{\xcb\xafn\x90@\x93\x10\xfc9h\x8a\xc1u\x8a\xc4#!\x0cMS:\x96K\x96\xce\x07^\xa8\x82\x03\x05\x07\x0a\x0e\x14\x1c8<\x1ch\x22\x98\xd2hy\x91\x1at5\xca\x0d\x9b&\x0aV\xc2\xe1\xbdj\xf0\x7f\xa0\x11\xc2\xa5\xe0=\xe7\xc6\x9d\xff\xd8\xbbg\xcf\xe6\xd1\x91\xe1?\x96\xf5\xcd\xc0\xd4\x98\xff\xec\xee\xd7.\xfd\xcf\x18\xcf\xf8\xf2\xda\xd3%D^\xfe\x8aW/\xb9\xfc\x9aRi\xf4\x8ck\xd7\xce\x940\xf9\x9f\x8cvB\x1f\x18R\x1a}\xdc\xf3\xea\xa5\x1f\x93\xd0)\x9dy]\xf7[\xe4\xff\xabw\xbfz\xc9{q:\xe3\xda\xee+\xa5\x9d\x86y(\x84\xab\x15\xf6\xae\x853\x96\x5c\x9e\x09\xc2\xafj\x845?\x8cjt\x13\xc2\xbf\x83\x83jhlx\xf9/\xaeZ\xbc\xc6\xe8]\xdb}E\xb9<z\xc1]\xafY\xf6\xa93\xaf[wRy\xb4|\xf9\xccR\xf3\xc7n\xbej\xfe\x1ep\x853//h\x81\x17\xaa\xe0@\xc1\x81\x82\x03\x05\x07\x0e\x1d\x07l\xc4\xd3\x10\x1a\x1e\xb0 F\xc3\xe9\xe3\x05u\xee76-\x90P\x98)\xe1\xf3\x03\xc7\xb9\xf5\xb2\x99;$H~\xa1\x11\xce\xf1\x0e\xd3H\xa5\xbap_\x0a\xbdj\xdd\x87\x11:\xd1\xbd\xa1\x17}N\x8b\xc6 \x99\xd2 \xc8\xf03\x01\xd0\xa7\xe9\xb5\xaa\xffP6\xfc\x88Z>Qa\xcd\xd9\xd8\xd3\xbdS\x02\xad\x8fO\xe1\xbe\x82)5\xa7\x85\xde\xda\xd4\xd0\x8f\x1e\xe9\x95\xb6\xc8di\x04\x96W\x85\xd0\xc9s\xa4\xb0\x17\x1c(8Pp\xe0\xd0s\xc0\x1a\xe5U\x0d\x8b\x1eP\x83\xff\x98F\x07\x7fx\xee\xd7\xba\x97\xa6\xc1\x9ey\xed\xdaW\x9du\xdd\xfaW\x5cz\xf9\xfc-\xc2\xe9\xd3\x94\xd6\xd9\xee\x9em8x\x96FKk\x1dv\xe8\xf4\xd2\x93\x9a>\xdb\xd9\x14\x1a\x8ek\xe8h\x5cf_{\xc3\xa2\x86\x8e\x86\x13\x0f]\x98\x05\xe5\x82\x03\x05\x07\x0a\x0e\x14\x1c8\xd8\x1c\xb0\xa96\x9d\xd3\x19<\xeb\xfa\xf5o\xd6\xe2\xfc\x0f\x07\x07\xc3=\x9a\xc2\xfaDh(=\xaa\xf5\x92\xe7H\xa8\xbc\xad\x5c\x1e\xf9\xe9w\xbe\x12\xbe\xa3\xc0?\xafQ\xc6\xdb\xce\xb8n\xdd\xff\x92\x00\xfa^\xdf\xc8\xba?\xd2\x84U{\xa9\xd4\xf0\x99\x83\x1d\xb11\xf4\x1a\x1a?\x1fFG\xde0\x5c*\xffui`\xf4\xa3M\xc3\xa5~M\xbf\xfd\x9e6#\xfc\xcd\x18\xdc:\x00M\xb3\xed\x02\xbcst\xf0\xd2s\xae\xdfx\xe7\xf4\xd0\xb0\xa5gt\xe0\x9f\x1b\x1aJ\x9f\xfd\xc5UK\xff\xa3\x8e\x97\x02Tp\xa0\xe0@\xc1\x81\x82\x03\x87\x80\x03\x95i(\xad\x8b\xdc\xda\xd4\xdct\x86\xc2\xb8\x97\xb3<\xe5\xd1\xd1\x7f\xd5n\xb3\xcb%x\xbe\xd0\xd5\xd0\xfa\xb2\xdb\xae*\xf55\xb47\xbeGsd\xff\xa4u\x95\xab\xb5)\xe0\xfb\x1a\x81h7Z\xc3[\xb5&\xf3\xfdC\x10\xb7\x1a\x92w_\xb5\xe8G\xda\xac\xc0\xda\xd1o\x8d\x0e\x85{\x07C\xf8\x95\xa6\xde\xce)\xf7\x0du\xd5 \x8ecik\xec\xfc\x0fM\xad\xad\xd1\xd4\xdf\xf5C\xa3Co\xde\x1bF\xe7)m\x97\x8a\xc6\x05\xe3x)\xc0\x05\x07\x0a\x0e\x14\x1c(8p\xb88p\xf1M\xe5\xa6\xfc\x94[\x1a\xb6\x0e\x9b\xb6\x9c\xfd\xe5u\xcbX\xc0O\xe1\x87\xcbL\xdc.\xbe~s\xc7\xbe\x86G|\xb5\xb1a\xae\xfb;\xf7[\xdbf\xb8\xb9\xd0\x0b\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03\x05\x07\x0a\x0e\x14\x1c(8Pp\xa0\xe0@\xc1\x81\x82\x03O#\x0e\xfc\x7fYY\xdb\xa9\xff\x89\xf6G\x00\x00\x00\x00IEND\xaeB`\x82"
-qt_resource_name = "\x00\x0f\x03)\xa2G\x00t\x00k\x00-\x00f\x00l\x00a\x00m\x00e\x00-\x00r\x00e\x00v\x00i\x00e\x00w\x00\x15\x03=\xaa'\x00s\x00u\x00b\x00m\x00i\x00s\x00s\x00i\x00o\x00n\x00_\x00f\x00a\x00i\x00l\x00e\x00d\x00.\x00p\x00n\x00g\x00\x17\x06\x1a:\x07\x00s\x00u\x00b\x00m\x00i\x00s\x00s\x00i\x00o\x00n\x00_\x00c\x00o\x00m\x00p\x00l\x00e\x00t\x00e\x00.\x00p\x00n\x00g\x00\x0d\x0fv\x18\xe7\x00u\x00i\x00_\x00s\x00p\x00l\x00a\x00s\x00h\x00.\x00p\x00n\x00g"
-qt_resource_struct = "\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\x00\x00\x00$\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00T\x00\x00\x00\x00\x00\x01\x00\x00F{\x00\x00\x00\x88\x00\x00\x00\x00\x00\x01\x00\x00u\x93"
-
-
-def qInitResources():
-    QtCore.qRegisterResourceData(
-        0x01, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(
-        0x01, qt_resource_struct, qt_resource_name, qt_resource_data
-    )
-
-
-qInitResources()
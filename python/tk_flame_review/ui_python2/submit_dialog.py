@@ -64,6 +64,3 @@ class Ui_SubmitDialog(object):
                 QtGui.QApplication.UnicodeUTF8,
             )
         )
-
-
-from . import resources_rc
@@ -68,6 +68,3 @@ class Ui_SummaryDialog(object):
                 "SummaryDialog", "Ok", None, QtGui.QApplication.UnicodeUTF8
             )
         )
-
-
-from . import resources_rc
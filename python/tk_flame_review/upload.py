@@ -0,0 +1,655 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Resumable, chunked upload of media files to ShotGrid storage.
+"""
+
+from __future__ import absolute_import
+
+import json
+import mimetypes
+import os
+import struct
+import threading
+import time
+from multiprocessing.pool import ThreadPool
+
+try:
+    from urllib import parse as urlparse
+except ImportError:
+    import urlparse
+
+
+# Size of each uploaded part. Cloud storage requires all parts but the last
+# one to be at least 5 MB.
+DEFAULT_CHUNK_SIZE = 20 * 1024 * 1024
+
+# Number of parts sent at the same time.
+DEFAULT_CONCURRENCY = 4
+
+# Suffix of the progress journal written next to the uploaded file.
+JOURNAL_SUFFIX = ".upload.json"
+
+
+class UploadError(Exception):
+    """
+    Raised when a chunked upload cannot be completed.
+    """
+
+
+class UploadRejectedError(UploadError):
+    """
+    Raised when ShotGrid no longer accepts parts for a multipart upload, for
+    instance because it has expired. The upload can only be started over.
+    """
+
+
+class ShotgunStorageTransport(object):
+    """
+    Talks to the ShotGrid upload endpoints used for direct-to-storage multipart
+    uploads.
+
+    This mirrors what ``shotgun_api3.Shotgun.upload`` does internally, but exposes
+    each step so that an upload can be interrupted and picked up again part by
+    part. Any object implementing the same methods can be handed to the
+    :class:`ChunkedUploader`, which is how the uploader is exercised against a
+    local HTTP stand-in.
+    """
+
+    def __init__(self, shotgun):
+        """
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        """
+        self._sg = shotgun
+
+    def supports(self, entity_type, field_name):
+        """
+        Returns True if the site accepts direct multipart uploads for the field.
+
+        :param entity_type: Entity type the file is uploaded to.
+        :param field_name: Field the file is uploaded to.
+        """
+        # use the same rules as Shotgun.upload, so that files it would send to the
+        # storage are never sent through the ShotGrid server instead.
+        return self._sg._requires_direct_s3_upload(entity_type, field_name)
+
+    def authenticate(self):
+        """
+        Resolves what the connection otherwise looks up on its first request: the
+        server's capabilities and the authentication parameters.
+
+        Once done, the upload endpoints can be called from several threads at the
+        same time, since each of their requests opens its own connection.
+        """
+        self._sg.server_caps
+        self._sg._auth_params()
+
+    def begin(self, filename):
+        """
+        Requests a new multipart upload from ShotGrid.
+
+        :param filename: Name of the file being uploaded.
+        :returns: Upload info dictionary. It must be JSON serializable since it is
+                  stored in the progress journal.
+        """
+        return self._sg._get_attachment_upload_info(False, filename, True)
+
+    def get_part_url(self, upload_info, filename, part_number):
+        """
+        Returns the url the given part has to be sent to.
+
+        :raises UploadRejectedError: If ShotGrid does not accept parts for the
+                                     upload anymore.
+        """
+        params = self._upload_params(upload_info, filename)
+        params["part_number"] = part_number
+        result = self._send_form("/upload/api_get_upload_link_for_part", params)
+        if not result.startswith("1"):
+            raise UploadRejectedError(
+                "Could not get a link for part %d of %s: %s"
+                % (part_number, filename, result.strip())
+            )
+        return result.split("\n", 2)[1]
+
+    def put_part(self, data, content_type, url):
+        """
+        Sends a single part and returns the etag acknowledging it.
+        """
+        return self._sg._upload_data_to_storage(data, content_type, len(data), url)
+
+    def complete(self, upload_info, filename, etags):
+        """
+        Tells ShotGrid all the parts have been sent.
+
+        :raises UploadRejectedError: If ShotGrid does not accept the upload.
+        """
+        params = self._upload_params(upload_info, filename)
+        params["etags"] = ",".join(etags)
+        result = self._send_form("/upload/api_complete_multipart_upload", params)
+        if not result.startswith("1"):
+            raise UploadRejectedError(
+                "Could not complete the upload of %s: %s" % (filename, result.strip())
+            )
+
+    def link(self, entity_type, entity_id, field_name, upload_info, display_name):
+        """
+        Creates the Attachment for the uploaded file and links it to the entity.
+
+        :returns: Id of the created Attachment.
+        """
+        params = {
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "upload_link_info": upload_info["upload_info"],
+            "field_name": field_name,
+            "display_name": display_name,
+        }
+        result = self._send_form("/upload/api_link_file", params)
+        if not result.startswith("1"):
+            raise UploadError(
+                "Could not link uploaded file to %s %s: %s"
+                % (entity_type, entity_id, result)
+            )
+        return int(result.split(":", 2)[1].split("\n", 1)[0])
+
+    def _upload_params(self, upload_info, filename):
+        """
+        Returns the parameters identifying a multipart upload.
+        """
+        return {
+            "upload_type": upload_info["upload_type"],
+            "filename": filename,
+            "timestamp": upload_info["timestamp"],
+            "upload_id": upload_info["upload_id"],
+        }
+
+    def _send_form(self, path, params):
+        """
+        Posts the parameters to a ShotGrid upload endpoint.
+
+        Connection errors are raised, while the errors reported by the endpoint
+        are left in the response, which starts with "1" on success.
+
+        :param path: Path of the endpoint on the site.
+        :param params: Dictionary of the form's parameters.
+        :returns: The response of the endpoint.
+        """
+        url = urlparse.urlunparse(
+            (self._sg.config.scheme, self._sg.config.server, path, None, None, None)
+        )
+        return str(self._sg._send_form(url, params))
+
+
+class UploadJournal(object):
+    """
+    Records the progress of a chunked upload on disk, next to the uploaded file.
+
+    Every acknowledged part is written to the journal straight away, so that a
+    retried job can resume after the last part the server accepted.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Path of the file being uploaded.
+        """
+        self.path = path + JOURNAL_SUFFIX
+        self.data = {}
+        self._lock = threading.Lock()
+
+    def load(self, signature):
+        """
+        Loads a previous journal if it matches the file being uploaded.
+
+        :param signature: Dictionary describing the file and chunking. A journal
+                          recorded for a different signature is ignored.
+        :returns: True if a matching journal was found.
+        """
+        self.data = {"signature": signature, "upload_info": None, "parts": {}}
+        try:
+            with open(self.path, "r") as fh:
+                data = json.load(fh)
+        except (IOError, OSError, ValueError):
+            return False
+
+        if data.get("signature") != signature or not data.get("upload_info"):
+            return False
+
+        self.data = data
+        return True
+
+    @property
+    def upload_info(self):
+        return self.data.get("upload_info")
+
+    @property
+    def parts(self):
+        """
+        Dictionary of acknowledged part numbers to their etags.
+        """
+        return dict((int(number), etag) for number, etag in self.data["parts"].items())
+
+    def start(self, upload_info):
+        """
+        Records a new upload, dropping any previously acknowledged parts.
+        """
+        self.data["upload_info"] = upload_info
+        self.data["parts"] = {}
+        self.save()
+
+    def reset(self):
+        """
+        Forgets the recorded upload so that a new one is started.
+        """
+        self.data["upload_info"] = None
+        self.data["parts"] = {}
+        self.discard()
+
+    def acknowledge(self, part_number, etag):
+        """
+        Records a part the server has accepted. Safe to call from several threads.
+        """
+        with self._lock:
+            self.data["parts"][str(part_number)] = etag
+            self.save()
+
+    def save(self):
+        # Write to a temporary file first so that a crash never leaves a
+        # truncated journal behind.
+        tmp_path = "%s.tmp" % self.path
+        with open(tmp_path, "w") as fh:
+            json.dump(self.data, fh)
+        os.rename(tmp_path, self.path)
+
+    def discard(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ChunkedUploader(object):
+    """
+    Uploads a file to a ShotGrid entity field in parts, resuming from the
+    progress journal of an earlier attempt when there is one.
+    """
+
+    def __init__(
+        self,
+        shotgun,
+        chunk_size=DEFAULT_CHUNK_SIZE,
+        concurrency=DEFAULT_CONCURRENCY,
+        max_retries=5,
+        logger=None,
+        transport=None,
+    ):
+        """
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        :param chunk_size: Size in bytes of each uploaded part.
+        :param concurrency: Number of parts sent in parallel.
+        :param max_retries: Number of times a failing part is retried before giving up.
+        :param logger: Optional callable used to log debug messages.
+        :param transport: Optional transport, defaults to :class:`ShotgunStorageTransport`.
+        """
+        self._sg = shotgun
+        self._chunk_size = chunk_size
+        self._concurrency = max(1, concurrency)
+        self._max_retries = max_retries
+        self._log = logger or (lambda msg: None)
+        self._transport = transport or ShotgunStorageTransport(shotgun)
+
+    def upload(self, entity_type, entity_id, path, field_name, display_name=None):
+        """
+        Uploads the file to the given entity field.
+
+        Sites which do not support direct multipart uploads, as well as files
+        smaller than a single part, go through the regular ``Shotgun.upload`` call.
+
+        :param entity_type: Entity type to upload to.
+        :param entity_id: Id of the entity to upload to.
+        :param path: Path of the file to upload.
+        :param field_name: Field to upload the file to.
+        :param display_name: Optional display name, defaults to the file name.
+        :returns: Id of the created Attachment.
+        """
+        file_size = os.path.getsize(path)
+        display_name = display_name or os.path.basename(path)
+
+        if file_size <= self._chunk_size or not self._transport.supports(
+            entity_type, field_name
+        ):
+            self._log("Uploading %s in a single request." % path)
+            return self._sg.upload(
+                entity_type, entity_id, path, field_name, display_name
+            )
+
+        journal = UploadJournal(path)
+        resumed = journal.load(
+            {
+                "filename": os.path.basename(path),
+                "size": file_size,
+                "mtime": int(os.path.getmtime(path)),
+                "chunk_size": self._chunk_size,
+            }
+        )
+        if resumed:
+            self._log(
+                "Resuming upload of %s, %d part(s) already acknowledged."
+                % (path, len(journal.parts))
+            )
+        return self._finish(
+            entity_type, entity_id, path, field_name, display_name, journal, resumed
+        )
+
+    def follow(
+        self,
+        entity_type,
+        entity_id,
+        path,
+        field_name,
+        display_name=None,
+        poll_interval=5,
+        stall_timeout=3600,
+        start_timeout=4 * 3600,
+    ):
+        """
+        Uploads a quicktime while it is still being written.
+
+        Parts are sent as soon as they have been completely written, so that the
+        upload overlaps with the export instead of starting after it. The upload
+        is completed once the quicktime is complete, see :func:`quicktime_is_complete`.
+
+        The first part is only sent once the file is complete, since quicktime
+        writers go back to the start of the file to fill in the size of the media
+        atom when they close it.
+
+        :param entity_type: Entity type to upload to.
+        :param entity_id: Id of the entity to upload to.
+        :param path: Path of the quicktime, which does not need to exist yet.
+        :param field_name: Field to upload the file to.
+        :param display_name: Optional display name, defaults to the file name.
+        :param poll_interval: Number of seconds between two checks of the file.
+        :param stall_timeout: Number of seconds after which a file which stopped
+                              growing without being complete is considered failed.
+        :param start_timeout: Number of seconds after which a file which still does
+                              not exist is considered failed, for instance because
+                              its export job failed or was cancelled.
+        :returns: Id of the created Attachment.
+        """
+        display_name = display_name or os.path.basename(path)
+
+        if not self._transport.supports(entity_type, field_name):
+            self._wait_for_quicktime(path, poll_interval, stall_timeout, start_timeout)
+            return self.upload(entity_type, entity_id, path, field_name, display_name)
+
+        filename = os.path.basename(path)
+        journal = UploadJournal(path)
+        resumed = journal.load(
+            {"filename": filename, "chunk_size": self._chunk_size, "follow": True}
+        )
+        if resumed:
+            self._log(
+                "Resuming upload of %s, %d part(s) already acknowledged."
+                % (path, len(journal.parts))
+            )
+        else:
+            journal.start(self._call(self._transport.begin, filename))
+
+        def send_written_parts(size):
+            written = size // self._chunk_size
+            acknowledged = journal.parts
+            pending = [
+                number for number in range(2, written + 1) if number not in acknowledged
+            ]
+            if pending:
+                self._send_parts(path, filename, journal, pending, "?")
+
+        # if the export fails, the parts sent so far are in the journal for the
+        # next attempt.
+        self._wait_for_quicktime(
+            path, poll_interval, stall_timeout, start_timeout, send_written_parts
+        )
+
+        return self._finish(
+            entity_type, entity_id, path, field_name, display_name, journal, resumed
+        )
+
+    def _wait_for_quicktime(
+        self, path, poll_interval, stall_timeout, start_timeout, on_growth=None
+    ):
+        """
+        Waits until the quicktime at path is complete.
+
+        :param on_growth: Optional callable called with the size of the file every
+                          time it has grown.
+        :raises UploadError: If the file does not exist after the start timeout, or
+                             stops growing for longer than the stall timeout without
+                             being complete. The stall timeout only runs once the
+                             file exists.
+        """
+        started = time.time()
+        last_size = None
+        last_change = started
+        while True:
+            size = os.path.getsize(path) if os.path.exists(path) else None
+            if size is not None and size == last_size and quicktime_is_complete(path):
+                # the size did not change since the last poll, so the writer is done.
+                return
+
+            if size is None:
+                # the export job may not have started yet, which is not a stall,
+                # but it may also have failed or been cancelled.
+                if time.time() - started > start_timeout:
+                    raise UploadError(
+                        "%s has not been created after %ss." % (path, start_timeout)
+                    )
+                last_change = time.time()
+            elif size != last_size:
+                last_size = size
+                last_change = time.time()
+                if on_growth and size:
+                    on_growth(size)
+            elif time.time() - last_change > stall_timeout:
+                raise UploadError(
+                    "%s has not been written to for %ss and is not a complete quicktime."
+                    % (path, stall_timeout)
+                )
+            time.sleep(poll_interval)
+
+    def _finish(
+        self, entity_type, entity_id, path, field_name, display_name, journal, resumed
+    ):
+        """
+        Sends the remaining parts of a complete file, then links it to the entity.
+        """
+        file_size = os.path.getsize(path)
+        try:
+            upload_info = self._upload_parts(path, file_size, journal)
+        except UploadRejectedError as e:
+            # The server expired the upload we were resuming. Start over once from
+            # a fresh upload before giving up. Any other failure keeps the journal,
+            # so that the next attempt still resumes.
+            if not resumed:
+                raise
+            self._log("Could not resume upload of %s (%s), restarting it." % (path, e))
+            journal.reset()
+            upload_info = self._upload_parts(path, file_size, journal)
+
+        attachment_id = self._transport.link(
+            entity_type, entity_id, field_name, upload_info, display_name
+        )
+        journal.discard()
+        return attachment_id
+
+    def _upload_parts(self, path, file_size, journal):
+        """
+        Sends all the parts not acknowledged yet and completes the upload.
+
+        :returns: The upload info of the completed upload.
+        """
+        filename = os.path.basename(path)
+        if not journal.upload_info:
+            journal.start(self._call(self._transport.begin, filename))
+
+        upload_info = journal.upload_info
+        part_count = (file_size + self._chunk_size - 1) // self._chunk_size
+        acknowledged = journal.parts
+        pending = [
+            number for number in range(1, part_count + 1) if number not in acknowledged
+        ]
+        self._send_parts(path, filename, journal, pending, part_count)
+
+        etags = [journal.parts[number] for number in range(1, part_count + 1)]
+        self._call(self._transport.complete, upload_info, filename, etags)
+        return upload_info
+
+    def _send_parts(self, path, filename, journal, part_numbers, part_count):
+        """
+        Sends the given parts from a bounded thread pool, recording each in the journal.
+
+        Each part needs its own url from ShotGrid. The url of a part is requested
+        while the part ``concurrency`` places before it is being sent, so that the
+        workers find their next url ready instead of waiting a round trip for it.
+
+        :param part_count: Total number of parts, only used for logging.
+        """
+        upload_info = journal.upload_info
+        content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        concurrency = min(self._concurrency, max(1, len(part_numbers)))
+
+        # the urls are requested from several threads at the same time.
+        self._call(self._transport.authenticate)
+        failed = threading.Event()
+        url_pool = ThreadPool(concurrency)
+        urls = {}
+
+        def request_url(index):
+            if index < len(part_numbers) and not failed.is_set():
+                urls[part_numbers[index]] = url_pool.apply_async(
+                    self._transport.get_part_url,
+                    (upload_info, filename, part_numbers[index]),
+                )
+
+        def upload_part(index):
+            if failed.is_set():
+                return
+            part_number = part_numbers[index]
+            request_url(index + concurrency)
+            with open(path, "rb") as fh:
+                fh.seek((part_number - 1) * self._chunk_size)
+                data = fh.read(self._chunk_size)
+            etag = self._send_part(
+                upload_info,
+                filename,
+                part_number,
+                data,
+                content_type,
+                urls.pop(part_number, None),
+            )
+            journal.acknowledge(part_number, etag)
+            self._log("Uploaded part %d/%s of %s." % (part_number, part_count, path))
+
+        for index in range(concurrency):
+            request_url(index)
+        pool = ThreadPool(concurrency)
+        try:
+            # Consume the results so that the first failing part is raised here.
+            for _ in pool.imap_unordered(upload_part, range(len(part_numbers))):
+                pass
+        except Exception:
+            failed.set()
+            raise
+        finally:
+            # wait for the parts in flight, so that none of them is recorded in the
+            # journal once the upload is retried.
+            pool.close()
+            pool.join()
+            url_pool.close()
+            url_pool.join()
+
+    def _send_part(
+        self, upload_info, filename, part_number, data, content_type, url_request
+    ):
+        """
+        Sends a single part, returning its etag.
+
+        :param url_request: Optional ``AsyncResult`` of a request for the part's
+                            url, which is used for the first attempt.
+        """
+        url_requests = [url_request] if url_request else []
+
+        # Part urls are pre-signed and short lived, so request a fresh one for
+        # every retry.
+        def send():
+            if url_requests:
+                url = url_requests.pop().get()
+            else:
+                url = self._transport.get_part_url(upload_info, filename, part_number)
+            return self._transport.put_part(data, content_type, url)
+
+        return self._call(send)
+
+    def _call(self, func, *args):
+        """
+        Calls func, retrying with an exponential backoff when it fails.
+        """
+        delay = 1
+        for attempt in range(self._max_retries + 1):
+            try:
+                return func(*args)
+            except UploadRejectedError:
+                # asking again won't change the server's mind.
+                raise
+            except Exception as e:
+                if attempt == self._max_retries:
+                    raise UploadError(
+                        "Giving up after %d attempts: %s" % (attempt + 1, e)
+                    )
+                self._log("Upload request failed (%s), retrying in %ss." % (e, delay))
+                time.sleep(delay)
+                delay = min(delay * 2, 60)
+
+
+def quicktime_is_complete(path):
+    """
+    Returns True if the file at path is a complete quicktime.
+
+    Walks the top level atoms of the file. A quicktime being written either has a
+    media atom whose size is not filled in yet, or is missing its movie atom, which
+    is written last.
+
+    :param path: Path to the quicktime.
+    """
+    try:
+        size = os.path.getsize(path)
+        atoms = set()
+        offset = 0
+        with open(path, "rb") as fh:
+            while offset < size:
+                fh.seek(offset)
+                header = fh.read(8)
+                if len(header) < 8:
+                    return False
+                atom_size = struct.unpack(">I", header[:4])[0]
+                atoms.add(header[4:8])
+                if atom_size == 1:
+                    extended = fh.read(8)
+                    if len(extended) < 8:
+                        return False
+                    atom_size = struct.unpack(">Q", extended)[0]
+                elif atom_size == 0:
+                    # the atom extends to the end of the file, which is how the
+                    # media atom looks until the writer closes the file.
+                    return False
+                if atom_size < 8:
+                    return False
+                offset += atom_size
+    except (IOError, OSError):
+        return False
+
+    return offset == size and b"moov" in atoms and b"mdat" in atoms
@@ -0,0 +1,276 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Long lived local upload daemon which backburner jobs hand their uploads to.
+
+Only uses the Python standard library, since the backburner jobs run this file
+as a script to hand their uploads over without bootstrapping the toolkit, see
+:func:`main`.
+"""
+
+from __future__ import absolute_import
+
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+
+try:
+    import socketserver
+except ImportError:
+    import SocketServer as socketserver
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Reads a single JSON request line and writes back a single JSON response line.
+    """
+
+    def handle(self):
+        daemon = self.server.upload_daemon
+        try:
+            request = json.loads(self.rfile.readline().decode("utf-8"))
+            response = daemon._handle(request)
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+
+class UploadDaemon(object):
+    """
+    Accepts uploads over a Unix socket and runs them in the process hosting it.
+
+    The daemon is hosted by the Flame process, where the toolkit is already
+    bootstrapped and its ShotGrid connections are authenticated. Backburner jobs
+    hand their uploads over instead of setting all of that up again for each job.
+    """
+
+    def __init__(
+        self, socket_path, handler, warm_up=None, logger=None, bootstrap_time=None
+    ):
+        """
+        :param socket_path: Path of the Unix socket to listen on. Its folder is
+                            created if needed, and only the current user may
+                            use it.
+        :param handler: Callable receiving the list of uploads of a request. It must
+                        return quickly, running the uploads in the background.
+        :param warm_up: Optional callable setting up the resources the uploads need,
+                        for example an authenticated ShotGrid connection.
+        :param logger: Optional callable used to log debug messages.
+        :param bootstrap_time: Optional callable returning the number of seconds a
+                               job bootstrapping the toolkit takes to start, or
+                               None if unknown. Jobs reporting their own start up
+                               time are told the difference as the time they saved.
+        """
+        self.socket_path = socket_path
+        self._handler = handler
+        self._warm_up = warm_up
+        self._log = logger or (lambda msg: None)
+        self._bootstrap_time = bootstrap_time
+        self._server = None
+        self._thread = None
+        self.warm_up_time = 0.0
+        self.jobs_handled = 0
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """
+        Starts listening in a background thread.
+        """
+        if self.running:
+            return
+
+        _make_private_folder(os.path.dirname(self.socket_path))
+        if os.path.exists(self.socket_path):
+            # a daemon which did not shut down cleanly leaves its socket behind.
+            os.remove(self.socket_path)
+
+        self._server = _Server(self.socket_path, _RequestHandler)
+        os.chmod(self.socket_path, 0o600)
+        self._server.upload_daemon = self
+        self._thread = threading.Thread(
+            target=self._serve, name="tk-flame-review upload daemon"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+        self._log("Upload daemon listening on %s." % self.socket_path)
+
+    def _serve(self):
+        if self._warm_up:
+            start = time.time()
+            try:
+                self._warm_up()
+            except Exception as e:
+                self._log("Upload daemon warm up failed: %s" % e)
+            self.warm_up_time = time.time() - start
+            self._log("Upload daemon warmed up in %.2fs." % self.warm_up_time)
+        self._server.serve_forever()
+
+    def stop(self):
+        """
+        Stops listening and removes the socket.
+        """
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._thread = None
+
+    def _handle(self, request):
+        received = time.time()
+        self._handler(request["uploads"])
+        self.jobs_handled += 1
+        response = {
+            "accepted": len(request["uploads"]),
+            "handling_time": time.time() - received,
+        }
+        bootstrap_time = self._bootstrap_time() if self._bootstrap_time else None
+        if bootstrap_time is not None and request.get("startup") is not None:
+            response["saved"] = max(0.0, bootstrap_time - request["startup"])
+            self._log(
+                "Upload job handed over %d upload(s), saving about %.2fs of toolkit "
+                "bootstrap." % (response["accepted"], response["saved"])
+            )
+        return response
+
+
+def _make_private_folder(folder):
+    """
+    Creates a folder only the current user can access, or checks an existing one
+    is, so that other users can't connect to the sockets it holds.
+
+    :raises OSError: If the folder is owned by another user.
+    """
+    if not os.path.isdir(folder):
+        os.makedirs(folder, 0o700)
+    info = os.lstat(folder)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise OSError("%s is not a folder owned by the current user." % folder)
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(folder, 0o700)
+
+
+def process_age():
+    """
+    Returns the number of seconds since the current process started, or None if
+    the platform doesn't tell, which is the case outside of Linux.
+    """
+    try:
+        with open("/proc/self/stat") as fh:
+            # the name of the executable may hold spaces, skip past it.
+            fields = fh.read().rsplit(")", 1)[1].split()
+        with open("/proc/uptime") as fh:
+            uptime = float(fh.read().split()[0])
+        started = float(fields[19]) / os.sysconf("SC_CLK_TCK")
+    except (EnvironmentError, ValueError, IndexError, KeyError):
+        return None
+    return max(0.0, uptime - started)
+
+
+def hand_off(socket_path, uploads, timeout=30, startup=None):
+    """
+    Hands uploads over to a running :class:`UploadDaemon`.
+
+    :param socket_path: Path of the daemon's Unix socket.
+    :param uploads: List of uploads to hand over. Must be JSON serializable.
+    :param timeout: Number of seconds to wait for the daemon to answer.
+    :param startup: Optional number of seconds the calling job took to start,
+                    which the daemon reports the saved time from.
+    :returns: The daemon's response dictionary, or None if no daemon accepted the
+              uploads.
+    """
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+        request = {"uploads": uploads}
+        if startup is not None:
+            request["startup"] = startup
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            data += chunk
+        response = json.loads(data.decode("utf-8"))
+    except (socket.error, ValueError):
+        return None
+    finally:
+        sock.close()
+
+    if "error" in response:
+        return None
+    return response
+
+
+def main(argv=None):
+    """
+    Hands the uploads of a backburner job over to the upload daemon.
+
+    The job runs this file as a script, with the path of a JSON file holding the
+    path of the daemon's ``socket``, the path of the upload ``queue`` and the
+    ``uploads`` to hand over. If no daemon accepts them, Flame is gone: the
+    uploads are released in the queue for the next drain, and the job fails.
+
+    :param argv: Arguments of the script, ``sys.argv[1:]`` by default.
+    :returns: The exit code of the job.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    with open(argv[0]) as fh:
+        request = json.load(fh)
+
+    uploads = request["uploads"]
+    response = hand_off(request["socket"], uploads, startup=process_age())
+    if response:
+        if "saved" in response:
+            print(
+                "Handed %d upload(s) to the upload daemon, saving about %.2fs of "
+                "toolkit bootstrap." % (response["accepted"], response["saved"])
+            )
+        else:
+            print("Handed %d upload(s) to the upload daemon." % response["accepted"])
+        os.remove(argv[0])
+        return 0
+
+    if __package__:
+        from .upload_queue import UploadQueue
+    else:
+        # run as a script, next to the other modules of the package.
+        from upload_queue import UploadQueue
+    queue = UploadQueue(request["queue"])
+    released = sum(
+        queue.release(owner) for owner in set(upload["owner"] for upload in uploads)
+    )
+    sys.stderr.write(
+        "No upload daemon accepted the uploads, released %d of them for the next "
+        "drain of the upload queue.\n" % released
+    )
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,386 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Durable on-disk queue of pending quicktime uploads.
+"""
+
+from __future__ import absolute_import
+
+import os
+import random
+import sqlite3
+import time
+
+
+class UploadQueue(object):
+    """
+    SQLite backed queue recording every upload the app has to perform.
+
+    Entries are written when the export is submitted and only removed from the
+    pending states once the media is on the Version, so an upload whose backburner
+    job was purged or lost can always be picked up again by a later drain.
+
+    Entries go through the following states:
+
+    - ``pending``: waiting to be uploaded, no earlier than ``next_attempt``.
+    - ``running``: claimed by a worker, or owned by the backburner job which is
+      going to upload it. The claim is a lease which expires, so entries held by
+      a worker or a job that died are picked up again by a drain.
+    - ``done``: the media has been uploaded.
+    - ``failed``: every attempt failed, the entry is not retried anymore.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(
+        self,
+        path,
+        max_attempts=8,
+        base_delay=30,
+        max_delay=3600,
+        lease=4 * 3600,
+        owner_lease=24 * 3600,
+    ):
+        """
+        :param path: Path to the SQLite database, created if needed.
+        :param max_attempts: Number of failed attempts after which an entry is
+                             marked as failed.
+        :param base_delay: Delay in seconds before the first retry. Each following
+                           retry doubles it.
+        :param max_delay: Upper bound in seconds for the retry delay.
+        :param lease: Number of seconds a claimed entry is reserved for a worker.
+        :param owner_lease: Number of seconds an entry is reserved for the job owning
+                            it, which covers the time the job waits for the export.
+        """
+        self.path = path
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._lease = lease
+        self._owner_lease = owner_lease
+
+        folder = os.path.dirname(path)
+        if folder and not os.path.isdir(folder):
+            os.makedirs(folder)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS uploads (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    full_path TEXT NOT NULL,
+                    sg_version_id INTEGER NOT NULL,
+                    field_name TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt REAL NOT NULL,
+                    last_error TEXT,
+                    created REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    owner TEXT,
+                    wait_for_thumbnail INTEGER NOT NULL DEFAULT 0,
+                    UNIQUE (full_path, sg_version_id, field_name)
+                )
+                """
+            )
+            # queue created by an earlier version of the app.
+            columns = [
+                row["name"] for row in conn.execute("PRAGMA table_info(uploads)")
+            ]
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE uploads ADD COLUMN owner TEXT")
+            if "wait_for_thumbnail" not in columns:
+                conn.execute(
+                    "ALTER TABLE uploads ADD COLUMN "
+                    "wait_for_thumbnail INTEGER NOT NULL DEFAULT 0"
+                )
+
+    def _connect(self):
+        # Backburner jobs and Flame may all write to the queue at the same time,
+        # so use a short lived connection per operation and let SQLite wait
+        # on the others.
+        conn = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return _Transaction(conn)
+
+    def enqueue(
+        self,
+        full_path,
+        sg_version_id,
+        field_name,
+        delay=0,
+        owner=None,
+        wait_for_thumbnail=False,
+    ):
+        """
+        Records an upload. Enqueuing an upload which is already known is a no-op.
+
+        :param full_path: Path to the file to upload.
+        :param sg_version_id: Id of the Version to upload to.
+        :param field_name: Version field to upload to.
+        :param delay: Number of seconds before the entry can be drained.
+        :param owner: Token of the backburner job which is going to upload the file.
+                      The entry is then reserved for that job, and only drained if
+                      the job doesn't claim it before the owner lease expires.
+        :param wait_for_thumbnail: True if the file is still needed to generate its
+                                   thumbnail once uploaded.
+        :returns: The id of the entry.
+        """
+        now = time.time()
+        if owner:
+            state, next_attempt = self.RUNNING, now + self._owner_lease
+        else:
+            state, next_attempt = self.PENDING, now + delay
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO uploads "
+                "(full_path, sg_version_id, field_name, state, next_attempt, created, "
+                "updated, owner, wait_for_thumbnail) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    full_path,
+                    sg_version_id,
+                    field_name,
+                    state,
+                    next_attempt,
+                    now,
+                    now,
+                    owner,
+                    int(wait_for_thumbnail),
+                ),
+            )
+            row = conn.execute(
+                "SELECT id FROM uploads WHERE full_path = ? AND sg_version_id = ? AND field_name = ?",
+                (full_path, sg_version_id, field_name),
+            ).fetchone()
+        return row["id"]
+
+    def get(self, entry_id):
+        """
+        Returns the entry with the given id as a dictionary, or None.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM uploads WHERE id = ?", (entry_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find(self, full_path):
+        """
+        Returns all the entries uploading the given file.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM uploads WHERE full_path = ?", (full_path,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    @property
+    def lease(self):
+        """
+        Number of seconds a claimed entry is reserved for a worker.
+        """
+        return self._lease
+
+    def claim(self, entry_id=None, owner=None, lease=None):
+        """
+        Reserves an entry for the calling worker.
+
+        :param entry_id: Id of the entry to claim. If not given, the entry due the
+                         longest is claimed.
+        :param owner: Token of the backburner job owning the given entry. The job
+                      can claim it while it holds it, or again when it is retried,
+                      without waiting for its retry delay.
+        :param lease: Number of seconds the entry is reserved for. Defaults to the
+                      owner lease when a job claims its own entry, and to the
+                      lease otherwise.
+        :returns: The claimed entry as a dictionary, or None if nothing could be claimed.
+        """
+        now = time.time()
+        default_lease = self._lease
+        if entry_id is not None and owner:
+            # skip the retry delay, but never steal an entry another worker holds.
+            query = (
+                "SELECT * FROM uploads WHERE id = ? AND (state = ? OR "
+                "(state = ? AND (owner = ? OR next_attempt <= ?)))"
+            )
+            params = [entry_id, self.PENDING, self.RUNNING, owner, now]
+            default_lease = self._owner_lease
+        else:
+            query = "SELECT * FROM uploads WHERE state IN (?, ?) AND next_attempt <= ?"
+            params = [self.PENDING, self.RUNNING, now]
+            if entry_id is not None:
+                query += " AND id = ?"
+                params.append(entry_id)
+            query += " ORDER BY next_attempt LIMIT 1"
+
+        with self._connect() as conn:
+            # take the write lock straight away so two workers can't claim the
+            # same entry.
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(query, params).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                "UPDATE uploads SET state = ?, next_attempt = ?, updated = ?, owner = ? "
+                "WHERE id = ?",
+                (self.RUNNING, now + (lease or default_lease), now, owner, row["id"]),
+            )
+        entry = dict(row)
+        entry["state"] = self.RUNNING
+        entry["owner"] = owner
+        return entry
+
+    def release(self, owner):
+        """
+        Puts back the entries a job still holds, so that the next drain picks them
+        up without waiting for their lease to expire. The job can still claim them
+        again if it is retried.
+
+        :param owner: Token of the job holding the entries.
+        :returns: The number of entries released.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE uploads SET state = ?, next_attempt = ?, updated = ? "
+                "WHERE state = ? AND owner = ?",
+                (self.PENDING, now, now, self.RUNNING, owner),
+            )
+        return cursor.rowcount
+
+    def complete(self, entry_id):
+        """
+        Marks an entry as uploaded.
+        """
+        self._set(entry_id, state=self.DONE, last_error=None)
+
+    def defer(self, entry_id, delay):
+        """
+        Puts a claimed entry back without counting it as a failed attempt.
+        """
+        self._set(entry_id, state=self.PENDING, next_attempt=time.time() + delay)
+
+    def fail(self, entry_id, error):
+        """
+        Records a failed attempt and schedules the next one.
+
+        Retries back off exponentially with jitter, so that a burst of failures
+        caused by an unreachable site does not turn into a burst of retries once it
+        is back.
+
+        :returns: True if the entry will be retried, False if it gave up.
+        """
+        entry = self.get(entry_id)
+        attempts = entry["attempts"] + 1
+        if attempts >= self._max_attempts:
+            self._set(
+                entry_id, state=self.FAILED, attempts=attempts, last_error=str(error)
+            )
+            return False
+
+        delay = min(self._base_delay * (2 ** (attempts - 1)), self._max_delay)
+        delay = delay / 2.0 + random.uniform(0, delay / 2.0)
+        self._set(
+            entry_id,
+            state=self.PENDING,
+            attempts=attempts,
+            next_attempt=time.time() + delay,
+            last_error=str(error),
+        )
+        return True
+
+    def due(self):
+        """
+        Returns the entries which could be claimed right now.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM uploads WHERE state IN (?, ?) AND next_attempt <= ? "
+                "ORDER BY next_attempt",
+                (self.PENDING, self.RUNNING, time.time()),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def drain(self, handler, limit=None):
+        """
+        Claims due entries one after the other and hands them to the handler.
+
+        The handler is called with the entry dictionary. The entry is marked as done
+        if it returns, and as a failed attempt if it raises. A handler which cannot
+        process the entry yet may call :meth:`defer` and return False instead.
+        Deferred entries are not counted as uploaded nor as failed.
+
+        :param handler: Callable processing a single entry.
+        :param limit: Maximum number of entries processed.
+        :returns: Tuple with the number of uploaded and failed entries.
+        """
+        uploaded = failed = 0
+        while limit is None or uploaded + failed < limit:
+            entry = self.claim()
+            if not entry:
+                break
+            result = self.process(entry, handler)
+            if result:
+                uploaded += 1
+            elif result is False:
+                failed += 1
+        return uploaded, failed
+
+    def process(self, entry, handler):
+        """
+        Runs the handler for a claimed entry and records the outcome.
+
+        :returns: True if the entry was uploaded, False if the attempt failed and
+                  None if the handler deferred it.
+        """
+        try:
+            result = handler(entry)
+        except Exception as e:
+            self.fail(entry["id"], e)
+            return False
+        if result is False:
+            return None
+        self.complete(entry["id"])
+        return True
+
+    def _set(self, entry_id, **fields):
+        fields["updated"] = time.time()
+        names = sorted(fields)
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE uploads SET %s WHERE id = ?"
+                % ", ".join("%s = ?" % name for name in names),
+                [fields[name] for name in names] + [entry_id],
+            )
+
+
+class _Transaction(object):
+    """
+    Context manager committing (or rolling back) and closing a connection.
+    """
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __enter__(self):
+        return self._conn
+
+    def __exit__(self, exc_type, exc_value, tb):
+        try:
+            self._conn.execute("ROLLBACK" if exc_type else "COMMIT")
+        except sqlite3.OperationalError:
+            # the connection is in autocommit mode, only claims open a transaction.
+            pass
+        finally:
+            self._conn.close()
@@ -25,6 +25,9 @@ function build_qt {
     # replace PySide2 imports with tank.platform.qt and remove line containing Created by date
     sed -i"" -E "s/^(from PySide2)(.*)$/try:\n    from tank.platform.qt\2\nexcept ImportError:\n    \1\2/g" $UI_PYTHON_PATH/$3.py
     sed -i"" -E 's/u\"/\"/g' $UI_PYTHON_PATH/$3.py
+
+    # resources are registered by the app, not when the ui module is imported
+    sed -i"" -E '/^from +\. import resources_rc$/d' $UI_PYTHON_PATH/$3.py
 }
 
 function build_ui {
@@ -32,7 +35,11 @@ function build_ui {
 }
 
 function build_res {
-    build_qt "$1 -g python" "$2.qrc" "$2_rc"
+    echo " > Building " $2
+
+    # compile resources to a binary file, registered by the app when a dialog first needs it
+    echo "$1 --binary $2.qrc -o $UI_PYTHON_PATH/$2.rcc"
+    $1 --binary $2.qrc -o $UI_PYTHON_PATH/$2.rcc
 }
 
 
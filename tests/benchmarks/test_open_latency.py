@@ -0,0 +1,110 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Latency of loading the app and of opening its dialogs, on offscreen Qt with the
+toolkit stand-ins of :mod:`fake_toolkit`.
+
+Qt stays imported between rounds, as it is in Flame before any app loads.
+Timings depend on the machine, so baselines are saved locally rather than kept
+in the repository. Save one before a change with:
+
+    python -m pytest tests/benchmarks --benchmark-only \\
+        --benchmark-storage=tests/benchmarks/baselines --benchmark-save=baseline
+
+then compare against it after the change by replacing the last option with
+``--benchmark-compare --benchmark-compare-fail=median:25%``.
+"""
+
+import importlib
+import sys
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import fake_toolkit
+
+
+def _purge():
+    """
+    Forgets the app's package, so that the next import loads it again.
+    """
+    for name in list(sys.modules):
+        if name == "tk_flame_review" or name.startswith("tk_flame_review."):
+            del sys.modules[name]
+
+
+@pytest.fixture
+def app(make_app):
+    app = make_app()
+    yield app
+    # let the dialogs' background tasks finish before the app goes away.
+    fake_toolkit.process_events(lambda: app.task_pool.pending)
+
+
+@pytest.fixture
+def dialogs():
+    """
+    Closes the dialogs a benchmark opened.
+    """
+    opened = []
+    yield opened
+    for dialog in opened:
+        dialog.close()
+        dialog.deleteLater()
+    fake_toolkit.process_events()
+
+
+def test_import(benchmark):
+    fake_toolkit.install()
+    benchmark.pedantic(
+        importlib.import_module, args=("tk_flame_review",), setup=_purge, rounds=50
+    )
+
+
+def test_submit_dialog(benchmark, app, dialogs):
+    tk_flame_review = importlib.import_module("tk_flame_review")
+    ExtendedSubmitDialog = tk_flame_review.ExtendedSubmitDialog
+
+    def open_dialog():
+        dialogs.append(
+            ExtendedSubmitDialog(
+                app=app,
+                message="Upload selected to ShotGrid for review.<br>",
+                defaults={"mode": 0},
+            )
+        )
+
+    benchmark.pedantic(open_dialog, setup=fake_toolkit.process_events, rounds=50)
+
+
+def test_set_options(benchmark, app, dialogs):
+    tk_flame_review = importlib.import_module("tk_flame_review")
+    ExtendedSubmitDialog = tk_flame_review.ExtendedSubmitDialog
+
+    def setup():
+        dialog = ExtendedSubmitDialog(app=app, message="")
+        dialogs.append(dialog)
+        fake_toolkit.process_events()
+        return (dialog, {"mode": 0}), {}
+
+    benchmark.pedantic(ExtendedSubmitDialog.set_options, setup=setup, rounds=50)
+
+
+def test_summary_dialog(benchmark, dialogs):
+    fake_toolkit.install()
+    SummaryDialog = importlib.import_module("tk_flame_review").SummaryDialog
+
+    benchmark.pedantic(
+        lambda: dialogs.append(SummaryDialog(True)),
+        setup=fake_toolkit.process_events,
+        rounds=50,
+    )
@@ -0,0 +1,78 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Throughput of a single multipart upload against the local storage stand-in,
+over an emulated link, for several ``upload_concurrency`` values.
+
+Each part costs a part url request to ShotGrid, then the part itself. Sending
+parts in parallel hides the latency of the part requests, and the url of each
+part is requested while an earlier part is being sent, see
+:class:`ChunkedUploader`. The share of the link an upload used, including the
+requests starting and completing it, is recorded as ``link_share`` in the extra
+info of each benchmark.
+
+The uploads take a while, so these benchmarks only run with ``--benchmark-only``,
+see :mod:`test_open_latency` for saving and comparing baselines.
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+shotgun_api3 = pytest.importorskip("shotgun_api3")
+
+from tk_flame_review.upload import ChunkedUploader
+
+from storage_server import StorageServer
+
+# parts take 200ms to send, long enough for the local cost of each request not
+# to matter. The file is large enough for the upload not to be dominated by the
+# requests starting and completing it.
+CHUNK_SIZE = 4 * 1024 * 1024
+FILE_SIZE = 24 * CHUNK_SIZE
+BANDWIDTH = 20 * 1024 * 1024
+
+# seconds each request waits for its response.
+LATENCIES = {"low_latency": 0.05, "high_latency": 0.25}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def benchmark_only(request):
+    if not request.config.getoption("benchmark_only"):
+        pytest.skip("Run with --benchmark-only.")
+
+
+@pytest.fixture(scope="module")
+def movie(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("upload") / "shot010.mov")
+    with open(path, "wb") as fh:
+        fh.write(os.urandom(FILE_SIZE))
+    return path
+
+
+@pytest.mark.parametrize("link", sorted(LATENCIES))
+@pytest.mark.parametrize("concurrency", [1, 4, 8])
+def test_upload_throughput(benchmark, movie, link, concurrency):
+    with StorageServer(bandwidth=BANDWIDTH, latency=LATENCIES[link]) as server:
+        sg = shotgun_api3.Shotgun(
+            server.url, script_name="test", api_key="key", connect=False
+        )
+        uploader = ChunkedUploader(sg, chunk_size=CHUNK_SIZE, concurrency=concurrency)
+
+        benchmark.pedantic(
+            uploader.upload, args=("Version", 1, movie, "sg_uploaded_movie"), rounds=1
+        )
+
+    if benchmark.stats:
+        benchmark.extra_info["link_share"] = round(
+            FILE_SIZE / float(BANDWIDTH) / benchmark.stats.stats.median, 2
+        )
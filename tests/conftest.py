@@ -0,0 +1,63 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import sys
+
+# the tests import the app's package directly, without a toolkit engine.
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "python"))
+
+import pytest
+
+import fake_toolkit
+from round_trips import RoundTripCounter
+
+
+@pytest.fixture
+def shotgun():
+    """
+    Mockgun connection holding the project and the user.
+    """
+    return fake_toolkit.create_shotgun()
+
+
+@pytest.fixture
+def round_trips():
+    return RoundTripCounter()
+
+
+@pytest.fixture
+def make_app(tmp_path, shotgun, round_trips):
+    """
+    Returns a function creating the app with the given settings, on a fake Flame
+    engine and a connection counting its requests to mockgun.
+    """
+    apps = []
+
+    def make_app(**settings):
+        FlameReview = fake_toolkit.load_app_class()
+        export_dir = tmp_path / "export"
+        export_dir.mkdir(exist_ok=True)
+        cache_dir = tmp_path / "cache"
+        cache_dir.mkdir(exist_ok=True)
+        app = FlameReview(
+            fake_toolkit.FakeEngine(str(export_dir)),
+            round_trips.wrap(shotgun),
+            str(cache_dir),
+            settings,
+        )
+        app.init_app()
+        apps.append(app)
+        return app
+
+    yield make_app
+
+    for app in apps:
+        app.destroy_app()
@@ -0,0 +1,725 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Stand-ins for the toolkit core, the Flame engine and the frameworks the app
+uses, so that the app and its dialogs run headless without a pipeline
+configuration. ShotGrid is played by mockgun.
+"""
+
+import collections
+import importlib
+import importlib.util
+import itertools
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+import time
+import types
+
+import yaml
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROJECT = {"type": "Project", "id": 1, "name": "Review"}
+USER = {"type": "HumanUser", "id": 1, "name": "Artist"}
+
+
+class TankError(Exception):
+    pass
+
+
+def install():
+    """
+    Registers the ``sgtk`` and ``tank`` stand-ins, and the frameworks, in
+    ``sys.modules``. Does nothing if they are registered already.
+    """
+    if "sgtk" in sys.modules:
+        return
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    # the PySide2 Flame ships with, or PySide6 like newer releases.
+    try:
+        from PySide2 import QtCore, QtGui, QtWidgets
+    except ImportError:
+        from PySide6 import QtCore, QtGui, QtWidgets
+
+    # like the toolkit, expose the widgets in QtGui as they were in Qt 4.
+    qt_gui = types.ModuleType("QtGui")
+    for module in (QtGui, QtWidgets):
+        for name in dir(module):
+            setattr(qt_gui, name, getattr(module, name))
+
+    qt = types.ModuleType("qt")
+    qt.QtCore = QtCore
+    qt.QtGui = qt_gui
+    qt.QtWidgets = QtWidgets
+
+    platform = types.ModuleType("platform")
+    platform.Application = Application
+    platform.import_framework = import_framework
+    platform.qt = qt
+
+    for name in ("sgtk", "tank"):
+        core = types.ModuleType(name)
+        core.TankError = TankError
+        core.platform = platform
+        sys.modules[name] = core
+        sys.modules[name + ".platform"] = platform
+        sys.modules[name + ".platform.qt"] = qt
+        sys.modules[name + ".platform.qt.QtCore"] = QtCore
+        sys.modules[name + ".platform.qt.QtGui"] = qt_gui
+        sys.modules[name + ".platform.qt.QtWidgets"] = QtWidgets
+
+    if QtWidgets.QApplication.instance() is None:
+        install.qapp = QtWidgets.QApplication([])
+
+
+def import_framework(framework, module):
+    """
+    Returns a module of one of the frameworks listed in info.yml.
+    """
+    return {
+        ("tk-framework-qtwidgets", "shotgun_search_widget"): _search_widget_module,
+        ("tk-framework-shotgunutils", "task_manager"): _task_manager_module,
+    }[(framework, module)]()
+
+
+def process_events(until=None, timeout=10):
+    """
+    Runs the Qt event loop until ``until()`` is False, or once if not given.
+    """
+    from sgtk.platform.qt import QtCore
+
+    deadline = time.time() + timeout
+    while True:
+        QtCore.QCoreApplication.processEvents()
+        if until is None or not until():
+            return
+        if time.time() > deadline:
+            raise RuntimeError("Timed out waiting for the event loop.")
+        time.sleep(0.005)
+
+
+# Frameworks ----------------------------------------------------------------
+
+
+def _task_manager_module():
+    if "task_manager" in _frameworks:
+        return _frameworks["task_manager"]
+    from sgtk.platform.qt import QtCore
+
+    class BackgroundTaskManager(QtCore.QObject):
+        """
+        Runs the tasks from the event loop, one per iteration, like the real
+        manager delivers the results of its threads.
+        """
+
+        task_completed = QtCore.Signal(int, object, object)
+        task_failed = QtCore.Signal(int, object, str, str)
+
+        def __init__(self, parent=None, start_processing=False, max_threads=8):
+            super(BackgroundTaskManager, self).__init__(parent)
+            self._ids = itertools.count(1)
+            self._tasks = collections.OrderedDict()
+
+        @property
+        def pending(self):
+            return len(self._tasks)
+
+        def add_task(
+            self,
+            cbl,
+            priority=None,
+            group=None,
+            upstream_task_ids=None,
+            task_args=None,
+            task_kwargs=None,
+        ):
+            task_id = next(self._ids)
+            self._tasks[task_id] = (cbl, group, task_args or [], task_kwargs or {})
+            QtCore.QTimer.singleShot(0, lambda: self._run(task_id))
+            return task_id
+
+        def _run(self, task_id):
+            task = self._tasks.pop(task_id, None)
+            if not task:
+                return
+            cbl, group, args, kwargs = task
+            try:
+                result = cbl(*args, **kwargs)
+            except Exception as e:
+                self.task_failed.emit(task_id, group, str(e), "")
+            else:
+                self.task_completed.emit(task_id, group, result)
+
+        def stop_task(self, task_id, stop_upstream=True, stop_downstream=True):
+            self._tasks.pop(task_id, None)
+
+        def stop_task_group(self, group, stop_upstream=True, stop_downstream=True):
+            for task_id, task in list(self._tasks.items()):
+                if task[1] == group:
+                    del self._tasks[task_id]
+
+        def stop_all_tasks(self):
+            self._tasks.clear()
+
+        def shut_down(self):
+            self._tasks.clear()
+
+    module = types.ModuleType("task_manager")
+    module.BackgroundTaskManager = BackgroundTaskManager
+    _frameworks["task_manager"] = module
+    return module
+
+
+def _search_widget_module():
+    if "shotgun_search_widget" in _frameworks:
+        return _frameworks["shotgun_search_widget"]
+    from sgtk.platform.qt import QtCore, QtGui
+
+    class _Completer(QtCore.QObject):
+        entity_activated = QtCore.Signal(str, int, str)
+
+    class GlobalSearchWidget(QtGui.QLineEdit):
+        """
+        Search widget which never searches: the artist picks entities by
+        emitting ``entity_activated``.
+        """
+
+        entity_activated = QtCore.Signal(str, int, str)
+
+        def __init__(self, parent=None):
+            super(GlobalSearchWidget, self).__init__(parent)
+            self._completer = _Completer(self)
+            self._completer.entity_activated.connect(self.clear)
+            self._completer.entity_activated.connect(self.entity_activated)
+
+        def completer(self):
+            return self._completer
+
+        def set_bg_task_manager(self, task_manager):
+            self._bg_task_manager = task_manager
+
+        def set_searchable_entity_types(self, types):
+            self._types = types
+
+        def destroy(self):
+            pass
+
+    module = types.ModuleType("shotgun_search_widget")
+    module.GlobalSearchWidget = GlobalSearchWidget
+    _frameworks["shotgun_search_widget"] = module
+    return module
+
+
+_frameworks = {}
+
+
+# Core ----------------------------------------------------------------------
+
+
+class Application(object):
+    """
+    Base class of the app, configured from the defaults in info.yml.
+    """
+
+    def __init__(self, engine, shotgun, cache_location, settings=None):
+        """
+        :param engine: :class:`FakeEngine`.
+        :param shotgun: Connection returned by the ``shotgun`` property.
+        :param cache_location: Folder of the app's caches.
+        :param settings: Settings overriding the defaults.
+        """
+        with open(os.path.join(ROOT, "info.yml")) as fh:
+            configuration = yaml.safe_load(fh)["configuration"]
+        self._settings = dict(
+            (name, setting.get("default_value"))
+            for name, setting in configuration.items()
+        )
+        self._settings.update(settings or {})
+        self.engine = engine
+        self.context = types.SimpleNamespace(project=PROJECT, user=USER)
+        self.cache_location = cache_location
+        self.disk_location = ROOT
+        self.icon_256 = os.path.join(ROOT, "icon_256.png")
+        self._shotgun = shotgun
+        self.logs = []
+
+    @property
+    def shotgun(self):
+        return self._shotgun
+
+    def get_setting(self, name, default=None):
+        return self._settings.get(name, default)
+
+    def import_module(self, name):
+        return importlib.import_module(name)
+
+    def execute_hook_method(self, hook, method, **kwargs):
+        return os.path.join(ROOT, "resources", "review_export_preset.xml")
+
+    def log_metric(self, *args, **kwargs):
+        pass
+
+    def _log(self, level, message):
+        self.logs.append((level, message))
+
+    def log_debug(self, message):
+        self._log("debug", message)
+
+    def log_info(self, message):
+        self._log("info", message)
+
+    def log_warning(self, message):
+        self._log("warning", message)
+
+    def log_error(self, message):
+        self._log("error", message)
+
+    def log_exception(self, message):
+        self._log("exception", message)
+
+
+def load_app_class():
+    """
+    Returns the app class from app.py.
+    """
+    install()
+    if "tk_flame_review_app" not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            "tk_flame_review_app", os.path.join(ROOT, "app.py")
+        )
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules["tk_flame_review_app"] = module
+    return sys.modules["tk_flame_review_app"].FlameReview
+
+
+# Engine --------------------------------------------------------------------
+
+
+class FakeEngine(object):
+    """
+    The parts of the Flame engine the app uses, with a backburner queue whose
+    jobs run when :meth:`run_jobs` is called.
+    """
+
+    has_ui = False
+
+    # where Flame and backburner are installed, and Flame's Python. Jobs running
+    # a command line are only submitted when set.
+    install_root = None
+    python_executable = None
+
+    def __init__(self, tmp_dir):
+        self.tmp_dir = tmp_dir
+        self.export_hooks = {}
+        self.jobs = collections.OrderedDict()
+        self.busy = []
+        self.modals = []
+        self.thumbnail_generator = FakeThumbnailGenerator(self)
+        # called with the submit dialog to answer it like the artist would.
+        self.answer_dialog = None
+        self._job_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def get_setting(self, name, default=None):
+        return default
+
+    def register_export_hook(self, menu_caption, callbacks):
+        self.export_hooks[menu_caption] = callbacks
+
+    def create_local_backburner_job(
+        self, title, desc, dependencies, app, method, args, host
+    ):
+        return self.submit_job(
+            title, dependencies, lambda: getattr(app, method)(**args)
+        )
+
+    def submit_job(self, title, dependencies, run):
+        """
+        Queues a job running ``run`` once its dependencies have run.
+
+        :returns: Id of the job.
+        """
+        if dependencies and not isinstance(dependencies, list):
+            dependencies = [dependencies]
+        with self._lock:
+            job_id = "job%d" % next(self._job_ids)
+            self.jobs[job_id] = {
+                "title": title,
+                "dependencies": dependencies or [],
+                "run": run,
+                "state": "queued",
+                "error": None,
+            }
+        return job_id
+
+    def run_jobs(self):
+        """
+        Runs the queued jobs in dependency order, like backburner would.
+
+        :returns: List of the titles of the jobs which failed.
+        """
+        progress = True
+        while progress:
+            progress = False
+            for job in list(self.jobs.values()):
+                if job["state"] != "queued":
+                    continue
+                if any(
+                    self.jobs[dep]["state"] != "done" for dep in job["dependencies"]
+                ):
+                    continue
+                try:
+                    job["run"]()
+                    job["state"] = "done"
+                except Exception as e:
+                    job["state"] = "failed"
+                    job["error"] = e
+                progress = True
+        return [job["title"] for job in self.jobs.values() if job["state"] == "failed"]
+
+    def show_busy(self, title, details):
+        self.busy.append(details)
+
+    def clear_busy(self):
+        pass
+
+    def show_modal(self, title, app, widget_class, *args):
+        widget = widget_class(*args)
+        self.modals.append((title, widget_class.__name__, args))
+        widget.close()
+        widget.deleteLater()
+
+    def get_server_hostname(self):
+        return "localhost"
+
+    def get_backburner_tmp(self):
+        return self.tmp_dir
+
+    def _get_dialog_parent(self):
+        return None
+
+
+class FakeThumbnailGenerator(object):
+    """
+    Collects the thumbnails to generate, and submits a single job for them.
+    """
+
+    def __init__(self, engine):
+        self._engine = engine
+        self._pending = []
+        self.generated = []
+
+    def generate(self, **kwargs):
+        self._pending.append(kwargs)
+
+    def finalize(self):
+        if not self._pending:
+            return None
+        pending, self._pending = self._pending, []
+        dependencies = [
+            thumbnail["dependencies"]
+            for thumbnail in pending
+            if thumbnail["dependencies"]
+        ]
+        return self._engine.submit_job(
+            "Thumbnails", dependencies, lambda: self.generated.extend(pending)
+        )
+
+
+# ShotGrid ------------------------------------------------------------------
+
+# field name -> (data type, valid entity types)
+_COMMON_FIELDS = {
+    "id": ("number", None),
+    "code": ("text", None),
+    "description": ("text", None),
+    "project": ("entity", ["Project"]),
+    "created_by": ("entity", ["HumanUser"]),
+    "updated_at": ("date_time", None),
+}
+
+_SCHEMA = {
+    "Project": {"name": ("text", None)},
+    "HumanUser": {"name": ("text", None)},
+    "EventLogEntry": {"event_type": ("text", None)},
+    # an entity_type field on the site, but mockgun can't filter those with "in".
+    "TaskTemplate": {"entity_type": ("text", None)},
+    "Attachment": {"this_file": ("url", None), "display_name": ("text", None)},
+    "Sequence": {"task_template": ("entity", ["TaskTemplate"])},
+    "Shot": {
+        "task_template": ("entity", ["TaskTemplate"]),
+        "sg_sequence": ("entity", ["Sequence"]),
+        "sg_cut_in": ("number", None),
+        "sg_cut_out": ("number", None),
+        "sg_cut_duration": ("number", None),
+        "sg_cut_order": ("number", None),
+    },
+    "Version": {
+        "entity": ("entity", ["Sequence", "Shot"]),
+        "user": ("entity", ["HumanUser"]),
+        "sg_first_frame": ("number", None),
+        "sg_last_frame": ("number", None),
+        "frame_count": ("number", None),
+        "frame_range": ("text", None),
+        "sg_frames_have_slate": ("checkbox", None),
+        "sg_movie_has_slate": ("checkbox", None),
+        "sg_frames_aspect_ratio": ("float", None),
+        "sg_movie_aspect_ratio": ("float", None),
+        "sg_department": ("text", None),
+        "sg_uploaded_movie": ("url", None),
+        "sg_uploaded_movie_mp4": ("url", None),
+    },
+}
+
+
+def _schema_paths():
+    """
+    Writes the mockgun schema files, once per process.
+    """
+    if not hasattr(_schema_paths, "paths"):
+        folder = tempfile.mkdtemp(prefix="tk_flame_review_schema_")
+        schema = {}
+        for entity_type, fields in _SCHEMA.items():
+            fields = dict(_COMMON_FIELDS, **fields)
+            schema[entity_type] = {}
+            for name, (data_type, valid_types) in fields.items():
+                properties = {"default_value": {"value": None}}
+                if valid_types:
+                    properties["valid_types"] = {"value": valid_types}
+                schema[entity_type][name] = {
+                    "data_type": {"value": data_type},
+                    "properties": properties,
+                }
+        schema_entity = dict(
+            (entity_type, {"name": {"value": entity_type}}) for entity_type in schema
+        )
+        paths = (
+            os.path.join(folder, "schema.pickle"),
+            os.path.join(folder, "entity.pickle"),
+        )
+        for path, data in zip(paths, (schema, schema_entity)):
+            with open(path, "wb") as fh:
+                pickle.dump(data, fh)
+        _schema_paths.paths = paths
+    return _schema_paths.paths
+
+
+def create_shotgun():
+    """
+    Returns a mockgun connection holding the project and the user.
+    """
+    from shotgun_api3.lib import mockgun
+
+    def serialized(method):
+        def call(self, *args, **kwargs):
+            with self._lock:
+                return method(self, *args, **kwargs)
+
+        return call
+
+    class FakeShotgun(mockgun.Shotgun):
+        """
+        Mockgun accepting uploads, which go to an Attachment.
+
+        The app sends requests from several threads, which the site answers one
+        after the other as far as mockgun is concerned.
+        """
+
+        server_info = {}
+        _lock = threading.RLock()
+
+        find = serialized(mockgun.Shotgun.find)
+        find_one = serialized(mockgun.Shotgun.find_one)
+        create = serialized(mockgun.Shotgun.create)
+        update = serialized(mockgun.Shotgun.update)
+        delete = serialized(mockgun.Shotgun.delete)
+        batch = serialized(mockgun.Shotgun.batch)
+
+        def _requires_direct_s3_upload(self, entity_type, field_name):
+            return False
+
+        @serialized
+        def upload(
+            self,
+            entity_type,
+            entity_id,
+            path,
+            field_name=None,
+            display_name=None,
+            tag_list=None,
+        ):
+            attachment = self.create(
+                "Attachment",
+                {"this_file": {"name": os.path.basename(path), "url": path}},
+            )
+            self.update(
+                entity_type,
+                entity_id,
+                {field_name: {"type": "Attachment", "id": attachment["id"]}},
+            )
+            return attachment["id"]
+
+    mockgun.Shotgun.set_schema_paths(*_schema_paths())
+    sg = FakeShotgun("https://review.shotgrid.test")
+    sg.create("Project", {"name": PROJECT["name"]})
+    sg.create("HumanUser", {"name": USER["name"]})
+    return sg
+
+
+# Flame ---------------------------------------------------------------------
+
+
+def write_quicktime(path, size=1024):
+    """
+    Writes a small complete quicktime, whose content is unique to the path.
+    """
+    payload = (path.encode("utf-8") * (size // len(path) + 1))[:size]
+    with open(path, "wb") as fh:
+        fh.write(struct.pack(">I", 8 + len(payload)) + b"mdat" + payload)
+        fh.write(struct.pack(">I", 8) + b"moov")
+
+
+def _exec_dialog(dialog):
+    """
+    Stands in for the modal event loop of the submit dialog: lets its background
+    tasks run, then answers it with the engine's ``answer_dialog``.
+    """
+    manager = dialog.app.task_pool
+
+    def busy():
+        return manager.pending or dialog._existence_timer.isActive()
+
+    process_events(busy)
+    answer = dialog.app.engine.answer_dialog
+    if answer is None:
+        return dialog.Rejected
+    answer(dialog)
+    process_events(busy)
+    dialog.accept()
+    return dialog.result()
+
+
+def select(entity):
+    """
+    Returns a dialog answer picking an existing entity in the Select tab.
+    """
+
+    def answer(dialog):
+        dialog.set_mode(dialog.Select)
+        dialog.entity_selector.entity_activated.emit(
+            entity["type"], entity["id"], entity["code"]
+        )
+
+    return answer
+
+
+def new(name, entity_type="Sequence"):
+    """
+    Returns a dialog answer typing the name of the entity in the New tab.
+    """
+
+    def answer(dialog):
+        dialog.set_mode(dialog.New)
+        dialog.set_entity_type(entity_type)
+        dialog.entity_name.setText(name)
+        dialog.entity_name.textEdited.emit(name)
+
+    return answer
+
+
+def auto_match(entity_type="Sequence"):
+    """
+    Returns a dialog answer matching each sequence to the entity of its name.
+    """
+
+    def answer(dialog):
+        dialog.set_mode(dialog.New)
+        dialog.set_entity_type(entity_type)
+        dialog.auto_match.setChecked(True)
+
+    return answer
+
+
+def export(
+    engine, session_id, sequences, segments=0, menu_caption="Submit for ShotGrid review"
+):
+    """
+    Drives the export hooks of the app like Flame exporting sequences in the
+    background.
+
+    Each sequence is exported as a movie, along with an open clip for each of
+    its segments. The movies are written by backburner jobs the upload job
+    depends on, see :meth:`FakeEngine.run_jobs`.
+
+    :param engine: :class:`FakeEngine` the app registered its hooks with.
+    :param session_id: Id of the export session.
+    :param sequences: Names of the exported sequences.
+    :param segments: Number of segments of each sequence.
+    :returns: Dictionary of the calls of each hook, as lists of their info dicts.
+    """
+    tk_flame_review = importlib.import_module("tk_flame_review")
+    tk_flame_review.ExtendedSubmitDialog.exec_ = _exec_dialog
+
+    hooks = engine.export_hooks[menu_caption]
+    calls = collections.defaultdict(list)
+
+    def call(name, info):
+        calls[name].append(info)
+        hooks[name](session_id, info)
+        return info
+
+    info = call("preCustomExport", {})
+    if info.get("abort"):
+        return calls
+
+    for sequence in sequences:
+        assets = [dict(assetType="movie", shotName="", segmentIndex=0)]
+        for index in range(1, segments + 1):
+            assets.append(
+                dict(
+                    assetType="openClip",
+                    shotName="%s_%03d" % (sequence, index * 10),
+                    segmentIndex=index,
+                )
+            )
+        for asset in assets:
+            asset.update(
+                {
+                    "destinationHost": info["destinationHost"],
+                    "destinationPath": info["destinationPath"],
+                    "name": sequence,
+                    "sequenceName": sequence,
+                    "aspectRatio": 1.778,
+                    "sourceIn": 1001,
+                    "sourceOut": 1101,
+                    "recordIn": 86400 + 100 * asset["segmentIndex"],
+                    "recordOut": 86500 + 100 * asset["segmentIndex"],
+                    "isBackground": True,
+                }
+            )
+            call("preExportAsset", asset)
+            if asset["assetType"] == "movie":
+                path = os.path.join(asset["destinationPath"], asset["resolvedPath"])
+                asset["backgroundJobId"] = engine.submit_job(
+                    "Export %s" % sequence,
+                    None,
+                    lambda path=path: write_quicktime(path),
+                )
+            call("postExportAsset", asset)
+
+    call("postCustomExport", dict(info))
+    return calls
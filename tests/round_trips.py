@@ -0,0 +1,121 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+from __future__ import absolute_import
+
+import threading
+
+
+class RoundTripCounter(object):
+    """
+    Thread safe count of the requests sent to ShotGrid, by API method.
+
+    Connections are wrapped with :meth:`wrap` to be counted. A method sending
+    several requests, like ``upload``, counts as one.
+    """
+
+    # shotgun_api3.Shotgun methods sending a request to ShotGrid, including the
+    # private ones used by the chunked uploader.
+    COUNTED_METHODS = frozenset(
+        [
+            "activity_stream_read",
+            "batch",
+            "create",
+            "delete",
+            "download_attachment",
+            "find",
+            "find_one",
+            "follow",
+            "note_thread_read",
+            "revive",
+            "schema_entity_read",
+            "schema_field_read",
+            "schema_read",
+            "share_thumbnail",
+            "summarize",
+            "text_search",
+            "unfollow",
+            "update",
+            "upload",
+            "upload_filmstrip_thumbnail",
+            "upload_thumbnail",
+            "_complete_multipart_upload",
+            "_get_attachment_upload_info",
+            "_get_upload_part_link",
+            "_send_form",
+            "_upload_data_to_storage",
+        ]
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def wrap(self, shotgun):
+        """
+        Returns a proxy of the connection counting its requests.
+
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        """
+        return CountingShotgun(shotgun, self)
+
+    def add(self, method):
+        """
+        Counts a request sent with the given method.
+        """
+        with self._lock:
+            self._counts[method] = self._counts.get(method, 0) + 1
+
+    def snapshot(self):
+        """
+        Returns the number of requests sent so far, by method.
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def since(self, snapshot):
+        """
+        Returns the number of requests sent since the snapshot, by method.
+
+        :param snapshot: Dictionary returned by :meth:`snapshot`.
+        """
+        counts = self.snapshot()
+        return dict(
+            (method, count - snapshot.get(method, 0))
+            for method, count in counts.items()
+            if count != snapshot.get(method, 0)
+        )
+
+
+class CountingShotgun(object):
+    """
+    Proxy of a ``shotgun_api3.Shotgun`` connection counting the requests it sends.
+    """
+
+    def __init__(self, shotgun, counter):
+        """
+        :param shotgun: ``shotgun_api3.Shotgun`` connection.
+        :param counter: :class:`RoundTripCounter` to count the requests with.
+        """
+        self._shotgun = shotgun
+        self._counter = counter
+
+    def __getattr__(self, name):
+        value = getattr(self._shotgun, name)
+        if name not in RoundTripCounter.COUNTED_METHODS or not callable(value):
+            return value
+
+        counter = self._counter
+
+        def counted(*args, **kwargs):
+            counter.add(name)
+            return value(*args, **kwargs)
+
+        return counted
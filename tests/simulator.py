@@ -0,0 +1,213 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Replays export sessions through the app on the fake Flame engine and mockgun,
+and reports how long Flame waits on each export hook and how long each
+backburner job runs. Sessions of hundreds of sequences and thousands of
+segments can be replayed without a Flame seat:
+
+    python tests/simulator.py --sequences 300 --segments 10
+"""
+
+import argparse
+import collections
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# like conftest.py, import the app's package directly.
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"),
+)
+
+import fake_toolkit
+
+
+class SimulatedEngine(fake_toolkit.FakeEngine):
+    """
+    Fake engine timing the backburner jobs the app submits, by app method.
+    """
+
+    def __init__(self, tmp_dir):
+        super(SimulatedEngine, self).__init__(tmp_dir)
+        self.job_timings = Timings()
+
+    def create_local_backburner_job(
+        self, title, desc, dependencies, app, method, args, host
+    ):
+        run = self.job_timings.timed(method, lambda: getattr(app, method)(**args))
+        return self.submit_job(title, dependencies, run)
+
+
+class Timings(object):
+    """
+    Latencies of named calls.
+    """
+
+    def __init__(self):
+        self._latencies = collections.OrderedDict()
+
+    def timed(self, name, call):
+        """
+        Returns a function recording the latency of each call of ``call`` under
+        ``name``.
+        """
+
+        def timed_call(*args, **kwargs):
+            started = time.time()
+            try:
+                return call(*args, **kwargs)
+            finally:
+                self._latencies.setdefault(name, []).append(time.time() - started)
+
+        return timed_call
+
+    def summary(self):
+        """
+        :returns: Dictionary of the count, total, mean, 95th percentile and
+            longest latency of each name, in seconds.
+        """
+        summary = collections.OrderedDict()
+        for name, latencies in self._latencies.items():
+            ordered = sorted(latencies)
+            summary[name] = {
+                "count": len(ordered),
+                "total": sum(ordered),
+                "mean": sum(ordered) / len(ordered),
+                "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                "max": ordered[-1],
+            }
+        return summary
+
+
+class Simulator(object):
+    """
+    The app running on a :class:`SimulatedEngine` and a mockgun site.
+    """
+
+    def __init__(self, folder, shotgun=None, **settings):
+        """
+        :param folder: Folder receiving the exported quicktimes and the caches.
+        :param shotgun: ShotGrid connection, a new mockgun site by default.
+        :param settings: Settings of the app overriding the defaults.
+        """
+        export_dir = os.path.join(folder, "export")
+        cache_dir = os.path.join(folder, "cache")
+        for path in (export_dir, cache_dir):
+            if not os.path.isdir(path):
+                os.makedirs(path)
+
+        FlameReview = fake_toolkit.load_app_class()
+        self.shotgun = shotgun or fake_toolkit.create_shotgun()
+        self.engine = SimulatedEngine(export_dir)
+        self.app = FlameReview(self.engine, self.shotgun, cache_dir, settings)
+        self.app.init_app()
+
+    def replay(self, session_id, sequences, segments=0, answer=None):
+        """
+        Exports the sequences through the export hooks, then runs the
+        backburner jobs.
+
+        :param session_id: Id of the export session.
+        :param sequences: Names of the exported sequences.
+        :param segments: Number of segments of each sequence.
+        :param answer: Answer of the submit dialog, see :mod:`fake_toolkit`.
+            Matches each sequence to the Sequence of its name by default.
+        :returns: Dictionary with the latency summaries of the ``hooks`` and of
+            the ``jobs``, and the titles of the ``failed`` jobs.
+        """
+        self.engine.answer_dialog = answer or fake_toolkit.auto_match()
+        hook_timings = Timings()
+        hooks = self.engine.export_hooks
+        self.engine.export_hooks = dict(
+            (
+                menu_caption,
+                dict(
+                    (name, hook_timings.timed(hook.__name__, hook))
+                    for name, hook in callbacks.items()
+                ),
+            )
+            for menu_caption, callbacks in hooks.items()
+        )
+        self.engine.job_timings = Timings()
+        try:
+            fake_toolkit.export(self.engine, session_id, sequences, segments)
+        finally:
+            self.engine.export_hooks = hooks
+        # wait for what the hooks left running in the background.
+        self.app.submission_pool.apply(lambda: None)
+        self.app.shotgun_pool.apply(lambda: None)
+        failed = self.engine.run_jobs()
+
+        return {
+            "hooks": hook_timings.summary(),
+            "jobs": self.engine.job_timings.summary(),
+            "failed": failed,
+        }
+
+    def destroy(self):
+        self.app.destroy_app()
+
+
+def format_report(report):
+    """
+    Returns the latencies of a replay as a table, in milliseconds.
+    """
+    lines = [
+        "%-32s %8s %10s %10s %10s %10s"
+        % ("", "calls", "total ms", "mean ms", "p95 ms", "max ms")
+    ]
+    for section in ("hooks", "jobs"):
+        for name, latency in report[section].items():
+            lines.append(
+                "%-32s %8d %10.1f %10.2f %10.2f %10.2f"
+                % (
+                    name,
+                    latency["count"],
+                    latency["total"] * 1000,
+                    latency["mean"] * 1000,
+                    latency["p95"] * 1000,
+                    latency["max"] * 1000,
+                )
+            )
+    if report["failed"]:
+        lines.append("Failed jobs: %s" % ", ".join(report["failed"]))
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sequences", type=int, default=100)
+    parser.add_argument("--segments", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    folder = tempfile.mkdtemp(prefix="tk_flame_review_simulator_")
+    simulator = Simulator(folder)
+    try:
+        for session in range(args.sessions):
+            sequences = ["seq%04d" % (index * 10) for index in range(args.sequences)]
+            report = simulator.replay(str(session + 1), sequences, args.segments)
+            print(
+                "Session %d: %d sequence(s), %d segment(s)"
+                % (session + 1, args.sequences, args.sequences * args.segments)
+            )
+            print(format_report(report))
+    finally:
+        simulator.destroy()
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Local HTTP stand-in for the ShotGrid upload endpoints and the cloud storage
+multipart uploads go to.
+"""
+
+import collections
+import hashlib
+import itertools
+import json
+import random
+import socket
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import parse_qs, urlparse
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import parse_qs, urlparse
+
+
+class StorageServer(ThreadingMixIn, HTTPServer):
+    """
+    Serves the requests a ``shotgun_api3.Shotgun`` connection sends for direct
+    multipart uploads, and drops a share of them at random.
+
+    The upload requests can be slowed down like they would be over a link with
+    the given bandwidth and latency, shared by all the connections.
+
+    Use as a context manager, the server runs in a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, drop_rate=0.0, seed=0, upload_types=None, bandwidth=None, latency=0
+    ):
+        """
+        :param drop_rate: Share of the upload requests whose connection is closed
+                          without a response.
+        :param seed: Seed of the random drops.
+        :param upload_types: ``s3_enabled_upload_types`` reported by the server.
+        :param bandwidth: Bytes per second the link carries, unlimited by default.
+        :param latency: Seconds each upload request waits for its response.
+        """
+        HTTPServer.__init__(self, ("127.0.0.1", 0), _Handler)
+        self.drop_rate = drop_rate
+        self.upload_types = upload_types or {"Version": ["sg_uploaded_movie"]}
+        self.url = "http://127.0.0.1:%d" % self.server_address[1]
+        # upload id -> part number -> data
+        self.parts = collections.defaultdict(dict)
+        self.upload_ids = itertools.count()
+        # upload id -> data of the completed upload
+        self.completed = {}
+        # attachment id -> (entity type, entity id, field name, data)
+        self.attachments = {}
+        self.requests = collections.Counter()
+        self.dropped = 0
+        self.bandwidth = bandwidth
+        self.latency = latency
+        # time at which the link has sent the data received so far.
+        self._link_free = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
+
+    def should_drop(self):
+        with self._lock:
+            drop = self._random.random() < self.drop_rate
+            if drop:
+                self.dropped += 1
+            return drop
+
+    def expire_uploads(self):
+        """
+        Forgets the uploads which have not been completed, like the storage does
+        once they are too old.
+        """
+        with self._lock:
+            for upload_id in list(self.parts):
+                if upload_id not in self.completed:
+                    del self.parts[upload_id]
+
+    def receive(self, rfile, size):
+        """
+        Reads a request body of size bytes at the pace of the link, then waits for
+        the response to come back. Bodies read at the same time share the link.
+        """
+        chunks = []
+        while size > 0:
+            chunk = rfile.read(min(size, 1024 * 1024))
+            if not chunk:
+                break
+            size -= len(chunk)
+            chunks.append(chunk)
+            if self.bandwidth:
+                with self._lock:
+                    self._link_free = (
+                        max(time.time(), self._link_free)
+                        + float(len(chunk)) / self.bandwidth
+                    )
+                    sent = self._link_free
+                time.sleep(max(0, sent - time.time()))
+        time.sleep(self.latency)
+        return b"".join(chunks)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        self.server.requests[path] += 1
+
+        if path.startswith("/api3/"):
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            self._send(json.dumps({"results": self._info()}), "application/json")
+            return
+
+        body = self.server.receive(
+            self.rfile, int(self.headers.get("Content-Length", 0))
+        )
+        if self.server.should_drop():
+            return self._drop()
+
+        params = dict(
+            (key, values[0]) for key, values in parse_qs(body.decode("utf-8")).items()
+        )
+        handler = {
+            "/upload/api_get_upload_link_info": self._get_upload_link_info,
+            "/upload/api_get_upload_link_for_part": self._get_upload_link_for_part,
+            "/upload/api_complete_multipart_upload": self._complete_multipart_upload,
+            "/upload/api_link_file": self._link_file,
+        }[path]
+        self._send(handler(params))
+
+    def do_PUT(self):
+        self.server.requests["/storage"] += 1
+        data = self.server.receive(self.rfile, int(self.headers["Content-Length"]))
+        if self.server.should_drop():
+            return self._drop()
+
+        _, _, upload_id, part_number = urlparse(self.path).path.split("/")
+        self.server.parts[upload_id][int(part_number)] = data
+        self.send_response(200)
+        self.send_header("Etag", '"%s"' % hashlib.md5(data).hexdigest())
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _info(self):
+        return {
+            "version": [9, 0, 0],
+            "s3_direct_uploads_enabled": True,
+            "s3_enabled_upload_types": self.server.upload_types,
+        }
+
+    def _get_upload_link_info(self, params):
+        upload_id = "upload%d" % next(self.server.upload_ids)
+        self.server.parts[upload_id] = {}
+        return "1\n%s/storage/%s/0\n0\nAttachment\n%s\n" % (
+            self.server.url,
+            upload_id,
+            upload_id,
+        )
+
+    def _get_upload_link_for_part(self, params):
+        if params["upload_id"] not in self.server.parts:
+            return "0\nNo such upload\n"
+        return "1\n%s/storage/%s/%s\n" % (
+            self.server.url,
+            params["upload_id"],
+            params["part_number"],
+        )
+
+    def _complete_multipart_upload(self, params):
+        upload_id = params["upload_id"]
+        parts = self.server.parts.get(upload_id)
+        if upload_id in self.server.completed or not parts:
+            return "0\nNo such upload\n"
+        etags = params["etags"].split(",")
+        numbers = sorted(parts)
+        if numbers != list(range(1, len(etags) + 1)) or etags != [
+            '"%s"' % hashlib.md5(parts[number]).hexdigest() for number in numbers
+        ]:
+            return "0\nInvalid parts\n"
+        self.server.completed[upload_id] = b"".join(parts[number] for number in numbers)
+        return "1\n"
+
+    def _link_file(self, params):
+        upload_id = params["upload_link_info"].split("\n")[4]
+        if upload_id not in self.server.completed:
+            return "0\nUpload not completed\n"
+        attachment_id = len(self.server.attachments) + 1
+        self.server.attachments[attachment_id] = (
+            params["entity_type"],
+            int(params["entity_id"]),
+            params["field_name"],
+            self.server.completed[upload_id],
+        )
+        return "1:%d\n" % attachment_id
+
+    def _send(self, body, content_type="text/plain"):
+        body = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _drop(self):
+        self.close_connection = True
+        try:
+            self.connection.shutdown(socket.SHUT_RDWR)
+        except (IOError, OSError):
+            pass
@@ -0,0 +1,102 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import importlib
+import threading
+import time
+
+import pytest
+
+import fake_toolkit
+
+
+@pytest.mark.parametrize(
+    "name, cls",
+    [
+        ("entity_index", "EntityIndex"),
+        ("task_template_cache", "TaskTemplateCache"),
+        ("upload_queue", "UploadQueue"),
+    ],
+)
+def test_lazy_member_created_once(make_app, monkeypatch, name, cls):
+    app = make_app()
+    tk_flame_review = importlib.import_module("tk_flame_review")
+    original = getattr(tk_flame_review, cls)
+
+    def slow(*args, **kwargs):
+        # widen the window between checking for the member and setting it.
+        time.sleep(0.05)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tk_flame_review, cls, slow)
+
+    members = []
+    threads = [
+        threading.Thread(target=lambda: members.append(getattr(app, name)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(members) == 8
+    assert len(set(map(id, members))) == 1
+
+
+def test_summary_does_not_wait_for_shotgun(make_app, shotgun, monkeypatch):
+    app = make_app()
+    sequence = shotgun.create(
+        "Sequence", {"code": "seq010", "project": fake_toolkit.PROJECT}
+    )
+    app.engine.answer_dialog = fake_toolkit.select(sequence)
+    create_versions = app._create_session_versions
+    release = threading.Event()
+
+    def slow_create_versions(session):
+        release.wait(10)
+        create_versions(session)
+
+    monkeypatch.setattr(app, "_create_session_versions", slow_create_versions)
+
+    fake_toolkit.export(app.engine, "1", ["seq010"])
+
+    # the summary is up while ShotGrid is still busy with the Versions.
+    assert app.engine.modals == [("Submission Summary", "SummaryDialog", (True,))]
+    assert shotgun.find("Version", []) == []
+
+    release.set()
+    app.submission_pool.apply(lambda: None)
+    assert len(shotgun.find("Version", [])) == 1
+    assert app.engine.run_jobs() == []
+
+
+def test_warm_up_authenticates_the_pool_threads(make_app, monkeypatch):
+    app = make_app()
+    threads = set()
+    warm_up_connection = app._warm_up_connection
+
+    def record_thread():
+        threads.add(threading.current_thread().ident)
+        warm_up_connection()
+
+    monkeypatch.setattr(app, "_warm_up_connection", record_thread)
+
+    app._warm_up()
+    app.submission_pool.apply(lambda: None)
+    # each thread only takes a task once started and done with the earlier ones.
+    barrier = threading.Barrier(4)
+    for result in [app.shotgun_pool.apply_async(barrier.wait) for _ in range(4)]:
+        result.get()
+
+    # every thread which sends the requests of a submission, and only those.
+    assert len(threads) == 5
+    assert threading.current_thread().ident not in threads
+    assert app.task_template_cache.fetched
@@ -0,0 +1,63 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import json
+import os
+import stat
+import sys
+
+import pytest
+
+from tk_flame_review.backburner import BackburnerError, submit_command_job
+
+
+def _cmdjob(tmp_path, output):
+    """
+    Writes a stand-in for backburner's cmdjob, recording its arguments.
+    """
+    path = str(tmp_path / "cmdjob")
+    with open(path, "w") as fh:
+        fh.write(
+            "#!%s\n"
+            "import json, sys\n"
+            "json.dump(sys.argv[1:], open(%r, 'w'))\n"
+            "print(%r)\n" % (sys.executable, path + ".json", output)
+        )
+    os.chmod(path, stat.S_IRWXU)
+    return path
+
+
+def test_submit_command_job(tmp_path):
+    cmdjob = _cmdjob(tmp_path, "Successfully submitted job 42")
+
+    job_id = submit_command_job(
+        cmdjob,
+        "Sequence - ShotGrid Upload (2 quicktimes)",
+        "Uploads the Quicktimes",
+        ["/usr/bin/python", "upload_daemon.py", "request.json"],
+        dependencies=["7", "8"],
+        servers="flame01",
+    )
+
+    assert job_id == "42"
+    with open(cmdjob + ".json") as fh:
+        args = json.load(fh)
+    assert args[0] == "-userRights"
+    assert args[2].startswith("-jobName:Sequence - ShotGrid Upload _2 quicktimes_ (")
+    assert "-servers:flame01" in args
+    assert "-dependencies:7,8" in args
+    assert args[-3:] == ["/usr/bin/python", "upload_daemon.py", "request.json"]
+
+
+def test_submit_command_job_failure(tmp_path):
+    cmdjob = _cmdjob(tmp_path, "Could not connect to the manager")
+
+    with pytest.raises(BackburnerError):
+        submit_command_job(cmdjob, "Upload", "Uploads", ["true"])
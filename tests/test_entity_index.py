@@ -0,0 +1,95 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import importlib
+import sqlite3
+
+from tk_flame_review.entity_index import EntityIndex
+
+import fake_toolkit
+
+PROJECT_ID = fake_toolkit.PROJECT["id"]
+
+
+def _codes(index, text):
+    return [entity["code"] for entity in index.search(text, PROJECT_ID, ["Sequence"])]
+
+
+def test_search_survives_vacuum(tmp_path, shotgun):
+    index = EntityIndex(str(tmp_path / "index.db"))
+    for code in ("seq010", "seq020", "seq030"):
+        shotgun.create("Sequence", {"code": code, "project": fake_toolkit.PROJECT})
+    index.sync(shotgun, fake_toolkit.PROJECT, ["Sequence"])
+
+    # deleting rows then vacuuming renumbers implicit rowids.
+    conn = sqlite3.connect(index.path, isolation_level=None)
+    conn.execute("DELETE FROM entities WHERE code = 'seq010'")
+    conn.execute("VACUUM")
+    conn.close()
+
+    assert _codes(index, "seq") == ["seq020", "seq030"]
+    assert _codes(index, "q030") == ["seq030"]
+
+
+def test_rebuilds_earlier_schema(tmp_path):
+    path = str(tmp_path / "index.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE entities (
+            entity_type TEXT NOT NULL, id INTEGER NOT NULL, project_id INTEGER NOT NULL,
+            code TEXT NOT NULL, PRIMARY KEY (entity_type, id)
+        );
+        CREATE TABLE syncs (
+            entity_type TEXT NOT NULL, project_id INTEGER NOT NULL,
+            updated_at REAL NOT NULL, PRIMARY KEY (entity_type, project_id)
+        );
+        INSERT INTO syncs VALUES ('Sequence', 1, 1000);
+        """
+    )
+    conn.close()
+
+    index = EntityIndex(path)
+
+    # synced again from scratch, since the entities were dropped.
+    assert index.last_sync("Sequence", PROJECT_ID) is None
+    conn = sqlite3.connect(path)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(entities)")]
+    conn.close()
+    assert columns[0] == "pk"
+
+
+def test_is_synced(tmp_path, shotgun):
+    index = EntityIndex(str(tmp_path / "index.db"))
+    assert not index.is_synced(["Sequence", "Shot"], PROJECT_ID)
+
+    # a project without entities is synced too.
+    index.sync(shotgun, fake_toolkit.PROJECT, ["Sequence"])
+    assert not index.is_synced(["Sequence", "Shot"], PROJECT_ID)
+    index.sync(shotgun, fake_toolkit.PROJECT, ["Shot"])
+    assert index.is_synced(["Sequence", "Shot"], PROJECT_ID)
+
+
+def test_dialog_searches_shotgun_until_synced(make_app):
+    app = make_app()
+    ExtendedSubmitDialog = importlib.import_module(
+        "tk_flame_review"
+    ).ExtendedSubmitDialog
+
+    selectors = []
+    for _ in range(2):
+        dialog = ExtendedSubmitDialog(app=app, message="")
+        selectors.append(type(dialog.entity_selector).__name__)
+        # the first dialog syncs the index in the background.
+        fake_toolkit.process_events(lambda: app.task_pool.pending)
+        dialog.close()
+        dialog.deleteLater()
+
+    assert selectors == ["GlobalSearchWidget", "IndexedSearchWidget"]
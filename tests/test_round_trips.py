@@ -0,0 +1,163 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+"""
+Budgets of the ShotGrid requests sent by a submission.
+
+The requests sent by the export hooks, including those of the submit dialog and
+those the hooks leave running in the background, are counted apart from the ones
+sent by the backburner jobs.
+"""
+
+import threading
+
+import pytest
+
+import fake_toolkit
+from fake_toolkit import auto_match, export, new, select
+
+# requests of the submit dialog: syncing the entity index, one find per entity
+# type, and fetching the TaskTemplates.
+DIALOG = {"find": 3}
+
+
+def _submit(app, round_trips, answer, sequences, session_id="1"):
+    """
+    Exports the sequences, then runs the backburner jobs.
+
+    :returns: Tuple of the requests sent by the hooks and by the jobs, by method.
+    """
+    app.engine.answer_dialog = answer
+    before = round_trips.snapshot()
+    export(app.engine, session_id, sequences)
+    app.submission_pool.apply(lambda: None)
+    _wait_for_pool(app.shotgun_pool)
+    hooks = round_trips.since(before)
+
+    before = round_trips.snapshot()
+    assert app.engine.run_jobs() == []
+    jobs = round_trips.since(before)
+
+    assert [log for log in app.logs if log[0] != "debug"] == []
+    return hooks, jobs
+
+
+def _wait_for_pool(pool, workers=4):
+    """
+    Waits for what the hooks left running in the background: the tasks only all
+    meet at the barrier once every worker is done with the earlier tasks.
+    """
+    barrier = threading.Barrier(workers)
+    for result in [pool.apply_async(barrier.wait) for _ in range(workers)]:
+        result.get()
+
+
+def _within(counts, budget):
+    return all(count <= budget.get(method, 0) for method, count in counts.items())
+
+
+def _sequence(shotgun, code, **data):
+    data.update({"code": code, "project": fake_toolkit.PROJECT})
+    return shotgun.create("Sequence", data)
+
+
+def test_select(make_app, shotgun, round_trips):
+    sequence = _sequence(shotgun, "seq010")
+    app = make_app()
+
+    hooks, jobs = _submit(app, round_trips, select(sequence), ["seq010"])
+
+    # the Select tab's entity is looked up too, in case the artist switches tabs.
+    assert _within(hooks, dict(DIALOG, find_one=1, batch=1)), hooks
+    assert jobs == {"upload": 1}
+
+
+def test_new_with_template(make_app, shotgun, round_trips):
+    template = shotgun.create(
+        "TaskTemplate", {"code": "Edit", "entity_type": "Sequence"}
+    )
+    app = make_app(task_template="Edit")
+
+    hooks, jobs = _submit(app, round_trips, new("seq020"), ["seq020"])
+
+    # the existence check, then the entity is created without its template, which
+    # is applied in the background.
+    assert _within(hooks, dict(DIALOG, find_one=1, create=1, update=1, batch=1)), hooks
+    assert jobs == {"upload": 1}
+    sequence = shotgun.find_one(
+        "Sequence", [["code", "is", "seq020"]], ["task_template"]
+    )
+    assert sequence["task_template"]["id"] == template["id"]
+
+
+def test_new_existing(make_app, shotgun, round_trips):
+    _sequence(shotgun, "seq010")
+    app = make_app()
+
+    hooks, jobs = _submit(app, round_trips, new("seq010"), ["seq010"])
+
+    assert _within(hooks, dict(DIALOG, find_one=1, batch=1)), hooks
+    assert jobs == {"upload": 1}
+    assert len(shotgun.find("Sequence", [["code", "is", "seq010"]])) == 1
+
+
+@pytest.mark.parametrize("bypass", [False, True])
+def test_bypass_transcoding(make_app, shotgun, round_trips, bypass):
+    sequence = _sequence(shotgun, "seq010")
+    app = make_app(bypass_shotgun_transcoding=bypass)
+
+    hooks, jobs = _submit(app, round_trips, select(sequence), ["seq010"])
+
+    # bypassing only changes the uploaded field and the thumbnail targets.
+    assert _within(hooks, dict(DIALOG, find_one=1, batch=1)), hooks
+    assert jobs == {"upload": 1}
+    field_name = "sg_uploaded_movie_mp4" if bypass else "sg_uploaded_movie"
+    version = shotgun.find_one("Version", [], [field_name])
+    assert version[field_name]["type"] == "Attachment"
+
+
+@pytest.mark.parametrize("count", [1, 50, 120])
+def test_sequences(make_app, shotgun, round_trips, count):
+    _sequence(shotgun, "seq000")
+    names = ["seq%03d" % index for index in range(count)]
+    app = make_app()
+
+    hooks, jobs = _submit(app, round_trips, auto_match(), names)
+
+    # one query matching every sequence, one batch creating the missing ones,
+    # then the Versions in batches of VERSION_BATCH_SIZE.
+    version_batches = (count + app.VERSION_BATCH_SIZE - 1) // app.VERSION_BATCH_SIZE
+    create_batches = 1 if count > 1 else 0
+    budget = dict(DIALOG, batch=create_batches + version_batches)
+    budget["find"] += 1
+    assert _within(hooks, budget), hooks
+    assert jobs == {"upload": count}
+    assert len(shotgun.find("Version", [])) == count
+
+
+def test_sequences_with_template(make_app, shotgun, round_trips):
+    template = shotgun.create(
+        "TaskTemplate", {"code": "Edit", "entity_type": "Sequence"}
+    )
+    names = ["seq%03d" % index for index in range(10)]
+    app = make_app(task_template="Edit")
+
+    hooks, jobs = _submit(app, round_trips, auto_match(), names)
+
+    # the entities are created without their template, which is then applied to
+    # all of them with a single batch in the background.
+    budget = dict(DIALOG, batch=3)
+    budget["find"] += 1
+    assert _within(hooks, budget), hooks
+    assert jobs == {"upload": 10}
+    for sequence in shotgun.find(
+        "Sequence", [["code", "in", names]], ["task_template"]
+    ):
+        assert sequence["task_template"]["id"] == template["id"]
@@ -0,0 +1,31 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import simulator
+
+
+def test_replay(tmp_path, shotgun):
+    sim = simulator.Simulator(str(tmp_path), shotgun)
+    try:
+        report = sim.replay("1", ["seq010", "seq020", "seq030"], segments=4)
+    finally:
+        sim.destroy()
+
+    assert report["failed"] == []
+    hooks = dict((name, latency["count"]) for name, latency in report["hooks"].items())
+    assert hooks == {
+        "pre_custom_export": 1,
+        "adjust_path": 15,
+        "populate_shotgun": 15,
+        "display_summary": 1,
+    }
+    assert report["jobs"]["backburner_upload_quicktimes"]["count"] == 1
+    assert len(shotgun.find("Version", [])) == 3
+    assert "populate_shotgun" in simulator.format_report(report)
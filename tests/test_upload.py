@@ -0,0 +1,264 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import os
+import time
+
+import pytest
+
+shotgun_api3 = pytest.importorskip("shotgun_api3")
+
+from tk_flame_review import upload
+from tk_flame_review.upload import ChunkedUploader, ShotgunStorageTransport, UploadError
+
+import fake_toolkit
+from storage_server import StorageServer
+
+CHUNK_SIZE = 64 * 1024
+
+
+class _NoSleep(object):
+    time = staticmethod(time.time)
+
+    @staticmethod
+    def sleep(seconds):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(upload, "time", _NoSleep)
+
+
+def _connect(server):
+    sg = shotgun_api3.Shotgun(
+        server.url, script_name="test", api_key="key", connect=False
+    )
+    sg.BACKOFF = 0
+    return sg
+
+
+@pytest.fixture
+def movie(tmp_path):
+    path = str(tmp_path / "shot010.mov")
+    with open(path, "wb") as fh:
+        fh.write(os.urandom(40 * CHUNK_SIZE + 123))
+    return path
+
+
+@pytest.mark.parametrize(
+    "upload_types, entity_type, field_name, expected",
+    [
+        ({"Version": ["sg_uploaded_movie"]}, "Version", "sg_uploaded_movie", True),
+        ({"Version": "*"}, "Version", "sg_uploaded_movie", True),
+        ({"Version": ["*"]}, "Version", "sg_uploaded_movie", True),
+        ({"*": ["sg_uploaded_movie"]}, "Version", "sg_uploaded_movie", True),
+        ({"*": "*"}, "Shot", "sg_movie", True),
+        # always direct for versions, whatever the site reports.
+        ({"Shot": ["sg_movie"]}, "Version", "sg_uploaded_movie", True),
+        ({"Shot": ["sg_movie"]}, "Shot", "sg_other_movie", False),
+        ({"Shot": ["sg_movie"]}, "Version", "sg_other_movie", False),
+    ],
+)
+def test_supports_matches_shotgun_api3(upload_types, entity_type, field_name, expected):
+    with StorageServer(upload_types=upload_types) as server:
+        sg = _connect(server)
+        transport = ShotgunStorageTransport(sg)
+        assert transport.supports(entity_type, field_name) is expected
+        assert sg._requires_direct_s3_upload(entity_type, field_name) is expected
+
+
+def test_upload_survives_dropped_connections(movie):
+    with StorageServer(drop_rate=0.2, seed=1) as server:
+        uploader = ChunkedUploader(
+            _connect(server), chunk_size=CHUNK_SIZE, concurrency=4
+        )
+
+        # like backburner retrying the job, each attempt resumes from the journal.
+        for attempt in range(5):
+            try:
+                attachment_id = uploader.upload(
+                    "Version", 1, movie, "sg_uploaded_movie"
+                )
+                break
+            except Exception:
+                continue
+        else:
+            pytest.fail("upload did not complete in 5 attempts")
+
+    assert server.dropped > 0
+    with open(movie, "rb") as fh:
+        assert server.attachments[attachment_id] == (
+            "Version",
+            1,
+            "sg_uploaded_movie",
+            fh.read(),
+        )
+    assert not os.path.exists(movie + upload.JOURNAL_SUFFIX)
+
+
+class _FailingTransport(ShotgunStorageTransport):
+    """
+    Fails to send the given parts, as if the job had been killed.
+    """
+
+    def __init__(self, shotgun, failing_parts):
+        super(_FailingTransport, self).__init__(shotgun)
+        self._failing_parts = failing_parts
+
+    def put_part(self, data, content_type, url):
+        if int(url.rsplit("/", 1)[1]) in self._failing_parts:
+            raise IOError("connection reset")
+        return super(_FailingTransport, self).put_part(data, content_type, url)
+
+
+def test_retried_upload_only_sends_missing_parts(movie):
+    with StorageServer() as server:
+        sg = _connect(server)
+        uploader = ChunkedUploader(
+            sg,
+            chunk_size=CHUNK_SIZE,
+            concurrency=1,
+            max_retries=0,
+            transport=_FailingTransport(sg, set([7])),
+        )
+        with pytest.raises(UploadError):
+            uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+        sent = server.requests["/storage"]
+        assert sent < 41
+
+        uploader = ChunkedUploader(sg, chunk_size=CHUNK_SIZE, concurrency=4)
+        attachment_id = uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+
+    # every part was sent exactly once.
+    assert server.requests["/storage"] == 41
+    assert server.requests["/upload/api_get_upload_link_info"] == 1
+    with open(movie, "rb") as fh:
+        assert server.attachments[attachment_id][3] == fh.read()
+
+
+class _Clock(object):
+    """
+    Clock whose sleeps only move time forward, running the events due by then.
+    """
+
+    def __init__(self):
+        self.now = 0
+        self.events = []
+
+    def at(self, when, event):
+        self.events.append((when, event))
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        for when, event in list(self.events):
+            if when <= self.now:
+                self.events.remove((when, event))
+                event()
+
+
+def test_follow_waits_for_the_export_to_start(tmp_path, monkeypatch):
+    path = str(tmp_path / "shot010.mov")
+    clock = _Clock()
+    # the export job starts long after the upload job, then writes the file.
+    clock.at(7200, lambda: fake_toolkit.write_quicktime(path, 3 * CHUNK_SIZE))
+    monkeypatch.setattr(upload, "time", clock)
+
+    with StorageServer() as server:
+        uploader = ChunkedUploader(_connect(server), chunk_size=CHUNK_SIZE)
+        attachment_id = uploader.follow(
+            "Version", 1, path, "sg_uploaded_movie", stall_timeout=3600
+        )
+
+    with open(path, "rb") as fh:
+        assert server.attachments[attachment_id][3] == fh.read()
+
+
+def test_follow_fails_when_the_export_stalls(tmp_path, monkeypatch):
+    path = str(tmp_path / "shot010.mov")
+    clock = _Clock()
+    # the media atom of a quicktime being written, without its movie atom.
+    clock.at(7200, lambda: open(path, "wb").write(b"\0\0\0\0mdat" + b"\0" * CHUNK_SIZE))
+    monkeypatch.setattr(upload, "time", clock)
+
+    with StorageServer() as server:
+        uploader = ChunkedUploader(_connect(server), chunk_size=CHUNK_SIZE)
+        with pytest.raises(UploadError):
+            uploader.follow("Version", 1, path, "sg_uploaded_movie", stall_timeout=3600)
+
+    # the stall is counted from when the file appeared.
+    assert 7200 + 3600 < clock.now <= 7200 + 3600 + 10
+
+
+def test_follow_fails_when_the_export_never_starts(tmp_path, monkeypatch):
+    path = str(tmp_path / "shot010.mov")
+    clock = _Clock()
+    monkeypatch.setattr(upload, "time", clock)
+
+    with StorageServer() as server:
+        uploader = ChunkedUploader(_connect(server), chunk_size=CHUNK_SIZE)
+        with pytest.raises(UploadError):
+            uploader.follow(
+                "Version", 1, path, "sg_uploaded_movie", start_timeout=4 * 3600
+            )
+
+    assert 4 * 3600 < clock.now <= 4 * 3600 + 10
+
+
+def test_failed_resume_keeps_the_acknowledged_parts(movie):
+    with StorageServer() as server:
+        sg = _connect(server)
+        for failing_part in (31, 35):
+            uploader = ChunkedUploader(
+                sg,
+                chunk_size=CHUNK_SIZE,
+                concurrency=1,
+                max_retries=0,
+                transport=_FailingTransport(sg, set([failing_part])),
+            )
+            with pytest.raises(UploadError):
+                uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+
+        uploader = ChunkedUploader(sg, chunk_size=CHUNK_SIZE, concurrency=4)
+        attachment_id = uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+
+    # the part failing on the resumed attempt did not restart the upload.
+    assert server.requests["/upload/api_get_upload_link_info"] == 1
+    assert server.requests["/storage"] == 41
+    with open(movie, "rb") as fh:
+        assert server.attachments[attachment_id][3] == fh.read()
+
+
+def test_expired_upload_is_restarted(movie):
+    with StorageServer() as server:
+        sg = _connect(server)
+        uploader = ChunkedUploader(
+            sg,
+            chunk_size=CHUNK_SIZE,
+            concurrency=1,
+            max_retries=0,
+            transport=_FailingTransport(sg, set([31])),
+        )
+        with pytest.raises(UploadError):
+            uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+        sent = server.requests["/storage"]
+        server.expire_uploads()
+
+        uploader = ChunkedUploader(sg, chunk_size=CHUNK_SIZE, concurrency=4)
+        attachment_id = uploader.upload("Version", 1, movie, "sg_uploaded_movie")
+
+    assert server.requests["/upload/api_get_upload_link_info"] == 2
+    # every part was sent again to the new upload.
+    assert server.requests["/storage"] == sent + 41
+    with open(movie, "rb") as fh:
+        assert server.attachments[attachment_id][3] == fh.read()
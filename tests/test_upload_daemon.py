@@ -0,0 +1,253 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import importlib
+import os
+import socket
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+
+from tk_flame_review.upload_daemon import UploadDaemon, hand_off, process_age
+
+import fake_toolkit
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets"
+)
+
+
+@pytest.fixture
+def socket_path():
+    # Unix socket paths are limited to about a hundred characters.
+    path = os.path.join(tempfile.mkdtemp(), "daemon", "daemon.sock")
+    yield path
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def test_hand_off(socket_path):
+    received = []
+    daemon = UploadDaemon(socket_path, received.extend)
+    daemon.start()
+    try:
+        uploads = [{"full_path": "/tmp/a.mov", "sg_version_id": 1}]
+        response = hand_off(socket_path, uploads)
+    finally:
+        daemon.stop()
+
+    assert response["accepted"] == 1
+    assert received == uploads
+    assert daemon.jobs_handled == 1
+    assert not os.path.exists(socket_path)
+
+
+def test_hand_off_without_daemon(socket_path):
+    assert hand_off(socket_path, [{"full_path": "/tmp/a.mov"}]) is None
+
+
+def test_failing_handler_is_not_accepted(socket_path):
+    def handler(uploads):
+        raise RuntimeError("pool is closed")
+
+    daemon = UploadDaemon(socket_path, handler)
+    daemon.start()
+    try:
+        assert hand_off(socket_path, [{"full_path": "/tmp/a.mov"}]) is None
+    finally:
+        daemon.stop()
+
+
+def test_hand_off_reports_saved_time(socket_path):
+    daemon = UploadDaemon(socket_path, lambda uploads: None, bootstrap_time=lambda: 5.0)
+    daemon.start()
+    try:
+        response = hand_off(socket_path, [{"full_path": "/tmp/a.mov"}], startup=0.5)
+        unknown = hand_off(socket_path, [{"full_path": "/tmp/a.mov"}])
+    finally:
+        daemon.stop()
+
+    assert response["saved"] == 4.5
+    assert "saved" not in unknown
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+def test_process_age():
+    age = process_age()
+    child_age = float(
+        subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "from tk_flame_review.upload_daemon import process_age; "
+                "print(process_age())",
+            ],
+            env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        )
+    )
+
+    assert 0 <= child_age < age
+
+
+def test_socket_is_private(socket_path):
+    daemon = UploadDaemon(socket_path, lambda uploads: None)
+    daemon.start()
+    try:
+        folder_mode = os.stat(os.path.dirname(socket_path)).st_mode
+        socket_mode = os.stat(socket_path).st_mode
+    finally:
+        daemon.stop()
+
+    assert stat.S_IMODE(folder_mode) == 0o700
+    assert stat.S_IMODE(socket_mode) == 0o600
+
+
+def test_app_only_accepts_its_queued_uploads(make_app, tmp_path):
+    app = make_app(upload_daemon=True)
+    app._start_upload_daemon()
+    full_path = os.path.join(app.engine.get_backburner_tmp(), "seq010.mov")
+    fake_toolkit.write_quicktime(full_path)
+    app.upload_queue.enqueue(full_path, 1, "sg_uploaded_movie", owner="job")
+    outside = str(tmp_path / "seq010.mov")
+    fake_toolkit.write_quicktime(outside)
+
+    for upload in (
+        {"full_path": outside, "sg_version_id": 1, "owner": "job"},
+        {"full_path": full_path, "sg_version_id": 2, "owner": "job"},
+        {"full_path": full_path, "sg_version_id": 1, "owner": "other job"},
+    ):
+        with pytest.raises(fake_toolkit.TankError):
+            app._on_upload_daemon_request([upload])
+
+    # nothing was uploaded, nor removed.
+    assert os.path.exists(outside)
+    assert app.upload_queue.find(full_path)[0]["state"] == app.upload_queue.RUNNING
+
+
+def test_app_releases_unfinished_uploads_on_stop(make_app, monkeypatch):
+    app = make_app(upload_daemon=True)
+    app._start_upload_daemon()
+    full_path = os.path.join(app.engine.get_backburner_tmp(), "seq010.mov")
+    fake_toolkit.write_quicktime(full_path)
+    app.upload_queue.enqueue(full_path, 1, "sg_uploaded_movie", owner="job")
+
+    started = threading.Event()
+    finish = threading.Event()
+    claims = []
+
+    def upload_quicktime(*args, **kwargs):
+        claims.append(app.upload_queue.find(full_path)[0])
+        started.set()
+        finish.wait(10)
+
+    monkeypatch.setattr(app, "_upload_quicktime", upload_quicktime)
+    app._on_upload_daemon_request(
+        [{"full_path": full_path, "sg_version_id": 1, "owner": "job"}]
+    )
+    assert started.wait(10)
+    # Flame exits while the upload is in flight.
+    app._stop_upload_daemon()
+    entry = app.upload_queue.find(full_path)[0]
+    finish.set()
+
+    # claimed for the queue's lease, not for the job's owner lease.
+    lease = claims[0]["next_attempt"] - claims[0]["updated"]
+    assert lease == pytest.approx(app.upload_queue.lease)
+    assert entry["state"] == app.upload_queue.PENDING
+    assert entry["next_attempt"] <= time.time()
+
+
+def _run_jobs_as_commands(app, monkeypatch):
+    """
+    Runs the command line jobs the app submits in processes of their own, which
+    can't import the toolkit, like backburner would.
+
+    :returns: List of the command lines of the jobs.
+    """
+    app.engine.install_root = "/opt/Autodesk"
+    app.engine.python_executable = sys.executable
+    commands = []
+
+    def submit_command_job(
+        cmdjob, name, description, command, dependencies=None, **kwargs
+    ):
+        assert cmdjob == "/opt/Autodesk/backburner/cmdjob"
+        commands.append(command)
+        return app.engine.submit_job(
+            name, dependencies, lambda: subprocess.check_call(command)
+        )
+
+    backburner = importlib.import_module("tk_flame_review").backburner
+    monkeypatch.setattr(backburner, "submit_command_job", submit_command_job)
+    return commands
+
+
+def _wait_for(condition, timeout=10):
+    end = time.time() + timeout
+    while not condition() and time.time() < end:
+        time.sleep(0.05)
+    return condition()
+
+
+def test_upload_job_hands_off_without_the_toolkit(make_app, shotgun, monkeypatch):
+    app = make_app(upload_daemon=True)
+    commands = _run_jobs_as_commands(app, monkeypatch)
+    sequence = shotgun.create(
+        "Sequence", {"code": "seq010", "project": fake_toolkit.PROJECT}
+    )
+    app.engine.answer_dialog = fake_toolkit.select(sequence)
+    fake_toolkit.export(app.engine, "1", ["seq010"])
+    app.submission_pool.apply(lambda: None)
+
+    assert app.engine.run_jobs() == []
+    assert [os.path.basename(command[1]) for command in commands] == [
+        "upload_daemon.py"
+    ]
+    assert _wait_for(
+        lambda: shotgun.find_one("Version", [], ["sg_uploaded_movie"])[
+            "sg_uploaded_movie"
+        ]
+    )
+
+
+def test_upload_job_releases_uploads_without_daemon(make_app, shotgun, monkeypatch):
+    app = make_app(upload_daemon=True)
+    _run_jobs_as_commands(app, monkeypatch)
+    sequence = shotgun.create(
+        "Sequence", {"code": "seq010", "project": fake_toolkit.PROJECT}
+    )
+    app.engine.answer_dialog = fake_toolkit.select(sequence)
+    fake_toolkit.export(app.engine, "1", ["seq010"])
+    app.submission_pool.apply(lambda: None)
+    # Flame exits before the export is done.
+    app._stop_upload_daemon()
+
+    assert app.engine.run_jobs() == ["Sequence - ShotGrid Upload (1 quicktimes)"]
+    assert [entry["id"] for entry in app.upload_queue.due()] == [1]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="needs /proc")
+def test_app_reports_the_bootstrap_time_jobs_save(make_app):
+    app = make_app(upload_daemon=True)
+    assert app._get_job_bootstrap_time() is None
+    # run by each upload job bootstrapping the toolkit.
+    app._record_job_bootstrap_time()
+    bootstrap_time = app._get_job_bootstrap_time()
+    app._start_upload_daemon()
+
+    response = hand_off(app._get_upload_daemon_socket(), [], startup=0.0)
+
+    assert bootstrap_time > 0
+    assert response["saved"] == bootstrap_time
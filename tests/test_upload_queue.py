@@ -0,0 +1,89 @@
+# Copyright (c) 2014 Shotgun Software Inc.
+#
+# CONFIDENTIAL AND PROPRIETARY
+#
+# This work is provided "AS IS" and subject to the Shotgun Pipeline Toolkit
+# Source Code License included in this distribution package. See LICENSE.
+# By accessing, using, copying or modifying this work you indicate your
+# agreement to the Shotgun Pipeline Toolkit Source Code License. All rights
+# not expressly granted therein are reserved by Shotgun Software Inc.
+
+import time
+
+import pytest
+
+from tk_flame_review.upload_queue import UploadQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return UploadQueue(
+        str(tmp_path / "uploads.db"), base_delay=0, lease=60, owner_lease=60
+    )
+
+
+def test_drain_leaves_owned_entries_alone(queue):
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+
+    # a drain running while the owning job still waits for the export.
+    assert queue.due() == []
+    assert queue.claim() is None
+
+    entry = queue.claim(entry_id, owner="job")
+    assert entry["id"] == entry_id
+    assert entry["owner"] == "job"
+
+
+def test_other_jobs_cannot_claim_owned_entries(queue):
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+    assert queue.claim(entry_id, owner="other job") is None
+    assert queue.get(entry_id)["state"] == queue.RUNNING
+
+
+def test_drain_picks_up_entries_of_jobs_gone(queue):
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+    queue._set(entry_id, next_attempt=time.time() - 1)
+
+    entry = queue.claim()
+    assert entry["id"] == entry_id
+    assert entry["owner"] is None
+
+    # the owning job comes back while the drain holds the entry.
+    assert queue.claim(entry_id, owner="job") is None
+
+
+def test_owner_skips_its_retry_delay(queue):
+    queue = UploadQueue(queue.path, base_delay=3600, owner_lease=60)
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+    queue.claim(entry_id, owner="job")
+    assert queue.fail(entry_id, "timeout")
+
+    assert queue.claim() is None
+    assert queue.claim(entry_id, owner="job")["attempts"] == 1
+
+
+def test_enqueue_is_idempotent(queue):
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+    queue.complete(entry_id)
+    assert queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job") == entry_id
+    assert queue.get(entry_id)["state"] == queue.DONE
+    assert queue.claim(entry_id, owner="job") is None
+
+
+def test_entries_remember_the_thumbnail_job(queue):
+    entry_id = queue.enqueue(
+        "/tmp/a.mov", 1, "sg_uploaded_movie", wait_for_thumbnail=True
+    )
+    assert queue.claim()["wait_for_thumbnail"] == 1
+    queue.complete(entry_id)
+
+    entry_id = queue.enqueue("/tmp/b.mov", 1, "sg_uploaded_movie")
+    assert queue.get(entry_id)["wait_for_thumbnail"] == 0
+
+
+def test_released_entries_are_drained_straight_away(queue):
+    entry_id = queue.enqueue("/tmp/a.mov", 1, "sg_uploaded_movie", owner="job")
+    queue.enqueue("/tmp/b.mov", 1, "sg_uploaded_movie", owner="other job")
+
+    assert queue.release("job") == 1
+    assert [entry["id"] for entry in queue.due()] == [entry_id]